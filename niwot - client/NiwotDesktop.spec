@@ -1,34 +1,93 @@
 # -*- mode: python ; coding: utf-8 -*-
+#
+# Deux profils de build (variable d'environnement NIWOT_BUILD_PROFILE) :
+#   onefile : un seul NiwotDesktop(.exe) ; Python + Qt sont extraits dans un dossier
+#             temporaire à chaque lancement -> le splash natif couvre cette attente.
+#   fast    : dossier dist/NiwotDesktop/ (onedir), rien à extraire, modules Qt inutilisés
+#             exclus, bytecode optimisé (-OO), pas d'UPX (décompression au lancement).
+#
+#   pyinstaller NiwotDesktop.spec                              (onefile, défaut)
+#   set NIWOT_BUILD_PROFILE=fast && pyinstaller NiwotDesktop.spec
+#
+# Le splash (assets/splash.png, généré par tools/build_assets.py) est fermé par main.py
+# à la première frame de la fenêtre.
+import os
+
+PROFILE = os.environ.get("NIWOT_BUILD_PROFILE", "onefile").strip().lower()
+if PROFILE not in ("onefile", "fast"):
+    raise SystemExit(f"NIWOT_BUILD_PROFILE inconnu : {PROFILE!r} (onefile | fast)")
+FAST = PROFILE == "fast"
+
+# Modules Qt / stdlib jamais importés par l'application (QtWidgets + QtGui + QtCore seulement).
+# Les plugins imageformats restent inclus (webp des variantes d'avatars).
+QT_EXCLUDES = [
+    "PySide6.QtNetwork", "PySide6.QtQml", "PySide6.QtQuick", "PySide6.QtQuickWidgets",
+    "PySide6.QtQuick3D", "PySide6.QtQuickControls2", "PySide6.QtWebEngineCore",
+    "PySide6.QtWebEngineWidgets", "PySide6.QtWebEngineQuick", "PySide6.QtWebChannel",
+    "PySide6.QtWebSockets", "PySide6.QtMultimedia", "PySide6.QtMultimediaWidgets",
+    "PySide6.QtSpatialAudio", "PySide6.Qt3DCore", "PySide6.Qt3DRender", "PySide6.Qt3DInput",
+    "PySide6.Qt3DLogic", "PySide6.Qt3DExtras", "PySide6.Qt3DAnimation", "PySide6.QtCharts",
+    "PySide6.QtDataVisualization", "PySide6.QtGraphs", "PySide6.QtPdf", "PySide6.QtPdfWidgets",
+    "PySide6.QtSql", "PySide6.QtTest", "PySide6.QtBluetooth", "PySide6.QtNfc",
+    "PySide6.QtPositioning", "PySide6.QtLocation", "PySide6.QtSensors", "PySide6.QtSerialPort",
+    "PySide6.QtSerialBus", "PySide6.QtRemoteObjects", "PySide6.QtScxml", "PySide6.QtStateMachine",
+    "PySide6.QtTextToSpeech", "PySide6.QtHttpServer", "PySide6.QtDesigner", "PySide6.QtHelp",
+    "PySide6.QtUiTools", "PySide6.QtOpenGL", "PySide6.QtOpenGLWidgets", "PySide6.QtSvg",
+    "PySide6.QtSvgWidgets", "PySide6.QtXml", "PySide6.QtConcurrent", "PySide6.QtDBus",
+    "PySide6.QtPrintSupport", "PySide6.QtAxContainer",
+]
+PY_EXCLUDES = ["tkinter", "unittest", "pydoc", "doctest", "lib2to3", "pdb"]
+# Plugins Qt collectés d'office mais inutiles ici (clavier virtuel, PDF comme image, VNC, TUIO),
+# les bibliothèques qu'ils sont seuls à tirer, et les traductions Qt (aucun QTranslator chargé).
+QT_FILE_EXCLUDES = (
+    "qtvirtualkeyboardplugin", "qt6virtualkeyboard", "qpdf", "qt6pdf", "qvnc", "qtuiotouchplugin",
+    "qt6quick", "qt6qml", "qt6network", "/translations/",
+)
+
+
+def _keep(entry):
+    dest = entry[0].replace("\\", "/").lower()
+    return not any(x in dest for x in QT_FILE_EXCLUDES)
 
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('niwotfren.png', '.'), ('niwot-favicon.png', '.')],
+    # les images sont embarquées dans niwot_assets_rc ; les PNG sources ne servent que de repli
+    datas=[] if FAST else [('niwotfren.png', '.'), ('niwot-favicon.png', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=(QT_EXCLUDES + PY_EXCLUDES) if FAST else [],
     noarchive=False,
-    optimize=0,
+    optimize=2 if FAST else 0,
 )
+if FAST:
+    a.binaries = [b for b in a.binaries if _keep(b)]
+    a.datas = [d for d in a.datas if _keep(d)]
 pyz = PYZ(a.pure)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
+splash = Splash(
+    'assets/splash.png',
+    binaries=a.binaries,
+    datas=a.datas,
+    text_pos=(14, 206),
+    text_size=9,
+    text_color='#aab2e6',
+    text_default='Chargement…',
+    minify_script=True,
+    always_on_top=True,
+)
+
+exe_options = dict(
     name='NiwotDesktop',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=not FAST,
     upx_exclude=[],
-    runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -37,3 +96,35 @@ exe = EXE(
     entitlements_file=None,
     icon=['niwot-favicon.ico'],
 )
+
+if FAST:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        splash,
+        [],
+        exclude_binaries=True,
+        **exe_options,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        splash.binaries,
+        strip=False,
+        upx=False,
+        upx_exclude=[],
+        name='NiwotDesktop',
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        splash,
+        splash.binaries,
+        [],
+        runtime_tmpdir=None,
+        **exe_options,
+    )
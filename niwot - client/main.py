@@ -1,20 +1,28 @@
-import os, sys, json
+import time
+_T0 = time.perf_counter()  # référence du profil de démarrage (NIWOT_STARTUP_PROBE)
+
+import os, sys, json, logging
+from typing import Any, Callable, Dict, Optional
 from PySide6 import QtWidgets, QtCore, QtGui
 
+# Seul le nécessaire à l'écran de connexion est importé ici : les autres pages sont
+# importées par leur fabrique (_make_*) et la pile réseau après la première frame.
 from ui_login import LoginWidget
-from ui_lobby import LobbyWidget
-from ui_room import RoomWidget
-from ui_quiz import QuizWidget
 from ui_header import HeaderWidget
-from ui_profile import ProfileWidget
-from ui_admin import AdminWidget
-from ui_suggest import SuggestWidget
 from niwot_client import NiwotClient
+from niwot_media import DEFAULT_VARIANT_QUERY
+from niwot_cache import DEFAULT_TTL_S
 from ui_theme import apply_theme
+from niwot_assets import app_icon
+import niwot_metrics
+import niwot_tasks
+import niwot_trace
+
+log = logging.getLogger("niwot")
 
 
 def load_config():
-    """Charge API_BASE et WS_BASE depuis config.json et/ou variables d'env."""
+    """Charge API_BASE, WS_BASE, MEDIA_VARIANT_QUERY et LEADERBOARD_TTL depuis config.json et/ou variables d'env."""
     cfg_path = os.path.join(os.path.dirname(__file__), "config.json")
     try:
         with open(cfg_path, "r", encoding="utf-8") as f:
@@ -23,18 +31,23 @@ def load_config():
         cfg = {}
     api = os.environ.get("NIWOT_API_BASE", cfg.get("API_BASE", ""))
     ws  = os.environ.get("NIWOT_WS_BASE",  cfg.get("WS_BASE",  ""))
-    return api, ws
-
-
-def resource_path(name: str) -> str:
-    """Chemin d'une ressource packagée (PyInstaller) ou en dev."""
-    base = getattr(sys, "_MEIPASS", os.path.dirname(__file__))
-    return os.path.join(base, name)
+    # Indices de taille pour les médias ("" = toujours l'original)
+    media = os.environ.get("NIWOT_MEDIA_VARIANT_QUERY", cfg.get("MEDIA_VARIANT_QUERY", DEFAULT_VARIANT_QUERY))
+    # Fenêtre de fraîcheur des classements (secondes)
+    try:
+        ttl = float(os.environ.get("NIWOT_LEADERBOARD_TTL", cfg.get("LEADERBOARD_TTL", DEFAULT_TTL_S)))
+    except ValueError:
+        ttl = DEFAULT_TTL_S
+    return api, ws, media, ttl
 
 
 class MainWindow(QtWidgets.QMainWindow):
-    def __init__(self, client: NiwotClient):
+    # émis une seule fois, juste après le premier rendu de la fenêtre
+    sig_first_frame = QtCore.Signal()
+
+    def __init__(self, client: NiwotClient, cached_user: Optional[dict] = None):
         super().__init__()
+        self._first_frame = False
         self.setWindowTitle("Niwot Desktop")
         self.resize(1100, 720)
         self.client = client
@@ -78,52 +91,20 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.setCentralWidget(central)
 
-        # ---------- Pages ----------
-        self.login   = LoginWidget()
-        self.lobby   = LobbyWidget()
-        self.room    = RoomWidget()
-        self.quiz    = QuizWidget()
-        self.profile = ProfileWidget()
-        self.admin   = AdminWidget()
-        self.suggest = SuggestWidget()
-
-        self.stack.addWidget(self.login)    # index 0
-        self.stack.addWidget(self.lobby)    # index 1
-        self.stack.addWidget(self.room)     # index 2
-        self.stack.addWidget(self.quiz)     # index 3
-        self.stack.addWidget(self.profile)  # index 4
-        self.stack.addWidget(self.admin)    # index 5
-        self.stack.addWidget(self.suggest)  # index 6
-
-        # ---------- Injection du client ----------
-        self.login.set_client(self.client)
-        self.room.set_client(self.client)
-        self.quiz.set_client(self.client)
-        self.profile.set_client(self.client)
-        self.admin.set_client(self.client)
-        self.suggest.set_client(self.client)
-
-        # ---------- Signals ----------
-        # Login
-        self.login.sig_logged_in.connect(self.on_logged_in)
-        self.login.sig_error.connect(self.on_error)
-
-        # Lobby
-        self.lobby.sig_enter_room.connect(self.on_enter_room)   # string: room_code
-        self.lobby.sig_error.connect(self.on_error)
-        self.lobby.sig_goto_suggest.connect(self.on_goto_suggest)
-
-        # Room
-        self.room.sig_leave.connect(self.on_leave_room)
-        self.room.sig_goto_quiz.connect(self.on_goto_quiz)
-
-        # Quiz
-        self.quiz.sig_goto_room.connect(self.on_back_to_room)  # retour à la salle
-        self.quiz.sig_quit.connect(self.on_back_to_room)       # "Quitter le quiz" -> revenir à la salle
-
-        # Sockets -> pages
-        self.client.sig_socket_message.connect(self.room.on_message)
-        self.client.sig_socket_message.connect(self.quiz.on_message)
+        # ---------- Pages (construites à la première navigation) ----------
+        # nom -> fabrique : crée la page, injecte le client et branche ses signaux
+        self._factories: Dict[str, Callable[[], QtWidgets.QWidget]] = {
+            "login":   self._make_login,
+            "lobby":   self._make_lobby,
+            "room":    self._make_room,
+            "quiz":    self._make_quiz,
+            "profile": self._make_profile,
+            "admin":   self._make_admin,
+            "suggest": self._make_suggest,
+        }
+        self._pages: Dict[str, QtWidgets.QWidget] = {}
+        self._user: Optional[dict] = None
+        self._outbox_wired = False  # file d'envoi créée à la première connexion
 
         # 🔸 Hook global : si un évènement de démarrage passe "à côté", on force la redirection
         self.client.sig_socket_message.connect(self._maybe_goto_quiz)
@@ -133,16 +114,29 @@ class MainWindow(QtWidgets.QMainWindow):
         self.header.sig_go_admin.connect(self.on_goto_admin)
         self.header.sig_go_profile.connect(self.on_goto_profile)
 
-        # Profil -> déconnexion
-        self.profile.sig_logged_out.connect(self.on_logged_out)
-
-        # Démarre sur l'écran de connexion
-        self._show_header(False)
-        self.stack.setCurrentIndex(0)
+        # Session mémorisée : lobby tout de suite, /me vérifié en tâche de fond.
+        # Sinon écran de connexion (seule page construite avant le premier affichage).
+        if cached_user:
+            self._start_optimistic(cached_user)
+        else:
+            self._show_header(False)
+            self._show_page("login")
 
-        # Raccourcis plein écran (F11/Esc)
+        # Raccourcis plein écran (F11/Esc), panneau de performances (F12), trace (Ctrl+Shift+T)
+        # et profileur (Ctrl+Shift+P)
         QtGui.QShortcut(QtGui.QKeySequence("F11"), self, self.toggle_fullscreen)
         QtGui.QShortcut(QtGui.QKeySequence("Esc"), self, self.exit_fullscreen)
+        QtGui.QShortcut(QtGui.QKeySequence("F12"), self, self.toggle_perf_overlay)
+        QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Shift+T"), self, self.toggle_trace)
+        QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Shift+P"), self, self.toggle_profiler)
+        self._perf_overlay = None  # créé au premier F12
+        self._profiler = None      # créé au premier Ctrl+Shift+P (ou --profile)
+
+    def paintEvent(self, e):
+        super().paintEvent(e)
+        if not self._first_frame:
+            self._first_frame = True
+            QtCore.QTimer.singleShot(0, self.sig_first_frame.emit)
 
     # ---------- Plein écran ----------
     @QtCore.Slot()
@@ -157,6 +151,142 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.isFullScreen():
             self.showNormal()
 
+    @QtCore.Slot()
+    def toggle_perf_overlay(self):
+        if self._perf_overlay is None:
+            from ui_perf_overlay import PerfOverlay  # outil de diagnostic : importé à la demande
+            self._perf_overlay = PerfOverlay(self)
+        self._perf_overlay.toggle()
+
+    @QtCore.Slot()
+    def toggle_trace(self):
+        """Démarre l'enregistrement de la trace, ou l'arrête et l'écrit (hors thread UI)."""
+        count = niwot_trace.toggle()
+        if count is None:
+            self.statusBar().showMessage("Trace en cours d'enregistrement (Ctrl+Shift+T pour l'écrire)")
+            return
+        self.statusBar().showMessage(f"Écriture de la trace ({count} évènements)…")
+        niwot_tasks.submit(niwot_trace.export, on_done=self._on_trace_written)
+
+    def _on_trace_written(self, path: Optional[str], err: Optional[Exception]):
+        if err is not None:
+            log.warning("trace non écrite : %s", err)
+            self.statusBar().showMessage("Trace non écrite (voir le journal)", 5000)
+        else:
+            log.info("trace écrite dans %s", path)
+            self.statusBar().showMessage(f"Trace écrite : {path}", 8000)
+
+    @QtCore.Slot()
+    def toggle_profiler(self):
+        """Démarre le profileur par échantillonnage, ou l'arrête et écrit ses fichiers (hors thread UI)."""
+        if self._profiler is None or not self._profiler.active:
+            from niwot_profiler import Profiler  # outil de diagnostic : importé à la demande
+            self._profiler = Profiler()  # un par session : write() du précédent peut encore tourner
+            self._profiler.start()
+            self.statusBar().showMessage("Profilage en cours (Ctrl+Shift+P pour l'arrêter)")
+            return
+        self._profiler.stop()
+        self.statusBar().showMessage("Écriture du profil…")
+        niwot_tasks.submit(self._profiler.write, on_done=self._on_profile_written)
+
+    def _on_profile_written(self, paths, err: Optional[Exception]):
+        if err is not None:
+            log.warning("profil non écrit : %s", err)
+            self.statusBar().showMessage("Profil non écrit (voir le journal)", 5000)
+        else:
+            log.info("profil écrit dans %s", paths[1])
+            self.statusBar().showMessage(f"Profil écrit : {paths[1]}", 8000)
+
+    def stop_profiler(self):
+        """À la sortie : profil encore en cours écrit (bloquant)."""
+        if self._profiler is None or not self._profiler.active:
+            return
+        self._profiler.stop()
+        try:
+            log.info("profil écrit dans %s", self._profiler.write()[1])
+        except Exception as e:
+            log.warning("profil non écrit : %s", e)
+
+    # ---------- Pages ----------
+    def _page(self, name: str) -> QtWidgets.QWidget:
+        """Retourne la page, en la construisant (et en la branchant) au premier appel."""
+        w = self._pages.get(name)
+        if w is None:
+            w = self._factories[name]()
+            self._pages[name] = w
+            self.stack.addWidget(w)
+        return w
+
+    def _built(self, name: str) -> Optional[QtWidgets.QWidget]:
+        """La page si elle existe déjà, sans la construire."""
+        return self._pages.get(name)
+
+    def _show_page(self, name: str) -> QtWidgets.QWidget:
+        w = self._page(name)
+        self.stack.setCurrentWidget(w)
+        return w
+
+    def _make_login(self) -> QtWidgets.QWidget:
+        w = LoginWidget()
+        # pas de /me ici : une session mémorisée passe par _start_optimistic
+        w.set_client(self.client, check_session=False)
+        w.show_form()
+        w.sig_logged_in.connect(self.on_logged_in)
+        w.sig_error.connect(self.on_error)
+        return w
+
+    def _make_lobby(self) -> QtWidgets.QWidget:
+        from ui_lobby import LobbyWidget
+        w = LobbyWidget()
+        w.sig_enter_room.connect(self.on_enter_room)   # string: room_code
+        w.sig_error.connect(self.on_error)
+        w.sig_goto_suggest.connect(self.on_goto_suggest)
+        w.restore_snapshot(self.client)  # dernières données connues, avant la 1re requête
+        if self._user:
+            w.set_user(self._user)
+        return w
+
+    def _make_room(self) -> QtWidgets.QWidget:
+        from ui_room import RoomWidget
+        w = RoomWidget()
+        w.set_client(self.client)
+        w.sig_leave.connect(self.on_leave_room)
+        w.sig_goto_quiz.connect(self.on_goto_quiz)
+        self.client.sig_socket_message.connect(w.on_message)
+        return w
+
+    def _make_quiz(self) -> QtWidgets.QWidget:
+        from ui_quiz import QuizWidget
+        w = QuizWidget()
+        w.set_client(self.client)
+        w.sig_goto_room.connect(self.on_back_to_room)  # retour à la salle
+        w.sig_quit.connect(self.on_back_to_room)       # "Quitter le quiz" -> revenir à la salle
+        self.client.sig_socket_message.connect(w.on_message)
+        return w
+
+    def _make_profile(self) -> QtWidgets.QWidget:
+        from ui_profile import ProfileWidget
+        w = ProfileWidget()
+        w.set_client(self.client)
+        w.sig_logged_out.connect(self.on_logged_out)
+        if self._user:
+            w.set_user(self._user)
+        return w
+
+    def _make_admin(self) -> QtWidgets.QWidget:
+        from ui_admin import AdminWidget
+        w = AdminWidget()
+        w.set_client(self.client)
+        if self._user:
+            w.set_user(self._user)
+        return w
+
+    def _make_suggest(self) -> QtWidgets.QWidget:
+        from ui_suggest import SuggestWidget
+        w = SuggestWidget()
+        w.set_client(self.client)
+        return w
+
     # ---------- Helpers ----------
     def _show_header(self, show: bool):
         self.header.setVisible(show)
@@ -166,19 +296,65 @@ class MainWindow(QtWidgets.QMainWindow):
         Assure l'ordre : d'abord les clients/pages, ensuite l'utilisateur.
         Garantit l'affichage immédiat des avatars (profil/header).
         """
+        self._user = user
+        lobby = self._page("lobby")
         # rafraîchir données lobby qui dépendent du client (ex: liste de salles)
         try:
-            self.lobby.refresh_rooms(self.client)
+            lobby.refresh_rooms(self.client)
         except Exception:
             pass
 
-        # pousser l'utilisateur dans les vues
+        # pousser l'utilisateur dans les vues (les pages pas encore construites le reçoivent à leur création)
         self.header.set_user(user)
-        self.lobby.set_user(user)
-        self.profile.set_user(user)
-        self.admin.set_user(user)
+        lobby.set_user(user)
+        for name in ("profile", "admin"):
+            page = self._built(name)
+            if page is not None:
+                page.set_user(user)
         # room/quiz n'ont pas besoin du user directement ici
 
+    def _start_outbox(self, user: dict):
+        """Propositions en attente (y compris d'un lancement précédent) : envoi en tâche de fond."""
+        outbox = self.client.outbox
+        if not self._outbox_wired:
+            self._outbox_wired = True
+            outbox.sig_pending.connect(self.header.set_pending)
+        outbox.start(user.get("id") or user.get("username") or "")
+
+    # ---------- Session mémorisée ----------
+    def _start_optimistic(self, user: dict):
+        """Affiche le lobby avec l'identité en cache ; rien ne part sur le réseau avant la première frame."""
+        self._user = user
+        self.header.set_user(user, load_avatar=False)
+        self._page("lobby").set_user(user)
+        self._show_header(True)
+        self._show_page("lobby")
+        self.statusBar().showMessage("Reconnexion…")
+        self.sig_first_frame.connect(self._validate_session)
+
+    @QtCore.Slot()
+    def _validate_session(self):
+        log.info("time-to-lobby: %.0f ms (identité en cache)", (time.perf_counter() - _T0) * 1000.0)
+        niwot_tasks.submit(self.client.me, on_done=self._on_session_checked)
+
+    def _on_session_checked(self, r: Any, err: Optional[Exception]):
+        if err is None and isinstance(r, dict) and r.get("ok") and isinstance(r.get("user"), dict):
+            log.info("session validée: %.0f ms après le lancement", (time.perf_counter() - _T0) * 1000.0)
+            self.on_logged_in(r["user"])
+            return
+        status = r.get("status") if isinstance(r, dict) else None
+        if status in (401, 403):
+            # refusée par le serveur : inutile de la retenter au prochain lancement
+            self.client.forget_session()
+            message = "Session expirée, veuillez vous reconnecter."
+        else:
+            message = "Serveur injoignable, veuillez vous reconnecter."
+        log.info("session non validée (%s) : retour à l'écran de connexion", status)
+        self._user = None
+        self.statusBar().clearMessage()
+        self._show_header(False)
+        self._show_page("login").show_form(message)
+
     # ---------- Hook global socket ----------
     @QtCore.Slot(object, object)
     def _maybe_goto_quiz(self, event, payload):
@@ -197,6 +373,8 @@ class MainWindow(QtWidgets.QMainWindow):
     @QtCore.Slot(dict)
     def on_logged_in(self, user):
         self.statusBar().showMessage(f"Connecté: {user.get('username') or user.get('email','')}")
+        # cookies + jeton + identité pour le prochain lancement
+        self.client.save_session(user)
         # Connexion socket après login
         try:
             self.client.connect_socket()
@@ -204,7 +382,8 @@ class MainWindow(QtWidgets.QMainWindow):
             pass
         self._set_user_everywhere(user)
         self._show_header(True)
-        self.stack.setCurrentIndex(1)  # Lobby
+        self._show_page("lobby")
+        self._start_outbox(user)
 
     @QtCore.Slot(str)
     def on_error(self, message):
@@ -218,9 +397,9 @@ class MainWindow(QtWidgets.QMainWindow):
           - Affiche la page 'Room'.
         """
         try:
-            self.room.set_room(room_code)
+            self._page("room").set_room(room_code)
             self._show_header(True)
-            self.stack.setCurrentIndex(2)  # Room
+            self._show_page("room")
         except Exception as e:
             self.on_error(f"Impossible d'entrer dans la salle : {e}")
 
@@ -228,51 +407,52 @@ class MainWindow(QtWidgets.QMainWindow):
     def on_leave_room(self):
         """Retour lobby depuis la page Room (bouton Quitter)."""
         self._show_header(True)
-        self.stack.setCurrentIndex(1)  # Lobby
+        lobby = self._show_page("lobby")
         try:
-            self.lobby.refresh_rooms(self.client)
+            lobby.refresh_rooms(self.client)
         except Exception:
             pass
 
     @QtCore.Slot()
     def on_goto_quiz(self):
         """Basculer vers l'écran de quiz lorsque la partie démarre."""
-        code = getattr(self.room, "room_code", None)
+        code = getattr(self._built("room"), "room_code", None)
+        quiz = self._page("quiz")
         if code:
-            self.quiz.set_room(code)
+            quiz.set_room(code)
         self._show_header(True)
-        self.stack.setCurrentIndex(3)  # Quiz
+        self._show_page("quiz")
 
     @QtCore.Slot()
     def on_back_to_room(self):
         """Retour à la salle depuis l'écran de quiz."""
         self._show_header(True)
-        self.stack.setCurrentIndex(2)  # Room
+        self._show_page("room")
 
     # --- Header actions ---
     @QtCore.Slot()
     def on_goto_lobby(self):
         self._show_header(True)
-        self.stack.setCurrentIndex(1)
+        lobby = self._show_page("lobby")
         try:
-            self.lobby.refresh_rooms(self.client)
+            lobby.refresh_rooms(self.client)
         except Exception:
             pass
 
     @QtCore.Slot()
     def on_goto_profile(self):
         self._show_header(True)
-        self.stack.setCurrentIndex(4)
+        self._show_page("profile")
 
     @QtCore.Slot()
     def on_goto_admin(self):
         self._show_header(True)
-        self.stack.setCurrentIndex(5)
+        self._show_page("admin")
 
     @QtCore.Slot()
     def on_goto_suggest(self):
         self._show_header(True)
-        self.stack.setCurrentIndex(6)
+        self._show_page("suggest")
 
     @QtCore.Slot()
     def on_logged_out(self):
@@ -280,30 +460,95 @@ class MainWindow(QtWidgets.QMainWindow):
         Déconnexion depuis la page Profil.
         Ferme le socket, masque le header et renvoie à l'écran de connexion.
         """
-        try:
-            if self.client.sio and self.client.sio.connected:
-                self.client.sio.disconnect()
-        except Exception:
-            pass
+        self.client.disconnect_socket()
+        self.client.outbox.stop()  # les propositions en attente repartiront à la prochaine connexion
         self._show_header(False)
-        self.stack.setCurrentIndex(0)  # Login
+        self._show_page("login")
         self.statusBar().clearMessage()
 
 
+def _close_splash():
+    """Ferme l'écran de lancement natif du build PyInstaller (sans effet en dehors d'un build)."""
+    if "_PYI_SPLASH_IPC" not in os.environ:  # pas de splash (exécution depuis les sources, splash désactivé)
+        return
+    try:
+        import pyi_splash
+        pyi_splash.close()
+    except Exception:
+        pass
+
+
+def _report_startup(app: QtWidgets.QApplication):
+    """NIWOT_STARTUP_PROBE=1 : écrit le temps jusqu'à la première frame puis quitte."""
+    ms = (time.perf_counter() - _T0) * 1000.0
+    mods = sorted(m for m in ("requests", "socketio", "engineio", "requests_toolbelt") if m in sys.modules)
+    sys.stderr.write(f"niwot-startup first_frame_ms={ms:.1f} epoch={time.time():.6f} "
+                     f"net_modules={','.join(mods) or '-'}\n")
+    sys.stderr.flush()
+    app.quit()
+
+
+def _start_watchdog(app: QtWidgets.QApplication, client: NiwotClient):
+    """Après la première frame : surveillance des blocages du thread UI (watchdog.log)."""
+    import niwot_watchdog
+    if not niwot_watchdog.enabled():
+        return
+    watchdog = niwot_watchdog.Watchdog(client, app)
+    app.aboutToQuit.connect(watchdog.stop)  # résumé des pires blocages de la session
+    watchdog.start()
+
+
+def _dump_metrics():
+    """NIWOT_METRICS_FILE=<chemin> : mesures de la session (niwot_metrics) écrites à la sortie."""
+    try:
+        path = niwot_metrics.dump()
+        if path:
+            log.info("mesures écrites dans %s", path)
+    except Exception as e:
+        log.warning("mesures non écrites : %s", e)
+
+
+def _export_trace():
+    """Trace encore en cours à la sortie (NIWOT_TRACE=1 ou Ctrl+Shift+T non refermé) : écrite."""
+    if not niwot_trace.recording:
+        return
+    niwot_trace.stop()
+    try:
+        log.info("trace écrite dans %s", niwot_trace.export())
+    except Exception as e:
+        log.warning("trace non écrite : %s", e)
+
+
 def main():
-    api, ws = load_config()
+    api, ws, media_query, leaderboard_ttl = load_config()
+    logging.basicConfig(level=os.environ.get("NIWOT_LOG_LEVEL", "INFO").upper(),
+                        format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    if os.environ.get("NIWOT_TRACE", "0") != "0":
+        niwot_trace.start()  # dès le lancement : le démarrage figure dans la trace
     app = QtWidgets.QApplication(sys.argv)
 
     # Thème global
     apply_theme(app)
 
     # Icône fenêtre
-    app.setWindowIcon(QtGui.QIcon(resource_path("niwot-favicon.png")))
-
-    # Client API/WS
-    client = NiwotClient(api_base=api, ws_base=ws)
-
-    mw = MainWindow(client)
+    app.setWindowIcon(app_icon())
+
+    # Client API/WS (requests/socketio chargés plus tard, voir warm_up)
+    client = NiwotClient(api_base=api, ws_base=ws, media_variant_query=media_query, leaderboard_ttl=leaderboard_ttl)
+
+    mw = MainWindow(client, cached_user=client.restore_session())
+    mw.sig_first_frame.connect(_close_splash)
+    if os.environ.get("NIWOT_STARTUP_PROBE"):
+        mw.sig_first_frame.connect(lambda: _report_startup(app))
+    else:
+        mw.sig_first_frame.connect(client.warm_up)
+        mw.sig_first_frame.connect(lambda: _start_watchdog(app, client))
+
+    app.aboutToQuit.connect(_dump_metrics)
+    app.aboutToQuit.connect(_export_trace)
+    app.aboutToQuit.connect(mw.stop_profiler)
+    if "--profile" in sys.argv[1:]:
+        mw.toggle_profiler()  # jusqu'à Ctrl+Shift+P ou la sortie
 
     # Démarrage en plein écran
     mw.showFullScreen()
@@ -0,0 +1,82 @@
+# niwot_assets.py
+from __future__ import annotations
+import os, sys
+from typing import Dict, Optional, Tuple
+
+from PySide6 import QtCore, QtGui
+
+try:
+    import niwot_assets_rc  # noqa: F401  ressources Qt compilées (tools/build_assets.py)
+    _HAS_RC = True
+except ImportError:
+    _HAS_RC = False
+
+ICON_SOURCE = "niwot-favicon.png"
+AVATAR_SOURCE = "niwotfren.png"
+# Tailles pré-réduites embarquées (avatars : tailles affichées x1 et x2)
+ICON_SIZES = (16, 24, 32, 48, 64, 128, 256)
+AVATAR_SIZES = (28, 36, 40, 56, 72, 80, 96, 192)
+
+
+def resource_path(name: str) -> str:
+    """Chemin d'une ressource packagée (PyInstaller) ou en dev."""
+    base = getattr(sys, "_MEIPASS", os.path.dirname(__file__))
+    return os.path.join(base, name)
+
+
+# Registre process : chaque ressource est décodée une seule fois puis partagée (QPixmap = partage implicite)
+_icon: Optional[QtGui.QIcon] = None
+_avatars: Dict[Tuple[int, float], QtGui.QPixmap] = {}
+
+
+def app_icon() -> QtGui.QIcon:
+    """Icône fenêtre multi-tailles (les tailles sont décodées à la demande par Qt)."""
+    global _icon
+    if _icon is None:
+        icon = QtGui.QIcon()
+        if _HAS_RC:
+            for side in ICON_SIZES:
+                icon.addFile(f":/niwot/icon-{side}.png", QtCore.QSize(side, side))
+        else:
+            icon.addFile(resource_path(ICON_SOURCE))
+        _icon = icon
+    return _icon
+
+
+def fallback_avatar(size: int, dpr: float = 1.0) -> QtGui.QPixmap:
+    """Avatar par défaut (niwotfren) déjà à la taille demandée ; nul si la ressource est absente."""
+    key = (int(size), float(dpr or 1.0))
+    pm = _avatars.get(key)
+    if pm is not None:
+        return pm
+    side = max(1, round(key[0] * key[1]))
+    src = None
+    if _HAS_RC:
+        best = next((s for s in AVATAR_SIZES if s >= side), AVATAR_SIZES[-1])
+        src = f":/niwot/avatar-{best}.png"
+    if not src or not QtCore.QFile.exists(src):
+        src = resource_path(AVATAR_SOURCE)
+    reader = QtGui.QImageReader(src)
+    full = reader.size()
+    if full.isValid() and min(full.width(), full.height()) > side:
+        k = side / min(full.width(), full.height())
+        reader.setScaledSize(QtCore.QSize(max(1, round(full.width() * k)), max(1, round(full.height() * k))))
+    img = reader.read()
+    if not img.isNull() and min(img.width(), img.height()) != side:
+        img = img.scaled(side, side, QtCore.Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                         QtCore.Qt.TransformationMode.SmoothTransformation)
+    pm = QtGui.QPixmap.fromImage(img) if not img.isNull() else QtGui.QPixmap()
+    pm.setDevicePixelRatio(key[1])
+    _avatars[key] = pm
+    return pm
+
+
+def fit(pm: QtGui.QPixmap, size: int, dpr: float = 1.0) -> QtGui.QPixmap:
+    """Pixmap remplissant size x size logiques : size*dpr pixels physiques, devicePixelRatio posé."""
+    side = max(1, round(size * (dpr or 1.0)))
+    if pm.isNull() or (pm.width() == side and pm.height() == side and pm.devicePixelRatio() == dpr):
+        return pm
+    out = pm.scaled(side, side, QtCore.Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                    QtCore.Qt.TransformationMode.SmoothTransformation)
+    out.setDevicePixelRatio(dpr or 1.0)
+    return out
@@ -0,0 +1,7921 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.7.2
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x11v\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x008\x00\x00\x008\x08\x02\x00\x00\x00'\xe4\xacI\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x11(IDATh\xde\xad\
+ZyxT\xe5\xd5?\xe7\xbd\xeb\xdc\xd92\x99\xcc$\
+$!\x1b\xd9\x08B@@\xf6\xad*n\xd5\xe2\xe3\x02\
+\x1f_\xad\xd4\x22\xb4\xa5\xad\xa5hK\xb1\xb6\x8f\xadU\
+\xbfR\x97\x8a\x8a\x82Z\xa5\x14p-\xa0\x80\x88Z\x83\
+X\xc2f!\x04\x13\x12\x02\x09\xd9\xb7Y2\xfb\xcc\xbd\
+\xf7|\x7fL\x12 \x84$ \xf7\xb9\x93's\xe7\xde\
+\xf7\xfd\xbd\xe7=\xdb\xef\x9c\x8b\x00\x0a\x5c\xf6\x81p\xf5\
+\x0f\x1a\xf8g\xfe2\xc1\xd1\xd5\xc3\x84\x975\x1a\xbb\x1c\
+\xb1\xd1U\x12\xde\x95\xac\x99\x0d8\x16\xf6\x9c}.^\
+6\xb0t)\xfd\xa2\xf1\xf1\xb2t\x89\x03\x10\x86 K\
+\xbcB\xedD\x109\xe9~\xc7R\x03SNE\xaa.\
+!\x11\xbcr\x89\x8e7\x8dI\x10,\x80\xf8\xad\xcc\x06\
+Q\xe1L\xcbS\x1e\x1b!\x8f\xac\x8a\x1e6pR\x7f\
+(\xe9\x8a\xb7\x1e\x01\xe1z\xcb\xcc\x0d\xd9kV\xa4<\
+\x98*&\x03\x22 \x0e\xa6s\xd8}\xdby\xa7\x88\xc2\
+O\x93\x7f\x93!\xe5~\xec\xdd\xf6T\xee\x02\xd6\xbf\xf0\
+p\x88\xa2e\xfd\x1a\xe5\xa9H\x9dW\xf7\x17\x19\xf2\xde\
+\xc8\xfe\xbf\xc5\xce{D\xc6\x03^4\xd09L\xdd\xbf\
+ b\x9a\x98\xdc;\xef\xbdI\x8b3\xa5\xbc.\xbd\xcb\
+Ggf\xda\x0ac\xa4~\x1b\xf7\xd7\xff\xd67\xc5Z\
+M\x9cm\xab\xe7\xd3R\xff\xd1\xef'\xde\xf1R\xc6\xef\
+\x92\x04\x1b t\x8b\xb6G\xc6\x13L#\xe3[\x80\x88\
+7Z\xa7\xae\xcf\xfc\xf35J~\xfc{\xb12i\x82\
+q\x16\x01\xfc\xc7\xf7\xf9<\xc7x\xd2Ib\xe2`\x8a\
+D\x03\xb8\x97\xfe\x81zT\xafF\xf0?\xf6\xf9\xeb;\
+\xde\xd9\xe7\xffz\xa4\x9c\xf3r\xc6\xa3N1\xb1\x1b%\
+\x00\x00\x88\x8c_\xea\x98\x87\x88V\xde\xf4\xec\xf0G~\
+\x97\xb2\xf4\xebP\xf9'\xde}\x08\x08\x08S\xcc7\xea\
+@:@i\xa0d\xb6u$\x91\xaet\xeb\xe8\x15j\
+}\xbf@1J1\x0d@@yQ\xd2\x0f\x9elY\
+{&\xda<Lp\xfe%\xeda\x03'c\x8f\x0c\xaf\
+U\x0a2\xc5d\x1bo^\x9b\xf9\xdb\xc9\xc6\xa2\x0e\xad\
+\xfd\xcd\xce\x0f\xa6\x99\xc7\xfc\x22\xf9\xde?\x0c[r\xc0\
+\xf7\xde\x16\xd7+u\x91\x9a(\xf9F\x18\x92\x89\x80G\
+\xf6m|/\xebG9\x10D\x94T\xc0\x18`\x91\xa1\
+8G\xca}\xa2ym\x8c\xf4\x1cq\xf8C\xce\xfb\x00\
+\xb1X\xc9\x07\x80\x9b\xad\x93UR\x9fN[\x96#\x0e\
+cH\x0d\xb1\xa6M\xd9\x7f|.\xfd\xa1\xdb\xacS\xb7\
+{K\x0c\x5c\xc6\x9d\xb6\xc5\xe5\xa1#\xa3\x8d\x19\xa4\xa3\
+\xae\x7f\xdb\xc8|\xb1\x1fE@\xc8\x94\xb3'\x9a\xa6\xe8\
+\x00:@\x22o\xdf\xee\xf9\xd0\xc2\x99\x8b\x0c#r\xa5\
+\xccc\xa1\x8a1J\xae\x83\xb7.N\xba\xdd\xcc\x99\x86\
+\x09v@`\x00\xc3\xc5d+o\x0cR\xf8\x91\x865\
+\xd5\x91z\x89\x19y\x14\x0f\xf8?\x1b.Y*\x83\xcd\
+S\xcc\x05k\x9av\x85\xf5\xd8\x15\x87\xfb\xfe$J \
+\xa1\xac\x03j\x00\xd5\xe1\xea,)7\x89w\xfc\xc3\xb5\
+5\xa4G\x11\xe1\xc1\xa4\xbbl\x9c\xf9\xf1\xd4\x07\xab\xc2\
+\xf5\xef\xbb\xff]\x16:M\x80\x04\x08@D$\xa3\xb4\
+.s\xe5\xebY\xab:cg\x0e\xf9\xdf\xd3\xc1\xf7\x89\
+\xfb\x98NzH\xd3\xbcZ\xf0*J\xb4\xdb\xa8S\xc4\
+\xd4kM\x93\x89\xe0=\xf7\xdb\xef\xb86\xa8\xa4u\xa9\
+\xbeab\xd2H93UL\xcc\x94\x92\xb7y\xf6\xae\
+jZ{8X\xb9\xcd\xbb\xb7<\x5c3\xddX,1\
+1\xee\xa1\x00\xe8gg\x9fY\x91\xb2`E\xca\xbd\x0b\
+\xed7\xb4\xab\xee\x5cy\x98\x88<\x10W\x1e\xaa\x1d\x0c\
+\x10^\x96\x1f\xa5\x0e\xb5]#P\x09'\x18\xa7\xcf4\
+My\xc8\xb98UL\xfe\xd2\x7f\x98\x010 F\xf8\
+\xae\xe7\xf3\xbf\xa6?\xb2;o\xdd\xc7\xb9\xaf\xce4M\
+X\xdd\xb6\xb1{\x1a\x82\xb3\xd1\xd6\x9b\xad\x93\xa6\x9bF\
+\x9f\x0c\xd7\xd7EZ\x7f3l\xe16\xd7\xc1l!=\
+E\xb0\x9dK\x9b\x06\x0d\x1fC\xd2Q\x00\xbf\xee\x9be\
+\xb9\x15\x80\xb7p)\xbb\xbc\xdb'\x9b\x8a\xef\xb3\xcf;\
+\x1c<:\xd7r\x1d\x03j\xd5<7\x98\xa7fJi\
+;\xbaJ\xf6\xf9\x8f\xa4\x08I3L\xe3E\xe4$&\
+\x22@\x98\xa2\xa3\x95\xec\x95m\xafv\xce\x86\xe3\xce\xc6\
+\x1d\xc7K\x0a\xa5,U\xd7^j\xdd\xee\xd7BCH\
+\x9bh\xc8[\x0f\xa0\x03Yx{\xaa\x94\xdb\x12k\x8e\
+P\xf0\x1d\xd7\xa6\x19\xa6\x097[\xa6\x18\x19\x8f\x00\x16\
+\xceH\x00\x0f\xbb\x9e\x9d\xb4l\xda\xcdKo\xaaMl\
+\xd9\xb2\x7f\xfb\xf5\xca$\x89\xf1\x08`\xe6\xe4u\x1d\xdb\
+\x7f\xbc\xeeg\xbf\xf8\xc9\xd2y\xdf\xbd5i\xd4\xb0W\
+\xde\xd9\xb0\xdb{\xa8-\xe6>Odx\xb9\xca\xda?\
+P@\xac\x8f\x9e\x1ek\x9a\x15#\xed_\xaeu\xf7$\
+~\xf7\xeb\xe0\xb1Y\xe6\xb1\x02\x22\x02\x11\xe0\xf3\x1d\x9b\
+W\xbe\xfe\x9b\xff\x9d\x7fOVf\xe6\xcc\xa9S3\x8b\
+3_x\xfb\xf5\xd9\xc6k\x11\x80!~YP\xbd|\
+\xc5\xb2\xf8H#\xb2\xb2\x8eT\x1f?Pv\x94\xa8o\
+\xca2X\x869\x90\x8eR\xaf\x9a\xfaT\xef\xeb\xadO\
+\x22\x8as\xac\xf7V\x86k~\xee\xbc_B>\x9e\xed\
+\xc4H\x8b\x8d\xe5\xbe3kf\xfcN\x00\x983s\xc6\
+\xf0y\xb9\x0d\xb16\x00\x88\xe8\xb1\x11cs\xddn\xcf\
+\xb6\x1d\xbb\x80\x80\x80\xee\xbc\xfd6\xa5\x9f\xd4\x09\x86\x94\
+\xeb\x5c\xda\x98\xce-\xbc)R\xfbb\xf3\xc3Q=t\
+6\xda\xf1r\xfb?zs\xb2\x86X\xeb\xc4)\x13\x10\
+\xa0\xbe\xb1\xf1\xd1\xc7\x9fp{<\x00\xb0\xf0\x9e\xbb\x0e\
+\x04N\x00\x01\x02\xf2<\xff\xc4\xeag\x16\xdc\xbf\xb8\xf4\
+\xd0! HK\x1d6\xc34\x1a\x11\xe3!M\xe2\x14\
+\x85\xb7\x08L\x1aP\x07\xa8\xe7\xbc\xa4\x1f\xbd\xe0\xc9\xb0\
+\x16\xf8\xc4\xf3\xb6Wm[`\x9b\x8b@\x88\x80\x88Q\
+\x8aY-f\x00\xf8\xdb\xcb\xaf>\xbbf\xed\xcb\xaf\xbd\
+\x01\x04\xb9#\xb2\xdbT\x17 \x88\xc8\xb9*ZMF\
+#\x00\xf8\x03A\x00hjj\x9ee\x1e\x03\x00&\xde\
+6\xde<\xf9\xc9\xf4_\xbd\x94\xf1\xbb9\xd6\x99V>\
+\xf1\xd2r\xed\x8bd0r\x87h\xe6\x94\xd5\xe9\xbfJ\
+\x11\x12{\xd7\x9a\xcc\xdb\x8e5\x9e\x04\x00\x81\xe7\x01 \
+\x1a\x8d\x02@ \x1822\x19\x81\x10\xc9|X\xbf\xe1\
+\xc1\xef\x8c,\xc8\x9f3c\xba\xa6i\x1b6\xbf}\xb4\
+\xfd\xa8\xc4)Ff5 \x17\xd4\xfd\x0d\xd1\xc6\xbaH\
+\xbd\xc2\x0c\xde\xf86\x0d!\x81\xc6\x8b\xe82\xf6\xfcA\
+D\x18o\x1c\xf5\xeb\xe4\x1f\x9a8\x89@u\xf2\x09a\
+\x8a\x94\x85N!\xb0-\xd2\xe7\x1f\x95\xbc\xef\xf1z\x9f\
+\x7fi\xed\xcf\x7f\xbc$\xc5\xe9|k\xd3fe\x8d\xab\
+P\xca\xd8\xd0\xb1\xfbH\xf0d\x873\xbc\xea\xe1\xe5'\
+\xabOm\xffp\xe78\x7f\xea\x5c\xdb\xd8\x9fV\xbdi\
+@#\xc3xbK\x00\xa4R\xb4#\xd6\xd9\x0d\x91h\
+`?u)\xa0x\x83u\xc6\xf7\x12\xe6\x8e\x92\xb3\x05\
+$\x1eu\x0e\xe9d\xa4\xf6/mo^\xef\x1c\x99(\
+\x19\x0fy\xce$]\x9f\xff\xb7\xbf>-\xf0\x02\x105\
+45\xadZ\xb0\xf2qeA]\xa4\xd5\xcc\xcb\x87|\
+\xa7?r\x7fe\x17\xcd'\x83\x0d\xcf\x15,\xca7\xa6\
+\xa8\xa4N?\xf8x@\x05\x06\xc8\x00\x19\x02\x91\xee\xd6\
+\xdc1M\xed\xc6D0(P#\x5c\x1c1\x10M\x9c\
+r\x83eF\x91\x9c\x93*\xda\xc7)\xf9\x00\xda\x93\xed\
+\xaf\xac\x1e\xb9\xc0n\x92\xddj\xc0\xc8K_\xbbj\xd7\
+\xf8\xf7fO*\x8c\xc5b\xee\xaf\xce.K\xb8)O\
+I\x06\x84\x96\xa8'\x02\xd1\x11\x8a\xf3`W\xf58k\
+\x86\x91\x17\xe3Jx\xc2\xdf\xb8\xaa\xf2\xddc\xdez\x00\
+4\xf1\xe2\x1d)\xe3\xbab\xc1w\x1aK{\xfd\xcc\xd0\
+\x81^\xe0G\x01\x80C6\xcf6w\x91\xfd\xce\x04N\
+\xe9\xd4:\xcc\xc6h~\x82uU\xcd\xa6\x7f6\xees\
+J\x96\x1d\x13\x7f\x9d*\xda\xea\x02\xae/\x5c\x15\x1d1\
+\xef\x83\xe9s\xcc\xbc\xa1\x9b;\xb1n\x83F\x84\x18i\
+\x1a\xe9\x06\xae\xdb[\xfb\xb5\xc8/\xca7\xae+~\x80\
+\x03|\xe8\xf8\xc6M\x0d_\x0d\x11(\x7f\xa9\x8a\x80\x89\
+S\x1eK]>^\x19\xc5\x80t\x22\xa7`\xb7\xf0\xb1\
+\xa3]5\xc9\xa29\xcb\xe08\x13j[||\xfd\xd3\
+\x05\xf3\xc7\x9a3\xb2\x8c\xd30\xfe,\x9e\xe3y\xf1\xc5\
+\x96tV:E\xab\xc8\xb8\x5c\xa33>\x89Jz\x92\
+h\xe2\x00\x03jdO{\xd9\x80\x81\xf4\x02T\x1c\x80\
+\xd8s\xf5\x9c8E&\xfc9\xfd\xd1k\x0c#5\xd0\
+j\x22g\x128+\x87 p\x94(\x8b\xd7\xdb\x0bK\
+\xbd\xa7\xaa\x03-K\x7f\xb5\xf8x\xa2\xe7\xa5\xcf\xde\xb7\
+\x08r\x96\xe2\xe0\x18\x22\xe2\xf9\x8c\x15\x01\xb2\x0c\x0e\x87\
+h\xaa\x09\xb6\xa5\xca\xb6\xb8e\xff\xfe\xe4\x07?L\x9f\
+\xa90iY\xf9[\xc7\xbcu\x00\x90#\xa7\xda\x05\x8b\
+K\xf5\x0d\xcc\xa4\xe3!\xb4/\xbd\xfc\x91\xe3\x07Ff\
+|\xb3s\xcb\xf3m\xebs\xe5\xcc<9\x07\x01\x18#\
+\x85\xe7x\x8eZ\xa2\x9e\x12W\xc5\xb5\xc5c\xa6\x5c7\
+\xf1\x83\xfd\x9f\xa6}\xaf\xf8\x0f\xfb7\xeeo:\x19\xd4\
+#\x09\xa2\xd1\xca\x1b\xf0\xc2\x12S\x9al\x03\x80\xb3\xa1\
+\xce\x15\x15\x9b\x0e\xc7\xea\x0f\xb6U?Q\xb5\xb5\xcc{\
+\x16\x00\x86K\xce\xf7\x0b\xfe|o\xe2\x1c\xab`\xfa\xca\
+W>t\xf7\x84\x00\xc01\xae\xd0\x90\xffM\xa8\x12\x00\
+oO\xb8q\x99c\x11\x03bH2\xaf\x99e\xd5l\
+P\xebbMs\x0e\xfd1\xd1\x96@D\xa1p\xb8\xbe\
+\xa2l\xe1\x8f\x96p\x1c7\xe5\xba\x89\xaf\xbc\xfe&\xb9\
+\xc3\xa3,\xe9Y\x06\x87C\xb0HL\x88P\xac-\xe2\
+=\xd6u\xd6\x95\xa0\xbe\xb1v\xcd\x87;w?\xf3\xc2\
+\xcb\xbd\xf3\x99yeO\xe1\xf3\x12r\x04p_\xcd\x9f\
+N\x04\xce\x5cJS\xd9\xc5\xe1_\xd3\xb5\x13\xc1J\x22\
+0r\xca\xf7\x13\xe7k\x00*\xa0J\x18\xd1X8\xc6\
+\xa21\x96+\xa7\x14\x1aS].\x8f\xdb\xed\x0d\x87\x22\
+\xb3o\xb9c\xcfg%\xcd-\xadw\xdev\xab\xc7\xe3\
+uS\xe8\x95=\x7fw\xde[\x5c\xd9\xa9\x7f\xda\xdc\x18\
+\xbc1\xf9\x91\x7f=\xa5e(\xde.\xdf\xe8\xa2\xa2m\
+\x1f\xed<\x7f.\x9f\x1a,\xf5\x7fC\x80\x040N)\
+\x18 \xfa\xb3\x01\x92\xab\x19\xa6\xa9\x123z\xb4\xc0v\
+\xcf\x9eM\xaem~\x8dB*\x17V\x99\xaa\xb1\x05)\
+S\x01!\xdb\xe0\xb81qT\xb4\xce\x83\x88e\xe5\xdf\
+\xdct\xe7=\xa1P8\x12\x8d\xae}\xed\x8dm\xef\xed\
+\xba+\xe1\xce\x86h\xe3\xf1\x13\x15\xb5ug\x8f\x96\x9d\
+p\xb9\xdc3o\xfe\xee\xa9\xd3\xb5}f9\x1e<\xa3\
+\xeaH\x04\x1a\xe8\xfd\xa1\xc0>V\xdf\x8f\xc3-4\x8c\
+z\xd7\xbd\xf5}\xcfV\x1b\x97\xf4X\xea\x1f\x22\xc0\x07\
+4\x9d\x8fr\x22\xaf\xdf\xed\x9c\xba\xbe\xe1\xb3\xbd\xc5+\
+\x05\xc6\x10\xe0\xcb\xaeSO\xd7\xef\x9ao\x9e\xb8\xdeW\
+R\x15ly\xf6\xc5Wf\x98\xa6\xb8\x12:\xeb\x22\xf5\
+u%\xf5_\xfe\xa7\x94\x88\x00\xe0\xc47'\xfb\xb3o\
+\xa6\x11\x02`U\xb8\x1e\x10\x80z\x0b^\xbdQ\x00\xfb\
+X}\xdf\x04\xac.Z\xbb\xdf\x7f@\x07\xfd\xc1\xe4U\
+\x16\xde\x19\xa3\x18\x02G\x00*Dl\x82\xe8\xd1\xfd\xaf\
+5}Q\x13n\x1fo\xce\xcc58F\x1b\xd37\xb5\
+\x1d\xd8X\xb8\xf8\x13\xf77\x9d1\xff\x0c\xd3\xe4\x90\x1e\
+:\x188\x12\xd7\xa5K\xa7\x12\xf0@\xd2\xdd\x89|\xc2\
+3\xad\x1b,\x9caY\xf2\xf7\x96&\xdfz\x8bm\x82\
+W\x0b\xd4FZ\xcf_M\x1c(\xf6\x0dN\x08\x00\xe8\
+\xd7\xfc\x88\x98g(VA\xdf\xd8\xbe\xe6]\xd7?w\
+v\xedj\x8d\xb992K\x8cf\xd8s\x9f\xaa\xfb\xd7\
+\x17\x9e\x93\x95\xa1\x96yI\xe3RDKu\xa8\xd5\xc0\
+\x89s\xac\x05\xef\xb4\x1f*\x92\xf3\x0cL>\x12>F\
+D@\xd8\xd7>\xa8[\x16\xd9\xf2\xf0\xc5\x8e\x05\x1b;\
+\xb7\xe7\xc9\xc3\x1fp\xdc\x9e)\xa5\xd8\x05s\xaa`\xbf\
+\xc1:\xfe}\xd7\x97A=\xd2\xbb\x22\xd6\x7f\xd1\x87z\
+>D\xa7Be\x1f\xbb7\xbb\xd5N\x00\x94P\xd1\xd1\
+&\xb3\xac\xbf\xb7\xfc\x87\xe9\xca\x8a\xcc;\x00`\xb7\xab\
+\xbc2\xd8B\x00K\x86\xcd\xfa\xd8U>\xdd\x9a7\xc2\
+\xe0,\x0fU4\x88\x8d{\xb6\xbe\x0b@}-$\x8e\
+\x9b\x08\x00\xe6Z\xa6#\xc0\xd1P\xc5T\xd3\xf8\xb0N\
+\xc7\x83u_x\xcb\xabC\xad@|\xaa\xe88?7\
+e\x97L\xb0\xa8{,\x8d\xf4\xb8\xe2$\x0a\x0e\x86\x9c\
+CH\xd5\x995]\x9c\xf8t\xed\x07w%\xcd\x9ee\
++\x22\x802\x7f\x03\x02Yy\xd9.\x98\x10a\xb6\xb5\
+\xe0D\xb8j\xfa\x92IE\xf9\xf9\x02\xe3\x92\x04\xf3\x85\
+\xde\x86z7/[L\x07\x82\x91r\xee\xef\x9b^\xfc\
+e\xfd\xea\xbd\xbe\xe3]Z\xect\xa4#\xaa\xf3Q\xd2\
+\xfa\x84\xd0\xc1\x93\xc1|\xa5\xf8\x16\xdb}iR\x0e\x00\
+\x01\xe8\x84,].\xdc\xdc\xb1\xfe\xed\xe6\x83Oe-\
+\xf9Q\xe4\x19\x99\xeb\x1e'S\xb2\x03P\xbe\x92\x0c\x04\
+\x7f\x5c\xfdL\xe9\x91#s\x12\x8a2\xe5\xa4u\x8d\xff\
+\xee7\xe2\xb8T/\x01\x8e\x96\xf3\xbd\x9aoE\xf2\x03\
+\x0c\x08\x81\x10 \xaa\xd3(C^e\xa8\x16\xa8;]\
+\xed\x9f.\xf7\xb1\xaaN\xb5\xf5X`_\x97\xd6\x91!\
+\xe7JL\x89\xc7\xdb\x141\xfd\x85\xc6\x173\xc5\x1c\x02\
+\x9am\xcb\x1a&Z\x01\xc0\xc0\x84\x04\xdeP\x17v}\
+\xe8:\x16\x8d\xc6\x94\xc6\xd8Ky\x0bwt\x96U\x06\
+\x9b\xfb%L\x01\x0a\xddh\x9e\xb9?\xf0\xdfT\xd1\x99\
+&\xa4TE\xea\xeacm\x12\xca\x1cJ\xbb\xbd\xfbj\
+#\x0d\xbdw\x0f\x0eT`\xe2\x5c\xdb\xc2\x85\xce\x15E\
+\xcaD\x91\xc9\x80\xddYG\xa2\xe0T\x98qm\xcb\xfa\
+\x96\x98\xeb\xd7\x197\x89\x8c\x07\x80\x04\xde\x00\x00\x15\xc1\
+\x16;o|:\xe7\xee\xe5\xe9s\xf7z\xab\x9fk\xfc\
+\xa4\xdbG\xf6\xc9|\x10\x03\x14\xb2q\x96\xf1J\xf1\x13\
+\xcdk\xca\xc2U\x1a\x81\x06\xd0\xaa\xba\xd3\x84\xf4\xb5\xed\
+o\x85\xcf\x19\x13\xf1\x97N[\x00\x00\x0cLY\xe8\xfc\
+\xadJ!\x8dT\x02\xf1B\x0a\x00\xd3\xac\xb7\xc8L\xde\
+\xd6\xf9\x9a\x85\x93\xa8w_\x09\x9a#\x9e\xd1\xc6\xe1\xaa\
+\xae\xaf\xa8y\xbb*\xc4?\x96\xb1v\x7f\xd7g_\xfb\
+\xbel\x896\x9c\xe7`\x10\x00\x96$\xdd?\xd3<\xad\
+&\x5c3\xcd4\xf9'I?$\xa08\xa3\x0b\xe81\
+\xff\xb9Z\x15\x0d\xdcg\x02\x00p\x88i[:V7\
+DOIL\x89;\xe2>\xa4k\x94qRX\x8f\x85\
+\xf5\xde\xb27\x12\xc0\xa7\xee\x8aGk\xb7>V{ \
+I\xb8u\xbec\xd9>\xef\xc7-\xd1z\xd6[\x1f\xed\
+\x19b\xb2\xf9\xba\xc9\xa6\xe9Q\x9dL\x9c\xb5*|\xaa\
+2R\x13!:\x1d\xa9\xf7\xe9\x91\x8f<\x9f\xf4)\xa5\
+\x0f\xd2\xbe\xf1j\xae\xe1R\xde-\xb6E\x22\x138D\
+\x86\x80\x88\x0c\x80\xf5\x84\x0f\x9e\x09\xc7\x03\x07#\x14\x98\
+b\xc9\x89\xb3\xf8\x0d\xad\xa5e~X\x9e\xf6\xd48\xf3\
+\xb4D\xc1\xc1\x80\xb3\xf1I;]\x9b;\xd5\xb6\xf3\x19\
+f\x96\x9c\xfdP\xca#\x0cx\x1d\xe0C\xef\x8ei\xa6\
+\xa9\x15\xe1\xea\x03\x81CF\xce\x5c\x16*\xff\xa7k\x0b\
+\x91>0g\xea\xcbInM\x5c\xa4A\xf8;\x09\xf7\
+0\x8c\xe3C\x95\x22\x0c\x99\x80\xdd+l\x88\x9e~\xb5\
+\xe9\x89\x22\xa3\xbd\xc0\x90\xf2M\xb0\x19!}\xbe\xe3'\
+\x02\x8a\x04\xd0\x1c\xa9=\xe2\xdf7\x5c\x1a\xa1\x93\xf6V\
+\xebs\x00\x18\x8f\xa5\x99r\xf6/SVY93G\
+\xc4\x80B\x14z\xab\xe3\xef\xf5\xd1Z33\xd7G\x1b\
+\xba4\xdfy\x09?\x0d\x00\xf4\x1cVd\xcc\xc0\x94\xe5\
+\xe9\xcf\xda\xf8$\x8c\x13H\x84\xa3\xfe}\xc3\xa5\x11v\
+\xc1\xc9\x90\x8b\xdf\x16\xd1C\xd5\xc12\x95\xa2\x19r\x9e\
+\x9dO\x06\x80\xb2\xc0\x81Q\xca\x04\x95b+\xcf\xdc\xc7\
+\xa1\x80\x00Q\x8a\xfe8eeH\x0b\x18\x98\xe1\x1aC\
+1\x8f\x8c\x11\xc4\xfd\x11\x01\xbd\xe7\xda\xbc\xcb\xf3Q\x7f\
+,\x8f\x86\xc4\xeb\x89(\xc70\xd2.8\xf0<+\xaa\
+\x0e\x95\xeb\xa4\xba\xd5\xd6\x02el\xefH\xa3M\x93\xe2\
+\xc3\xaa\x14\xe3\x90?\x1d\xaa8\xec+Y\x94\xfc\xb0\x95\
+\xb7\x1b\x99\xe9\xe7\xa9\x8f\x9f\x0c\x1e\xb3\xf3\xc9\xc9\x86T\
+\x04\x00\x22\x9dH\xefQ\xd7\xf2\xe0\xb1\xdd\xde\x1d\x97\xe0\
+\xa2\x837m\xbb\x8f1\xc6\xc9\x1c\x02\x220\x00\x86\x88\
+\x80\x8d\x91\xd3G\xfc{\x0b\x94\xb1\xbd\x85\xb9\xd6\xe8Y\
+o\xac#\xbe\x0e\x9f\xe6\xd9\xeb\xfd(J\x11\x99)[\
+;\xdf\x04\xa2\xa6\xe8Y\x1e\x851\xc6\xc9N!\xad7\
+\xd4k\x00\x1a\x80JP\x15\xaeZ\xdf\xf6\x82N\xfd\xca\
+\x92.\x03h\xb6\x5c\xd0C)\xe3[\x8f\xaeX\xfb\xf7\
+\x93\x1f\x82\x9e\x1e\x19\x02d\xc9\x85<\x13\xe2\xff'\x0a\
+\x8e\xd2\xae\xcf\xceFN\xdd\x96\xb8\xb0\xc4\xbb\xd3\xa3v\
+\xea\xa4m\xef\xdc\x18\xd2\x03DD\x04\xf1\xb6\x8eF\x10\
+\xd2#\x9fw\xedZ\xd3\xf2dX\x0f\xf7\xc7B\x07o\
+\xda^\xc0\x9b\xfd\xba{\x98\x94a\xe1\x12\xbasr\xcd\
+}\xc8W27\xf1\xees\xd5A\x8c\xb7\x9d\xe4\xde\x87\
+#z8G.\xcc3\x5cs\xd8\xb7\xd7\xaf\xf9\x00\xa0\
+6\x5c]\xea\xfb\x5c\xe1\x94T1+\xa0\xfbu\xa2\xb6\
+X\xb3Km\xefT\xdb\xdbb\x8d!=0\xa8\xbc\x06\
+\x7f\xb1\xe0\xbf\xbe\xd2\xa3\xfe\xd2,9\x7f\xb4iR\x9e\
+\xe1\x1a\x02Mf\x06\x04\xec\xb6\xe0x\xff\xeb\xfcm#\
+\xb8\xde6/~\xc1)\xa6\xb6E\x9b{\x18}\xd7\x96\
+\xf6u_u\xed\x99\x9bp\xf7\xde\xae\x9d\x06f<\x11\
+<\xa2\x916\x942\xc9\xe0V\xdfO-\x13I@i\
+\xb4q\xfcpy\x84SH\xb5\xf2v\x853I(!\
+bL\x8f\x065\xbfGuu\xc4Z\x1a#\xb5\xa7\xc3\
+\x95\xdd(\xfbl+\x02\x03\xa6\x83~\x09\xd3\xa1!\x16\
+\xc9\x86\xd0L\xc1!w\x0a\xe9r_\x9a\xa0+\xdbz\
+\xea\x1f\x10]\xc5\xd76\xae\xb0!v\xf1ctU\xdf\
+&\xb9\xf2)\x86\xd8H\xc5\xab\x8d\x8f\xfa\xc3:\xd0\xf1\
+\xff \x9c\x95&\xdc\xf0G\xf5\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00)\x1e\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00`\x00\x00\x00`\x08\x02\x00\x00\x00m\xfa\xe0o\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00 \x00IDATx\xda\xcd\
+}w|TU\xda\xff\xf3\x9c{\xa7\xb7Lf\x92I\
+O\x08!\xa1\x13z\x17\x10A\x8a\x05]P\xb0\xaf\xfa\
+\xaa\xa0+bw\xd7\xb5\xade\xedb\xaf\xb8*b\x17\
+|\x11T\x04\x01E\x90\xaet\x12zz\x9bL\xa6\x97\
+{\xef\xf3\xfb\xe3\xceLf\x92\x994u\x7f\xef|B\
+\x98v\xcf=\xe79\xcfy\xca\xf7\xf9\x9e\x13\x04\xd0B\
+\x97\x1e\x08@\xc9\xdfi\xf3\xa9\xfc\x12\xe3\xbf\xdf\xfe\x9d\
+?\xf0\xd1\xa6\xf1\xe8\xcb\xd8'=y\xb0\xee\xf4\xa0\x03\
+\xe9$\xec.\xfd\x17\xa5#\xff\xa6\x98\x9bR\xf2\xce\xff\
+)\x02\xeaX^\xf2\xf81^d\x18/\xd0?\xef\x11\
+{_\xecp\x9e\xba\xfd\xe0\xff\xb8\x09L\xf8\x04\xffL\
+\x0dJ\xa8\xa7\x1dO\xe4\x9f( l7rJ\xf2Q\
+B\xad\xc1?Mq\xb03q\xfc7lPW\x86\xda\
+\xe6;\x7f\x82D\x10;\x135\xc6\xdc\x1a\x7f\xbftz\
+`\x830\xc9\xd4\xfda3\xd6\xa1t\xa8D[2+\
+ev\xa2;\xb77\xcf\x7f\x80\x01\xea\x8a\x80:\xd6\x05\
+L\xa48\xf4\x07\xaf)\x04@\xe4\x19w\x99\xf5\xea;\
+2\x1f<\xe4?\x94\xa8ql\xe7\xd7\xff\x18\x07\xcaw\
+\xa3\x97\x04\xdd_\x8f\x7f\xcc\xb22\xf2\xc6\x85\xe9w\xf6\
+R\xf5\xf9\xc5\xfd\xe3\xa9\xc0\xa9.t\x14\x139\xb8\x9e\
+h\x13\x07\xa0\xe8t\xa8\xa5\xba\x01zN\xdf,\xb5\x00\
+  \x86m\xc1\x9f\xea\xaf#\x8a\x03\x00\xa9\x0a\xcb\xed\
+\x99\x0fe)\xf3D\x08\xbdV\xffl\xae:\x85\x10}\
+R\xb0k\xae\x0d\xff\xec%\x06\x808L7\xe4\xc5\xbc\
+\xc7\xde,x\xfaB\xf345S\x86\xbb\xdes1\xc5\
+\xcc*b\xe47\x00bd\x5c\x91\xf7\x01L|\xcam\
+\x19\x0fXx\x1b\x00\xfc\xe4\xda\xe0#\xf7\x8a\x81\x8bU\
+\x8c\xef\x82\x95\xfcc\x1c\x05\xeb\xca2)\xf3\x1f\x17\x81\
+\xb2\x15\x997\xa5]\xb5\xbc\xf0\xc5\x05\xa9\xe7\xab\x98\x22\
+FL\xd8%\x89`\xa4\xeb\x08\xadBi\x1dQ\xe4;\
+\x88\xd1\xf6TL\xb9\xc8vo*\x9fN\x00\x22H\xeb\
+ZV_\x9e11K\x95\xea\x11|1\x0dv+h\
+\xea\xb6\xd4XW\xd4\xfdx\xe0\x14\x00\xba%\x8f[\xf2\
+\x188\xdd\xb5\xd6y\xef\xf5z\xfa,\xc3\x88\xe8`;\
+\x17\x13b\xdc\x900^4\xb2P\xb0\xed\x15\x97[o\
+\xcaR\xe6\xcbZ\xb5\xd3\xbd\xc5%\xb5\xdc\x98u6c\
+\x10\x22\xb1k~\x92\x12\x19Q\xea\x96\xc5d]\xc9$\
+\xeaB\x0d>)\xa4f\xfaw\x1b?\xde\xe4\xfa\x05\x80\
+\xa5),\x8fd-~8\xeb\x16\x1d\xaf\x8d\x09O\xb0\
+m\xd4\x1f\xd6\xb2\x18\xb5\x88\xb32\x88\x88\x1c\xe2\x18\xfd\
+\xe0\x85i\x0b\xf4\x9c6\xb6\xdb\xe3\x0d\xe7\x0c\xd1\x8d\x8b\
+~s\xa3k\xedd\xf3\x80l\x95\x99\x08x\xc6\xb5j\
+b7\xdc\x05\xf6\xc0\x99\xb0\xaei'\xd5\x85\x1aD\x80\
+\xcb\xad\x97\xbd\xd3\xf8\xf1\xeb\x0d\x1f\xc8Q\xc7\x14\xc3\xe8\
+w\xf2\x1f\xe9\xa5\xca\x0a\xeb\x06\xb6Z\xd68y L\
+1\x8e0\xf1\xfa\xd6w\x11\x11Q\x85\xfc%\xa93V\
+\x14<\xffP\xe6\x92]\xde\x03n\xd1\x87\x91\x8f\xac|\
+\xfa\x05\xe6+\x09H\x22 \xc0\x13\xfe\xa3\x95\xc1\xd3\x17\
+[G\x12\x00I\xa2\x86\xa9zj^\xa8]\xf6C=\
+\x16\x10\xb5\x8a\x07\xa0Qh\x96\x08\xb4Lwk\xfaM\
++\x1d\xeb\x9e\xa9}K\x02\x00\x80,E\xfaky\xff\
+\x1c\xac-\x02\x8c1\x09\xf1!/\x02\x94\xa8\xf2g\xa6\
+\x8c\x0d+\x13\x22\x00\x8c\xd2\x0d|\xbf\xe0\xc9\x1b\xad\x0b\
+\xd2\x14\xe6W\x1a\xde\xdf\xe59\x801kpN\xea_\
+yT\x11\x01!\x10\xd06\xf7F\x0e\xd9\x94\x94\x01@\
+@$\xa9\x98\x12\xa8g~\x0a\xbb\x9b\xe5w\xc1\x06!\
+\x00\x80[\xf2H\x00\x04\xd0_\xd3\xff<\xd3\x8c\xef\x9c\
+?\xbdR\xbf\x5c\xfeP\xcf\xb4\xcf\xe4\xdc5P\xd3;\
+NF\xf1\xf6y\x88\xb6\xf7\x18\xfd\xc0\xa8\x83\xba)}\
+\xee\xd39wf*-\x1c\xd0\x0f\xae\xad_\xb7l\x8c\
+\xbd\xc0\xaa\xb0\xd9\x949Q\xf0\x22D\xa1\xbd\xde_\x06\
+\xe9\xf2\x8d\x9c\x1a\x00\x88@\xcf\xab:\x09\xe6\x93N9\
+\xfd~/\x86\x09\xc3*\xbf\xe4'\x00\x91@\x02\x98o\
+\xb9$\x8d\xb7\xact\xac[\xe3\xdcL\x80\x00\xa0a\xea\
+\x7f\xe7\xdc\x99\xab\xb4\xc9+$nu!j\x99r\xb0\
+\xa6O\x16o\x05\x04\x8e\xb1\x87\xb3\x16^\x99:\x9b\x03\
+\xe0\x10\x9c\x92\xeb\xc5\x86\xe5Q\xc1\xe5)m\xc3\xb4%\
+\x05J\xcbG\x0d\xff~\xb4j\xd1:\xe7\x17\x04p\xc0\
+\xbb+ \x05\x86\xea{E\xc5\xa1\x00\xd6\xfd\x91R\x92\
+\xc4\x00\xbb\x1bI'\xb932\x09\x00\x11\x81\x80C\xd5\
+e\x96\xcb\x96\xd6\xbd\xf4B\xdd{\xfd\xd5E\x85\xca,\
+\x0000\xed\xe3\xd9Kn8\xf3\xa0O\x0c   \
+Eo>N?X\x81\x1c\x8f\x0c\x11\xef\xb5]3\xcd\
+0\x12\x80\x08\x01\x00\xfe\xd3\xb4\xd2#z'\xe8\x87\x9c\
+g\x1a?J7P\xcb\xd4\x22Q\x99\xbf\xfa\xcd\xc6\xcf\
++C\x07S\xf9t \xfc\xcd\xbb\x03\x00\x07\xe9sI\
+\x22@$\x02\x8c\xcbi\xa8\xcb\x8b\xab'x\x08\xebJ\
+\xd6\x8e\x00JT\x8b\x80\x22\x81\x08 \x00\x8c\xd4\x8d)\
+T\x15\x04I\xf8W\xcd\xabA\x12\xe5\x9b\xe4*\xb3n\
+K\xbbJ\xee|*o\xea\xab.\x90/\x9fe\x1a\x8b\
+\x00>\x0a\x5cn>\xf7<\xd3\x04yp\x0c\xc9#y\
+\x1a\x84\xc6\x15\xbd\xfe\xf5l\xce\xe2\xb3\x0d\xc3\xf5L\x05\
+@\xef\xdb\xd7\x5c\x7f\xe6\xc1c\x81\xba\xbf\xd9\x1e\x1d\xa6\
+\x9d(\x82x\xd8\xf7+ \x0d\xd2\xe6\x11!\x11\x10\xc9\
+\xd6\x95z\x84\x1ct\x8c\xea%\x16\x10&\xd2\xc3\xb6B\
+\xd6pz\x09 \xfcC@\x00\x17\x99\xe7\x02\xd0\xf1@\
+\xc5\xc7\xf6\xb5\x04H\x84@0\xdd8q\xacn\x08 \
+\xd8\xc5\x96;3\xafF\x84Le\xeax\xfd`\x000\
+1\xfd\xcdis\x19\x10\x22\xc9^_\x81\xdc39\xb7\
+\x15\xaa\xb2\xe4EI@\x8f\xd4\xbc\xfdF\xc3\x97)\x9c\
+u\x91\xed_\xe9\x8a<\x89\xe0\x84\xffH\x80\x82FN\
+\xd3[\x95\xe9\x16C\x92\x04\x92\x04\x22I=\xb2,\xd4\
+\x83$\x96%\xd1\xba\xb6w\xd51\x83D R\xd8\x0c\
+\x89\x00\x035\xc3\xb2\x159@\xf0\x81\xfd\xab:\xc1\x1e\
+\xf6\xde\x00\x8b\xd3\xafR \x07\x04yJ\xdbX\xfd\xa0\
+\xab,3\x180\x00H\xe7S\xb9\xd6p\x88\x10H\xcb\
+\x94,<\xa7\x04\x88\xcf\xd4\xafX\xdb\xb2\x0d\x00\x9a\x84\
+\xfa\xa7k\x96\xfc\xaf\xe3\xfd\x9aP\xc5o\xdem\x000\
+X\xdbki\xd57\xb3\x0e<&\xcf_\xb3\xe0!\xec\
+An\x8c\xed\xc6\xd5\xb9p\xdb$\xab\x98\xd8\x8b!\x9e\
+g\x9e\xa3a\x1a\xb9=\x09\xc2N\x96@\xda\xef\xfdM\
+$\xc9-y\xc6\x1bF\xc8\x17\x188m\x8b\xe8<\x1c\
+8\xb1(mn\x8e\x22\xed,C)\x03F\x09\x96-\
+\xc6\xde\xca'\x05\x8c\x9c\xf6\xda\xb4\xf3\xe6\x9a'\x8f\xd1\
+\x0f\xda\xeb=|\xc8\xb7\xef\x17\xf7\xfa\xca\xe0I\x00\xac\
+\x086\xfe\xe2*\x1fi(:?u8\x00\xf7d\xe5\
+\x97\x12\xf5\x0cT\xc5\xee\x02{|\x12\xad\x8b\x0b\xd2\x91\
+\x88\x01'\x01\xca\x1f\x1c\xf6\xfeV/\xd4\x8d\xd4\x8d\x1d\
+\xae\x1b\xfba\xe3\xfb\x00\xb0\xce\xb9\xe5j\xcbE\x19\x0a\
+\xab\xac\x22\x97\xa5\xce\xde\xe5;\xc0\x08\x07k\x8a\x82\x14\
+\xfa\xc2\xb1~\x97\xe7H\x88\xc4\x12u\xfeL\xd3\xf8\x5c\
+E\xba\x9c\x96b\x8c\xaf\xd40\xd50m\x09\x00\x05(\
+\xf4l\xddG\xd5\xa1\xc6,\xa5e\xa8\xa6\x8f\x8f\x02\xbf\
+x\x0ey\xc5 \x00\xcc6\x0f'\xc2\xba\x80#D\xe2\
+\xef\xc61\xb0\x8bk\x93\xefR}\x06Q\x90-1\x01\
+\x019%\xcf\x07\x8d\xff\xf9\xb0\xe9\xbdR\xedp\x03o\
+p\x09.\x09h\x95c\xfd\xc2\xb4\xf9\x0c\x88\x03\xc8P\
+\x98\xef\xcf\xb8\x0e\x90\x1c\x82\xe7\x96\xca\xa7\xca\xfc\x15r\
+3?{\xf6\xfd\xc7\xfe\xf5\xc5)SnM\xbfT\x8d\
+|,\xc0\x16\x0d\x0d^\xae\xfb\xe2\x17\xcf\xa1\xab\xad3\
+oI\xbf\x98C@\x00\xbb\xe8\xba\xbb\xe2\xb5=\xde\xf2\
+\x11\xba\x12Q\xc2\xc3\xde\xaa,\xa5\xb5\x97\xca\xb6\xc5y\
+\xb05\xfb\xef\xb6\x1eQ\x17\xe5\xcb:\x04\xba[e\xd6\
+\x22\xb6H\x146\xd2\xfd\xd5C8d#\xb4\xa5N\xa1\
+\xd1%:\xe5[\xacw\xfdLD\x0c\x00\x91\x10h\x90\
+\xba\x08\x09\x1f\xacy\xa3\xcc_\xc1!\x1b\xaa\xed{\xbe\
+i\xd2\x14\xc3H3g\xfc\xdc\xf1\xc3\xe2\x8ag\xfdR\
+\xa8\xf5^\x14\x9eM\x9f\x18\x5c\xe9\xd8\xbc \xf5\x9c[\
+msYDa-\xbc\xe1\x85\xbc\xbfe)\xad/W\
+\xaf\x11%\x08\x11}Tt\xaf_\x0ca$\xd2j\xcd\
+oz\xbe\xd6\xba\x07\x98\xb5K\xab\x11\xfai\x07f\x86\
+\xa3[d\xa8\xac\x09V\xfa%\xd7S\xb9\x8f\x0cR\xf7\
+=\x1d<c\x17[|R`\x9c~\x88\x8d73\x94\
+c\x07\xda\xe7?\xf6j\xe3\x17\xc3u\xfd\x9f\xcd\xbe{\
+\xaey\xfax\xfd\xd0\xc9\xc6Q\x97\x9ag\x14\xaa\xb27\
+8\xb7\x9f\x0e\xd5\x9d\xa5\x1f\x1a\xcd\xcd\xe4i\xfa\xd5W\
+~$p\xfa\xc9\x9c\x85\x1c\x22\x00q\x8cC`\x12\x90\
+\x0a\xf9L\x85\xe5\xc5\xfa\x95\x7f1O\xec\xab\xce\x0dH\
+\xe2\x935\x9fH\x92\xf4;\x90L\xea\xa2\x9b\xef\x00Q\
+\x8c3f\x16Ez\x89f\x90$\xc7A\x04\x16\x85m\
+\x95\xe3S\x9b\x22}\xb4~\xf8\x0c\xd3$\x81\x82\x87\xfc\
+e\x05\xaa\xacA\xea\x22\x86$\x0f\xf7\x07\xd7n\x0dS\
+?\x96u\x9b\x91\xd7E\x84 !b\xa1*{V\xca\
+\xc4\xd5-\x1b\x07k\xfb\x189]\xc4\xa9\x01 \xec\xf7\
+\x1f\x9fj\x18\x96\xa7L;\x19\xa8}\xa2\xf6\x83\x07\xab\
+\xdey\xaba\xf5>\xdf\xf1\x1cE\xfah}\xff\xefZ\
+v\x22\xe0\x10m\xd1\x8a\xc6M[]\x87\xa8\xed`\xa9\
+\xfby\xd9\xef\xd2\xa0X/\x83>\xc9;\xc18C\x02\
+\x92\x08\x04\x02=\x97\xe2\x10\x1a\xd6\xb4|=V7\x22\
+\x953\x8d\xd0\x0d\xd4q\xea\xeaP\xedD}i4\x0b\
+h\x96<\x97\xa6\xceT '\x01mto\x7f\xb7q\
+\xe5g\x8eu\x1b\x9d\xdb\xeb\x84\xa6bM\xc1,\xe3\xc4\
+F\xc1n\xe5Rb\x13[-\xa7\xee\xa7\xc9\xdb\xe3-\
+\xbf\xe1\xccS\xa9\x83\xd3o\xbbu\xd1\xecY\xd3\xcf\x04\
+\xeb\x9e\xdd\xfd\x81\x993\x16\xa9\xb3\xd7;w\x9fk\x1c\
+yO\xc5[q\x90kO\xcctW\xafI\xa6A\xf1\
+\xd07\xa2Kr\x0e\xd0\x0e\xd3s\xa9\x12\xa0\x08 \x11\
+\xf4V\x0f\xf8\xcd\xb3m\x93k\xf3Y\xfa\xd1\x06N3\
+XS\xacAE\xae\xd2\x1a\x0d=s\x95\x19\x1crn\
+\xc9{O\xd5\xf3\x1f7\x7fk+\xcd\x1a;}\x94\xa1\
+\x97\xe9\x9b\x93\x9b?\xae\xfe&_\x951B;\x80\xc5\
+g\xfeFN\xe3\x91|7\x9c~\xea\xca\xeb\xe6/\x7f\
+\xe7\xcd\x91\xc3\x86\x0e\x1d2\xe4\x92\x8b\xe7\x14\x16\x16\xdc\
+\xf7\xf93\x03\x94\x85\xeb\x9c\xdb\x9bE\xcf\x1eO9\xb5\
+\x19\x1eB\x8f\x00V\xfc=\x02\x8a\x0d\x85\x10\x10\xbc\x92\
+{\x90n\x1c\x01\x88\x00\x9f7\xbd\xb2\xc1\xf9\xa5\x86S\
+U\x87jv{\xf7M3\x8d\xd3 \x9f\xaf\xb42 \
+\x8cI\x0b%\xa0\xbb\xab^\xa8\xd06|\xb6\xfc\xddG\
+\xfeq\xef\x8cs\xa6^0k\xd6M\xd7\xfd\xd5\x1dp\
+\xff{\xe3\x1b\xd9\xca\xb4\x22Un\x8c\x85%D\xf8\xd4\
+\xbe\xc1]L\x1f.{\x8b\xb1\xd6\xde\x0f\xec\xd7\x8fW\
+p\xaf\x7f\xbf\x22 \x09\x87\xbd\xa7\xc3\x10LR\xa4\xbb\
+\xbb\x99\x07v, eG\xa0z\xcc\xfc\xd4\x85\xaa\x0a\
+T}Sx\x9bD\xd0(\xd6\xfd\xe6\xdd:\x5c\xdb\xbf\
+\xbf\xa6\xcf\xe9`\xe5\x11\x7f\xf9t\xe3X\x0e(\x02#\
+\x02\x01\x12\xe0\xb7\xce\xad\xab\xbc\x9b\xbe\xfb\xea\x8b\xb1\xa3\
+FF\xc5\xc6\xf3\xfc\xd4)\x93\xb4Z\xf5\xa3k^\x9e\
+b\x1cn\xe6\x0d\x18\xa3\x04K\x1b>\xbb\xf7\xd1;\xfa\
+\x16\x17\xb7\xc9\x10F\x0e\x1f\xf6\xde\xa7\x1f\xb78\x9c\x00\
+1XP\x02`\x17\x7fw\xfa\xda\xa5T#^\xfd\xe4\
+\xb8\x99`E\xd3KM\xa1z\x09`\xb4~F:\x9f\
+}\xc0w\xf4J\xcb%\xcb{\xbd\xf8\x17\xf3\x0c\x87\xd8\
+\x12\xfe\x1eR\xf4\xfa\x15\xf6o\x96\xdcr\xd3\x90\xc1\x03\
+c\xba\x13\x8e\xc1o[\xb8\xf0\xfc\x0bf\xbc\x5c\xffi\
+|o\xd8\x09\xb1\xea\x9c\xc9\x93\xdbwT\xa9\xe0\xaf\xb9\
+|~\xe7\x9e\x07#Q:\xf6\xc0\xeb'h\x9d%o\
+\x89\xda\xbfr\x09-o\xd5?\x5c\x1f\xaab\xc8\xcfO\
+[\xe2\x94\xbc\x8f\xd4<\xe3#\xdfPM\xffT\xce\x80\
+\xf1\xd7\x9d\x09\xd6\x9d\x16kn\xbc\xee\xaf\xad\xef\xc5O\
+\xfd\xe3\x0f\xfdsg\xf0PU\xa81\x9a\x888Dw\
+V^\x96F\xa3\x01\xa2o\xbf\xdf\xf0\xd3\xcf\xdbZ\xaf\
+$\x98r\xd6D#\xa7\x95\x81\x94\xce4\xa3\xeb\x12\xc2\
+\xf8\xa4\xacm\xdd1Y\xa0\x98D\xad\x08\x9aC\x8d\xaf\
+\xd7\xdd\xb7\xcd\xb9\xc6\xc2\xd9\xaeI\xbb\xeb\xb8\xbf\xe2\x8e\
+\x8a\x7f5\xc9\xc9j\xfc\x85G\x02'\x87\x0c\x1ahK\
+O\x0f\xeb=\x81 \x88\x14\x89\x09\x01!7+k\xfa\
+9g\xff\xec\xfe-z\x9dD\x92A\xaf\x07\xa2\xaf\xd6\
+\xae\xbd\xf8\xb2\xab\xcf\xbdh\xde\xfa\xcd\x9b)\x22\xd7\xa2\
+\xc2\xc2\x1c\xa5\xb5D\x9d\x9bx\xf0\xd83?N\xf1\x18\
+a[\x8c\x89u\x08\xf7'\x9e\xab\xa0\x14\xfc\xd6\xb1\xfc\
+\xb9\x9a\xc5\x87}\xbb\xd5Ls,pf\xb3{;\xb6\
+MA\xa9>\xd4\xdc\xb7\xb8Ot\x82\xbe\xf8\xea\x7fm\
+\xbd\x8a\xcf\x9ds\xb1\xdb\xe3\x8e\xb6|\xf6\xc4\x09G\x02\
+\xa7(2\x87zN\xebt:\x81\xe8\xab5\xdf\x10\x11\
+I\xf4\xc1\x8aO0\x02\xfe\xf0</\x11M\xd1\x97\xca\
+\xd8\xbe\x5c/b\x8ciy\xa3I\x91fVd\xa4(\
+m\x1a^\x1f\x0fdagbj\x03\xbca\xc2d\x95\
+\xba\xe6\x05#\xc2&\x00\x80\x16\xc1\xbe\xb9\xe5k@\x18\
+\xad\x1b<\xcf<=\xc6\x19!\x12\x11\xa0\x9f\x02z\xbd\
+)\xac=\x12\xdd\xfb\xc0C^\xaf\xff\xa7\x9f\xb7\xbf\xfe\
+\xf6\xb2;\x17\xffMn\xa4O\xef\xde+BQ\xed\x03\
+\x050V'\xd8\x1d\x0e\xbd6\x5c\x02\xf2x\xbd\xd1O\
+k\xeb\xea\xac\xbc\xb1\xbf&?\xec_\x903\xf1i:\
+>\xb5T\xd3\xbbT\xdd\xdb\xc4\xe9\xaaC\x8d\xabZ~\
+\xf2\x88\xce\xc6P\xb5(\x891\xcb\x8d\xba\xe6\xec\xdb\xa7\
+\xaf\xc4w\x1e%&\x94W\xa4LZ\xa8\xca~$k\
+!\x0f\x88 EdH\x80\x88\x04\x06N\xdb\x1c\x0c\x12\
+\x12\x12\xb68[\xaa\xaak\xe5K\xb7\xef\xda\x1d]\xea\
+*\x95R\x94\xab\x802\x9a\x8b0^=\xf8\xd3/W\
+^s\xf9\x82\xff,\xff8$\x08\xd3\xa7N\xa6\x88\xe5\
+\xda\xb4e\xcbPm\x1f/\x04\x00\x81GE*\x9f\xcd\
+!??e\xe2\xf9\xa6\xf1\x14\x0e\xc7\x8b\x0f\xfa\xcb\xf7\
+\xfb<f>\xb51\xd4\xd0\xe5\x84\xb4#\xd9\xf1I\x8a\
+!\xedi\xaa\xedS|(Pf>\x9f{\xb7\x91i\
+1\x8a]`\xab1\xceVXw\x1e\xdf\x81\x04\x00\xa4\
+\xd7\xeb\xb4Z\xad\xc7\xed\x05\x00\xbdN\x1fm\xa3\xd9\xe1\
+H\xe1\xf4,\x02\xa1\x22\xd0%\xe6)7\xbf\xf2\xd2\xe5\
+\x9b\xe7\xad\xff\xfa\xcb\x13\xa7N_r\xd1\x9cp\x9f$\
+\xe9\xed\xff,ov4T\x05\x9b\x00\xc0\xc8\xa5\x01\x90\
+\x04\xc2!\xff\x89\xde\xaa\x0c-S\xd6\x86\xec[=\x07\
+\xf6{\xcb\x01H\x81\xca\x9e\xb2^0\xbe^F\xac\xdd\
+\x12K\x82\x84\xc7i\x0f\x02\xc0\x18\xdd\xa0\xd7\xf2\xfe\x99\
+\xca\x99vx\xf6\x1f\x09\x9c\x14@\x8c\xc3\xc2\x10\x06\xaa\
+{\xef\xde\xb3\xb7\xa9\xb9\x19\x00x\x8e\xff\xeb\x95\x0b\xe4\
+\xd2\xc5\xfc\xb9\x17E\xdb\xdf\xb5\xf7\xd7\xbe\x9a<\xc6\x08\
+\x91\x90\x11\x22(Q1\xd1\xdf\x7f\xf1=\xf7\x0d/-\
+\xbd\xf4\xe2\x8b\x10\x91\x88\xb6n\xdf>\xe7\xb2+\x0e\x1c\
+:\x12\x04a\xaeu\x9c\x02\x95\x08 \x81(\x91\xb0\xdb\
+s\xe4\xa1\xeaewW\xbe\xf6|\xdd\xc7\xdb\xdd\x07$\
+\x10\x08D\x89\x84\xee\x10\x00)\x11\x1a\x9b\xb4\xaa\xd1Q\
+\xa3r\xd6\x9d\xc2\xeb\xaf\xb3\xce\xbd\xd04\x99C<\x13\
+\xac*\xd5\xf6\xd5\xb0V[v2XU\xee\xaf$\x04\
+\x1bo.f\xf9\xaf\xbf\xbd\xec\xefw\xde\x01\x00\xff~\
+\xf8\xc1aC\x86X,\xa9\xd3\xa6\x84\xc3\x1cA\x14?\
+_\xf5\xbfO\x99\xae\xe78\x02\xc25\x8e_\xdenX\
+}:XK\x84\xf0\x05p\x1c\xd7\xbfo\xdf#ee\
+?m\xfd\xe5\xd4\xe9\x8aL\x95\xf9_\x85\x97\xcfM\x1b\
+\xbb\xdbu\xec+\xfb.\x09D$b\x08\x22 \x02E\
+\xe6\x9d\x88\x08\x11\xfc\xe4\xedN\xe9\x02\x93\x90\x87\xc3\x9f\
+i;\x17\x10\x02\x002\xc4~\x9a>S\x8ccf\x1a\
+'\xe9\x98\x92\x03`H\x0c\x88\x011\x04\x00\xaa\x15\x9a\
+\x1e\xae~{\xb7\xf7\x88\x9a)\xccJ\x83[\xf0\xba\xc4\
+\x80F\xad\xde\xb0f\xe5\xd0\xc1\x83c\x22!\xd9\xd5\xd3\
+\xab\xef,[\xf5\xef\xcf^+\x5c\x0c@\x1bZ~;\
+\xe6\xaf\x98`\x1a`\xe2\x8cG<g\x1e\xadZ\xde\x14\
+r1\x04\x05*D\x92\x16\xe6\xccX\x943C\xcb\xf3\
+\x0c\xa16\xe0\x1c\xbd\xe3^\x03\x97\xca\x80\x8b\xe1\xce\x00\
+\x0b+.\x09$4\x09\xcd\x12I1\xa3\xa6\xe4\xde\x9d\
+\xda-\xab\xb6R\xd0%'B\xc4\xc1\xd2\xf7g-\x19\
+\xa7\x1b\xc9!q@<\x10C`H\x1c\x84A\xb2F\
+\xd1q\xed\xe9G2\xd5\xa6{\x0a/\x98d\xeb\xc73\
+\x00\xc0\xdfZ\xce\xbcr\xf2\xfb\x9f\xfc\xe5o\xbc\xf4\xfc\
+\xac\x19\xd3\x81Zc\xe9O\xbe\x5cy\xc7\x92\xbf\x7f\xd4\
+\xe7\xbe<\xa5E.I\xcb\x11\xe0+U\xdfll\xd9\
+3-u\xe88S\x89\x84\xec\xae\xf2\xb7_\xed\x7f\xc3\
+\x10CN,!\xe9\xce#+>\xad\xd9\xae\xe3\x0c\x0c\
+X\x94\x80#7\x12\x94\x02.\xc9%HR\xdb|\x8d\
+\xa8;\x05\x8f\x8e\x04\x94,\x06CD\x1c\xa7\x1f>\xc5\
+0n\x80\xa6(\x83O\xe5\x11\x09D\x1e\x01\x81\x18\xc2\
+\x9dU\xcfgj\xf5O\x15_\xa6R!\xc7\xcbq\x0a\
+\xc8E\xaco\xeb\x0e\xdcv\xf0\xbd\xde\x83\xfa\xcc\x9c~\
+N\x86\xcd\xd6\xd2\xd2\xf2\xcd\xf7\x1b\x0en\xdf\xffB\x9f\
+\x1bG\x19\x8b\xb8p-\x96\x10\xe0;\xfb>\x83B5\
+!\xa5\x04\x11\x10\xe9\xf1\x13\xab\xae\xcd\x9d\x94\xab1c\
+\xbc\xff\x0cJ\xe2=G>\xfe\xa4z\x1b\x8fJ\x0ey\
+\x06\x0c\x01D\x12\x82\x14,\xd6g<\x5c|\xe9\x95{\
+\x97\xfa\xc4P\x97\x05D\x1d\xc0 \xb2\x80(>\xe8n\
+\xc7\x86\xc4\xa8\x90\xc2/\x19\xe2d\xfd\xc8\x9b\xd3.K\
+WX\x18Pu\xa8\xee\xe9\xc6\xb7?\xe8\xb7D\xab\x02\
+NA-\x92\xf7\xc3\xea\xadG\x5cU%\xfa\xac+r\
+\xc6\x999]\x83\xdf\xb3\xa2z\xeb\xcf\xf6\xa3\xf6\x90'\
+\x85\xd7\x8eO\xe97D\xdf\xeb\x88\xb7\xe2\xfa\xec)\x04\
+\x80r\xf6\x80\xb2\xf9'\xc6\x10\x81\x10! \x89\x1a\x9e\
+kS\x06\xc10H\x0bG\xdcu\xabk\xf7\x1cpW\
+\x9c\xf04T\xf9\xedW\xe5N\x98j\x198\xce\xdc\x87\
+!\xf4\xf9\xe1\x8e\x96`\xbc\x19\x22\xearTM\xc94\
+\x08\x93H\xaa\xb5w\xb2\x80z\xa9roM\xbf\xa6T\
+\xd3\x17e\x1b\x84\xb4\xdf\x7f\xb4\xb7>\xa5\x97\xc1\xa4R\
+JU\xa1\xc6\x8b\xf6>[\xebw\xc8W^`\x1b\xf1\
+h\xc9%i\xbc\x9e\x08H\x02\xaf(\xeeu\x9d|\xb3\
+r\xbd\x8a\xe3\x9e+\xbe\xd2\xc0\xab\x00\x90\xa2ax\x0c\
+\x93\xa8\x95\x9cGa\xd7I\xf1\xf0~t\xd4\xefW\xfd\
+\xbc\xa9\xe9\xc8\xb2\xc1\xd7\x02\x22\x109B\x81\x92\x0dK\
+\xa4\xb6~\x89\xba\xbb\xb8bS\x0d\xea\xa4\xbe\xda*\x1d\
+\x9c\x97z\xde\xab\xf9\x8f\x0f\xd6\xf4#\x00\x22\x90\x08\x88\
+\xa0T[lS\xa4\xca\xa5\xe1\x7f\x94}\x22Jb\x9e\
+&M\xbets\xd3\xc1\xad\xcde\x88\xc0\x180\x0e\xfc\
+\xe8\x150\xf8@\x9f9\xef\x0c\xb8\xde\xa4P1\x86\x8c\
+\x81\xfc\xc3E,\x0a2@\xd6j~\x9bC^\x00\x98\
+\xb7\xfb\xc5*\xbf\xa3\x0d\x0bK^\x9b\xdb\x9b\x8f\x8fK\
+)\x0a\x83\xff\x84?4\x1e\x94z\x88\x9c%HqY\
+;\x95I\xca\x7f`\xc8\xee\xcaXx\x9d\xf5r\x06\x5c\
+\xa4\xf6\x8a\x91\x1f\x90\x08\x89\xc0-\x08\x02\x85~\x1a\xfd\
+\xe0\x85\xe9\xc3\xe4\x0b[\x04\xdf\xa2\x83\xef\x5c\xb9\xef\xb5\
+2o-\x22\xa5)\xf5S-\xfdJt\xb6\xd6[E\
+\x15'\x9eA\x1b\xf9\x9f\xcd\xda\xf1du\xa0\xe5\xbd\xd2\
+\x859\xea\x94\xf6#k\x0cy\xbf\xad\xfbu\x96m\x88\
+<\x02\x91\xa4\x97O}\x97\x04*\xea\xd8Y'\xf6b\
+2`\xd6>O\xa36\x9a\xc3\x10\xef\xc9\xbce\xb2a\
+\x02A\xeb\x82\x88\xd6]\x18\x02\xc7\x88\xe7$\xa7\xe4\xbe\
+4s\x8c\x91W\xd5\x05\x9d\xdf4\xfe*\xcb\xfc\xcd\x97\
+\x9e\xf3\x18\xe8\xf6o_\xdd\xef\xac\xb2\xa9Sr5\xa9\
+\xad\x8cM\x08\x13\xaa\xdap\x18czC\xff\x93?U\
+\xcf\xa9$\x92\x8ey\xeb-J}\xf8k\x11\x1fu\xef\
+\x91O\x8b\xf5\x99\xf32F\xc9\xbd~\xb8l\xe5\xda\xba\
+\xbdq\x05\x5cL\x96>\xb5\xc9\xe31Y\xe1\x90\x12\xad\
+\xac6\x95\x1f\xb8\xcc\xf2\x97\x09\xbaq\x12\x01Cl\x12\
+\xed{=\xfb\x0e\xfa\x8f\x0c\xd3\x0d8[?N\x02\x94\
+\x80$BQB\xab\xd2\xa4B\x89\x88\x06\x1ar\xa3W\
+\xa7\x18\x8dK\x9fx\xe2\xaa\x05\xf3'N\x9f\xfdM\xfd\
+\xde\x22]\xc6%\x99c.\xb4\x0d\xeb\xa5\xb1\x86\x87\x89\
+q\xfe\xa0m\xd0F\x12\x02\xb8D\xff\x1e\xe7\xa9\x12}\
+F\xac\xddx\xe1\xe4\xbam\xf6\xb2oG\xddC\x04g\
+|\xcdO\x1c\xfbje\xcd\x0e\x8a$<F^{c\
+\xfa\x9c\x02UF\xb9\xbfrE\xd3\xba\xfa\xa0#\xecX\
+;\xa4\xb2$\xab\xacb\xe2\x14\x0c\x11\x00\x06hJ\xe6\
+\x9a/\xf6J\xfe\x1f\xdc\x9b7\xb9\xb6\x1c\xf5\x1f'\x80\
+9)\xd3'\xeb'\xc8t\x14\x89@\x94@\x10Q\x10\
+\x91\xe7\x00\x11J\xb4\x99)\xbc\xd6!x\x81\xe0H\xf9\
+\xb1\xd9\xe7\x9e\xbba\xd3f\x00\xfc\xfb]\x8b}\xbe\xc0\
+\xb2\xcf\xbex\xfc\xf8\xaa~\xfa\xeci\xd6A\x93S\xfb\
+\x8d4\x17*\x81\x8bA\x0a\xe2\xac\xaal\x99-\xbc~\
+~\xe6\x98\x08*\x05\xb5\x01\xe7\x03e\x9f\xaf\xaa\xd9e\
+Rh/\xde\xbd\xd4#\xf8+|\x8dDQ\xc0\x12\x00\
+\xe1\xfa\xf4\x0b\x16X\xa7\x02\xc1X\xfd\x80\x0b\xcd\xe3o\
+<\xf5L\x99\xb7B6\xe4]\xb0\xd6\xe1\x99JF^\
+h5\x83\x88pW\xe6\xed\x1b\x9c\x1b\x9f\xaa[\xba\xcd\
+\xbd\xabQh\x06\x841\xba\xa1w\xda\x16\xb2\x98\x82\x04\
+\x220$\xc6\x80!1$D:\xe0\xa9<\xea\xa9\x01\
+\x00G\x8b\xa3\x7f\xdf\x92EK\xee\x16\x04q\xcc\xa8\x11\
+\xff\xfa\xc7\xdfo\xbe\xe1\xfa\x1d{v\xef8\xba\xbf\x0c\
+\x1b\xdf?\xb1\xe9\x95S\xeb~\xb4\x97\x1d\xf7\xd6;E\
+\x9f\x02\x15F\x85\x96Q+@\x1b\x03\xe9\xa3[\x08m\
+n:\xf2\xfc\xc9\xef\xee8\xf4\x81\x94\xady\xed\xb9\xa7\
+N\xd7V\xed.?\xe8\x08z\xa9\xdd\x00'\x18\x06\x0d\
+\xd2\xf6\x96\x17\xb2\x8a)\x86i\xfb~\xe1\xd8H\xd4\xbd\
+Zkl\x1c\x940\x86F\x15S\xe8\x98\xce.:\xa2\
+\xd20\xf3\xc6\xd7\xf3\x9e6rz\x0c\x87\xd1\xc0\x808\
+&\xa9xI\xa3\x10\xd5\x0aI\xa5\x10\x15<\xadl\xd8\
+\xf9\xb7\xc3\xefF\x9ct\xb8\xdd\x91\xc3K7\xaf]\xbd\
+m\xc7\xce\xe9\x17\xce\x15%i\xef\xd6\x8d~\x9f\xff\xc7\
+\xad\xdb\x1e~\xe2i\xaf\xd7'\x0bB\xc5)r4\xd6\
+\x0c\xa5\xc9\xac\xd0i\x98J\x02\x0a\x88A\x87\xe0\xad\xf4\
+\xdb+|\x0d\x22I@\xf0\xd4c\x0f.\xbc\xf6ZD\
+\x9c8c\xf6\x9e_\xf7'L\xae\xc7\x1a\x07\xbd\x94\x7f\
+;\x02\xc9:C\x00\xb7\x9fyis\xcb\xaf\xdd\x8a\xaa\
+Y\x22\x081\x16\xae\xa7\x80\x14\xb2\x0b\x8eX\xd0\xf6J\
+\xcb\xa5zN/{1\x09@$\x12\x01DBA\xc2\
+\x90\xc8\x04\x09E\x09%\x09\xa6Y\x06\xa9\x19\x8f\xd1\x80\
+\x85\x00\x08v\xed\xf9\xf5\xad\xf7\xdf\xbf\xea\xc6\x9bEI\
+\x02\x80\xad\xbfl\x1f<`@\xef\x82\x02\xaf\xd7\x07\x04\
+\x96\xd4\x945\x9f\x7f\xf4\xf2\xd2\xa7\xe7/Z\xf0\xb3\xfd\
+H\x8d[j\xf2(\xbe\xaa\xdd\xd9X\x80\xe7\xdct\xfe\
+C\xcf\xff\xf3\xe5\xe7\x9f\x94\xbb\x11\x0a\x868\xc6\x9d\xae\
+\xa8\xf8m\xdf\xc1d\xa3\xdc\xe1>\xd8,\xb8[aT\
+\x82\x11\xda~\xd8Mv5\x8b$\xfb\xc9\xf7\xedE\xe4\
+-\xaf\xee4>\xf5l\xc3$\x89P\x22\x14\x01E@\
+Q~N,$\xb1\x90\x88!\x11\x05\x91\x89\x12\xea\x99\
+j\x9auH\x9b\xb0\x94\x08\x16\xdf\xf5\x8f\xaa\xea\x1a\xb9\
+\xb9\xf5\x9b~\xb4;\x1cK\xee\xbb_~iov\x0c\
+\xec\xd7\xef\xf2ys\xd3\xd3\xacf\xcet\x87\xed\xb6K\
+\xcds\x05\x12\xf2\xf3r\xefZ\xfc\xb7y\x17^Xv\
+\xec\xb8\xdc\xd5/W\xaf!\xa4\xa7\x96\xbe$IR2\
+\x84F i\xabk\xbfDH\x84D\x88\x00\x19J\x0b\
+u\x8eUS\x07u\xb1$\x85\xb4V0\x15\xceO\x99\
+5H30\xda\xd2\xa9`\xc5F\xd7\x96\x1d\x9e=\xbd\
+\xd5\xbd\x15\xa8@$\x0e\x811\xe2\x18pH\x06\x85\xfa\
+\xcb\xba\x9d\x18!\xdb\xcbv\x04[\xdd/\x9c<y\xfa\
+\xcb\xd5_\x9f:]\x11\xbd\x95?\xe0\x1f4\xa0\xff\xd5\
+7\xdc<My\xf6\x00\xcd\x80u\xce\xf5\xfb}\x07+\
++\xabn\xb8\xf6\x1a\x9f\xcfw\xc3\xad\xb7\xfb\xfd~\x02\
+\xac\xa9\xa9=z\xec\xd8G\x9f~I\xb1%\xfa\xf8`\
+\x07\x11l\x0a\xcb\x18\xfd \x19\xae$\x80C\xbeS\x9b\
+\x5c{:#w`{L\x1a\x13\xa5\x1a\x89\xaf\x1b\xa9\
+\x1b)\x02\x10\xd1f\xf7\x8f\xab\x1dkN\x05+\xd3x\
+\xeb\x83\xd9\xf7s\xa8\x09\x11\xa1\xc48\x118\x81xF\
+\x1c\xc3\xb3R\xfa\x15j\xd3Nz\xeb/\xb2\x0e\xbf1\
+sRouz\x80B\x87\xbc\xd5\xab\xed\xfb>\xad\xdf\
+N\x00C5y{O\x9dj\xad6\x12\xbc\xfe\xce{\
+\xef~\xb0\x22\x10\x0c\x9d\x9d7\x19\x086\xbb~\x02\x82\
+\x96\x16\xd7\x1d\xf7\xdd\xdf\xd4lonv\xc8\x80\x09\x01\
+|\xberu\xdb4\x13\xdaR\xe9\x9bE\x97D\xb2o\
+GD\xa8\x0c6\xc4P\x8a \xde\xebw\xce0\xeb\x84\
+\x9aO\x00jT\xe6\xa8z\x1d\xf5\x97\xbf\xd6\xf0zE\
+\xb0\x0a\x00\x8c\xccxG\xc6\xfdF.- \x83<\x12\
+0\x11\x192\x9e\x11\xc7\x881\xba!\xe7\x9c\xfb\xcaV\
+\xdc\x93;+_\x95\x8a@FTM2\x15OJ)\
+\xbe1k\xf2_\x8f\xbc\xcd#\xdb9\xe2\xe1O\xeb\xb7\
+?_\xf1\x9dG\x0c\xc87\x0a\x04C\xbdU\xf9\xa9|\
+jM\xb0\xb62T%\x0f\xe6\xc3O\xbe\x800\xa6K\
+I8\x99\xd8\x86\xe3A\x08\x06NG\x80\x12\x01C\x00\
+\xa2\x03\xbe\xe3\xed6'#\xb4\x86\x06\x09\x84\xdd&\x92\
+N\x8e\xe3\x22\x02@\x9623D\xc2\xd2\xba\x17[\x04\
+\xa7\x5cD\xbd.\xed\xce,U/\x22$\x8c\x16\xf4P\
+\x8e\xadyF\x0c\xa9\xbf!\xfb\xe3\xba\xad>)T\xa8\
+\xb6r\xc8\xa9\x22\xfbP\xac\xbc\xf6\x02\xeb\xd07\xaa7\
+\x1d\xf2V=Zp\xe14\xf3\xc05\xf6}\xde\x08g\
+c\xa4\xb6t\xa4n\xd8v\xcf\xce]\xde_\xe3\x07M\
+\x9d\xe4\xe216\x18\x11.1\xcf,Pe\x03\x80\x04\
+\xf0\x9dk\xdb\xa7\xf6\xf5\x0c\xb1T\xd3{\xac\xb1\xff\x08\
+}\x9fBu\x86W\xf2\xb7H\xbe\xb8\xedYI@\xfb\
+.\x95\xda\xaa\x82\xd5\xef7\xbe\x1f\xf5\xf7\xa5\xdaq\xf9\
+\xea\xc1\x01\x22@\x0c\x88~%\x122\x8d$\x09\x00\xcc\
+I-6\xc6s\x8c\xa9\x18wc\xf6\xb4GO|\xfe\
+V\xf5F%\xf2\xd7dN\xfcg\xfel\x050\x00L\
+\xe3u\xef\x96\x5c;c\xdf\xb3k-\x07f\x99\x07.\
++\xb9\xf6\xa2\x03/\x8a@\x00\x90\xc2\x9b\x00\xa0Z\xa8\
+i\x8d>\x88:+p\xc5\xe5\x00\x08\xa0\xe34\xa3u\
+C%\xc2\x10\x89\x0f\xd5\xbc\xbc\xcfW\xb6\xd8v\xc9\xf9\
+)\xe3\x8d\x9c\x92c\xc4\x80d\xa7\xf1\xb9}\xcb#\x95\
+\x1fHr\xc4E\xd4\x06\xf3ic\xa4\x93\xdb \x0c\x1b\
+\x09\x8c\xa9\x7f/\xb0\xde\xe6\x95\xdc\xeb\x1c\x9f~\xd2\xf4\
+\xe6*\xfbG_\xb7\xac\xfa\xae\xe5\xdb\x13\xc1\x93\x16>\
+\xcd\xa6\xc8|\xbf\xe1\xcb\x11\xfa~\x1c\xc2`c\xceg\
+\xf5\xdb<b@\x00\xda\xed:y\xc2\xdfx\xbee\x08\
+\x92\xbc-CG\x80o\xd7l\xbe&sB\xb6\xd2T\
+\x15l\xd9\xef\xa9\x02\x80\x12u\xe1\x10\xed\xa0]\xde=\
+\xe5\x81\x13m\x8a\x05I\xfd\x0e\xc5X\x16\x00D</\
+e\xca8\xfd0\x00|\xbb\xe9\xb3\xed\x9e\xfd\xcbz=\
+8F7@\xc9x\x19\xbc\x8c\xe8\x1b\xf6S\xe75\x8b\
+\x9e\x03\xdeS\x89\xb2\x10d1\xb0>u\x05\x22\xa1\x88\
+\x9a[\xf8\xb4]\xee\x8d\xcf\xd5\xdc\xb1\xcd\xb5\xbeEp\
+\x00 \x10\xbaE\xcf6\xf7\x8e\x7fT=|\xd0{:\
+\x83\xef\xf3a\xfd\xa6\x80\xc8xP\xdc]0'\x92]\
+\xe2\xaa\xc6=\xeb\x9a\x0fS\xc4\x99-\xcc\x9cl\x17\xbc\
+[\x9d\xc7\x01\xf0\x96\xecsd\xfeku\xa8\x96\x01d\
++2x\x9e\x1bZ:0\x1a\x22$\xf5\x1f\x89\xba|\
+A\xca4\x04\x14I\xfa\xca\xb1\xe1\x7f\xd2\xfe\x92\xce[\
+E\xc2\xe8\x8fDL\x0eV\x08\xf0\x1c\xe3\x88D\xc4L\
+LVzNT\x09\x89_\xfcD\xd4\x14\xaa\xff\xc9\xf9\
+5\xc5\xbf\xaf\xe5t#\xf5\x93'\x18f6\x88B\x7f\
+\xed\xe8\x8d\x8eC{\x5cg\x02\x02\x9b\x936j\xa4\xa9\
+(:\x9e\xf7\xea\xb6F[\xd4r\x8a\xab3\xc6\x7f\xd3\
+t\x00\x11\x0a\xd5\x96\xd1\xc6\xde\x00\xb4\xcfw\xd8!6\
+\x7f\xe3\xdc\xf0\xf2\xd3O<\xf5\xd0\x03a\xe8\x00; \
+\x12\xc8\xf2n\xfd\xb8\x8f:?O\x91\x05\x00\xb5\xa1F\
+\xaf\x14(T\xe6\x85c7BI\xe2\x1c\xa1\x80=\xe4\
+\x15%N\x90@\x94\xd0\xc4\x190\x01\x94Hr]\xac\
+;T~\xa26L\x0d9Y\x8d^\xef\x95<y\xaa\
+>3S\xaf\xcaR\xf5s\x89x\xa1\xf9\xea\xbf\x9f|\
+\xbd>\x10\x08\x0a\xec\xc9\xa2+\xb5\x9cB\xbe\xfc\x97\x96\
+\xf2\x88\xf7%\x00\x9ak\x1d\xb1\xdb}R^\xc7\xe7\x9a\
+\x07\x02\x80W\xf2\xdfQ\xf9\xc0\x05W\xcd\xb8\xfc/s\
+S\xcdfHL\x99\x8a\xae,\x8a\x7f\x0e\x000HS\
+\x22\x1b\x05\x0dS\x01\xd0n\xefA\xb7\xe4\xff\xb2y\xe3\
+\xed\x15\xcfM-\xbbij\xf9\xa2s\xcbn\x9bz\xf4\
+o\x1f7m\x14\x88\x1d\xf1UQ\x02\x0d\x0a\x1b\xe9\x8e\
+\x0f\x06JTRD\x8a\xb5\x85rAJ\xc1\x94Zf\
+\x10!\xb4\xca\xfeN\x96\xb2 O\xd5'\x84\x94\xa2\xc8\
+J\xe1\xb3\xef?\xf9\xce\xd2\xa2[\xb2\x94\xe9\x8f\xf6\xbe\
+\xe2\xf6\xb2e\x00\xe0\x11\x03M!O\xba2\x9c\x06\x16\
+\xaa-\x11J\x8f4\xd2X\x10v\xf6\x9a\xd0}K\x16\
+\x03@]}\x03\x00\x0c7\xf6\xda\xeb:%\xb5w\xc6\
+\x09c8\x043/\xa3k\x98\xca\x9b'\x19F\xbd\xdd\
+\xf8\xc5\x0a\xfb\x1a\x1e\xb9\x19\xc6\x09\x0bRg\xf5Q\xe5\
+\xc9\x15]BI *T\xe5c\x9b\x18\x22ym\xbe\
+s\x986\x96\xc4\x90\xa1\xcc\x19k\x98\xd5W;\xd4\xa2\
+\xc8\x90mJ\x88|\x1e\xa9\x05\x10%@\x11a\x98~\
+\xe2\x07\x0d/\xbfZ\xb5\xfa\xe6\xec\xf3g\x9aG\x97e\
+\xd5\xbeQ\xfd\x0d\x00\xa89E4\xaeA\xa0B\xb5U\
+$\xe2\x10J4\x99\x0c@\x22p9=3\xe6\xcd\x7f\
+\xee\xd1\x87w\xee\xfd\x15\x00\xee\xca\x9e\xf1b\xf5\xfa\xad\
+-\xe5\x89\xc9wm\x18\xe5\x04N\xc1\x1d!\xbf\xd2\x15\
+\xe69\x9b];&\x19F\xdd\x92v\x85\x9a\xf1H\x00\
+H\x12\x80\x14\xf6:\x98\xab\xc8\xb6\xf1\x96\xdaPS\xfb\
+\x1a4\xeb\x9c\xa0\x98<\x16\xe7\x91\xcfV\x15z\xc9Y\
+\x1b:\xed\x95\x9c\x80D(\xf2Li\xe2\xd3\xe4\xad\xa7\
+\x048D?\xd1\xc2\xa5/\xab[\xfdU\xc3NW\x80\
+[\x98y\xe1y\x961ZNi\xe0T\xb1\x01Y\x81\
+\xda\x8a\x88\x04`\xe4\xd5F^#\xb7\x7f\xe0\xe0\x91\xe9\
+\x17_\xfa\xd0\x13O\x0d\xd1\xe7NJ)\xceW[\xb1\
+\xd3\x22rD|\x87|\xe5\x11.\x12~\xef\xdcR\xa0\
+\xcaY\x92v\xad\x12\x95\x12\xc9$\xd4Vk-\x10\x04\
+\x88\x8c\x9c>\xa1\xe0\xf9\xe4\x14<\xea\xf4\xa0\x17A\x12\
+v\xbb~\x94k~\x088D7fV\xea\x95\xa9\x0a\
+[kX\x07\x80\xc8\xcfM\xbb\xfe\xcd\x9a'\x1e\xab|\
+G\xcd\xb4g\x19\x07\xa5\xf1\xa9\xb9jk\xc4)\x85\xef\
+^\xaa\xcf\xe3d\x0bG\x92\x89\xd79B\xbe\xe8\xcd\x8a\
+4\xb6e\xc5\xd72\x80\xca@s\xd2\xfeDK\x1e\x91\
+.\x1f\xf2\x97\x9f\x0aV\xe6+s\x10\xa1N\xb0[Y\
+\x0aEl\x9e\x0c\xf6F. \x09\x90\x80\xd5\x0a\x0d\x09\
+WJBvG\xf7\x8eo\xc9Q\x16\x8e2N+\xd1\
+\x0e\xb5(lD\x12\xc5lS\x91\xcdd_\xed\xf0)\
+)\xe7\xfd\xe0X\xfd@\xc5K\xf7d\xddx:`\xef\
+\xa3\xb1\xb5\x11\xffxSQ\xd4\xd8s\xc8\xc9\xfe(K\
+i^\x90>\xe6\xe6\xac)\x1a\xa6\xd8\xef\xa9\xde\xdaR\
+\xd6\xb1\xd6\xc4\xe6\x02\x04\xf0Z\xe3\xf2'\xb2\xee\x05\x82\
+\x22U\xfe{\xf6/\x0e\xf8\xcb\x8e\xfaN\x1c\xf0\x1f\xad\
+\x08\xd5\xb8E\xaf\x96i\x0aU\xb9\x97\x98g\xf7R\xe6\
+\x1f\xf2\x95;\x05o;#\x82Q\x1bD\xdd\xb4A$\
+\x03\xeef\xde2\xdb|}\x7f\xddH\x19u\x17$\x91\
+!`;\x86,\x01\x9cg\xb9\xaaE\xb0\xefv\xff\xfc\
+h\xd5\xab:\xa6Y\x985In%:\x19\x9a\xd6\xd3\
+&0$\x85\xee\xc9\x9d\xfdW\xdb\x84\x14\x85F\x0e#\
+*\xfc\x8e\xeb\xca\xde\x95\x12\xe6\x19\x14\x9b\x9d\xb5\x1aj\
+\x02:\xe4/\x7f\xb9\xe1\xdd\x85\xd6\xabg\x99\xa6\xaet\
+|wk\xc5#V\xce<F?\xfcb\xed\xb0\x0c\xa5\
+M\x8b*/\xf9T\xa8\x13\x08\x0f\x06\x8e%\xcacZ\
+5\xa8cd$\x11\xfa\x81P\xa4\x1e</\xedv\x0d\
+\xd3IDL\xb6\x1f\xd1\x7fm\x18\xb2\x08\x00\xec\x0a\xdb\
+m\x1a\xa6\xdd\xe2\xfc\xde#\xfarT\xa9\xd1\x12i\xac\
+\x98\x10@\x02l\x0a\xb9z\xa9\xad)\xbc\x9a/\xa1X\
+\xd1\x00\x00\x08\xc4IDAT$\x22\xc0\xb5\xf6}\xf7\
+\x9e\xfaL\x8d\x96\x1b3oXc\xff\xa8\x22p2~\
+\x12\x133\x0e\x0c\x9c\xfe\xed\xfc\x17=\x92K\x00\x0cH\
+\x82St_\x93z\xc9\xc5)\xe71\xe4b/\x91\xe4\
+\x9d\xcaRR\xceY\xa7\xc7\xe3`\xc27\x8a5\xa5\x0b\
+\xd2\xee\xad\x09\x1e+\xf7\xed\xcdP\xe4\x0e\xd6Oh-\
+\x03\xb5;x\x22\x0a\xce\xcdK\xbfI\xc1T\x1b\x1d_\
+\x9bymdA`\x9b\x19\xa9\x0c\xd8\xbdRH$i\
+\xb7\xeb\xcc^\xf7\x99\xcf\x9av\xee\xf7T\x9ee\x9c9\
+\xdbr\x05\x07\x8ab\xcd\xb02\xdfo{\xdd[\x8ex\
+\xf7\xb6\x88\x8eV\xc8:Z\xca\x80p\x9d\xffJ\xcb|\
+\x15j\xd4\x9c\x86\x88\x8e\x07*\x04\x08\xcd6\x9d\x0b\xc0\
+\x89\x94\xe0 \xa6\xa3\xb2\x06%ZF|\xd7(\xb2q\
+\x15\x12\x13\x9f\xd2_;\xf6\x8d\xda\xbb\xeb\x82gJ4\
+\xc3\xce6_\x0a\xc9\xb6\xca\xc6\x87^\x12\xa0\x85\xcf\x00\
+\x00\x97\xe8O\x00\x5c\x12\x02\xd0\x0f\xcd\x87\x01\xe0\x96c\
+\xcb\x09\x80\x01+\xd5\x8f\xbe;gI\xba\x22\xef\xa4\xff\
+\x90Kl\x11\xa4\x90[tr\xc8q\xb1\xba\xdf&\x87\
+B\x18\xa6\x1d2\xc50U\x00`@\x08\x90\xab\xcc\xe3\
+\x80_\xd5\xbcv^\xea\xc5R$\xb6\xa00)\x80\x1a\
+\x82\x0d\xdb\xdd\xbb{@\xa0\x82v\x87\xff\x85{\xd3\x22\
+8V5\xbd\x86\x80VE\xf6\xbc\xb4\xdb0\x06d\xc0\
+\x04%\xeb\x98\x8e\x13\x98\x15V\x00\xd8\xe6<>\xcf:\
+<\x1e\xe6E\x00\x12\x88\xde\xaa\xfdQ\xc7\xe9{\xa9\xfa\
+\xf6\xd5\x0e\x1e\xa2\x1f\xa7\xe7L\xf2Mm\x8a\x9c\xaf\x9a\
+\xde;\x138\x1e\x09t\xa8\x1d!%\xfc\x9fM\x91\xbe\
+0\xfd\x16\x81\x80\x01H\x00\x07\xfd\xfbK\xd4\xc5\xd7[\
+\xaf~\xab\xf1\xdd\xc3\x81\xf2\x09\xfa\xb1\x06f\xa8\x15\xea\
+O\x07O\xcfI\x99c\xe4R\x966\xbc\x22\x90\x18o\
+\x80Z\xedZ\xc7\x07,A\x076\x88!\xbb:\xfd\xfe\
+\x14>\x0d@\xe4\x90\xb1\x08\xe3\x05\x11ZO\x83\xc1\xb6\
+@\x8b\x89\xb7liY{\xc8[yN\xea \x9b\xc2\
+\x10\xc3\xbf'\x22\xfc\xe7\xa9U\x9bZ\x8e\xde\x96\xf5\xf8\
+\xa4\x94\xf3\xf2\xd4}T\xa8\x8avU\xc9T\xc3\x0c\xe3\
+\x0f{\xf7\xb8D\x07\xb5\xb1A\xd4:3:NwO\
+\xd6\x03\xa9\xbc563z\xa2\xf6\xdf\xb3\x8c\xb3f\x9a\
+\xceu\x93\xe7\xa0\xef\xf0\xb1\xe0I\x03g8\xcft\xbe\
+\x04\xf4l\xdd\xb3G\xfd\xc7\x92\x87\xca\xd8\x95\x13\xa80\
+\x11\x8f\x1dF\x1a\xa6\x0d\xd6M\xdc\xe2\xfc,G]\xa4\
+DU\x84\xc2\x04,ZJ\xc68k-\xbf\xc9\x01\xcf\
+!;\xe4\xfd\xf5k\xfbo\x19\xca\x94Bu:\x8f\x8c\
+\x08\xf7y\xaa\xee<\xf1\xe9\x97\x8d\xbb\xaeH\xbf\xa5D\
+\x1b\x06C\xe4\xf8\x86C.\x9c\x16!?P7b\x97\
+ks\x90\x02\xf1APx:T\x9cjI\xc6}\xb9\
+\xaa\x82\xe8G\x04\xa0A\xbd\x02\x95O\xd5?\xed\x14\x9d\
+\x03\xd5\x03\xc7\xe9\xc7\x97jJ\x95\xa8\xfc\xc1\xfd\xc3\x9b\
+\x0do\xd5\x86\x1a\x12\xe7y]\xa0\xe0AR\x98\x11\x11\
+\x11\xae\xcbxd\xad\xfd\x9d\xa1\xfa\x89\x13Ms\x10\x90\
+\xc5\x9c\x85#\xabPc\xa8&]\x91\x05\xb1(E\xb8\
+\xa6N\xab\x9a\x96mv\xac\x05\x00\x15\xe3l\x8a\x14\xa7\
+\xe8s\x08^#g\xba,}Q?\xed\xf0\xb8\xf0\x86\
+\xe0\x93\x86W*\x03\xa7\xb3\x94\xf9\x05\xea\xe2\x12mi\
+E\xa0|Y\xeds\x18\x97\x99\x02 \x188\xfd\xa2\x8c\
+\xbb\x8bT\xc5\x8c\x00\x91X\x98\x8fLrDx\x22p\
+|y\xd3\x7f\x8e\x07\x8e\xb7\xc6)\xd4\xbaX\x93\xf8\xee\
+\xb0\x0b\xe8\x89\x80R\xf8T\x05\xaa<\xe4\xfc{\xee\x9b\
+J\xa6\x8e\x90\xe00v+\xc9\xca\xc6\xb7f\xa4.\xd0\
+2C\xc2\xdd\x15g\x02e;\x9d\x9b\xaa\x03\xa7\x01\xc8\
+\xaa\xc8,\xd1\x0e\x1a\xa2\x1b\xcb3\xa5\x1c\xdf6\x84\xaa\
+\xac\x8a,\xb9\xbb\xbf\xb9\x7fy\xb7\xee\xd9H\x92\x0cy\
+\xaa\xc2\x8a\xc0\xc9T>\xed\x02\xcb\x15\x07=\xbb\x1bB\
+5\x1c\xb0\xde\xea~g\x9bf\x9a8\x13\x82|\xc6\x01\
+D7f\xc9!\xbbD\xf0B\xdd\x93\x07|\xfb(V\
+\xae\x04\x1dr\x17;7\xd2I\x13\x0e\x87hG\xc0\xb3\
+\xcd\x17\xa9\x99\x1ab\xecNT:\x08l\x9fg\xfb\xa4\
+\x94\x0b\xb4\x9c\xc1)4\x199\x0b\xc6\x97\xde\xf3\x94\xc5\
+yi\xc5q\xdb\x97\x88(\x9cPKk\xed\x1f\xf5\xd3\
+\x96\x8e2L\x05\xc0\xde\x9a~\xb2\x16\x1a\xb8\x944\xde\
+v&p\x9c\x80\x9a\x84\xfa<eQ\xa9v\x0c\x0b\xcf\
+s\x04\xb8!yKV8\x9e\x97\xe17\x22\xda\xec\xfa\
+~\xbfo_+\xdc\xd7%\xc6k\x97\xdc|\xe2\xe6\xe4\
+\x90p\x8c\xe1\x1c\x16\x0f\x92G\x1fMB\xadC\xb0\xf3\
+\xc0\xafmZ\xdeO;\xd4\xc4[(f\x178\x86\xd1\
+[lo\x16\xe5\x5c\xc9\xc2\xdb>\xac\x7f-(\x05'\
+\x98f\x9a\xf8T%S\x06\xa5\x10\x91tk\xcec!\
+1P\xe6\xdbw\xc0\xb3+ y1\xa6\x18&Q\x5c\
+\xfba\xabG\x00\x08g\x82\xa7>\xb1\x7f\xd8\x1d\xb2}\
+\xeb\xc0Y\xcf\xb8\x9f\x04P\xa0.\xb6*3\x18\xa2L\
+\x0bc\x18\xc7\x87:\x13(\x07\x82\x9f\x9c_\x9f\xf0\x1d\
+\xee\xad\x19\x08\xad\xc7\x94\x85\xc7\xb3\xc7\xb59\xba!<\
+\xda\xad\x13\xfeC\x01\xc9\x8f\x00\x1cp\x0aT\xac\xb1\x7f\
+\xbc\xd7\xbd\x05\x08\x94\xa8\x06\x00\xb7\xe8\xb2\x07\xeb\x14\xa8\
+\x1c\xa0\x1dqi\xdaM\x99\xca\xfch\x18\x14\xc5\x8c\xa3\
+\x07\x8c\x88D\xf2\x11\x1aMB\xf3\xab\xf5\xcf\x06\xc3\xbb\
+\xd0\xbbX\x95o\xbb\xdb\x07\xba-&\x84\x01\xba\x111\
+$\xb1\xd6\x03\x16e\x01\xd4\x06N\x03\xe2\x8f\x8eo\xe7\
+\xdb\x16Q\x5c\xb1.\x0a\xce\xea\x0f\xb8\xb7\xb5i^\xcb\
+\xf4\xafV?\x14\x90\xfcn\xc9\x95\xaf*\x1am\x98\xb2\
+\xbc\xfe\xe5\xca\xc0\x89\xa0\x14\x88\x94UN\xc6(jL\
+=\x8b0*#\x22\x10\x09\x08P$\xb0\x0b-Kk\
+\x1f\xb3\xcb\xfbe\x88:C\xdb\x13\xac\x98\x1e\x9f'\x0d\
+\x85\xea~\xd8\xc6\xf5c\xab\x9d\xae\x0dV\x01\xc1\x82\xf4\
+Ei\x8al\x88\xdf\xcd'?\xe9\xa7\x1b\xe9\x14\xed\x0c\
+1\xf6\x04\xbclU\x81Cl\xfc\xb0~iE\xe0\xd8\
+\x00\xdd\xf0a\xfaq\x02\x85\xde\xacy<H\xe1z\xd9\
+\xa9@9\xc6#\xc0\x14\x8e\xd1\x09\x00\xe4M\xd9\xf2I\
+Y\x22Ae\xf0\xcc\x0b\xb5\x0f\xd4\x06\xab\xbb\xa6;\x89\
+\xedI\x8f\xcf\x93\xa6\x1cU!\xcap R\x9b\xaa8\
+\x02\xd6\x87\xaa\x8a4\xfd\x87\x1b\xce\x82\xa4G;\xd0x\
+\xd3\xac\xd69\x0d\x1b$\xea\xaf\x19\xb6\xcd\xb5\x01\x00\xfe\
+\x9aq\x97\x99O\xd33C\xb3`\x8f\xaa\xca\x86\xe6\xaf\
+*\xfc'\xe6X\xae\xceT\xe4E\xdb\x91\xa2\x08{\xe4\
+{\xcdB\xe3\x16\xd7\xb7?\xba\xd6\x09\xd1\xf3\x1d\xa8G\
+\x0b\xa5k\x91t\xe2\x94U\x02\xa1@U\xcc3e{\
+\x82$\x02\xaclX\x96\xa7\xea3\xd40\xae\x1d\xd5\xad\
+\x13z\x85\x9aS\xefpm\x1a\xae\x1f?\xc6x\x0e\x00\
+\x9c\xf2\x97\xd5\x85\xaab]\x8f]\xa8\xdf\xea\xfc\xde)\
+9\x0a\xd4\xc5JTE\xbc6FH\xa5\x00\x00\x1a\xd4\
+\xd9\x14y\x05\xca>\x0e\xb1\xc1!\xd8;\xe4\x00\xf7\xfc\
+\xe4\x85\x0e\x05\x04x\xd2wt\x8b\xf3\x1b\x9f\xe4\xb6\xf2\
+6=g\x8c=\x22\xcc)6\xafo^\xd9[\xd3o\
+\x80n$\xb6\xf5\x0d\xad+\xaa\xcd\xa1\xa2\xf2K\x8b\xc2\
+&Rh\xb6\xe52\xd907\x86j\xca}\x07\xb0m\
+\xce\x0f\x15\xc1\x13\xbf\xb87\xa8P\x9d\xad,\x04\x80]\
+\xeeM\x0d\xa1\x1a\x0b\x9f\xf1\x93s\xedf\xe7\x9a]\x9e\
+-\x9b\x9dk~v\xafkn\xdd+\xda\xf5l\xfc\x8f\
+\xd1 \x04\x00\x81\x84\x13\xfe#?\xb6\xac9\xe4\xdd\xe5\
+\x16\x9d*\xa62\xf2f\x04l\x0c\xd5ni\xf9\xaeD\
+;\xa8\xaf\xb6\x14 \xee \xca0\x13\x86\xe2\xaa\xe8\xad\
+\x8e\x99\x00\x10\x8a\xb5\x83\x95\xa8\x92\x15\xc3%:~u\
+oK\xa8\x01!)t\xc8\xb7\xf7\x80wG\x0ag-\
+\xd1\x0c}\xbf\xf1\xf9\xcd\xce\xaf\x0d\x5c\xca\x99\xe0\xf1\x13\
+\xfe\xa3\x1e\xc9\x05]^]\x1d\x8f\x5c\xdb#\x0djs\
+\xc6YX\x0aJ\xa6\xcaW\x15\xa9\x98\xea\x80g\xcfp\
+\xfd\x84\xf9\xb6\x85\x1aNO \x85\xe1\x1a\x8c\x05(\xda\
+\x1a\xc5\x98\xf4\x93\x10XS\xa8\xae\xdcw`\xaf\xfb\xe7\
+C\xde\xbdD\xf1`f\xbbD>G\x95o\xe0L\x87\
+\xbd\xfb\x12\xe0\xb0]2\xcc\xc9#\xbe\xae\xa5\x1a\x1d\x17\
+9\x92\xd0B\x10\x18\xa0M\x99\x9d\xad*\xb0)r\xac\
+J\x9b\x89O5pF\x0d\xd3\xab\x98F\x81J\x86\x8c\
+H\x0a\x90\xdf'z=\xa2\xcb)\xd8\xedBCc\xa8\
+\xae.XQ\x118\xe1\x12\xe3\xcf\x10\xa0\xe4\xba\xd0\xe9\
+\xa9\xf6]\xf6Y=\xd6\xa0.-\xd7\x98\xfc.\xb1\xbc\
+0\xc9 (\xe9'\x9dR^\xba\xed|;\xfc\xeb\x05\
+=\xb7A\x9d-\xb7N\xa5\x0a\x90(Zl\xc7\xf8\xfb\
+\xc3dAI\x08\x07\xdd~t]@\xf8_\xfcC\x22\
+\xbf\xff\x81\xbfwj\xbb\x19IwP)\xa3\xff\xdb\x92\
+\xfa\xbd\x7f>\x87u\xf96\x94\xa4\xfa\xfa\x7fM\x04\x1d\
+\x90.z\xd2a\xfew\xafs\xeaR)\xedO\x94N\
+W\xfeFL\xcf\x1f\xecw\xaf\xf3\x04\xe7.\xfe\xff\xb3\
+5\x94\xc8\x0f\xfc\xae\xc7\xff\x03\xb1\xda_70\xbe=\
+6\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x05\xc3\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x1c\x00\x00\x00\x1c\x08\x02\x00\x00\x00\xfdoH\xc3\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x05uIDATH\xc7\x8d\
+\x96ilTU\x14\xc7\xcf\xbd\xef\xcd\xdbg\xa63\xed\
+\x0c\x9d\xbe\x96nt\xa1i-[\xa1\x14*kS\x81\
+\x14\x83\xc6\x08\x1a\x03!\x1a1\xa6\x12\x97D\xa3\x09F\
+\x14\xfd\x02h0j\x05c4\xf2\x01\x12I\x0dbY\
+4\x01\x1a\xa1\x0a\xb5\x01\xcb*\xd4\x96\xd2v\xda\xcet\
+\xa6\xb3\xcf\x9b\xb7\x5c?\xb4\xa5+\x83'\xf7\xdb\xb9\xf9\
+\xbd\xffY\xde9\x17\x01\x08\xf0PC\x90\xcc\x08\x00\x02\
+ \xd3\x1dx\x1a\x05\x8d\xb1\x1eJd1;v\x81\xcc\
+xa\x1c*Q\x12\x8d\xe8\xe4\x1a1\xa2\xb68\xb6;\
+\x99\xb4\xc9\x22\xa6\x1a\x05`\x1aq\x97\x8a%\xbb\xe4\xd7\
+1&\xff\xc4\xbb\xc6% 4rX\x8a\xd5\xc1\xd8\x92\
+\xf6\x12O1s-tk\xa0#I\x96\xc6\x95\xf6%\
+\x06T\xc0%\xfc\x9c\x8f3w2\x98\x01\x840\xc6\x8b\
+\xa4\xb9\xc5|\xee\x87\xf2N\x91\x12\x0a\xf9\xb2\xc5\xe6U\
+,\xedN\xa3\xa5\xe4\xe9\x1e\x87\xaaDM5\xc9\xff*\
+C\x12%\xbe\x99\xbeM\xa2\x84R>\xffi\xdb\xca\x86\
+\xecwT\x88\xbc\xebz!\x97\xb5\xff\x15i\x919\x8e\
+\x02*y\x09\x1f$\x118,(\x04*\xa4\xea\x03\x83\
+\x9f\x1e\x9c\xfd\x81W\x1fZ\x22\x16Y)I\xc0\xa6:\
+k\xd5M\xa5+F\xa2W\x22\xe7=:.\xe13g\
+\xea\x132CN9JXi]\xd7\xe8;\x123\x22\
+\x19\x8cm\x9deI\x83\xf7\xa7A5tK\xe9*\xe7\
+\xe7X(A\x03e\x87\xb36\xa8Gs\xd9\xf4&\x7f\
+k\x12\xa5\xe3\xd0\x98\x11]h^\xa9\x12\xa8\x14\xf3g\
+3\xa96J\x94L\x16\xbe:\xc5H\xe8\xf9\x09\x17F\
+p?{X\xd8\x99s\xf5\xf6\xadS\x9d\x7f\xb8\x13\xbe\
+$i\x1d\x87\x02\x90\x01m\xc0J;M(\xb4\xca\x5c\
+N!\xca\xbdY\xad\xdf\xf3\xea\xbc\x8d\xf3\x9b\x1aO\xe7\
+\xe9\xe9L\xbd\xbc\xb4r\xb1\x5c\x9a\xb5\xf7\xfb\x06\x02\x04\
+\x10\x00B\xd3z|\x12\x14\x00\x90W\xeb\xf7jn\x01\
+\xd3\xab\xcd\xf3\xfdzP\xdeQ\xfc\xf9W\x87J\x8a\x8b\
+\x86\x83\x01G\x07\x7f\x9an=~\xea\xd4\x86'jZ\
+\x0e\x9f\x8f\x12\xa8MY1\xac\x87\x22F$I\xf5G\
+?R\xc4\xa5\xefpl\x22`\x84\x8d\xa8\xbb\xbb\x9f\xa2\
+\xb0\xa6\xe9\x10\xd3\x075o\xf0\xa6\xb7n}\xed\xc1\xfd\
+\x87\x10\x85\xad\xb4-A\x14\x1a\x99\x1e\x19>\xd4\xd9k\
+\xb6\xa5n\xcab\xd2N\xc4\xce\xb8\x1c\xc8}\xbdk\xce\
+\x9a\xf2\xde\xce^\xdb\xa9\x80\x93\xe3\x99\x80\xd6u\xae}\
+;\xa9\xc8\x11\xedM\x9e\xb6n\xc5=[\xb4\xf4\xc5}\
+\x93\xa7\xc1(\x94\x19\x85\x22\x04\x00\xcb\xa4\x0a\x91\xe2\xca\
+l\xa9\xbb;\x8ev\xfa\xfa\xb7\xba\xe7*m\xfd\x0bR\
+2\xec\x02[du\x14\x98\x9d\x0a$\xca\xac\xf2\xf6\xec\
+\xe5\x05\x92#_p\x9e\x1e\xfc\xfbaJ\x11\x00\xc8l\
+\xc6\xf6\xb4\xe7\xba\x13=E\x5c\x9e\x85\xc1\xd9\x92\xd4\xe2\
+\xf2\xdct\x04i\x8cc\xc1\xb0\x8b\xb7\xd2\x18s\xd8d\
+\x10\x02\x88\xec\xed:\x19N(\xfb;\x9a\xaa\xa4\xb2\xa5\
+\xe6\xd2\xf6X\xc7\xc4\x1c\xe2\x07\xb2\x87\xb5\xc0\xee\xbe\xbd\
+E\x5c\x91j\xe0\xa8\xc2\xcc\x17\x0b\xda\xdb\xae\x1d9y\
+\xe2r\x8a\xe7\xf7*\xa5\xac\xe5\xbd/f\xb5\xbf\xdd\xfe\
+\xf3\x8f\x99]\xabo\xec\xcb}\xb1\xfa\xa3\xdb\x8dC\x89\
+\xf0,\x93\xfd-\xd7\xe6<V\x9eX\x9b\x91\xf0\x11\x00\
+\xa8\xa0\x96\x09\xa5\x22e\xbe\x14\xbd\x96\xc7\x14\x9ai\xec\
+\xd5\x07\x9fO]lt\x07.\xb6\xb5\xb9\xc3\xbe`L\
+\x15\x02iWMw\xda\xae\xb57_hQU\x15\x00\
+L\x88Yo\xad>\xe6?\xeb\xd7C\x13\xc3g\xc6\xc6\
+-\xf8\x8d\xe1\xab\xd1\x1bs\xf8Em\x91+\x84\xb0\xd5\
+\xf6\x9c\x03=\xbf\xec\x94\xd7f3\xf6Z[\xe9\xc5\x9e\
+{Q\x12\xb9p\xf7\x12!0B\x04\x80\xb5\xd6e\x03\
+\x9a\xffI\xdb\xd2\xd7\x5c\x1b=Z\xe0n\xbc\x17\x00\xe1\
+\xb1\x92\x11\x00H\x18JT\x0f\x1f\xf5~}&\xf0[\
+\xa7B_\x1a\xf6UX\x8b\xbf\xec;W\x97\xfa\x98\x83\
+1\x13\x14ye\xd7V\x06Sc\xa5&\x00\xf0\xb8\xb4\
+\xe4~b\xa0S\xf1\xde\x88\x0c,\x10JF\x1c\x93\xfb\
+\x94\x00\x01R$\xcc{9\xe3}\x99/\xf1\xa8\xa9\x16\
+d\xcf\xe6fQ\x08\xe7r\xa9Y\x9cu\xcfg\xfb\xea\
+\xe5\xb5\x13\x0b=\xa4\x0d\x9b\xb1\xa5BX\x98\xc5\xe4\xf2\
+(e\x04\x85\xa7\xb4X&[\xb0\xda\xfa\xac\x83\xceB\
+\x80\x0a\x84\xf2\xbbq\x96A\x00\x80d6\xa5\xd2\x9c\xb7\
+'e\xc3\xfd8\xe7b\xb3\x1e@\xbb\x13\x9e\x98\xa1\xb5\
+F\xee\xf4$B\xb7\xe3}S\x94\x8eZ\xcc\x08\xf1X\
+Dh\xf4O\xae\xb6\xae\xefM\x84\x00\xa0_\x09\x9e\x0b\
+D.\x04\xe5\x5cn\x85N\xf4\x91\xa5Pmy|\x85\
+\xb9\x06\x80\x8e\x13\xdd\xa7E\x7f\x0d6O\x9d\xa7\x0f\xb6\
+\x10\x85\x01#\x14\xd6\xfd\x1c\xc5\xb3\x98\xe3\xd0\xf2\xfa;\
+\xcd\x1c\x9e\xb5&e\x0b\x8d\xe8\x1f\x06\x0e\xd0\x88^h\
+\xaeJ\xa3\x9d\x9bl\xcf\xc4\x08H\x94\xf3\x1b\xcf\xb7A\
+-\xa8\x11mf\xa8\x992\xbbX\x19\x01t\xc4\xafc\
+\x84\xe6K\xcbs\xb8\xc2B\x5cF\x88q9t>\xaa\
+\x87z\x95\xce7\xe4O\x04$\xb0\xc8\xa4\x03\xf1\xe9\x91\
+F\xff1\x9f\xea\x9b\x98\xc6\xa9\xe1\xf3X\xd4\x89\x82\x11\
+\xf2k\x9er\xb1\x12\x01\x88\x94\x84\x011\x98\xbd\x17\xbf\
+\xad\x13cX\xf3\x1d\x1f:\x1c1\xc2\x8a\xa1z\xd4\xa1\
+\xef\xbc\x0d\xddJ\xe7\xf45 L\x19T\x1c%\x14\x8b\
+\xf3\x22z\xb0\xc6\xfe\x94\xd3\x94!Rf\x04\x10\xd1\xc3\
+\x1e\xd5\xfdg\xf0\xec\xe5`3\x00a1\x9f\xc9\xe4\x0c\
+\xa8}a-0}\xa0\xa0\xc9/\x14\xf4\x887\x0aI\
+\xf2Z\x99i\xf1M\xf0\xa1\xffAIv\xe3?\x83?\
+4Je\xb3\xed\xc9\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00~\xb9\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\xc0\x00\x00\x00\xc0\x08\x02\x00\x00\x00\xdd\xbe\xfbP\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00 \x00IDATx\xda\xd4\
+\xbdwt\x1cU\xd2>\x5cu\xbb'\x8fr\x0e\x96l\
+I\xce9c\x1bG0`\x83I&,\x18LZ\x16\
+X\x16\x16\x93\xf3\x92\x97\xb0\xe4\xbc\xec\x92YXr2\
+\xd18\xe7\x9cs\x92-\xc9\xb2d\xe5\x19iR\xdf\xfa\
+\xfd\xd1azf\xbagF\xb6x\xf7\xfbt||\xa4\
+\x89\xdd\xf7\xd6\xad\xf0\xd4SU\x08\xe0\x84\xe3\xffA\x00\
+\x8a\xf9\x05\x00(\x89G@\xfd3\xf6\x03c\xff\x8fz\
+\xd6\xf0\xc7\xf0JN\xfc\xa7\xab>\xcd\xecs\xa2\xee\x88\
+\x22W\x0c\xe2\xfe\x9e\xccwQ\xd2[\x19\xfb\xe2\xc4\x9f\
+ \x00XNxi0\xe9\xcd\xc3H\x81\xd0\xbf\x12M\
+^\x00\xe6/6|6\xfek\x8e\xef\xee\xf0\xf7\xfc\x9c\
+\xd8M\xc2\x98\x83\x17\xf5\x9a\xd8\x13\xd8)Y\x81D\xcb\
+\xdb\x89eg]tF\xa3n\x80:s\x10Q\xb7d\
+\x14W\x04\xa3\xc4\xd4\xf02\xe8\x04\xb6\x9c\xbab\x1b\x92\
+\xff\x22\xc3\x05\xd1\x16\x81\x8c^o(mx\x5c\x92\x81\
+q\xaf\xca\xf0q\xfa\x9d\x04\xc8\xf0\x00Q\x5cu\xad\xbf\
+&\xc3m\xa3D\x87\x95\x12\xadH\xd4\x06P\xa2\xcb\x86\
+H9\xee\x12\xf1\xa2Dg\xc0\xec\xec\xa1\x89\x1d\xd7\xbf\
+\x9eb\xae*V\x98\xe2h\xa6\xae9',i=\x96\
+\xbc\x8c\xc7\xd7\x13\x90\x84\xf2@\x93\x83E\x89\x04\xc5L\
+\xdfb\xd2\xa70y\x13\x09IK\xa4\xa1\xbb\x83\x91B\
+\x83\x89<$49\xab\xb1\x12\x16\xdf\xcb<qCl\
+ @h\xee\xd3u\xf6C1\x095\x1b\xfb\xa7\xa1\xf6\
+64v\xb1\xdf\x12_\x9e\xa8\xab\x8f\x1du\xde\x155\
+[\xfd(\xdb\x8d1\x0a\x09ct\x0f\x1a\x89Z\x1c}\
+\x86]'.\xc6^v\x978\xd1fG\x1f\x93Vl\
+h\xa2\x841n\xa4\x16G\xf9\xc5\x7f1\xc5\xb5\xb3\xc7\
+\xe7iv\xea5d\xee\xd0\x90yh\xd2)\x87\xe6\xff\
+\xe8\x87\x9d\xf0b\xc5q\x83\xe2\x04\xab\x98\xdc\xb3dn\
+>(\x89G\x0c\x8f\x0e\x1do\xa4F]\xf7\xb2\x84a\
+\x94\xde\xa0\x9b)\xd1d\xee\xbdS\x9b\x8b\xc7'@\xd8\
+Eka\xe8\xd3\x18\x86\xb2\xf1#yJ\x14\x0e\xc41\
+[\x98\x84L\xa3Q\x80C]\xa4{:\xfb\xb2(\xab\
+\x841\x81B\xc2\x984\xa1\xef\xdfY\x07?Io/\
+,@\xc7\xe7\x16`\xa2u1\xdcNJ\x02\x050\x8b\
+#\x12\xdeUB\xdd\x13\xc7\xb4\xff\xcfL\x80Q4\x9a\
+\xd0\xd5\xc3\xb8~d\xa7\xd4\x0c\x9e`\xbc\xc9\xba\xc2\xa0\
+\x1a\x0a\x0a\x19\x19\x8b\xf8Q%&\x07\x18&\xe3`\xd1\
+\x09\xdc\xce\xef\x12\xad$\x0dR`\x5c_\x10\xe3*\xdd\
+d\xb0\xfe\xae\x8d*P<^\xcbE\xe6[\x15\xc76\
+\xc7\xda\xf5N\x01\x86\xc9k\x8b\xff\xb5F1T\x1c\x94\
+\x8cb\xa0\x18\xdf?\x0aeE#\xcd\x8d\xc7\x95\xbeH\
+\xfefL\x9d\x8a\xdf#\x0a\x03\x93\xa8\x1e\x8d\xec\x11\x99\
+\xc4\xa5\x10\x17\xed\x88\xef\x83\xff\xaf\x7fP\xbd#\x04D\
+8)et\x8a\xe0>\x16j\xe8\xa4Sb\xa8l\x0c\
+\xa1\xf6\xdf)\x87\x93\xd4\xad\xb2\xdfGn\x92\xb18h\
+\x84\xa5\x9ai]\xfa\xff\xa8\xbe1Av\x10\x09\x90J\
+l\xc5\xf7\x17<rC\xce\xedA\x08\x99_f2\x9e\
+\xbe>\xbc\x88:EQO\xc1\xffI*&|\xf1b\
+W/d\xa7\x94\x81\xa1\x221C\xd5\xccT\xfd\xffB\
+hL\xa5\x1dU\x1d\x84g\xa7\x9e7#\xf3\x02\x00\x5c\
+\xd3\xbel\xaf\x7f\x1f\x00\x02Qr\xf8Y|_\xe28\
+0C\xfc\xfd\xa4J\xec\xeac\x98\xfc\x8e\x92\xc9\xf2Q\
+\x22\xda\xc6\xffZ\xeb\xc4\x0aM\xe4\x02\xa4\x8b\xa97\xe6\
+\xdc^j\xef\xc9\x81$\x90>i\xf8\x00H\xd1K1\
+2d\x86\xb6G\xf9:d\x84+R\x12\xf2\x81I\xe8\
+\xef\x13\xf2\x9c\xc4\xaeX\xce\x13O\x9f%\x8c<\xe9w\
+ww\x8e\xf3\x94\x86\xa5\x07\x11\x08\xa0\xc2V~C\xee\
+\x9d.!\x95\x80\x00`~\xcb\x0f\x0d\xa1F\xf3oA\
+#\xf0,a\xe6\x0eM\xa2\x19L\xa8!\x93\xb8\xf3\xce\
+-\x84\xd8u\xbaG\xefB\x92\xee\xb4\x1c\xdf\xce\x18\xae\
+\xec\xffN\xf1\x18\x02\xc5\x80\x80\xea\xb6!\x10\xc0H\xe7\
+\xa8+snfL\x00\x02\x22\xf4Q\xc7w\xcd_P\
+\xb2r\x8a\x89\xd0,3\x8b\x0fF\x8e\x11\x1d\xef]\xd1\
+\xef\xa7\x81\xd0\x08zG\x0dQB \x00F\x04\x80\x18\
+\xd6\xd6\xaaW\x00\x04'\x06Z\xe2\xff\x85\x94P\xcca\
+\x90o\xc3\x18W\x0aK\x0f\x02LI=\xe3\xa2\xcc\xab\
+8pu+\xf1\xbb\x86\x8f\xfd<\x88\x88\x00$ \x0b\
+\x11Oz\x01\x0c\xc1\xd5\xf8n\xf2q\x98\xa1\x13\x12\x1d\
+\xf9\xe7\xf8\xc2\xf8\x18M\x8b8\xd0\xd1\xfb\xbe\x829\xdd\
+\xac\x05>\xe88\x16j\x00@D\x9d\xf4\x00\x01\xa2\xfa\
+\x0f\xfe\x7f\xf3c\x08\xdb\xca7&\xdf\x8b\x1a\xad\x9f\x9e\
+6\xe3\xfc\xcc+$\xe0\xca#\x08\xcd\xa1\x86w\x8e\xbd\
+\xc6\x11\xec(<\xd3sv\x10q\x7f\xfb\x91\xa4\xcf\x03\
+\x9a\x9f\x22J\x14\x82t6.\xc6N\xd2^\x8fS\x03\
+\xa1\x11\xc6\x15\xfe\xd8V\xee\xe9\xed\xe8]n\xef13\
+s\xc6\xd1`\xfd\xbc\xd6\x05\xdf4\xff\xdc*\xb5\x93\xa1\
+\xa3\x8d\xd4\x19q\xef\xbc\xdf\xa3wW5s\xa3\xffJ\
+\xd9aA\x00\x22\xe5\xc5\xb24\x10\x99./\x9a\x85Q\
+pJ\xda\xb4s2.\xe3\xb2\xf4\xa8w8\xb7\xf93\
+\x09\x08\x01\x1e\xe8q\xf1\xcc\x9c\x91\x1f\x1d]\x16\xe3\x1a\
+\x1f7\xfc\x01I\xf0\xe9\x12c\x80&8\x02%\xa1\xb1\
+\xc2/f\x9dWw\x14\x83\xcd \x02T\x07\x8f\xb4\x85\
+<\x04\x10\x22\x9e%f^\x9c9\xf3\xe3\xb27\xef\xc8\
+\xbf\xae\x87\xbd\x10\x91\xe4C\x19\x19i%i\x98\x8e\xcb\
+k\xa6H\xf0MQ{:\xaaZXP0,Oz\
+\xedB\x08$;p\xba\xeb\xd4\xb4\x8e&&\x08\xe3\xdc\
+\x13gf\x5c)\x01\xd7\x8b\xde1^\xbf\xdc\xb3\x18\x00\
+z8\xb2/\xcb\x1f'\x0ab@\x0a\xa0\x968\xc2\x13\
+T\xc2\xf1\xf78\x96K\x04I'\x85:k\x01\xb1S\
+\xb90\xc3\xbc\xb1\xb2]!\xe2\x07|\x07\x08\x80\x90\x00\
+\x80!\x00\xc0\xa4\xd4q\xff,\xf9\xc7\xa3\x85\xb7\xf7\xb4\
+\x97*\x9f\xab\xbcU\xdb\x0f\xdd\x9f]\x18\xae\x9bf\xe5\
+\x938^\xe1[\xc4\xb0\xcd2\x8c\x16\x80\x068\x06]\
+\x92}\xbdDRdX\x86\xbf6}#\x01\x01\xd0-\
+\xc53D\x06\x08Bk\xc8C@\xa8\xe9\xb9\x13\x12!\
+4\xd1dd\xeeS'\x03\xb8\x1c\x07\x1cc\xac\x81\xe2\
+\xfbh&Z\x0eqw`?\xa9\xaf\x94O8#\xe4\
+(\x8dt\x0fy\xad\xf4\x89\xbf\x15\xdc\x5cd\xc95\xba\
+\xbcN\xfa\xc8\x06~\x89\x11\xe3\x11M\x22DT\xdf\x82\
+\xb1\xc1c\x1cMfp\x19\x05b\xd15\xd9\xb7E~\
+\x14\x12\x81Gj[\xe2\x99\x0f\x00E\xd6\x8c\xf3rG\
+#\x01\x80\xd0\xce\xfd\x08\x10\xa1\xe7\xba\xac\xd8#\xd67\
+\x05#\x92\x0c$\xc1V\xeb\xf4\xd1e\x9d<\xc5\x86\x10\
+\x9f|\xaa`_\xa0\x92\x08\x81\x88\x80\x088\xaa\xbb\x88\
+\x00@|l\xca\x88\xb7{<\xfb\x97\xdcK\xdd\xcc\xaa\
+?Ea?\x1b1\xdaF$\x03@\x92\xee!\xed\xed\
+\xf2\xc6c\x94\xdfc\x8a`\xa3\xd9\x97\x9a<\x8e\x08N\
+\xc1vC\xfe\xdd\x82`% \x1d\x15\x83\x08\xe0\xb7\x96\
+\xef9\x01\x02^_|\xba\x08\x122@FA)\x14\
+q\x0d\xc7\x1f\x93\xc6\xf1`\xc8\xa8\xa8\x83\xe2\xe6\xe4\xc9\
+\x5c\x99%K\xe7\xc0\xe4=\xa68\x1f\x8a\x00\xfb\xfd\x07\
+\x04&\x10 \x00n\xeb\xd8\xb5\xd6\xbb\x01u\x9ck\x04\
+D\xa4s\xd3\xcfx\xbf\xec\x85\x09)#\x10I\xde\xb9\
+hy$H F\xa8\x82\x02\xa8\xb3\xa7\x18\xc5\xa2\xd1\
+\xfda\xcas\x8f\xf6o\xe4\x9f\xc4\xa1\x0c\x02\x00^\x95\
+uK\x9a\x90\x1b\xa3\xcdP\xa2\xd0b\xcf/\x00\xe4\x16\
+\xac\x17\xe6\x8d\xd5\xc2|\xa6]\x12vm\xde\xd3\xcc\xcb\
+N\xc8\x16\xc2DUxI\x99\xb6\xe3p\xa2\xcdR\x82\
+X\x13\xa8\x0drN\x00\x84\xd8\xcf\xd1\xff\xbb\x96_\xef\
+\xaf~\xbc!\xd4B$\xcb\x0a0@\x86\x98\xceR\x1e\
+-\x9a\xf3H\xc1_SE\x07\xe9\xfcW\xa3\x0d\x8e\xb9\
+y\xd9\xbdEM\xbb`\xe2\xcd\x8eS\xce\x80 K\x0c\
+\xa9\x82`g\xe2\x04\xf7\xb0r{\xb1\x89\x93\xa0|\xdd\
+)\xa9\xd3{\xb9\x86\xa9\x1aG\x09)e\x9f{\x95w\
+a;\xef\x00\x80srF\xa70A\xb3\x1c\x02c1\
+\xa7\x02\x95\x14\xc7\xf1\xe8\x9ed8\xe6\x94\x10\x09M:\
+\x8e1U+\xac3\x90\xa5I\x00\xa9<@A\x0a\xd5\
+\x87\x8eI\x00\x9c\x80\x03\xcd\xc9\xff\xcb\x01\xff\xe1?\x1e\
+\xbcu\xa9w\x0d \x8b\x08\x90\x89\x8fO\x19\xf9A\x8f\
+\x7f\x0cuV\x90z\xfa\x8dV)\x12\x95W\x02i\x02\
+\xd9H\xc6\xd6=#\x88\x0c\xd1\xac:\x8aiN1h\
+Q\x19\x00\x01\x92[\xb0\x9d\x9d>\xf9\xb9\xe2\xbb\xe7\xf6\
+|\xef\xea\xec\x8b\xebB\x0dz\xc1\xc5\xc8\xcb*\xb1\x94\
+\x9e\x95q\x19\x10\x91\x12\xab\x85u(\x036\xbfm\xae\
+,\x96\x17\xe5\x8e%`\xca\x95\x12w0\x1b\x11E2\
+\x82\xa8+0z\x88\x89\x8e\x93\x8f\xe4\x8f#\xf2J\xca\
+\x896\xfb\x8e\x84\x88\x02\xd6\x05\xeb\x88\x80\x03\x10\x80\x83\
+9\xe7\xe4\xdf\xe8\xa7\xc0\xe3G^z\xa3\xfe}B\xf5\
+\xa5H\xf2\x92g\x08\xa9/t\xbb\x7fV\xe6t\x16\x16\
+\x07#=\xa4\x05Aa\xeb\xa67=\x11\xae\xcc\x15\xd9\
+3X\x8c\xdeV\x01?Y\xe3\xa0\xac3\x10\x88\x80w\
+\xb3\xe6\xdd\x91}\xd5\xe7=^\xbf1\xe7\xca\x01\x8e\xbe\
+\xb5\xc1\xba\xdb\xaa\x1eo\x93:b>B\x11$\x01\xd9\
+\xe597k\x9bB\x8a\xbb\xa5\xac\xc0.\xdf\x96\xa3\x81\
+\x1a\x00(\xb5e\x8fp\x97\xc90\x00\x10!\x97\x5c\xcc\
+\x1e\xebzu5\xd0ih+(n\xb2\x96\x92+\xa0\
+3\x05!\x99\xb9\xc6\x8fc\x12Le\xf6h\xa0N\xd9\
+\x19\x00\x00\x18\xe0\x1cpv\xfa4\x02\xfc\xb2\xe9\xe7G\
+\xaa\x9f\xe7\xca\x91c\xdag1\xc0\x1br/y\xa0\xe0\
+z\x11\x99b\x8e4\x0d\x82\x86WL\xd11v\xe4\xd3\
+\x93R\x86\x8fM\x19\xa2\xea\x0d\xd5]\x22\x8c\xb9\x07,\
+\xb2d\xff\xad\xf0\xc6w{<{z\xc6\x14\x01\x05\x04\
+l\xe7\xbe;\xab\x9fh\x08\xb5\xc9\x8aE\xf5\xee),\
+>\x80g\xa4\xcd\xcc\x12\x8bH\x15@M7\xca@\xfb\
+\xf2\xb6_\xe5\xf7\x9d\x955\x12 \xa4].\xe7\x92E\
+\xb0\xc4\xb8\xea]\x9b\xddC#\x9b\x1d\xa7\xf2\xd5P/\
+P'\xf9\xa8\xd1N4\x99\x04Y\x98\xf8\x0b\x08\x08\xa0\
+\x99\xb7r\xd2\xae\x0b\x89\xc3\x15\x99\x97\x96X\x0b\x00p\
+\x99w\xc3\xbd\xd5O\x05\xc3\x80\x9bzx\x89\xa6\xa6\x8e\
+}\xa9\xe4^\x17\xb3R\x18w\xc1H\xd1\xa0\xa4\x80G\
+\x92\x8a,y\xe7eLB\x94\xdd.\xd5\xb8bX\x0b\
+\x11\x92\x15\xd9\x9f\xb2f\xbe\xdf\xe3\xd9\x89\xee\x93\x888\
+\x021D\x8e\xd2\xfd5\xcfT\xfb\xebQ\xe7\xa6\xcb\x01\
+\x01\xa9\x1f\x92c\xc9\x9d\x9cz\x1e\xe8\x02.\x9d\x08A\
+\x07\xefX\xef])\xbf{JF\x7fR\xb4\xad\xac]\
+\xc9\x02\x16\x22\x9d\x11#\xe8\xfc\xb9\xef\xac\xdd\x89C\xd2\
+\xa2\x13\xc0~\xa2M\x18%qq\x94\x00/'\xc5\xd4\
+4\x86\x9a\xa2\xc3Z\xc4\xdb\xf2n\x11\x91\x01\xc0\xda\xf6\
+\xad\xf7\xd5<\x15$\x89t\xd6G\xf6\xa1\x07\xda{\xbe\
+R\xf2`\xaa\xe0\xa48(T<g\x19\x110O\xcc\
+\xcc\x10\xdcc\x5c\x83\xdd\xcc\x8e\x9a\xfb\x82zz\x00\x0d\
+\xb0\x97\xbf\xdf\xfd\xe9K\xb2\xceVl!\x11\x12\x08\x08\
+\xaf\xd6\xbd\xbf\xb5cw4\x94\x14\xe1\xa3\xd39\x19\xb3\
+e\x9dM\x88z<^\xf6\xcbV{\x16\xcab\xeeb\
+\x96\x11)=\x11t\xdfJ<\xc5\xe2T\xd5k\xa4u\
+\xeeL\xcc\xdc\xc9\xcd\x8eS\x5ce\x88\x0c\x1d\x8fye\
+I\xbc\xc1\x10}\x8a\x8a\xc0\x94#\xe9#\xbf\xec\xcep\
+\xc5\xddA\x00\xe8f+\xba,\xf3\x22\xf9~\xd6\xb7\xef\
+x\xa8\xe6y\xa2\xb0:A\xc5\xd8`\x85\xad\xf8\xa5\xe2\
+\xfb\x5c\x82-\x0c\xc5'\x07\xf9kH\xd2Hw\xff \
+\xf7\x0b\x08#\xdd\x03b\x84\x0e\x01\xe9\xd2\x8ci\xaf\x94\
+<P`\xcd\x96\xdd_\x04B\x04D\x9a\xdf\xb6\xfc\xbb\
+\x96\xf9\xf1c\xd2rk\x9f>\xce\x11 \xfb\xc4\xb2V\
+Q5\x13\x00\x08 \xaeh\x9f/\xfb\xe7c\xd2\xfa!\
+\x0f\x02iWOD\x90*\xdac\x9c\x0d\xfa=\xc9\xdc\
+f\xfdR\xd0\xbc\x09\x10%\x1ft\xc7\x0aP\xf2%\xdf\
+hf|\x11\xa0\x9d\xb7\x87cZ\x90%\x09\x89`F\
+\xfa\x8c\xde\xb6r\xf93Vz7\xbd|\xec\x1dD\x94\
+\x01}}dRf/~\xa9\xdb\xfdN\xc1\xa2a9\
+\xc9-\xaf\xac\x0fp\xa8\xb37\x22#\xe0\xfd\xed\xe5Q\
+\x98\x88\x95\xe1\xa3\x857\xfe9\xf7\x12\x81\x90\x010\x04\
+\x01A\xfe\xe5X\xa8\xe9\xe9\xda\x7f\x99~\x95\x1a\xf0;\
+-\xee\x8d\xde\xa5\xc7B\xb5\xa8\x11\x0d\xc2{\x815\x81\
+C5\x81*\xd9Z\x8eJ-\x03\x01)\x1c\xa4#\x01\
+\xd8d\x92P\xc4\x06\xa1\x8eW\xd4U\x0d\xac\xc0\xa8;\
+L\xfc\xdcb2\x152\xa6?b'U\xa5)\xb1K\
+~\xa2\x83\xb7\x83\x8c\x0d*P\xb4j\xe2\x88n\xcc\xbd\
+aN\xd5\x9d\x12\x11\x00|\xd3\xfc[Ok\xe9Y\xe9\
+\x93\xd5\xa4\x10\xa9\x81-V\xd8\xba?Vp\xcb\x1d\xd5\
+\xcfp%\xea\xc2x\xf9\x84\x88\x5c\x06\x1f\xe9\xec\x8f@\
+\x0c\xb0\xd0\x92\x15\xbeT\x047\xb3=]|\xfb@G\
+O \xce\x14\xb3&#8\x80\xc0\x9e>\xfa\x96\x9fB\
+\xe67\xad\x84[[\xbdk\xb6z\xd7\x10\x81\x8b\xb9z\
+:\x06\x0et\x8e\x18\xec\x1c\xcb\x18C\x0e\x80\xb0\xc1\xb3\
+T\xb9\x09\x82\xa1\xee\x1e\x18\xd90\x03\x01E\x10:\xd1\
+l-Y\xf3\x94\xd0\xe8`\x22\x0d\x84ID\xd9\xf1\xb0\
+\x00\xb13v\xd4\x88\xed\xa6\x1e\x1dy?$\x92d\xfb\
+\xc5\xf4\xc6\x8d\x00\x00\x0a\xac\x053\xd2\xcf\xfc\xba\xe9;\
+\x04$\x82\x17\xeb\xde\xebe\xef\xd1\xcb^\xa2\xc5;\x04\
+$\xcb\xcbH\xf7\xc0\x9bs.\x7f\xa1\xfe\x03E\xb1\xa8\
+\xd9\x09\x8a\xf0x\x88H\x03t\x00\x00*l\xc5\x85\xd6\
+,\x22\x0e\x00NfC\xd5\xb8\xb8D\xdb\xcb\xc5\xf7\xf4\
+\xb4\x972\x22P\xe5F\xbep\x0e\xf0[\xeb\x8au\x1d\
+\xdb\xc3\xfb\xa9\xfa\xdd\x02@o[i\xb9\xbd[\x86\x98\
+\xeafN\x11-^\xc9\xd7(\xb5\x1e\x0a\xd4l\xeb\xd8\
+\xbb\xb1}\xd5\xa6\xf6U{\xdc[.\xca\xfa3!\x01\
+\xb05\x1d\xcbd\xea%\x03\xea\xe7(\x8d\x89.@P\
+\xfc&\xf5.42\x09\xe8s/\xb1\xdb\x14\xbf\xa5_\
+\x9c\x0e8\x86=\x02\xc1\xa4\xcd\xd9\xf1cE\xa2\x094\
+i\x96u\x8b\xf9&\xf5 k\xa0\xbe\x1c\xd0*\xda:\
+\xbchH\x0033f.hY\xd8\xc2=@\x10\x00\
+\xe9\x81\x9a\xe7\xdf-}\xc6\xce,\xaa\xb2W>\x858\
+]\x90y\xfa\x9e\xc0\x81\xb9-K#@E\x05\xd1F\
+\xa0\x98\xfc\x15\xc2\xe4\x94\xe1\x9c$\x04\x04\x22\x11\x05\xf9\
+\xe5\x22\xb2\xe7\x8b\xee\xe8m+A\x15\xae\xd1\xe9\x1e\x0c\
+Q\xe8\xf5\xfa\x8f5 \x07\x91\x97\xd9\x8aNw\x8f\x1e\
+\xee\xea?\xd0\xd1\x13\x80B\x14\x22@\x22\xe0\x88\x12\x09\
+\xfb|\x87\xff\xdb87D\x12\x020\x14\x069\xc6\x10\
+\x00#<\x12\xacl\x08\x1e\x05\x10\x00\xa0\xc4\x9e\x9bn\
+\xb1r%?\xaf\xa5\x5c(\x82[\x07:n\x1a\xe9\xe4\
+\x80\x92Gz\x92a\x94Sr| <\xae\x96N\xca\
+{\xc5D\x22\x96\x84\x17\xa6\xac\x05!\x80\x88\x16\x22 \
+\x19*$E\x8c\x10Q\x0e`\x05\xb4^\x94u\xd1[\
+\xf5\xff\x96\xdfS\x1bl\xf8\xc7\xd1\xb7\x1e(\xb81\xf6\
+\xc3%.\xcd\xc9\xbbz\x97\xef\xe0^\xffa\x9d\x97\x8c\
+*0\x07Q\xf9t\x04~J\xcaH\xcdo\x0e\xf0 \
+\x01\x08\x08\x8f\x17\xfcy\x80\xbd,\xfaJU\xa5\xf9}\
+\xf3\xc2:\xa9\x19\x01-\xc8\xceH\x1b;3}J?\
+{\x99D!@\xe4\x18B@\x06\x8c\x03\x11`K\xc8\
+\xfbJ\xfd\x7f~m]\xc1\x81\x00(C\xcc\xbe2\xe7\
+\xb6\x22k9\x10'\x80-\xedk\xb4\x036(\xa5\x87\
+DRd\xaaW\xc9\xe5$\x1drwI\x08\x96\x88=\
+a\xd0\x93\xea8 ib\xe6\x89w0\xa9l\x8f\xf3\
+z\xb0\x0b\x0e\xd9q\xe6\x00\xea?\xe426\x8d@\x04\
+\x93RN\xc9\x17s\xd4\xf7\xe1\xbc\xb6\x15\x0b<+\xb9\
+\x12\xf9#i\x9a\x1cP\x04\xf1\x91\x82[m\xcc\x12\xb5\
+&C\xdd\xbdS\x05G\xd4R\xf4\xb4\x95T\xd8\xbai\
+\x89M?\xf9\x09\xf8\x9f\xb2\xcf\x1f\x9f:\x0cU\xb0\x0b\
+ud$D\x12\x80}\xd8\xf4=\x03\xbc c\xf27\
+\xe5\xcf\xdd\x9b\x7fUo{\x09\x81\xc4\x10\x19\x10#\x05\
+\x09\x12@X\xd0\xba\xe6\xd2\x83w\xfc\xdc\xbaBFG\
+\x07:F\xdeV\xf0l\xa1\xb5\x8c\x88\x03\x22\x03qc\
+\xc7JMv\x079\xbbi\x08\xb5\x1e\xf4!C|\x82\
+\xf4\x99\x12\xea\xea\xea\xad\xd8\xbeo\x86\xe9U<\x111\
+eF^\x15\xc6\xf5\xb6b\xab\x0cPS\x0fN\xe6\xa4\
+\x880\x00\x01\x80\x03\x11\xc9\x80\x0bp\x84K\xb2f\x11\
+j&\x1f\x9f\xad}\xbbUj\x97\xe3b\x05\x01\x96\xc3\
+[\x82Bk\xf6-\xd9\xb3e\xbfD\xbb\xa6\x1a\x7f\xdd\
+\xe3\xddn\xc1\xc8+\x99\x991E\x92\xab?\x09\x00\xb0\
+\x85{'\xbb\x87\xcf\xce<\x8b\x85\x9dt\x0dUP\xbe\
+dU\xfb\xe6|1\xf3\x93\x1e\x8f\xdf\x91wY\xa6\xe8\
+f\x08L\xcb\xb5\xa9\xc69\xc4\xe1\xc9\xa3\xef<p\xe4\
+\xd56\xc9\x07\x00\x02\xb0s3\xae\x9c\x9ds\xa7\x15\xed\
+\xb2Z!\xa2V\xa9\xb1&pH[\x8bA\xae\xee\xca\
+\xcd\xcay29\xe4\xa7\x18\x1ag\xc4\xb1'H>\xe2\
+\xec\x84\x8f\x82q!f2G\xa8\x93\xe4\xe7\x1bSZ\
+\xe3\xf4\xb5 \xe3\xee>\xa8\xba\x8a\x046t\x92f\xd2\
+\x80\x14\xd5B\xa8\xbb|\x1c\xee:\xa9\x9b\xb5PK\x7f\
+\xb5\xf1\x8e\x17\x8e\xbe\x8b(h\xc8\xad\x9aiD\x02\x98\
+\x9e>e\x84\xab_\xd8\xc9D\xa8\x0b6\x8cv\x0d<\
+%u\x94v\xb3\x0ef93m\xacf\xd1\x88\x888\
+<Xp-C\x92s\xed\x11MxTl0KL\
+\x7f\xb3\xf4\xfeRk\x9e\x1c{\x87\xddXM\x8dI\xa1\
+\xdb\xaa\x9f\xfd\xaai\x91\x1c\x12\xa4\xb2\xb4?\xe7=<\
+\xda}\xbaD!N\x5c\xbe|\x02\xd8\xd5\xb1Q9\x87\
+\x086&\xf4w\x94h\xa9^\xa20\xa4-\x1179\
+\xd6\xa4H+\x9e\x88\xfaAs\xc9@\xf3\xad\x04\x93\x06\
+\x8c\xc9\xb7\xd2Bf\xfe\xe9d\x8e8E\xe5\xa7\xc3/\
+K\x15Se\x7f\x99H\xc9\x10qR\xe8\xc5\x1c@\x02\
+ \x22\x89\xa4\xf3\xd2/\xd0\xeb\xce\x05\x9eUk\xbd[\
+IFWH\xc3\xa7\x09\x08%\xe2w\xe4]gc\x16\
+\x1d\xf2\x86\xf5\xc1\x86\x9bs/\x15\x19\x93/\xe0\xbc\xf4\
+\x89\xb6\x886#xV\xfa\x04'\xb3\x85\xc9@\x18\x93\
+\xd8'(\xb7\x152\x80pj\x16Q\x1fV\xfa!\xf4\
+\xd7\x9agVy\xb7kW9\xcc56G,\x92s\
+c\x0a\xf2D@\x00\xbb\xfc\x9b\xb5\xd2\x9f>\x8eb\x17\
+\xb3\x12\x01\x82\xb0\xcb[\xc7U\x0d\xc4\x09:x0\x81\
+}\xa0.L\x8a\xc5\x09\xbe\xc0\x5cb\xba,\x95\x01\xe6\
+mf\xc8\xe4\x7fE\x0d\xbb\xd0M@\x5cM\xc8k\x07\
+\x91\x83\xa6\xce\x81\x00\x87\xbb\xc6d\x8bY\xbaw\xe3\xf3\
+uo\x878\xa9VL\x8d\xd5\x91\x10 O\xcc\x98\x9d\
+u\x8e\x96\x17 \x02\x1f\xf7\xe5Z2NO\x19\x0b\x08\
+V\xc6fe\x9d\x0e\x91\x9c}\x1b\x8a\x0a'\x1e#\xb8\
+e\x8a\xfd\x0a\xb3\x8aTq\xd0T\x14\x22\x01p\xa2[\
+\xab^\xd8\xe8\xdd\xab7\xeb\x0b=?\xfd\xad\xfa\xaa\xf7\
+\xeb\x9f\xda\xda\xbe:\xa4RV\x18\xb0\x9d\xed\x1b\xb5\xc5\
+\x19\x97\xd2?D|A\xf3\xae3\xb6>v\xd5\x9e\x17\
+\x98\x9c\xf7\x00@\xc4\xbaP\x1b \x98vmC\xe8\x22\
+\x07(v\xe3\xc8\x04<$\xf38\xa9\x13?\xcc\xc8\xfe\
+\x99\xa1Od\xec\xc6\xeb\x1eNa\xa9\xa4Q](\xa2\
+\xd5\x14\x01\x12*\xde4G\x9a\x9az\x86\xfeK\xaa\x82\
+G\xbfm\xfdE\xf1\x5c\xd5\x0c\xb8\x22\x16\x04\x17g\x9c\
+\x95cI\xd7e\x90\x10\x80\xceO\x9f\x8c@g\xa7O\
+\xc8\x173\xc1\xec\xfaH\xf3\xcbc\x03\xa1\xf0\x95\xaa4\
+n9\xb9!<_\xf7\xd1\xea\xf6\x1d\xb2\xf4\xa9*Q\
+vdp\x87o\xe3G\x0d\xcf\xff\xbd\xfa\xda\x9f[\xfe\
+s,X\xb3\xa4m\xae\x97{4O\xb0\xc0\x9as\xf5\
+\x9e\xd7\xae\xd9\xfb\xd2\x8e\x8e\xea\x0a{\x11\xc9\xecyD\
+\x06Bk\xa0\x0dI+O\x89Z`\xea:\xef\x19M\
+R\xf4d\x92 ?Qj\xb6hn;\xc1\xa8\x8e?\
+\x06\x80B5\x0d\xc6\x10\x90\x5c\x82[u_\xc8(%\
+\x8b\xa8n\xdc\xc9\xee)\x9f6}\xa2x\x06\x04\x80\xf8\
+\xde\xb1/OK\x9d\xe4f\xf6\xb0\x13\xab~\x95\x88\xec\
+\xea\xcc\x99O\xd5\xfe[\xfe\xfa\x14t!\xe0`G\x9f\
+\xee\xd6\xbc\xebr\xcf\xa78\x80iX\xc8eqRS\
+\xab*@\xae\xb8k:D|o\xfb!\x04\xbc'\xf7\
+\xf2l1\xcd%:B 5\x07Zk\x82\x8d\xbb\xfd\
+U\xab\xbd[Z\xa4\x0e\x04\xf4p\xef\xa2\xb6\xef\x17\xb5\
+}\x0b\x84\x9a\x1b@@\x0f\x1f\xfe $\xcb!\xc2`\
+ww\x02.\x17\xa9 Z\xeaB-\xa4\xe0\x94\x1a$\
+u\x82e\xe9\x9dr\xae\xd1$4;\xd1\x1f\xd1\x1c\x1e\
+\xc0D@S\x14}\x1d\x88@@\x91T\x02\x85\x1aK\
+Q\x04$\xa2\x0a\xbeCt\x0fq\x0c[\xeb]\xa39\
+\xbf\xad\xbc\xfd\xb3\xa6\x1f\xaf\xcc<7\x9cl\xd2\xc8\xf2\
+@g\xa5Oz\xbb\xf1\xf3\xfa`+\x02\xe5\x88\xe9\x01\
+\xf2I\x14x\xb3\xfb}i\xe8\x8a\x88\x961\x1a\x94#\
+T]!2\xca8!FP,\x10*\xecEs\xec\
+\xb3d\xdb\xa7<\xe5\x00\x0e\xe0\xe3\xfe7\xeb\xbf\xfd\xa4\
+\xf1'Rj\x96\x08@\x80\x08J7\x86\xc2\x5c\x15\x1a\
+\x97\xd2\x17\x09U#N\xc7\x02\xcd\x88\x82\x8abQd\
+}t\xe4b\xc2\xef\xa1\x8d\x0ca\xbc.\xf8\xba\xe4I\
+\xf5\xe6\xd8\x00\xa2v\xc6\x05\xb0j\xd6J\xb5\x10\x8a\xf5\
+\xa8\x0dV\x85(\x80\xcaS \x01\x1f\xe5\x1e\x17\x05'\
+\x7f\xd6\xf4\x9d\x9f\x07)\xcc\xf4\x93\x83&Y<\xf9\xec\
+\xccs\x01\xa8\xbb\xadH\xa2\x90\xfc\xe9\xe9,\x05\x94=\
+\xc4f\xa9}\x99g\xd3'\xc7~\xfc\xa8\xfe\x87\xb9M\
+K\xf7\xf9\xab\x11D\x8e2\xbc\xa4\x10N\xc2\xb6JU\
+?D1\xa86\xca\x02B\xe1\x9bC8\x12\xac\x9f}\
+\xe0\xe1\x8f\x1b\x7f&}\x88\x8bZ\x94\x15\xbd\x5c\xf9\x96\
+\xd4\xe1\xaer\xae&\x96\x0fu4P\xa4\x93n\x10\x9a\
+\xe0\xef\xd4\xc2\x87Lb\xb1$\x1dgL\xa8\x81\xe27\
+\xba\xc6$f\x0di\x09\x9d\xc8\x0c\x87.tg\xc4\x1e\
+\xaf\xbe/\x040\xdc5b\x94{\xdc\x10\xc7\x08N|\
+\x90k\x04\x82\xcex t\xf0\xe07\xcd\xbf\x5c\x98u\
+\xa6\xc6\x00\x93\x1fg\x80\x004#}\xd2;\x0d_\xf6\
+u\x94\x05y\x90\xa9)[B\xaa\x0b6>\x7f\xf4\xe3\
+%\xde\x0dA\xe2\xfaK\xcd\xb3d\x9c\x9d6\xe9\xc2\x8c\
+\xa9n\xc1\xce\x94\x88^\x8e\xe9\xd5\x84*D\x9a0\x8c\
+\x0c\xe4U\xc4\xbb&p\xec\x9a\xcaG\x1bC\xed\xb2R\
+J\x11lg\xa7\x8f\x1f\xe4(\xcf\xb7\xa4\xfb\xc8\xbf\xdd\
+_\xf9c\xf3\xaa\xdd\xbej\xfd\xa6\x5c\x945\x811\x0d\
+\xab\xa2\x03\xfe#\x8a\xbb\x19\x9b\x1a\xd6\x92vD\xbf\x8f\
+\x19\x8bc@\x92\x81.\x13\xbc@\x00\xb0&\x91\xd1\x8d\
+\xdb\xf4Iw\xb6\xc6\xa7LI\xb3d\xa0\x0a\x0b)\x1b\
+\x01\xc4\xd0\xb2\xd4\xb3\xb0Yj\xad\x0aT\xad\xf2\xac\xf8\
+\xa5\xf5\xfb6\xa9%\xdb\x9a[\x1f\xaa\xad\x0b\xd5\xe9\xbf\
+\xeaP\xa8\xe6\xc2\xf4\xe9\x0cT\x08\x07\x11\x81\x18\x10\x02\
+\x08\x0c\x18`O{\xb7\x9e\xb6n\x1a&\xb8\xd4\xb3\xe5\
+\xfa\xc3\x7f\xdf\xe7\xaf\x96\xa2]B\xf4r\xdf\xfa\xf6\x9d\
+\x9f6\xffL\x00\x03\x1c=\x05\x0c\xe7\xea\x8cQ\x90\xc8\
+:5\xd9\x8aI\xc4\xaf\xaf|\xaa:\xd8$?|V\
+\xda\x987\xba\xdf=\xde=\xa8\xdc^\x98g\xcd(\xb6\
+\xe4\x0c\xb1\xf7\xbc(\xf3\x94R[\xde*\xcf\xd6\x00H\
+\x80\xc4\x80^,\xbb\xd1\x0e\x82\xc2W#\xf8\xady\xcb\
+\x92\xb6\xed\x04tZ\xda\xf0\xfd\xbej\xd4\x15\xf9\x9cp\
+\x81X|\xadC\x89\xca\x88N\xd4\x13\xd2\x04(~\x19\
+\x11\xc6\xa3 h\xe7\x19p\x8c{|\xa6%[uv\
+PSC\x12\xf0\xfa`\xed\x01\xff~\xf9\xed!\x0a\xed\
+\xf7\xef]\xd0\xf6KK\xa89\x5c\x17\x8c\x00\x00^\xea\
+\xe8g++\xb6\xe63\xc5x\x11S9\xae\x0c\xb0\xdc\
+\xd6\xad\xc2V\x22(\xbe8,\xf7n\xb9\xab\xfa\xc5 \
+p0\x85rQ\x22Z\xdf\xb1s\x99g\xfdI\xae!\
+)\x82\x03\x15}\x16\xb9\xca*\xc3:\x8a;M\x04\x9f\
+7.\x9c\xdb\xb2L.`\xbb&g\xc6\x9d\x05\x97Z\
+\x90\xc9\xf8\x82&d\x1c\xa9\xa7\xa3pJ\xca\xf0_Z\
+V\xfa(\x04\x04\x83\x5c=\xca\xedyr\x22\x16\x09\xdf\
+96o\x9f\xef\xc8\xf5y3\xce\xcd\x18\xf7E\xd3\x12\
+\x82({\x85\x06\xd5m\xc7\x93X\x88\x0d\xbe\xe2\x8b\x0e\
+\xc4\xdd\xf4N\x84\xf1f\xc9\xde8\xe3N\xa2\x1f\x90_\
+\xda\x1cj\x90q39\x97\xaa\xc4\xed\x00\x040\xd09\
+\x1c\xc3\x19j\xd9%A?\x05b0\x0b\xfc\xa5m\x89\
+>L\xd1;\x0d.f\xb3\x80\xec\x8a\xc2a\x7f\xfd\xbd\
+\xb5/\x87\x88\x90Pw\x0dju F\xdc\xc2\x1e\x7f\
+\xf5\xd5\x87\x1e\xde\xed\xab\xd6\x85\xcc\x18\x8d\xe3Q\xe4\xac\
+\x17\x02\x11,\x1f5\xfdH\x88\x084+k\xea\x9f\xf3\
+\xce\x03$\xbd\xfb+\xdf\xac\x8c5t\xb7\xe5=\xdf\xed\
+\xaf\x22  >^\xf5\x1f\x9f\xa4 \xf1\x12\xb0\xf5\xde\
+\xddO\x96\x5c\xf3\x97\xbc\xb3w\xb6WF\x1c8\x88\xca\
+S\x99\xf3\xbe\x13zH\x18\x87\xc1C\xe6\x0d\x05\xc1\xbc\
+\x049)\xe5\xa4\xf5\x07\xc2\xb8B\x1a\x97\xfe\xa4\xb5J\
+\x01\xa8p\xf6)\xb3\xf7\xd2\xa7\xce\x15\xf2&A\x8eX\
+\xb0\xa0\xf5\x87\x00\x05\x869\x07\xfd\xa3\xdb\xe3\xf9bv\
+\xa3\xd4\xd8$5\x85\xf3\x0b\xeaW\x1d\x09\xd5]\x9c>\
+]@\x86(;\xf9\x8a9\xd3\xe7D\x19\x08\xb7W?\
+W\x1dh\xd0\xd6\xd7\xc9lSSN\xba(\xe3\xb4?\
+d\x9c13\xe3\xd4\xc9\xee\x91\x03\x1c\xe5.f?\x12\
+:\x1a\x22\x09\x00\xfc\x14\x9c\xdf\xb6jB\xea\xc84\xc1\
+\x85\x11X>F\xfbwr\xc8\x8f\xb8\xbb\xa3\xf2\xbd\xc6\
+\x1f\x81`\x5c\xca\x80G\x8b\xae#\xe2\xa8\x93\xd3\xf0)\
+T$\x02s,\xe9\x80\xb8\xd6\xbb\xd3\xc3\xfd.\xb4\x0f\
+q\x96\x03`}\xa8\xed\xb4\xf4\xd1c\xdc\xbd8\xc2\x7f\
+\x8e\xcd\xdf\xd5QE\x80\xa8\xafk\xd3\x17\x0eP\xd7z\
+?\x10#\x0d\x86\x8d\x97O\xc8\x84Y\x8c\xdcg\xb3\x9c\
+-\x19\xf4zF\x8d\x12\x04ybn?\xe7P\xcdA\
+\xd5\xa5\x10I\x22\xf2\x91o\x8fogm\xf0\xe8I\xae\
+\xa1\xa3\xdc#\xa7\xa7M\x1dh\xef[\x17<Z\x17:\
+\x16fg \x84H\x1a\xe8\xec\xd9\xcd\x92\xc7PM\xa4\
++\xda\x9d4K\xb3\xaa}\xdb\xbbM\xdf\xc9\xef\xb2\xa3\
+xM\xf6\xcc\x87\x0bn\x9a\x982\xba\xdcV\x92k\xc9\
+\xca\x14\xd3\x0b,9\xbd\xede\x93RF^\x9c1=\
+\xd7\x92\xbe'p\xc0+\xf9\xfd\x14X\xe9\xdd<#m\
+\x92\x88BLQ\x99^\x15* \xf8\xfc\xd6\xb5\xcb\xdb\
+\xb7dY\xdc\xaf\x95\xdcicb\x84\x9c\xa3V\x1c\xa8\
+Z\x1f\x22\x00\x18\xe2\xe8\xf9C\xeb\xf26\xc9\xb7\xab\xa3\
+rV\xf6T\x01\xd0)\xd82D\x17\x10H\x9c=\x5c\
+\xfd\x9e\x8f\x07\xc3\x1d\x8b \xb6\x80\xb1\x0b+\x9f\xe3D\
+<d\xb4\xe3x\x82\x02\x04q\xf5\x1b\x9a\xf8e\xa07\
+\xdeVf\x19\x9b2\x85\xf4\x1c\x06T\xf3b\x889\xd6\
+\xc2\xc5\xad?\x12\xe2\xa1\xc0\xa1\xd3\xd3O%\xa0\x1cK\
+\xd6\xd4\xd4\xc9\x15\xd6\x92-\x1d\xdb}\xe4\xd7>5\xcb\
+\x926\xd25P\xa9\x8bP\x81\x1c\xa6\x15\x11#\xfe\xfb\
+\xd8\xd7{\x03\xd5\x80Pj\xcb\x7f\xa9\xe4\xfe1\xee\xa1\
+2\x89L\xf1\x97tGN@\xec\xe3(;7\xfd\xd4\
+\x00\xf7o\xf5\xedk\xe5\xed>\xee\x1f\x932\x08#<\
+X\x0c\xd7~\xa9\xd6\x85\x88\xbem[\xb6\xd3w\xf0\xfe\
+\x82\xab\xfa9K\xe5HPu\xebHd\x16\x0bXD\
+\xb4\xc8.\x1dS\x11!D\xc8\x10R\x17\xb4\xad\xef\xa0\
+`\x0f[~/[\x91fB\x96\xb6n\xfb\xa2yI\
+D\xd1\x99\xd9\x8e#\x9ep~\x1eL8\x87fCj\
+\x8f\xb3S\xaa!\xa9\xde\x90\xb8\x1b'O\xab\xf9\xca\xb8\
+\xdf\xb7\x17\x81\x11\x10\x07$]B\x83\x03HDiB\
+\xd6H\xd7\xc9\x80\xb0\xcb\x7f\xf0\x97\x96\xdf\xb8\xa2Qh\
+\xb4{\xf8[\xa5\xcf\x8cs\x0fU\x0b\x12q}\xc7v\
+\x86\x8a\xc0`\xc4qE\x00\x14\x90m\xe9\xd8K\x00}\
+m\xdd\xdf\xe8\xf6p\xb1%\x8fi\xe4i9\xee\xd1\xc0\
+lT\xa0\x1f;Z\xfe\x927\xeb\xf9\xe2;R\x98\xfd\
+\x8b\xe6y\xc7\x82-\xa4b/\xa8\xe5<\x88\xf4\x15\xc7\
+\x8c\x09\xf5\xc1\xa6\x81\xf6\xb23RG3\xf5\x1c\x10\xc1\
+\xfe@\xdd\x0bG??g\xf7]\x83\xb6\xce\x1a\xb0e\
+\xd6\xb4\xdd\xb7>Q\xf3\xc1z\xef^\x00\x99<\x82\xd3\
+\xd3\xc6\xe6\x0ai\x04\xf0y\xe3\x12\x02\x81\xcb\xe7\x87\xb3\
+O\x1b\x17i\xc4\x04\x8aJH\xeb=/P\xb3\xf9]\
+V\xb4aV\xfa\x17\x9f\xef\x91\x94\x923\xd4@Q\xd1\
+\x01\xc5\xc8\xa9\x91\xb7\x84\x0a\x93\xa7\xbfch\xaa\x90)\
+\xef\xa2Z\x98AD(\x8bT\x81\xa5tY\xdb\xcf\x04\
+\xb0\xa5c\xfb\xc4\x94\xf1N\xe6`\x00\x0c\xc0\xca\xc4\xc9\
+)\xe3,\xc86vl\x03\xc0&\xa9\xf9\xea\xac\x0b\x80\
+\xb8\x1a\xcfG\x885'\xf6v\xe3\xd7\x05\x96\xecWJ\
+\x1ep0;\xe8\xb9\xc6a\xbe3\x97S\xb3\xfa\x9e\x06\
+\x85\xb6\x9cI)\xa3\x16\xb4\xad\xb61\xcb GO\xa4\
+h\xef5|\x93\x88\x80\xf0c\xcb\xd2?f\x9f]h\
+\xcd\x96\x9d\xf2\x0e\x1e|\xe6\xe8\xc7\x8f\x1dy{S\xfb\
+\xdef\xee%\x10\x00\xb1\x8d\xfbv\xf8+\xbfkY\xb2\
+\xce\xbb{\xa8\xa3W\xaa\xe0\x02$\x04a\xb9g\xeb\x91\
+\xd0\xb1\x99\xe9\x13\x1d\xccJ\x04\x07}uO\xd7\xfeG\
+\xeb%\x81\x06\xa1t$R\x8e]R\xaaa\x96\xff\x82\
+\x13l\x0bd\x86\x03%\x7f\x11&\x8f#d\x0aY=\
+\x1c}\xb5\x0b\xe4\xa4T\xf6\xc8\x7f:\x04\xb7\x8f\xb7V\
+\x06\xf6\x05I\xda\xde\xb1\xed\xf4\xd4)\x0c\x11\x11\x19\x01\
+!\x0d\xb4\xf7\xcd\xb5d\xac\xf0n \xa0\xd3\xd2\xc6\xa6\
+\x09.\xa6\xa1\xbd\x116S\xf8\xa2\xe9\xa7g\x8b\xef\xce\
+\x14R\xc3\xb9-5\xae\xd9\xd4\xb1ca\xeb\xea\xc5\x9e\
+u\xcb\xbc\x1b6\xb7\xef\xac\x0d\xd4\xdb\x05G\xa6\x90.\
+\x83\x88\xa9\x82kR\xea\xc8\x1fZ\x16MM\x1f\xa3\x06\
+\x83\x9aGC\x11\x99d\x84\xda@\xc3\xd9\x19\x13\xe4H\
+\xab!\xd4zm\xe5\x93\xcb\xbd[e_77;s\
+\xd4\xc8a\xbd{U PcS3 \xab\x096|\
+\xdd\xbc\xa8\xccV\xd2\xdd\x96\xdf\xcd\x96\xffq\xc3\xcf\x12\
+`\xb1\x98\xd9\xcf\xd9\x1d\x89=Y\xfb\xc9\x1e_u\xbc\
+\x8e\x1c\x11\xfch\x15\x5c\x88\xedo\xd4\x05^\x11\x1d/\
+\x08\x84I\xe2@\xb1@B\x9c!\x92:\x07\x10\x01\x10\
+[\xa5\x86I\xa9gID25B\x11#\x0ck\xa3\
+\x0a\xfb\x80\xb5\xdeE>\xeah\x92Z\xeaBG\xc7\xa5\
+\x8c\x921_\x94k!\x1c\xe5\x19B\xca\xea\xf6M\x93\
+\x5c\xc3\x0b\xad\xd9\x18\xc1\x94\x91M\x14\x10\xc3\x1c1k\
+\xa0\xa3'\xaa\xcc\x0c` \x11\xff\xbc\xe5\xc7\xfb\xaa\x9f\
+\xff\xa6e\xe1\x9a\xf6\xed\xdb|\xfbw\xfb+\xb7\xf8\xf6\
+-\xf7n\xfe\xaae\xde\x22\xcf\xeat1\xb5\xbb\xbd\x98\
+\x88R\x98s\x80\xbd\xa7\x93\xd9\x144G\xb7O\x91\x1a\
+\x00\x06:\xcae\xd9\xf5\xf1\xe0\xb5\x07\x9f\xdc\x1f8\x02\
+\x04\x83\x06\xf6}\xed\xa5g_~\xf6\x99Y\x17\x5cp\
+\xf1\xf9\xe7\xddx\xfd\xb5\x17\x9cw\xb6\xd7\xd3\xbam\xc7\
+\xce\x00\xe7\xf3\xdaV\xf7\xb0\x16\xf7s\x94\xac\xf5\xee\xaa\
+\x09\x1e#\xa43\xd3N\xda\xe9\xabz\xb2\xe6#\xa5\xaa\
+\x15\x0c\x09\xd2a\xdc5\xba\xb1D\x97A\x8bh4\xfe\
+\xc7\xd0\xeb\xc5\xe3\xd3@q&}\xc4\x9f\xe9\x14\x11\xc3\
+xy\xeb\x00\xe7\xb0T1SI9\x01\xca\x1a\x88\x83\
+VU!\xf4\xb0\xf7^\xe7YD\x00\x07\x02\x87B\x14\
+\x18\xee\x1a\x84@\x0c\x811@\x80\xfe\xf6\x8a6\xa9-\
+KL\xebn+`\xd1\x88\x84R\x8c\xd7\xddZ\x18.\
+\xd0\x00\xaa\x0c\x1c\xb9\xb5\xea\x89_[W\xf9(\xa4\xae\
+\xbc\xdc\xaf\x87\xe4\x1eV\x8dR\xdb\x82\xb6\xd5\x1b\xbc\xdb\
+\x87;\xfb\xbb\x04\xbbKtj\xed\xd3\xc2\xb2\x1fy_\
+\x88$ C\x00\x86\xf8h\xcd\xdb\xab\xbc;\x01\xe0\x8a\
+Y\x17\xfd\xf7\x83\xf7\xfa\xf4\xec\x89\x80\xc8\x10\x19\x02`\
+vf\xe6\xd9gN\x1f:d\xd0/\xbf\xfd\xd6\xe1\xf3\
+/l[7\xd65\xa8]\xf2m\xec\xd8\xd3\x10j\xbe\
+<\xf3\xcc\xdb\x0f\xbfR\x17l\x8d\x8b\x1bkM\x83I\
+?\xb2\xa5\xcb\xa6\xe7&5E\x14M\xb2\xe9\x9d\x10\xa0\
+\xe4\x9b\x17\xa3YB\x03\x10\x09\xa5\xfe\xce\x91\xd1d\xa0\
+0\xf6\x06\xe9\x96\xac\x0c!c[\xc7: \xd8\xe6\xdb\
+mG\xcb\x00g\x1f\x19\xe9a\x00\x884\xca5P@\
+\xca\x14R\x14\x8d\x1f\x99\xf4\xc6\x08\xf0\x86\xb6w\xec\xbb\
+\xa9\xea\xf1\xfaP\x0b\x002\xa0SO\x99p\xe7\x9c\x9b\
+\xee\xbd\xe3\xb6\xbbo\x9bs\xd9%\x17\x8d\x1d=B\x14\
+\xd8\x9e\xbd{\x89\xb06\xd4\xf8C\xdb\xa2~\xf6\xf2B\
+K\x8e\xe6\x8b\x84S\xc1\x11gH\xb3 \xb8\xb1}\xef\
+sG?\x01\xc4K.:\xe7\x8d\x17^\xb4X\xc4\x88\
+\x94\x87\xfa_\xcf\x1ee\xa7L\x9e\xf8\xf9\xd7\xdfv\xf8\
+\xfdk<\xdb\xc6\xba\x07/\xf5n\x0aR\xb0\x85\xb7/\
+h[\x1f\x0e\xe0\xe2;'\x84a\xae\x92\xca\x8a\xc1Z\
+R\x00\x00 \x00IDAT\xff0t\x9cNL\x09\
+uA\x1aU{\x91\xb3\xf3\xc6\xcf\xb0\xbbLx[E\
+d\x0f\x16\xbf\x9e\x22\xa4qP\xc81!\x22\x02\xd8\xd3\
+\xb1qi\xebw\x02\x8a)\x96\xf4|\xb1\xf0\xa0\x7f\xfb\
+\xe6\xf6\xcd\xf2\xb2\xdd\x95\x7f\xc3\xd4\xd4qLA\x0bI\
+@\x12\x81\xeb\x90k\xd4Q\x84H#\xcbr\x84C\x81\
+\xa3\x7f<\xf4`\x87\x14\x04\xa4\xc1\x03\xfb\xbe\xf6\xc2s\
+\xc3\x06\x0dF5I\xabp\x189\xec\xab<p\xc7\xbd\
+\xf7\xff<o\x01\x01\x8a\xc8\x9e,\xfc\xeb\xd8\x94\x81\xc8\
+\xc3=\x5c\xd0\xa0\x9f\x8c\xf2\xe0\xcd\x87\x9e_\xde\xbe\xad\
+wE\x8f\x15\x0b\xe69\xec\x0e\x88\xa0+ad\x1c\x0a\
+s\x7f\xfd\xe5\xe2\xcb\xaf\x96$>\xc4Y\xb1\xa9}\xaf\
+\xda6@>\x01dH\x922\xaf\xfd\xd2M\x8c\x00\xec\
+:\xde\x99Y\xbb\xcb\xe3\xc9\xe6&\xd9\xa9>9\xe8I\
+\xd7B\xc5\xc7=\xfd\x1c\xa3\x08\x91\x14\xd0\x15\x89p\xbd\
+g\xd1Z\xef\xe2c\xd2\xd1\xaa\xc0\xa1]\xbe\xadG\x83\
+\xb5ZG\xc2U\xde\xf5\x83\x9c\xbd\x0b,9\xb2\x12\x12\
+tdx\xa3\xcbP\xbe(\x04\xd2-\x87\x9f\xac\x0f5\
+\x03\xc2E\xe7\xcd\xf8\xec\x83\xf7K\x8b\x8bQ\xc7Z\x05\
+\xb5\x1dYfz\xc6\x85\xe7\x9f\xefNq,\x5c\xbcT\
+\x22Z\xe4Y{\x92k\xb0\xccr\xc4\xd8>\xbe2|\
+\x80\x80\x00\xb5\xc1\xc6g\xea>\x22\x82\xb7^{\xb1_\
+\xaf\xde\xe1xP\xbf\xa9\xba7\xf7,/\xaf9R\xb3\
+a\xf3\xd6\xdaP\xa3\xaa\xddd\x1dJ\xd1\x9da\xe3\x04\
+\xb5Q\xd2C\xc7\x1f%%J\x96%9e\x0c\xe3\xe7\
+\xc2\xb03_\x99\xe8E\x04@\xb8\xd2\xbb\xa0*x\x80\
+\x03\x11P8\x1d\xe6\x1e\xa7@\xff\x88\xf9\x96\xec\x14\xe6\
+\xd2\xae;D\xd2C\xd5/4JM\x0c\x88a\x98\x18\
+M\x11P\xbf\xbc\xae\x1a\x94\x02\x9f6\xfe\xb8?P\x0d\
+\x00gM\x9b\xfa\xef\xd7^u9\x1dzzN\x94\xfc\
+1\x86s\xfe|\xe3+/<\x8d@~\x0a\xdd]\xfd\
+B;\xf7\xe9lX\xc4\xfe\xa1\xda\xf8`\xb1w#\x07\
+\x184\xb0\xef\x19\xa7\x9cJ\xd1\x1a\x84b\x7fE\xa2\x87\
+\xee\xbb\xc7\xed\xb4\x13E|\xae\x9cX5\xe8\xc2\x16\xaf\
+p\x19\x93\x1e\x22v\x22\xaa\x08\x92\xa8\xb47\x1d\xc0-\
+\xfb@\x14\xb74\x1f\xcd\x07\xe5\x19\xbdE\xb5\x0a\x07\xfc\
+\xdbG\xb9N\x95\xb5\x89\xbc\xdfn!\xbd.x\xa8.\
+T\x0d\x80\xdd\xad\x85\xef\x94\xbe2#\xed\xb4\x81\xce\x0a\
+9c\xd5\xc6;\xf6\xf9\x0eLO\x9f\x04\xc0Yt\x17\
+\xbb0KZ\xfb\xee\x0e)xg\xcds!\x82\xee\xa5\
+E\xdf}\xfe\xa9\xc3n\x07\x84(\xc2V\xf4\xef\x08\x83\
+\xfb\x0fHKO\x99\xf7\xdbB/\xf9[\xa4\xd6\xf1)\
+\xc31\x1c\xff\xe8t\xa9*\xb4\x1f4\xfct P{\
+\xfb\xcd7\x8e\x1a>L\xf6\x99\x81b\x1c\xa0\x88\x18\x03\
+\x9dv{Sk\xcb\xaa\xd5\xeb\x0c!\xb5D{J\xfa\
+\x89\x99\x9dpW0\x19q\x89M'\xa0Q\xf6\xb4\x13\
+\xb9\x14\xd9\x84\xc5ol\x8e\xc9J\x0fF0\xb2\xbc\xbc\
+\xadI\xaa\x1b\xe4\x1c\x13\x22\xaei\x85R[\xaf5m\
+\xf3B \xd5\x87\x1aC\x10\x18\xe1\x1aZd-\x18\xed\
+\x1a\xf6\x87\xcc\x19}l%{\x02\x07\xdc\xccQj\xcd\
+\xd7\xe9\x05DExH\xef\xe6\x12\xc0\xe7M\xbf.k\
+\xdf\x82\x08\xef\xfe\xf3\xb5\xfe\xbd{\xeb\xa7\xbbD\xc4\x93\
+:n\xb5,)#\x87\x0e\xdb\xbdo\xcf\x8e\x9d\xbb\xf7\
+\xf8\x0fMt\x0d\xcf\x14S\xd1 \xedG\x80hE\xfb\
+?\x8e~\xe4\xe5\x1d\xcf\xfe\xfd\xf1\xac\x8c\x0cd\xba\x1a\
+G\xa3\x9a\x02\x05?B,--y\xf3\xdf\xef\xe8\xf5\
+\x15%I8\x8cj\xcd\x16\x06*\xd0 iw\xfcx\
+4\xc6\xf5\x87\xd0\xa4\xaa\xd5\xe0\x13\x98\x91*\x8b\x9d\x8c\
+\x97\x5c\xe66\x9c\x0aP\xfe[\xef]2\xb7\xf9=\x04\
+AKk\xb8\x85\xac\x19\x99W\xcb\x1f\xf4I\xe37k\
+\xbd\x1bd\xc9\x10\x00\xc6\xbaG\xfc\xa3\xdb=C\xdd\xfd\
+\xa2\xa6p(9\x89\xc8\xab\x14A\xfc\xb6m!\x00\x8e\
+\x1b3\xea\xb4)S\xe4\xa4Y\xec\xbcq\x8a-\xc7$\
+@\xc4g\x9f|\x22++]\x22x\xbf\xe9;\xb5\x11\
+Y\xb4-\x02\x80 \x85\xea\x83M\x85yy=JK\
+\x95\xe6\xa0\xe1\x8f\xa4\x18\x89\x0b\xff]\xd1\xbd\xc7\xe0\x81\
+\x03b\xf7\x0f\x934+f\xc4/4o\x10\x95\xd8T\
+\xc5\x9fjh\xe6\x97\x91\xc9'(\xafd1\x1a0N\
+!>%\xbe\x1a\x0a\xc3~D\x00\x84\x8bZ\xbf\xff\xa5\
+\xe5\x03\x04\x81\x83\xdct\x81\x86\xb9\xa6\x0cs\x9d,o\
+\xe5\x13\xb5/\xee\xf7WrU\xe88\xe7\x0e\xb0j\xf5\
+\x85J\xf6\x92P\xad\xdf\x0a\x9f\xf1\xbd\xfe\xaa\xca\xc0Q\
+\x00\xba\xfe\xda\xab\x18\xa0\x1e\xa0\x0b\xfb\x84d\xda\x02,\
+;#\xf3\x9e\xdb\xe7\x00\xc2omk\x1aC\xad1y\
+ %\x11U\x1bl \x80\xbe}z3dz\x95F\
+\x5c\xe7\xd9\xe9\xaa\xb8IK\x98\x01L8y\x8c\x02G\
+\xa1\xd6\xc9%\x19\xff\x05\x0d.D\xd7\xcd_g\xe3\xa2\
+\xccQ\xc2y#\x187\xe9i\xf8T\xc2\xf1d\xc8\xcc\
+\x13i\xf1{!%n\x89\xa7\x16\xb1\xc0\xc2\x96o\xbe\
+hz\x89SHV\xe9!\x90\xce\xcd\xbc\xa1\x87\xbd\xa7\
+\xcc\xd1\xb9\xbb\xfa\xb1}\xfe\x03\x14\xae]\x0fk\x8e\xf0\
+\xbe E1\xae7\xf8v\x02@Z\x8ak\xda\xd4\xd3\
+b\xc9\x84Q\xcd\xcau-\xaa\xc3\x8d\xe8\xaf\x9cuY\
+vf\xbaD4\xafu%\x85k\x0c\x01\xb5!=\x04\
+>\xf2\x03bvV\x96\x02\xc4\x10\x11\xc1Ws\xe7\x8e\
+\x988\xe9\xf4\xf3\xcf_\xb6z\x95\xc1r\xa9B;b\
+\xe8P\x04\x18\xe5\xee\x03\xc4\x8f'm`\xa6\xb6\xd0\x88\
+VMIVt\x98\xa52\xe2\x88\x8bY\x05\x99rt\
+Xb\xa78N5j|m\x19>\x8dl\x83g\xc9\
+\x1bG\xef\xa8\x0d\x1c\x90c,\x04ve\xce\xbd\xf9\x96\
+\x02\x00\xf0H\xbe\xdb\xaa\x1e^\xe7\xdd\xac_\x0c\x8d\x0e\
+\x8b\x91s\x0fe\xc1\xe2H\xbb:\x0e\x02\xe1\xf8\x93\xc7\
+8\x1d\x0e\xad\x05+b\xb8\xa61\xdc\xc9\x89\xf4M\xc5\
+\xc3\xbf\xd9\xad\xd6Y\x97\x5c\x08\x04\xcb\xbc\x9b\x22Zg\
+`x+8q\x22JKM\xd5\x9e\xfej\xee\xf7\xb3\
+\xffx\xc3\xf6\x1d{\x96,]u\xe6\xf9\x17/]\xbd\
+R\x0fP\xe9\x97\xb1WE9\x10\xf4\xb4\x15\xf7r\x16\
+\x13\xa9\x05\xde]\x93\x15\xc5HsF\x9d\x92G\xa3\x9e\
+\xbbf.>E\x8e\xfc5\x90-\x163F\xda\x0ct\
+\x8a\xbd\x0e2MqD:\x97r^\xfeh\xe0\xc8\x1b\
+u\xf7|\xd7\xfcF\x07\xb5!\xa0\x05\xed\x7f\xce\x7f\xb4\
+\xd0R\x04\x04~\x1e\xbc\xa7\xe6\x1f_4\xff\xcc\x88\xa1\
+\xd2\x9f*\xf2\x5c\x93\xa6\xca\x11\x00D`\xfb\xfdU\x00\
+0l\xf0\x10\xd0z\x97\xa1\xfa\x1b\x01\x00\x85$\xde\xe6\
+\xf5\x92&M\xa4\xd5\x89\x90Rv\x8fp\xc1\xd9\xe7\x00\
+\xd0:\xefv\xa6T\xa7(\x94\x0em\xabE\x10\x10\xb5\
+\x8b!\xaf\xcf7\xe7\xce{%I\x19,\xe7\xf7\x07o\
+\xbe\xed\xce\x10\x97@o4\xd5\x9f\xf4\xf4\x0c\x00\xde\x14\
+\xf2\x9e\x976^m\x8f\x1e=n\xcc \xfa\x89\xfd\x07\
+\x86\xfcR4\xae\xb6\xed4\x96hfp \xc9\xf1x\
+\xc9ti5K\xa9\xa0\xc1\x15\xa0\xb9k\x04\x00\xc4\xd6\
+z\x16\xfc\xa3\xe6\x86\xb9Mo\xd7K\xd5\x02X\xca\xec\
+\xbd\xb5\x14\xe9ku\x1f\x1c\x0e\xd6\xe8\xdbO\xa2\xbe\xe9\
+\x5cXS\x13#V/5\x22b\xaf\x8a\xf2pX\xa2\
+\x03i\x16.[6d\xcc\xb8\x82\xb2^c\xa6\x9c\xba\
+t\xf5*2\xc1>\x06\xf4\xef\x9f\x95\x99\x1e\x02\xda\x1b\
+\xa8\x8c\xc0\xb1T<\xc0)8\x90\xa8\xa5\xb5\x858\x07\
+\x82M\x9b7\xd5\xd5\x1d\xd3\x1d\x12\xdc\xb9s\xef\xa6-\
+[b\x1d\x10\x02`\x0c\x19CN|\x82s(\x12'\
+]\xf9\xbdQ\xe6-\x5c\xba\xcf\x90\x09\xc8\x18\xa2\xd2\xeb\
+\xd6x\x98\x0eu>\xfb\x99\xb0\x8f\x82\xe1\xc4\xf1\x04\xbe\
+\x8a\x18\xa9\x9d\xb03\x8d\xca\x8d.\x85(\x01\x06A\x10\
+\x04iE\xdb/+=?[\xc0\x12\xa0\x90f\x9d\xa6\
+\xa7M\xecf\xcf\x07\xce\xb5`X\x96\x0a\x8c\x0a\x0c\x09\
+$\xa4V\xc9\x0bD=\xba\x97b\xe4U#\xc0\xde\x83\
+\x07/\x9cu\xa5\xc7\xd3\x0e\x00\x9b\xb6\xec8\xf7\xa2K\
+\x7f\xfd\xfe\xeba\x03\x07\xc9\x9f\xa58L\x84\x80d\x15\
+\xc4\x81\x03\xfa-Z\xb2\xa2\xd2\x7f\xa4\xdcZ\xa4u\xf5\
+\xd4>.\xdf\x92\xc1\x00\xaa\xaak\xe4\xfd\xaeol\xa0\
+\x88\x88\x8b\x00\xd8\x86\x8d\x9b\x86\x0f\x1e\x1c3[\x0a8\
+\xe7\x9c\xc8\xcd\x1c\x85\xf6\xac\x02[V\x8d\xbfY\x8f\x1d\
+Q\x985\xcem\xe8t\x0a\xa9V\xe6\xb0\xa2S@\x11\
+\x119\x11\x22\x12I>\xee\xf1J\xcd^\xa9\x99\xa2\xbd\
+\x17\x8cl.\x98\xcc\xf6a\x5cc\x02\xc9\xf5\x04\x8e~\
+#3\xf7\xbd\xe3\xc7{&\xac\xfd8S\xa7\xb5>K\
+\x8a\x83\x84~\x0ai\xaf\xaa\xb0w\x9b\x93\x7f\x05r\xae\
+a0a\xaa)F\x98FD\x94 \x14\xa0  \xd9\
+\xedv\x85\xc1\xa7\xebZ\xf9\xe4\xb3\xcfz<\xedZO\
+\xa9\xf6v\xff\xdd\x0f\xfc\x8d\x88\x93\xae\x01\xbd&+\xe5\
+ee\x00X\x1blP\x1f\xd5\xf5\x80&\xe0\xc4\xfb:\
+{l\xdb\xb1\xdd\x1f\x0c\x00\x80\xcdb\xc5\xc86\x1a\x84\
+\xe4\x0b\xf8#\x13U\x8a\x06;R[\x0b\x80\x19\x82\x0b\
+\x88\x0f\xb0W\xc48\x0f\x84\x0c\xd3\xc4\xacb[\xbf|\
+[\xafT1\xcf\x8a.\x17\xb3\xf4\xb3\x15\x8ds\xf4\x1e\
+\xeb\xecU\x22\xa6s\x0aY\xd0\x9e.\xe6\x17X\xcb\x9d\
+\x82+\x86H\xac\x0b\x10\xe8DF6Cg8\xd1\xd1\
+\xfaP4r\xbf\xc9\xdc{O\xa4\xa2(^\x920\x9a\
+/\xa1\xb65q3\xc7\x93E\xb7\xdaAT\x02x\xad\
+\x87\xb4\x22K$\xd7\x05\xa3\xd6\x0d\x13\x18C&7\xb2\
+\xd4\xaa\xe8\xe5\x0f\x0f\x84\x02?\xfe\xf4\xab\x1eF\x04\x84\
+e+V\xef\xad<X\xd1\xbd\x87\xd6\x13]]z,\
+\xc8\xcb\x05\x22\x8f\xe4\x91\xb3\xbe\x18\xa6w\x10\x02H$\
+\x8dt\xf6\xdd\xd6pp\xc5\xeaU\x93O\x9e0x\xe0\
+@Q`\xc1\x10\xd7\xfa;#Pnv\x0e\xc4\xf0\xbe\
+\x08`\xf3\xb6m\x00Xn+\x04\xa4\x12kN\xe4\x0a\
+\x91[HK\x15\xf2d}#Ap\xbc\xab\xdf\xe9)\
+\xa3*\xac\xddB q\xe0\x80 \x82p4\xd8\xf8t\
+\xdd\x875\x81F\x04\xcc\x14\x0bX\xa8\xce#\xb5\xc4p\
+<Pw\xde\x927 \x18\xb7\x8f\x07&'v\xa4o\
+qG\xe6\x08\xb9\xd1@\xc9\xf8\x14\xda\x88\xd6\x7f\xfa\x19\
+K\xa8KW*?\x22\xb2\xa7\x8a\xe7\xe4\x8b\x99\xa8\xaf\
+3\xc7\xa8\xbe6\x14F;\x10,Lt2;\x01H\
+\x5c\x22\xdd\x87\x13@\xfd\xb1c\x8d\xcd-QZ\x90\x08\
+V\xafY\x1b\xf6\xa3@\xe3\xdf\x90 0\x00\x90\x90\xeb\
+`G\x0aw\xed\x03\x1c\x9f2\x18\x00>\xf9\xec\x0b\x22\
+\xca\xcb\xc9\x9d>m\xaa\xfe>\xad\x16\xcb\xc9c\xc7\x18\
+\x00ND\xcb\x96\xaf\x04\xe0C]\xbd\x00!\xdd\xe2\xd6\
+\xee\x0b\x912\xc5\xfc4!\x1f\xe4\xc6e\x14\xbc/\xef\
+\x92\x1br\xce\xeda\xcf\x970$\xf7\xb9\x16\x08\x89\xa4\
+\x1cK\xda\x05i\x13\x08$\x00\x89C(M\xc8\xb02\
+\xab\xb14P\x0c}\xf1\x84y\x1a\xc9Y\xa4\x04\x03\xe7\
+(&\xd8K\xc6\xb7\x8a\xf6)\xc9\x08\x14FU\xa2\x1e\
+,\xfc\xf3`G/\x1dq,\x9c\x85V\x0c\x8a\x96\xe2\
+R)\xe9\x8cC\x86\x90\x8a\xc8\xea\xeb\x8f\x85#+\x00\
+\x00\xf2x<\xa0\x16T\xeb\xbf\xad\xb9\xb9\x19\xa3\xcb\xae\
+\x08\x108'@\x10ADy\x5cP\xe4\x9cN\x00\x1a\
+d\xebUb\xcd\xfb\xf4\x8bo\x8e\xd6\xd5!\xd1S\x8f\
+<\x9c\x95\x99\xaeI\xe05W\xcd*\xc8\xcd\xa5h\xf7\
+\x9cZ\xdb\xbc?\xfc2\xaf\x97\xb5\xb8\xc0\x9a\xbb\xb5\xa3\
+ry\xdb6\xadKZ\x86\x98oE\x17\x07\x89\x80s\
+\x92&\xb8\x06\x0e\xb0\x97\x02q\x99S\x8eHL\xfe\xc7\
+@\x00\xd8\xe9\xafT\xc1I\xce\x81\xa7\x0ai1\xc1\x13\
+\x86\x9b\x17c\x97tY\xc4D\xbd\xee#\x94\x08K\xe4\
+^\xc5!\x03\x99\x03_\x94\x84\xcc# \xd0\x9dyW\
+\x9d\xea\x1e\xad\x80Q(\xb3`\xc3\x13IP\x9d\x93\x82\
+:>\x1a\x00\x840Xb\xcd\x03\x82\xbd\xfb\xf7\x87\xe7\
+\x87\x11\x01@nN\x0eCF\xfa)\xaa\xf2\xf02\x87\
+3\xb6?(\x11\xb5\xb4\xb6\x02@\x86\x90\x82\x8a\x87M\
+\xa8\x03!\x10\x81P\x9a\x9d5-\x10\x94\x9e|\xeey\
+\x22*),\x9a7\xf7\xebi\xa7O.\xeb\xd1\xed\xaf\
+7\xfe\xe9\xef\x7f{(\x96\xe3L\x04\x9f|\xf9y[\
+\x9b7\xc7\x92>\xeb\xc0\xc3\xb3\xf7\xff}\xb9w\xbb\xfc\
+\x94KH\xb3\xa0\x83\x94\xc6\xb5\x9c\x80\xef\xf6W\xfa(\
+\xa0\x8d\x8b\x959\x99\x16d\x8d\xa1\xd67\xea?\xff\xa9\
+u%\x02W{\xbeq\x0b\xda@7\x9d^\x87l\xc4\
+\x1bk\xdfyI2\xa4\xdf\x1b\x0fm\x12\xe3\xb6n\x88\
+\xef\x00\x19\x8e9\xc6x\x0d\x1at\xefc\x08\xf7\xe4]\
+wF\xfa\xc9\x04\x5c\xa1\xdd\x11\x12\x90\x08\xc8U*\x99\
+\xd6\xa5\x9b \xdc?C\x86k*,\xc5\x8bi\xd3\xba\
+\x0d\x1b\xe9JB]d\x92\x96\x9a\xd6\xa7w\xcfm;\
+vG`\xe2\xc4\x87\x0c\x1ed\xe0#\x10\xee;p\x10\
+\x00\x0a-\xd9\x11\x16@)\xaaE\x02b\x003\xd2\xc7\
+}\xd8\xf8\xd3\xbb\x1f~|\xf9%\x17\x0f\x1f4\xa4w\
+Y\xc5\x17\xef\xbf\x0f\xc8\x88s9=\x1f\xf5\x13\xe2\xd2\
+\x0b\xaf\xbe\x01\x80K\xbd;t\x1d`\x08\x01\x1c,\x95\
+\xcb\xf7\xab\xf2i\xab\x83\x0d\xd7\x1dzz\xbc{P\xb1\
+5\xc7\x01b\x80\x82GB\x8d\xdb|\x07\x0e\x06j\x81\
+\xe4\xe4-\xd7%\x89\xd0\x9c\x17JI\xa6\xfb\x8d\x9a\x91\
+\x83\xc9\x94\xe7\xc4f\x87\x99DMd\x92.I\xc6\xdb\
+7\xa6?\xa1\x0e\xf9p\x0b\xf6\xe7\x8a\xee\x9a\x96:N\
+s\x858\xd0\x12\xef\xfa\x95\xed[\x9a\xb9W\x8bMQ\
+G\x9e\xc0p\x13\x18\x02\xc0\x81\x8e\x0aD\xf8m\xe1\xa2\
+\x90\x14\xd2\x1f\x0a\x06x\xd9%\x17E\xa1p\xbdz\x96\
+\x0f\xec\xdbOI\xa4\xea\xaeM\x22i\xfd\x86\x8dD\xbc\
+\x9f\xab\x07\x80Z\x04\xa0\xb0\x13Q\x9d\xe8\x83\x02\xc0\x03\
+\x05W\x85$\xe9\xba\x9b\xe7\xb4z<j,\xa9\x97\x1e\
+U\xe7s\xda\xb2c\xc7\x05\x97_~\xb0\xb2J;P\
+\x0c\xa0\x87=\x07\x00m\xccAr\x8d.p\x22\xce\x89\
+s\x928\xf1v\xee\xff\xb9u\xf5\xbf\xeb\xe7\xbeZ\xff\
+\xcd[\x0ds\xbfo^q\xc0WK\x1c\x88$\x02\x89\
+@\xdfrR2\xc7\xdb\x92D\xba\xa3\xe2v4qW\
+\x0cP\xbc8@b\x22\xbd\x02d\xde\xae16m\x82\
+q\x1f\xa4\xde\xf6\x92wJ\x1e\x1f\xe6\xec\x07\x08\x0c\xa0\
+\x83\x07?l\xf8\xf6\xa9\xda\x7f\xa5\x0b)'\xbb\x07\xa7\
+\x09.Sh2\x5c\xdeL\xc3\x9d\xfdl(TW\x1f\
+]\xb4liDz\x1c\xe1\x86k\xae\x1e=rH\x98\
+\xb0\xc2\xf0\xb1\x87\xee\x17\x05\x01\xa23F\xb4c\xf7\xee\
+\xda\xda\xba\x22kv\xa1%\x8b!0$\xc6\x94ZX\
+\xb9\x91\xa3\xc0\xc4F\xc9\xb3\xbd\xe3P\x90B\xa7\xbaG\
+\xed\xd8\xb5\xf7\xda\x9bo\x0aI\x12Q\xd4n`H\xe2\
+\x0b\x96.\xfd\xc35\xd7\x8c\x9br\xfa\xaf\xbf-\x91-\
+\xb4\x05\xf0\x9c\xacQ\xdf\xf4\x7f\xe0\xe2\x9c\x89\x00 \xa0\
+\x85\x88\x13\x92*\x13\x5c\xe9\xce@\xe1\x96\xa4\xa4\x0eM\
+W\xff\xc9^\xa0\xd2\xa44\xc0\xfd\xca\x96Qb\xd7\xb3\
+\x939\x0d0\xf7X \x0e\x1e-&\xca\xb7%\x04\x94\
+\xe2\x09\x1eF\x86\x85\x02\xc2\x15Y\xe7\xcf\xce:\x9b\x01\
+2\x00\x01ps\xc7\xee\xdd\xfe\xfdSRO*\xb6\xe6\
+!\x10\x117\xbaX\x029!\x19\x8e\x92\xd0&\x8a'\
+\xbb\x87\xcck[\xf7\xca\x9boM\x19?Q\xd7\xea\x80\
+lV\xdb\xb7\xff\xfd\xe4\xc1\xc7\x9f\x987\x7faZZ\
+\xea\x1d\xb7\xdc|\xd6\xd4\xd3T3\x12\xe1\xa9|\xfa\xe5\
+W\x80\xec\xb4\xb4\x93\x82\x14`\x915\xbaM!\xef'\
+\x0d\xbf\xfc\xd4\xb2\xa2:\xd4H\xc4\x01\x10\x91\x01\xe0w\
+?\xcc\xbb\xe9\x8e;^~\xf6\x19\x91\x89\x04\xb4\xff\xc0\
+\xc1\x0d\x9b7-^\xb6\xfc\xd7\xdf\x16\x1c>\x5c\xa35\
+\xf0\xb32\xfcC\xde\x94k\x0a\xa6\x16[2\x08\xf8w\
+M\xab\x14\xa8\x88q\x00\xa6-I\xb8;5E\x1ft\
+\x0d\x5c\xd7+\x96\x0e\xeaH\xa0\xfb\x13o\x14%\xd1\xea\
+\x05\x92\x87\x97\x93$\xd5Cr\x15\xd4\xa8\x95O\xe8\xa7\
+Y\x10\x12C\x18\xef\x1c~}\xee\xe5\x85\x96,\x16\xe6\
+G\x91\x85\x89\x12\x0f1\xa5\x97\x941\xd2\xb0'xx\
+Y\xeb\xc6\x03\x81#\x0dR\x1b\x02\xa6\x8b\xee,!\xb5\
+\xdc^\x1c\xe4\xd2\x93\xb5\xef!\xd0\xdc/\xff;y\xfc\
+\xf8h\xf3J\x00\x0cI)t\xc6\xd8\xfc\x5c[\xbb\xb7\
+\xcf\xd0\x91\xcd-\xad_\xf6z\xa2\x87-W\xf7,\xfb\
+\xb2i\xc9\xd35\x1f\xf8HR[\xd7Gg\x1c\xbb\x15\
+\xe5;\x9c\xce\x03\x07+\x83\xc1 \x80\xa0\xbff\x0bc\
+\x97\xe4M\xfaK\xd1\x8c,\x8b\x1dQ\xc9\xa4=[\xf9\
+\xfd+\xd5?8\xd0agn]\xe1\xbb\xae\xd1\x95\x0a\
+Y\xa1\x8a|\x85\xa1-uh\xbaDR}\xe8\x18)\
+ \x03\xc5\x08\xc3\xf1Q\xee\xcd\x5c\xa2$\xb9\xd2a \
+1\xc9Vgq\x81\x01\xd4\x83\x85\x0a\x91\xc7\xc2\xd8x\
+\xf7\xe8?\xa4\x9f\xdd\xd3\xd1]6\xe1\x9a\x88!\xa0D\
+!4\xf6\xc5\x89\x11\xdb\xdc\xb1\xef\xc5\xba\x8f\xb7\xf8\xf6\
+\x12\x851$]\xc0\xca\x01\x18\x11\xfe\xe5\xd6;\x97\xff\
+\xf6KZjJ8N\x97\xbf\x83k\xfd,5\xb0$\
+\x9c\xf3|\xf6\xe5\x97\x9bZ\xda&\xa6\x0e*\xb3\xe7)\
+y\x01\x04\x02|\xeb\xe8\xdcWk?\xeb\xed,\x1d\x9f\
+:\xa8\xaf\xa3$Ep \x88!)\xd0\xca\xdb\x7fm\
+\xdd0\xafy-\x11\x1c\xae\xae\x05\xad\xfb\x9eN*'\
+\xa7\x0f\xbc\xbf\xc7\xa5\xdd\x1d\x99\x88\xc40\xdc5\xbd\x97\
+\xbb\x00\x08\x02\x10\xb0\xa9n\x00\xaa\xeb\xa3\xe44H\xaf\
+<H\xd7\xaaD\x0bK\xa8Ej\xa5(\x04NO\xb0\
+\xa5\xe3\x10\x170\x91\x152\x99\x13g '\xa2\x09M\
+$\x8e\xee2\xebS\xa6\x8f\xc4\xc0\xca\x84\x11\xce\xa1\xa3\
+\x5cCON\x19\x95\x228\x91\xb8D\x9c!\x10\x85\xab\
+\x01\xd1\x04\xaf&$\x01\x85\xb7\xea\xbf\xfa\xd7\xb1\xaf%\
+\x0d=$^\xe2\xc8\xce\xb4\xa6#2\x7f\xc8\xb7\xbf\xa3\
+\xa6\x83+\xc9\xa0\xfd\x07\x0e]y\xfd\xf5\xff}\xf7]\
+\xab\xd5\x1ae\xe2\x89(\xb6\xf2\x06\x08VoX\xff\xe2\
++o2\x80\x9b\x0b/d\x02G\xf5Loo?\xdc\
+\xc0\x1b\xbe\xee\xfbx\x85\xa3\x08PBuXL[\xd0\
+\xffb\xcd\xa7\x0b\x9b\xd7BX&\xb9\x13-\x19\xd6\xb4\
+\x1a\x7f#\x00dZ\x5c\x8fT\x5c>={\x08\x82Z\
+\xcf\x8fa\x8a\xc0\x94\xacAV\x06~\x1e\x0c\x91_@\
+\xab\x1e\x9b\xd0\x94\x09\x92>\x8a\xd5\x17X\x03\x00\xb4J\
+m\x01\x0a\xc6s\x1d\x10\x8c:0&\x94!4wm\
+)\x99\x11\x08\x08\xe0J\x22Y\x81\x89}\xed0vC\
+\x0f\x16\xde>.et\x88\x07\xe5\xcdW\xab\xbd@^\
+Y&;\xa9(W$+c\xc0\x11t\xe3\x91\x05\xf6\
+B\xdd\x87\xff\xa9\x9f\x07\x08H|tz\x9f+\x8a&\
+L\xcd\x1b\x92fw\x10\x05\x80\x88\x81\xc0\x19[\xd3\xb4\
+\xef\xcb\x9a\xd5\xff\xad^\xea\xe1\x01\xe0p\xda\xa9\x13\xdf\
+\xfd\xe7\x1b\x19)\xa9\x14^L\x83\xaa\x09\x22\xda\xb1g\
+\xf7\xb4\xf3/\xac\xafo\xfcc\xfe\xb49E\xe7\xa1\x8e\
+\xbb&\x80\xc0IB\xdd\xec\x03N\xc2\x0fM\xeb\x1e\xab\
+|\xaf1\xe4\x15\x11+\x1c\x85'\xa7\xf7\x1f\xe2.\xeb\
+\xef.u[S\xa6\xad\xbf\xa7!\xe8\x99\x94\xd1\xff\xf9\
+>\x7f\xcc\x12\xed\x88\xca\xbc\x06\x04MH\x14\xd5\xf7\xd0\
+\xde/\xdf\xaa\xfa\x15\x01SX\x1a\xa2\xa0\xe2>\xa4k\
+S\x16^d\x161\xee\x93ZB\xad>\x0a\x80\x06\xab\
+\xc6\xa9.#JD%\xc3\xb8p3%\xe1\xc6\x18\x08\
+PlO\xbb\xf8S2(ne*\xf4\xb0\x15\xdf\x95\
+\x7fK\x89\xad\x08\x80\xb4ZA\x99\xf8,\x970#*\
+uR\x82z\xc8P\x87\x1f\x7f\xd9\xb4\xe0\xa9\xba\xf7\x00\
+\xa0\xc4\x9e\xf5X\xc5\xecS\xb3\xfb\xa0\xc0\x19\x03\xb5\xd1\
+\x86\x8a\xd1p\x00\x80z\xbf\xff\x99}\xdf~px!\
+\x07*\xedV\xf4\xe2?\x9e\x9c:\xe5\x14\xd4s\x84\xf4\
+I\x0a\xa2\xb9\xbf\xfc|\xc3_okhl\x19\xee\xae\
+x\xaf\xef]\x02p\x8c\xb2\xbda&?\x848>p\
+\xe0\x83/\xea\x16W\xb8\x0b/\xce\x9bxj\xc6\xd0R\
+k\xa6\x84!\xc6\x90\x91p\xf5\x8e\x97\x174n\xf9S\
+\xb7\xd3\xee+?O>\x1b\x10\xf6n\xa2\xec&z\xa5\
+\xe0\xf4u\x7f\xdf\xed9\x82\x88.\x96\x227\x16\xd2\x0f\
+\xe9@=qU)\x10@?\xf7\xb5\xf16\x89\xb8\x05\
+1\xc09j\xe4\xdd\x88\xaa\xa7\x18\xe7/Y^\x22\xc6\
+\x05\xa3!Q\x02T\xa1\xdc8\xcdyC\x98\xb4\x14\x83\
+nh!\x10\x82\xc8\xd8\xb4\x94\xc9\xe7\xa4O/\xb5u\
+\xe3\x14\x90{\x8d\xc9\x92\xc4t\x15\x88,l\xecI>\
+\x8f\xd5\xc1\xa3\xb3\x0e\xdc\xeb'\xe9\xe4\xf4\xbe\xaf\xf7\xbe\
+!\xdd.2\x06L\x00d\xc8\x986\xfeOK\x1f\x12\
+\x00\x10\x87\xe5M\x07n\xdc\xfcV\x8d\xbf\x19\x01N\x1a\
+=\xfc\xea\xcbg\x9d1\xf5\xb4\xec\xccL\x22./q\
+H\x92\x16,^\xf4\xfa[\xff\xfae\xde\x22\x0e\xd0\xd7\
+\xd9\xed\xbd\xde\xb7\xa7\x89v\xa5{\x15F\x15\xea\x10 \
+\x868\xde\xb0\xeb\x95\x86P\xdb-\xdd\xce\x99\x90\xde\x17\
+\x05\x1dl\x8f\xb0\xae\xa5r\xe6\xe6'\xee\xe81\xf3\x96\
+\x92\xd3\x88\xa9S\x8f\x18\xa2J@\x89\x0e.\x88\x8e\xf8\
+=\x17mxn\x8f\xb7\x16\x10,`\xb5\xa1\xd5\xc2l\
+\x91\x11\xab\x22=D<@\xfe\x0e\xee\x0b\x81\x04@\x03\
+\xdc\xdd\x9e\xe8s\xe5\xf9k\x1f\x0d\xf2\xd8:\x90HC\
+\x93\xb8\xef=%1\x5c\xd7L\x9b\xc4>\x8e\x9a\x09\x03\
+\xf3\x91\x97\x9d\xa1ZF\xc1\x86@e\xf6n\xa3]\xc3\
+\xfa\xd8\xca\xbb[\x8b\xf3-\xd96\x14\x11\x19\x03\x92 \
+\x08H\x82\x9a\xce\x05\xc5\xa2\xe1\x1d\xd5\xcf/\xf6l\x18\
+\x97\xda\xef\xdd\x01\xb7\xd8\x18g\x02\xa0@\x8c\x01c\x80\
+\xba6R\xa0\x0eMUX\xb3\x1c\x9a\x82\xbe\x9b\xb6\xbc\
+=\xafa\x8b:S\x9c\x97v+\xce\xcd\xcd\x11D\xb1\
+\xad\xadm\xef\xde}\x81\xa0$;\xd0gd\x0e\x7f\xaa\
+\xe2J?\x04\xdd\x82\xd5\x86\xa2F\x0a\x88\xaa\xd3\x5c\xdc\
+\xbc\x8bP:5s\x10\x97=}\x0c_'!<\xb6\
+\xef\xab2g\xc1\xec\xc21J\xbb\xf1\x98Z.\x83\x04\
+\x0fA;\x97\x1e\xdb\xfb\xe5\xfb\x87\x17\x06\xd5J'\x01\
+E\x01\x04\x04&\xaf\x18\x07)\xc4\x83\x1c8\x01C\xa0\
+\x22g\xc6\x9c\xee3.)\x1ckA\x1c\xba\xf8\xae*\
+_\x93\xb9\x8e\xa1D>\x10\x99P\xc6 \xae\x8eI\xa0\
+\xd3\xf4>P\x1c\xdaG\x12\xe9\xb0\xc8h*jF\x8e\
+\xaa\x98\xc8\xca\xac\x22\x09vf\xbd4\xf3\xac\x0b3\xa7\
+c\x18\x1d\x04@:\x128v\xc1\xc1\xdb\xcaly\x9f\
+\xf5{ \xddf\x15\x05b\x021F(\x00\x222$\
+D\xa1&\xd0\xb6\xb3\xf50\x07\xea\x9dR\xdc\xcd\x9eN\
+\x14\x22u\xca&\xe7\xf8\xe3\xb1\xado\x1c\xfci]\xcb\
+^\xc2\xe8B,\x064\x22\xad\xd7\x9f\x0a\xcf8%}\
+\xc0\xee\x8e\xa3_\x1e[v_\xe9\xf9\x1cx\x0c\xd1$\
+<}\x971F\xa4\x8c\x97\xd7\x0dk\x05\x008\xeck\
+.ud\x02r\x1dva$C\xa4+?T\x0f\xed\
+\x81\xf6\xa6\x0f\xaa\x97|_\xbb\xb6\xb2\xbd\x9e\xf4\xe5\xd1\
+jkI7\xb3\x8e\xcb\xea\x7fA\xc1Ig\xe4\x0c\xb2\
+\xc8W\x82l\xd4\xd2\x07\x0ex\xeb\xcdw\x93\x80N\xa4\
+I\xb9aE\x17\x9a?\x15\x81\x03\x196\xf5%\xf3\x0f\
+\x8ag\xc2b\xc4(\x12MD\x9a\xe4\x1eyC\xce\xac\
+|KfXi+\xfd\xe3\xe1\xb3\xe6\x9f_\xa9\xff\xf8\
+\xb3\xde\x0f\xf7u\xe7YD\x12\x04\x12\x04@&k \
+\xf6c\xdd\xd6\x97*\x7f\xd8\xdc\xbc?\xa4\x9a\xc2A\xa9\
+=n.\x9b>=g\x10\x10'\x02\xce\xe5Y\xe3\xac\
+\xba\xbdyy\xe3\xae\x9d\xed5\xad\xc1v\x0e\x90\x228\
+z\xda\x0b\xc7f\xf6)\xb1f\x1e\xf47\xfe\xb3\xfa\xc7\
+\x9f\x8e\xad\xf9z\xd8}\xddm\x99\x11\xad\xe4\xf4\x85\xa6\
+Z4\x84Jo{\xd4\xf5wP\xc6\xe8\xb2\x08\x94 \
+\x06>5\x12)U\x81\x12\x07\x02V\xd5\xd1\xbc\xcds\
+\xb8\xaa\xe3X[\xc8\xffe\xed\xea\xdd\x9e#C\xd2K\
+\x9f\xee7\xab\xaf\xbb\xc8\xa6\x1f\xe2\x01\x84 \x0c[t\
+\xf7a_S\x5c\x09I\x1e\x0a\x22\xf3\xee\xbe\xf1\x19\x89\
+\xd1\x8f\x88q\xdb\x04'\x9d\x84\x8f\xff\xbc:\xf0\xb1\xbf\
+\xbd\xe2\xa6\x9c\xab\xfa\xd8\xcb\x098\x91V}\xa1Q\x05\
+\xa9:x\xf4\xc6\xfc\x99=\xed\x05Zl)?\xcb\x89\
+\xdd\xbd\xf3\x93\xf7\x0e-\xd4\xf3\xc4$\x80\x0d\xad\x07\xaf\
+\xd9\xf0\xca)\xd9C^\x1exU\xba`C\x00\xc6\x01\
+\x80\x17\xd9S/(\x18I\x5c\xc1\xb6\x19C \xb6\xd3\
+{\xf4\xa6\xbd\xff\xfe\xbe~e\x9a\xe0z{\xc0M\xe5\
+\x8e\x0c\xae\xcb\xa4\x93\x8e\x94\x1a6X\xa0\x0dJ$\x9d\
+\x93\x12\x9e4\xa6r\x9c)r\xfdU\xb2\x99A\xc7\x0f\
+U#3@\xe2%\xce\xd4\x12g\x7f\xf9\xc9U-{\
+w{\x8e\x9c\x95?|P\x8a<\x09\x8f\xeb\xda>\x82\
+\x97KG\xfd-&\xf1\x13E\xb40\xe94r\x08F\
+\x9d\x81\xcc\xe6\xf1R\x9cTF\xfc9\xbf\x18\x17h\x82\
+\xa8\x9a7\x8c\x9c\xc0\x97\x228\xff\x92{\xc5\xa9i\x13\
+\x80s\x1e&$D\x13z\xfb\xd8\xcb\xce\xcd\x1eC \
+\xc9\x93*H\x9d{\xf8\xc4\xfeo\xdf;\xb4\xc0\xc0$\
+\x13L\xcd\x1d~M\xd1)+\x9a\xf6L\xcb\x1a\x04\xc0\
+5\xca)\x12\x12\x03\x9fD-\x92ocs\xe5\x7fj\
+\x16\xcdo\xd8\x84\x08\xa7g\x0f{\xb4\xd7\x1f\x0a-n\
+u\xb2\x0fF+P\xb5\xf1f\x84[\x1d\x164%4\
+\xc7\x08q\xd0\xf8\x142\x9b^\xe4\x14$\xb3\x9d\xc3h\
+\xda\x8b<cx\xb7\xa7\x0a\x91\xc6d\xf4\x144?K\
+[H\xc4\x1dm\x87\x83\x11D\x8e\x18\xd1I6\x89\x81\
+\xe6)\x0bJ\xce1\x8ax\xbb\x98\xc4xDH\xb6\xb4\
+9\xaa\xae[9\xd64\xca5\xe8\xf6\xbc\x1b3\xc4\x14\
+\xb9\xab;\x851z\xd2PWy\x92\xd7\x99i\xe3@\
+\x9e|\xa0\x8bI7yj^\xaf\x9cK\x11\x9f\x1e\xbe\
+\xc2\x9f\xeb7\xb4\x05\xbd\xaf\x0d\xf8#\x91\xa4\x11\xe2e\
+\xce<\x02CF\x1b[\xf6\xaeo;X\xe0\xc8\xb8\xbd\
+\xfc\xdc\xb3r\x86\xf6v\xe4\xf2\xb07\x12\x83\xe2c\xf4\
+]\xe8\xfafi\x18\xb2\xa1\xa3\xa8\xa4\xad\xde\xaaZ\xfc\
+z\xe5\x8f\x9f\x0c\xbf\xb5\x973\xdb\xd8+\xa4\xa8\xe1\x1c\
+@D\x95\xbe\x86Z_\x93\x83Y\xfa\xa7\x94\x90\x0a \
+i\xd5u\x00\xf4[\xc3\x16\xd3\xa9\xf2\xb1\xa5B\x14?\
+[I\xe6\x0d\xcb(\x09\xfc/BT\xc4D\xad\x18(\
+Y\x13\x16\xa3\xa7\x01H@\xbc:\xeb\xe2\x8b3\xcf#\
+\x90P\xddZ5M\xa8B\xb1\x0a\x1b\x99tx'*\
+5\x89\x04\xc0\xe1\xcdC\xbfJ\x00\x02\xd2\xb9\xb9\xa3{\
+\xbb\x8b\x9f\xdc\xf7\x15E\xda\xe8\xe5M\xbb'\xad\xfc\xdb\
+\xd3\xfd\xae:;k *C\x01\xe5\xf8\x9d;\x04a\
+z\xce\xc0i\xd9\x03\x89HGO\x8b\x80|4-B\
+\x10\x01\xcb\x98\x04\x04a\xc4NE\x0b\xa1\xce\xef=\x12\
+l\x1e\xe2\xeaF\x8c\xef\xf2TWw4\x1d\xf0\xd4\xf6\
+vd\x19Ge\x11\xe6B\xf6\xd1\xe1\xe7\xa3\x9b%\xc2\
+\xb1Y}\x5c\x9a\xef\xaf=\x8bH\x9c\xfd\xb7j\x99\xd1\
+\xce\x90\xee\xfa\x08b3\xc6\x89\xf3\xdef\xec\x1f\xb3\xe4\
+:\x19\xd29\xc0|<j\xe2Y\xf1\xb1ZG!\x01\
+2\xeb\xc3\x85\xb7_\x98y\xae\x04\x12\x85\xcb\xb6\xa2\x07\
+\xa8\xab\xa5\x7f\x9aw\x83D\xfau\xb0\xfc\xda\xb0.S\
+t}4d\xce\xeb\xfd\xaf:;o8\x84\xfb\x8a\x85\
+\x7f\x9aC\x1d\xd7mz\xf5\xf2-o\xec\xf77\xa3:\
+\xc7K\x1d\xf0\x04\x0cQ`j+\xf1\xa8\xc2\x06}\xf4\
+\xa4\xcb?h\xf5X\x06=\x04#\x87t#Z\xce[\
+\xfb\xcci+\x1e\x9b\xd7\xb4\x1d\x09\x9f\xe8s\xf1\x9a\x09\
+\x7f\x9f\x963\x88\x22\x0a$\x8d\x0f\xa6\x92\x13a\xec\xc3\
+\xaaE\x800-W\xeb\x94\xad\xb8\xce2\xd3\xf2\xcb\xa3\
+k\xaa|\x8d\x14\xab\x0b\xa2F\xc2v\xba\xc9}\x9cj\
+\xe3\xa8\x9aTS\x11\x14\x93H\xc0b\x5c !\x86\x86\
+\x82\x00\x00Nf}\xb2\xf8\xc1\x9e\xb62y\xe8#\x01\
+p@\x86@\x80,r\xc2\xb6zjP\x9b\xb0\xae\xfe\
+C\x22\xda\xe69\xe4\x16\x1d\x9f\x0d\xb9\xa3\xa7#\x93\x13\
+/\xb2f8\x99\xc5+IZ{p\xa5C\xbe(\x06\
+\x82\xc1_\xeb7.j\xdcry\xd1\xa49=\xa6g\
+\x8b\x0e\x0c\x13=I\xf3QP\xd7\x0e5\x8a\xf9\xaa\xcb\
+\x5c\xea\xfe74\x9ca\xef\x15\x08x\xbf\xd4\xd2\x96\x90\
+\xb7\xc4\x91M@V\xc4\x12{:\x01G\xa3q\xf0Z\
+-\x17\xe9\x9aq\xcd\xad\xdf\xbc\xd3S\xed\x16\xac\xe7\x17\
+\x8cTMp8\xa6j\x0b\x85\x1e\xdf\xf3\x856~/\
+q\xb2\x0b1\xe6\x90&\xe4\xad\x1a\xda\x998#+\xc3\
+\x1a\x8b\x99\xf8\xe4hnNc\x86\x92\xeaY,\xaa\xf4\
+<[\xf2POkY\x94\xc2Q\xbb\xb0\xeb\xa7\xd3\x10\
+E\xf4\xd8E\xc5~\xa9Ed\xfb|G>\x18p[\
+\xb9-K>\x8ev&\x16\xd9\xb3\x144_\xb7\x96\x17\
+_x\xee\xe7\x1f\xbdS^V\x1a\x90\xf8\xbf\x0f\xcf\x1f\
+\xb6\xe4\xce\xbb\xf6|\xb6\xa7\xa3I\x1d\xdc\xa3D\xe1\xe1\
+\x19M\xda\xf7)\xb3}\x08!A\xe7\x1d\x8a\xd1\xb2\x0a\
+\x9b\x9f\xa4\xb7\x06]\xb3}\xca\x8b\x15\x8e\xecpi\x0d\
+E\x0c\xd2\x04\x9d\xb5AB\x0a\xb7\xeb\x00\x1f\xc1#\xbb\
+>\x07\x80\xabK\xa6:Q\xd0j\xaf\x95*5\x09n\
+\xdd\xf6AuG3\x12\xea\xb2\xfb\xd1\x02\x13\xcdh\xc0\
+\x84u9qF\x17\x929G\xd1@\x18b\x1b\x8dc\
+\x22{\x195\xa4-\xb2\xb11\x82\x05\x85\xc7\x8b\xef\xad\
+\xb0WD\xcf\x8a\x89\xf2\xb0Q.\xbeTak\x04\x04\
+\x90;\xfd\xca5\x09\x8c\x01\x22\x14Y3\x8b\xed\xa9,\
+\xdc'\x88\xafk;\xb4\xc3S\x15\xc5\xfb\x9e4~\xcc\
+uW^u\xcd\xec\xd9\xee\x14\xc7\xc6M\x9b=\x1d\xbe\
+M-\x07\xde\xabZ\xb0\xdeS\x95nM)\xb5\xe72\
+\xe4*\x9c\xa3\x0f\x85\xf4 `t\x9bVuLGT\
+\xa6\xcc\xa0\xdd\xb2L\x8f\xd7\x1e?\xe4kzf\xff\x8f\
+}\xdd\xc5\xa9\xa2-\xac\xd8\x8c\x8b-\xd9]\xbb>Y\
+\xdc\xb0=\xcf\x96\xf6\xe6\xa0kmL\xd0WP\x12\xb1\
+G\xf6}\xfba\xd5b\x15\x18\x88n\x22\xad\xe6\xa5#\
+O=\xc6\x17#\xa3\xee\xa8\x09Z\xaf\xc43\x87f-\
+\xee0\x99\x9a \xa3\xe0\x8bn\xce\xbb\xf6$\xd7\xa80\
+<\xa7c\xc3#\xa0\x1d\xadG\x82\xb5\x1b;\xb6,\xf2\
+\xac\xf0A\xa0\xd8R\xa0\x9b\xef\x8dJ\xe7\x0e\x86(\x13\
+L\x91l\x82\xc8\xe4!\xa6\xaa\x90\x1d\xf27/j\xdc\
+\x16urF\x0d\x1f:u\xd2$\x8b(\x8e\x191\xf2\
+\x8a\xcb.e\x8cV\xac^G\x80\xfb\xbdG\xbf8\xb2\
+\xf2\xbf\xb5+\x9a\xa4@\x89#7]t\x822\x05Q\
+kI\xa5\x8beLz_k\x5cv\xc3\xf1i\xd1~\
+,\xc2\xfc\xc6\x1d\x0f\xef\xfelHZ\x8f~\xae\x02\xcd\
+\xc9\xc4H+&\x7f\xea\x1b\x87\x17\xbd\xb8\xff{F\xf0\
+\xfa\xe0\x1b\xfa\xbar\xc2\xe3\x81\x09\xbc\x92t\xf3\xf6\xf7\
+?\xacZ\xa8\xef\x8d\x14\xd5\x85\xcf\xca\x84\xc9\xa9\xc3'\
+\xa6\x0c\xe9\xef\xe8n\x17\xac\xb5\xc1\xfa\xc8\xa01\xe1\xf6\
+%d'\x9aO\xb6\x88\xf4\x81bC\xbb\xd8\xceg\x14\
+_\xaa\x10\x81\x80\xa6\xa5N>-\xe5\x14\x89s-\xd6\
+B\x00\x01\x856\xa9m]\xc7\xfa\x0d\x9e\xad\xab\xda\xd7\
+7Km\x000-m\xc2\xe5\xce\x8b\x89$\x0d@A\
+$N\xc0\x089\x11'\xe0\x84\x9c3\x86r\x0e\x1a\x99\
+\x0a\xf8\x0fM-\xd5\xc5R\xcau\xd5\xd6\xd5\xa9\x12\x86\
+Y\xe9\x193\xcf>\xe7\xb9\x97_\xd7.\xad\xaa\xa3\xf1\
+\xb9}\xdf=\xbf\xff\xdb\xa1\xa9e\xe7\xe4\x8d\x98\x917\
+\xbc\xd8\x9e\x06\x9ck\xda(\xbcC\x86\x80\x1cE\xf75\
+\xd0^\x1d\xd5v^\xfe\xe5\xfc\xbc\x11}\xc7\x16\xf6r\
+\xe6\x9b\xa7\x16\x88\x13{\xb5r\xfec\xbb>\x05\x80\xbb\
+{\xcd<-\xab7p\xce\x01\x10\x84c\xc1\xf6oj\
+\xd7\xbe\x5c\xf9\xc3\x91\x8e&\xd45\x82\x0d\xf7\x99F\x00\
+\x84\x11\xae^\x7f\xefvc\x86\x5c\xf2L \x00\xab\x0f\
+\xb5\xbeU\xff\xf5\x17M\x0b$\x0e\xd1m\xd4\x12\x87c\
+\x86d/2o\xfb\x12M\xe7\x80D\xa9\x908\x17\xa0\
+lC\x89\xb5\xe0\xc5\x92\xa7\x05\x105\xc0\xd6\xcb\xbd+\
+\xbc+\x16\xb5\xad\xd8\xd2\xb1]\x92\x1dh \x00\x9a\x9e\
+:qN\xdeu\x9a7\x84\x00\x08\x5c\xa6\xb5\x8b\x02\x89\
+\x8c\x8b\x8c\x8b\x02\x88\x22\x89\x8c\x8b\x02\x09\x8c\x98<6\
+\x17)\x04B\xd9\xa2\xebC\x14\x11{\xf6\xef\xdbk\xcd\
+\xa2\xf9Z\x17\xb0\xcb\xae\xfd\xd3W\xdf\xfe\x08@S\xa7\
+L8i\xd4\xc8\x0f?\xfe\xf4`\xe5aR\xfdu\x01\
+q@J\xe9\x199CN\xc9\x190\xc8]\x82\x10\x0a\
+\x075\xa4/\xff0\xf1 \x8c\xc0\xfd09\x00u\xe0\
+\x80\x0e[U\xe7\xc8\x22\x025J\xa1{\xb6\x7f\xf4U\
+\xed*\x22D\xa0\x93\xb3\xfagYSD\x14|<\xb8\
+\xbf\xbdvO[UH\xab\xd0'c\x0e\x8e\x8d\x09\xf3\
+\xfa\xbd\xeaB\x8b\xd2\x8dF\xed\x8d\x85\xc4\x16{6\xdd\
+y\xe8\xd5\x00\x0f\x91Y7\x8f\xc4qY\x1c^a4\
+\xc1#*\x99\x8aI\xf8\x5cQ\xce\x9a\xda+\x0f\xe1\x1f\
+\xdd\x1e+\xb3\x95#\x81\x88\xc2>\xdf\x9e\xafZ\xe6.\
+k_\xa9\xb1X\xb4#t\xb2{\xf8\x83\x85\xb7)\xb3\
+\xb8\x89dZ(\x80\x5c\x91\x09\xb0\xb8b\xf1\x00\x00 \
+\x00IDAT\x02\x92 p\x91\x91E Q Q\
+\xe0\xa2@\xa2*@\x8c\x01\x03\x98\xb9\xf1\xa5e\xcd;\
+\xd4\x1c\x1a\x01\x80\xd5&\xec\xdf\xba)3=\x1d\x88\x16\
+._6\xe3\xfc?H\x04@0l\xe8\x80%?\xff\
+\x18\x92\xa4E\xcb\x96~\xf8\xc9\xa7\xdf\xff\xf0S\xbb/\
+\xa0\x9dND\xc8\xb1\xa6N\xc8\x1e0>\xad\xf7\xf8\xec\
+\xde\xdd\x1c\xd9\x9c\x07PW\xd7j\xb4rHf\x9b\x11\
+\x19u\x84k\x22u\x94\x0e\x09\xd8G\xd5\xcb\x9f\xda\xfb\
+e]\xc0\x13U\x91(#UZWr\xd5\xed1\x86\
+\x0f\x878{\xfe\xbb\xfc\x1e\xd0ph\x8d\xd9\x02\x04\x00\
+K<[\xe7\x1c|>\xa2UV'j\x0e\xc9<\xa7\
+n\xf0\x88\xe6\x03%\xe9\xfd\x18%\xe1\x11\x00\xe1\xb4\xd4\
+\xc9S\xd3O\x17\x88m\xf5m{\xb1\xee\x95\xf7\x9a\xfe\
+{\xd0_\xcdI\x0f\xf9#\x00\xf5\xb5\x97=Zx\x97\
+\xa0\x9b\xf4\xac\xe7`\xc9\x1e\xb9\xec\xf4\xc8n\x90\xf6?\
+\xa2Z\xef\x87p4\xd0\xb6\xb4i\xa7\xfe*$N}\
+z\x95\x0d\xee\xdf\xbf\xb1\xa5e\xe6\xac\xcb\x9a\x9a\xdb\xe4\
+\x0f\xf4x\xda\xee\x98\xf3W\x01\xb1\xac\xb4\xfb9\xd3\xa7\
+\xdfx\xdd\xb5\xddK\x8b\x7f\xf8\xf9\x17\xed\xea\xbdR`\
+{[\xd5\xcf\xc76\xbeY\xf9\xeb\x7f\xaa\x97n\xf7\xd6\
+5\x06\xdb\x1d\xa2#\xd5\xe2\x12\x81\x11\xf0hoB?\
+\xc6\x8b\x0c\x1a\x04\xeb<\x10m>4\x01\xb1\xba@\xc7\
+\xfb\xd5\xcb\xfe\xbc\xe5\xadO\xabWz\xa5\x00\x02\x0c\xe8\
+\xdf\xfb\xf1\xbf\xdd\xebv:\xb6n\xdf%gH\xc8(\
+\xfc\x8e\xedP\x81\x88y\x96\xb4\xf32'\xaakF\x11\
+C?\x08Jmy-\x92g\x9bo\xbf\xe9d\xa0\xc4\
+1\x1a&\x99\xcd\x10\x8f\xbbEy\xe4\xa7\xb0\xcbr.\
+?\x148\xf4^\xfd{\xeb\xbd\x9b1\x1a\x1dP\xc0\x8d\
+\x0c\xd1\xfd`\xc1\xed\x0cD\xd9\xe5\xd1Q\x96\xe5\x01\xf0\
+\xca[\xb4\x82(\x89#\x22p\x15\x02\x14\x14\xfe\x1dM\
+\xcd\x1c\xf8\xe4\xfe/\xd4\x01o\xca\x96\xbe\xfc\xc6?\xc7\
+\x8f\x1b\xf7\x97[o?XY\xa3\xad\x85\xc7\xe3\xdd\xbd\
+wo\xaf\xb22y\x85]\x0egUu\x0d(Lx\
+\x1a;z\xe4\xe6\xad[\xbd\xed>\x22\x00d\xd5\xbe\xe6\
+O\xaa\x97|R\xbd\x14\x80\xd2,\xf6\xfe\xa9\xdd\x87\xa4\
+\x95\xf6u\x15\xf7q\x15\x95\xba\xb23D'P\x88@\
+\x8am\x89D\xca1 e\x98=\x11'\x12\xd0\x12 \
+\xda\xe5\xa9]\xde\xb4\xf3\xa7\xfaM\xab\x1aw\x04\x95\xdc\
+\x1e\x16\xe6\xe7\xdc\xfe\xd7\xbf\x5c5\xeb2\x9b\xc5j\x11\
+\xc5\x8f?\xff\x86\xe2\xd2|b\x1d\xb2\x9d\xbeJ\x22\x06\
+ \x11Em\xb5\x9c,\xa2\x1b\xb2/\xf8\xaeyi;\
+\x05N\xa0\xdc9\x99\xea.\x14c|d2\xc2\x8b\x0c\
+=\xac\xb0\xd6\xce\xb3d\xbfW\xf7\xee\x02\xcfb\xae\xa3\
+8\xc7\xc2Esr\xafOc\xa9Z\xb2\x22\xdc\xbd\x14\
+\xc3CG\xe5!\x18\x12\x11#D\x02N$\xc9\xf32\
+9 \x12\x03\x22\x82\xde\xae\x82n\xf6\x9cC\xbe\x06%\
+\xedH\x80\x00[\xb6\xee\x1a0b\xac\xc4y\xb8R\x1e\
+\x81\x90-\x5c\xb2X\x16 \x00\xdaw\xa8\xf2\xc5W\xdf\
+\xd4t\xc4\x8b\xcf<\xd9\xbd\xa4d\xed\x86\x0dK\x96\xaf\
+X\xb6r\xe5\xcaUk\xfc\x01\xb9\xce\x15[\x82\xfe\xe5\
+\x0d\xbb\x967\xec$\x00\x06`\x11\x84t\xd1U\xe1.\
+(\xb4g\xe5[R\xb3\xad)\x99V\xb7\x03m.\xc1\
+&2\x11\x88\xfb(\xe4\x93\x02\x01\x1el\x96\xda\xeb\xfc\
+\xadU\xbe\xa6\xfd\x1dG\xf6yj\xdaB\x01\xbd?\xda\
+\xbfo\xefk\xaf\x9a}\xd9\xc5\x179\xad\x0e\xf9\x1a\x0f\
+T\x1e\x22\xcdZa\x5c\xb2\x98.k\x1d \xbe\xca\xbb\
+u\x94\xabox\xae\x18\x11\xea\x92\xaf.\x8b\xed\xdc\xcc\
+\x09\x1f\xd5\xcf\x8b@\x17\x93LD%\x88\xf9#\xac\xba\
+\x08\xd1\xc9\xdc\xa8\x16yd\xd24O\xcf\x82\x83\xea@\
+]u\xb0NW\x97B\x11\x05\xc9\x08\x004\xc5=v\
+\x94c8\x07)\x8a\xff-\xeb!\xd9\xfe3B9\xd3\
+\x89\x1c9\x93\x0b\x80\x91#*\x89yR\x88\x88\x08\xfc\
+\xf4\x9c\xa1oU\xcf\x03I\x8f\xd9\xa2$Q4\x1b\x87\
+\xe0\xfb\x1f\x7f\xfe\xd3\x95W\x01Q0(]\x7f\xd3-\
+\xed\x1d~\xf5\x19\x5c\xbeze\xff\xde\xbd'\x8e\x1d;\
+a\xcc\x18\x22\xf2\x05\x03'O\x9d\xb6s\xd7^}/\
+zy_\x03\x9c\xd7\xf9\xdb\xea\xfcm\x91v\x0a\xa3q\
+\x5c\xa5\x8a\x0c#S^\xe1\xcd;o\xc6\xf4\xebf_\
+\xa9\xc0\xe1\x04D\xb4b\xf5\x1a#\xf7\x9c\xe2\xcfF\x22\
+\xa2\x9fZV\x8et\xf5\x8b\xc68Q\xeb\xd7\x01SS\
+G\xff\xe7\xd8\xbc\x98\x8a\xc5\x13!\x9a\x19 \x90,\xae\
+\xd3Cq\x19B1\xdc\x8a\xa8Y\xa0: \xcb\x8e\xb6\
+?f_!!'\x8c\x18\x1aJ\xf241%\x8f\xa1\
+\xf4\x04\xe4\x00\x1cP\xe2\xc0\xe56\x16\xc4\xe4_\x88#\
+'\x94\x0d\xc6\x8c\x9c\xe1r\xdf)\xc4\xb8\xf9_\x80\x85\
+\x8b\x97m\xd9\xb1\x1d\x00\xef\x7f\xfc\xb1\xe5\xab\xd6\xe9_\
+\xb0t\xd9J%o\x02\x80\x80\x0b\x16-\xda\xb9k\xaf\
+\xfe\xbd=\xba\x17\xff\xed\xde\xdb\xaf\xbbz\xf69g\x9e\
+1b\xf8\xe0\xee\xa5E)n\x87.D\xe6\x04\xc4\xd5\
+rd\x22B\xe4VQ(.\xcc\x1d{\xd2\xf0\xcb/\
+\xbd\xf0\xc9G\xee\xbf\xe5\xa6\xeb\xc3\x8bB0o\xe1\x22\
+EG\x00\x02`Sk\xcb\xe2\xa5+\x8c\xc6\xcf\xc5@\
+*1\xf8\xffo-\xab\x83:\x18\x9ft\xbe\xb2\xac\xc9\
+\x069zY\xb5\xf2\xfd.\x1b\x9e\x19\xedb\x8b\xe6\xc0\
+v\x92\xb4h\x83\xc26\x8aAA\xcf\xcb\x98\xe6\x16R\
+)\xb2\x15\x9b>~\xd0\xbaah%~\x12!#@\
+BF\xc4\x09\x91\x90\xab3o\x08`Xj\xf7b[\
+\xe6a_\xb3\xac\xb1\xc3cv!\x9aQ\x1a\x94\xf8\xf5\
+7\xcf\xa9(\xeb\xf1\xd9Ws\xa3nl\xf1\xb2e!\
+\x22\x911 \xf2\x05\xfc\xf7<\xf8H\xd4\xbd9\x9d\x8e\
+\xbbn\xb9\x05\xd4T0\x8al\xf3\xb6\xadc&\x9eF\
+\x00\xa7\xa7N\x99\x94:A\xa2\x10\x12<U\xfbb+\
+o\x13\x05\xdc\xbea]ZJ\xaa\xcb\xe9@\xb5#\xe8\
+=\x8f>\x12.\x22EX\xb3fCcssfz\
+\xba,T\xff\xf9\xf4S\x9f?\xa0\x15\xa6\x1ai\x9cp\
+\x9f\xb6\x08 \x0a\xd1+\xf9V{\xb6\x9c\xec\x1e\x04\xba\
+b;\xd5%\x94m\x1a\xaf\xb0\x95n\xef8\xa8\xd6\xa8\
+\xe8\x88o\x9dV?\x86\xcd[Hk\xf3Kq\xc36\
+\x8a\x9e\x01\x1fK8\xa4\xe8<#\xe9rUv&\x9e\
+\x9b~\xb6\xd2\xa5NN\xb6\x13\xca\x03\x95u\xc3\x9d\x95\
+\xc790\x0e\xc8\x099\xa1\xc4A\xe2(q\x948p\
+\x8e\xc4A\xe6\xad\x12\x07$if\xde8\x8d\xf4`D\
+&\x09G-\x1b6m\xfb\xec\xab\xef\x15[\xa7\xd3\xaa\
+uu\x8d[\xb6o\x03\x00\xe0\xf0\xd83\xcf\xec=p\
+(*\xf3\xb3{\xf7>_\xc0\xaf\x0c\x92G\x00\x89>\
+\xf8\xe8c\x02\x14\x01\xcf\xcf8\xb7\xc2\xd6\xb3\xb7\xbdO\
+\x89\xb5{+o\x01\x00\x89s\xaf\xc7\xe3V\xa4G\xbe\
+'\xf8\xf2\x9b\xef\xf5\xdb\xc1\x09\xbe\x9e\xfb\xbd|\xc1^\
+\xbf\xef\x957\xfe\x15\x958\xd3\x93\x80\xc2Z\xdd@E\
+\x11\x01.m\xdb(\x81<\x92V\x9bc$\xd3Y\x08\
+\x01B\x5c*\xb1\xe7\x93>]A\x9dU3\xf1Ga\
+\xa2\xd6`\x0abzN\x1bv\xb63\xba\x10\x8c\x9fg\
+\x05\x008%e\xa2\x1d\x9d\x5c\x1bf\x8dH\xa8\x9b\xa2\
+\xaa\xb6[R\x9a\x04\x91\xd2\xc5D\x22E\x8c\x14T\x9a\
+P~DY#\xc0\x0b\xf2F\xa3:\xf54\xf2J(\
+*#\x8c\xb11\xaaZ\x85\xfe\xcbo\xbf\x01\xc0O\x0b\
+\xe7\xbf\xfc\xfa\xbf\xa23\xd0\x08\xa1\x90\xf4\xf3\xbcyZ\
+\xc8^U[\xf3\xce\x87\x1f\x13\xd0\xc9)c2\xc4,\
+\xf9nVyV\xc9\xac\x18\x22\x9c\xbfx\x91J\x05A\
+ X\xb0dqU\xf5\x91\xa8A\x04\x1f|\xfc\xa9<\
+R\xed\x99\x97^\xaa\xaa>\x92\xc0\x97\xc5x<\xbe\xd5\
+\x9em@\x82~\xdd\x88\xb4<, \x82M&\x0cb\
+\x92yV\x88\xcb\x0a\x22\xa3<+0\xb3\xceS&\xb3\
+}c\xbc%\x8a@H\x8c`j\x9a\x922E\xe90\
+\xafH\x8c\xda2\x89\x94Y\xaa\x0cENP\xe9?\xbc\
+\xda\xb3n\x97o\xbf*. \x11\xaa\x1aH\x96\x1e\x90\
+} y\x95\xca\x9d\xd9#R+\x22\xa0Z\xb5\xd1\x17\
+bT:K\xc7\x91G\xa5\x03\x90\xfc\x9e\xb7\xde\xf9\xe0\
+\x99\x97_\xbe\xe2\xda\x1bB\x12\x8f\xf5\x9f\x08\xf0\xc5W\
+\xdf\x08I\x92\x8c\x0a\xdf\xf7\xd0#\xed\xed~\x04\x9a\x9e\
+6Mf\xac\x09$\xfe\xe6Y\xa8\xdd\xf2W\xdf~O\
+je\x05 \xbe\xf0\xea\x1bz\xca\x93\xbc\xcd\xab\xd7\xac\
+\xffi\xfe\xfc/\xbe\xfb\xf6\xd9\xe7_1\x89\xdd)!\
+}G^\xf5\xc3\xc1\xa3\x1e\xde!\xaf!W\xa7c\xea\
+\xc3^\x8f\xd4\x11\xa32\x92\xe8\x84\x87\x09\xaf$\x02\x07\
+\x82\xb8\xdc\xe9$\xdaN\x1b\xf5KG\xb5/G\x91%\
+\xaf\x97\xadw\x08\x82Q\xb1\xa0D\x5c\x00a\xb7\x7f\xef\
+\xda\xf6\xb5k<\xeb\xf7\x05\x0e\x00\xb0\xc9\xeeq7\xe5\
+\xde\x10\x04\x10\x01\x81@\xe2\x84\x0c\x18!#`\x9c8\
+\x22G\xe2(;F\xc0\x89_Q8am\xeb>\x15\
+\xeeUa8\xad\xa9\x85\xdc\x09\x0c\x11(\xb6\xdcO\xf1\
+\xd3jj\xeb\x1ez\xec\x192\xa3\xd4 \xacX\xb3\xfe\
+\xd1g\x9ey\xe0\xae\xbb\xde\xfe\xf0\xc3\xcf\xbe\xfa\x0e\x00\
+\xfb\xd8+*\xac\xe5!\xe0@p$T\xb3\xd3\xb7[\
+\xf3y\x97\xafX\xbbv\xc3\x86\x91\x83\x87\x10\xc1\xfce\
+\x8b\xe7/Z\xa2t\x00\x90M\x0c\x12\x02r\xa2\xf3\xff\
+pyD\x03-3\x0f\x1a\xcd\xb8\x8c\x9ag\xc4\x0et\
+\x1c\xe9\xef\xec\xae\xa3\xe4\x86\x1dK\x01-G\x02\x0d\x10\
+m/(<\x905\xce\xc4\x1c\xd3djt\xc1\x86h\
+\x92.5\x05!\x12\xb8\xd2QwLp\xb2kl\x80\
+\x02j\xd7p%\xe7\x1a\xe0\x81y-\xf3~j\xfd\xa5\
+:X\xa7\x16E\xb1s\xd3\xcf\xbc\x22\xfbr\xce%\x0e\
+J\xac/\x01\x02\x07\x95\x08\x83\x8c\x01#\xe4\x1c\x18\x02\
+'`\x04gf\x0f\x7f\xd8\xf2\xd9\xb1\x80G+\xac\xcf\
+\xb5\xb8/\xc8\x19}rZ\xcfr{\x9e\x0dE\x09\xa4\
+*\x7f\xd3v_\xf5\xf2\x96\xfd\x0b\x9b\xb6\xb6I\x01P\
+\x189J,D\x0a\x82\x89\xa4\x9fv\x1b\xb1\x84\xf8\xf4\
+\xf3/\x7f\xf8\xf1\xa7G\x8e\xd6\xcb\xf78\xd5}J\x88\
+$Y\x14\x16\xb7-!]\xebN\x89\xe0\xee\xbf=\xfc\
+\xe3\xe7\x9f567\xdd|\xfb]\xc4\xc3c\x84T\xf9\
+!\x8d\x08j\x9a_D#\xb8$R\xfe\xb5\xc8\xa5\x85\
+\xb7\xa9\xb4\xe0\x88\xa1\xaa\x88`\x05\xeb\x01\x7f\x15D\xa1\
+\x03\x185~&!>dV\xcf\x1e\xd1'\x1aL\xf8\
+fI\x88\x0b\x1a\xb3[I\x19\xb7M\xfd\x1d\x03\x15\x80\
+\x16\x00\x80|\xdc\xffU\xf3\xd7\xdf\xb7\xfe\xd0\xc1\x83\xba\
+|\x1c]\x981\xf3\x82\xcc\x8b\x82\xc4\x19\xa2\xa4\xefu\
+\x82\xc8\x08\x181F<\xc4\x95\xfaM%\xb9A`E\
+\x9c]4\xf9\xd9\x03\xdf\xc9\x1f>3g\xd4S=.\
+v1\x85\xf9(\xe3!\xc5\xb6\xd41\xa9\xa5W\xe7\x8e\
+\xf5\x12}vl\xcd\x0b\x87\x7f<\x12h\x01\x80|K\
+\xda\xb5ES\x0fu\xd4\xcdk\xdaT\x13h\xd1E\xd7\
+\x0a\x1bG\xd7\xb5\x82\xd5\xd4\xd6\xab\xd3\x17h\x8ck\x8c\
+\xfc\xa8\x00\xc2R\xef\xf2\xa8L\xfd\x8a\x15\xeb\xce\x9bu\
+y\xe5\xa1C\x07\x0e\x1e&}\x9e\x83t5\xed\xf1\xe2\
+!]\x81\xa9\xbe\xf9B\xcc\x84'Y\x87J\xc4\xa3\xc0\
+_-\x19\x5c\x1d\xac\xef\xe0\x81\xc8lF\x0c\xd9#\xa6\
+\xd7Z\xcc\x9e\xc6\xb6\xc4\x8b\x08\xc7\x98!O1\x11\x09\
+\x1a\x8d\x1e\x8eD\xc1\x90\x08@\x00V\xe1\xec#\x11J\
+\x00\x04\xec7\xcf\xfck+o\xf8\xac\xf9\x9b\x0e)\xa4\
+\x1b\x00Fg\xa6\x9duN\xfaE\x01\x92\x82DA\x02\
+\x09P\x22\x90\x00C\xb2'\xc4A\x22\x08I\x18\x920\
+\xc4\x15\xc7H\xf1\x87\x00g\x17Nt\x08\xa2\x0c1\xde\
+Sz\xb6\x8b\x09\x00H\xc0\xf4\x93\x0aen\xb1\x8b\xe1\
+\x959\xa3W\x0e}hv\xc1xFP\x1bl\xf9\xf7\
+\x91\xdf\xae\xca\x1f\xbfi\xd4\xe3\xdf\x0e\xb8uF\xd6P\
+Qk\x17\x12\xce\xab`d\x0a\x0c\x069\xfa\xdb\x98M\
+f\xbe\x1f\x0d\x1d\xa9\x0e\x1e\x89\xb52\x0b\x16.\xdb\xb7\
+\xff\xb0,\x8e\x86\xe9\xad\xb8\x05\x80\xa8g\xd9\x82\x16:\
+Rd*N\xc9#\xf34\xd1\xad\xcd\xb0\xd6p|9\
+h\xdf\xd2\xbeW\xe9\xf3\x11\x87i\xa9\xb1\xe6\x8c\xf74\
+.\x97P\xd3\xa5&O\x9b\xcd\x8dJ\x0e\xd7$@\x80\
+\x5cK\x9e\x88VBh\x0a6=T\xfd\xe0kuo\
+y\xb9O\x83U\xfe_y\xdf\x19&Gum\xbb\xf7\
+\xa9\xea\xdc==9*\xcc\x8c\x22B\x01\x84$,$\
+@\x80\x10`d@\x04\x036\xd9`\x83\x0d\xbe6\x18\
+\xdb\x18\x03\xc6\xd8\xf7\x81m0`08]\x0c\x18\x0c\
+\x06\x8cH\x22\x07\x01\x22(!\x81\xb2\x84Fi49\
+w\xee\xaa\xb3\xef\x8fJ\xa7\xaa\xab{z$\xb8\xf7\xbd\
+\xef\xcd\xc7\xc7'\xa9{\xba+\x9c:{\xef\xb5\xd7^\
+K\xab\x1a\x8e\x0c\x1d\xf5\xb5\xd2o\xa6\x88\x9bKG!\
+P\xb4\xd5\x03\xa0\x00*\x80\x0aG\x85@!T8S\
+\x855\xa4\x12VJ\xc1\xf3j\x8f\x01\x22@\xe9\xd5\xde\
+Om\xf5\x82\x85u[\xc5\x97\x1f\xe1\xb7\xcdg\xfdf\
+\xe27<\x80\xfb\xd3}go\xbagc\xbccNd\
+\xcc_'^\xf2\xc2\xf4\x1fM\x0e\xd4\x19H\x8a\x99\xf5\
+\x0a\x0do\x80i\xfeC\x00u?\x86\xb5\xc9\xb5\xb9\x93\
+\x839\x03\x9e\x07\x0d\xe1\xd9\xb4Ym\x05\x0b\x224x\
+\xea\xcd\xd5Ed\x8a!\x03\x07\x5c\x99\xd8h\xc1\x8c\xf9\
+\x0c\x81\x9c\xc4\xb8\x02\xdeu\xee4E\x96\xa7\xee/\x92\
+\xb1\x967\xfb\xd2\xfe\xd4\xe0mP9|\x92X{m\
+\xeb\x0f7\xa4\xb6:\xbd!\x11\xea<u\xe7\x96_\x95\
+E\xc8\x22(\x84Y\x22\x05 \x0b\xda\x1a\x02\x85P\xfb\
+/\xab\xfd\x81k\xff1\x0d\x16\xe2\x1c9'\x0et\xd5\
+\xe8\x93\x18\x02\x01=\xd4\xbe\x1cQ\x06Ah\x5cg\x18\
+\xa3-\x07@N\x17U\xcd\xb9w\xe2\xa5\x08\xd4\x93\x8d\
+]\xb8\xf9\xfe^5\x0d\xc0g\x86\xea_\x9e\xfe\xa3\xd3\
+*f\x82\xad-`\xb3\xebn\xf642\xa3\xc8\xdb\x94\
+\xdaBy\xca$\x03\x10\xa6\x91\xfbW\x90\xd3h\xd4L\
+\xabE\xb8\x8b\x00\x10\x1a\xbd\x0d%RD[.:\xa2\
+F\x9a,\x1bfH}'\xb6Z\xafI\xad\x85\xa1\x13\
+\xc0\xb5\x82\x18m\x156\x0a\xe4\x0a*\xde\xc2W.\x82\
+I\x84\xc3T\x98(8]\xdaS\xa3\xb0\x14z\xbe\xff\
+\xe9'z\xfei8/;6J\xfaf\xd5\xf7\x01=\
+\xda\xd4\x0fG\xe0\x84d\xa8\xc6i\x93c\x86=\x0b\x12\
+1\xe4\x1c\x11\x19\x82\x84\xc8\xf4Q2\xe4\x08u\x9e\xc8\
+\xd9\xb5\xf3\x9ej[\xf1y\xb2\xf3\xb1\xaeU\xe3\xfc\xe5\
+\xfd\xd9x\x9d\xb7tj\xb8A\xd6z\x8c\xc6\xff,A\
+w\xe2gUL\xebj:\xe7\x96\x96\xa7\xf7\xa4z\x7f\
+\xb8\xe3\xb1\x87']\x06@\x01\xc4\x07'^(m\xc7\
+g{\xd6X\xe3\x11\x02\x0f\xb5\xde[\xcb\x89\x00 \xc8\
+|\x1b\x92\x9bDI\xfc\x1c-\xb4\xfc\xcc\xa1a\x1a\xe0\
+d\xd9\x7f\x10\xe4\xb0T-\xd8k~\xf8\x08\x85T\x8d\
+\x18-\x18\xbf\xd1\x13\xbd\xcb\x1e\xea^\x9a\xe4Zc\x98\
+*\xe4\xf0Q\xe1\xe9\x87\x06\xc7\x8e\xf1\xd6\xd4z\xca\x82\
+\xb2\x0f\x81\xc5\xd5DK\xbam]\xfc\xf3\xd7\x06Vw\
+d\xfb\x0d\xfc\xba\x00\x931O\x9d$\xc8\xbb\x14.\xb8\
+\x0a\xabK\x81 \xd9f\xd5\x9a>\xf4\xa6x\x0at\xb7\
+l\xa7n\xc5\xfc\x92E\xa7\x95\x7fK\x8b\xe6\x0c@B\
+\x90\x01$\xe0\x0cA\x06d@2\x82\x04 !\xc9H\
+\x1e$\x1f\x03\x0f#Y\xca\x06$\xf0\xc9\xe4\x91\xb8\xc4\
+\xb8\xc4@b\xb43\xdd}\xe2\xea\x9b\x15\x8bC\x85@\
+T\xeb/\xbd\xb2~\xe1\xe55\xf3df;r\xcb\xc0\
+\x90\xf0\xca\xed\xffX\xda\xb5\x1a\x90\x1e\x98\xf4\xad%e\
+\xd3\xb4\x85\xa6\x10\x9c\xb1\xe9\xde\xd5\x83\xbbrRJ\xfe\
+\xaf\xa6\x87d\xf4\x12@\x862\xdfh\xb9\x8c\xdc\xd4\x99\
+M\xc9\xba\x11\xabe\x90\x1d\xad\xa1\x5cT\xc6\x12/E\
+\x84\xbf\x8d\xf9\xcfF_\x03\xb3\xf6\x15\xe8\xcb\x0e\xfel\
+\xff]\x1bS-\x80\xe0\x05\xf6\xd5\xe8\xbc\xd3K\x8f\x9e\
+\x11\x1a\x8f\xa0\x02\x80\xc4t\xd9s\x86\x96\x1d\x89\xca\xd9\
+\x93\xbd\xcb\xefj{2\xa9f\x85\xa1I\xcc\xc9\xd4\xdc\
+\x85\xcc\x98\x9b\x22\xbd\xa3q\xe1Joucz\xd8\x9b\
+\x22\x04\x90\xa6\x0cj\xa3*\xe0\x14\xc2\xf6\xa2\xf7\x84\xe8\
+y\xa6^\xb2\x0a\xa0\x12I\xe8K\x03\xef\xc9\xf6tf\
+\xbb\xd2\x94\xf1`\x80\x13S\xf5@\xc6\xb2\x04Y\x82\xb7\
+\x06\xd6\xeeLw*\x1cT\x15\x8cl\x1a\xc6\xfb+\x17\
+W\x7f\xc58#\x8d{\x86m\xe9\xc1[Z\x9eY\xb2\
+\xf9\x0f=J\x12t\xd3I\xa3q\xa0w\x1a\xf8o\x9a\
+\xcf\x1d\xed/'\xc2_\xb6<\x934\x9a\xfb2\xc0}\
+\xe3.\x0a0Y\xb0_\xd4!x\x19%m\x0b\xe8S\
+z]\x9fR#\xb93\x02\xcd\x08\xd8Uv\xdf\x020\
+wm!\x19\x22S\xdc\x01\x0f\xf157\xf9\xc7jR\
+j\xda\xd9\xf4f\x07\xbf\xb3\xf7\x17\x1bS-\x040?\
+4\xe3\xe9\x09\xbf\xbd\xa1\xee\x92\xa9\xc1q`\xf4\x17\xc5\
+\xe9M\xd3\x0e\x8b!\x9dWq\xf4C\xcd?\xf5I\xb2\
+}D`\xd8\xf9\x1c\x00@q*\x03\x0b\xb4<\xdc\xcc\
+\xe4s\x01\x0c\xb1\xf24\x09\x1d\xe6C/\x08/ \xcd\
+/9eRp\xb6V\x09f)\xb3>\xfe\xfe[\x03\
+\xcf\xfe\xb3\xe7\x81\xe7{\xff\xf9\xe6\xe0\xcbo\x0c\xbd\xfc\
+b\xff\xd2\xe7\xfb\x9e\xd9\x94\xfa\xac[\xe9*\x91#e\
+R\x19\x07 \xc4zO\xfdu\xbb\x7f\xb5(z\x94\x8f\
+I\xa8q\x17\x01\x11qJd\xd4?\xda\xde\xe1\xfa@\
+\x8cE\xb7mM\xf7\xbd\xd1\xb7\xe1\xf4\xaa\xd9\x01I2\
+\xadU\x0d\x5c\x05}\x0c&\x06F=\xd3\xbd*\xa6\xa6\
+\xcb\xe4\xd0\xac\xc8\x18\xedp\xa3\x92\x8f\xa3\xb4b`\xbb\
+c\xa2\xe7\x9c\xb2\xaf1\x90\x10aP\x19xy\xf0\xcd\
+|\x95\x86\xb5'\x1c\x00\x8d\x8b\xec\xb3\x22d\xbb3:\
+\xed\x15\xf1\x8a\xaa\xf3\x1a}\xa3\xcc1Z\x04v\xed\xbe\
+\xdb[2\xfb\x01\xe8\xca\xca3\x7fZwiX\xf2Y\
+\xa8\xbc!$\xa2S\xda\xd0i\x88Q-\x97\x94\xc9\xd1\
+\xe5C\x9f\x16\x9c\x8f\xce\x95\x01Bq.\xac\x00\xaf\x03\
+\x8b\x8bbb\x0eo\x0f\xd8:\xd9\xd7\x14\x0c\xc2\xafW\
+\x5c\x13`\xe1\x84\x1a{\xb3\xff\xc9\xc7\xbb\xef^\x9f\xf8\
+\xa8=\xdb\x9a\xa5\xac\xa1\x84\x88\x00\xa8\x02u)\xdd\x9b\
+\xd2[^\x1f|}Sj\xcb!\xfeC\x82,\x04\x80\
+q5\xf1L\xef+\x0bK\xe7\xa15\xbdE\x15\x9eP\
+[v\xf0\xd3\xa1=9e\x04\xf6(\xb1\x8d\xf1\xfdg\
+W\x1di\x82\x87\xe6H\x18\x004\xfb+7$\xda\xb6\
+':\xb6&Z/\xaf?\xd1\xa8\xd9pz\xb0\xf1\xf1\
+\xce\xf7\x13<+\x1aV-\x8a,\x08\xb1\x10 $)\
+\xf1\xe2\xc0k\xc2\xe4\x98\x90\xde\x16\xdds\xca\x9b&\x88\
+\xe3\xee\xce1B$\xc0R9\xf8\xd3\xba\xef\x811\x1c\
+\x06\x00\xaf\x0d\xbc\xf7\xec\xe0\x1b\x00\xb0\xa4\xf4\x84\xef\xd5\
+\x9co\x1b\x916\xd7\xb4\xce\xb1\xb5\xfeNz&\x89\x00\
+8\xd9?\xf6\xd9\xde\xf7\xe2<\x0d\xe86\xe4\x94g=\
+1\xb7\xc0V\x8cD\xc3p}\x14\x12\xedr\xed\x86Z\
+\x04u\x9e\xd1U\x9eQ\x1f\x0c\xbdxG\xdbw\x97\x0f\
+\xbd\x98\xe6\x19\xc3(\x07m\x91\xd3\x90m%b\x9f&\
+6]\xbf\xef\x86}\xe9\x8e,\xc7S\xcb\x17oI\xee\
+}\xb8c\x99\xaa2\x953\x95#'\xa6\x02\x5c\xdfx\
+zP\x92\x05\xd8\xc4z\xc8\xde\x19\xd8\xbc\xb4{-\xa1\
+H\x80\x04\xc3\x93\x95n\x1c\xfb5\x19\xb1=;\xf4j\
+\xdfz\x93`\x1c\x92\xf0\xb2\xba\xe3\xac'\x1f\x08\x00\xf7\
+g\xf7k\x8aX\xb5\x9ej\xc1\xd7G\xc0\x0bu\xf9\x08\
+\xb2c9y.\x99u\xa6d\x87r\xad9V\x07n\
+\xa2]\xc6\xd3\xa3\x8b,d\x02HB\xf9\x99\x81W\x81\
+\xb0T\x0a_]{\x01'\x22\xad\x0f\x0df\x9b\xcc\xea\
+L\x931\xfe\xab5\x169\x18b\x04\xc0O(\x99e\
+\xf9\x22\x0ds\x97]\xcaxtk\xbc\xe7\xd3X\xa4<\
+\x9d>\xca\xe1\x95\xe5^0\xa8\xf1\xd5\xdf\xd3v\xdd\x0b\
+\xbd\x8fd\xd4\x8c\xb5h\xf2\xe6\x95\xfakCj\xf2\x1f\
+=\xffL\x13S\xb9\xe7\xe2\xaa\x0b\x1fl\x7fzel\
+G\x96\x18'\xc6\x898\x87R\x16\xb8\xb6q\x89\x13\xb8\
+5n\xc1\x9d{\x97\x111\x14\xbbf\xc6!O\xf0U\
+,\xae<\x02\x00\x9e\xeeZmM\xc1\x22^T{\xb4\
+d\x00yZ\x9d\xb2#\xb5S\x03_\x19\x93\x8e\x08\xce\
+\x00\xa0\xd2\xb2\xc8\xa3\x7f\xf9Cs\xe3h#\x817\xfc\
+P5\xd9=,\xd8\x96D{!-\x8e9\xe99%\
+\x82m\x12\x5c\x9f\xdf=\xb9\xf48q]\xf5f\x07v\
+\xa4v\x03\xc0\xa2\xe8Q\x12\xc9D \x90d\x904\x22\
+\x83\xc1\xd7#\x0e\xc4MR\x8d\xd9\xd5F\x02\x1c\xe7k\
+\xb0\x80&\xa2\xfc\x0dyr\x00\x89\x90\xbf\xa1Ay\xa9\
+~\xc34=\x5cV\x90yH\x9f\x0c~\xb87\xbd\xb3\
+\x08\xc1![j\x8a\xc0\xb7\xa7w\xa4I\xcap6+\
+<\x7fr`\xd2\xcf\xf7\xdc\xdf\x99\x8ag9*\x1cU\
+\x8e\x04xI\xc3\x82\x89\xe1\xba\x5c\xbf \x04\xdc\x91\xea\
+\x5c1\xb8\xc3P\x0fC\x9b\x7f-\xc2w\xea\x16 \xc0\
+;}\x1b\xe3\x8ajn\xf4\x95\x92\xef\xc4\x8a\x19\xe2\x19\
+\xacL~\x22\x03c\x88\xaf\x0f\xbc\xf5IbC8\x14\
+x\xf6\xb1GO_t\xca\xa9'/\x12\x15\x9f\x09\xf3\
+\xf4+\x0b\xfc\x95\x84\xdbc-,go\x0e\x00\x0e\x0d\
+\x8c\xaf\x95\xab\x84\xd4\x8c\xb5\xa4\xf7h\x11\xab\xd9;F\
+\x0bL\xdaGp\x8d\xde\xa9\xdb\xb7 \x11\xa8\xc4T@\
+\x15\x81\x13r \xfdU\x1d{d\x95\x9e\x12\x17\xcd!\
+\xf7\x1bJf3\x15\xf2\x03\xd0\x05\xb4\xa7\x0a\x0c\xbd\x9a\
+\x9d?\xb7!O\xd2e\xc6\xdd_\xc8A\x13&\x07\xa6\
+\xce+Y\x5c\x22\x95\x87\xa5\x88\x07%\x091A\xe4\x05\
+T9]Vu\xe5\xf5{\xaf\xbdi\xef\x03\xf7\x8d\xbb\
+\x1e\x81\x109\x22\xc8H\xffg\xfc\x85__\xff\x1b\xd5\
+\x12]5\xc5\xe5\xf1\x95\xfe\xcf\xe6\x974\x99\x13j\xe2\
+\x00\xe0\x11\x91\xd1SB\x0d\x1bc\xadkb-\xc7D\
+\xc7\x19\xd9\x06\x9cQq\xd8+=\xeb\xcd\xc3\xdc\x92\xda\
+\xd9\x9amm\xcbv\xdf\xdf\xf5_\xc0\xe0\xbe;\x7f;\
+k\xdat \x9a:y2\xd8\x1d\x11\xc9u\x05\x15\xaa\
+l\xd0\x10\xf5\xb3\xd8\x1f\xce+\x83@\x08\xf3C\xb38\
+W5\x9a\x01\x10p\xa48%\xb4wg(c\x90\xad\
+\x0d)G\x04N$#\xf3\x80\xdc\xa5\xf4\x0dd\x06\x11\
+\xc9\xc7\xbc\x0d\xbe*\x990\x8bYq\x04rH\xcd\x80\
+\x88\xbb\xbb\x80;\x98\x0b$\x16\xdeNhd\x8dz\x14\
+T+\xc9Q\xc8\xbau\x93-\x97vs\x5c\xd9\x069\
+nI}6+r|\x8d\xffp\xed\x99\x92\x80\xb2\x00\
+D s\x88J\xf5\xa7D\x17/\xeb\x7f\xe1/\xed\xcf\
+\x7f\xb7\xe1\xb4\xac\x0a\x88\x1c\x80\xcd\x0c\x8f\xbd\xb4n\xe1\
+_\xdb\xde0\xef\x84\x99\xaa\xbc\xdf\xbf\x15\xc721d\
+\x9b\x07@\x5c=\xbb\xf2\xc8\x0d\xf1gW\x0e\xb5\x1c\x13\
+\x1d\xa7\xdfM\xa4\x05\xa5\x87z\x91e,P\x93=\xd2\
+\xfb\xd4\x86\xe4\x16N\xf4\xe3k\xbew\xd6W\x17k'\
+SZ\x1a\xb5\xed\xd9\x84PH\xa8Y\x10\x08';\x0b\
+\xb1\xa0R\x9c\xf6\xf4M\x0dLf\x1a\x95\x14Q\xc3H\
+e]i\x0e\xd6&6\x9f^v\x22q}V!E\
+\xd9\xd5\x89O\xd7\xc77\x7f\x96\xda\xbe-\xb5K\x05.\
+\xd0\xb4\xa8\xc9\xdfpR\xc9Q\x17T\x9c\xe4A\x09\x01\
+U\xa2\xed\xc9\xbdd\x93\x1a\xcd\xd7\x9f\xb0\xce\x84\x15\xdd\
+\xac\xa0\xa2\xe2\x94xk@@\xa8E8L\x10>1\
+\x9f,\x22\x1b\xddQ,k\x1e\xef\xfa\xc3\xe7\x89\xf5\xba\
+\x8d\x16\xa0J\x90\x05\xcc\x02f\x01N,=\xd3\x83\x9e\
+\xbfu<\xf7a\xff\xb6,\xc7\xac\x8a*G\x0ex}\
+\xd3\x19\x93\x83\xf5\xc6j4Xf\x80-\x89\x8e\xa4&\
+\xa1g\xe4\x17\xe2\xa9,\xae\x9c\x01\xc0w$\xdb\xcd9\
+\x1b\x00(\x93\xbc\xd3#c\xc5\x8c\xe0\xbd\xa1\x95}\xd9\
+\xc1\x93N8\xf6\xc6\x1f^k^\x16UUA\xf0l\
+B\x9b\xfb\xabk\xb9\x8a\xc3\xb3\x04s\xb2P\x0dq\x1e\
+%\xd7\x99\xd22\xdaaN\xf06J\x88\x00\xf0\xee\xd0\
+\xeam\xc9\xdd\xc0\xd8\xd6d\xcb\x7f\xb6\xfd\xe9\x8c\xcf\xaf\
+\xba\xb1\xf5\x9e'\x07_\xdf\x94\xda\xa5\x18O\xad\x04\x18\
+\xc1@\xa9\x5c\xd2\xa3\xf4?\xd2\xb3tSb\x97\x16\xe9\
+\x08\xa4w\xe3k\x87\xab\x1e\x9dZ0\xf2\xf0\x0a@\xee\
+\xa4\x8d\x22D[]QT\xc7\xe23\x87\xba\xd1\x1dv\
+B\x00\x15\xe8\xb1\xae\xbb\xae\xad\xff}D\xae\xd0\xfa>\
+\x88\xa4\x02\x12\x90\x8c\xe19\xe1\xa3W\xc4\xde\xbeq\xd7\
+}\xff\x98\xf4\xabz\x7fX#\x10I\x8c\xfda\xf2U\
+g\xac\xbb-\xaef\xc4\xaf\xcc\x80\xda\x96\x1ah\x0e\x94\
+\xa1u\x1b\xf5^\x17\x12\x8d\xf5\x955\xfb\xaaw\xa7z\
+\x901\xe0\x5c\xbb\xaf\x9c\x949\xe1\xe6\xd5\x83-\xe2y\
+L\x9c\xd0\xfc\x97{\xefe\x92E\x08nmk\xd3\x94\
+W\x81\xc8\x83L\xa1\x82\xe6'N\x8f\x5c;;\x07s\
+\xe6\xc0\x84L\xdc'\xf9\xc2r\xd8\xb6\x0d\x10Vx\xca\
+\xe7\x85f\xbe\x1b[\xa3\x02\xfc\xa4\xf57\x93}\xcd\x1f\
+&\xd6\x19(9\x96bpn\xc9\xcc\xa9\x81q\xe3\xbc\
+\xa3\xc7\xfa\xea\x22RP\x06I\xa3E\x11\xa8\x08\xa4\x0d\
+\x10\xab\x00\x0b\x22s\x1e\xea~\xc1z\x88ix\xd24\
+s\xe3[\x8f\xa0\x19\x9b\xf7\x09\x13\x93yr\xb1\xc1\xd4\
+\x8a\x00C\x86\xce\xb4\xb2\xe0^&\x97\xca\xe5\xa3\xfdM\
+M\x81\x89c|\xcd\xe5r\x85\x97Iq\x1e\x7f\xa2\xfb\
+\x1ef\xa4\xfc\xda\xe8\x0f!#\xa4\xd9\xe1\xf9\xc0\xa9\x9f\
+\xc7\x7f\xb2\xfb\x9e\x94\x8a\x19\x95e\x15\xa6\xa8\xd8\xe8+\
+\xbfc\xc2\xb7\xd0\x80CL\x0eM\x9f\x92\x10!Yc\
+O$\x00\xe0\x5c\x99_>\xb9+\xd3\xcf\x88\x99\xc0-\
+26#2\xc6\xc1\xd3\xeb\xec\xea\xda\xb7\x7f/\xa2%\
+\x8a\xb7s\xd7n\xcd\xdc4,y_\x9cy\x93\xcct\
+\x80x\x98G\xcb\xe2\xcc\xa3\xad)\x049e\x8c\xd0\x1a\
+@\x0b|1f3\x89\xff\xa0\xfa[\xe5r\x04\x80z\
+\x94\xa1\x0f\xe2\xeb9\x81\x04\xb0\xa8d\xee\xfd\xa3oZ\
+6\xfe\xaf7\xd4]~z\xf4\xf8i\xc1\x09Q9\xcc\
+\x80q\xe0\x1cT2\xb8D\x00\xfa\xbc\xd4\xa9\xd1\x05\xcc\
+\x02`\x0a\x08I\xa3\x83\xd2Zx\xb3\x81\x82\xca\xd3y\
+\xf2\x22r\xab\xc1Pl.\xeb\xbb0\x02x\xc1;5\
+<gR\xe0\xf0\xb1\xdeI\x95\xfez\x19\xbc\x9cT\xad\
+\x14FD\x852}JGKjc\x8c\xf7\x87\xa4\xa8\
+y4\xdas3>0=,\x85c<\xb1)\xb1\xeb\
+\x8e}\x8f\xde8\xeab\xf3\x0b\x17\x95\xcd\xf8\x8f\xd1K\
+\xee\xde\xf7\x9c\x99\x91\x00@X\xf2\x89\xf4\x05\x14\xd5\x12\
+\x10\xa6\x06\xea_TWe\x80K\xa6P*\xc1\xa4@\
+\xad \xc0\x01@\xd0?\x10;\xf9\xac\xf3\xee\xfb\xdd\x1d\
+KN9\x15\x01\x91\xe1\xeaO\xd6i\xdf0\xabd\xc2\
+a\xde\x8a\xc5\x95\xb3\x9e\xedZUD\xd2\x88\xb6>F\
+\xeel\x92A\xcc5\xff!\xcb\xb3\x09\x9e6\xda,\xd6\
+\xad\x89J%\xb77\xdc\xf0\xed\xdd?\xd5\x0c\xf0\x8e\x08\
+\x1c\xf2\xa3\xda\xcb\x1b\xbc5\x04<\x0b\x0a\x03\xe60.\
+\x16\xfd\x84\x8c\xd6\x0e4xjFyj\xf6d:\xdd\
+n5\xba\xcd\xa0B\xeed\xaa\xebJr0\x81\xb0\xa8\
+U\xe7x\x19\xd1\xc1\xfaE\x80\x129z|\xe9\xd93\
+C\x0b\xbd\xcc\x87\x00\x84\xc4\x892\x90\x06SI\x81\x88\
+\x10\xcb<ue\x9eZ\x13c\x01\x220\xbc\xbd\x15\x80\
+\xb9%'\xbe\xde\xbf\x94\x00\x9f\xef]>\xc17\xfa\xec\
+\xea\x05\x04\x8c\x13\xca\x8c_YwJ{\xba\xff\x89\xce\
+\xe5:\x97\x16\xa8\xd6W\xe2dv\xa1\xe97\x07\xe3\xfd\
+\xd5i\x9eU\x89d]\x8a\x0e\x00\xa1\xc1[\xeec,\
+\xcdm\xfc\xfd\xc1\xc1\xf8\xc5\xdf\xb9\xfa\xf1\x85O\xfd\xe0\
+\xaa\xab\xc6\x8e\x19\xb3n\xddg\xda\x07\x9e^~8\x07\
+\xbe\xb0t\xf2\xd2\xceU.\xda,\x0ed\xd1\xac\x16\xd0\
+&\xf6\xe74O\x10\xac\x10\x14\xe0\xed\xd9\xceF_\xbd\
+\xb1\xa4M\xf69\xbd5\xf8>\x01C\x80E%\xf3~\
+R{\xa5\xf6h\xa0\xb5\xd7!\xa2\x96E\x0b\x92\xb4\x80\
+\xdaii\xc5|\x9a\xb2\xe3\xfcc\xf7d;\x87\x13\x0a\
+\xb6\xf1\x81\xb0\x88\x04\xa8\xb86r\xde\xcfpG\x1d#\
+\x9e\x92\xd3*.m\xf0O \x96e(1\xa6\xa9\xda\
+\xd9Pt\xc7\xd8\xa2\x9d'\xa8\x8f\xf8\x1c\x17=]F\
+I\xe3\x7f\xdc\xd5\xf6\xd8\x07\xfd\x9b\xd3\x0a\xcb\xa8\x98V\
+X\x86\xe0\xe7c\xcf_R9\x97\x13'\x800\xf3\x05\
+\x98\xdf\xac3\xf46\x04Y\xb4\xbf\x06_\xb9\x84\x0c\x81\
+YR\xe2\x04Q\x8f/\xcc\x02.\xbc\x1d\x0e\xaf\xbc\xbe\
+\xfc\x943\xcf;t\xf6\xdc\xac\xca\x01\xa0\xd6\x17]R\
+5\x13\x01Gy+\x0d\x05~W$\x91\x9c\xfcyG\
+\xaeDvX\xc8V\x82\xc0\xb6\xe4v\xe2v\xec\x16\x80\
+\x03>\xdb\xff\x1a\x02\x8e\xf2V\xff\xa4\xe6*\xb4\xa6C\
+\x80\x9b\xf30\xfa\xce\xad\x05,\x00BN\xa49\xfcj\
+_\xa8\x00D\xa5H\x11\xf7\xdb\x96D\xe7\xe3\x03\xd1p\
+1i\xa4\xc4{\xe7\xcf`v\xf0\xd1\x8e\xdf\x1b\x91%\
+Z\xefkl\xf4Mj\xf2\x1f2\xce?M\x92<\x86\
+\x97\xb1H\xf6%!\xab\xb4L*\xfdr\xc9\x89\xd1%\
+/\xf7?\xad\xc5\xb5\x9f\xef\xf9\xc3\xfd\xcd7M\x0c6\
+\xc8\x8c\xcb\x04\x0c\xf9\xadc\xaeX>\xf0io6Q\
+\xe5-\x090T\xc9\xa6X(\x9eX\xb5'Z*\xf9\
+\xbdf+\xca\xb8E\xf5\xbe\xd2\x1e%\x91\xaf\x87n4\
+\x1e\xe8\x8e\xa6\xf3\x83\x8c\xe9\x18\x0c\xda\xc7\x1f\x5c#\x17\
+\x92\xa5BE\xe4R\xa99&\xe6\x09\x00\xe1\xbd\xf8\xaa\
+E\xd1\x05d\xda\x98#\x10\xc1\xe6\xd4\xf64)\x00x\
+j\xf48\x01\xc3G\xb2\xb4bI$\xdd\x13\x08\x0e\x89\
+D\x1a\x1f\x8d\x13$y\x8a\x8a\xe5\xd8[9\xd0\x88}\
+\xeaF\xbcK\xa1\xcb:3f\x09\x80\x00c\xea\xe0\xb6\
+\xc4\xa7\xdb\x92\x9f\x02\x90\x17\xbd\x87\x86f\xcf\x09/\x9c\
+\x14<\x82\x03\x17\xa4\xc1\x9d\x00\xa0\x89\xe2,,?\xeb\
+\xe3\xd8\xdb\xbdJ\x0f\x00&x\xe6\x07\xbbn\xbf\xbf\xf9\
+\xe61\xbeJ\x15\x98\xc4\x90\x01%y\x1a\x10\xc6\xf8\xab\
+9\xa9`\xca\xca\x1b\x80\x8cyH\x01&M\x0c\x8db\
+\xc0\xb9P\x15qRK=\xa1<n\x7f&\x7f\x8f~\
+>\xe6\x8c\x93\xcb&k\x0fs{\xa6\xdfv\xcb\xb0\xb0\
+z\xbc\xd8p\x06\xab\xbf\x96\xe7\xa9\x5c\x95X\xdf\xa3\xf6\
+\x97KQk\xcc\x0b\xb13\xdb\xad}M\x14\xc3Ff\
+m'(9\x88\x81V\xe0&C\xd9\x1de\x94[\xb3\
+\x9d\xc35_\x9cU\x98\xab\xee+\x16\x1c\x07+rx\
+#\x1f+\xdb\xf9\xdb\x02\xce\x0aD\x90\xa1\xcc\xe6\xf8\xda\
+W\xfb\x1e{\xa5\xe7\x11\x95\xd2\x22?5\xa7\xcfej\
+\x0cy/\xac\xfe\x0f\xa6C\xaf8\xa0\xc4\xbf\xbf\xf3\xd7\
+{R=i\x92\xb2\xc4\xda\xd3\x03I\x9e\x01\x80\xe6@\
+\x15\x99\xd4\x1e\x03\xea\x159\x85\x8c\xf1y\xa5\x939p\
+\x07\x8e&\x817\xcf\x98.\x01\x82\x8f\xc9\xbf\x1dw\xfe\
+\xf7\xea\x16\xe8\xc2t\x04o\x0dl6,\xac\xf2\xf3Z\
+\x0bc\xb4 <,d\x03\x86\x14\xe0O\xf4>\xa7\xf9\
+\xc8\x90\xd1:\x96\xd1\xab=Q{3\x1d\x04\x86\x13=\
+\x10\x01\xa8\x00\xaa\xbe\x80\x18\x80\xa4\xf9\xd4\xe8\xbd0\x00\
+U\x9fK\x04\x0e\xa0\x90\xba3\xbd[T\xc1.\x98\xac\
+ \xe4\x19\xeb\x81<v\x1b\x98'f\x8d|p\xcc\xc9\
+\xf1%\x02\x0a0\xff\xd4\xe0\x91\x13\x823\x9a\xfdS+\
+<\xb5\x08\xa0\x92b@)\x16\xe5\xd14\xc3\x00\xd2\xdd\
+R\xb48\xd0\x1c\x98zr\xe9Y\xcb\xfa\x9e\xd6\x9e\xe2\
+^e\xf0\xfb\xbb~\xf9\xbb17\x8e\xf5\xd7\xecJu\
+k>\x80\x13\x83\xb5&\x88`\xacKa\x86\x08\x81\x13\
+\x9dT>\xd5|\x84\xc8\xd0k\xf20\xc9e\xf5\x10\x00\
+\xd2\xdc\x92\xf1\xff\xd9t\xee\x94@%\xd73T\xea\xca\
+\xa6\x9f\xef^UD\xbb\xd0\x94\xa5\xc3B[\x149\x9d\
+\xcc\x00\xe8\xb9\x81\xd7\xcf\x88\x9eR\xe7\xad2\xf3\xb9\x89\
+\xfe&@\x0e\x84\xaf\xc7\xde\xbd\xac\xfa\x5c\x22\x92AN\
+\xa8\x89\xad\xa9\xcfwfv\xef\xca\xb4\xf6\xf1\x81\x01e\
+\x88\x13\x0fI\xa1*V\xd6\xec\x1f=#8\xa5\xd97\
+\xd6pNB\x0e\xb01\xb1%\xa91#\x5c\xee>\xe5\
+(\x1c\xeb\xbd0\x1c\x89\x80\x0c\xb91\x84F\x96\xfd\xe4\
+\xce\xb2\xd5zG/\x88\x9e9-4OBY[\x1b\
+YRP\x80\xa8\xed\xee$&\x02\xa9\x95h\xba\xaa \
+G8\xa9\xfc\x1b{\xd3;7$>\xd1\x02S\xaf\x12\
+\xbbf\xd7/nm\xb8\xaeG\xed\xd5\xc6,&\xf9\xeb\
+\xc06,A\x08Na\x8cq\xbe2{\x96\x00\x80h\
+9\x0c\xa1&\xf9HeR\xf0\x84\xf2\x19\xe7U\xcd9\
+*\xda\x8cF\xaf^\xd3K\xbda\xf7\x93I\xae\x189\
+\x06\xe6\xa5F\xa3\x9d\xcc\xe9B\x11\x06+=B\xdb\xbe\
+\xcb\x91n\xef\xbc\xe7\xaeQ\xb7I\xc6\xe2\xab\xf5TO\
+\xf26mI\xef\xea\xca\x0e<\xd8\xf9\xe8d\xff\xf8\x97\
+\x07\xde\xfa4\xb5U\x01\xaeO\xc5Z\x10?\x12\x10\xc6\
+\x00\x80\xa6\xfa'\xdc9\xea\x17\x1c\xb8\xc6\xd6zi\xe0\
+-\xca\x97\xd7\xbbH\xf6\xeaq78\x92\xec\x07\xf3\x87\
+\xbc\xe2\xd6\x0eXd&\x02*\x97\xaa\xbeZq\xe9\xd4\
+\xe0\x5c\xed\x0e\xa1 Sb\x1a\xcf\x1aD4\x83wC\
+\x8eud38L\xaec\x86\x00\x00\x1eGIDA\
+T\xe6\x90}`\xdf-;\xd3\xdb\xcc\xe3f\x0c'\xf9\
+\x9a\xb7\xa4v2\xa2\xf5\xb3\x7f]\xe5\x09\x9a>e`\
+O=\xdc\xfb\xc6\x04\x00p\xce\xe6?\xbd\xd7\xbf\xb5\x5c\
+\xf6\xff{\xca\xb5\x80\xbcT\x0e\xd7\xfb\xa2*\xcf8\xed\
+0\x08\xee\xda\xff\xd6\xef\xf6\xbehcC\xd1p\x89d\
+^\xee\xbd\x90\x87\xdb\xe5\xc35r\xeb\xc2\xf0\xdc\xebk\
+\xaf6K\xf9\xb5\xc9O\x7f\xba\xefv\xb2\x8a{\xbd1\
++#\xab\x97k&\xfa\x9a\xaa\xbd\xd5\x15r\xa9\x1f|\
+\x88\x98\xe0\xf1n\xb5_&\xe9\x82\x8a\xafs\xe2\x00\xc0\
+\x19\x9e\xbb\xe3\xb28\xcf\x08r\x9d\x85\x9a\x18\xf9\x80\xc4\
+\xc2%}q\x1d\xb1\x82\xabGW\x9d\x0486z\xc6\
+\x82\x92\xf3$&+\xa0\xea\x90\xae8\xc2NB;\x89\
+H\xac\xc1\xac\xd7M\xc6\xa7\x01\x94H\xe8\xf9N\xfd\xcd\
+\x7fl\xbbyw\xba\xc5\xc0\x97is\xeas$\x8c\xc8\
+\xfejo\x84\xb8b\xe8;\xa3\xe1\xb8\xaa[\xc69|\
+\x9e\x85\xf2OJ\xf3\x0c\x00\x94z\xc2SB5*\xa9\
+\x00\xa0\xf2\xac\xbdIE\x08\xec\xb7\xad\xaf\xdf\xb5\xef%\
+c1\x1a_\x81T\x94\x95\xa0K\xf7\x9erz\x97\x80\
+\x04\xc4\xa8\xce[3\xa4\x0c\xbe\x19\xfb0\xd5\x96\xfeQ\
+\xf5\xd5~\xe6C\x84\x99\x81\x19_\x8d\x1e\xb7l\xf0\x1d\
+\xedc|L:6|\xd4\xdc\xd0\xac\xa9\x81)\x11\x16\
+\xc9B\xd6\xa1b\xa2gH\x06\x1e-\x93T&\x95\xc5\
+yG~ \xc6EcC..\xff\xa5\xe1:^\xc3\
+mBv\xa3\x83 \x0b\x9cW\xf5\xe3\xb1\xfei@\xdc\
+\x00\x0bm\x9fd\x0a\xd7!\xe6\xf5\x9f1\xd5\x11m\x93\
+\xe3\x1c\xbc\xcc\x7fu\xfd\xaf\xfe\xdc\xf6\xcbm\xc9-\xd6\
+\x82\x05\x1a\xed\xab\xd0\xb69\xf1\x9e\x08\xd5\x1c\xda\xa7\x22\
+\xacR\x9f\x81\xb4?\xd5\x07\x00\x0d\xde\x0a\x02\xc5\xa4\xaa\
+\x90\xa0#6\xa4*\xd7\xefz\xe2\xb9\xee5\x00\x08\xc0\
+\xcf\xaa\xb8dKr\xfd\x86\xc4:\xcd0\xd3}\x92\x99\
+\x5c2\xaaB0\x9c\xe9\xfaKt]\xf5\xf7&x\xc7\
+\xed\xc8\xecH\xf0\x18 j\xce.\x9c2\x1f\xc5\xd7j\
+\xa2\x8e_/?\xed\xcc\xd2\xd3\x02\xcc\xaf}}\x16\x14\
+\x13W\x14\xa6\x5c\xf5\xd2]K\x038\xa1Jj\x11\x10\
+\xa2\xedG\x1eI\xdeS\xa8YZ\xb0\xfc\xb2\xa9\xadT\
+x\xab/\xaa\xbc\xb5D\xae0\x5c\x07\xc8\x9e\xd5Z\xd4\
+\x18{\xd1&z\xa4\x0b\x11\xd8\xee\x7f\xa3\xe5!2\xfa\
+\xbe[\x7f\xdb\xbf\xba\xee\xff`\xe8m\xf33+\xbc\xa5\
+\xfa\x8c\xb5\xddOQ\x18D\x10\xc4\xe0\xd1\xda\xa3\x12j\
+\xb6O\x8d\x01@\xad\xaf\x94s}\xe8_\x00\x89\xd8s\
+\xbd\xeb~\xb9\xe7\xdf\xed\x99A\x00\xf43\xef\xa5U\xd7\
+M\x0a\xcd<&z\xda\xba\xd8\x8a\xa5\xbd\x7f\xefSz\
+,\xe0)\x9f\x0c\x99\xc9\xe5\xc0\x82%\x0a\x02 \xcc\x09\
+\x1e>\xd17\x11\x81&\xfa&j\x05\x04'\x02\xa2\x0f\
+\xe2\xab{\xd4A \xf8~\xf5\xb7N,9\xc1\x1c\xc6\
+'K\xb5,\x87\xfei\xce\xaa\x00*\xa0\xf6\xab\x03\xf9\
+\xd5\x16\xdc\xc9a\xf2\x08\xf1\x9e\x91\xf7V\xc9\x96\xfdV\
+y\xea.\xab\xfe\x95\x8fE\xb4\x14G\x02\xd6\xa7\xb4\xb7\
+gZ\x82,\xdc\x14\x98fI\xb5\xdai\xdd\xbaS]\
+\xee\x18\xb1\xb1E\x91\xad\xf5\x87\x04\xc0\x90\x9d_\xfd\x1f\
+\xe3\x02S\x1e\xef\xfc\x93J\x1c\x80*=a\x22\x8e:\
+r\x81\x96\x90\xab\x1e\xbf\x9c\xc6\xc2\xba\xee\x17`k\xa6\
+?\xa1f\x01\xb0\xc9Wn\xcc<\x03\x00\xc6\x15\xf5\xa5\
+\xfeu\x7fn{{sr\x9f\x16z\xc7z\x9a.\xa9\
+\xfdQ\x99\xa7\x86\x13\x01\xd0\xd4\xd0\xdci\xa1\xb9\xebb\
++>\x8c\xbd\xbe#\xb9\x11\xc8p\xea!*\x08\xaf\x08\
+F\xce9\x944/\xc8\xdf\xaa\xbc\x94[S\x80d\xa8\
+\x0c\xe0\xb6\xd4.\xad(=*<\x97\xeb\xa5\x05Y\xd1\
+\x98l\xf9V\xae\x04\xf9\x9e\xf4\xbe$\xa5\x81X\x11M\
+x\xeb\xb8\xe5\x22\xd6\x0d\xe6\x17\x10*&xY\x7f\x0c\
+K\xd1\x8bkn\x0d\xb0\x12\x86\xd2\xe7\xc95\x1b\x12+\
+\xb6$W\xc5\xd4\xc1&\xff\xe4K\xab\x7fI@\xcca\
+Uj\xeb\xa2\x89c\x81F\xd4\xd3\xed!\xdd\xdd-T\
+\xe4G\x95\x9c\xfc\x5c\xcf\x13\x83J/\x00\x06\x99\xd7\x0e\
+H\x228\x19\x17\xc2CfR\x82\x88\xd6\xc6Z\xb4\x81\
+\x98\xcetli\xef\xa7\x19\xae\xecM\xf7\xae\x8b\xef]\
+1\xb89\xc95v\x11zQ>\xb5\xec\xdcc\xca\x96\
+\x00\x00's\xb4\x14\x89`Fx\xfea\x91\xa3\x87\x94\
+\xbe\xcd\x89\xd5\x9b\xe3kw\xa47\xc5\xd4\x98\x0d\x04B\
+{,u\xec\xdc\xf6\xe8\xff\xf5\xf23\xab<\xd5$\x9c\
+\xb8\xd9\xd0\xe7\x06ChP\x1d\x0c`\xc0@\x88\x90,\
+(\xc4\x22\xb0\x11\xd9\x08m\x04\xf0qr%\xb8\xb0\xc9\
+\x1c\xb5\xb6\x8b\xe9n~\x0f\x1a\xe7e\x1d\xd6[\x9e\xdc\
+)f\xa8UCp~\xd5\x8f\xfd\xacdu\xfc\xd5\xf7\
+\x07\x9e\xedW4\xed#^\xefm\xbc\xb8\xe6\x17\x0ce\
+#\x87\x06\xb4\xbb\x04 \x82\x93\x96ff\x1f\x98\xbb\xe5\
+\x93}4\x1e\x89\x14\xed\xc5>%\xa1#\xb4hV^\
+h\xa0@\xb6\xd3'!\xd8\x10\xc1\xf2\xbe-\xda\xdb\x1e\
+\xee|\xef\xe1\xce\xf7\xc9V\xf8\x93\x84\xec+\xe1\xe3\xbe\
+Z~A@\x8a\x10\x81\x04\x8c#\xe7\xba5\x1a\x03\x00\
+\x86L\x9b\xe4\x0bI%\x11O\x94\xd2\xdcIlq\x5c\
+f\xcc+V0\xc1\xdftF\xe9\x99*q\x06H\xa4\
+\xcd\xc4Yo\x19\xef\x1f\xa7\x9d\xfb\x0b}\xaf\x5c^u\
+\x89\xb6\xad\x92 \xe7N\x0e\xe6\xa8\xa1*\xa4M[\xbe\
+\xd4\xf7\x8a]\x04\xb5\xa8$X\xce\x03\x0c\x0eK\xe7p\
+\x1dT-\xa4\xbbpd\xf8\x84\xf6\xcc\xae'\xbb~7\
+\xa8\xf6\x9a7,*U\x5cTs\x93\x8c>\xd1\xfbX\
+\x80\x89\xd1rZ\x17tv\x10-YSr:=\x1a\
+\x15\x16\x02\x00\xa8\x9cBrdH\x1d\x04\x80=\xa9\x0e\
+\x04\x0f\x81*\xe6=\xe4\x80\xc4\x8d>\x16\x19z\x06q\
+R_\xe9]g+\x8a\xf4g\x96\x02R\xf0\xa8\xc8\xc2\
+c\xa3\x8b\xa3\x9e*n8\xe0mL|\xfc\xd1\xe0[\
+\x1e\xf4\x00\xa0B\xd9$%\x06\x95\xdeA\xa5/\xc1c\
+dN\x07\xe5>\x87\x089S`\xce\x8b\x19b\xfe\x1f\
+\xd6^\xa7\x12\xa1\xa9\x0fbM\x0f\x11\x01\xcc\x0a\x1dQ\
+*E\xfay\xec\x85\xc1W\xeb\xbd\xf5'\x97.\xe2:\
+\xd3\xc9rw\xd6\xffJ\xc4\x18\xe3:\x11\x0a\x01\xe0\xdf\
+}O\x0f\xf0x\xfe^x\xde\xb5!\xbb58\x0a3\
+\xc4 \xcf\x22-\x18\xc3\x10>\x1az\x93\xe0M\x93a\
+JH\x12\xb0\x0bkn\x08\xb1R B\x86v\xaf4\
+\xcc\xc3\x04\xd1\xf0\xc3\xdc\xa6\x86u\x10\x0cM\x93\x11\xcc\
+@\xa6J\xaai\x87V\x00\xd8\x12o\xebW\x92Q\xc9\
+\x93W\xd5Qx4\xcd\x17\x1f\xef\xfcx\x88\xdbh\x8d\
+\x0caj`\xd6\xe1\xe1\xf9\xd3\x22s\x19Hz\xec\xd0\
+\x91M8$4\x87\x88\xff\xad\xf3Nnv\xcc\xf5\xc5\
+.\x99\x02\xfaDT\xe8\x0e\xd9\x09\xaff}zM\xcd\
+\xf7\xcb\xe4J\xce\xad\xd9\x1fN\x00@mJ\x9b\x0f\xa5\
+*\xb9J\x06\xefw+\xaf\xb8\xbd\xf3.\x0e\xf8`\xcf\
+Ck\x93\xeb\xce/?o\x9co\x5c\x9a\xa75\x0a\x9e\
+\x8cL\x02\xb6%\xbdy]b\x1d \x9eYv\x8e\xa6\
+s\xbd+\xd3\xf2\xf4\xc0s\x98W\xb0\x11\x0b\xe7kA\
+8\xc0\x9f\xe2\x12 \xb2C\x88`\x8ed\xd0\x19\x15W\
+\x1e\x1e>\xde`,\x13\xd3qD\xd3\x10\xcej\xbc\x8b\
+\xa3\x80`\xe3\x83\xb9\x1b\x5c\x89\x07\xf0F\xff\x93/u\
+\xffK\xcb{n\x1f\xf7\xf5K\xaa\x8f\xc4\xbc\x8aK\xe2\
+\xddE\x02\xeaW\xb3s\xd7\xdc\xd2\xa7\xa6\x00\xf8\xd4\xd0\
+\xe1\xa3\xbd\x13\x9a|\x93'\x85f  7[\xa9v\
+\xc5A\xed\x97\xf7\xa4\xb6\xfeq\xff\xadiM\xdb\xcfj\
+j\x15\x01\x07\x11\xd9\xf2\x1e\xd0\x85A\xcf/?\xffk\
+\xa5K\x88\xb8\xa5\xe0C\x16\xb7\xe5\xe6}?\xffn\xed\
+\x95u\xd2(@X\x19\xfb\xf8\x0f]\x7fLRV{\
+\xb5Z.?\xd4?%\xc8\x82\x0a\xa8\xbb3{\xb7\xa7\
+\xb6+\xa0\xce\x0cL\xbf\xae\xfa:\x89y\x09\xa8K\xe9\
+\xba\xb9\xf5\xe6~u\xc8\xaa\xee\xa9@\x07\xdeiu\x90\
+ky9\xd25T\x1c~d\xea\xb4\x19\x0a\xbbS\x82\
+\xb3O,\xbbX;\x7fc\xbe\xdd\xa4\xc0[-.\x14\
+6$Q\xae\xc2\xdcll\x9eS9\x11\x00\x11\xbd\x18\
+\xf8h\xf05-hnJ\xee\xfbf\xed\xd1>dn\
+\xea\xc4(\x94$\x08D\x1c\xd8U\xdb\x1e\xd9\x98hE\
+\xa0Y\xe1y\x97\xd7\xfcl\x5c\xf0\xd0\x0ao\x8d\xd8H\
+\xb5Y\x11Y\x856\x96y\xaa&\x06\xa7\xae\x89\xbd\xab\
+\xefCy{\x936\xa2\xa6`\x5co\x13\xe2\x98_r\
+\xf47\xca/Q\xdd(E\x04\xc0\x81\x86x\xec\xde\xce\
+?6\xfa\xc6\xd4\xc9\xf5u\xde\x86E\x91\x85^\x90\xba\
+\x94\xae\x04%\xe2<\xd5\x92\xd9\xbd-\xfd\xf9\xe7\xe9\x96\
+\xeelW\xb3\xaf\xe9\xe2\x8a\x8b\xce+\xff\x866\x12\xbd\
+'\xbd\xfb\xb6\xb6_\x0e\xa81,4\x9bS K\xb1\
+Z\x19\xc5\xd7\xf08r5{t\x88\xf3y\x99\xff\x07\
+\xf5\xf7\x87\xa4\x12\x04d\x08q\xb5/,\x95i\x0b\x88\
+\x09\x0a,B\xe3\xc3\x9a\x1fv8\x98\x9a\xaa\x91\xd6\xc0\
+\xbb\xa3\xcf\x8f\xec\xce\xbd\xd7\xeeM\xeb\xac\xf8\x93\xcb\xa7\
+\xffm\xd2e\xb2\xd5\xdbB \xc8)p\x91\x13\x5c\xbf\
+\xfb\xa9\xc7:>\x00\x82\xa8T\xf2\xd31\xf7\x06X8\
+\xe7\xd6\x1b\x93\xf6\xeeJ\x91\xb8-\xf1\xc9\x03\xfb\x7fE\
+6\x010\xca\xdfx\x07\x17gK\x84\xa9\xc1C\x7fX\
+w\x93l\xb9\xf2h!\xcc\x1a]D\x80\x18\x8f]\xb3\
+\xf7\xea\x94\x9aZ\x189\xee\x82\x8a\x8b\xfc\xcc\xaf\x19E\
+\xb6+\x1d\xbb\xd3-=J\x1f\x01/e\xa5\xe3\xfc\xe3\
+\xab<\xd5*\xe7Z\x1e\xf9\xca\xc0K\xff\xec{\x22\xc3\
+\xb9\xadqS\x94g\x90\xb5\xc4%\x00\xcf\x88\x9b\x12\x05\
+H\x1ayah[\x07\xeb\xa4\xd2o6\xf9\xa7\x22\x02\
+c\xf4V\xdfc~\x16*\xf3T\xa3\xa0P\x8a6\x81\
+g\x14\x9d\x96s\xd2\x03\xcc\x07T\x1bs\x11T\xed\xad\
+]5\xb4\x5c\xfb\xe7\x1d\xc9\x8e\x8d\x89\xfd\xc7\x97O\xf5\
+\x0bI\x17\x89\xado\x82\xbd\xe9\xd8\x15;\x1ez\xb1g\
+\x1d\x00\xc8\xc0\xbeW\x7fk\x85\xa7F\x97\x98\x162%\
+k+2\xc9\xf5\xf6EP\xe9\xa9\x8bx\x22\x1b\xe3k\
+\xa1\xd0\x843\xd9\xcbu\xdbV\xd6\xecm\xbc\xb6\xee&\
+\x19$\xca\x0d\xb5B\xaf\x991\xcfD\xef\xc4\x0f\xe2\x1f\
+\xec\xc8\xb4\xbc:\xf4*\x81Z'7x\x98?\xc8\x02\
+u\x9e\x86f\xdf\xf8q\xbe\x09\x0d\xde\xd1~\x16\xd4\x8a\
+\xc3\x95\x89\x8f\xee\xed\xb8\xe7\xbd\xd8\x87*Q\x9e\xceW\
+\xb1l\xc1\xc2;\x10\x16!\xf3Q<\x9b\x0c\x0d4(\
+r\xfd\xe8\xbf!\xb0~\xb5\xed\xa9\xce;\xa3R\xc5\x05\
+\xb57h\xfb\x07\xcbY\x17\x88\xb6\x04\x0amm0\x00\
+;tm\xb7z\xb1$\xdb\x19\xb2\xa7:\xef{\x7f\xf0\
+M\xf3\xc5\x1ao\xe4\x8a\xba\x13N\xab8\xbc\xd1_\x01\
+\xa4\x12\x10\x03\x96\xe5\xb4>\xb1\xef_]+\x9f\xe8\x5c\
+\x91\xe4\x8a\xa6\x06tU\xdd\x8d\xe3\x033\xc0\xd6\x9es\
+\x02\x1c\x0c$\x09$\x85\x14.d\x09h\xa4i\xff\xe8\
+\xb8k\xd5\xd0\x0a\x1b\x01\xad\x88\xcb\x85\x00\x0d\xbeQ?\
+\xa9\xbb- \x05\x90\x83)\xd1e\xba43\xb3\x822\
+\x0ee[z\xcb\xef\xdb\x7f\x1b\xa3\x04\x10H\x80\x93\xfd\
+\x87L\x0bLi\xf04\x84Y\x84\xa1\x94\xe4\x89\xcel\
+\xc7\xb6\xf4\xf6O\x92\x9f\xc4y\xca\x06\xc5\x17\xe2\x9cR\
+\x01\x05Ws\x01\xe1\xc8\x09b\xb9\xbbYakU\x0b\
+\xa1ZTv\xfe\xfc\xe8\xd9\xdb\x93+\x9f\xea\xbe;C\
+\xa9\x1f\xd4\xdf]\xed\x1d-\xa4;\xb6b\x17MSC\
+\x02\xd0\xd5\xef\x10\x00\xd2<\x11d!.\x88\x98\xe4*\
+F\x0a|y\x22\xe2\x7fm\xfb\xf5\xa6\xc4z\xf1\xb8$\
+\xa4*\xb9\xa4)P\xedAO\x8c\xa7v$\xdb\x06\x95\
+\x94y.Q9\xfa\xed\xda\x1bF\xf9\xc6;.&\x89\
+K\x95\x80\x00\xde\xee{\xe6\xc3\xd8\x1bu\x9e\xb1\xb5\x9e\
+1\xb5\xde\xd1c\xfc\xe3\xeb\xbc\x8d\x19\xcaho\xcb\xf2\
+\xd4m\xbb\xaf\x1aT\x87\x04s\xb4B\x0dx\xed\xeb\xc7\
+\xfa\xc6\xfe\xa0\xfe\xe60\x86\xcc\x01yD\xbbTf\x0e\
+\x84\xc5\x91\xfa\x95\xbe\xbfv=\xb8!\xf9\x99\x9d\x8bM\
+6\xe8\xdeL\xbd@\xb0\xca\x84\xe2Kw\x1b\x94\xe3\x08\
+a\xf9v\x14,\x22\x8aa\xa1$\xdbHj\x18\xc2\xd9\
+\xd5\xd7~\x16\x7f\xfb\xa9\xee{UP\xa7\x05\x8e\x9c\x1b\
+],\x90\xe5m\xfb8ZI\xb7m\x1d2\xc4\xd7\xba\
+\xff99|\x187\xfd\xdd\x9d\xbff\x05;C\x96\x89\
+\xcd\x0c\x1f\xad@jWj\x9b\xf0\xe0a\x8cg\xf6\xa5\
+\xfbv\xa7\xbb\xdb2\xfdi\xaej\xc1\x89\x01\x1c\x19>\
+\xf6\xca\xba\x9b\xca<5\xb6\xcb\xe9<W=\xf5/\xf5\
+V.\xeb\xfdWGv\xff\xe7\xe9-\xeb\x13\x1f\xbf;\
+\xf0\xd2\x9b}\xcf\xb4fZ\x92<V&W\x84\xa4H\
+D\x8a|\x1a_i\x14\x0a\xdc\x0c\xcc\xce8o\xe4\xd0\
+3B\x87_S{\xa3\x1fu\xd7\x1f\x87\xe7\x87\xa8c\
+f\xdf\x16\xd0\x87\xfe\xf9\x91\x05\xe3}\xe3w\xa6\xb6\xc7\
+xB@\xd41wD\xd8\x92\xb2\x83a\x13\xe7|-\
+mt]@#J\x86\x8aO\x83\x00\x10\x9a}\x93=\
+\xc0\x96\xf6\xfeY\xebI\x9e_}mD.\xd5%\xa5\
+\x04=Q\x10\x05\x91\xcc\x1c\xc3\xc0\x848\xa8\x0fu\xdc\
+>'\xba\xd0\x87~\x17z\xac\x1br\xa1]\xc6\xc9\xa1\
+\x99\xd3\xc3\xb3\x12\xea`Wv?9m\x96\x01\x80\xa2\
+R\xe9\xbc\xe8\xc2\x0b\xaa\xae\xf9J\xe9\x22\x99y\x9c%\
+\x9d\x0b0A\x80\x10\x92J6\xc4V\x0e\xaa\xfdf\xe0\
+RAm\xcf\xee\xdb\x98X\xf3\xce\xc0\xf3[\x12\x9f\xd4\
+xGmO}\xa6Ud\xf3JN\x98\x11\x9e\xdd\xaf\
+t%H7v5\x8c\xe1\x11\x81\xca\xe5\xaa\xf3*.\
+=\xa3\xe2\x02I\xc3\x8d\xc4\x09\xfa\x1c\xc9\x1a\xf3\x87[\
+\x1dDP\x89\x08\xe1\xe5\x81\x17TP\x89\x0a\xa0\xc1X\
+\xc4}\xc3\x9ck\xea\xe2XX|\x07~\x84 P.\
+\x8f\x0c0E\x89\xe7z\xffB\xc0\x80`Rpz\x83\
+o\x1c\x01\xb7q\xc2\x8c\xed\xc4>\x84h;\xa3\x8d\xf1\
+\x95i\x9e\x19P\xba#\xde\xa8\xb3\xca\x13\xebq\xb2\x19\
+\xf6h\xfc\xd5:o\xd3\xc5u?\xce\xa8\x89\xcf\x93\x1b\
+\xda2{\x86\xb2}\x04\x14\x91K+<\xb5\xa3}\xe3\
+\xab}\xa3\x80\xb4)\x17\x9e[V-\xeb}\xec\x98\xd2\
+SC\xac\xd4\x0a\x02\x9a0\x13\xa8S\x023\xf7fv\
+9)K\x00D\xd0\x92\xde\xde\x92\xden2\x9d\xb6&\
+?\xbb\xb9\xfa\xc1Ee\xe7veZw\xa7\xb6tf\
+\xdb\x93<\x86\x80ere\xb3oJ\xb3o\xa2\xe1\xbe\
+'\xb6\xa1L\xef\x0e\xa11aKa\xc4aK\xf6\xb7\
+\xee\x072\x94u\xef]j\x93\x8a\x04\xae>v\x05s\
+g\xca)\xc0Ik\xa6\x1e\xd8\xcfHx\xf5\xa6\xad9\
+Qkf\x8fY\xb1,(]\x02\xc01G\x1d\x0f\xf3\
+\x8b\xcdj\xafo\x88\xaf$\x84$O\x98\x8c\x0b\xa3\x11\
+i\x80\x80Z\xe5\x8f.d,\xad!\xeee\xc1)\xa1\
+9SBst\xf1_\xf3\xb1\xd6V\x8f\x9br/\x81\
+\xe2c\xfe_\xef\xb9\xe6;u?k\xf4\x1d\xe2p\x88\
+\x1f\x17<\x04\xfa\x9dW\x5ct\x840\x93\xfe\xeelg\
+Wz\x7f\x85\xa7\xa6R\xae\xad\x0a\xd7\x02hA\x8d\x19\
+\x959\xb7%\x95b\xcaE\x06\xa5%\xc7\x10\x93\x8c\xc5\
+L\x08\xaf\xf5?\xbb=\xb5\xdd\x02\xb5\x88\x9c\x17\xf4\xa0\
+\xec/\x9d\x7f`p\xb0?8\x82\xb7\x99\xd3\xc2\x08U\
+\x9e\xba\x89\xc1\xc3\xd1\xd2\xcf0\x7f\xac\xc2\xdf\x94@4\
+\xb2@\x04\x00\x0fz7$V\xe9\xbb\x13\x22\x102\xc4\
+O\x06\xdf\x89\xf1>=\xea\xa1\x0dh\xb7wa\xd1\xee\
+\x10\x09\xe2\xeaq\x1c,\x81\xe3s\xb0\xd179\xae\xc6\
+\xefm\xbde}l\x053\x0f\x14\x09\x00\xea}M6\
+\xa8\x10aN\xf8\x98s\xca/\x9d\x15\x9eW\xc2J\x8c\
+\x08\xa3\xdb@\xedM\xef\xb0\x09&hvcv9;\
+\x02\xcb\x8a\xce\xe1\xf5G\x80Z\xcc2'\x06\x09u\xcf\
+\xb5}\xe9]\xff\xee\x7f\x1aD\xa7L\x1cA\xb9\x5c\xb0\
+Y\xee\x9e\x1c\xcb\x07\xb1n\x8a\x11\xd3\xb3\xe7k\xc6\xb4\
+&\x01\x1dU\xb2\x88\x93\xe6\xe8M(\x8c\x9a\xda\x84\xc3\
+\xec \xb6v\xf5\xdb3{\x12j\x02\x00<\xe4\x01\x22\
+\x86\xd2K=\x8f\xb4\xa6w\xce,9\x9e\x0c\xd7,2\
+[&D\x94#vc\xd2\xc9\x9cS\xa3\x86\x1f\x9e\xe8\
+f#\xee\x22\xd5\x9ez\x00RH\xfd\xaf\x8e;/\x86\
+\xec\xe1\xe1\x05\xe6\xe4_T\xae\xf0I\xfe\xb4bu\xcd\
+\x06\x95\xfe\xf95\x8b\xe7\x03\x97Hj\xcb\xec\xde\x98X\
+\xbd!\xbe\xfa\xf3\xd4\x16 \xecQ:\x08\x89\xe5\x110\
+#p\xb2\xe4\xb4\xd8\xc4l\xb3\xe5\x86\x0c5Y\xf1-\
+M\xe9\x07\xba\xeeV\x89\xdb\xceVd\xea\xd2\x01o\x10\
+\x94o\xd4]\xcec\x87Y\xe4n\x86E\xad!\x11@\
+\xd6\xabq\x9c\x199\xd6,\x0cl\x002\xbad\xfcF\
+\xf6\x8a\x00\xb03\xb9\x11\x00\x81\xb8\xcc\xbc\xc8\xf0\x99\xce\
+\x07\x96\x0f\xbc|u\xfd-\x80\xdcFQ6\x81\x18\xe1\
+|\x18\xb2,\xa5=\x9a\xb2\xb1\xa5Z\xaf\xf1v\x10u\
+g\x0c\xa7\xbf\xa8\xf9\xeb>)$\x81\xa4\x02\x11\xc0\xdf\
+;\xee\x95\xc1;-r\x94\xd6\x93\x92\x90\xf9)\x90\x06\
+\xcb\xe4{wf\x87\xf6\x11\x0a\xa8\xd5\xdeQ\xd5\xdeQ\
+'\x94\x9e\x99Tc\x1b\xe3\xab*<5\x96\xd4S\xae\
+\x98\x8b\xce<ur08\xd8tW\x8c\xa62\xe9\x8e\
+U\x84\x7f\xee\xbc\xab+\xdb\x95\x93\x1d\x15\x93k\xe4\xb6\
+\x13]\x19`\xe8\xaa\x918B\xe1\x1f\xe7\x9b\xa9\xf8w\
+\x99rS\x13\x03\xd3#r9\x022DD\x01?\xc4\
+|\x96 VJ\xb3'\xbd][\x18a)\xfab\xd7\
+#\xcb\xfb_\x19\xe3o\x9e\x1c\x9ae\xbarA\x0e\x0b\
+\xcbbC!\xbd\xdb\xf7\x9c\x0a\x8a\xc0\x1b\x13\x9fP\x1b\
+\xb4=\xa8\xf6$\xf9\x10\x09\x1f\xc2t\x06\x8e\xfe\xf3P\
+\xe7];\x12\xeb\xf4c#\x08\xca\xa2\xe6?$\xd5D\
+g\xb6\x95\x84\xb0\xc4\x81\xfb\xa5\xe0\xcc\xc8\xb1\x8d\xfeI\
+\xe8V?\x0b\x8d8 \xd4\xe2\x14\x92]\xcbU\xf3'\
+$\xb2\xe6\x06\x09\x00\x88=\xd3\xfb\xe8\x86\xe4g`\xa3\
+*\x15\x9f\xca\x14\xb0\x18\xc7\x82<\x1fdn\x10\x0e\x1d\
+\xe8.WL\xfe\x05\x00pXh\x1e\x80\xaa\x19\x100\
+\xa1w\x91\xe3\xd4juW\xb5\xfc\xc6\x83\xf2\x9e\xf4v\
+\xed\x03?\x8e\xbf\xfaz\xff\xb3\x80pN\xc5\x15\x5c\xd7\
+\x1d\xb3\xe1F\x8eZT\xcb++=\x0d\x8fw\x18R\
+C(\x0e\xb1#\xd9\xd5\xd1K\xe5\xea\x07\xf6\xdf\xda\x96\
+\xdei>\xc8*e\xb4\x91\x8c\x0aO\xf5\xc4\xc04\x95\
+\xe8/\xedwtd\xf7\x82}\xee\xdc\x8c\xc1{R\xdb\
+\xad\xb4\xce6\xa2\xea,-\xcd\xfc\x98\xcc\x0a\xcc0-\
+\xb3- \xcd\x83\x8d\x88P\xd7\xef\xd5\xfe\xbf|\xe8\xd5\
+\xd7\x87\x96\x01G\xbb\xf53\x0e\xe7\xbb\x83#\xbc\xad.\
+\xa3\xdd\xccn\x0b\x93o\x0d\x16\xf82,\x8a`o\x1b\
+\x8bS\xa7\x86g;L\xaa\xd0\x86\x92\x19Y\xb5v\xc5\
+,-&PI\xed\xc8\xb4j-\xd2e\xdd\xcf\x00\xc2\
+\xb1\xa5'5\x06\xa7X.7\x94+\x9a@\xe2~~\
+X\xe4\xa8]\xe9\xadk\x06\xdf6\xb4(\x89\xc8\xee\x8c\
+\x03\xa6k\x83:58\xe7\xf7\xad7\xeeIn\xd6\xf6\
+\xaa\x14Oj\xaf4\xfb&\x1d\x17Y\x0cH)\x9ey\
+\xb0\xf5\xb6\x14%\x00X\x8a'\x1d\xe6\xe7\xfb3\xbb\xc8\
+R\xc8\x16\x0d\xce\xc9\xa0\x8eX\x96\xd7H\x8e.\x09:\
+6\x1e\x124\x945I\x0d\x15H%\xf8(\xfe\xce\x13\
+\xbd\x7f'Gk\x82\x9cn\xdaE\xc4\x08*`\xae[\
+`\x07\x1a6rQ\xfe\x95\x88\x05?\xdd\x95\xb0\x85U\
+rmT\xae\x02\xa74\xa0\x81\xd3\x8b\xa5\xbc\x8d\xbf\x87\
+\x000\x90\xedNS\xca\xfc\xa7Z\xb9\xfe\xf4\x8a\xcb8\
+\x09\xbdzk'\x13]n,\xd6\x05\x07XRy\xd9\
+\xd2\x9e\x87IOC\x0c\xf8\x92\xc8\x18t&Sh\xf7\
+\xd0\xd0\xac,e\x1eh\xffUGf\x0f\x00ve\xda\
+4\x96\xc9\xa4\xe0\x8cC#\xb3\x83,\x08\x00\xbdj\xef\
+\x7f\xb5\xdf\xc1IM\xf1\xa4C\xd3o\x7fz\xb7\x89\x80\
+:\xa6\xb1\xc4=B\x1f\xa0F\x12\x0a\x09\xb2(\xce\x16\
+\xc4\x80d\xbd\xa6-\x13\xf6ql\xf9\xa3]\x0f\x12\xe5\
+\x18\xe5\xe2\x01\x84\x11\xcc\x03\x1e\x16Zy\xac`h\x1c\
+\x01\x1e0|\x03\xc4\xe0\xe6M\x0e\x1c\x96\xa54\x8a\x8b\
+\xc3\xd1\xc7\xd2\x904\xb4S8\x00\x00\xa1#\xbb\xcf\xc4\
+\xc0<(\x7f\xbb\xfeg\x12z\x86\xdb$5\x9f\x15\x0b\
+\xd1\x9d\x1a>j\xac\x7f\xc2\xda\xa1\xe56\x08\xca\x8ct\
+:]\x02\x90\xb0)0\xc9\xcf\xfcI\x9e\xfa\xe3\xfe[\
+\x13|h_f\xa7\x16s\xa7\x04gr\xe0\xb3CG\
+k\xdb\xda\xd6\xe4\xc6\x7fw\xff)\xc3\xd3\xa6\x9a\x9f\xb6\
+\x19\xee\xce\xec\xf0I>\xb1\x8c\x14M\xc1Mc\x16\x93\
+\x05`j\xec\xebb\xf2hl6\xc2\xca\xd3<\x099\
+\x00\x00{c\xe0\xd9\xc7{\x1e$A$\xd0\xda\xedh\
+D\xe00\xbaA\xd5E\x95\xfe\xff\x838\x90q\x05G\
+\xfb\xc63`@\xe46\xe8\xa8g\xb2\xcc\x0c\xe0hs\
+BkO\xefE`\x84\xc0\x08\xbf]\xfb\xd3J\xcf(\
+k\xcc\xcf\xa6h\x02\xa2\x8a\x94\xc9F3\xa8C\xfc\xc2\
+\xda\x1f\xee\xcb\xec`\xc0D\x0b\x18\x01\xc9\xd4\xa3\xa1\xc2\
+\xb3\xd3BG \xe0\x80\xda\xff\xf7\xf6;6\xc7\xd7\x00\
+@\xa3oB\x89T\xce\x00\x0f\x0d\xcd1\x9f\xf3\xb7\x06\
+^\xd1DtI\x90\x1bO\xa8\xf1\x8d\xf1\xd5h\x84*\
+s\xdb!\x13\xdc\xb3\xa8H$\x14\x1bF\xa2C\x96^\
+\xbc%6ID\x00i\x9e~\xa8\xfb\xae\xe7\xfb\x9e \
+\xbbtI\xc1\x8d\x07\x8b\x0eg#(\x92d\xf8\x82\x7f\
+(\xbfJ\xb0N\xeb\x1e\xe3\x9f \xd00\xd0\x5cI\xc2\
+\xec{^{\xf1\xael\x9b\xf6\x05\xc7\x96\x9e2%|\
+\x04'{\x84c\x98g\x1b\xd5\x89\xaaf@\xf0`\xe0\
+\xf4\xaa+8\xf1<\x94_\x8dU\x8f\x048\xc9\x7f\xd8\
+\xaa\xc1\x15\x00\xb8-\xb5Y\xdb\xc9f\x87\x8fQ@a\
+\x80\x13\x83\xd3\xbc\xe8\xc9\x80\x22\x90J\xc0\x1c1\xd3\xce\
+\xf6\xbe\xb6['\xf8\x0f=\xbd\xec\xa2\xd1\xfe\xf1\x06;\
+\xd1\x22\xb7b\xbe]\x9d\x1c\xa69\xfa`\x1c\x01!\xc3\
+\xf5\xb1\x0f\x97\xf6=\xda\xaf\xf6Y\xf8\xc6\x88K W\
+\x1a\xb0k\xd6<\xcc\xc8\x97<B\xf8\xa7@\xc3\xb6\xe0\
+2\xb7&,x\x8d\xb7\x1eD\xda\xbc\xc0\xef\xc9w\xec\
+\xda\x9f\x19H\xed\xd9}\x1azV&W\xf2\x5c\x0c\x89\
+\x1cT\x0e\xc7u\xb2{\xb8\x11\xcb\xf1\xf4\x10\xf8`\x86\
+:\xc1\xd4\xf0l\xd6\x85\xaa\x11\x04\x11\xf0\x88\x92\xe3P\
+7\xaa\xf14\x07\xa6lI~*\x80$d|\x8d\x05\
+\x07nKm\xfc\xdd\xfe\x1f\xcf\x8e\x1c}z\xf9%a\
+\x16\xb5\x8d\xfc;2~\x81 Kd\xb2?\xf4\xa3L\
+\xf1\xc4\x9a\xd8{\xef\xc5\x96ud;\x04^\x92+b\
+\x95o\xb6\xcb\x15\x1e\x84\xfc6p\xc3'3\xf9\xba\xf1\
+_h C\x11Q\xc6\xa8'\xda\xe8\x9b\xac\x93\xfa\xc4\
+\xfe\x85u\x93\xdc\xb71\x09\xd9\x0b]\x0f\xa7x\x0a\x01\
+\x8e\x8c\x1c_\xefk\xcc\xbf\xe9Y\xb3z\x162\xe8^\
+<\x16<\x0b\x04\xaf\xec\xdf\x95\xd8\xd2\xa5\xb4k\x9b\xe3\
+\xd1\xd1E\xd3\xc2_1\xf0i>\xa8\xf4lM|f\
+\xa0\xd7.n\xe8Fj\xca\xf6g\xf6\xbc;\xf8\x12 \
+4\xfa&i\xb5\x8b\x95\x14\xe5\xf0mL\xa3O\x14\xb6\
+,\x1f\xf3\x8d\xf1\x8e\x9f\x18\x981=0g\xb2\x7f\xc6\
+\xd4\xe0\xacC\x033{\xd4\xfdC\xea\x90\x136\x1c\xe6\
+\x069\xa0B\x1c1CP\xc8\xbb\x0fr\x01\xe1H\xbe\
+R\xcf26\xc6\xd7nI\xac\xad\xf1\xd4Wx\xeb\xc8\
+\xdel\x12\xdf\xea\x001\x10@\x81\xec\xf3\xdd\x0fk\xbf\
+0/zB\xa5\xb7\x0e\x9c\x86\xd5\x16\xe0c\x00\x93N\
+>\x89c\xf58\x91'\xca\x19$\x22\xf0I\xbe\xb5\xb1\
+\x15\x00\x18\x90\x02\x97\xd7\xfe\xc4\xcb\xfc\xe6|\x80J\xea\
+\xca\xa1w\x04\xf0\x88\xf2s\x11\x80\x03mOn\x5c\x13\
+{\xb7\xcaS]\xed\x19\xa5\x05D\xb1\xcebzQl\
+\xa5\x87\x5c\x98\xf1Q\x81s \x9f\x14\xa8\x90\xeb\x83R\
+xwj\xdb\x9b\x83K\xbb\x95N,\xea\xe2S\x9e\xda\
+\xb9\xf0X\xdf\xf0\x9f|\x909\x109}b\x8b\xe2\x98\
+`Kj\xdb\xdd\xfb\x7f>\xce?iQ\xf99S\x83\
+G\xaa\xa0\xda\xcf\xc6\x1c\x84\xb3\x05\xea~\xa5\x9b\x03!\
+0@\xf2\xb1 XC\x87\xb6\x89Jk(Yl\x1c\
+\x81\xd3\x84\x94\xdcC\x97 \xc3d\xa4#\xd3B_\x19\
+\xed\x1d\xbb/\xb3\xfb\xa2\x9a\xef\x87\xa4\xa8\x1e\x89\x11\x18\
+\xe0(_\xf3\xb0\x0a\xc7vp\x0fz\x94\xae\xbft\xfe\
+\xe6\x90\xc0\xf4s*\xae(\x93jE\x87\xde\xed\xa9\xcf\
+z\x94\xb6\xd9\xe1\xe3\xb5\xf7\xa6\xd4\xe4\x8a\xc1e\x12\xf3\
+D\xa52\x0fx\x15P\x86\xd4\x81\x1e\xa5\xbd%\xb3m\
+\x7ff\x97JE\xa1\xce\x05\xb1=WJ\x05\x8e\xa4\x1e\
+/v.lX\xac\xb9\xd8\x1dH|\xf6\xb5\xdf)\xf7\
+\x94\x1fS\xf2\xd5Y%\xc7\x97\xc9\x95*\xa8BdG\
+\x91\x11A\x00-\xc9Mw\xb7\xde\xa8\xf5\x10oi|\
+\xb0\xd2[\xab\xcf]\x1a\xd2B\xd6\xe6a\xb9\xb4\x8a$\
+e\x1b{\xd3\xdd\x8bZ\x10\x04#K\x87\x9b\xe2\xea@\
+\xbf\xd2=\xda?\x91\x88\x83@m\xf5\x80\xf7\xc7-\xdf\
+\x88\xa91\x0b~!\x02\x18&X\x9a\x94\xc9\xe3\xa3\x8b\
+\x17F\xcf\xf12\xafN\xd6@~g\xeb\x8f\xe2\x14_\
+\x14=\xfb\x88\xe0\xb12zb|\xe0\x1f]w\xefH\
+o\x86\x1c}\x8f\x9c[r\x00&\xbf\xe06\xf3\x85n\
+\xd4\xb3\xbc\x1fk\x860\x1c\x81\xe0\x86;B]\x84d\
+\xa2#\xe0 \x00A\x92'\xb7&\xd7\xbf=\xf0\xfc\xb6\
+\xc4z\x95\xb2%RiX.\xe1\x9a%\x86\xcd\xae\x14\
+v\xa7\xb6\xae\x8d}\x88\x88\x04\xfc\xe4\xb2s<\xba\xf8\
+\x8d\x15\xf3\xac\x89e\x03\x1b\xb4X\x8e\x84\x82\xa8B>\
+\x84\x9f\x0c\x1e\x91\x9dJ\x8b\xe8e>M\x8f\xc6q\xd7\
+\x10pCbU\xaf\xda\x0d:\x14H#\x88\xfd\x08-\
+\xe9\xad+coE\xa4H\x9d\xa7\x91\x108P\x93o\
+\xf2\xbbC\xcb6&\xd7\xac\x18z\xb97\xdb\x11\x90\xc2\
+\xc7G\x97\x00\xaa-\xe9\xad9\xde\x03\xf6\xf5\x7f\x80,\
+\x1f\x17\x1b\xd4\x11\xed\x0b\x07\x9c\x03a\x0ea\xb6\x88|\
+\x08\xb1\xc0\xaa\xeaQ\xba6\xc6W\xbf\xd3\xff\xc2'C\
+\xef\x0dd{\x91xT\xaa\xf0\xa2\x97\xeb\xc3\xf0\xf8y\
+j\xe3\x86\xf8\x1a\xedN/*?\xdb\xc7|&\x9aK\
+d\xf3\xf452 \xcc\xe1p \xba*\x0e\x0b-[\
+\xf7kH6^\x87\xa9\xf2\xa1\x02\xdf\x93\xda\xb6'\xbd\
+\xd3e\x87.\x06\xc8E\xccP\xfa\xb3\xc4\xaaO\x12\xef\
+\x97Heu\x9e\xc6\x90\x5c\xe2C\xef\xd6\xe4\x06\x85\xd4\
+\xd6l\xcb\xda\xf8\xfb\xcb\x07\x97&x<MIN\xaa\
+\xcb\xfd&*\x92T\x9c\xe7\x98(\x07z\x1e\xd9J\x94\
+\x8b[%\xc5\x80\xd1\xc5,9\xb2#\x17f\x0ec\xd9\
+\x86\x11\xc0\xfe\xcc\xbe\xfd\x99}\xaf\xf5\xfd\x1b\x80\xd7\xfb\
+F\x8f\xf3O\xa9\xf76\xd5\xfbF\xb7\xa7w[\x19\x0d\
+\xe7$YO\x9e \xeb\x9ds1\xc9\xceq\xccQP\
+\xb2A\xb8\xa2&7:0{\x13\xa4\xd3\x07\x0a\x19\xb0\
+\x8e\xf4\x9e\x01\xb5\xd7]\x06Q\xb0\x18p\x06\x05\x12<\
+\xd2\x00\x00\xb0+\xd3\xf1H\xd7\xdd5\x9e'\x8f-Y\
+<7r\xe2\xca\xf8[\xed\x99vm\xd5*@m\x99\
+V\x91\xa5\x02b\xcfcd{O\x01\xb9\xe6\x91\xd8\xa1\
+\xd8\xb7\x84\xe0\xc8w\x9d\x02GF\xc3\xb7Ql\xd73\
+\x8f\x8c;\x8a\x026\x0e6\x18\x10\xd0IeK\xa6\x87\
+\x8e\x1c\xe3\x9f\xe8a\xbe,dQh[\xa0K8\x15\
+\x8e\x8a\x5c\xc3\xbc\xf3\xc2\x9aY9\x19S\xe8\xda\xec\x18\
+\x02\xeb\xca\xb4\xedLm\xda\x91\xda\xb8)\xfe\xc9\x80\xda\
+\xab\xc3O\xf9\x86\xaa,c9\xca\xd9tsJ!4\
+,\xef\x91\xa9\x02\xeax\xd0q\x8a\x86\xeb\xaeS\x9e\xbe\
+\xf8\x17\x96D\x17\xb9\xaa\xb0(`\xdaa$\x80\xc3\xc3\
+H\xe2D\x95\xd5nD\xf2\xa2\xb7\xc1\xdb\xd8\x14\x98T\
+\xef\x1d[\xeb\x19]\xe3\x1dS&\x97g!\x9b%\x05\
+\xc5\xb2\x1a\xf5>\xa91\xfa*nB\x0e\x93\x1c=\x0b\
+\xe6D\x12c^\xf0\xc6\xf8PW\xa6\xb5=\xb3\xb7-\
+\xb3go\xfa\xf3]\xe9\xedq5\xa6S\x98\x08]y\
+\x1c\xf9}\xd7\xf3\xe4\xa6\xe8\xfeOy\x9d\x8d\x0fp\x01\
+\xe5\xdd$\x87\xdb \x0a\xedI\x07\xb9\x80\x0a\xf0\x1dG\
+\xfaI\xe2\xde\x0e.\x0da\xa2\x9c\xf1\xe1\xdc\xd1\x14\x92\
+\xd0S\xef\x1b]\xebi\x08I\xd1\xa8\x5c\x11b\xa1\xb0\
+T\x12\x94\x22^\xf4\xfb\xa4\xa0\x9f\x05<\xe0\x91$\x0f\
+#\xcd\xec\x87+\xa4d)\x1dS\x872<\x95Tc\
+C\xea@\x82\xc7\xfa\x94\xae\x982\xd8\x99im\xcf\xee\
+K\xf1\x149y\x03n\xbafTP\x94\xa9\xc8\xb0\x80\
+x\xd0\xbcwp\xdbT\xb0\xe8AA:\x80\x15\x10\x84\
+/\xe0\x07G \xbbY8\x00\xba\x84D\x81\xd8k\xff\
+\x0a\xd1\xe1\xcf\x86\x11\xe8\xcd\x11\xfb\x8a$\xb2GYB\
+1\xbf\xb6I\xe2\x0bmI\x02q\xdf\xcb\x7f\xb3r\xee\
+\xca\x08j\xb2\x03\xee'Q\x9e]\xdfu\xe9\x14\x10\xf8\
+\xa6\x03>&\xf9K8\xc5\xe2e\xcb\xdcb4\xe4\xdf\
+\xd4\xc8\xa9Fg\xf3\xa9%\xb0\x8d\xda\xa0a\x85@\xc2\
+\x14\x9d\xa3\xd9@\xf6\xfe\xa7\xd9\xd1\xce+\xd7L9v\
+\x1fd\xccm\x81M\xb6\x88\xe8@v\x11:\xe0'\xaf\
+\xc0\x92\x1a\x96nZ8\x84\x0d\xd3L=\xf8^\x18\xe6\
+\x8f\xf0\x07\x11\xd1\x8aB\x01\x04sq\x9b\x87Z\x81\x85\
+K\xc5Q\xa5H\x10\xb3\xb7\xdc\x01\x9c\xfb,\xe2\x01\xef\
+\xfc\x07\x0d\xfdcq\xd5\x0c\x8cDK\xee\x00\xdevP\
+8P\xbe\xbf\xe6\xc2B\xf4E.#\xd7\xb5*\xd2\x0f\
+\x1d\xaaV\x0e\xf7q\x07\xe2\x8a\x08\xf9^s\x9c\x13\x1e\
+L\xac\xf9\xa2V\x0f\xe4\x98NR\x01\x5c=\x0fD\x5c\
+`\x89\xe0H\xd7P\x91\xe2\x0a\xf9\xee\x1e\x16\x84\xa7\x8b\
+\xa1H~Qk+_K\x11]@\x1aD\x97\xd2O\
+\x94\x8b\xc1\x22\xce\x12\xff\xe7\x17P>\xc0\x16\x8b\xbe5\
+8\xdc\xdd\x1c1\x1a\xf4\x85\x870,\x18>1\x7f\xae\
+\xf7\xff\xcf\xcf\xc1<H\x05:\x0f\xae\xbc0,\xa2\xca\
+9\xa8\x8b\xcf\x0eb\xad@A`\x8a\x8a\x10\xee\xc0\x03\
+\xcd\xdd\xfe7~\xf0\xcb\xf8 *:\xd5-\x1c\xd7h\
+\xb8G\x97\xbe\xa4\x0b\xcbFry\x0a[\xf58\x9c\x9d\
+\x0b'\xf9v\xd9\x82/\xfa\xb1\xf8\x123\x90/\xf8#\
+\x8a|xr\xbb\x0d\x05(`T\x5c_\xfc\x00\xda\xe7\
+\x85\x16\x10\x1d\xf4E\xa1\xe1\xe8\xb4\xc5tn\xe8\xff\xf5\
+5Rt\xe4\xa2\xe1\xd2\xde|\x17\x93\x86\xbb\x0b\x05\xfe\
+\xea\xf8\x15:\xf8\xcd\x89\xfd\x0f\xde\x8c\xdc\x9c\x9a\x86#\
+SR\x11w\xf7 \xf1\x16\xfa\xd2\xb6\xbd\x22\xebgt\
+\x9d9\x1f\xae\xf2\xa4\x22\xc0\xb4ak\x81/2\x84\xfd\
+oU\xa4\xb9\xb9anQ]\x18h\xc7\x91,b\xca\
+\x93x~\xd9I\x13\x15L\x87\x1d\xbbE\x81\xb0Ny\
+\x98\xf0X\x98h9\xdc\x80\x0e\xfe\xdf\xbc\x80\x5ce\x1f\
+\xf2Ud\xee O\x9e7\x0c\xbb?\x0d\x9bZ\x1d\x18\
+\x85\xef\xe0\x83\x1d\xe5\xac\x98|e9\x15\x1c\xe3\xa4\x82\
+{R\xf1\x15\x01\x8d\xe4\xcd_\xee\x02\xcaE\x80h\xb8\
+\x84\xba\xf0SBEpH\xa0`O\xa7\xf0?\x8e\x80\
+\xba\x90\xe7\xa98\x98\xca\xcbMQ\xc2y\xe2\x98\xe3\x98\
+\x8cy\xeco\x8a/fi$\xa1\x8d\x0ef\x01\x8d\x14\
+\x9a\xcc\xc7Q*\xb0\xf6\x0b\xf4=\x0a\x5c\xdf\x11%\x1f\
+\xb9\xb2\x01#\xad\xfb\x8a\xc99\x8a_|\xe86\x00\xea\
+\xe2\x89\xec\xf6x\x148\x0b\x1c\xf9\x16BE\x8d7\xe5\
+\xff\xd8\xff\x06*y\xcf\x0b\xdf\x92\xf5,\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x08\x93\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00$\x00\x00\x00$\x08\x02\x00\x00\x00nb\x0f\xcf\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x08EIDATH\xc7\xad\
+WipS\xd7\x15>\xf7\xed\x92\x9evKB\xde\xb0\
+\x90m0f151\x10\xcc\x9a\x01\x13 \xd4\xc4\xa1\
+\x84\x94\x846\xa18\xe92M\x1a\xa0\x1d\x0a3\x19\xa6\
+\xd3t\xa8\x93i~\xb4%\xa1\x0b\x9dL\x12\x9aq\x09\
+\x09\x03\xa6\xe0\x001\x10\x13\xb3\xd8\x18\x18\xef\xd8\xc8\x8b\
+b[\xb2\xb5<IOzz\xef\xf6\x87\x8dc\x19\xdb\
+8\x9d\x9c\xb9\x7f\xde\xbb\xf7\x9es\xbfs\xbf{\x16\x04\
+\xa0\x86G\x08\x82o'x\xa2\x09\x0a\xbeK\xc1\x93O\
+\x93\x00t\x22\x881\xe3\x11\xc8\xd2\xb9\x0c5\xa1\x16\xe4\
+\xe0\xa8\xed\x13\x0a1\xfa\xc3\xce\xd8\xd2\xd9\x94\xc4\xf5h\
+\x12\xef\xe6\xf1\x05\xdb\xcc/Q\x94\xf4\x90\xdb\xd1#\x91\
+\xa1\x14\xc6~(\xed\xc0<uvk\xac\xc3/\x0b\x09\
+\xfb\xd1\xd8\x91\xc9\xe5\xec\xb2\xed\xbd\x119\xb3\xc2\x94\xfe\
+\xa5\xafy*7\x9d\x80\xac+\xe6\x8ebh\x12\xdb\xdf\
+\x9d~p\xad\xfe\xf1\x11\xbd,I;\xd8d\x84`\x09\
+\x9f\xf7\x1b{\xa9\x8e\xe29R\xb5\xdd\xf2\x0b\xbf<8\
+\x93\xa7XDM\x91C\x09\x04\x09+a\x8aP\xcd\xe0\
+f\xbd\xeb9\xb6\xdf^\xaa\x00\xae\xf4W\x03@\xaej\
+F\x16\x97\xb6\x81Z\xb6\xc5X\xb4\xeb\xfeA'\x9b\x92\
+\xcc\xa4\xde\x8d\xdc\x8c(\xa1\x9d\xa9Y\xb7\x05\xd7\x14\xc9\
+\x92\x80\x8c@\xa4\x04D67\xe7~l\xe0\xb2P\xb7\
+\xd7\xf6R\x1ak\xcfQ;\x8a\xf4\x8b\x8a\x0d\xcb\x9f7\
+\xad\x0b\xca\xbe\xb2\xd4\x9f\xff\xd6\xbe\xc3\x15sgry\
+\x0d\x91\xdat\xc6\xaa\xe0\xa9>\x98\x84;\xe3I\xbe\xc8\
+\xf0\x94O\x0e\xe8I\xd3?\xbd\xef\x97\x18\xd7\xd9i\xf3\
+\x02\xb53W\xe5\x08)Q\x0be\xd0\x92j\x9eRu\
+I\xbd\x03\xf2`e\xe0\xb47\xde\xeb\x97\xc3\x80\xd1\xd5\
+@\xf3T\xdc\x98\x80,\x8e%\x19\xa3\xb6hGU\xf0\
+\xbf\xde\xb8\xef\xabP\xedJm\x9e\x81\xd4\xee\xef9R\
+>Xu\xc0\xfd^H\x89\x00\x86\x99\xdct\x02\xa1\x8f\
+\x9d\xfb>r\xee7\x10\xda9\x9c\x93\x18\xba\xddG\x81\
+K@\x16\x079_\xbb\xdcF;:c\xcd\xbbm;\
+;b\x1dy*\x87K\xea/1\x16\xc5 \x96\xcbe\
+\xca 'Q\xfa\x80\x1c2P\x9a\xb33\xee6\x91=\
+\xfe\xbe\xa0\x8c\xf1\xa5\xc0\xedo\x85\x0c\x01\x00`|\xd1\
+\x7f\xce/G\xbe\x96\xfa\xce\x04*\xb7\x18\x9e@\x80g\
+s\x8eO\xb3\xaf\xbcpr\xe7\xac\xb7\x16\xd6\xd2-\x00\
+`\x22\xf9\xae%b\xd9\x87\x87\x0e}r\xc8\x9d\x1dy\
+\xcb]\xfe@\xc7#\xc0% \x03\x00W\xac\xcdL\xa7\
+P\x88*\xd2\xe5\xa72\x06\x02\xe0l\xb8f\xf7G{\
+SSR2\x1d\x8e\x80%\x16\xba\xe8\xd1\x92*r\xbb\
+\xf5\xbe\xabsff&\xa2\x89\x8a\xd3\xe7\xe2X\x9e\xd8\
+\xde7&\x891\xbf\x15\xac\x94{\xfe\xd2\x14\xb9u6\
+p\x91\x02\x84\x00\x90\x8d\xb2&%\xed\xf8\xc9+\x15\x95\
+\x95\x1b\x8a\xd6\xdc\x89\xdd#\x00\xf5\xf5\xf4>\xfd\xdc\x8e\
+\xae\xeen\x83N\xb7X\x93C\x93\x5c\x1e\x9f\xb7\xde\xb8\
+FM\xf1\x0f\xd9C\xe3\x13d\xe4p)4_\x9aT\
+2\x1cw\x04YV\x94\x86\xa6\x96\xe6\x966\x0c\x98F\
+\x04\x81\x90x\xc9{\xec\xe8\x11\xa3\xd1x\xe2\xf8\xa9\xce\
+\xb8\xc7H\xd9\xf2\xd5\xb3\xac\x94^O\xea\xc7\xc3\x87G\
+\xcc\xaaG\x1f![\xe5\xfc\xbe\xf1\x89\x8d\xfa\xa5\x14\x92\
+\x9b\xa2\xed5\xd1\xda\x18\x8a-xuu\xc9\xe6M\xbc\
+\x86\xff\xcf\xbfO8\xff\xae\xdc\x0a\xb7~:\xf0%\x93\
+\xa6\x11\x07\x84=\xd6\x8dg\xbcu\xef\xf7\x5c#\x01\x11\
+\x08D%\xec\x97\x02C\xd7?\xae1\x0d\x00\x1e\x01k\
+a\xcc+\xb4\x8b\x8a\x0d\xabR\x19Su\xfcRq\xfa\
+\xdcj\x7f\xb3\x9e\xd4\xdcN\x16\x80\xa1T\xf5\xe1\xad\x96\
+%\x11\x1c\x0dcQ\x02)Mm\xa4\x09B\x90\xc5?\
+\xb6\x9d\xfe\xc2\xdb<G\x97b\xa1\xf9?\xb7\x9f\x9d\xc8\
+\x18\x09\xc0|\xe3Y\x84X\x82\xd9n\xde\x9c\xcd\xce \
+\x10^hL=\xdcS\xf1FS9\x89\xc8_jV\
+\xf0\x1e\xb9\xd0\xe4T3\x94\x9a!\xf5,kd\xd5.\
+\xd1\x13R\xa2VV\xbb\xda\x92\x83\x10\xde\x97\xf5\xd4\x05\
+O\xc35\xdf\xbd\x87|\x88F\xb3q\xf8CE\xaa\xde\
+L=\x10\xc1b_\xdc\x93B[\x19JYaqT\
+x\xear\xb7,9>xC\x08\x04\x0d\xc0N\xe3\xf4\
+\x88@C;L\xb4&\xaaH\x1a\x8a\xad\xf3\xbb\xea\x02\
+\xae\x96`oY\xdb\xa9\x0c\xd6\xbe\xd9\xb4\xac5\xda\x1d\
+S\xa4\x070\xf0\x18\xea#\x00\x98\xce\xa5\x9f\x0b\x5c\xac\
+\x0d\xdfy\xde\x5cB\x22\x8a\x00P\xd1\xf8~\xb4\xf7\x8b\
+\xee\xfa\xfa\xe6\xc6}\x7f}cWyYW\x16\xfa\xd7\
+Wg\xda\x22}\xf7B}\x8d\x82\xbb^\xe8:\xec\xfa\
+\xdc\xf4b~Y\xc5\x07';\xaf\xcbXY\xad\xcf\xdf\
+m\x7f\xd6F\x9b\xce\x07nNF\xfd6\xb1\xbd_\xf2\
+l7o%\x80k\x8b\xba\x83\x12\x11\x8e\x92\x1b-\xf9\
+\x0d\xcd-\xfe@p\xe3\x96\xe7\xba\xbb\xdd\x22\xad\x9c\xe9\
+\xaf_\xff\xce\xce[^\xe5o\x037\xd6\x1fy\xf93\
+\xf7M\x97\xbbg\xd0\xe7\x1fRr)pK\xc1\xc4\x5c\
+\xb5s\xdc\x082\x8a\xa6\x18\x93\x88R\x80|\xc5\xb5\xa7\
+V\xec\xf4\xcb\xe4\xa0H\xe7r\xceu\xe6\xf9\xcd\x8f\xfd\
+\xfeb\xce\xeb\x9b\x0c\xf3\xe1\xf3.\x16\xa8\xd5\x1b\x8a\xb3\
+\x89\xcc[\xddw\xd6\x15\xff@\x91\x957\xcb\xde\x19\xd1\
+\x11\x94\xc3\x92B\xb8\xa2\xfd\x08\x01M\x8c\xa4:\x04\x80\
+\x12\x09\x02\x00\x80\xae\x08\xd5\xe9l\x8e\x91N\xae\x09\xd5\
+\x88\x0a\xa6\x80HUk~\xdc\xf8\xde<>\xf5g\xc9\
+\xab\xea\x84\xceg\xad\x05\x95\x03My\xea\xdc+B\x8d\
+ \x84F\x9f\x15\x10*\xd4.\xb4Q\xd6\x06\xb1\xf5P\
+z\xe9\xab\xc9\xc5I\xb4\xbe*X?~\xb8\xc2\x08c\
+\x00\x9f\xdc_\x17\xba\xda$6J\xc0s(u\xa6\x86\
+\xbf\x13\xe9(\xef\xbb\xf6\xd3\x94U\x11%\x96\xaf\xcd8\
+\xee\xb9\x91\x94ly|S\xc1\xf5\xba\xba\x04z#T\
+j\xd9v3|w\x93a\xd5\xf5PCc\xf8~\x81\
+&\xf7\x03\xef\xb9\xa1\x15\xc4x\x09\x16\xcbX^\xaa{\
+\xf2\x87\xb6\xd7\xf2\xf8B\x03=\xf3O\x9d\x17~\x9d\xba\
+\x0d\x01!ay\x99>\xbb':\xf8\x98\xd6qO\xe7\
+\xf2\xf9|k\x8cs\xc6(\xd0\x93\xba\x1c.\xf3\x1f\x9e\
+\x13Yl\xe6J\xedr\x152\xb1\x88\x990\x5c\x01\x80\
+\x8c\xe5\xceh\x9b\x8a\xd08T\xb3\x15D\xcc\xd1\xac9\
+\xd8\xf1\xf1j\xc3B\x06\x91,A:UV+\xa3u\
+\xd7w,\xaeW\x9b\xa8\xb15\xee\x85\xe0\xd5\xa8\x12\xcf\
+b\x1dW\x84\xfa\x0a\x7f\xb5/.\xc90\x14\xa6\x11\xf1\
+\xf0;'\x80|\xd2\xb4c\x9b\xf5\xf5Ln>\xc6\x18\
+\x002\xb8Y\x0b\xf8\x8d\xf7\xc4\x0e\x0c\x00\x80\x0c\x94J\
+G\xaa\x8e\xcd*\xed\x10\xfda%k:\x97\x89F=\
+&=i\xb6\xd2\xb6\xae\x98\xb7P\xb3|\xb1\xa6\xb0=\
+\xea\x89+\xf2\x04n\x04\xe0H\xcd\xed\xd0\x15\x06q\x08\
+\x10B\xc315WS \x037d;$K\xe7}\
+]\xbf\xeblO\xa2\x9f\xd1\x10:\x09\xc7\x86\x83/B\
+K\xb5K\xd7\xea\xd6G\x14\x1cR\xc4*\xa1\xa65\xda\
+}\xdcwz\xb2\xf2;,\x07\xbf\xc7\xaf\xc4 !\x04\
+\x08 \x8e\xa3\x0cb\x11\x80\x93[\xfe\xa3\xa6\xa3\xf9|\
+z\x9d\x10|:\xe95-ih\x0e\xd7\xeb(\x03C\
+0\x04B2\xc6s5\x0b^\xb0\xbc,\x02\xc4\x81\x8e\
+(R\x8b\xd8\xfe\x99\xaf\xa2#\xda1\xe2\xb6\xf1k}\
+A\xf1\x1ah\x03\x02\x84\x10\xd4\x09\x97\xb3U\xf3L\xb4\
+\xa5@\xb7*,\xe7G\x95\xc8Z\xa35 \x0f\xd6\x0a\
+\x97#r\xe8\x82\xef\xa4\x9dI+\x9aV2\x8dN\xb6\
+\xd1\xd3\x00\xe3(\xc6\x1c\xa1\xbf\x11\xba\xe9\x95<Sj\
+,\x16\xf0K\xc9a\x07\xa2*\xff\xa9l\xd5\x5c\x00\x84\
+\x00\xfb\xe3\x03\xc9l\x86(\x87\x9a\xc2\xf5\xd5\x81sf\
+\xda\x06\x00/\xda\xf6 \xc0\x08\x83\x82\xb1\x02\x10U\xc4\
+\xc3}o{\xe3\x9e\xf1\xd80^}I!\x82@\x08\
+!\x14R\xfc\xb3\xd5\xf9f\xda6\x94G\xedl:\x02\
+P\x91\x9a\x9a\xe0\xf9\xad\x96\xd2k\x81\xaa~\xe9\xeb\xa3\
+\xbdo{\xa5~\x19+\x12VDE\xfad\xe0\xc3\xd6\
+H\xe3\xb8\x0d\x0dJ\xec\xcf\xd0H\xb6\xcePe\xcf\xe3\
+\x17\xa9\x08uX\x16\x8a\xcc\xcf\x0c'\x8a\x07YJR\
+\xa4\xb0,\xfc\xa1\xf3W\xc1\xb8\x1f\x00\x18\xc4\x14\xea\xd6\
+\xf5\xc7{\xda\xc5&A\x0e\x8e\x9b\xcc\x1e6\x96X\x0f\
+=\x08k&:)\x89\xb6\xf3\xa4\x96F\x8c\x84c\x82\
+\x1c\xe8\x8f\xb9\x07\xe3^\x00<iK\x86'G\xf6\x7f\
+w\x9bS\xaa\xf5\xbf\xdb\xce\xf3\x11\xfd\xe7\xff\x00+\xf9\
+\x92\xf5Z\xa4\xde\x96\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x1e\xd0\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00P\x00\x00\x00P\x08\x02\x00\x00\x00\x01se\xfa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x1e\x82IDATx\xda\xb5\
+\x5cw|\x14e\xfa\x7f\x9ewfv\xb6\x97l\x92\xcd\
+\xa6'\xf4\x1e:\x02R\xa4\x89 \xa8\xe8\xa9 \x22\xea\
+\x09\xa7g\x01\x15\x0b\x82\xed<QT\x0e\xf5,\xa7\x1e\
+vO\x11\xf0\x90\xfb\xd1\x04\x05\xa4H\x0b\xa1\x83\x90\x90\
+\x84\x14R7\xd9\xbe;3\xcf\xef\x8fIB6\xd94\
+\xd4\xf9|\x92\xec'3oy\xde\xa7\x7f\x9fg\x16\x01\
+\xf4\xd0\x81\x0b\x01\x00\x80\xea?S\xb4\xbbP\xff\x0c\xc2\
+\x1frQ\xe4Z\xd4\xa1\xc1\xecJ\xd7\x8bz\x16\xd4\x02\
+\xf1\xbf\x9dBj\xb6.]\xd9\x5c\xac\xdd\x5cm\xbe\x0c\
+\xb5\xfa\xe4\x1f\xc4[\x8a\x144\xfa#\x08n\x89o\xf8\
+\xbb\x1cy\xfbN\x1c\x7f\x8b\x18_\x01\x87\xb1-\xe6\xe3\
+\x1f\xcf^\x8c\xb6\x22\xfe\xee\x04c\x0b\xc7\xfc\xc7\xb0\x17\
+\xb1\x93\xae\xd3\xd4\x98i\xed \x84\xael]\xd6n\xed\
+\x85\x96\x05\xfb\xf7`/\x2226\xcdv\xd3\xe3\xce\x17\
+\x8e\xf9\x8e\xb65!\xb6p\xeem_|\x9b\xdb\xa0\x86\
+\x13\xa5?NT\x91g\xfc\xdd\xb1\x7f\xedo\x18\xba\xcf\
+\xbb\xa3 T\xc0!\x93In\x81\xb1\x18\xf9\x01;\xc4\
+g\x0e@hq#\x88\x8f;\xef\x9fn\x9b\x08H\x85\
+\xe1\x12\x05\x08\x10\x7f\x07Um\xcc\x1eD\x00\xe4\x91\x9b\
+\xe7x\xac\x8f~\x90\x02\xf2\xbf\xcaW,\xcd\xbc\xe1\xa8\
+\xb7\xd0+\x07Z\x0d\x04\xf0\xf75Zu\xd3\xe5\x06\xf3\
+{\xe9z,t\xcc\xff4c\xc5M1\x93\x04\xc6\xab\
+\x07\x01\x88\xed\xb51u\x0f\xd7\x7f\xc0z\x15\xc0\xcb\x8a\
+0+v^\x0f]\x16\x00\xfe\xe2\xdd\x19\xa3\xe1\xefp\
+^\xed\x93\xfc\x1d\xf1\x94\x1d\xd0\xa96\x8c\xd6\xf9`>\
+\x01\xe6\x87\x0a\xad\x9c\xe5/qw\xfc;}\xd9`c\
+\xefzZZZ\x06\xeb\x04\xa1\xf1\xa14\x0c\xc1\xa6\x16\
+`\x9c\xf5\xbaA\xc6Q\x04@@[k6\xccK\x1c\
+\xcf!\x86I\xea\xa0\xf5no8\xd0\x06\xc1\x17C\xc5\
+2\x80\xc8\x0cK\x8b_\xbb$U$i\x1c\xcb\x93\x9f\
+X\xe8\x98\xa3a|\x83\xfaEXrD@\xd02M\
+\xa3\x07\xeaH\x15\x18?\xde|\xd5\xf3\x89\x0fw\xd3f\
+4\xb0?U\xcc\x9cb\x9d\xa5\x9a\x87\x93\x81\x1c\x8fR\
+5-v \x11\xd5\x0d\xef\x98\xdc\xe2o\xe60A\xa5\
+T\x15\x22\xc5\xc6\xdb\xaf1\x8fy\xa8\xe0\xd9\xf3\xc1B\
+\x00\xb8\xd1:ne\xcaS\x16\xde\x88\x0d\x1cCl\xac\
+\xde\x19\xda\xc4\x89\x96\xa1u\xe7\x81\x88\x88\x93\xcd#\xbf\
+\xc8x\xfd\xc9\x84\xf9\xbb<\x07\xce\x06. !\x22r\
+\xc8\xddf\x9f\x8f\xc0\x08\x80\x00w\xbb\x7f\xb8\xc6\xda\xdb\
+\xc04\xa0(\x22\x13\x7fC\xecI\xbf)\xf0\xa8\x95\xdc\
+\x0a\xc00\xc3\xd0\xbe\xfa\xbe\x8f]|9?T\x02\x00\
+}t]\xdeJy\xda\xc2\x19\x9b\xeb2\x22v\xd7\xa6\
+]c\x1a\x84\x08\x88h\xe6\x0c\xcb\x93\x17>\x99po\
+<o]\xeb\xda\xb8\xadvo\x033\x86\x18\xc78\x84\
+TBP\x00<J\xedq\x7f\xf6hk\x0f\x02P\x88\
+\x0c\x9c\xd8H\x82~\x1f\xde\xb6B06\xfe\xeb#\xbf\
+\x02 \x03\xcc\x8d\xbd\x13\x00\x17\x17\xbd\xeeV\xfc\x00\x90\
+!&\xbf\x9a\xfc\x98\xc84\xd8\x8c\xe8!\xfa\x1e\x19\xa2\
+\x13\x10\x1c\x9a\x98\x7f\xa5/\xb9\xca\xd0\x87G(\x0a\x97\
+|X\xf1\xad*\x11q\x82\xb5\xa7.\xc3%\xe5\xbes\
+i\xf1\x7f\xab>Q\x80\x0e{\xf7*\xa4\x0c4e\xaa\
+3h\x90kwXA\xcd\x8cvk6\xac\xedH\x8b\
+\x80\xc9\x042\xa0\xc8\x8c\x7f\x8a\xb9\xa5(\x5c\xf6J\xe9\
+\x87\x0a\x00\x00t\xd7f<\xe6\x98\xabr\x95C\x06\x08\
+\x88\xa8a\xfcU\xc6\xbe<2\x0bg|3\xf9\xb14\
+!\x9eC`H\xefW|\x93\xac\x89\x7f\xdc1kC\
+\xe776t~\xe3\xbd\xd4\xa7\xaf1\x0dsI\x15\x1a\
+\xa6C`9\xbe\xfd\x06N\xcc\xd0\xc6\x13\x01\x11\xd4\xa9\
+\x07\xb6\xdf\xcbQ\xabG\xd0\x1a\xc1McF\x0d\xd3\xc9\
+\x80\x12\x80\x0c0\xca46Ap\xec\xf4\x1c\xdc\x5c\xbb\
+G\x01\x00\x82\x09\xa6\x91\x13,\xc3\x01@\xcb\x89c\xcc\
+\x83\x00`\xaci\xa0\x91i\xfdJ\xe0\xa5\xc4\xf9i\x9a\
+\x04\x04`Hn\xc5=\xda\xd8\xef\xab\x8c\x17o\xb1]\
+\x13\xcf[*\xa5\x9a\xfb\x0b_\xfe\xa4r\xc3\x8d1\xf7\
+O\xb4\xfc\xc9/\xfbr\x03\xa7{\x1b\xd2\x90PQ@\
+i\x1c\xe3t@\xaa\xb1\xe5\x5c\xb55\x82\x9b\xe4\x5c\xa4\
+c&\x19@&\x90\x09\x08\xd8T\xebt \xf8g\xf9\
+\x97n\xd9O\x80\x84\xf0`\xdc\x1d\x16\xde\xe8S\xfc\xf7\
+\xc5\xde\xc41v[\xcc8\x00H\x15\x12\x07\x1bz\x22\
+\x12\x22!\x90\x953N\xb3\x8e\xe2\x00\x11\xb1J\xae\x9d\
+_\xb0\xec\xb8?\xcf!\xa4H$\x87I9\x138\xaa\
+\x00\x0d4t\xda\x5cu\xec\x8c\xaf\x84\x14\xf0+\xa1F\
+\x06\x88\xda-\xd8m\xc7\xf6-EZu\x12\xa5\xe3t\
+\xd3l3\x14 \x02P\x00\x88\xc0)$ow\xff\xe0\
+\x96=\x12\xc8\x83\x0d}\x11PDA\xc3\xf8\xfd\xdec\
+\x0b\x1c\xb7\xc7\xf1\x96\xb1\xc6\x01u\xc69\xe2\xf0\x11\x01\
+\x00\x89\x00vy\x8e\xa4\x88\x8eA\x86\xee\x0cCk\xab\
+W\x1f\xf4\xfex6p4@\x81\x82P\xc5\x7f*~\
+\xbe\xd71\xde\xc2\x1b_\xbb\xf8\xdfp\xf4\xd0\xb2\x9dy\
+N\x07\x8cV\x84_\x15@\x90\x81\x08P\x01,\x08^\
+8\xec;H\x80\x03\x0dC\x00\xe0\xbf\xae\x1f\xaa\xa5\x1a\
+\x00B\xc4\x1b,c\xbbhSD\xe0o\xb2\x8e=\x1f\
+,\xfeg\xf9\x9ae\xa5\x9f\xadu\xed\xf4(A\x22$\
+@5\x16'\x02\x00\x98d\x1e:;f\xd2\x0d\xb6\xab\
+\x0bC\xa5<\xb2n\xda\x84\x1e:\xa7\xc8\xf8K!W\
+7mR\x8a&\xb6:\xe4\xf3+\xc1\x0e\x1a`lg\
+\xea\xc6G\x13\xf7\xcb\x1a/\x81D\xc0\x08d\x22\xaa\x95\
+=o_Z\xa1gz\xa7&\x11\x00B\x14\xdeP\xf3\
+\xe3\x1c\xfbt\x0eH`\xc2\xdf\x12\xef'\xa4m\xb5\x07\
+\x97\x96\xbc/\xd53\xe7\x9d\xf2o\x1fw\xdc1\xd1<\
+\xa4\xb9i\xf9{\xf1\xa7U\xb2\xfb?\x9d\x9e\xcf\x10\x1d\
+\x08P\x22U=\x98\xbf\xb2\xb7>MV\xf0\x84\xf7\xe2\
+HS\xef\x0b\xc1K\x85\x81\xf2+H\x0f\xdatK\xad\
+!5~\xc5\x17T\x82\x0a\x81\x02\xd8I\xeci`\x86\
+\x19\xb6)\x0e\xce\x8a\x88@\xb0\xcd\xbd\xa7!9L\x17\
+\x9c\x97\xc2U/\x94~hd\xbaY1\xd7=\xeb\xfc\
+\xcb\xa3\x8e9Y\xban\xcf\x95|\xf0_\xd7\xae\xcb3\
+\x13\x10@\x95\xe4\xd9\xef;\xf9v\xea\xc2t1A=\
+`\xa7\x10\xb3\x22\xe5\x81M\xae\xc3\xe7}\x15qB\xcc\
+\xf2\xd4?\x97\x86\xaa:h\xb7\xda\x956\xb6\xae\xc3\x08\
+\x88\xfd\x8dC\xcc\x9cU&P\x90\xf9\x14\xdf\xc5P\xde\
+\xd3\xce\x85C\x0dY'\x03\xa7\x0bB\xc5S-\xa3\xcd\
+\x9c\x96\x01\x01\xd0\x1a\xd7\x8f\x1e\x0a\xbc\x95\xfa\xccpC\
+\xffL1\xb9\x9b.c\x9cy\xc8\x08C\xd6{\x15\xab\
+G\x1a\xb3\x0c\x9c\xaea#\xc7\x02\xe72\xb5\xceQ\xa6\
+~\xd5\x92{\x83k\xcf\x01\xef)\x06\xac\x8b6\xa5F\
+\xf2\x1c\xf3\xe7]g\x19\xbc\xd1u\xf0\x87\x9a\xec\xdf\x90\
+\x8eu\xc0h5ER\xe2\x84\xc4T\xb1\x8b\x0c \x11\
+8\x85\xf4u\xd5_\x9a9\xe30C\xff\x89\xe6\x91\xa7\
+\x83\xe7\x92\x85\xf8t\x8d\x03\x81\x00\xe0|\xa8x~\xec\
+\x9f\x8c\x9c\xde\xab\xf8\xb6\xbb\xf7\xed\xf6f\x17\x86K\xbb\
+\xe92\xa6ZG\x9f\x0b\xe6\xa7h\x1c\x00\xa4\xce\xebU\
+\x02#M}\x7f\xf1\x9c\x98W\xb0\x5c\xea+R\x0f\xdd\
+\x87\xe7\xbe;Vunf\xec\xa4\x95\x97\xbe\x9d\x193\
+~\xf1\xc5U\x95R\xed\x15ETte\xf9pC\xb0\
+\x85^\xa5v\x98y\x82B(\x110\xd0\xc4\x0b\xce\x8f\
++\xfe\xd5]\xdb)CL\x1ck\x1a\x1c \x9fS\xb0\
+\xa9Ow\xd1\xa6\x8b(\xec\xf3\xe6<T\xb8\xec\xa2\xb3\
+\x22vX\xc2)\xe1\xc2['>\xd53\xedd\xf3H\
+ld\xbac\x05sY\xb8\xea\x91\xb2\xb7>\xfd\xfc\xfd\
+g\x9fZt\xe3\xf5S\xff|\xd7\x9d\x9bN\xee\xfa\xe5\
+dv\xa5\x5c[\x10*\xdb\xe5>\x1e\x0d;\xc4\x8e\x1b\
+\xb0(\xf7\xf4\xad\x0d@\x04\x84\xf9\x8e\xa7;\xeb\xfa\xca\
+\x04\x9f\x97\xbf^!\x15\xbb\xe5\x1a\x05\xa4\x15)\x8b{\
+\x8ai\x1aTTyV-\xf9\xa9`\xfe_\x8b\x97-\
+\x7f\xe5\x85\xbbg\xcf\x02D \xc89v\xec\x8e{\xe7\
+\x0ds\xf5x \xf6\x16\x86T\x9f&\xd2\xf2\xd2/\x07\
+,\x18\xf1\xf0\xfd\x7fi\xe0I0\x18\xbaz\xd2u\xbf\
+\x9e<\x1f\x90CPo\xd2#\x99\xd7!\xd3EW\x16\
+i\x01\x10\xac\xadZ\xe5W\x822A\xa6\xb6O\x95T\
+\xf6\xd7\xb8\xbb\xfed\x9b\xba\xaa\xe2\x1b\x89B\x18\xe9\xf1\
+W^\xfab\xc93\x8f\xdfs\xe7\x1d\x0dn\xb8_\xef\
+\xde\x9b\xbf\xfb\xf6G1\xfb\x80\xefdc\xb7|X9\
+{\xcf\x9c\xd9\x8dW\x115\x9a\xe7\x9eZ\x14PB\xd1\
+I#\xe8\x08\xdeB-\xb9\xe5\xb6\x22-\x22\x00(\x0b\
+\x97|V\xfeZ\x90\xc2\x03\x0d\xe3\x935]\xd7\xd7l\
+\xb9\xd96eY\xd2\x22.r\xf9\xbcPqu\xac\xf7\
+\xaf\xf3\xfeL\x97\x03$\x02\x00\xa7#a\xe5\xf2\x97?\
+\xa8X\xd7\xb0v\x88$G\x0f\xa7Qo\x00\x22I\x92\
+\xd5\x05\x09h\xe25\xd7\xd8\xac\xe6V\xb3\xfa\x88<\xb4\
+e\xfa\xb1\x05$\x04Y\xdb\x8aA\x04\x04g\xfd\xc7>\
+\xbc\xb4\xb4,\x5ct{\xec\x82j\xd9\xf7L\xd1\xab^\
+\xc5\xabA\xbeq2\x9a\xed;=}\xeau\x02\xcfc\
+\xc3\xc8\xba:\x01N\x9e0AJc\xc5\xe1J\xf5F\
+@\x09:\xe2\xe3\x09`\xd1\x92g\x93\xba\xf6\xda{\xe0\
+\x80\x0a\x12r\x1c\x97\xd5\xabW_Cf;P\xcb\xf6\
+X\xa8\xe6P.\xb1\x16\x0ab\xd4|lQ(\xef\x9d\
+KO\xfc\xafzU\x9a\xd8%\xc7\x7f\xfa\xeb\xea\x0d\x91\
+c\xa88\x5c\xde\xb7wou\xf0\x9e}\xfb\x87\x8e\x9d\
+\xf8\xeeG\x1f\x11\x90j\x9c'O\x18\x7f\x22p^\x9d\
+W\xc7D\xbf\xdf\x1f\x08\x04\xde\xfd`Um\xad{\xc5\
+\xdb\xef6\xd0\xa0\xd5i\xaf1\x0eP-\x9c\x8a\x1eh\
+9\x83I\x881\x0b\xb1\x06\xde\xc2\x18\x8b\xb0/\x1d\xd6\
+d\xe4[\xf0Z\x18u,\x01\x1d\xf1\xee\x01\x80Lm\
+\xd2\x1c\xfb\xb4z\xdc\x0a\x81\x00\x01\x82\x146\x19\x0d\xea\
+\x84K^|\xe9\xe8\xd1\x13O\x9cz\xfe\x86\xa9S\x9c\
+\x0e\x07\x00t\xce\xcc8\x15>\xa8N$\x00W{\xb6\
+\x12\x11u:\xad\xdb\xe3\xf5z}\x97C\x9d\x0ao\x96\
+~\xb0\xfa\xd9\xc4\xdb,|\xfc(c\xbf\xfe\xba\xce\x22\
+\x0a\xbb\xbc9\xbb=9\x95\xe1\xe2\xa0\x1c\x00l3\xfc\
+\xc2HL\xf72\x87[z\xa8E\xe2\xe3\x04\xdb\xf2\xe4\
+\x85\x06\x14\xb1Af\x10\x00\xc0\xca\x19=^\xafz0\
+\x17/\x16\x03\x80$\xc9g\x7f=\xa7>\xc5q\xdce\
+\xcc\x1e\xa1\xb7/\xed\x87\xed?.^\xb4P\xd4\x08w\
+\xddq\x9b*\xfd\x85EEr\xaeo\x87'\x07\x10,\
+B\x9c\x91\x8b\x19\xa6\xef6?v\xcaPC\xb7\xfe\xfa\
+\xcc.b\x02\x80l\xe5m\x11\xfa\xdc6\xcd\xd4\x84\xc3\
+\x14M\xe81\x9aK\x06\x00H\x11\x13^K~4\x81\
+\x8f\xb9\x18.M\x16\xe2\xb8:q&\x04\xc8\xd48\x0f\
+\x1f\xc9\xb9\xe3\xd6?\x01B\xff\xac\xbe\x05\x17\x8bx\x9e\
+\xeb\xd2\xa9\x93:<\xbf\xa00QcGPsJ\xb8\
+=f\xdc\x93\x7f\x7f\xeb\xfb\x8d_\xdf\x7f\xef=<\xcf\
+\x03\x80\xc7\xeb]\xfa\xb7\x97w\xb9\x8f\xe7p\xb9\x02j\
+\x04\xd4\xca\x14\xde\xe3=Z[Zk@\xb1 \x5cZ\
+\x1c\xaa\x04 \x16\x9d+\xed\x0c\xbc\x08[(\x88c\x93\
+8\x16\x11\x10p\xb2u\xd4Cq3y\xc4s\xc1\x0b\
+=\xb5\xe9Z\xa6Q\xe7\xaa\x94j\x02\x14\x12Qs\x9f\
+\xfb\x95\x9c\x83?\xebu\xfa\xa2\xe2\xa2g^\xfc\xfb\xe8\
+\x11\xc3\xe7\xcc\xba]]n\xf4\xa4)\xaf\xf8\xe7Zy\
+C\x8d\xe4\xfb\xaa\xf2\x87\x1c\xdf\xb9\x0b\xa1\xd2\xfec\xfa\
+/Y\xf4hn~\xc1\xce\xdd{\xd6|\xf7\xbd\xd1/\
+\xccK\x9c\x94\xa9u\xdcu\xfa]\x03\xb30\xacC\xb4\
+\x01\xa8\xde\xffQX\x09VJ\xd5\x8dH\xa0\x0ey\xe3\
+v\x11l\xe1M\xc3\x8d\x03o\xb2M\xec\x22\xa6\xf0@\
+\x0c\x81\x03bH\x00\x94\xed?\xb3\xbc\xf4\xf3\xbcP\xb1\
+Mc\x0a\xca\xc1\x80\x22\xdd{\xcf\x9do\xbc\xfcR\x9d\
+S\xa2:\x87\xb3a\xd3\xe6O\x1f\xf9\xe0\xef\xa9\xf7\xb8\
+%\xff\x07e\x1b\xba\xe9\x93cx\xf3vW\xf67\x15\
+;\x08H\xc3\x04\x1e\xb9GS\xa7\xcdv\x8e\xd1r\xac\
+4T3|\xff3F\xce\xc6\x80]\x06E\xd5\xbd\x90\
+R)W\x87\x95p[\x04SK\x115\x02\x18\x9aU\
+\x80\xa9\xb1\x1c\xdb\x05\xdb\xf2\x94g\x13\x858\x1e\x88\x07\
+\xe2\x108$\x06\xc4\x90\x0e\xfbO/.\xfe\xe7#\xe9\
+Sf\xa6^e\xd6\x88\x0a\xc0\xcf\x15\xa7\xff\xfe\xeb\xfa\
+\xfe\xd3\x87\xbf\xb8d\xb1\xd5bQ\xf5y\xcb\xf6\x1f\x1f\
+{\xe0\xa9U)\x8f\xc4\x09&\x04\x04\xa4\x10\x85\x97\x15\
+\xac!\x94\xc7\xdb\xfa&ic\x17\xe7~\xf6\x8f\xees\
+2\xf4\xb1X\x8fd=z\xfa\xcboK\x0f\xea\x99\x01\
+\x01\x19 \x000D\x99$\x9f\xe2\x91I\x09\xb5Mp\
+\x8b^+*\xc1\xcd+]\xdcPC\xff\xbe\xba\xeeN\
+!\xc6\xc0\xb4\x83\x0d\xbd\x04D\x02\xf9\x9e\x82gWt\
+\x9b\xdb\xc7\xe6\xe45\xc4\x18\x06\x15Yd\x9c$\xcb\xaf\
+\x9f\xdb\xb8\xaalW\xff\xc1YV\x8b\xe5\x5cn.\xe5\
+y\x16\xa5\xde<\xcc\xd2\x99\xd5\x87\x0c'|\x17S\xb4\
+v\x9bF\xc7\x10v\xbaN\xf73%\xdbEC=r\
+\x07\x08\x10&eE\xde\xa6\x8f\x0a~\xf4Ha\x86\x0c\
+\x00\x08\xe4\x911\xdd\x16e^\xff\xe4\xe9/\xb3]\x17\
+\xda\x11oRT/\xdb\x98`l$\x09\xd8\xc4\xd7\xa9\
+\x98\xfbX\xd3\xd0\xfbboM\x12b\x19\xd2\x99`\xae\
+\x8b\x95\xde\x98\xd0_#*?\xb9N.9\xfbM\xbe\
+\xb7\xac\x9f%\xfd\x85n7\x0f2f\xba\xa4\xc0\xc1\xea\
+\x5c\x8f\x144r\x86}5g\xba\x1a\x1c3\x1cC\x1a\
+\xe7\x9d\x80\xc0\x1aU\x9d\x22\xab\x14u\x1f\x82\x8ar\xca\
+S\xb4\xb5\xfc\xf8\xa1\x9a\xbcw\xfa\xdee\xe3\xf5Dt\
+\xcd\x9e\x97\x8f\xd7\x16\xb6\x8f\xe0(R\xcd\x01h\x22M\
+\x196M\x1e\x00\x00!\x8e\x8fy.i\xc1m\xb6\xeb\
+\x8d\xcc\xa0\xde\xb1\xf0\xba>\xa6d\x81\xa7\xfc`\xd9-\
+\xd9o\xf8\xe5p\x88\xa4\xca\xb0']\xe7\x18b\xcd\xd4\
+q\x5c\x86.^\x02\xda\xe1::9\xbe\xefx{O\
+\xc6\x901`\x08\x8c\x012`\x0c\x18\x03\xac'\x9b!\
+\x94\x85\xdc\x1b\xca\x8e\xf41'7\xec\x82g\xe8\xd0Z\
+\x0e\xd7\xe4w7:\x87\xdb:\x03@\xad\x14|\xe1\xec\
+\x1a\xb9\xed,\x82\x22)jJ0\xb6\x88_#\x22B\
+Wm\xc6k\xc9\xcf\xa6\x8b)\x8d*\x82$2\x8e\xe7\
+H\xe0\xe9\x9b\xb2\x9fg'\x8f\xeceL\xdeQuJ\
+!eW\xf5\xe9_\x5c\xe7{\x9bS\xe3E\xa3C4\
+_\x1d\xd3\xd5)Z\xeb\xa2\xa6F\x14b\x84\x0c\xe1\xad\
+\x87\xde\x9e\x954\x22F0\x98\x05]c\x84\x83\x88\x9e\
+<\xf5\xf5\xe3\x9d\xa6\x98y\x1d\x11\xbc\x97\xbf\xed\xa7\x8a\
+SMv\xd8!\xf4C%\xb8\x05\xb7\x86\x08\x00\x99\xda\
+\xd4e\xc9KM\x9cI}\x82CT@a\x00\x8c\x01\
+\xcf)\x02G\x9d\x0c\xb1\x03-\xa9\xb5\x92\x7f\xed\xa5\x03\
+@0z\xe4U\xf7,\xbcw\xc1\xff\xbd\xbd\xb3\xe8\xa4\
+]cJ\xd3\xdb\x19`}\xcc\x8f\x18\xd90\xd0\xb0\xea\
+-\x89C9\xc0\x13\x9e\x22\xa7\xd6\xca\xeaS-\x02X\
+U\xf8\xb3D\xcam\xcea@\xb0\xb7\xfa\xfc\xc2\x13\x9f\
+\xc9\x8a\x02M\xaa\x97\x88-\x97\x91\xa3\x80x-r\x1f\
+\x00L\xbc\xe1\x19\xe7\xe3Z\xd4\xbb\xe4\xda\xfd\xde\x83\x87\
+}GC\x14x\x22\xe1~\x0b3\xc8D\xb2\x82\x92\x8c\
+v\xd1\xa2(J?S\x9a:\x95\xcf\xef\xbfe\xfa\xf4\
+\xac>}\xfa\x0d\x1fu\x94\x95\x08\xa7\x94\x1b\x1c\x83\xa6\
+\xc4ge\x99S\x11Iu\xab\x97\xbb\x8e\xea\x8f\x1a\x89\
+\x00\xc0\xc4\xeb\x1aR!\x02X]|\xe0\xd5s\xeb?\
+\xe8{\xdf\xde\xaas[\xca\x8f\x7fX\xb0-\xa8H\xea\
+6o\xb6\x8f\x9d\x177\xcd\xab\xf8\xbf\xa8\xdc\xb2\xba\xe2\
+\xa7VQ\x9d\x88{|\xb4\x98\xf32\xd9scgW\
+K5\xff\xae\xf8l\x9f\xf7\x90\x0cJ\x92\xe0X\x99\xf2\
+\xbc\x91\x19\x09H!\x94\x14\x0c\xcb(\xc8\xc83\xb0\x0b\
+\xc6\xae\xfa\xc4\xb3\xbe\x92\xe3'Ny\xfc\xbe\xe7\x97\xbd\
+\x0a\x80\xab?\xfbwuu\xcd??\xf8\xe8\xad\x1f\x96\
+\xc5\x89\x96Q1\xdd\x87\xdb\xba\x0e\xb5u\xealp`\
+\xa45U\x17\xeeeLB\x00\x228P\x93\xf7f\xde\
+\xe6l*J\xef\xd9i\xc6\x81\x15M\xf0\x00\x04\xb8\xdd\
+>\xde.X\xecd~\xca9[@\xfe\xcb\x8a\x1fZ\
+\xf5\xc9\xd1{<\x9aR\xabA\xfe\x907\xfb-\xcf{\
+\xea?y\xe4\x16'<bd&\x22R\x10\x81 \xac\
+0^\xa6\xb0\xa4\xf0\x8c1\xa6\x8c\xb3\xf7>\xeb+\xf1\
+\x07\x82\xa3&M9}\xf6\x1c\x00\x1c\xca\xce\xb9o\xce\
+\x9c\x7f}\xfc)\x00\xbe\xf4\xdas\xc7O\x9ezo\xeb\
+\xb6Gw\x7fn\xe2\xb5\xdd\x8dI]\x8c\x09I\xa2-\
+Vc\xd23\x91\x00\x02J\xb0<\xe4\xce\xf5\x95\xed\xab\
+\xfe\xb58X\xbd\xe4\x89GW\xdd=\xf7\xe3/\xbe:\
+\x94\x9d\xd3\x84{\x04p\xda_\x90\xa1q\xaa\xbc\x9a\x1f\
+w\xe3wU\xbb|r\xb0\xe5\x14\x88\x9a\x03\x00Q\xce\
+&D\xd2n\xf7/\x0dy\xfc\x0d\xd6\xc9ib\xaaZ\
+I\x94\x09d\x00I\xc1\xb0\xcc\xc22\x93\x14\x94\x15\x98\
+\x12\xd7_\x9d\xe9\xf4\x99sj \xf8\xf1\x17_\xbd\xf2\
+\x8f\x95\x1b6n\x01\x00\xab\xc5\xfc\xf2\xb3K:gf\
+\x00\x01h\xb99K\xfe\x9c9s\xe8\x16}\xee\xca\xf3\
+?}~\xe1\xf8\x82\x93\x9fnO*e\xd33\xc7-\
+\xba\xb94\xe4\x22\x85\xae\x1d?\xceb6o\xd9\xfec\
+T\x9em\xa9\xd9O\xf5Y\x8b\x9ei\xfb\x1b\xba\xb6\xbf\
+\x8b\x87\xa2\x9dG]J\x00j\x17\x0f\x81\x86\xe3o\xb0\
+]\xafP]:\x88@D\x08\x80!\x99x\x99\x09\x12\
+\xf1\x9c\x92eL\xcb\xd4\xc7\xe7z\xcb\x1a\xe6;r\xf4\
+\xc4\x91\xa3'\xd4\xf9\xb6\xfe\xb8\xa3\xb6\xd6\xbdq\xcb6\
+5O\x98<~\x9c\xddn\xff\xf2\x9bo\xe7\xc7\xdd\x13\
+\xc7\xc5\xfe\xe2=8u\xf2\xa4\xb9\xb3f\xad\xdf\xb8Q\
+\x96\x09\x00\xd6\xac\xdf\xe0\xf5\xf9w\xec\xda\x13U9\x7f\
+q\x1f\x0f\xc8\x8a\x961\x00D \x87\x10\xd3\xfe.\x1e\
+M\xcb\x18m\xbd\xd3@\x18f\x18<\xc64\x86\x00\xc2\
+$\xed\xf1\xec_]\xbd\xfe\x88\xffD\x0fm\x0f\x9e\xf1\
+\x0c\x80c\xc43\xe0\x18\x05)\xfc\xb3\xeb\x0c \xa4\xeb\
+b\x07\x18\xd3\xed\x1acU\xd8+\x03\x01\xe0\xd1c\xc7\
+\xbf\xdf\xb4\xb9A\x17\xf3\xf2\xf3\xf7\xec\xdf\x9f\xb7\xa7\xe0\
+\xb6\x98[7\xd5l9\xee?YQU9\xeb\x96\x19\
+\xf3\x1eZXRz\x89\x00\x8f\x1c=\xb6\xee\xfb\x0d>\
+_\xd4^\x1e\x90A\x19o\x1ej\xe5\xcd\xaa\x85\xfe\x9f\
+kon\xb0\xb8e\xd0\x0b\x9b\xe80FO\x0c\x1b]\
+}\xf5Ya\xa2\xad\xee-\xdfV\xaf\xab\x96jz\xeb\
+\xfa\xcc\x8d\x9b\x87\xc8\x85\x14b\x80|\x98\xe39\xe2\x19\
+\xdd\x9e0bE\xfe\xff\xdd\x9dp\xf5\xe2\x94\xeb\x10\x11\
+\x81<J\xf8\x93K{\xde\xb8\xb8yf\xfcUn\xd9\
+\xbf\xa6\xfc`H\x91\x81\xe8\xfb\x8d[\x00`N\xcc\xed\
+H\xb0\xdb\xb3\x17\x00\xf6\x1f\xc8\xee7|\xd4\x85\x82\x8b\
+\xaa\x12\xf9|~\x9f\xcf\x1f\x11QE\xba\x9f \xc9\x0a\
+\xa1Z\xdc\xca\x0d\x165\xea3\x89\xb4\x84\x919\x02\x1f\
+\x19\x97`Ka\x8b\x9e3.-~\xfe\xb4\xff\x0c \
+\xc4\xf3\x09s\xe3\x16\x84@@\x22\x05\x90\x14`2p\
+a\x8eg\x8aQ4\xcct\x8e\xbc\xe0\xaf@`@\x0a\
+ \x1a\x99\xe6\x81\xc41\x83L\xe9w\x9d\xfe\xf0\xf3\x1e\
+\xf3\xfe\xe2\x1c;\xfb\xf4\x07\xf9\x81\x0au\xe6^\xda\xae\
+.\xb9\xaa0|Q]:\xbf\xa0\xa8\x9dh\xb3\x80|\
+\xa2\xe0\x94\x01\x89\xf0\xa4\xff|^\xa8\x98!85v\
+\x0bg\xa8\x91\xbd\xc5\xa1\xca:\x87G\xd4R\xf2\xd0r\
+o7\x22\x22\x88(\x06)\xa8\xceq\x9fcI\x17]\
+/\x11\x91Q\xc0\xc08\x1d2=\xa70\xce\x1d\xafE\
+\x9b\x16\xab\x94\xea\xd1\x87\x96\x8a\xc8'jlK\xd2\xae\
+\x1fg\xed\xa6\x86\x1bk*\xb2\x97\x17n\xdc\xd1\xef\x89\
+\xa2\x90kB\xcekn9\x00\x00\xffN{\xf3B\xa8\
+\xf0\x85\x92\xe5u,i=\xf5!l\x08\xc5G\x1a\x07\
+\xbe\x98\xf40\x87\xf0q\xc5\xba\x0d\xb5?\xcd\xb5O\x9d\
+d\x19h\x17\x0c\x1c*\x80x>P\xf2d\xc1G'\
+}\x05\xcd|\x155\x0e-\xa3\xc6\xd2u?u\x8d\x80\
+\x88ib\xd7a\xe6k\xb7\xbaV\x7f]\xf9\xde\xda\xaa\
+\xaf\xd6\xbb\xd6\xee\xf5\xec\xf5*\x81\xee\xda^\xeb\xaa6\
+\xf73t\xb6j\xc4\x1a\xd9\xbb\xaf\xe6\xd7\xf2\xb0\xe7\xbb\
+\xca\xc3Y\xc6\xb4Lm,\x22\xf4\xd4;w\xd6\x9c\xf5\
+)\xa1\xd1\x96.\x08\xb8\xab\xe6,\x00L\xb5\x8c\xaf\x92\
+\xabwy\xf65\x16\xc7\x16\xa8\xbd|\x1f\x11\x1ep\xdc\
+\x99(8vx\x0e~]\xbdqU\xfas\x03\x0c]\
+uLS\x0f9\x81\x8d7\x0d7\xf5\xfa\xaar{\xb3\
+~Id\xcd\xb0\xe8f.\xaf\xfeG\xbd\xa1\x80\xfcZ\
+\xd1\xc3\xbbj\xff\xcf%U\x03 \x11\x16\x85J\xbe\xa8\
+\xfc\xe6\xbb\xea\x1fL,\xfd\xdb\xf2\xbdA\x89=\x98r\
+\x9dU0\x00\x80L\xb48o\xadR?\xe7\x93\xa9S\
+\xbe,\xdb\x07\x80s\x12F\xe8\x99\x06\x00\x0aB\x85f\
+\xde\x98\x9c\xe4\xbci\xda\x94\xd6P\xd7\xc8\x1b\x89\x9a\xf8\
+\x81\xba>\x00\xb8\xa9f\xd7\xed\xf6\xebL\x9cY&\x94\
+\x08%b21EA\x850\x81\xb7g\x88\xce\xe6\xb3\
+\xf0\xd1V\xa1\xa6\xd8/\xd6\x099\x11\x15\x06\xcf7Q\
+\xf8\x01\xc6\x11\x13\xac\xb7Z9\x83\x9d\xd7\x7f\x5c\xfeV\
+oCz?\xab\xe3\x99\x8c\x19\x8f\x9e\xfd\x04\x00.\x04\
+*\x8ez/f\x19S\x00\xa0\xa7>A\xcb\x84*\xd9\
+g\xe7\xf5\xe3m\xbd\xd6Wfov\xffT\xc9W\xad\
+^\xfd\xd1\x85\x82\x82\xb5\xeb\xff\x17=B\xa4\xa6\xba6\
+\xdc0PE\xb6\xaa\xe5Z$T\x08\xcb\xa5\x9a\xc3\xbe\
+\x13\x05\xc1\xe2\x10\x85\x9c\x9a\x98\xeb,WY8c(\
+\xa2\x9d\x8f\x1aP\xcbv\xa0atY\x13\x88\x9a\xb6\x83\
+\x1d\xf6\xee.\x09\xe5\xf3\xcc\xe4#6\xca<\xed\xf1\xbc\
+w\xcb\xfd\xe1\xeb\xed\xc3\xa6\xc6\x0dR\x1f:\xe5+A\
+\x15\xcb\x05\xba6\xa6\xcf9\xdf%\x00\x1ai\xe9\x0c\x00\
+\xfb\xbdG\x1e~\xfa\xbe\xde\xdd\xbb\x07C!@\xb0\x09\
+\xfah\x8d\xd8\xd4\xc4l%k\x9c\xea\xad\x01\xfa\x9e\x9f\
+U}\xbf\xb8h\xe5\xec\xbc\xa7\xf6x\x8eZxK\x1f\
+]7'\x9f\xe0S\xe4\xa0\x82A\x92\x9a\x17\x5c\xf8\x0e\
+\x14\xe0\xea\x1d\x03\x8f\xfc\x00\xe3\xe8^\x86!NM\xaa\
+\x96\xe9\xfd\x8a\xc7#\xbb\x00Q\x06t\x8a\x9d\x82\x0a\xff\
+L\xde\xaa\xd7;\xcd\x7f!\xfd\xce|_\xc5qo~\
+C\x01\x82\x80\xfa\x1bR\xab$/\x00\xf42$\xaa\x9b\
+~\xf3\xfd\x0f\xbbv\xee\x9cs\xfcD\xac`z)\xe3\
+\xe6\xfb\xce\xfc;z\xda\xa3\x22y\xa8\x16.\xd4\x96\x17\
+\x9ci\x9b\xbe\xc6\xb5\xd9\xc2\x99\xbf\xc9\x5ci\xe0\xb4\x08\
+T\x7f\xb2\xa0\x00\x0c7\xf4_\x17\xda\x16U\x87;V\
+\x83\xb5\x09q\x0a(\x95\xe1\x12\x9f\xe2\xd1q\xc6\x18!\
+!U\xdbM-\x14\xc8\x80\xe3\xad7\xfdT\x93\xfdF\
+\xe1:)\xac\x7f\xbb\xf3Cf^\xef\xd0X\x1a\xc6\xa6\
+\x8a1<2\x02H\x16\xebb\xa3s\xe7/\x5c;\xe3\
+\xb6\x15\xef\xbc\xff`\xd2\xb8\xce\xda8\x8cV\xcdk\xc2\
+\xea\x93\xfe\xb3jkS\xb6\xefd\x02\x1f\xb70\xfe\x1e\
+\x1d\xd3)\x84\xf5\x9a\x8c\x12\xa1\xa4\xa0\x8134O\x9b\
+\xf8\x96\xeb1\x185=\x06\x80\xb2Pqy\xa8\x98G\
+!M\xdb5\xcb0|\xa8y\x22C\xaea\xe4\x00\xd3\
+\xa8\x83\x9e\x1d_\x94o\xd4\xa2n\xaecjP\x09\xa5\
+k\xedT\x7f\xf0\xf1\x1aS\xbabG\x00\x03\xa7\xad[\
+\x05\x81G\xf6H\xd2\xc4\xfb\x12F\xad.?\xd4j~\
+W\xb7\x81=\xde\xc3\xa5\xe1\x8a\x04!\xd6\xab\x04\x00H\
+\x01\x04\x85J\xa4\xb2*\xa9F@>U\xe3\x14\x99F\
+!,\x0c\x96F+@\xb6\x0e\xd36\xa7\x19A\xcf\x8c\
+c\xad3\x06\x9b\xc6\xeb\x98\xbe\x0e\x97\xabO\xd9\xd5?\
+~\xb9\xf6\xcd\xa2\xa7\xcb\xc2%\x13\xac#w\xd6\xee\xcb\
+\x1d\xfa*\x8fji\x84\x1aV\xf6\xc8\xa1\xce\xbf<1\
+\xc712E\x8c\x99j\xef\x9b.\xda+\xc2\xde\xc9\xc7\
+W\x14\x06\xaa\x9az\xe3\x88\xcc\xb0n\xb5\xfe\xfa\x1e/\
+%>\xe1Q\xbcw^X\xd0O\xdf\xe3d\xe0W\x11\
+\xc54M\x92\x91\x19%\x08\xcd\xb3\xcf6\xf3\x96[\xcf\
+\xcf\x0b(\xc1H+H|; \xbf\x08j;k\xfb\
+\xce\x88}\xd8\xc4\x99\x19\x22\x01)\x04L\xedp\xa9\xcb\
+7\x00\x10\xf4\x9c\xf9\x81\xc4\xe7\xde-ya\xab\xeb\xe7\
+.\xba\x04\x1e\x9bj$\x02\xb8\xa5\x80\xc8\xf8\x973f\
+\xa8\x81\xe0I_\xe9\xbc_?1s\xe9\x0e\x8d\xb64\
+T\xd4zg\xac\x957_k\x99x6\x98\xdfM\xdb\
+9M\x93$\xa2\xf8J\xe2\xd2TM2\xd5\xb7T(\
+\x00a\x92\x9aS\x0bm\xbe\xf3\xd0\xe4\xea\xa5\x1fr\x83\
+\xfd\xc1\xbc@\x8e_\xa9\x1dl\x9a\xd8\x98\xb5M2\x0f\
+3\x1f\xbb y\xd9\x9bE\xcf\xc4\x08|\x14\x0c\x86 \
+7P\x1e+\x98s\xfd\xe5y\x81\x8a\xf5\x95G6T\
+\x1d\x9d`\xbby\x8ce\xbaL\xca\x11\xcf\xeel\xcf\xcf\
+\xbf\xfa\x8f\x87\x94P\xdd\xc4D\x97W@\x98\x1ds\xdb\
+0\xfdP\x04rK\x813\xc1\xf3/&.\x16Q+\
+\xd5\x0b\x86\xfa;7X\xd8\xa4\xc8\xd2\xba\x95\x8e\x22\xd5\
+z\xce`\x17\x92V\x14\xfd\x85Cn\xbes\x19Dt\
+\xf9G\xe9\xc2\xd00},\x9f\xe0\x96/B\xfd~\x1b\
+\xea;\x04\xb4\xbd\xfaTQ\xb0zd\xce\xcb\x22\x8a\x83\
+M\xa3\x17%\xff\xc3\xc0Y\xf6\xd5\xfe\x10P\x02>\xd9\
+\xcd!\xc7\x1a\x0cj\xe4\xe8A\x86\x01W\x9b\xc6\x84\x81\
+\x10H\xc3\xb4\x89\xbcs]\xf5\xffn\x89\x99\xa1\xd4\x8b\
+X\x88B<j\xd6\xbb6Fu\xe5\x1d\xe0\xb0O\xf6\
+\xee\xacY\xc7\x80\xdd\x9d\xf0\xbc\x85\x8f\xadO\x1c#,\
+\x5cDzI\x10\xafI\xda\xee:\x90\x1fp\xa5im\
+\x8d\xa3\xc4K!\xcfg\x97\xf6\x8c0O\xe8\xa1\x1f\xd0\
+M\xd7\x97g\x1a\xf5F\x8a\xd8\xe9\xdd\x92\x17|\xb2\x97\
+\x1a\xbfD\xd3H>\x125\xce\xf9\xf1\x0fH\x04\x0c \
+H\xc1\xfd\xde\xbd\x8f9\x16\xac,\xff\xe7\x1e\xdf\x81\xee\
+bW\x1f\xf9E\xd4\xcc\x8c\x99\xb5\xdb\xbdc\x97{O\
+\xb3T\x9f\xa0\xd5\xb7Z\xa2\xeb\xf0U\xa6\xeb\xb2\x8c\xa3\
+\xab\xa5\x12\x13gauUk`\x97\x0bn\x11\xf1\xb0\
+\x95\x8f\xdd]\xbb\xf9\x90'\x7frL\x1f\x1d\xabk\x17\
+\xc8\xf7W\xdfy\xf6C\x87\xd0cf\xfc\x83\xf1\x9a$\
+\x0e\xb9\x86W\x85\xcc\xbc\xad\x8b\xae\xd7A\xf7\x0e\x05\x94\
+\xe6\xc9\x8c\x85\xb7,J\x5cj\xe6l*\xd6\xc1!\xbf\
+\xdf{h\x8fw\xef\xdd\xf6\xbbF\x9aFX\xb9\x98\xc1\
+\x86\xc1=\xb4=\xffS\xf5\xf5:\xd7\x7f\xa9i\x88\xd6\
+F1-:\xc1<\xe3\xefq\xbc\xb8\xc5\xf5\xf1\x9d\xf1\
+O\xe99\x13\xab{\x97\x03\xd5zWH\x09\x88L\xdb\
+\x04:\xd9[\xbbiu\xf9\x87&^;\xce\xda3^\
+0\xe5\x06*v\xb8Ne\x19G\xdc\x16\x7f?\x07|\
+}s\x07\xec\xac\xd9 \x91\x9c,f\xa6k\xbb\xed\xab\
+\xdd\xba\xa6bU\xc4>\x11\xac\x9cmA\xe23\xc9B\
+\x12\x021\x00F\xa4*\xe8\xd6\xdaMk\xaaW\x9b8\
+\xa3\x95Y=\x8a\xbb8\x5cJ\x04\xcd\xde\xb2\x8a\x90\x16\
+}{{\x9e\x10\x134)>\xc53\xd84vR\xcc\
+\xac\xfa\xba\x1e6\xbc\xbf\xb2\xb5\xea?\x93\xec\xb77Q\
+9\x00(\x0c\xfe\xba\xcb\xb5\xb1$\x94\xcf\x83\x90\xa4\xcd\
+\x18d\xbc:S\xd7\x93\x88|\x8aG\x83\x22\x87\x02\x00\
+m\xaf\xfen}\xd5\x17@\xc43\xa1\x9b\xae\xcf\x09_\
+v\x1f\xfd@+o/\x08\x9cW@\xee\xa4\xed>\xd9\
+z\xa3\x95\xb3 \x10\x120 \xac3\xc8\xa4\x10\xac\xbc\
+\xf4\xeaQ_\x0eA\xd4\xbc\xbfi\xcd\x85\xefH\x87\x17\
+\x95\x86\x0by\xe4\xaf\xb6La\xf5\x15\xe3F\xd5\x18\xfc\
+\xc5\xf3\xe3\xb5\xf6Y\x15\xe1\x8bv\xc1\xd9\xa0\xdc\x00\x90\
+\xa2\xe92\xd3\xd1\x855\xc2d\x15\x22\x04`\xc0V\x16\
+-\xbe\xcf\xf9\xb4\x89\xb3f\xeaz\xa8\x09`\x1f\xfd\xe0\
+K\xe1B\x00r\xcb5\xf7:\x16\xd5\xe3\xf6\xc4\x00\x14\
+\x00$\xd5d\xd7U?\x88`\xa7g[\x8e?\xa7\xd5\
+\x22\x13^\xa1\xd1\x02@$\xe8i\x18h\xe6\xadMZ\
+\xf4\x11\xe0R\xa80$\x07\xf3\xfc'\x8f\xfb\xf6]o\
+\xbf\xab>\xac!\x02\x08(^\x1dg\xb8\x0c\xd1\x10*\
+ 1\xe0t\xccX\x1e.}\xbbh\xe9CI\x7f\x8b\
+\xe1\xe3\x1ar\xaf>\x86\xa15R\xc5\x85\xc0\x99\xc6{\
+U(\xf2\x8d6\x00 \xc8\x0f\xe5\xfd\xa7\xf2\xb3\xc6\xb9\
+M{\xbai;\xd2\xdc\x86\x90e\x1c\xce\x10\x19^6\
+Q\x0c\x11\x01\x8bB\xb92\xc8\x9f\x94\xbd>\xc62\xad\
+\xb1\xc1F\x80\xa2`nQ0\xb7\xb1\xac\xe5\xf9O\x9f\
+\xf0\x1e\x00\x00\x99\xa4X\xc1\xf9A\xe9\xcb\x0a)\xea\xfd\
+\x82\xe0y \xb2p\xf6,\xc3\xf0\xfa\xaa\xba\xda9\x05\
+\x0a@\x03H,\x11\x94J\x97\xde\xb9\xf4ZH\x09w\
+\xa4m\xa9\x0d\x82\xa3\x1c[W}\x9fF/\x0e\xd6\xc5\
+\x1d\x88P\x1a*\xf4+\xbe\x9b\xecsM|L\xa3\xfa\
+\x11\x01@\x17}\xdf<\xff\xc9\xc6HJ\xa6\xae\xfb\x17\
+eo\x1d\xf1\xec\xe6\x90\xdd\x12\xf7\xe7\x0b\x81_\xbf,\
+{K]\xac$T\xa0N\xaa\xc6\x11\x0d\xbf\x08\x80\x88\
+\x14\x02\x85@\x06(\x0c\xe5\xaf(y\xc1%\xb9\xda/\
+\xcc\xad7\x97F\x87l\xad\xbc\xed\xda\x98\xdb\xea\xc8\x8c\
+,\x8c\xfd\x5c\xb3)IL\xbd\xd6~+D\xbe\xa9V\
+\xe7?\xc5\x0c\x0e\xf9\xfac\x02\x86,\xd7\x7fz\xabk\
+m\x7f\xe3\x88!\xa6\xb1'|\x87r\x03g\xd5\x11\xe5\
+\xe1\x92\xb2pQ\x8a&S\xc7\x0c\xd0\x0cj#\x00\xb7\
+\xec\xde^\xfb\xfd\x97\x95\xef\xfb\x14o[\xcdi\xd4\xfe\
+n\xda\xe8v+\x0ca\x1e\xb9\x141\x93cB\x13\xd9\
+\xd8R\xbd:E\xec\xd4]\x9f\x85M\x94\x00\x01\x018\
+\xf5=\xa4H\xa7\x9e\xe3\xd9\x7f\x87\xe3A\x13g-\x0f\
+\x15\xe5\x05\xce6l\xaf4\x5c\xb8\xdb\xbdU\xa2p\x9a\
+\xb6\x0bC\x8e\x08\x14 \x00T\x08\x10Q\x83Z#g\
+\xe5\x81/\x0e]\x90H\x8aFTk=>\x1d\x8b\xa5\
+e\x92\xd7W|\xbe\xcd\xf5\xdd0\xf35CLc\x13\
+\xc5tUj\x10YU\xb8L\xcf\x8cM{D\x10\x1b\
+U\x08#v\xd4\xdf0\xc2\x96\x1c\x9b\xa8I'\xa0$\
+1\xa3Iv\x14\xa6\xf0f\xd7\xda\x03\x9e\x1d\xd7\xdb\xee\
+\xe8g\xb8j\x8f{\xb3W\xf6d\x88\xdd\xb7\xd5\xac+\
+\x0e\x15x\x94\xdaV\x8d\x14\xb6^j\xe9\xf0\xe5\x95<\
+\xdb\xaa\xd6o\xaf^\x1f\xc3\xc7u7\xf4\xcf\xd0vu\
+jR\x03\x8aO@^\xedY\x898ej\xec\xa1\xea\
+wD\x00\xc82\xc4\x1e\xad\x81\x95\x04U\xe1\xcaO\xca\
+V\xa6\x89\x1b\xc6Z\xa6\xff\x5c\xbbe\x93k\xb5\x89\xb3\
+\xb8\xe5\xda\x16\xfcm\xdb\xbd\xc3mFZ\xd1N\x0b\x1b\
+\x12\xe9\x88\x7f\x22\x80\x913w\xd7\xf7K\xd1vJ\x10\
+R\xe24\x09\x16\xde.2-\x01\xd5\xf3\xb8\xae\x01\xd8\
+'{\xaa\xa5\xf2\x8apii\xa8\xb0 p>7p\
+\xda-\xd7P+]9\xed\xfd\xba\x01j\xd6\xa6BW\
+@p[\xa0\x0fF\x8d\xc9\xeaL4\x8f\x82\x8e\x19E\
+\xa6e\xc0\x08\x94\x80\xe2\xf7)\x1e\x99$\x82f\x5c\xa7\
+\xdf\xf8\xde\x0a\xb5\xf5-2\x1d \xb8\xbdXW\xab#\
+0\x0a\x88\xd1\x1a':Jm{/\xbe\xdd\x1b\xa7\x0e\
+\x93Mm\xed\xe9\x0a\xbf\x99\xe27]\xed\xfc\xa6\x16\xba\
+\x82\xb3\xfc\xe3\xaf+90\xd6q\x19\x8d\xd2f\xfe\xc7\
+\x13\xd6\xfcm\xd9?\xe4\x8bKZA\xf60Z\xeb\xc0\
+\x1ft\xb5\xf4UCW\xb2\xee\xff\x03R\xb1zX\xd0\
+\xf7\xc4\x1d\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x06\x7f\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x02\x00\x00\x00\xd8`n\xd0\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x061IDATX\xc3\xad\
+X]l\x14U\x14>\xe7\xcelw\xb6\xfb\xd3v\xfb\
+\xbb\xd0Rj\x0b\xf2WAH\x89\x09F\x22\x08h\xaa\
+<\xa0hbB0\x1a\x22\xa8ob\xc2\x03\x09\x89\xc1\
+\x07\x9fH\x1a\x8c$&\xc4\x18~$\xd1\xf0\x22\x0f\x08\
+\x82\xa8PZ@\x11K\x95T\xa0\xf4\x07+[\xdb\xfd\
+e\xb7\xdd\x99{|Xhwg\xef\xdc\x99-\xcc\xd3\
+\xfc\xdc{\xe6\x9c\xef|\xe7\xdcs\x0e\xba\xb5Jx\xc4\
+\x8b\x00\xb0\xf8\xc5\x16\xbb\xd4\xbcu\x94\xffQ\xb23W\
+.\x14l\x84|i\x85\x92I$\x99\x00\x10\x98X\x1c\
+\xd8\xd8!\x83\x04\xed\x96\x91\x0cA&\xd8\x869o\xd0\
+N\x07\x87\xeab\x8e\xd8\xdc\x1b\xb1B\x85\x16\x90\x03*\
+H\xcc%\x8b7\x85\xfe%\xb3\x19\xcc)\xce\xa6\xbf\xa0\
+c\x84\xd0Z>I\x10\x22\xa7>.bM.\xd8T\
+\x10\x07P\xf0HS\x0a\x91\xf4\x1f$\x05\x8e\x8aQ\x97\
+D\x08\xa1\x15\x87\xa4\x5csD\xdbB\x07\xa1\x88\xd4\xb9\
+\xaa\xa00\x0f\xa1\x93\xd0E\xb1\xed\x12\xf2\xa1\x94d$\
+~b\xce\x98\x81\x96\xb1G\x8e\xb9E\x96\xb1\x99\xfb\xc4\
+\xd0*\x03\x99\x81GG\xbe\x93'LkV\xe0T\xd8\
+\x93u\xc2\xc8\xb1\x87\xd0i\x5c\xcd0<)/\xca\xec\
+\x1d\x8f$d\xe0\x0c.\xb4\x09\x0b\xbb\xc3\x95\x1e\xea\x93\
+\xffQ\x01e\x91\xe7\xe9\xa0+\xc8\x00\x10\x09\x01\x10\x88\
+\x01 \x00\x03\xb8\xcf\x93\x97\x93W\x93<%\xc6\x06\x05\
+\x09zJ\x07\x15\xe4<\x16]>\xa5lg\xe8\xd3F\
+\xadQA\x9d!g\xc8\x15\xe0*\x82\x0a\xa4\x02\x00d\
+4t\xc5\xf5\xd8G\x83\x1f\xf7\xa5\xfbe\x06\x8b\xb2\x11\
+\xb3AU\xe4\xa5\x8d\x15[\xea\xb5Fb\x99/\xc3\x9f\
+\x0d\xebw\x00\x0dBNh\x10\xf2(\x8fl\xba\xb1u\
+T\x0f\x97\xb9\xbc;C\xdb\x9c\x98g\xfa\x8b*\xa6\x8e\
+(\xbb\xe0C;\x17{\x97\xeb\x98>=\xfe\xed\xe5x\
+\xa7\x01\x13\xeb*\xd6\xb7hM\x84\xd0\x1d\xbf2I\xa9\
+\x8e\xe6\xbd=\xe9\xbf\x94\x09X\xed_\x19P|1#\
+aY!\x89\x22\x949\x8b\x82\xe9\x90u\xa1VYR\
+Eh\xdc\xcb\x8c\xe8\xa4G\xf5H\x8a\xdf\x07\xe4\x04\x86\
+\x0e\x19\x9d2\x8c1\x1d3:d8\xd3\x9b\xb4z\xa7\
+IAV~X$5\x02\x02\x80\x90\xbb\x01\x91\x14\xc6\
+\xb6\x86v<\xe1i\xd9T\xb3y\xa1w\x01\xa1Ah\
+\xac,[\xb6<\xd0\xfa^\xdf\xae\x85\xde\x96U\xe5+\
+8\xeas=\xb3\x9cV,\x82\x12\xd6\xaaF\xc9\xc7v\
+v\xc9\x1c`F\x967\x1f\xce\xdd\xa5\x00G0\x00\x08\
+\x90\x13p\x9f\xaa\x1d^\xd2\xa1\xa1\x8b\xd0\xe0Hs\xb5\
+:Y\x15%:\xf6\xd5\x07\x9e\x95fX\x9c\xceFT\
+\xe5\xaa\x01 \x02\x0e\xc0\x09\xf4C\xff|uo\xf2_\
+\x00@ D\xf0)\xa5\xdb\xeb\xdf\x04\xc6\x08\x89\x90W\
+\xb9\xfd\x96\xfe\xb2\xe0\x90J\x92\xf2\xc0l\x18\x01\xc0\xd0\
+d? G$\x86\xfc\xc7\xb1\xd3\xdf\x8f\x9d2\xd9\xea\
+W\xb5w\xeb_\x07\xe4\x80\xbc?=\x0c\x0e\xe4\xe7\xaa\
+\xa8\xa8j\xa9U\x04\x0a\x91\x1a\x99\x1c6`\xb2\xda\x15\
+\xecI\xfevx\xe4\x90A\x86i\xef\xcd\xfb\x83\x1e\xa5\
+$\xe8\xf2^\x88^=8|B\x9fZP(_\x84\
+\x10\xca\xfb\xb2\x0a\xb5\xc6\x8dZ\xc4\x08\xa7y\x0a\x01k\
+\x5c\xa1\x0ce\xc6\xf4pP\xadd\xc8F3\xe1\xc7\xd9\
+\xcd\xe5!D\xc2\x13\x03\xde\xa9\xdd\xbd\xa9r[P\xad\
+\xba\x96\xec\x04\x80=s\xf67\xb9\x9b\xbb\x12\xe7v7\
+|\xb2\xb6|\xdd\xc9\xf1\x13\x82\xa8\xb1\xc0\xb8\x5c\xf5\xaf\
+\xaf|&\xaa\xc7\x13FJ\xb2\x85\x99\x13MN\xa7\x82\
+\x80Y*\xb4\x05V\xb7x\x96\x00\x00\x22\x01r\x048\
+>\xf6\xf57\xa3G\x04\xa5&\xe6\xb1\xae\xc2\x15\xf0*\
+\x9e\xec}\xad\xbb\xe2\xfd\xc6\xcdM\xa5\xa1\xbc<\x8c\xe6\
+\x83!\x9fC\xf9H\x22@[`\x8d_\xf5\xdf\xcb\x0c\
+\xb5\xfaV\x5c\x88\x9dz\xa1\xe2\xe5\x981\xd6\x15\xff\xf9\
+\xed\xd0\xf6\xf9\xa5\xf3o\xa7o\xeek\xe9\x88\x1b\xb1\xb8\
+\x11;\xb0\xa0\xa3\xc9\xd3\xd0\x19\xbd\xb4\xef\xc9=\xab\xca\
+\x97_\x89\xf7\xeci\xfe`G\xfd\x1b\x9bk\xd7\xd6\xba\
+\xcb/E{\xbfh\xdd\xad\x22>\x17lM\x18\xc9\x1b\
+\xc9A+ e\x15#\x01\x00r\x8e\xfa\xb1\xf0\x81Y\
+\xee\xd9\xcf\x97\xb7#r\x04\x22\x00\x17***\x03\xe9\
+\x81\x88\xf1_\xabo\xc9R\x7fk\x09cK\xfd\x0bk\
+J*\x1b\xb5\xba\x8b\xd1_\xb7\xcc\xda8\xaf\xb4~\xef\
+\xed\xcf\x0f\x0c\x1d\xdbP\xdd\xf6b\xf5\xca\xfd\x03\xc78\
+\xea\x07\x87\xbe\xfbi\xec\x0fI\xef\xc6$\xe7\x1c\x00d\
+O\xcd[\xa9?\xbb\xe2g\xdb\xab^u3W\xd6e\
+YW\x02PW\xec\xe2\x22\xef\xbce\xbe\xc5\x9d\xb1.\
+\x17\x83\xd7j7p\x988\x1f\xb9\xd2\xe8\xa9\xbb\x95\xbe\
+s1r\xedD\xf8\x97\x14%\x9b\xbd\xa1\x81\xd4\x081\
+>8\x11\x1e\xcf\xc4%\xf5\x10C\xd9\x19\x8c\x88\x84\xc8\
+\x01\xe0x\xf8\x10\x80\xeeVJ\x00\x0d\x00@\xe0\x08\x1c\
+\x00\xbac\xdd~\xb5tE\xa0\xf5\xdc\xf8\xf9\x9e\xe4\xf5\
+5\xc1\xb6k\x89\xde\xa8\x9e\xecM\xf6\xcd\xf3\xce\xdeX\
+\xfb\xec[\x0d/i\x8a\xd2\x9b\xe8'\xe0\x04\xfc\xa9@\
+S\x9d\xbbBRa\xa8\xd2\x16\x8a\x12F$\xa2\x8f\x02\
+@\x5c\x8f\x1e\x1f=\xd2^\xf9J\xdc\x88\x02@\xcc\x18\
+W\x11\x09\xa0?u\xe7V\xeao\x9fR\xd2\x93\xb8\x11\
+P\xb5&\xad\xfa\xecX7\x00\x1d\xbd{\xb2\xccU\xba\
+\xa5~\x83A\x13G\xef\x9e\xf9a\xf4\xaa\xca\x94\xdfc\
+}\xed\xb5m\xd7\xe3\xb7G&\xc6Ma?\x9dY\x9d\
+\xcf\x87\x10\x90\x8a\xac\xac\xb1\x98.w\xba\xeb@i\x87\
+\xfe\xc0w\x8e[\xc8\xc2\xce\x07\x9d\xe9m\xe32Q\x03\
+B6K\x9dL)D\x1342\x0f\xac\x8a\x1a\xc4\xc8\
+G3T\xa4\x93\xc8\x5c\xf90\xcb\x06\x94\xa4*\x92\x03\
+\x03$\xd3 \xb2\xc4U-\xba{2\xf1\x8bf\x04\xa4\
+M\xc5Hv\x1b\xb0\xc0\xf7\x0e\x81q\xe2A\xb2\x9a1\
+\xa2 \xba\x04u\xa3]\x93$\x90fU\x06\xa1`\x12\
+d=\xb0*x$\x87\xb3\x0e*\x92I\xf9\x8b\xd5\xc2\
+fVhD6\x11\x11Z\xc0@v\xfcC\x07\x83s\
+4q\xc8\xaa\xe5\xc8V\xf0V\xe2\xc8:'Y\xb1\x8d\
+,\xeaFs\x1eB\x9b\xc9\x17Z\xb9\xdfvbT\xcc\
+\xe0D\x05\xf9o\x1e}\xde(i\x83Dne\xf0\xe8\
+\x17\xcd(\x1bY\xb0N}\x9c3\xa8\x99.\xce\x0d;\
+\x87\xc3\x86\xa2\xab\x88\x19K\xf9\x1f\xee-\x96\xc6\xbd\x87\
+\xb6K\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x0af\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00(\x00\x00\x00(\x08\x02\x00\x00\x00\x03\x9c/:\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x0a\x18IDATX\xc3\xad\
+XipTU\x16>\xf7\xbe\xa5\xfb\xbd\xd7\xfdzK\
+\x93\x84\x84$$!\x81@\x02!!,\x06\x93!\x88\
+#\xe0\x02\x03\x8e Z2\x22\xe52C\xa9\xa5L\x95\
+\xce\x94:\xae3N\xd5\x94R\xa2\xe0\xa0\x85\x96\xb2\x08\
+2\x03*\x0e\xa2l\x09`BX$!\x09K\x80\xd0\
+\x09M'\x9dN\xba_/\xaf\xdfr\xe7GC\xdb\xc4\
+\x0e\x84\x9a\xb9\xf5~t\xbd\xba}\xbew\xcf\xf9\xce9\
+\xdf\xb9\x08\x80\x87\x9b/\x04\xb7\xb0\xc8\xb5\xfd\xb1\x1f$\
+\xe9&\x1a\xfe\xff+\x11\x8c\x0c\xb6\x09'\xfb\x1b\xba\xf6\
+\xc9h\xe8X\x19\x86\xccd\x1e\x1a\xd4\x02=\xd0\xc0\xcf\
+\x9f;Tl\x84\xf0|\xfb\xa2\x80\xde\xdf\x15\xed$\x84\
+\x0c1:\x14\x00\x93h\xe4\x95\xcc\x95E\x5c\xfeE\xa5\
+3\xa8\x87\x07\xf7$\x02\xf4\xf3\xf3@\xca\xa3\x13\x85)\
+4\xdb\xda\x14\xecPum\x88\xfc\xc0\x03v\x5cQ\xbd\
+Y\x86\xcc\xb59\xaf/v\xcc\xc5\x18\x03B\xf1sQ\
+\x98\x02\x84\x00\x01\xc6h\xa20\x96\xa7\x8c\x00P)\xce\
+\xbc\xcd<s\x9f\xb4kYF\xb5F\xb4\xa1s\x13_\
+\xcfFp+=\xe9\xec\x88\x7fx>~$\xe5\xbeW\
+\x86?E#\xea\xea\xc9\x00\xe6\xdb\xab\x11B\x85\x5c\xce\
+\x87\xd9\xaf\x8e\xe1\xf2\xc2\xbal\xa1\xedsmK\x14\xa2\
+)\xd0\x91J\x8b\x06\xcc\x0er>r\xf3\x13\x87u\x99\
+\xc3\xe2\x04~\xd2\xdb\xeeu\xd5\xe6\x8a\xe7\xd2\x96\x22\x84\
+\x10B\x18\xe1\x85\xb6\x19\xe5\xc2\x98\x0f\xb2^ \xa04\
+\x86N<\xe6\xbcw\xbe\xad\xf2s\xef\xaa\x96\xc8Oc\
+\x04'!\xc0\xe2[\xc8\x91\x81\xacf\xb01\x0a\xa8\x5c\
+\x98zF\xbe\xfc}\xa0\xfe.\xb1j\x868\xb9\xd2<\
+a\xaail:\xedx+\xe3I\x81bR\x19\xf3\xa7\
+9/\x95\xf2\xa3\xbe\xf1\xff\xf8k\xcb\x92\xe6\xd0\xb1L\
+\xd6))\xb2N\xc8\xd0\xf3 \x91\x5c\x08\x00\xc6\x9b\xca\
+r\x8d\x05\x1e\xa5G\xa0\xcc\x1b{\xb7\xdcg\xbb\xa3\xd8\
+\x98'\x93\xd0b\xfb\x9dg\xe4K\x02\xe6M\x94\xd1L\
+\xf1\x80\xc0\xaf\x07y\xcc~\xee]\xdf\xab\xba\x0f\xf8\x9b\
+\x1f\x19V\xf3N\xd7W\x09\xac\xbeI\x8c\x07\x02\x8f\xe2\
+\xc6\xe4\x1b\x8b\xb6\xfb\xb6]\x90[\xce\xca\x17\xf2\x0d#\
+&\xf0y\xb9\x86\xe1\xcfu\xae:-w\xee\x0e4\x84\
+\xf4\xc88.\x17\x00\xac\xb4i[\xff\xde59\xcf?\
+\x94Rs1\xea\x1e\xc7\xe5x\xa2\xfe3\x91\xae!f\
+\xff@`\x13m)\x11&\x8b\x94\x13C`\x91\xed\x9e\
+V\xb9m\x8aPtV\xbeT.\x94\xcc\x12\xa7\x8d1\
+\xe62\x981a\x03\x8f\x8d=j_\x11\x97\xbdE\xd9\
+\xf7#uf\x22\xe4\xbb\xe4\x9e\x03\x81\xa6n\xa5\x7f\x88\
+\xde\x1e\x18\xe3\xa6\xd0\xb1>-\x14\xd1\xb5\x86\xe0)I\
+\xf7/\xb1\xcf\xc1@\x8a\x8c\xb9n\xd5S{g\x1b\xff\
+\xa7\xf4\xa3y\xe7\xc2\xba\x02\x00\xa9\x8c}\xbf\xa5\xe5\xf5\
+\xdd\x7f[\xbd\xef\x83\xae*u\x8d\xe7\x9b\xe6\xf0\xc5\xc1\
+}\x8b\x06\xbc\x1c\x08\x1c\xd1#_x\xd7Q\x98\xb7R\
+<\x8f\x8d\x226\x02\x10Y\x8fJ\xb3\xd1\x9b\xaf\xbdt\
+\xff\xfcyk>\x7f\xf7\x9b\xd4z\x04\x00\x84\x8c^0\
+\xdej\xb1P\x18\xaf\xfc\xf33]Z/$V-\x84\
+\x06->I\xf3\x18\x089.\x1d\xdc\xe2]m\xa23\
+\x8f\x86N\xd2\x08\x11\x80V\xf9\xc2\xdc\xf9w\xf9\xfd\x81\
+\x1d;\xbfeY\xa6z\xe9\x0c\xb7\xd2\xab\x12\xcd\xea\xb0\
+\x16\x95M=T\xdf\xe0\xb0\xdbg\x8d\x9a\x12+/\x0c\
+6\xb0\x147\x086\x89\xe74N\xca\xbd\xf3\xe1\xe6C\
+\xfeo\xef\x10'!\x00\x84\x90B\x14\x8b(n\xdc\xf2\
+\xe5o\x1f~\xd4\xd3\xdd3*/\xcf\xa3\xf6\xb2\x88\xf2\
+\xb5x\x0c\x066\x14\x0e\xcb\xb2\xec\x0c\x9ah\xcc\x8c\xe2\
+\xc6\xbe\x97\xfd\xd2\xab\x19+R\x98\xf4X\xbd\x1b\x8c\xde\
+tR\xe6;\x18\xeb\x8b\xe9\xcb\xb3\x98T@\xa0\x10u\
+8\x93r\xf4\xd8\x89Ie\xa5\x95S'[E\xf1\xd0\
+\xe1\xfaL\x83\xc3\xa5^9\xb0i\xdf\xaa5\x7f\xa5(\
+\xea\x0fO\xaf\x0c\x84{yl\xf2k\xfe\xf7\xbb7\xf7\
+\xaa}\xd4\xe0\x0d1\x8e\xc3'b2\x98Y>l\xc9\
+\x1cK\xa5\x85biD\xbe\x0b\x1c<\x8f\xced\x08\x96\
+S\xb4\xf7\xc5\xb5\x7f\x19]P\xe0\xf3\xf9\xde]\xf6\xf6\
+\x83\xd2\xd4\x93\xa1s\xb5\xfe\x16\xaf\xe6\xebQ\xfb\xdf\x18\
+\xb5x\x18k\xae\xaa\x7fMRu\x0a\x10B$\xa8I\
+A5\x14\x8b]\xd2\xda\x89\x00\x84\x04\xcd\x00\x80\x90\x95\
+\x16+Me\x8f\xa6\xcc3S\x86\x168Z\x93^\xb0\
+\xe1Jm\xa9\x98\xe3\x0a\xfb.\x89\x91\xcb\x97=\xbf\xb3\
+W\xe5\xf3\xa9!=\xc2\xd1L\x88DD\xc6\xc0P\x14\
+\x02\xe8\x08{\xd7\xbbj\xebz\xcf\xccK/Su\xed\
+\xe5\xd6\xad7\x00\xa6\x00\xd8\xeb\xbc\x8cP\xa90nE\
+\xeaR+ea1*\x16\xd3\xd7\xbbwo\xea:\xbc\
+\xab\xfb\xe4\xe2\xf4iw\x19\x8brY\xfbX1\x8d\xa6\
+\x81ch\x86A<\xcd\x9c\x0e\xb9\xfdj\xd8\xc1\x0aV\
+\x96\xbf=e\xb4_\x0d?\x913\xe3\x13Wm\xb3\xdf\
+ucV\x93\x04T(\x13\xc6\xff1uE[\xe4\xfc\
+i\xf9\x02!\x94\xa2\xa1\xe5\xc3gVZ\x0bT\x1b\xed\
+{l\xe4\xf2\xd6u\xa7C\x97\x83\xba\x8c0\xa0k\xbc\
+,2\x0d\xe7)V#\x04\x08\xfc\xf3\xe2\xbeB!\xfd\
+\x83\xf3?|\xd1y\xd8\xc9X\x1ft\xde\xe1dmI\
+;U\xacr\xc5d\x07B\x08\x97\x9bJ\xdf\xf1\xac\xed\
+P:\x17\xd8\xe6`\xc0\x18\x11\x8e\x01\x19\x22\x9b.\xd4\
+\x1a\x8c\x06c\x86%}\xf6\xb8\x95\xfb?:I\xdc\x0d\
+\xae6\xaf\x22IJ\xc4\xa7\x84\xbc\x8a\xb4\xdf\xdb\xf6I\
+\xa4Q\x996\xec\xf9\x1d\xef\xef\xe99E\x00j\xace\
+/\x0c\x7fh\xbay\xfc\x16\xdf\xde_*\x13\x9c\xa8\x0b\
+\x09\xd1\xb7\xfbv\xfa\xb5\xc0S\xcee\x00t\x94\xa0\x90\
+B\x87\xa2T\xb5u\x9c\x01\xe8\x0d\x9b\xbf\xdc\xb9\xeb\xfb\
+wV\xafM\xcbH\x1b^Y\xf8^\xc7\xee\xec\x97\xef\
+|\xb3\xeb\xc0\xca\x93;\xdb\x17\xda\xf7\x8e\xec\xf1\xa5c\
+\x8bE\x8c\xc7\xb1\xce\x7fR#(\xdb\x90\x96cHO\
+Z\xab\xd9\xeb2\x0c\xa1\xd1\x5c\xe1m\xe6\xca\xcfz7\
+7E\xda\x0b\x8d\xa3i@\x22K\xb9\x14\xcfDS\xd6\
+\xc3\x8e)\x10T\x8f\x9dk;\xd6p\xdc\xaf\x84O\x9c\
+l\xae\x09V\x1f\x96\x1a\xa2\x8c\xbc{\xcf\xfe\xe6\x96\xd6\
+\xba\xc3\xf5\xba\xae\xc7,\x85\x89<\xcfV\xc3c\xc3\xa7\
+=\xdf\x06\xf4pB\x0e\xa380J\x94n\x02%|\
+\xe9\xfb\x97\xa4k\x0f\xa4<A\x00\x80`\x8c\x94\xb1\xa2\
+\xf3p\x7fk\x859\xe7\x89\x8cj\x91\xe6f\xdbKz\
+\x95\xe0\x11W\xdbB\xdb=\x9b}\xdbZ\xdb\xce\xc8r\
+\x94\x10r\x15\x95\x00 \xb0\xd1\xe2\xc3\x8e\xfb\xb6\xf7\xed\
+e1^\xe0\xa8\x1c\xc7g\xb7\x84;\x14\xa2\xc6`b\
+\xc0\xd7\xf1\xab_\xebWA\xc91\x16\xee\xe8\xdb\xb8\xc1\
+\xfbi\x9d\xd4\xc0\xa1\xb4\x02\xdeqHj}\xfd\xe2\xf6\
+RS\xd6\xbd\x8e\xf1[\xbb\x1b\x9f\x1d1\xebcw\xed\
+tsE\x9b\xf9\xac? %\xb0\x87\xc4\xd4\xea<\xdb\
+,\x8ch\x00}i\xca\xdcb~d\x85i\xb4\x06z\
+\x83\xd4:\x80\xd5\xf1Z\x0d\x00\x84\x108\x11<\xe8U\
+\xdc\x00$\x9f+w0e\x1fu\x1dy:s\x9e\x9d\
+1m\xe9n$\x00\x13\xcdYf\xcaXf\xca\xf9Z\
+\xdc\xf5\xd9\xda\xf7i\x84\x7fI\xdd)\xc2\x84~M\xba\
+\x10u\xaf\xf6l[\xe7\xf9O}\xa0\x9d\x05.\xbea\
+`?\x8e;\xdc\x80\x8d5\xb6\x05\x0f\xa6>\x93\xcd\x15\
+2\x94\xd0\xa7\x86\x0f\xf5\x1f|*\xe3\x9e\xd6P\xfb\xdd\
+\x8e\x12\x0b\xcd\xf7\xa9\xa1N\xd9\xf7\x9d\xfbx\xa7\xdb\xbd\
+@)\xda\xdf\xdf6@m\xff\xca<\xb5\x88\xcb\xaf\x93\
+\x1a\x1fw..\xe6\x0aSh\x87_\x8b\xec\xf2\x1f\x8a\
+\xbb\x9aIR\xc4\x11\x02 \x16\xda\xc9S\xa6\x0c\xc3H\
+\x04\xc8\xc9f\xfc\xd0\xb7\xcf\xaf\x04\xd2\x8d\xcctK\x01\
+G1<\xc56\x06:TU\x9d-\xe7\xa61\x96\xaf\
+\xbc'\x06\x00\x07\xf4`9_r,\xdc\xd4.\xbbN\
+E\xce\x13\xa0\xcf\xc9\x9d\xf5\xd2\xf1\xc1F\x18\x00\x00\x81\
+2/\x1a\xb6r\xa6\xed\x81\x02\xae4\x1e\x8a\xc5\xc3V\
+4\x85{2\x0d\xf6\xd8\xc4\xc1aF&\xea\xea\xfc\x87\
+\xc2\x9a\xf2o\xafTe\x9dk\xa2\xc4D#\xe5B\x19\
+\x0d\xbcJ`\x8e8g\x8ee\xce\x08&\xbfC\xbe\x12\
+wur`\x03\xe6\x0f\xf4o\xe3\xb1\x09\x01B\x08\xc5\
+\x0a\x1d\x8d\x98\x0a\xf3\x0c\xafr\x95G\xb2\xae\x1d\xecw\
+=\xd3^\x1f\xd4\xa7\x97\x08\x95\xee\xe8%\x84P\x5c\x05\
+L3O\xab2\xcd\xec\xd7e\x06\x19\xea\x82G\xea\xa4\
+F\x97\xd2\xb3/p0\xce\x00:\xe9\x84\xe9S<\xb7\
+[\xe6\xe9\xa0\x22d\x00\x00\x02:\x06\x0c\x00\xa3\xb8\xe2\
+5\x977Y)>\x95\x15\xb7v7\xcd\xb5?\x99\xca\
+f\xf5\xa9=AM*\x16&\xb5\x86bnD\xa3\xf9\
+\xb1\x8f8\x1f\x97\x01\x82\xba\x86\x81\xe9\x88^\xd6\x88\xb6\
+\xb6\xfb\xa3>\xb5?i[\xfc9\xcc,e\x1co\x9a\
+v\xbf\xf3\xf7\x18!\x8c\xe0\xb8T[\x22L\xa61\x03\
+\x00\xb2\x1ej\x0a6P@\x8d\xe1K)D\xbb\xe4v\
+#\xe6\xdf\xeax6\xdb\x98+i\xd2\xdd\xf6E\x88\x90\
+2\xa1\x82\x01\x8a\x02\x82\x80l\xed\xdd\xf8u\xdfv\x00\
+\x92\xd0\x99\xc8\xa0\xf3qT\x97+\xcc\xd54\xbe* \
+\xce\x86\x9b%\xad\xaf\xcaz7\x00\xd1\x88Z,T\x18\
+0\x17\xd2$M\x8f~\xe6Y\xb50e9\x00\xfc\xc6\
+\xf1\x98\x85\xb2\xdah{\xac\xf6\xaa@4\x02?\x85\x8e\
+\xec\xec\xdb\x01\x84\x0ce>\x06\x00\xa0\x11\x9d\xc7\x8d\xc1\
+\x00\x18!\x8c\x90O\xed.7W\xc5\xa6D\x81\x12#\
+z\x10\x01\xf0XX\x7f\xe5\xefU\x96\xb9\x1b<\xab\x09\
+@\xbd\xb4G\xa0\xcc\x84\x80N\x88F@\xd6\xd5=\x81\
+\xef>\xf4\xbc\xab\x13\xfd\x06\xddi\xa0\xab\x09\x90\x80\xe6\
+s0\xc3D\xda\x8a\x00\x8e\x05\xea\xa6Zf\xc6\xb3\xcd\
+\x88y\x00@\x08i\xa0N2U\xb7\x85\x7f\xea\x89\xba\
+;\x22\xe7\x1a\xa5Z\x1b\x9d\xc2b\xae[\xbd\xd2\x14j\
+<\x1di\xbe\x12u\x11\x18T\x81\xf0\xc9\xf5\x18\x02\x00\
+\x94\xc2\xa4\xe6p\x05.\xb9}\x81sY\x1a;\xc2B\
+\xdb\xaf\x8d\xee(\xac\x05{\x94\xcb\x1d\xf2\xb9=\xbe\xaf\
+\xdcQW\xdcn\x8e\xa1\xa0K\xb9\xa8\x13M\xd5\xd5\x1b\
+\xcc\x8c(\xd9\xe5\x0bJ\xf6\x02\xc5NiD\x1cFX\
+\xd6#*Q\x13\x8a\xf3Pnd\xe0\xa6\xc0\xb7z\xcd\
+sk\x907\x22\x17\x00\xf9\xdf\x90\xc8\x00\xf9\xfe\xcb\xf5\
+_6\x7fY\xfa\xc6\xf9\x16\xd3\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00$i\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x02\x00\x00\x00L\x5c\xf6\x9c\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00 \x00IDATx\xda\xa5\
+}y\x90]Wy\xe7\xf7\xbb\xefu\xbf\xd7\xbb\xd4\xad\
+]\xb26\x1b\xdb\xc2\x1b\xd8f\x87\x89\x09\xd8\x98J\x85\
+\x18\x92q<\xa9\x0a\xa9\xa9\x99\x22\x93\x22E\x0d\x03\x14\
+\x99)\x86JUR\x99L2\x99\x84a\x82\xc9$c\
+\xe2\x90\xc5\x860I%\xc46\x18cl\xb3\xd8\x92\xb1\
+\x8cW\xe4M\xb2-\xcb\xb2ZR\xab\xa5\xeeVo\xef\
+\xfe\xe6\x8f\xbb\x9d\xe5;\xe7\xde'?\x5c\xe2\xf5}w\
+9\xf7,\xdf\xf7\xfb~\xdfr\xd0\xedNQ\xf2\x0fD\
+\xca\xef\xca\x87\x14 \xf2{\xf6\x1b\xed#4~*\xee\
+\x01\x11\xd28\xa1\xfc\xd7\xbc\x1c\x0d\xbe\xc7\x1b\xd3\xe4\xb4\
+\x9aKh\xbf\x18bw\x86}\x05\xed\xe3\xa1\x9ei\xd3\
+\xf8\x85\xfeu\xd4\x9aF\xa1\x10\xe2\x0e\x06\xed.\xa4\xf1\
+pZ\x8d\xb0\xffA\xfe+\xc5xO\x16\x8d\xc9\xbe\x1b\
+cEV\xa3\x95\xfdi\xbed\xd9T\x96\x17f\xbf\xc2\
+z\x97\xbc\xfd\x10a9%\xb2K\x8c\x99\x00\xe4O&\
+\xca\x97\xf6{\xbfh\x1dh\x1e\x01\xca\xf7\xa13k\xed\
+\xe6\xc1\x5c\x01\xca`\xd2\x1eA\xf5\xbb?k`\x9d`\
+5\x9a\x82\xf2\xc5\xbcy\x11\x9b\x9b\x91\xa7{OT\xda\
+\x13\x9a\xd7\xf1\x0f\x03\x0b\xb9\xc1\xdd\x10X\x0d\xce\xfb&\
+\xea\x1diwY\xc3~B9\xd7\xa4Z\xad\xe2\xadD\
+\xb3\xeb\x19z\x9f\xec\x1c\xda\xc7\xa8\x9c\xa6\xbc<\xdd\x15\
+\x17\xeb\xdcP;\xa8\xbe[\x83~`\xb0]\xea\xa7\xd5\
+j\x0f\xbbS;&\x11a\xce\xe4\xa0`S'\x03l\
+\xb9\x14\x9f\xb6\xe6@\xf6+\xcb\xeb\x16@P\xb9\xc0\x1c\
+r\xc2\xee\xc6pK\xb3\xc5i/\x13\xc4\x87\xa7Z\x1b\
+\x89%\x1f\xcb\xd9\x87\xc0\x08\xc2\x98\xe7\x0c/Lx\x13\
+\x07\xee\x01\xab\x7f\x19\x9e\xd4\x94\x06\x93\xd98\x01\xce\x1d\
+\x08\xfd\xb8\xf7V\xf6\x0a\x85\xb9P\xfd.EL\x04x\
+\xa3\xe3\x5c\xc8\xbc\x8bA\x01\x12u\xed\x90\xea#\xe0O\
+ \xd4\xceP\x1ao\xe1\x8b\x17*\x83\xa4\x8c_\xd9+\
+\x08\x8ctH\x0c\x97\x9dkN`\xc0\x98\xa7aY\x09\
+\xa7\x05l\xaaE,]\x85\xd8\xea\xa6$To\x07\xbb\
+W\xe1\x8bg\x1b\xea\xd8\xaf\xa3\xf4&LP\x84\xfe\xc4\
+$\xbc\xb9\x85F\x17\xb9\xa2\xcc\x85v@\x0c\x8aF\xd6\
+\xb5{\x1c\xa17B\xe0t\xe3\x84$>mu}E\
+]\xe9\xd1\xbc\xd0\xbb\x03\xa4\x990\x81\xf7\x08z\xcf\x0d\
+\xeaX\xd6\xbc\x05m(-\xbax\x88\x1a\x05\x8ae\xe0\
+N\xcd&\x22\xa1DA\x10m~y\xf37\x22\xd6\x95\
+_\x03\xeb\x00\xda\x1f!\xa5\xe9v\x87x\xcfUn\x02\
+\x178\x05E4\x82\xaa\x19\xe1\x9b\xfb\xc7\xa9\x89\xc7&\
+\xcb\xba\xf8\xb4\x9d\xc5a\xcd\x00x\x8b\x19zc(\x9e\
+\x95\x08K\x8e\x1a\xfdJ\xf3\xf6\x8c\x80\x9fx\xbfS;\
+n \xab\xec\x7fT-Ix\xefXM\x0b\xbbU\xb0\
+\xdb\xea\x8d=\xccu\x1f%\x05\xb4'\x9a\x03\xc0b\xf6\
+\xd06k%\x8a\x91a\x83\x14\xf8:\xca4oYX\
+vt\x80^\x0c\x22\x22G\xbc\xa4\xf7f\x0c\x8bh\x0a\
+A\xa3%\xb4Z\xa8\xa3P\xa3U\xf6\xb3\xe8\xa1D\xc7\
+\xdeV\x0c)\x84\xc5\x8f=\x90m:\x80$6\x82\x1e\
+\x01\xc1\xb0|sX\x1eZ\xccD\xaddtn\xc5\xe8\
+\x99\xf5\x06#u\xa3\x80\xb5-at\x0aF\xbbB\xb1\
+\x90\xe0\xadT\x916\x04DxyZ+\x18\x82\x1a\x19\
+W\x9eX\x82o\xa2bJ\xcc\xc3Q@i\xadV\xd8\
+\xb4\x92n\xda{l\x01$'<t8S\xdaN\xd0\
+f^H\xa0D,G\x044\x96\xdd~\xeb]\x90S\
+\x11\xf5\xf3@\x1f^\x0f\xe1\xb8\x00:(\x1b\x9bZ\xb0\
+\xee\x05\x0c\xa1\xf5\xb0\xb5\xe9\x89\x88\xf8\xac\x15\x9f\xdaC\
+\xfdb\xd5%\xb0\x84\xf5\x80\xc2\x05QC\x99\xd4H\x22\
+\xad)\xa4\xc5 )|!\xbd\xeb\x19\x96\x12\xce@\xab\
+\xadb\x80\xc6\xa1\xd1R\x06\xa8KF\xefC\xc3z\xa5\
+v\xb2\x87\xc8i\xf0\xbb\x0a\xf1I\xef\xe9\x8c\x93q\x12\
+\xe5\x18Xg\x84\xd7S7d\xed\xe4\xa7v\xf3\xe6\xeb\
+\x07\x01>\x03\xd1)\x199\x0d\x0d\xcc\xc3\xc8\xdd,\xb9\
+O\x93rJ\x82\x1c\x8e\xd2\x950\xb5Gp1\xc3W\
+\xc7\x99\xf2(M@@\x83\xe1\xf5\x94d\x13\xeb\x06u\
+\x00\x09\x01\xa2\xd0\x9fC\x8cjT\xcb\xfcB\xad&\xd0\
+\xe5\x1a$q[\x04\x8fX\x8e\xbc\x03,S\xbc\x96\x98\
+a\xa4ka\x0eP\x98g\xae\x9d\xf5\xf4\xf8\xb40\xff\
+\x01\x1b`\xa1\xb4\xa7B\xf6\x87#\xeea\xb9\x95\xfa\xa0\
+U\xc4\x82\xa1\xf4\xe5/\x9b\x03\xbe\xca\xbdh\x83\xdf\x0a\
+\xda\xb2 \x17<\xb7\x98\x0b\xceX\xa3\x1e\x1a\x13\xf1\x9a\
+\x5c\xa66\x11\x18Sq\x0c\xd3\xd0\xf4$\x03\xc3\x8b \
+\xf2.,\xa9\x88Z\x96\x8c\x9a\x84\x85\xc1\x18f\xb3\x87\
+\xea:\x00\x9c\x85\x17\xb2o\x11\x9d5h\xc2\xbd\x85\x85\
+u\x93I\x1a\x17\xfd\xf0n\xe80\xb5\xb0p\x14\x1a\xb4\
+3a\x00Y\xb2f\x10\xc4\xd7\xfc\xac\xd8w\x17\x031\
+n\x1cI\x00\xd2H\x80\xda\xab\xd5\x01\xa2\xc3\x95\xe0\xfb\
+0\xd0\x0c\xd6\xcc\xdfP\x03\x18\x02\x1b\xde\x00'\xa8\x95\
+\xf20\xb0=\xeag\x1e\xbc;\xc0\xfe\xc3uy\xa0n\
+\xaa\x22\xc0\x0fJxj\xc3\xd3y!\xff\x86s\x07\x14\
+N\x0e\x95\x00\x87g\xcd\xa2\x81\x8e\x0c\xf4\x17\xdc\x15\x10\
+\x19[\x04\x05\x11C\xee\x13*\x14\x88\xa1o\x187\x85\
+b\xeb7\x04QlS\xb9\x0f?&\xddE\xc6\x10\xac\
+b\xd8lepq#zE\x12r\xae\xa1\xb1\x8c5\
+q\x045\x7fF\xd1?&\xfa\xacc3\x9a\xf4 B\
+\xec|\xd4{\xa2\x0e\xa7\xb1\x02\xd0\xf0zx\xfdE\xed\
+\x9c2\x88& \x09\xdbV\x8f\xab\xeb\xd4u\x96\x82\x9e\
+\xbb\xccvlKI\xc2\xa0\xc6\xef\xae\xd396\xb3\x1d\
+%\x13$\xc2Q\xc3\x09)\x12\x939\xa7\xc1\x18\xb9\xc0\
+\x80\x88\xfa\x06\xdc\x80)(\xecK%2\x5c\xa1\xeb\xbe\
+l\xab\xd5\x1e\x0e\x82-\x09\x9b\x15\x12\x94\xaa\xca\xfa5\
+;\x99\x9a+P\x0d\xdd\x89D\xe11\x1cS\x87\xf0\xa8\
+\x84V\xb9\x1a\xf2\xe6\x9b\x9c\x11\x06PuK4#\xb9\
+\x128\x0fg\x7f\x1e5\xf38L\xef\xb03e\xe8\x89\
+\xa5\x9a\x18\x08q\xed\xb6\x10-\x83\x1a\xa2P\x10\xa5\x97\
+\xe9i\xaaZj$\x8e\xb5\x18\xbdPB\x22H\x94\x80\
+*\xd6\x8d\xad9\x0b\x8bn\x86.\x18\xfc\xf8\x03\x04h\
+\x0b\x0b\xa0\xd0\xe5\xa2#\x93\x1a\x0d\xec\x83\xdau\x8c\x06\
+\xec\x85\x1f\xc9AE\x11x\xb24\xce\x86z\xe8\x9e\x01\
+\x13\x0c\x1e\xb8a\xa8or\x99\x08}\xe2\xb3\xd6\xc8\x0d\
+\xce\xc8\x1a\xdfw?.Y\xcd\xac\xed\x87n\xb2\x83\xa3\
+\x18\xe0\xe7\x03\xfa\xd4\x1e\x80B\x16\xc1ePl\xa1\xc2\
+:\xd8\x0f\x1d\x98\xc2\xb7\x03P\xb0H\xd0\xe7\xa2oz\
+\x84\x03@\x14\xf9\x0e\xed\xcd\xb5\x09\x0f\xcb\xae\xb7\x15y\
+\x18\xd4C\xef\x1fu\xe2\xc3i\xb9qb\xab\xdd\x1e\xea\
+\xc3-\x02\xdd\x1a0z\x97\xf4.\xf4\x82\x8e\xd1HS\
+!\xe4g\xd6\xfc\xc6\x0e\xbc@4\xa0\x90A\xf0*!\
+%\x1c\xb9D\x8dC7\xcetg\xbdqO\x94lh\
+i\x00*3\x1b\x9a\xf5(1\xe7\xaa\x17\xe5\x97\xf7\xb9\
+3\x7f\xd5\x90\x17\x1f\x16C\x9d\x8c.A\x04\x0f\xcb;\
+\xff(\xe4\x12\xec\x89\x0a\x09\xbb\xc7\xeb\xd4\x06\x10\x95\x0b\
+\xae\xb2\xcc/a\xe6\x92\xccf(\x9d\xc9\xab(w\x86\
+\x10\x08\x0c\xce\xc7X\x05\xa5!\xe2\x84\xaf\xc6\xd8 \x11\
+\xc3\x10c0:@\xa72\xa9\x11\xa1u\xfeT]!\
+1@\x0a\x84\xdc^\xde\xaf\xa0\x1e'f\xb5+\x0bM\
+d\x08\x93i\xda\x8dZ\x13-\x91@\xad\xa3\xe8\xb1n\
+\xf1\x08*/\x02\xb8\x11\xd5\xaejV\x84\xf4\x96\x86\xbe\
+\x9a\xd0\xc8\x0c\xebd\xc3CP\xa6\xab\xc4^\x01\xa6\x1d\
+\x10\xa7\xa3#>\x0a\xd8z\xcf\x95Z@.\x82\x1c\xc6\
+\xab\xce>\x8e\xf8\xc6\x1b\xc4\xb5\xc3C\x12\x08GF\x87\
+}MaZ\xd0WN\x01\x82\x1d\x01WU\x85\x82\x5c\
+b\xd1\x96\xa1\xb0U8\xbc[\xeb\xaf\x10\xc2N\x9e\x8d\
+\x16\x0eLf\xc1K\xc2&\x94\x14)\x8b\x8a\xaeU\x02\
+\xe0\xed\xb0z\x09\xe9\x06D\xc9\x9e\xe0\xec\x84\x17\xaf\x83\
+:g\x87qB\xab\xdd\x1eb|A\xab~\xe0\xda\xf4\
+\x8a\xd0:b\xcd\xd47\x1b\xc9\xda\xa0\x8e\xbe/\xb7\xda\
+_\x7f\xaf\xd7\x91\xa2\x14\xfc\xc9f>\xda\xd4\x90\x93\xc2\
+\x17\xbbiZ\x9e\xb9\xcf:`g\xdd\x95\xf5\x83W\xf4\
+c[\xda\xa8\xeeo\x10\x8ct@'\xf2\xbc\x06\xe3L\
+\x0aW\xd2\x15\x02}\xb1*5\xe08t\x98*'\x18\
+\x9cB\xac\xa8\x08F\xd0E\x18\x12D.\xa16\x83\xa0\
+\xd2@\xfa\x8b^<t\xc5{F?\xf0\xc6\xee\x15\x93\
+\x9d\xa9v\xc6I\x80(\xff\x15)\xbe0\x11\x00\x04%\
+)052\x86\x8b\x92\x88$\x90\x95t\xe9\xa5\xc5\x97\
+\x7f\xb8\xf0\xd0?\xce|{fuV\x1c\xac\xc9\x80R\
+a\xd5\xabVd)\x03\xc4~\x19b\xc7\xb0\xa5\xa2\xa9\
+nt\xbaS\xb1A\xb6\x0c\x10\x83V\xa0N:\xaal\
+\xa8\xf9c\x95'L=rb\xac\xbd\xf6\xdf\xad\xfb\xcc\
+\xe5\xc3o\x01RA\x0a!$E\x16\xd9\x88\xac\xc7\xcb\
+\xef\x92\x14\x83\x91\x08\xf2\xef\x22\x89H\x22\x800)\xfe\
+\x84H\x02,\xa7K_\x9a\xfe\xcb\x7f<\xf9-u\xc5\
+\x07'{\x99rZ\x1b\x8c\xc3\x1asU\xfd\xb4\xda!\
+:\x1aax\xe8GM\x85\x0cE#\xd2\xdf\x88\x0a\xd2\
+\xf3\x04 2\xd1^\xf7_6}qW\xf7BH*\
+H%I\x05\xcc\x10u\xd6\xe3\x00\x05\x99Da\xaeO\
+,,\xc0\xc2\xe2#\x90C\xf1B\xedp\x00\xedw\x8d\
+\xbe\xa5\xd3j?<\xff\xb8\xdbx\xd5\xdeF M\x1a\
+J\x90/\x1a\x82+\xcf\x0e/\x06\xa0\x91\x0a\x0dh.\
+\x04<,\xa2\xfb\x98\x00\xa8Y@\x90\xe4\x93\x1b\x7fo\
+[w\x87\x80\x92M\x7f\xb0\xfaO\xaa~\x87\x88 \xb5\
+\xc1F\x99\x8c\x97G\x03?\xb9\xf0\xe4}\xa7\xbf\xbf~\
+`\xedhkD\x8a\xc5\x01\x91+\x86\xf7\x1c\x5cz\xe9\
+\xd0\xd2a\x97\xfai\xea\xfc\xd2e&\x04}\xf4\x89\xb9\
+\x02\x06\xb24\xd5Z\x0eV\xa1\xf3\x82\xcc\x94\xfe\x0e\xa5\
+\xf6\x0f0co\x1b}\xef\xfb\xd7|$\xb7 \x91\x02\
+) \xab\xe9\xd2\xdfM\xff\xf9\xde\xb9\x07\x86[\xc3\xeb\
+\x076d\x83!B@\x12a\xe6\xe4\x04\x98\xe4K!\
+_\x13\x87\x16\x0f~\xea\xd0\xe7\xf7\xcf?\xf1\xc0\xe9\x07\
+?<y}\x02d\xeb&C\xb7\x97\x0d]\xfc\x8d\x93\
+w\xa4U\xb2|\x94\xe4@}\x80-B.\x5c\xd4\x0f\
+d\x9bV\x96\xbd\x1eT]\x0ds\x88\x1f\x97@\x22\xb6\
+X\x8e\xbe\x12\x1aB\x94@\xa6\x9f\x9d\xb8A@\x22\x85\
+\xa4\xccE\x0d_\x5c~\xee;\xa7\xee\x14\x91e.\xed\
+\x19\xb9T@!\x01\x96\xda\x0eH)\x92\x0a\x13A>\
+\xfdE^[=\x96=\xe8\xf8\xea\xc9\xb3\xb20\x8a\x11\
+\x16W\x0a\xb0~`\xf2]cW\xddwf_\xa07\
+\xeb=\x10P\xa3\xd0D\xf7R\xf8!\xe9\xe6]\x138\
+<\x08m\xa6\x80.\x9f\xa0\xf8\xa7P\x03\x84\x5c\x92F\
+[\x8d\xc3\xad\xb1\xdd\x9d\x8b(=\x91\x94HE\xd2l\
+)PR\x0a)$S\xc9\x8eg\xe4\x12S\x0aER\
+VDUvf\x9aJz\xe5\xe8\x15\xef\x1e\x7f\xcbx\
+k\xe4\xa3\x1b\x7fi(\x19\xca\xcfD\x9a\xa2G\xe9\x11\
+\xbd\xb7\x8f]\xa9\xb7\x84\x1e\xfe\xa6B\x8bQ\xc5\x81\xd0\
+1a\xe8\x86Y\xd4w\xbb\x8f\xe4\x93\x88\x87O\xcb\xfd\
+\x08_h\xd5\xd1\xc8\xfe\x7fg\xe7\xc2\xbc$\x06\x98\x88\
+,\xcb\xd9\xe7\x16\x9e\x10\xe1+\xcb/f\xd7\x9c\xea\x9d\
+z\xe4\xccC\x22\xdc\xdc\xd9\xbcmp\x9b\xf9xB@\
+\x8a\xc8\xbd\xb3\xf7\xed\x9f\x7f\xf4g&\xde\xf9\xb6\xd1\xab\
+~k\xdb\x7fL \x22)%\xfd\xfb\x93w<\xb3\xf0\
+\xc2\x87\xa6\xae\xbbb\xe8\xe2T(\x82=\xdd\xdd\xe2\x94\
+\x07\x9105\xc8\xb0|\xf7\x11*\xb5eau\x8b\x95\
+h\xd4\x86\x99\xaf\x02\xaf10C7\x81\xc0i\x15{\
+\x03j\xa6z\x95\x9bG\xb0\xa4\xc2\xcd\xcf\xd6\xc1\x1d\x82\
+\x94H3\x91\xf2\xbdSw|\xfd\xd8_\x99\xef\xfb\xec\
+\xc23\x7f\xb2\xf0\x87\x22\xb2\xb5\xbb\xed\x0fv\xfdQv\
+\xc3\xa2oH\xc8\xc1\xc5C_<\xf2g\x22\xf2\xa3\xd3\
+\xfbn\xb9\xf0\x0b\x93\xed\xb5\xa9\x10\x22{\xe7\x1e\xf9?\
+\xaf\xde\x06\x91}s\x8f}c\xcf\xcdmiQ\xb0}\
+hK[\x92\x9e0\xab\x80BKN\xba\xae\xee\x12[\
+\xc3\x7fq\xe4\x86\x02|P\x04\xf7{\xe9\x224\xb9\xae\
+\xc4X[\xa0\xe6^\x0e\xf9\xc3\xd9\xf8?\xdbO\x97K\
+D\xda\xcf\xdd\xdc\xd9\x96#\x19\x8a\x08\x97\xb9\x92\xd9\xb1\
+%I\xce\x22Qc)]2\xfe\xca\xbeQ\x84\xab\x5c\
+\xce.N\xc9^&\x8e D\xda\x93^\xf6\xcc\x94i\
+\xcaT\x90\x12L\x80\xed\xdd\xcd\xa2\xf9\x16\xad\xc6\xd3\xca\
+\xe90\xf3P\x1c\x92\xde\xbf\x84\x81\x8e\x12\xfb\x92\x0a\x86\
+:qm\x80&RJ \xc4\xba\xd0S\xa3R\x8f5\
+\xe3\x95\xb0\x14\x88\xe0\x83ko\x5c30%\xc2\x8c\x1d\
+\x1ci\x0d/\xa6\xf3\xdb:\xe7\xadiON\xaf\x1c\xa3\
+`\xfd\xc0\xfa\xab\xc6\xaf\xde\xde\xdd\xf1\xee\xf1w\xef\x1a\
+\xda%\x19\x0a2\x0a\x0e\xad\x1bX;\xdc\xea$\x227\
+m\xf8\xf0\x9e\xe1\x0bE\xd2\xcc\xe2\xdb\xda\xd9\x94$\x1c\
+J\x06~}\xd3\xafl\xedlD\xe1?yb\xe1\x99\
+\x83\x8b\x87\x1b9\x8aC\xd0\x8e\x16s\x0e5X\xb1\xae\
+X\x0e\xba\xddu4\xe2\x1f\x14\xc7\x9f\xe7`\xa3m\x12\
+\x04\x0d\xc0\xa24P\x01~\xca\xb2H\x90\xdc&.Y\
+3\xf9\xc2\xf9_\xeb\xb6\xba\x19\xff_\xa2~\x08\x9f;\
+\xfb\xe4\x7f{\xf1\xf3\x22|\xeb\xf8\xdb~\xf3\xbcO\x81\
+9\x03Q\x9d\xc9\xac\xeeE~~\xc6C\xa4\x5c\xfd\xb3\
+\xa3\xb7>1\xff\xd3_\x98\xba\xee\xe7\xd6\xfel6\x12\
+\x99\xb5,\x90\x96\x08\x04\x7f{\xec\x9f\xff\xef\xd1o4\
+H\xe71,a\xc7\xe0\xd7,1D\x84\xbf\xf6=\xd1\
+],\xac\x0bS\x80\xe2 \xa2\x87\xb3\xe8\x82'\x03k\
+Tf0\xa7\x066\x0c%C\xb9_\x0e)A\x22\xfb\
+N\xb1DPZ\xfc\xd7cf*g\xe7KJ\x90\x92\
+\x12)\x91R\xd2G\xe6~\xf2\xed\x13\xf7\x1fY<\xf6\
+\xe5W\xfez>]`\x8e\x9dR\x22\x07N\x94tg\
+wKC*\xd4\x0f*\xb1{\x9f\xa1P\x8ex\xa2\x0d\
+\x9d\xa8\x08\xdd?G\xcd\x12\x89y\xe6T\xa7\x9a\xeb<\
+\x83}\xa7-\x83\xdb\xd3\xb27a\xaa\x06\xae\x1d\x9c\x1a\
+D\x8b\xe4\xe6\xc1\xcdB\x96\xba\xa3H\xad\xcd\x15@\xc9\
+XdG\xd6\xb6'\xb2_G[\xc3\x03h\xe7#\x9a\
+\x0fR>T;\xbb[X\x8b\xf7\x18\xd6{\x91\xb7\x86\
+\xa7<\xc3\x13\xdc+U`\x16b:\x87\xc0\x1b6K\
+\xf7\xb0\x05\xe8\x96\xc1\xf3\x04\xcc0>\x0c4\x90B&\
+\x07\xd6\xfd\xe9\x9e\xbf\xec\xa5+C\xadN6\x8b\x8b\x94\
+c\xa3c@\xcb\xde\x80\xec\x1e\xde\xf9\xb9]\x9f8\xb0\
+\xf0\xec5\x13\xefh\xb7\xda\x95\xb2,Y\x0b\xc8\xa6\xee\
+\xba\xe1\xa4\xb3\x90.5z5DHb\xe8\xde:\xb5\
+\xba\x01\xad+\xe0\x16\xed\xcb\x87\xc7v\x190\xcaT\xd7\
+R\xd3\x9aW\xd6\x99\x16[\xbb\xbb\xca\x8aB,\x9d\xd9\
+\xc8\x05}KZ\x03IK$U\xd6\xa0\x11v\x5c`\
+\xbc\xbc\xf1W\x8d]v\xf5\xd8eeT@\x09\xd4\x81\
+\xa2\x8e\x01\xb0\xb3\xbb\xe5\xa9\xf9\x83Ag\x06s*\x1a\
+\xaa\xbd`Mz\x82\xa8'\xe4\xab.\xcd5\x09I5\
+A\x031\xbb\xac\xd6\x05\xa6b\x06\xc6\x5c.[\x07\xb7\
+\x9b\xa2\xb5X\x04\x85`\xc9\xb8\xb9j\xee\xe6\x04\xa7\x94\
+\x9ch\xe9!\xc8\x05Q*\xc8`(\x0b\xadP,\x1d\
+\xe4ZD\x12\x12\xbd\x1d\xddM\xba\xf9J\xcd1]\x17\
+\x08\x16\xeb\x13j=L\x11A\xdb\x0a\xd1\x860\x12*\
+,\xa8kIa\xb3 \x0fu\xc9\x88O\x88\xeb\x8d)\
+\xeb#d\x0d\xdf8\xb8\xd5\x9c\xda,\xc7\x80,\xd6\x81\
+\x088\xb32}r\xe5\x04\xaa\xb2\x964\xd1@R\xe4\
+<\x0e&\x03\xbb\xba\xe7\xb5\x93\xaa\xb2%\xe0\xa4Ld\
+\xf6\x177v'u\x16\xabIqH\xb1#P\xfcZ\
+3\x9a4\xf6I\xa4\xb6\xd4\x86l\x84a\xa8\x07lm\
+\xb5\x8b\xcay\x18v\xc1r\x00\x9d\xc1d\x80\xd2+\x15\
+o\xcew\xb2DA\x84\xf0{'\xbf{\xeb\x91[)\
+)%\x10;nx\x17\xde0\xbc\xe3\xb7\xcf\xffO\xc3\
+I\xb7\xd0w9\x95m\xf4V*\x22C\xc9\xc09\xbb\
+!c\x81<\x91\xfa~\xce\x09(\xa3\x22\x0c\xa1j\xc5\
+:T\x07\x01\xaf\xe8N\x15Ea\x84Q\xd8D,`\
+\x95\xf9\xa0\xbf\xa4{\x5c%3p\xe2\xf2\x7f\xa5\x9b\xe5\
+\xc8\xd2\xcb_}\xf5\xabt\xb2\x06`X\x8b\xf6$z\
+v\xe1\xc5[\x8e|\xad\x98\x06i6\xe5\xa5\x92l9\
+\xa3w6]R\xf3\xd2\x10\xc8/V\x18kh\x01\x22\
+Z\x9dB?*\xb0\xf4\xdf\xd1\x10\xbd!\x16AHf\
+\xa6\x13\xc5\x8a\xa0\xf6,r\xda:\x9b\x06\x81H\x0b\xb7\
+\x15\x87z\xd2;\xb4\xf4L\xe6e,G(1z_\
+\x84_9r\xcb*WMfBq.W\xad\x22E\
+\xee9\xf1\xc3\xa7\xe6\x9f\x11I\x0b\x87\x5c\xa5\x1eJ\x98\
+{`\xe1\xa5\xe0\xfb\xfa\x08\xd3x%\x87#&\x15\xfe\
+\xc6|c+?\x8eU\xb8 \xabR\x05\x88\x18Tu\
+:\x80\x8d\xb2\x99]\x9b\xd9\x98\xc9\xdf9\xf5O\x90\x0a\
+\x86\x1ax&\x85\xf0\x9e\x93\xdfzv\xe1\xb9 \xe2\x0a\
+\x17r\xba\xf9\xf0\xdf\xaer\xb58)--\xbb\xecA\
+\xc7\x96O><\xfbt]\xf8\x01jl*U\xb62\
+\x8aG\xec\x85\xd6j\xb7G\xa4\xb9\xef+Dt\xa0\x8f\
+h\x19x\xb8\xf9\x95\xa5\x977u6m\xebl/d\
+Z\xe9j\xe7\xab\xcb\x87o~\xf9K\xab\xec\xd5\x80`\
+-\x14\xff\xf4\xea|*\xbd+\xc6.,\x89\x8d\xfc\xce\
+\x22=\xae\xfe\xce\x0b\xb7\x1cY:\xa9\xf8\x81\xd5\x97\x8d\
+\xc4\xa6\xfb\x11S\x017\x8e\x0a\x0e\xab\xf0t\x18I.\
+\x95BG \x1eO<y\xefD\xc1\xc3.\xc9`2\
+\xd6Z\x90\xe0O\xe6\x1e\xee\xb6:\xbb\x87\xcfO\xaa\x9e\
+\xe2\xc1\xc5\xe7\xfe\xf8\xd0\x1f\xcd\xf5\xe6c\xfeB?a\
+\xd8\x90\xdfO\xcf\xbf0\x90$o\x1c\xdd]E\xb2@\
+N\xae\x9e\xfa\xddC_y\xf4\xf4\xf3\xa1\xfe\x85\x04\x22\
+\xf2\x11\xaerj\x8fV\xa8\xf2\xad\x92D\xdd\xed\xaes\
+\xaa\x9f\xc1\xa75,\x14\x14\x8c8\x83]\x98\x85n\x1a\
+\x92\x05\x87h%*\xe6\x8f\xd9\xd4\xd9\xf4\x8e5\xef\xde\
+6\xb8u)=\xfb\x93\xf9G\xf7\x9d\xdaW\x08\xd8\xba\
+\xb05\xc4@\xf8\xee\xe1-\xd7N\xbdm\xf3\xe0\xd4|\
+\xba\xf0\xd8\xdc\xf3\xdf;\xf1\xc8R\xba\x22\x0dJ-3\
+\xb2\xa0=7\x94\xf3\xce\x0c\xb82\xdd\x15b\xc5\x05\x99\
+E\xf2\xac\x83f\xc2k\xc0\x0bVy^\xe8M&\x8a\
+U\xc3\x0c\xe1\xf0,'\x83\x94\x12)b\xcd`\xd4\x9f\
+\x88\xc3\xdaB)\xc4\x81h]j\xc6\xb2?j\x84-\
+\xeb\xfe4\xa6e\x82\x80\x11\x00\x9b\x9d\x88E\xc6\x85S\
+\x06a\x15\xf0G\x03\x9b\xa6(\x95\xc9\x8c\xc7\x96`i\
+K\xd5C\xe4\xfb\xb1\xa1:\x15k\xc0\x82.\xd3\xe5\x5c\
+\xf3G\xa1EG\x17\x8cW\xdb)*G\x12Q\xdd\xeb\
+\xbbghgH^\xbb\xf6\x97/\x19z+\x8aI\x7f\
+:=\xf1\x95c\xff\xdd\xe7\xb7o\x9a\xfa\xd8\x8e\xc1\x0b\
+\xb2\x11\xda\xb7\xf0\xc0=\xb3\xdf\xcc\xd6^'\xe9|l\
+\xd3'\xae\x1cy\xcb\xcc\xea\xf1[\xa6\xbf\xf4\xc4\xdc\x13\
+P\xd9\xf1x\xfd\xbc\x80\x7f\xa8on\xb1PZV]\
+\xc3(\xd3\x00\xc6\xa2|\xfc\x8c\x84vU\xce\x0db\xe5\
+R@wO;E4\x89j\x82e\xbfl\x18\xdc\xb2\
+\xbb{i\xc9\x10@\xd2\x03\xe3\x8f\xfe`\xf6.Z\x0e\
+l\xd9\xda\xd9q\xfe\xf0\x1e\xa1$\xc2C+\x07\xca\xfb\
+\xfd\xfc\xe4/\xbey\xe4m\x22\x9c\x1aX\xf7\x89M\x9f\
+\xfe\xcd\x17>\xb6\xe4\x10\x96R\x05a\x22\x1c\xc6\xaa\xef\
+\x06\x02\xcb\x88 P\x13\x9ah\x12\xc3\x01\xf9S\x92+\
+fh\xa8\xf5=\x00\xa0Y8\xe5\x85\x8d\xe2\x12\x03J\
+\x8anp\x00]\xee\x1c\x1f\x9a\xfc\xb5G\xe7~8\xdf\
+;m\x05\xc0\xc0\xf0C\x1b\xf1Q[\x07\xb7\x95\xd4[\
+7\xe9n\x18\xd8\xf0\xf2\xd2\xcb\x8a\xa8e@d\x878\
+d\xd6]\xab}>\xb2\xf1\x9ak\xd6^\x9d\x09\xd0o\
+N\xdf\xff\xad\xe3{\xfd\x91\x86\xc0-\x04\xe8w\x7fx\
+\x1f\x99\xc4\xa9x&&\xaf`\xa0:@\x8b\x00\x83\x02\
+7Q\x8dL\xfe\xdfp2v\xc3\xfa\x8f\xfa\xec\xa2\x09\
+\x01\x0b\xa5\x88\xc7\xce>\x82<,.\x9d\xed\x9dxu\
+\xf9U\x1d,:\x09\xae\x1e\x18u\xd3u\xdcd\x09/\
+mG\x93K\x1b:k/\x1a\xddy\xd1\xe8\xce\x8bG\
+wL\x0dN\xe8\x8c\x04\xc4K\xffA\xa4\x8e\x8e\x03\xa3\
+\xdb~\x08\x97\xbf \xa03\xb5\xa1Z\xef\x19\xeb[\x02\
+\x18\x02|\xc7\xe8\xb5?\x1c\xba\xfb\xe0\xe2\x01\xdbcc\
+\xd1>\xd9\xe7\xde\x99\xeftZ\x03\xef\x18y\xe7Lz\
+\xf2\xeb\xc7n\xefq5(\xb5\xa3e\xb4\xd8\x7f\xf4\x7f\
+X\xbf\x90\x0d\x93\xd5\xd4\xfd\x96\xbch8+AC\x02\
+\xb9\xeb\xfab\xb2a\x99\x1b\x9e\x07\xb3B7\x1d\xef\xe9\
+M\xeb\x7f\xfd\xf7_\xfe\x14K\xe6\x09N\xa0Fu\xf2\
+\x9d\xd3\xffr\xe7\xf4\xbf\x14\xadL2\xb6\xa5D\xc1\xb0\
+cn\xc8\xb4\xea2$\xb6\xb3\xd6\xa8\x9ec\xff\x94\x08\
+v\x0do\xdd\xd2Y/\x82\xa3K\xd3/\x9c=\xdcs\
+4=\xf3\xc4Qf\x8e\xa0<\xda$\xe3\xb1\x11\xd4\xef\
+T|\xe8&\xa6\xa7\xe3j\xa6\x81\x82t\xdf[D7\
+ D]T=;\xd7\x9b\x19L\xba]tE\xb0\xad\
+s\xfe{\xd6\x5c\x7f\xdf\xcc\x9d\x16c\x8d\x0a\xadfK\
+\xf0\xda\xc9\xeb\x7fn\xf2\xc3\xd9:>\xb12\xfd\xdb\x87\
+>\x07\xc1\xa7w|vgwW\xe6\xa6\xbc\xe7\xd4\xdd\
+\xffo\xfa\x1f\xb2\x06L\xb4\xc7\xff\xe0\x82\xdf+\xdd2\
+_<\xfc\xe5\xc7\xe7rz\xe7=\x93o\xfd\xb7\x9bo\
+\xca\x8e\xaf\xca\xca\xc7\x9f\xfe\xfcr\xba\x22\x22\x83I\xfb\
+\x86\x0d\xef\xff\xd0\xba\xf7\xad\x19\x18/x\xa7t.\x9d\
+\xbb\xf3\xf8\x03\xb7\x1d\xfd\xf6\xd9^\xae\xf0\x7fc\xc7/\
+\xbdw\xed\xd5\x9d\x9c\xaf\xa6\x08\xff\xcd\xa6\xeb>\xb2\xf1\
+gDx\xfb\xd1{\xbe\xfe\xea\xfdz\x8f\xc1e\x87\x08\
+\xcf!f\xd7u\xae*\xe7:\x05j\xa1p^\x0cz\
+\xe7\xa9\xed\x95\x02\xce\xa7\xa7\xee\x9a\xb9\xad\xf4\xf7\xfe\xc2\
+\xe4\xaf\x8c\xb5\xc6\x0d\xe6:\xd7\xc3\xa6\xf6\xee\xa0;\xd1\
+^3\xde^3\xde\x9a\x18m\x8dd\xef\xf2\xd3\xb3O\
+\x8f\xb7&&\xda\x13\x13\x03k\xde<ze\xf9\xe8+\
+\xc6.\x1bo\x8dM\xb4\xc7\xb2\x7f\xaf\x1c\xbf\xbc\x1c\xd9\
+\xab\xc6.\x9bh\x8fM\xb4G'\x06F\x9f]xa\
+%]\x11\x91\xb5\x03\xe3\xff\xe3\xc2\xff\xfc\xab\x9bn\x98\
+\x18\x18\xcd\xa2\x16\x89\x9e\x80c\xad\xe1_\xdex\xdd\xcd\
+{>\xbb\xb9\x93\x9b\xa5C\xad\xce\xf8\xc0h\xa75\xc0\
+\x82\xc5\xeb\xb4\x06\xc6\x07F&\x06G:I\xbb&\xe3\
+\xc9 ;\x9d4U\xdf\xd3\x9e(*%T%\xd6\xdf\
+?\x00\xf9^46\x9b\x9eq\xbfyb\xd1wg\xfe\
+\xe9\xd5\x95\x972\xa14\x94\x8c\xfc\xe2\x86_\xb3\xa2$\
+\x8d\x82\xa1\xa8\xc8-7\xa0`\xdf\xecC\xe5\xc1]\xc3\
+;G[#\x99\x16}\xd3\xe8e\x022w7\xf2\xcd\
+\xa3\x97\x96\x02\xe4\xd2\x91\x8b\x91\xd1\xab\x94\xfbO\xee\xa5\
+\xa0\x8d\xd6\x7f\xdd\xfd\xf1\x1d\xdd-,yi\xf4DR\
+\x91^\xe6\xb9\xdc\xd4\x9d\xfa\xfd\x8b>>\xd2\xea\x8a\x80\
+\x92\xa6\xd2K\xc5\x8c|I\xb3\xc8\xdf\xe0\xb6B\xe1b\
+\x92\x12v0$.WOo\xae3\x10\x9da\xa8'\
+3f\xb8\xe4\xc6\xb3\xf7L\xd9\xbb\xfd\xd8\x97\x0b\x97\xac\
+\xbc}\xec\x9a\x0b\x86\xf6\x88H\x15\x03Q\xcd\x15\xf3\x01\
+\x99\x17%\x8b\xe1\x91\xa3\xcb\xaf\xbd\xb4t0\xbf\x84\xb8\
+d\xe4\x92\xacg/\x1b\xbd\xb4t\x08\x8bpKg\xf3\
+\x86\xc1)\x11\xd9\xd2\xdd\xb8v`\xbc\xf0\xba\xcc\xff\xf8\
+\xf4\x13\x22\xfc\xe0\xfa\x7fu\xfe\xf0y@\x1e \xf4\xdd\
+\x99\x1f\xfd\xd6\xb3\x7f\xf2\xc9\x03\x7fx\xfbkw\xf5r\
+\xd6:\xdd4\xb8\xf6\xa3[\xaf\x13\xe1\xedG\xbf\xf3\x99\
+\x03_\xf8\xfe\xcc\xfe,B\x89\xe0\x9d\xd3\x0f~\xfa\xa9\
+?\xfd\xf4S7\xdf}\xfc\xc7\xf4\xe3V\xec\xcea\x98\
+8w\xaa['\x14\xad\xe2Th\x8d\x858[\xdb\xe5\
+\x9by\xc3\xcb\x87>\xb7\xf0\xd4\xc3s\xf7\x95A;7\
+m\xf8\xf7\x09\x123\xf8\x07\x16\xe3\xa1m@#x\xf0\
+\xcc\x83\x05\xbc\xe3\x1bG/\x16\x91\xdd#;\xc7Z#\
+\xc8u~\x0aP\x90^>\xb6GD.\x1d{C6\
+\xc7\x01\xfe`\xf6\xc7+\xec\x89\xc8uS\xef\xcaz\x19\
+\xc2\xbb\x8e\x7f\xef\x7f\x1e\xfc\xeb'\xcf<\xff\xcc\xfcK\
+\xb7\xber\xc7\xcd\x87\xbf&\xe8e>\x89\xeb\xd7\xbf\xbd\
+\x8d\xd6\x91\xb3\xc7\x9f<s\xf0\xf8\xca\x8c\x08\xb3\xb9\x7f\
+t\xe9\xf8\xe3s\x87\x1e?s\xf0\xd8\xd2\xac\xf3\xe2l\
+\xe4\xa8\xd4\xb5iRU\x1f\x86V\x0a\xd2\x90K\x16n\
+\x86\x9b\xd8\x0d\xa08+\x17A\x85p\x10\x81\xfc\xc3\xf1\
+\xaf.\xa6\xf3\xd9\x14\xde\xda\xd9~\xcd\xe4\xf5e\x0e\x97\
+Q\xb5\x0d\x80\xe1I\xcf\xfe\xcbo+{\x0d)t\xc9\
+\xc8\x1bE\xe4\x8a\xd1K\xb2@\x87\xa5\xf4\xec\xa1\xc5C\
+\x22i\x22|\xd3\xd8\x1e\x81\x5c>z\x11\x90BRH\
+z\xff\xcc>\x08\x86\x92\xce\xf6\xa1\xcdE\xdb\xf8\xb5\xa3\
+w\xa3\x10~\x10\xb9k\xfa\xa1\xd3\xe9<\x91\x0a\xd2\xa1\
+\xa4\xbd{d\xb3!1R\xdf\x93\xeaf]\xc3\xa8\xbc\
+\x5c\xd4&\x81k\x12\xa0<R1\xf2e\xb5\x14\x1a\x0f\
+\x09V-\xad\xa9~\xe1G\xfeV\x9d;\xbb2s\xc7\
+\xcc\xede\xfc\xda\x87&o\x1cm\x8d\x99\xd2\x0d\x963\
+\x8e\x02W\x0d\xbc\xb6|\xec\xe0\xd9\x17\xb2)\xbc\xa5\xb3\
+ir`\xe2\x8a\xd1K\xb3s\xf6\x9fy\xf4\x07\xb3{\
+!\xa4\xa4\x97\x8d^\xd4\x12\x5c6\xfa\x86l\xfcN\xae\
+\xce<y\xe69\x11\x19jw\xb3\x132Ptb\xf9\
+\x94]\x1a\x9f\xd3K'\xca(\xc7\xf1\xf60\x0d\xef\xa6\
+\x11\xb0\x14\x98\xd3\x0c\xc2Q;\xab\x03\x22N\x80\x86\x15\
+\x9a\xc8\xd0\x86O&\xc8\xa1\xa3\xe8\xcd\x97(w:-\
+\x8b\x18\x1b5(\xef=y\xe7\xab\xcb/e\x7fw\x93\
+\xa1\xcd\x9d\xf3\x8a\x1b\xa4\x15\xcc\xae\x94\x07+Wtq\
+\xdb}g\xf6\xe6\x192\xe4\xd5co\xba`hw&\
+\xbe\x1e:\xbd\x7f\xef\xec\xa3\xd9\x98\x8d\xb6\x86\xde7\xf5\
+\xf6\xf1\xf6hv\xe6\xf7g\x1eN\x85\x14.\xac\x9e%\
+\xd2,\x05\xaa\x8dd\xdd\xe0\x1aZ\xfb\xc7`}gm\
+\xe1\xb3L\x17z\x8b\xa6A\x97\xbf=\xf5B\xbb\xa1r\
+\x1c\xf4Bl\xf3\x17\xb1\x95D\xa28\xb3\xfc \x22(\
+\xfe\xe0\x0a\xbdT%\x1d\x90s\xef9\x93L\xf3\xe4\x94\
+\xe9m\xc7\xfe\xa2L\xb3.S!\xb3ea\xca9T\
+\xe1\x9e\xd6\xe2}hvo\x11\x95\xc5\x1b6\xfc|\x0b\
+\x09\x84\xab\x5c\xde\x7f\xfa\x89\xa3K\xd3/-\x1e\xceR\
+\x8bo\xdc\xf8A\x91^\xa6\x12\xee\x9b\xf9qv\xdb\xc5\
+t\xf9\xc5\xb3\x87\x99\x0fv\xfa\xaf\xb7\xbc\xcfD&\x1f\
+\xd8x\xf5X\xbb+\x92\x8a\xa4\xcb\x5c~~\xfeH\xf1\
+\x829J\x16a+i\xe9.\xca\xc8\x0e\x7fp\xbdd\
+\xb0+\x1bJY\xac\x83\xc1r\x1a\xca]Q\xb0\xd0\x0c\
+y\x7f\xb3x\x1e\x08\xadxByv\xfe\xa7\xfb\xce<\
+P\xe5y\x15(\xc86<hD\x1b\xa6\xc6\xf2\xe3k\
+\xcb\xd3/.\xbe\x98M\xd2\xb5\xed\x89,e\xec\xb1\xb9\
+'\x16\xd3e\x11\xec\x9d\xdd\x9fi\xd1\xc9\xc1\x89\xec\x9c\
+#\x8b\xaf=\xbfp\xb8$E\xee:\xf1\x83\xf2\xb9\x1f\
+X\xf7\xceO\x9e\x7f\xe3\x9e\xd1\x9d\x17\x8cl\xfd\xd5m\
+\xd7\xfe\x87\xed7\xe4\x0b\x11\xbc\xf7\xc4\xfe\xa5tU*\
+G~\xde\x98wN^\xb2\xb9\xb3v\xfb\xf0\xfa\x0d\x9d\
+q\xd4\xec \xa7\xdaKT\xab\xe4\xb5=~\xb4f\x9f\
+Dz;%\x05\xc6@\x97\x96\x7f\x7f\xec\xab\x97\x8f\xbe\
+y\x08C%\x82(B\xa6\xc82\xd9\xda\xda\xe7\xd9\xfa\
+\xec;\xf3\xf0\xce\xa1mF\xcd\x82t\xef\xec\xfe\x1c&\
+\x9d\xda\x7f\xe3\xa6\xeb\xf3x:\x11\x11>p\xeaa\xb3\
+C\xbeu\xecG\xef\x9fz\xeb\xf9C[3\x0a\xe3\x9a\
+\xc9\xab\xdf;yU\x96r\x8c\x22Wivu\xee\xaf\
+\x0e\xdfS\xbe\xd9k\x99\xd7^(\x90\xdd\xc3[\xber\
+\xe5gD\xf8\xbb\x07\xfefz\xe9\xb4#\xa4\x93f\xfb\
+\xca\xfa\x83\x94h\xec^\xd3\x0f\xf5\xe11T(\xdcp\
+\x8e\xd9\xd5\xd3\xff|\xe2\xebE\x14tj\xa8\x01{\xff\
+#I\x8b\x13,=\xb7w\xf6\xe1b\x84R\x914\x95\
+\xd5\x87O?\x9e]\xfb\xe2\xe2\xabG\x97_\xcb28\
+\xb2_\xef\x9fy\xd4l[\x8f\xe9\xef<\xfb\xe7/\x9c\
+=\x9c\x83Q\x12\x92\xe6\x0f\x12\x8apf\xe5\xcc\xe7\x0f\
+\xdczb\xf9L\xd9\xe0\xfbO>6\xbf\xba Ba\
+\x9a\xa5f\xc6\x9cC\x0d\xc0\xa7\xaf\xc7\x13\xcf>\x08\xaf\
+.\xd6\x8e\x073`\x9b@\x900Ihx\xdfJ\xdf\
+:\xef=y\xf7++/e\xf5\xea\x12H\x02\x02\x15\
+/\x0a\xb0%l%L\x90\x97\x850?G\x96\x8e\x1e\
+^:\x0c\xe4Oyz\xe1\x993\xbd\xf9\xf2\xd1\x0f\x9d\
+\xfaI\x02I\x04\x89\xe0\xe0\xd9\xc3\xaf,N;:s\
+fe\xee\xb3?\xfd\xdf\xb7\x1d\xbdkvu.\x8fr\
+\x14\x92\x5cL\x97\xbe9\xfd\xe0o<\xfe\xbf\x9e\x99;\
+b>nve\xfes\x07\xfe\xe2\xd0\xd9\xa3%=\xb7\
+\xc2\xde|oQM\x83`4\x8e7\x18\x9e\xa2ni\
+\x1e\xe8`6p\xeb\x22\x91$\xc9\x81\x9b\x08\xd8\x93^\
+\xe6\x13\xaf\x5c\x9e@\x82\xc4\x8c\xe7\xa6\xa4\xbdB[\xb4\
+\xca\x22^\x02\x11\xaeJ\xcfy@KZ\xe5\xb2M\x85\
+=C\xcd$\x82\x96$\xe5\xd6w\xab\xb6\x06r\xfc\x8c\
+\xbb\x867m\xeeN%\x82\xe3\xcb\xb3\xcf\xcd\xbf\x92\x19\
+k!\xdd\xb7}x\xc3\xfa\xc15g{\x8b\xcf\xcf\x1f\
+YLW=\xde\xd4\x88ub?2\xc4\xcc\x11\xd3\x0b\
+$\xb3\x8fP\xe1P\x1c\x87\x13\xdf\x10\x8a\x8ah\xb2\x13\
+i~\xab\xdaM\xe4%\x5c\xe2\xa4aTDT\xa0\xc7\
+\xe2Y\xd4H\xe9p$C\x22^N|x\xe5\xb0\x0f\
+\xb7\xb6\x05\xb6\xd8D/\xb1A\x85\x17\xc6\xb7l\xa7M\
+\x1d\xd69\xbc\xceM\xd5\xc1wE\x9bF\x12\xdc<j\
+F\x02\xb3\xb2\xca:fi6\xb3\xeb\x5c\xbf\x13B\xfb\
+\xcd\x18\x04sq+X\x10\xb92\x18\xc2\x0eM\xbd\x93\
+\xf4s\xd0,\x00$\x12)\xc1\xd0\x84\x89\xeeX\x13\xda\
+\x854\xb4e\x14\x15\xdf\xa5\xf3\xb8\xc4\xdcZ\x0e^\xcd\
+(iP\xd1H\xdb\x81\xb9\x8f\xdd\x17$\x5ck%n\
+\xfa7\x0d\xcb\xa9\xbb\xbf\x04*\x03Q\xb5I\x03\xa2A\
+\x1f6\xe8l\x8dys\xabh_M\xb5\x1aO\x097\
+IF\xd2\x8a8A\xe4uxl\xa5\xc9\xf6\x18\x0dd\
+\x0c\xf4\x04\xba\x98$\xeag\x1b'\xc4\x059\x1c\x87L\
+\xa3\xf9\x14\xddU\x89z\x99\xfd\xc0\x1eI\xaf\xab\xff\xfb\
+\xee\x9d\xc0\xab4\x0fz\x8b\x0f)\xebV)\x03\xf6\x92\
+T\x9b\xf8\x18\xb5\x10\xc2\xc5z\xd5\x9a\xb8\xb1J~J\
+T}Y#\x99\x8d\xd5\xb1z\x90\x81=\x13\x1c\xef\x90\
+\x1a\xda\xcb\x06\xfbV\xd1\xab\xe3O\xaa\x0dp\xab\xdfe\
+\xfc\xa1h5(\xc4\xd1\x0c4\xf7\x92\x0c\xec\x03T\x8e\
+Lhg,j\xf3\x1cAr$\xb8\xd3\x92\xf5\xe6\x0c\
+v\x968\xc9+\x9es\x8e\x8eh\x86M/\x85\xeb\x88\
+\xd0S\x7f\xb4o.\xea\x9c\xa3\xef\x92\x81\xf8\xf5i\xe8\
+\x02\x8b\x9c\xb1d\x1bUx\x82\xd1\x1e\x98a\x0b\x85z\
+\xa6W\x87\xdf+\xceG\xff\x88\x13uT\xa0d\x86J\
+s\x015\x0b\x1f\x15\x87,\xa1\xd0b\xe7\xd6~i\x7f\
+?\xa0\xc3\xc2|^\x942\x02\x91ny\x994=<\
+\xa4\xea\x14\xb5\xfeV\x11H\xa3\xa8\x0f:\xd6\x01\xa2\xb4\
+\x84!p\x10\x15#x\xfd\x82^$V\x0a\x86\xd1m\
+\xc8\x22^\xee&\x0f\x95`\xcdJ\xfa\xf1\x98\x11\xe5d\
+\x83\xcb\xc4\x8d\xd8e G,\x0e\xb3\xc3\x86\x89\xed\xeb\
+l\x8c2#\xc5c#YD\xb0\x97\x81v\x13\xb0\xd9\
+&\xadM\x0e:;\xb7\xaa\x1b\x99\xa1\xa6\xa3<%,\
+\x91\x17\xa0!I\xf5yD\xa5h>\x8b\x9c\xc8*\xf4\
+\x81\x12.d!\x91\x80\x02g3d\xaf\x22>\xc3\x1b\
+\xc4\xabQ\xd3\xfe\x90\x87\xc1\x05\x85\x01\xa5Mj\xdb\xd0\
+\xb2\xd9\xfe\x97\x89.\xd3u\xf3Ql\xc3V1\x1f\xd1\
+\xc4\xba\x15-*\x16\x0d\x9e+\xde\x96w\xdeF.\xce\
+~\xa6\xd6\xabEk\x1b*\xf1\xa6^\x06\x9cb\xc1\xe7\
+.x\xbbC\x1c\xa5\x12\xcd-L\x1a\x01^\xd6\x90#\
+}\xc2{6\x14\xbcv\x81\x0b\x09\xe0\x10\x9dC\xaf\xe7\
+\xce\x9d}\xa8B&\x8cz\xdc\x5cj\x19\xd4\x8d\xd8\xd0\
+\xca\xb46\xb64G\x03\xf2\xa9\xd1\x08\xc5\xe5\x09\xa4\xce\
+]F\x05J\x98f4\x1c\x1b*nL \xa6<r\
+\x87\x9b\x815\xe1\xc9+R\xb7;\x190\xfaiVB\
+\xa9\xdd\x9d\xabZ\x22\xed\x98%eRO\x91=LC\
+\xa5C\xed\x92\xe9%\xbe\xd2v\x0cd\xcd\x1e\xe8^\x05\
+I\xd4Tc\xa8+T\xa5\xda\xc4pv>\xb1\xe3\x98\
+\xcd\x16\xdb\xe7\xc3\x81*\xbei\x1c\xce8KX\xa3\xec\
+\xebv\x10\xa6\x8fV\xa3f\x94\x93R\x10\xdb\x18\xe9\xf5\
+\x91\xc8\xf5[\xe4\x052f\x10\xdaB\x0a\xcd\x04\x02k\
+\x80\xaf\x0d4\x13m[*\xd40s5m\xb0i7\
+\x1b Vd\xb5\x85\xaf\x11\xd4\x90h\xca\xbe\x9d\x1b\x8d\
+\xa3\xff\xccf\xb7`x\x00\x83\xb5?\xc4\x09\xd9Mb\
+\x94N\x13%\x0c\xa9\xbf\x83\x8bV\xa9o_\xe4\x83N\
+\x9ckfh\xbd\x0d\xd1|\xffB\xca\xb95\xfa\xe4\xeb\
+\xf5\x00\x00\x04\x0fIDAT!\x88\x1a\xac+\x92\x12\
+;\xc2L\xb0\x87\xb6\xd9\xb8\x84s\x83\x02!\x15fM\
+\x17\xb7\xdaG]\xf2\x94D\xc4@|\x89\xd4V\x13\xb0\
+\x9a\xc0(\x00\x85O[\x03\xae\x93\x05\xe6Z\xb7/u\
+\xdd\x11p\xb9\x8a\xc4g\x92\x10\x95-\xfe\x0eEn\xd0\
+\x1c\x9c\xd4\xbbHg\x07&_\xc8\x89\x18\x9f\x04\xa2)\
+F\x95\xfeA\x98\xba\x89\xe9\x8c\xc0\xee:\xa2,\x5c6\
+\x96\x7f\x89\x933'~\xc2e\x1f\xba\x0fV\xa6%\xdc\
+\xca\xf8~\x96\xa5YT\xd7\xd9O#\xb0\xfb%\x02\x8a\
+\xd4\xef&4\x90\xea\xf1\x88B\x1b\xec\xd5&o\xa9{\
+\xb1\xc5\x88:\x11\x91V\xab=\xd4\xd8;R\x17J\x80\
+\xfa\xa0\x06\x05\xb36\x8cMh\xb4\xfbg\xd3\xe3,\x85\
+A\xbf\xf1lAa\x8f>/A\xb1\x02j2\x08\x1a\
+r\x86!;\xe0\x5ci\xaf\xfelq\xa9K)\xf11\
+0\x95x\xfb~\xfdZn\x8a\xa7J]\xc5\xb53\xdb\
+Yyg\x9d,\xa9\xb8n\xc04`\x95\xfdr\xd5M\
+\x94`\x1f\x87\x98\xb5\xf3\xc1\xf8n\xf0\xce\x13\xecr\x0c\
+\x95\xdfB\x8b\x19a\xf9\xc5\xdb\xf6\xda\xdd\xb2;\xdf\xe5\
+\xbeh\xa7\xd7\x15\x8d\x00\x80]\xb8\x09\x0c\xd4\x16cQ\
+\x19\xd7\x14\xa7\xde~\xc2N\x92\xb1S\xc8\x14\xa8\x150\
+>\xecs\xcaIG\xb6\xb1\xaa\x91\x1f\x91\xbd\xa7\x10(\
+\x91*1\xc9\xe4\xbc#\xe2O\x0c\xad\xb7~%\x90}\
+~\x9b\x81\xa5\xc6Z\xb9\xe1\xbd*\x114\x03\xf5m\xd0\
+\x18\xd8r\xcb\xa9\xb9\x16\xf5q\xc6\x18\x08\xa7\xa9p\x81\
+\xb9Rx\xa4\xb9\x84\xa4\xb9wjQ9\x17\x81'F\
+\xe8h\x84\xc6P\xc5 l`\x97\x9ds\x805\x1a\x8a\
+M9\x97\x0f\x02\x1e\xfcF\xa6S\xd8Q\xe1oT\xcd\
+\xa8V\xf2VR\xc2\x86\xca\xd0G\xdf\xf47\xa8\x0d\xf5\
+\x11\x82\x9bA\x85\xaamH\xc0\xca\xeb\x8f\x14\x09\xdfG\
+\xc2\xfb\xd4\xb2\xae\x18\x11\x1atQ3\xa6&@G\xf7\
+\x85\xa6\x9c\xca\xf4!\xd4\xe7\x16\xbeF\x0d\xb2@\x9c\xcf\
+\xaa\x05&\x0d\xa66\xfb\x01Yad\xe4'\x00\xc7\xae\
+\xf0*\xe8$b\x9b\xd1\x08\x95`q\xee\x0d+Y\xbe\
+b\xde|\x17\x95\x9d\xd6\xeaZ(uS\x18\xb5\xb3\x0f\
+\xb6\xdd\x16\x0fy\x84f\xf3\xdb\x0e\xb5Z\xa7\x9e(T\
+D\x8c\xcaE\xc8\xf4W\x9c\xf2\x05\x07\x1e\xc8\x11\x83\xba\
+\x9a\x9a\x93x\xfd\xb3h\xc6\xca\x09s\x03\x12\xdb\xb6<\
+,\xf7\xa9\xcf{\xaa\x09\x8a\xa8\xe5\xec\x1a2\xa7.\xc2\
+M\xea[\x06\x8d;g]C\xa8l\xf2\xce~xd\
+\xc4Y\x04{^\xfbe\x8bbI\x87\x11N0\x90\x0d\
+PW3\x16\x91\xe1`\xb0d\xb0\xc9\x05\xd12\x13%\
+P\xd8\xa0\xe9 \xdb\xef\xc1\xfe\x82f\x1b\xac\x91H\x10\
+\x8e\xf4\x01\xc3\xd8`YH\x03>\x9aM\xc9me\x87\
+\x99D\x89\xb6\x08\xee\x9a\x11\x8d\x0d\x8d\xed\xb2B'\x0f\
+\x9f\x0d\x22\xd8\x11w*D\x9c\xf2q\xf7}H\xe5R\
+\x82%6\xb4\xaa\xdeV\xd9r\xd1\x82\xc3h\x17 \x08\
+\x08\xc3\xa4\xe4\x17a\xebU(,\xbf\x97\x9d\x0cO\x9d\
+\xfa\xfe/\x14\xa5\xef\x03\xab\x16\xfd\xae\x0d\x95\x94\xf6\x0e\
+\xc2-\x18o(^xJ\xd8A\x1f\x12+\x90\x0c\xd7\
+\xcd\x00\xdf\x1fPu\xa3_\x8f\x0f\x9e\x0e\x80\x07Wt\
+\x91\xeb\xe6\xfc@\x03D\x16\x1d\xad\xd4\xb2\x83\xa5\xcf\xe3\
+\xf96V\x9b\x1d\xefG\xd9\xc7\x08\xf15\x0c\x94\xa9\xb6\
+\xda\xee\xecvP\x22*\xa8`)\x8a\xe2\x94v*\x5c\
+\x19\xcc\x8e@\xb6\x93\x1e_\x0f\x17\xab\x11a:\x9dV\
+\xd5P\xc3\xeb\x0b\xc7?7\xde\xb7\x1fn\xbbo:\x5c\
+\xddL2l\xcf\x85\x92\xf4\xea\x8c\x0e\xf6\xab\xd5bX\
+\x89}\xdeK$\xa6\x81\x82_\x9a aJ\xa3g1\
+\x1e\xb4jL\xf8\xba\xd4k\x1b\x05\xe9F2\xfa\xef\x1e\
+\xd6\xb5\x0c\xd1\x19\x8e~\xd6\x9ab\xfaC\x91_\xb5Q\
+\x92\xf5O\x0e\x19\x93\x9e<\xa2c1E\xe81\x04\x06\
+ R\xae\xa6\x0f\x93\x9d:\xf6\xa2]4W\x22\xde\x0d\
+*\x9e\x94\xe0\x0a\x08\xfc\xc9\xbedK\x98i\x08\x82(\
+\xb5@\x19\xf5\x92e\x91E\x90\xd4\xd3\xb9\x12 ,\x19\
+\x8c\x97o\xd4\x01\x91\xed\x8f\x11XO\xd4\x9e\xce\xb8\xcd\
+\xd6\xa0\xdfQGk\xb3\x01QJ\x9b\x9dd\xd8F\xb6\
+G\xe3\xff\x03\x5c.\xb1\x07\xf6\x05\xc48\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x0b\x0e\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x02\x00\x00\x00%\x0b\xe6\x89\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x0a\xc0IDATh\xde\x9d\
+Zkl\x1c\xd5\x15>\xdf\x9d\xd9\x877^?\xe2G\
+\x88\x13\xf20\x8d\x88\x05I \xe2Q\x84(\xa9\x0a\x88\
+\x16A\x15Z\x04UE\xa1\x88>\xd4\x0ahU\xb5U\
+\x04TjE\x11B\x82\xa2\x82\x90h\xa9\xe0\x17*\x14\
+J\x11TU\x0b\xb4@\x84\xda$46!\x10'i\
+\x82\xdf\x09N\xbc\xb6\xd7\xf6>fg\xee\xe9\x8f\xf1\xee\
+\xce\xce\xdc;3\xeb\xd1j\xb5;s\xef\x9d{\xef9\
+\xe7;\xdf9\xe7\x22\x95\xee\xa2\xe0\xc5D\xa8~\xfbn\
+V/\xf7y\xd8\x159\x88\xefQ\xedf\xed\x05\xb5\xbf\
+\xd0\x8cF$\xb4\xfd\x83\x17(\xee\xc5+\xeaUk\x0f\
+O/\xdf\x8f\xc0hf\xc3+\xeb\x8bfb\xa8\xd7S\
+m\xc3\xd0\xec\xb7w@\x0e_\x9e;\x0a\x13P\xbd\xa9\
+\x11\x0a\x13\x11\xfc\x92$&\x82\xa9y\x0d\xfc\xf2b\xbf\
+\xd2\xf8U(\xb8C>9\x04u\x80\xdd\xb7\xc0\xb3/\
+\xd0\x8a\x1e\xc1{\xa8\xaa\x10b\xa8D\xa4\xcas\xa8\x1e\
+r\x94\xa2r\xa8\xc6\xeaM\xc5T\xab\x1a\xab\xc6\xf2\xef\
+T@\x22!\xbf\xb9Qh\xd0\x88\x0e*;V\xca\x1c\
+!F\x1c\xba[L\xc4\x5cS\xc1\x18\x12\xf0\x0c\xc8\xe1\
+\xa2c\x8d\xac\xaa\x1fV\xf5\x15\xcd\x81\x0f{\x80b\xc5\
+\x18\xa5S*\x9f\x15q\x8c^\xa8\xa9P8*#t\
+\x96A\xeblv1\x91\x9b\xa8o,\x14\xb3\x0c\xa2r\
+P\xbb8\x96\x85i\xe5\xc9JT\x89\xb1Y\x01\xb7 \
+V\xb8\x01+\xbeX\xe3\xc69t\x1a\xd1(D\xa1(\
+Du\xbcn\x84\xe1\xd8(\xa4\xdcB\x0e\xb5\xb4\xf05\
+T\xbb\x0bT\xf5\x04\x08\xf8\x22(\xde\x85\xf8\x1a\x0e\x05\
+\x0e\x06\xbd\xa5\x1a\x0f\xa0\xf8\xad\x9c\x9e\xa8\xe1a\x0d\x1b\
+9\xb0\x13\xec\xb1\x01&pL=\xe1Fd\xe4\x00\xf6\
+\xfa\xeep\xe3\x87\xfc\xbf\xfd\xd3#\xaf\x04\xa2\x00\xb4.\
+\xa8:)amW4n^\xb8v\x057;\xa4#\
+\xfco\x14j\xf96Z\x82\x8f\x8b\xb0\x07\xb6\x9a\xb0|\
+\xc4n\x16Ef\xbdK\x16j\xcbQ8Y\x8e\x89V\
+\x88\xff\x88\xa3H\x80\x06W\xbcS\x11\x1c\xcf\xa1p`\
+\x1d+pG\xdc\xa4\xd1+\x89\x89\xca\x06t\xf1\x04\x94\
+\xac\x16\xcd\xee=\x1aQg%J\x15\x12\xd00i\x22\
+7\x8dj2\xb8\x1a\x8a\xf8\x1b\xf5\xa7\x07\x06\xd2\xdb[\
+D\x0a`\x10\x01\x0cbQ\xd5TA\x04\x90d{\xa4\
+<\xfa\xfe\xe2\x076\xdb\x8ah3\x9c\xc0\xabBJ\xb3\
+\x09g\xa97\xb6\x04\x12w\xf7\xec\xb9,{%\xe0\x08\
+8\x02,H\x02l\x10\x0b\xb0I$\x88\x0d\x82Il\
+\x10\x19\xc0\xa45\xf9\xb3\xb1\x87\xa6\xac\xe9\x08uG\x94\
+F\x82\x0c\xd3\xcc\xa8\xf97\xa2&\xee\xd9\x8f\xdd\xab\xef\
+\xba\xba\xfdz\x82\xcd\xb0?,\xeck7\xdb\x92\xc2\x04\
+I\xc0\x95\x00\x03\x5c\xe6\xe2\xa3SO\xb4\x9b\xad\xe7$\
+{:\x8d\xb6\x8b2\x03\xaf\xcf\xbd\xd9\x1c\x91\x81bU\
+B\x11G+M\x02~\x9c\xae9\x10\x03\xc6\xae\xf6\x1b\
+$l)\x9cYy\xe6\x89\xc9\x87\x0f\x17\x07\x19\xb2\xe1\
+C\xb2\xc4\xc5#\xc5c\xa7\xec\xd3\x0c\xc7\x11\x95-\x99\
+\x8d\xdb2\xe7\xab_\xa4\xfc\x1b\xf40 \x02\x19\x093\
+\x13\xe1\xc95\xf2\xa8\x0d\xd5\x97\xda\xf4\xa5\x8e\x9b\x00\xf9\
+\xf6\xfc\xab\xef\xce\xff\xfd\x9451k\xe7F\xad\x93\x17\
+\xb5^\x0cb@\x96\xb9\xf0\xcb\xf1_\xb7\x99\xad?^\
+\xf7\xbd\xde\xe4\xea=\xa3\x0fw&\xb2\xebSk\xc6J\
+\x93\x87\x8b\xc7#\x08|(@\xa1n\xc4J\x8a\x0f\xa5\
+\x84\xe1\x91!3Q_r\x03A\x12\xe4t\xe5\xf4T\
+y\x82\x89f\xed\x5c\xcaJ\x11\xa4\x8b\xed\x92\x1cK\x96\
+m\xb6%\xa4\x84cq\xc5\xe6\x8a\x84\xbd\xb9e\x1d\x82\
+\xfe\x07U\x87\x80\x00\xe6C1M\xc3\xf4I\x00\x91\x00\
+\x07\xf2d9@tI\xf6\xea-\x99\x01\x02oo\xdd\
+\xb93{\xc9\x9b\xb97\xbe\xdd\xf7\xdd\xdbzo\x03I\
+\x02\x03\x9c\x10\xc6\xb5\xabwu%:\xee;q\x7fW\
+\xa2\xe3\x07}\xb7oH\xaf%H&\xf9z\xee\x9d\x88\
+\xa8 \x8aB\x9a\xea\xc0\x8aC\xd6\xc0>\xe7\xd6\x97:\
+\x97\xe0\x10$\x83\xb3f\xf6\xc6\x9e\xdd\x9b[6\xbbz\
+\x0f7\x84\x063\xb1)\x8c\xf5\xa9\xb5\xedf\xab\x84\xe3\
+.\xfd\xdct\xafA\xc2!\xa9\xc9M\xa9Rzj\x18\
+U\x86\xd5\x1c#\xa4b\x22`]j\x03\x81\x19\x12`\
+\x13\xc6\xee\xde[\x0cb\x90\x04I\x80\xc8]\x06d\xda\
+H\xdc\xbf\xe9\x1e\x103I\x063(a\x88\xbeT\xf7\
+xi:\xcc\x1bDM\xcc\x84.\x9b\xa4\x9d?\xaa\xee\
+\x0c\x04\x16\x84\xeed/\x91\xab\xee\x92 \x89\xe4\xde\xb9\
+w\x8f\x17\x8e\x12\x11\x96\x95\x8dA\xd4\x9d\xec\xbcu\xcd\
+\x0d\x06\xb0,\x130C\xf6\xa6:\xc7\xcb\xd3\x11\xc0\x1d\
+\xa6\x0eU\x09\x00\xdet]x\x06\xd7gu\x5c\x96\x85\
+\xb4\x99$0\x88A|\xbc0\xfc\xec\xe4\xb3\xec\x0b&\
+@ J\x1b\x89\x9b{\xae%H\xc0\x0d+x\xc1.\
+4\xcbP}S\x12\x5c\xdd(fM&\x87\xc3(#\
+\x13\xbf5\xfb\x17\x90\x14\xc4\x80\xacp\xf1\xb9\xa9?p\
+C\x88Tm\xc7\xf4\xe2\xe97N[\x9f\xd1\xb2y8\
+G\x0a'\x8f\x17&tY \xef\x08L\xaa\xe4\x12\x13\
+\x91\xc7\x0f\x00\xa4vjP\x87x5fv\xbcpd\
+I\xe6;\xcc\xb6ik\xe2\xd9\xc9\xdf\x8d\x95\xc6tN\
+\xd0f\xe7\x83\xfcGkR\x1d\x04g\xef\xdc\xe0\xe3#\
+\x7f\xb4\xb8\xa2F\x1bhB\x9c@H\x89z} \x1a\
+\x7f\xeaY\xdfe\x0bh*\x93\xc1\xf5\xc8(\xba\xb0\x10\
+L\xc0\x04'V\xe7BJ\xb2\x81\x86\x81\xb6fv\xde\
+{\xce\xa3_l\xdf\xddjf\x8f\x15\x0f\xb9+\xf9\xf9\
+\xbaG\xbf\xda\xf9\x8d1\xeb\xc4\x8c=\xfd\xcd\x9e\xbb\xee\
+\xeb\xfb\xe9\x945>eMjy!\xe2Y'4\xb9\
+\x0c\x15\x1d\x10\xd1\xec\x8d\x89\x88\x92Hu$z:\x13\
+\xdd\xd7v|}mj\x83\xfb\xa4=\xd1\xd9\x99\xecJ\
+ \x01\xc2\xe6\x96\xfe\xa4a\xf6\xa7\xfb\x9b(s\x04n\
+\xee\xc8~\xee\x85\xed\x0f=p\xde\x9d\x11\xf9\xd3\xb0\x0a\
+\x0d\x14L\x0eD\x04&8$\xa4\x10\xb8\xb5\xe7\xfbU\
+7\xcc\x04&\x10\x13?}\xea\xf1\xdf\x9f~\xf2\xb5\xdc\
+\xabU\x86Q\xdbH\xae\xff%/VP\x8bHml\
+Y\x9b1R\xb5;\x09av%\xdb\xdb\xccL\xbd\x19\
+\xf41\x16j~ \xae\x0b\xe0\xa2\xcc/\xc9\xfc\x96\xf4\
+\x05\x97\xb5}a\x7f\xfe=\x97)\x103\x88\xeeX\xf3\
+\x9d\xad\x99\x81\xa4H\xe7\xec\x99\x1f\xf6\xdd{\xca\x9ax\
+\xf0\xd3\x07\xba\x12\xab\x1f\xdb\xf2\x08H\xfe\xea\xd3GN\
+\x14G~\xd1\xff\xa3\xad\xab\xfa\x9f\x9fz\xe9\x9f\xb9\xff\
+\xdc\xbd\xfe\x96\xeb\xbb\xaeL\xc0\x90Ty;\xf7\xef\xa7\
+\xc7_\xbe\xb8\xed\xfc\x07\xfa\xefb\x92\xdb\xb3\xe7\xbd~\
+\xe9#{\x8e>sxa$R\xdf\x0211k\x0a\
+<\xc4\x04v`\xbft\xe6\x19\x82ss\xf7\x1d-F\
+\x06$\x89\xa4+\x8c\x840\xd3\x22e@|\xbct\x98\
+\xe0ln\xd9\xd4iv\xeeh\xdd\x96\x12\x89\xb4\x91\xb8\
+8{a\x0a\xc9\x0bZ\xb7$\x85\xb1\x7f\xfe\xc3;\xd7\
+\xed\xfeJ\xf7U\x0bN\xfe\x1f\xb9\xbd3\xf6\xcc\xf5\xdd\
+\x97\xdf\xb3\xf1kg\xad\xd9C\x8b\xc7\x18N\xce\x9e\x7f\
+'wp\xbe\xb2\x18\x16\xe9W\xa7*\xc2\x02\xd0\xc6j\
+\x13\xc1!8\xc3KC\x83K\xef\xb7\x99\xed7v\xdf\
+\xea\x92P,\xcb\x9b]\xfaY\x91\x95\xc1\xc5\x83\x00_\
+\xd0:\xb0#{!\x93]\x96\x85\x8b\xda\x06\xb6\xb6\xf6\
+'\x04\x0e-~\xbc`/]\xd7u\x05\xc1y\xf0\x7f\
+O\xfev\xf4\x85\x9f\x1c\xfd\x8d\x0d\xeb\x9a\xae\x9d\xa7\xcb\
+3\x7f\xfe\xec_\x0cg\xb4t\xea\xb1\x93\x7f\x1a/\x9d\
+\xd5\xe6\x88\xbc\x99\xb9\xd8\x09Y&\xc1\xae0^9\xf3\
+\xbc\xc5\x85]\xed\xd7\xb5\x1aY\x22\xb9\x1c*\xbbT\x82\
+\x98\x88\xf7\xe5\xf7\x119\xdbV\x0dlk\xdd:\x5c\x18\
+\xfe\xef\xc2\xe0\x96\xcc\xc6\xcb\xdb\xb7\x81\x9c\xf7f\x0f\x98\
+\xc2H\x19&\x933U:\xc3D9+_\x94E!\
+d\xd6l\xa9\xb1\x8c\xf8\xe0,<\x996uD\xb9\xdc\
+\xc0e@`\x22\x9a\xad\xcc\xfc-\xf7\x8a\x10H\x1a\x09\
+\x82\x030\x08\x04\x09\x92n\xafC\x0b\x87\xca\xb2xE\
+\xc7\xa5\x19#u \x7fp\x7f~\xd0\x04_\xd3\xf5\xf9\
+\x0a\x17\xf7\xcd\x1d\xb2d\xe5di\x8c o?\xf7\xcb\
+\xdd\xc9\xf6[\xfav\xad2\x93g+\xb3\xd3\xd6\x9c\xab\
+\xb0\x1d\x89Umf&)\xcc8\xd9'\xe1K~j\
+\x80\x8b\x975\x04\xcb\xd4\xf7\xad\xdc_?\xb3\xc6]\xca\
+\xe9>u\x83/W \x16[C\x8bCI!@\xce\
+\x81\xf9\xa1\xc1\xfc'\x16\x95\x12\x02\x07\xf2\x1f\x15e\x99\
+\x88\x9e\x19{\xb9(\x8b7\xf5^\xf5\xdc\x8e=\xdfZ\
+\x7f\x9d\xcd\xd6S#\xaf1\xf3D\xe9\x8c\xc3\xf6\xa6\xcc\
+\x9a\x17/\xbd\xff\x9cTg\x9c\xec\x93a\x04CJ\xb5\
+\xa4D\xd1Y<Q\xf8\xe4d\xf1(\x13K\x92#\xa5\
+\x93yg\xeexqx\xb8pd\xd1Y2\x80\x89\xd2\
+\xc4\x91\xc2p\xce\x9e%\xa2\x99Jn\xde\x9e\xff ?\
+4\xb4x\xc4f'o/\x8c\x16&\xdf\xce\xed\xcfU\
+\xf2Dt\xd6\x9a\xdb;;T\x96\xe5Y;\x7fp\xfe\
+\xd8S#\xaf}\xbc0JDKN\xe9\x93\x85\x11\x87\
+\x9d\xc3\x0b\x9f\xee\x9f;jI;\x1a\x1a\xd5G\x0db\
+UX\x9a\xa4\x121\xb8\xf1\x0a.\x01\x82\xd2W\x80t\
+\x19\x83\xba\xa3\x8fL?+\x16\x8f\xb8D\x01Q9\xef\
+Z<\xc0\xacI\xeek8\x01\x87;\xf8\xc8\xdc(\xc7\
+\xbb\x1f\xdd\x8c\x89\xe0f%\x14\xc1\x82\xf7\xfcB\x83\xde\
+\xd4\x9e\xb3\xabA\xc1\xa3'\x1c;u^{\x0b<\xc1\
+T\x9d\xec\xaan\xfa\x06aV\x85\x94\xbe\xf3\x0b\x1a\x9a\
+\x04B\x03`\x07\x13\x0a\xac)\xbay\xcfJ4(\x90\
+*\x1bU\x9b\x1c\xa0b\xda\x08$w\x95\x9a\x01%M\
+g\xb5uF\xaa\x822\x8fK\xa1\x07(XS\x08\xac\
+W\xea\xa1\xc9\xc9@\x9b\xb1\xe3\xc8*bT\xae=\x0e\
+\x8b!\x1d\x5c4\x9c\x95\xe0`\x11\x9b\x15\xc0\xd9\xd8\x06\
+\x14\x9a\xf3\xd0m|C\xe5\x8f\x15\xd1\xae\xbf\xea\xa8\xaa\
+\x17j\xeb\xc4\xc1\xc3 \xf1\x0e,4Q\xad\xa0\xe0\xa1\
+\x95Hi\xeaQ\x0f\xbe\xf3B1\xca\x95\xdaf\x1cc\
+\x19\x08\x0b\x9b\xa2\x0b>\xaa\xee&\x85\xf38]\xd1;\
+\xa4R\x8fx\x0b\x0b&\x10\x82\x88\x1c\x0c\xe7\xe1\x9d\x80\
+\xbb\x00\xd6\x15\xf4\x10!\xc6\xa6\x98\x84\xda\xd5\xb16+\
+\xe8\xcf\x9e\xd5\x97\xdbX\xad\x84\x09(\xa7\x81X\x5c(\
+\x92\xb8\x87\x1f\xb2d\xa8\xdf\xce\xca\xaa5\x02\xce\x10\xd5\
+\x22\x1f\xc77\xbb\xea^\xb8a>\x07\xb2~\xe1~ \
+\xe0m8\x98\x15\xd7\xe1DuU>\xea/\x22\x0a\x9a\
+a\xf6\x0d\xb5\x15\xc6\xact7u\xcaH?\xa0\xa9:\
+G\x13\xb5\x06\x04}\x81\xbe\xd8\x88\xa8\xf9AO@T\
+w|F,x\xc5\xab\x8fD~\xac\x88\xfa\xa3\x098\
+\xf0\xa8\x10\xa2(\xaf\x12\x1c\x22y3k\xcfP\xc6\xe2\
+\xdc\xaaCnh\xf4\xcd&\x94.\x18!\xa9]x2\
+o\x1cK+\xf4\x1b\xac\x18\x02a\xaa\xe8OM\xbb\x12\
+P\x01\x19\xeb7\x88y\xe5F\x17v\xd84\x82\xaa\xa8\
+\xab\x13\xc12\xab\x97\xa5p\xa8mE\xc2?\xeb\xf3\xd2\
+!\xd8\x1f\xa2\xc3\xaaA\xfe\x0f'\x9e\x1c\x0b\x8c\x0e\xec\
+,\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03\xb3\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x02\x00\x00\x00\xfc\x18\xed\xa3\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x03eIDATH\xc7\xa5\
+V\xcdk\x14I\x14\x7f\xaf\xba\xec\xa9ig&&1\
+#=qt\x12u\x8d\xf1#\x10\x141+\xec%\x87\
+\x95\x15\xf1\x03\x96\x05\x05/\xca.x\xd8\x93\x8b\xb0\x17\
+AO\x8ax\xd0\x83AP\x14\x11\xfc\x1f\xfc@\x5cP\
+\xa2\xeb\xc7\x8a\xab\x98D\x8cQC\x081\x99I\xd2=\
+\xe9\xaf\xe7\xc1\x9d\x9d\x99\xee\xea\x9e\x19-\x9a\x99\xaaz\
+_\xf5\xde\xab\xfa\xbd\x871\xd1\x0a\xf5\x0f\x02\xc0\xc6H\
+\xfc?Zp`@\xde7\xa9\xe4\xa4j\x12\x96\x99y\
+yM2\xbd>{\x14b\x1eCH\x08,\xf4\x5c\xd2\
+ \xd4\xdcA\xff&\xabW\xb2N\xdb\xe4_\xb2*\xbf\
+0R\x0b\xd62\x83\x92\x09\x93K\xe2\x97\x1f\x94k\xc1\
+(\x8d>!\x16\xb4_r\x06%\x91\xc2\x86\xfdc\xc1\
+8\x96\xc2H\xdf\x94\x86\xaaw\x10<\x02\x01`\x993\
+\xce\xb4\x5cl\x95\x82\x0c\x81\x10\x88\x01\x02\xd0\xa8\xf5n\
+\xda\xc9\xd7\xb4\xcbk\xde\x99\xf4\xa2\xcc\x9f\xedg\x15\xe6\
+\xa4\xb8P\x11T$\x05\xdc7\xe6\xebu\xa2\xf3\x8f\xb1\
+\x13\xff\x18\xaf\xa4\x97\xe7\xff\xa1p\xae\x953\x83\x15_\
+i\xef\xc7\xe6\x9fu\xa1_\x99<gPa\xb5\xd6\x01\
+\xe8<\x9d\x7f<\xeb\xe5\x0b\xde\xccw\xf1\xdc\x9d\xc2\x83\
+\xaaK\x18\xd0\xc3#\xb3\x84\x00\xd4.VX`ZT\
+4\xbc9@\xd7\x03\xdbA\x0b\x90lf\xe5\x84^3\
+\xdb\xdc\x0f\x00\x15\x80\xf1%\xcf\x19\xd1\xde\xa2.9\xa8\
+\x1fZ\xaa\xa6\x08\x1d\x05\xbd\xde\xd4\x86!s\xa8'\xb1\
+F\x01O0\xb5\xe8Y\xfe\x10Uh\xe3A\xf4\xf0\xfd\
+\xa7x\x13\xa0\x93\xe0\xda\x99\xd1S\x86k \x90\xca\xf8\
+\xd1\xdc!B\x1b\x99\x97\xe2\x8b\x8b\x96\x15\x81`\x0a\xe7\
+Z\x8d\xeb\x87\xae\x1eK_\x1f\xbf\xfct\xee\xd9\x8c\x9d\
+\x9fq\xf3S\xf6\xf4[\xf3\xfd\xa6d\xe7_\xf9\xbfo\
+}z\x14\x0d\xd7X\xae\x07%\x0e\x8d%\xb7&\xfa\x9f\
+\x9b\xf7\xa7\xec\x89\x1fR;\x06\xe7\xeenNl}2\
+\xffh\xd6-\xd4\xae\x0a>*\xc9^r\x927\xedi\
+;\xfcK\xdb\x11\x00\xd8\xb3t\x7fBIeEVc\
+ZP\x9e\x01\xd3\x14\x01\x00z\xacu`\xfd\xb1H\xb8\
+\xaeN\x91\x0dF\x5c\x89\xf5&\xfb\x10=\x04\xda\x98\xe8\
+\xd1c\xfa\x85\xb5\x03\x19U\xbf\xb6\xe1bNd/\xad\
+?\xdd\x93\xec\x1a\xe8>~\xbe\xeb\xd8o\xd9\xbd?\xa5\
+\xb7gD\xeb\x81\xf6\xfeH\xa8([&b\xf6\x8d\xc9\
+\x81\xbdm\x07\x14\x06\x80\xc0\x11g\xdd\xc2\xbb\x85\xb7\xfb\
+\x96\xed\x9a\xb0?\xeeN\xf7OX\xe3\xdd\x89\xce\xfb\x85\
+\xc7\xbf\xbe<\xb9s\xd9\x96\xdbS\x83\x93\xce\xd4\xb5\x0f\
+7%\x06\xe4\xc1d\xeeX\xf1\xcd\x0b\xe3aLQ\x00\
+\x08\xd1A\xa0\x87\x85\x07}M\xbd\x17?\x5c\xfd\xbey\
+\xe3\xbd\xe9\xc1\x17sC\xdb\x9a\xbb\x7f\xef\xd87b\x8e\
+\xe5\x9d\xf9\x94\x1a\xefk\xe9\x8eLri\xa8,\xb6B\
+\xac\x1a6\xfe\x8d\xb3xNt\x8c\x98\xc3+E\xf6\xfd\
+\xc2G\x00\xca\x89\xe5/\x8d\xe1.-7Z\x1c7\xbd\
+\x85\xacHgD\xcb\xb3\xc2H\xd1\xb3\xd7&\xb2\x86[\
+\x1c3'\xfd\x06\x84h\x0d\xab}\x00\xd80\xa6\x06c\
+A\x00${\x87$El\xaa\xf8|\x22T\xc1\x00\xc1\
+k\x1aVT\xc3\x0a\xb5\xb4\xa9\xa10\xb8\x86\x06\xb5\xfb\
+\x0e\x84Q\xcc\xd5}Q\xcd\x8aH\x81\x0e\x05\xab\xe7\x81\
+\xe6\x8a\xf9\x03W\xbf\x13\x11\xae\x93\x14*\xbe\xa2\x1d\xaa\
+\xa3\xed\xe4\x11m\x8b\xbckC\x19g%\x89\xc2\xb0\xa8\
+\x1e+\x18\xbeD9\x0fk\xd4\xfbF\xdb\x96\xcf\x1f\x10\
+L\x88\x89tm{\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x9c\xd6\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x02\x00\x00\x00\xd3\x10?1\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00 \x00IDATx\xda\x94\
+\xbdy\xf4f\xd7U%v\xf6\xfb\xbe_\xd5\xaf\xe6I\
+U\x9aJ\xb3\xac\xc9\xb2%\xcf\x06B\x18\x8cq\xb7I\
+\x13\xe3f0\xa6\x03M\x18l\xc8\xa2I\x13z\x01\xe9\
+\x84@Hhz\x91N\x82W/\x03\x0dfj\x9bv\
+w\x9a6\x040\xcd\xe0\x01\x0c\x96\xe4\x11\xf0,d\xb9\
+dY\xd6,U\x95T\xf3\xef\xbb;\x7f\xbcw\xef=\
+\xd3\xfb\xca\xd1\x82r\xd5ox\xdf{\xf7\xdd\xe1\x9c}\
+\xf6\xd9\x1b\x9b\x9b\x87D\x84\x92\xfc\x07\xf5uP8\xfe\
+\x1b\xe1\xe7\xa6/B\x84\xd3\xdf\xc9\xe9\x02\x98~\x9c\xfa\
+')\x80\xfdD\xf3\x15\x88\xd0\xfc\x96\xe4\x9f\x08s_\
+\xe6\x92\xe3\xf79\xde\x8f\x08\xd0\xaf\xc7\xec\x01\xd3\x8fK\
+\xbeX?\x97n|\xf4\xd7\xd3!\x1ao\xb4]T\x0f\
+\xedx\xeb\xf6\xb7\x90>\xfb\xf4,\xed\x97\xa4=\xa0\xbe\
+\xabu\x17Q\x9f\xe2\xbe;\x8d\xa3\xbb\xff\xfa\xf7\xf1\xbb\
+\xd3\x8b\xed\xff\xa8\x17\x81\xfai\xda\xe1\xab_wce\
+\xae\xdf\x1e\x1e\xf6;\xed\x96$\x8c8\xcc\xcc\x11\x91z\
+O\xc9x\xaf\x19\x16\x88\x0c\xf6\x82t\x7f\xef\x0f\x816\
+\xd0\xf4\xb3d\xbay\x9a'\x10\x08\xa6%\xc3\xfe\xf6\xa6\
+WH\xfbV\x81>\x06\xb0/\x02\xe1v0>\xddt\
+e\xfa\xe53\xdd\x11D\x08`\xbc\x84\xfae\xc0\x8c\x91\
+{\x17\xfd\x85\xd6{\x80}R\xd6U\x0d\xa8;\x84Z\
+\xfb\x82\xfe&\xd0g,\x083'\xa0\xd6\x02\xfb\x18\xb6\
+7\x84\xb0\x12\x05\xe8\x13\x0cu\x8fi\xf7j\x9e\x9f\xf9\
+\x12\x02\xd8.\xdd\xde\x16\xf4\xfbUo\x13\x02\x80\xea\xb3\
+\xfb\x98M\xff\x02\x89i\xa6M\xe30\xdd$\xf52k\
+\xbf\x0c\xbf0\xd4\x03\xd7\xebP\xcfp\xf4\xef\x8f\xd7\x84\
+\x08\xa0\xde\xeax\x0ff\xa5N\xbfN!\x00\xccnG\
+m\x9cd\xb1\xb1\xdcY\x97f\x9dH\xa8\x8b\xb6\xff]\
+\xcc\xd7\xf5\xe45\xdf\xd5\x93t\xdc\x99\xa1\xaf\xd66\xe4\
+\xf6[\x04\xa6iH\x10\xe3\xc4\xf6K<\xdc\x03\xd7\xde\
+\xa1{\x0a!\xd9\xee\x19u\xc7\x14\xa4[\x1d\xdbBN\
+6N\xf6\xb5\xab\x0f\xb9\xfe\xf3\xee\x1e\xec\xce\xdd&~\
+=\xb3h\xc7\xa1.G\xff'\xfbQ\xd1~\xa6\xdf'\
+\x85m\xfc\xfa\x15\x18\x9f\xae\xbe`\x19G\xba-R\xf6\
+\xcf\xe8\x9bC}\xcb\x1c\x17\x1a\xf4\x86\xdcob\xfc\xa5\
+\xba\xec\xdb\xb3P=\x01\xea\xfd\xb4{\x1aw;b\x9c\
+\x0f\xd31\xed~\xbe\x8d\x0c\x93\xf7\xab\x87unf\xce\
+\x8c\xe4\xf8\xb1zZ\x88p:\x01H\xb3|\xda\x1b%\
+\xd5\x08\xba1\xe54_\xd9gm]\xcb\xd3\xb6\x0es\
+\x07vjS\xbf'\xb6m]\x1d\x94\xf5M\xb0}\xca\
+t?\xd3\xce\xd3\xbf\x1bw\x18\xf4\xdf\xed\xfb\x08\x85\x00\
+U D\xda\xf1\x12\xb0N\x92~r\xd5\xcfe\xdd\xe6\
+ezt\x15\x01\xa8Q\x221~.\xcd\xd97]o\
+|F\xa8\xd5K5>\x1c?V\x8f*\xfb\x99\xdbW\
+\x88\x0c\xf5w\xe1b\x98\xf1\xae\xa6\xbf\xdb\x97Wow\
+Z3\xf5\x97\xda\xdc\x01\xdd\x0f\xb6)NL\xcf%\xed\
+\xf6\xdc\xc3\xa9\xb7\xd07}\xd0>E\x9f\x1bm\x1f\xe9\
+K\xa9]\x5c\xef\x0b\xa8\x01\x01H\xb0\xde\xc94\x94m\
+\x0e\xb4\xe3\xa7\x1f\x1f0G\xebt\xc7-hD\xdd\xa1\
+(\x00Z\x0e\x80,\xd0b\x88\x99\xf4\x1e\xc1b\x96\xa6\
+\xda\x01\xa7\x0f\xe8{\xba\x8e\xf6\x90\xad\xcf\x10OK\xd8\
+\xd3\xfbym?\xb1\xc5<6\xbe\xaf\x9b\xe7\xb4\x1dC\
+\xed8f+\xa1\x0d\xf7\xed\xfd\xe4\xd1\xb8\xfa\xb8\x1e5\
+M\x89\x07\x09\x98{\xf6\x83\xbb6LG[\x84\xf3\x87\
+\xb7\xff\xbdz\xe0$\xbb\x8d\xe4\x07\xa9>#%\xe4-\
+p\x87\x9c:\x17M\xa8Z\xea3\xda\xd4hf\xc3V\
+\x17E\x0fA\xda\xc1`b\x0b&\xa7\xbb\x0d\xb1!\x9c\
+\x96\xc3\xba\xb9\x94\xccIskl9\x80>\xa8\xdd_\
+h\x02\xf8$\xa3\xf5'R\xdf\x14a\xb2N\xb5KP\
+\xfan*b\x8f\x91\xbe\xc5\xb6S\xa1\xdf\x03iR]\
+\xba\x14\x915\x9el\xe9\x81}\x0d=u`\xfb\x08\xff\
+P4\x83\x90OC\xb6\xed\xd5\xcf\xcap\xbcd\xd3U\
+_]mi\xf5\xca\xee\xb7(\xf6\x9e\xea\xcaj\xd1n\
+\x0d\x92)\xe1\x085y\x07]\xa6J}q\x0b!\xf4\
+\xdb\x98\x0e\x96\xfal\xea\xb0\x9a\xde\x86\xfa\x5c\xb2\xc7Y\
+I\x04H\x9fb\xba\xc4\x83*\x84N\x228;\x18\xfd\
+\xc8\x0ds\xd5\xef\xd7t\xf3\x17\xfa:\x03l\x0e\x0c\xb7\
+\xcf\xa9O\xb3\x11\xbeE<Z2Nu}*\x18\x08\
+\xfd`r\x9f\xa2A\x0d\x95\xd7\x8dg?\xc7\xdfk\x7f\
+\x9a\x8d\x0a.\xe9N@\x08\x88\xbbl}0\x8c\x1f\x11\
+\x82;\xd8\xd7\xc7\x99w\xd9\x7f\x92n\xf9\x99\xfb\xcbp\
+\x0f\xa4{s\x8b\xaeu\xf6\x90\xa2In\x85\xc0o\xa5\
+\xfau@Ox\x188\x01\xed,Vaq\xf8(\xf5\
+\xbe\x10w\xbd\xe9\x97\xdb\x1c\xea\xc9\x00\xd1G\xd2\xbdq\
+\xfa\xd9\xd9\x16\xb1CXX\x13\x14\x97=\xa7\xe3\x03\x0b\
+\xc9X\x8cE\xecNk\xf0\x88!\xde\x94\xc2@\x5c\xfa\
+\xa6\xb7*{\xc08l\xa8?\x0e!Ix\xc1\x802\
+R=D\xdb\x0d\x01I6T\xd1\xb8G;\xa5I=\
+\xa4:`\x86?\xbd \xfeA\xe0N\x00\xd0\xe3\xa3\xd4\
+\xe3\x03\xf5~\x0cvk\x86\xdbm\x18\xf1O\xfa\xf0\x8b\
+P\x8fE\xf1\x0bWcMi*\x0f\x7f\xb6P/:\
+\xc6S\x87.\x05\xd23\x154o\xc4l\x840)\x00\
+i\xcf\x07}\x04\xc3\xa3\xa3\xf6\x0c\x11\xb5\xb7\xb9\x13\xbd\
+\xa5mID\xc71\xd5\xb2{\xca<F\xeaSD}\
+\xc1\x81\xf6haK\xff(\x0ai\xa6\x8f\xb1m\xfaH\
+\xba\x93Z\x0d\xaf\x1ew\x8e\x87&\xfd\xd4\xd7a\x80\xfa\
+>\xeb\x87\x8f\xa7O?\xb2I\x1bN\xd0\x85/\xedh\
+F=\xa7\xa9\xee\x9ea\x83\xa7^J~\xcf\xa6;\x80\
+\xfd\x89\xda\x16\xc3\x14\x160\xbe\x07\x93p\x8fO\xa3\xe1\
+L\x9a\xb4\xbb\xbf\xd2\xf62\xecz\xf5aV\x1f\x9d\xa4\
+n\xa0 \x0b\xb5\xdf\xb6\x87\x22\xd5\xefs\xca\x84\xa7\xd5\
+\xc8>\xda\xed\xe9\xfa>m7v\xb0\xadN\x92$\xcd\
+\x06\x17cM\xf3nX\x93S\x8d\x06\xb4\xb7\xd8\xee\xd7\
+\xaf\xe0\x16qQ\x8d\xa8Z\xd6\x22,\xf6\x1bl\x8fS\
+\xe3c\x19DC\xdf!bV\xf7d6g5O9\
+w*y\xf0g\xca\xff+\x86\x8e9pV\xe0v\xa6\
+\xb6Ih\xb8\x89j\xb3\x09#\x0buJ \x99\x12\xf6\
+d\xebG<\x15\x8c\x90\xa5f\xe9\xf42\xcf8\x052\
+\x0c{\x04\x5c)\xcbMu\x13#@\x0fy\x82?\xf4\
+T\xc3nKz\x1fh0\x22\x1b\x9cBs02\x06\
+wp\x88\x96\x07v&X\xb4\xe7z}\xe2\xb1\xd6o\
+(\x13R\xafw9\xd8`\x12\x1d\x04\xd7\xc79\xc3c\
+\xc3\x94SU\xb5\xa7\xbfz\xf8!5\xe9\x85\x82S\xa8\
+\xc2\x1bud\x0c\xfeT`\xdcK\xd4G\xa9PUl\
+\x9d\x01I\x8a\xe7R\x0a\x15\x92\x10>\xb7s\xf3/\x81\
+3(\xb1.\xe8\xb2\x08\x98\x98\x04\xf4\xf3\x076\x8d\x14\
+;\xfc\x0a\x1f\x94\x09,3\x09x\xbf>\xb2\xdajR\
+\xe4b\x9e'\xc7\xfdB\xbfZ\x83\xac0\xe4\xfb\xa1:\
+\x88p\xd0C\xed>\x13\xf2\xdd\xf1H5/\xd4X\x0d\
+\xadl\x09\x13\x04\xc7\xediP\x95Q\xb8\x11\xd7`\x88\
+\xa8\xe4A\xc5E:\xf6\x03\xb3\x82\xea\x94\x10\xc0\x1e\xc2\
+\x94~\xac\xe8oN\x07\x01$\x0b\x1a%\x01\x19\xea>\
+>\x0d\xf0 \xf9l\xd7%\x18\xba\xea\x99)c\xea9\
+\x84V\x0a\x08eW\xf4\x90\xcc\x8f*\xd4\x0bA\x92]\
+\xd4\x9bG\xdc@]\xc2f*\xe1=\xf4$\x22\xc3!\
+\xcd\xab\xf4\xe7\xf7\xec\xbb\xbdh\xc8\xdcu\xdcF\x015\
+a\xfd2F\xfe\x8b.\xfd\x1a7G\xd0\xecs!\x98\
+\xa0\x1d\xa0\x90\x12\xa0U\xda\xd5\xcd\xc3\xdeH-\xdd \
+\x14\xc6\xdd\x9e\xdd\xcaXu\x8e\xfa\x9c\x9a!\x09E\x98\
+>0\xa7\x9e\x0b\x04\xe8\xe2\xc5\x1eh\xc1n\xf8j\x97\
+n\xe5\x05\xf1\x15\xf1\xec\x1d\xa9zv\x1d\x90!Y\xbe\
+\xa6xa\xa6\xdc\x88\xa5b\x8e\xa6\xd3\xa3s\xc0\x86\xbd\
+u\x06\xfb\xad\xb4\x05\xc1q\xaf\x9f\x02%\xfa\x19\xa6#\
+x\x04H\x01\xd2\xbfXw\x0c\x98\xa7\xa0\x7f\xd3\xd0\xbb\
+\x22\xc2\xde\xad\xc3Y\x86\x9dVGs*\x9a\xb7\xf5\xfa\
+<\x0eKBd\xaa=\x9d)\x02[+L0\xfc\x04\
+\x8f\x88\xb9s\x99\xe1\xa4Rs\x050\xf5f\xc4e\xa9\
+b\xc5z\xc2\x9b!\x9b\xc1\x92CNK{\xfcV\xd8\
+\x8e\xe6\x19\xd0#1w\x02\xc0\xac\x11\xf4\xb1\xea\xf1\x16\
+B\xc4\x0a\x9f\x15\xab\x83\x90\x82\x11\xc2\xa2\x03b\xf4s\
+\xc1\xa2^\xea\x1d\xd9\x5c\x81v\x9a\x8d\x15X\xa8\xc8\x87\
+\x06\x80a`\x8a\xcc-\xa5|\xae\xb0a\xa5q)R\
+1L(\xf4\xe1\x88\xa9\xa9\xd1\xf3\xac2\x02M\xff\x09\
+d\x15\x08\x98\xf1I\xb8TYr\xe5\xe1\x9d\x08\x10\xe9\
+\xd2\xa6\x1b\x7f\xe4@\xaf\xae<\xd0\xc5\x8a\xba^\x07\x13\
+h\x93\xb5B\x18Nu\x171O\x11;F\xfaJR\
+J\xb0\x1b9\x5c\xc4\x9f\x8f\x09:\x9b\xcdd\xe7\xd0)\
+S;\xc1j\xf4\xddBI\xaa\xa0\x12Y\xb5\xb2\xd5\xbb\
+{\xd0\xae^\x11\xdb\x09\xc0\x90\xbb\xd2\xccU\xe9QS\
+\xd8c\x1a\x04\x08I\xcaT\xec\xcb;\x09\xd0ba\xd6\
+F\x1c\xe6e'x\xa6\x09\x80\xd5\xf9\xc0z\xd8\xc2\xf1\
+\x15m\x1e\x156N\xccc)\x94Y\x8a*\xcc\xb3\xb7\
+*{\x825\x99]b\xe6\x1cH^\x86KT\xd5\xa6\
+N\x1f\xc9a\x8e?k2IWw\xd1x5\x93l\
+\xd0r^:\x05\x03\xea\x85\x82y4\xe9\xe0\x8a\x80\x02\
+\xd5\xe7\x1a\x93\xe7\x8c\x96\x09_= UY)+[\
+\xc2\x1fH=su\xa1\xdd@\xb1\xc9\x8cM\xc7T<\
+\xefc,\xae\x0b\xac\x91|+\xcdQL\xa9\xcc\xa7-\
+\xed`\x87\xaf\xb8A\xa7\xd2!\x9b\xea[\x05\xfb^\x02\
+\xfa0'\x14\x11gh\x0f\x86w\xc1\x94,kV7\
+M\x1a\xa0J4\xb0h[\x9e\xa1w\xc6\xb39T\xcd\
+\xdb\x81YrHr!\xcc%*\x9d\xe8\xa6S\xe1\x84\
+N\x8d5w\x18\xabx\x9a\x80\xa5\xb9.\x8a\x97\xd2\xb3\
+\x12\x1d/\xe8C\x95\xcc\xd8\xd4a\x97\xaa\x17\xd2eM\
+\x95\xb9\xf6\xa7l\xb59(.\x93y\xa1c\x08\xe4a\
+Gu\x04[4<\x09(\xc4\xefF\x06\x08\xa2\xa5\xcd\
+\x89\xbeGWa\xa6\xc9\xe4\xd06\x08W\x01\xe8\xfc<\
+\xb6\xa7\xeaPl\xdb\x83\xa8N\x8e\x92\xcfp\xb8\x03\xdb\
+BF\xd0\xf1iv\xaa\xe7\xe7\x04%\xe44\xd4a`\
+\xce\xb8p\x7fR\xc1\xea\xa1\xe2\x0f\x97\xaa\xb9\x9d7\x14\
+U\xf2;\x1d\xd9|\x9d\xf7F\xf7\xf6=T\xca\x9c\xcb\
+\x94\xa5F\xb6\x94\xa3)\x22m,\x98T\xa4\x0c\xe2i\
+\xd76\xed\xb1\x14#\x03U\x5c5\x89t\xcfYt\x15\
+\xc4\x0e\xf8\xd0\xd3}\xd0\x8f\x85\xd9A\xa5\xb2x\xe7#\
+\x84\x18\xe40\xc9\xcd]\xdc\xe81<\xc64?\x0b\xa6\
+\xd1k6tL,\xda\x88\xcc\xe1\xa3\xba\xa8\xe2\xeb\x01\
+v\xfe\x10\xbe\xc6H\x1a\xc8\xcb\x05\xe1\xc8\xb1\x0f\x09\xdd\
+?\xba*\xc0<QNj\xf1\x0a\xa6G\xac\xe4\xb9\x00\
+\x8d\x0e\x06\xee\xd5\x85Z<\x82\xf8\xf4\xce\x9e3z[\
+\x07t\x9fR\x88uu9\x8c&r`L\xf1;7\
+\xde\xcc\x8dVct\x9c\x8e\x801\xd8\x1a` :e\
+\xf1Hh\xb5R{\xf0 \x1a\xe4\xc7\x1cN\xd7\x08\xf5\
+p\x90\x22\x11\x8a\x0b\x96\xb7\x15c\x1e\x7f\xbc\xd2%=\
+\x02\x84\xfcp\xed\xe1\x0b\x97\xf7\xa8\xb0*F\x94p\x5c\
+Y\xccA\xa3)]\x07\x16\xab\x0c\xf4\x18X\xa6\x92\xeb\
+\x051\x14+\x8ae\xd7gq\x17|\xd1\x83.:\xed\
+x;\xec;4+\x8fTT)d\xf1\x11%\xa9S\
+\xd9\x05L\xb1\xb9o\x9a6\xf9\x93\xceO\x00$\x08\xa9\
+*(\xc0&\xdc\x9d\xe6\xdc\x10aH\xec\xc7\xab\xf0\xec\
+\xec\x7f\xb0i\x1f\xf5}\x0d\x9e\xa5\x84\xb0x\xa8\xab;\
+\x9c\xad\xaf{T\x17\xbeL\x04{\xb0T0\x8b\xf0\xf4\
+\xb2\x96\x1aA\x1fl\x08\x11T\xc4'Uc\x1cf\x80\
+\x18\xae;\xc1\xd3 )\x0d*`\xf6Z&y|=\
+\x81\x01\xb7?Q<}j.\xff@\xc6GJ\x03\x0f\
+j\x0c6D,p\xc7\x16\xd3\x22gX\x10p\xf7F\
+\xbb\x1d\x10>\x18kE\x87\xbc\xad\x10\xd9\xfd\xf7\x18\x03\
+\xfe\xf4g\x92JRg\xac\xe6@\xc2|\xf6o\xfb\xb4\
+\xda<\x86PdH\xb7A\xa4\x0d\xaa\x9c\x0agP)\
+\x9d\x83\x034_\x5cz\xffV/\xb0\xf7r0T\xb1\
+\xa1\xb6*M;\xb4\x02\xeb,\xe2\xa7\x8f\x06s\x17\xf5\
+\xff\xa47v$\x95-\xb6\x14\x15\xed$P,S\xfb\
+,*\x05j\x8d\x8fv\xde\x86\xd3\xd0\x952\xfa\x98\x00\
+a;\x0c\x98#`Y\x18\x92l\x99\xb5\x1f\xd0\xb2k\
+\xcd\x11\xad\x10\xbf\x14\x1e\x82\xb8>\xd6\x08~\xea\x8e\xc6\
+\x09\x9a\xd1\xbb\xaf\xae\x9fa\xf0\xf1{<\xb8\x0d'\x11\
+b\xcf\x04h\x94E\x86\x10c\xd8\x96\xac\x18xR\x5c\
+/\x9dz\xeb\xe8g6f*$\x22\x8b\xe5\xc6\xce\x18\
+\x88\xc2\xbc\x8f\x1e6\x88C\xde\xe8K\xa4p\xcd\x8aj\
+\x17O\x11q\xf44]\xa0\x8f13=1C\x19R\
+\x18\xef\x94\xf9\xd6V`\xc5\x08\x86X.u\xef\xa67\
+M\xc02_\x00p\xffR\x0b\xd4\x96\xb0\x81XP\xeb\
+\x1fb\xebm\x13?\xc7/q\xdf\xae\xa2C\xa8\x11\x95\
+\xa8\x7f\xd5\xcd\x1d\x90\xa9\xdb\x0fb;\xd4\xfdA\x0c\x9f\
+oB\x92\x8e\xe4P\xc4G\x05r\xec\x22\xa0\xc6<=\
+\xac\xda\x9f\xc8\xb4,\xda\x0e^\xb8\x0e\x01\x1a\xd2;\x10\
+\x83\xba\xf6{1yq=L>\xc1ANxX,\
+\x97;\xe60hw`\xc2\xa3\x9c\xbe\xac`7\xc3F\
+\x0eW\xa4'\xced\xb4\x22\x8e\xfd\x96\xe7\x14>\xec\xf3\
+[$\x5c\xfb\xd2\x1c\xba\xcfd8\xe2\xd1\x89\x99^#\
+8\xaa]\xc5\x10\x00u\xb8\xce\x13\x95/\xf2\x1ff\x84\
++\x92{E\x1c\x0d\x93\xb1\x90\x9e\x8d\xc2P$r\x8d\
+^\x17\xbd~]\xc9\xb0H.lo\xe7\x9a8\xdc\xdf\
+\x0cr\xc5\x02\xd0\xa3<\xd2\xdb\x18\xcd\xc2\xc6L\xd8H\
+\x99\xe9\xc7\xb0\xbf0\xd0\xd5x{\x7f\x7f\x98\xd4\x08\x81\
+\xa1\xa5\xa2\xd80\xcb\x0c6\xa3\x0a\x87\xfe+}\xacE\
+\x82\x19\xe9@\x9dP\x8a\x82\xad\x98)\xae\x22\xd7\xd3\xbf\
+\x04\xe0H0Y\x1f\xd1 d\xba\xe8<q\x07IS\
+\x15\xe7\xe7h\xa8\xb3!~\x9c\x16\xf3t4d\xf52\
+\xdf\xdf\xac\xf0\xfe\xa4\xd8\xcc\x98\xee1$\xbf\xbaFe\
+\xfb-\x18\x9a\xb9\xc4\xe8d\xe4\xb32\xf6\x97\xbb\x8a(\
+\x99V0\xdaII\xd7\xce\xa6\x1a$\x12\xa5\x15w\xb6\
+3c\x7f\xf5\x86\x18z\x18\x173}[\x8cy\x1b2\
+\xaaBS\x08\x08\xc9\xb3\x01\xd4:~\xa7i\xc9R\x05\
+9\xa0\xa9w&H&\xec\xf9N\x17/v\x18\x90Y\
+\x8akSX\xa6\xf9\xe8,\x17\x83~\x1a\xaa\x14\xc4q\
+\x14\xb0f\xb3g\xaaL\x04\xb3,\x1du\x8dYG]\
+zRi<\x06I\xb9\x86\xb1\x94\x97\xc0MP\x1b\x1c\
+#%D,\xf7\xb7\xe7\xc4\xcc\xa9h\xc8J\xb5\xb4Q\
+\x18]\x09D\xf7\x95\xa0\x09\x0b\xc0\xbfL&\x13\x1dY\
+\x83\xa8f9\x8c!\xd0\xce\xe4\xe0\x07fw \xb6N\
+\x1d\xac\x85\x9bl\x08\xe8CS\x9d\x5c\xda\xd4\x90~\xb7\
+\xf3jS\xed\xd3\x03\xb8\xe8\x02\xf6&\xb9\xe2J\xabV\
+\xaf\xa7\xdd\x83\x8d\xc02\x9e\xb3K\x15u\x90\x0d\xccW\
+\x91\x0d\x8f\x9b\x09\xf2\x992\x9a\xe6{\xe2\x9d\xde\xcdE\
+\xba\xe7\xedTCZ\xa4O\x11@\xbf>a\xae\xd0\x03\
+'\xdd\xea\x0dHBeX\x17\x14\xc1l\xf1\x98\x03s\
+B\xa5\x22\xe9\xe7\xc7|\x0a\xe7\xfb\xdc\xfa\x9fK\x98~\
+\x0dLrVkN\x0d\xf8r=\x82L\xc3\xa0w1\
+{\xd0C\xe7x\xf4\x10\xa7\xee60\xc7,Tjm\
+\xab\xd4\x84\xd1}h\xf1\x80a\xe2\x89\xa9@\x82\x91\xc1\
+\x16:r\x11\x09(p\x0d\x90\x96[\xa0\xben\xfa?\
+i1oh\xfeT/\xca\xc2\xb7G\x22\x0d\xd6\xa3\x22\
+\x9e\xc3Z2\xfd$\xf5\x84\xd0\x8c\x12\xea\x8c1\xb2\x98\
+}\x1a\xdf\xf3\xec\x1e3\xb5\x15\xde_\x8d\x98B\xafW\
+\xf5AV\xfe\xd5(\x97\x1aI&\x95:=\xcej\x07\
+S\x07*\xfc\xe4\xa5Y\xcc\x0a'\x19\xc9p\xec\x95\xf7\
+P\xda\xb3\xa5\x07S\x14\xd7\xad\xfez\xf6O\xd4\x04\xd0\
+\xd2\x13\xf2J\x1e2&K\xdf\xabb\xc9\x1cZwA\
+\x97[|\xbe\x0b\xf4fA\xf8U8\xd3f:\xd3N\
+\x9dVj]\x0f\xbdSPqL'&\xbc)=\xbd\
+8\x97\xe9j\xc2j\x0c\xfca\xe8\xbf!^CZ\xd3\
+\x98\x98\xc5P\xbbu\xe7\x97%\xeciUB\x00e\xa6\
+\x915\xf6\xd3\xa7i\xdbl2\xd4\xab\x0a&\xda\xaae\
+V #\x9a\xa9n%\xce\xa4Z>|\x80\xf8\x22\x16\
+d\x98\x8a\xa74P\x14UzJ\x858r\xae\xc7\x80\
+\xaep\xad\xf5\x9c\xa4\xb3mt\x95\x05\xa6\xa5ZG\xbd\
+\xa0\xccp@\x89\x80pW&\x0c]_agd\x06\
+\xe6C:\xa5\xf3yN\x0fT\xea\x09\xdc\xff\x02_\xa5\
+\x15\xcb\x82Iz\xf7\x98\xcc\x0a\xd8\x9a\x87H\xc2=D\
+,\x891}\x1cB\x11\xf0z\x5c\xae\xb8_fy(\
+\x98\x17\x81\xfc\x11\x91\x11[\x12\xb7\x88YL2\xa8H\
+\xfc9\x83\xaa/2\xdf\xffCSG\xa4\xe6>\xf9>\
+\x07B\xe9\xe2@\xc2\x01\x91\xbd\xe5z\x02\xd8\x9d\xde*\
+:\xf4\x00-\xd9\x03\xe9'\x05U4\xe2[\xde\xec\x01\
+\xa7i\x11\x86\x06\x8e8\xeb\xc4\xa6.\xaa\xa7|\xda9\
+\x5c\xd2\x0e\x8b\xefAf\x84\x8f\xfc\xdf\x99d)\xa1k\
+\x05\xeaf@G\xf8\x85a\xaf8U^\xd7\xa4\xe1\xca\
+\xca\x94@mi!)T\xa3\x92\xfe\x85p8\xd0V\
+\xf0%\xc8\x9dzN\x86\xbf\x0e5qS\x5c\xa71\x22\
+\x8ag9\xedIw\xdb\xba\x12\x90\xd4\x02\x10\x9a\xe0\x9c\
+\xd7A\xaa[\xb2\x8a2\x98\xd7\xb5\xd1\xba\x1d\xb3\xe8\xdf\
+\x03\x96S!lc\xb93\xaf4!\x90\x88\xa8\x0b\x5c\
+rQ\x80\x83=\xd6\x9a\xa5\xb8\x1b\xa2\xac\xde;\xeb\x81\
+\xbbF\xe0\xd4\x0d5|iF\x9f\xe3p\x11j\xc2x\
+J$>g\xf4\xa3\xe1\x81\xd1\xd9\x00\x86k\xc8L\xb3\
+\xe0\xfeE*\x143\xece1u1\x98S\xa9+|\
+\x9a6?O5P\xb2\x84\xa3|h~\x93\xd9\xf8\xe0\
+\xa2\x85\x0ex\xf0\xc0\xcd\x06\x1a\xd9\xdd\xac\x1e\x85\xecM\
+9 7\xfed\xc4\x97m\xb6>p\x0d\xfbE\x89j\
+\xb6P\xcfJ\xe8\xd0\xb6i\xe4P\xab\x04 ^o\xd4\
+\xd4\x95\x05\x87\x8e\x22C!\x99\xd0IX\xeb\x94\x16\x88\
+\x07=K\x0bf\xd3\xa2%Y\xac\x09S\x19\xe8w\x0e\
+Y\xc7L\xcf\x87)\xe8\xaf\x99\xd3v7\x95$\xfa\x17\
+M`\xe0\x9a\xa5\xa2Z\x99\x90\xe7\x1d\x82@\x0b\xa6U\
+]p\xf1n\xc8[\x5c\xa6I^L\x91j\x8e\xcbD\
+\xa7\x85\x95\xeb\xfb\xb8pt\xeeM\x116\xfb\x81\x13[\
+H\x90\xd3!U\xb5\x0a\xe5C\xa4a&TC[d\
+\x991\x06\x1c\xb6\x03T$\xed\x7fPi\x00}G\xf5\
+L\x1c\xaa\xda\x07\xa1\x00\x04\xfa\xc6m\x1dj\xe9\xb8\x97\
+\x92\xb7b\x98\xca\x0e\xd6\xd6\x07\xe6N\x80\xf5X`&\
+J\x0a\x0d?\xcc\xf4\x8bz\xb5\xd4\xa4\x1c\x19\xa8\xcb\xe8\
+je\x9e\xce\x89\x99\xb3\xee\xa2\x0ayqSG\xe4\xc5\
+\xe6\x1byc\xa9\x1b\x8eI\x04\xb3DE\xfdF\xad\x99\
+\xe9\xf6\x91\xb5\x845\xf5<\x8a\xa3\xd6P\x0bcIv\
+\xa0\xd3\x1e\x91\xeb\x1a\x02\xdc[G\x16\xffX\xa5J\xd7\
+\x1a\x8f\xb0A \x10\x22\x99\x86\xf1\xa4j6\xea\x15\x13\
+\xe4\xd8\x88\x88g1bn\x06\xc3\xf2@\xb3C\xccG\
+\xa2\xc8p%\x98\x8d\x81\x925\x04\x93i\x81)\xef\x1a\
+U\xad\xfa\x09\xd0\xa1O\xb7\xa4\x17\x01\xf1\x00M\xa2;\
+\xb7\xd7\xe8>\xce\x06\x081\xe83\x04\x8d\xca\xbc\x93\x06\
+1\x87\xaf\xb7\x07\xdb\x9a\x12\x0b\x14\xb1\x82a\xf6,\xda\
+F\xef>Cz\xe6\xac\x94\xff\x86\xc4\x9ac.\xaa\xcf\
+\xa7\x0b\xe6\xe6A\xaf\x03\xc3\xf0\x9f\x92k:\xb9\x98 \
+|\xa3U\xdb\xf4\xca\x80\xeb\xe0\x84\xeb\xd9\xe0|\xed%\
+\x8c\x22,\x8f@\xb2\x1e\xce\x8e\xa5\x84\xf6\x998w3\
+\x8b\x00\xbav\x02F\xf3\x01\xcc\x0f\xb1\x8a7\x11\x8ek\
+\x86\xde\x226\xb6b8\xdcsX'\x83Q=\x84\xd2\
+\x83!\x18\xa4\xdc\x1f\x12H\x8f\xd3\x08\xa4B\xb7\xa1\xd4\
+qe<\xfe\x0c\xaa\x02\x07\x94\x19\xd0\xd7I\xbb\xc1\x81\
+\x5c\xe3\xb0T\xb9$\xa5\x0d\x0a\xb1\xcbW\x13\x1dah\
+/9\x1b\x82N\xa7 <\x84\x92\xdb\xd7\xbf\xe5\xbbC\
+\xbbJ\x9e\x0d\x04\xa8\x9aol\xe9\x1a\x0a\xeckdI\
+\xdf\xf3\xaa\xfeI\xb5@\x90\xa6w2\x13]T\xa0\xa7\
+\xb6q\x0a\xc4J8\x89\x0d=\xc3\x8e\x82\xb8\xcb\xfa\xa4\
+\x8b\xb6\xaef:\xce\xdbt\x89:\xb6\xa6\xed\xa0\xb7\xfb\
+\x10\xb2\x86\xe5\x91\xf4\x95\xb7\x97A\x83\xd3$Mg9\
+K\x89y\xe2\x84\x8b\xeb\xaf)\xcdm\xdd\x86f\xb3\x90\
+\x00\xfc \x17\xd7\xc8\xa3\x12\xe9$\x99\xfa\xbbC\xf2\xba\
+\x8cp\x86\xe1\xaf\x9a\xb7\x80\x80\x17\x99\x8d\x10\xbe\x12\x01\
+{\x9c\xc2\xf0_\xa8(\x1e\xad\x92`\xe7\x0e\xe0\xe8W\
+\xa6]\x8e\xaa@L\xb1\x0c\xdc\xb0\xe9\xf8@\x9a\xa1\x17\
+@7\xb7\xfbp\xa86.\x08f\xbc\x88h\x19\xf0\xe2\
+d\xa9\x90\xb7\xddI\xa6\x03\x0c=\x9c*O\xf4\x16B\
+\xbak\x0d\xba\xd2\xc34\xae\xcbPls<\x10HY\
+B\x08[FV\xcb\xf0\x82\x96\xb4\x15\x13i\xc6R\xee\
+l\x1c4\x97\x9fTC\xe7X3\x1e\xd6HO\xf8\x19\
+\xbd\x5c\x13\xc3M\x5c &\xe8\x12l\xf9f\xa2I\x8c\
+\x90\x22g\x13XSa\x87\x84\x0a\xbf\xbf-\x04\xd1t\
+5s\x9d\xffE\xe3\xbe\x07\xb6B\xd3\x17\x06TIc\
+l\x8e\xa9\x1fb\x89`j\x96g\xca\x14\xf0\x92\xed\x12\
+zP$h\x9fD\xc4v\x9dK\x15\x0cj\x19\xbf\x9e\
+0Z\xda>`\x9f\x05Q\xa6\xca\xf4o\xf8|\x08\xa9\
+\xd0\x829\x07\xdds\x81\x19\x10\x9c\xe0\xa1k\xae\xe9\x16\
+\x0c`\x99\x9c\x9a-a\x5c\xa6\x1cx\xcd\x10\xcbqv\
+?\xc9d|\xfc_\x16\x8b\xc5\x0ed\xa7\x06\x5c{r\
+\xb3s\xfa\x92\x18NL\xd8\x1e\x16\x96K\xf4\xf8\xe1\x8e\
+\x98,\x95\x9cA\x91m\xc7\x8b\xcd\x19DL;\x02}\
+u\xdd\x9c4s\x15\x00dA\x0br\x12E\xa0\xd4|\
+\x89\xad\x00i\x18\xc6\xd8\xf9\xc7\x14\x0e\xe7\xfc\xa5\xb2q\
+s\x92\xae\x95\xf1\x0c\xd7\xf6\x95\xa0\xec\xb1\x9a\xb3\xbe\xb4\
+\x1ek@\x98\xd3T\x8d\x8c\x1fz\xdf\x18\x18\x85\xab\xe4\
+-p\x06^Kw\xe4\xf1\xd0\x99\x8d\xe5\xec\xb5z\x09\
+2\x95\xda\x83e*\xb9\xe6\xf6hT\x00_\x0du\x19\
+b\xec\xb2\xca\xb5\xb6'\xb4\x09\x96\x81\x06\xc7\x11J\xeb\
+\xd7\xbe\xfa\x90\xd7\xea\xec\xc2\xe0Z\x84\x00A\xba\xcb\x9b\
+^\xcc\xc0\xff\x98\x83\x1c\x9cu\xa8\xab\xfd\x87\x14Ef\
+tD\xe1\xeb\x11t\xe5\x00\xad\x17\x84$d4p\xc3\
+\xdc\xe33\xad#\xc1z\x93\x84[ER(O\x00]\
+XW\x08\xe4\xd5'_\xab\xd1\x8c\x88\xacp9@o\
+\x91F6\xd4B\xb6\xa2\x0c\x88\x90\xf4+\xcc\xb1\x0b0\
+\xb3I\x98\xda\x11\xda\xe7\x029\xf4\xcc8Q*g\x85\
+\xd4\x14\xcbJ\x0c\xed=\x923@h\x0f)b\x96\xc9\
+L\xea\x22f2\xe1I\xe01D\xc6:\x98G\x11$\
+S\x1dU\xaf#D\xb1\x88\x1a\xf6\x12\xe2 \xdf\xe9K\
+\xcd\x1c\x15\xdb\xd4\xc3\x09G`\x166\xc3\x0a.\x89\xf8\
+\x0a\x8e\x04`*D\x91\x8a\xe9\xc9\xd09\xad\x84\xa6\xdb\
+\xbbp\x0d\x8e\xba\xff\x0a*Y\xcc%\x05m\x1dJ\xb3\
+&B\xd7\xb0P\x16\x0b\xd3\x0f\x90%;\x11\x15\xfe\x12\
+\x14(\x9aP|\x12\xa1\xa5\xbd\xfe\xd6\x99\x0d0\x12\xc4\
+\x10\x08Sv\xa1~\x9e\xb6\x94\xea\x9f\xd09\x80O\xa0\
+-zc|\xf90\xd7\xcc\x85\xc4+\xdb\xc8\x9f\xcc\xc5\
+\xcak\x03\xe35\x84\x19s\x93zrs\x0d\xcb\x00>\
+\xb6\xa6G\xe4\x89\xacd\x8fP\xc4\xa3\x84\x08=\x954\
+\xe5\xd4Y\x05\xabo\xe7s81\xa2\xbeI}@\xc5\
+`1\xac\x80\xe5n\xcf\xf5`\xccV\xdcC\x08\x84Z\
+\x07@R\xc5\xe6\x8cp\xb1\xd3\x00\x0crj:>\xa5\
+E\xce\xf4\xc9\xda[\x1f=\xd5\x19PX\x07'='\
+:\x9c&\x1c\xcfMXU+\x87E\x121\xc5{\x1f\
+A\x12e)r\x16\xaa\xf3{wu1\xe9{Y\xcc\
+\xf59\x13\xed\xb8\xc0\x09.[\x8d\xda]3r\x94\xae\
+\x9e`K`ZvD\x9f\xb7\x89\x9b\x1a\xbb\xd9\x0f]\
+\x82\xe4\xb8\x9c\xdeLZ\xd9\xc6S\xb5p1Vd\xe8\
+\xc49\xadp*L\xa10\xe4\x18\xaa\x0b\xd6\xd1|)\
+\x17\xcb>b\x01\xb1)\xc3%\xae\x0d>\x95\x8dO\x12\
+\xb8\x05B\x9d'){t\xf1U\xdc$\xbe\xeb\xe6\x92\
+0^\x92\x0e\x8f\xa6\x0fcA+\x9f\xd0\xfd{\x13\x8f\
+0\xdf\x1el:\xb52\x81\x08dP}Z\xe0t\xd2\
+?\x0c\x14\x9a4\xdaqu\x06J^R\x8e\x9c\x1cq\
+\xee\x12IU\x14\xe2:\xc3\xe1\x9d>d>U@\xc6\
+e@V\x07 \xe7\x1a\xe1iC\xc7\xbc)@\x89K\
+\xc0\x08='\xa4\x0c\xd3&\xdfU!\x98be>N\
+N\xab\xa0U\x1b\x94\x12j\xd7\xba\xfe\x9a\xf4\xd9;\xbd\
+\xb5D\xf8\x9b\x9c=\x92\xa8Q&/\x5c\xa7\x80\xf5\xc8\
++SB\xd9J\x1e\x1d\xdd5\xbb\xce\xfc\xa6a\xcb \
+\x82\x0cE-\xd1\x984\x93\xc3=\xd6\xb6\x90pmL\
+\x9a\x14\xda\xdf\xc4\xba\xcdy\xe0\x1cY\xd8)\xb3\xd5S\
+\xd1\xfah\x0d\x1f\x18\x83\xe7^\x0e\x84\xe6\x10p\xe6\x08\
+\x03$0c\xe6U,\xb4\x18K\xba)\xc0WhM\
+:D+\xda%N\xc6\xc4\x84\x93\xcc)Rd\x9ac\
+d\x0a\xd2\x8c\x11M\xdb\xd1cS<\xb3\xe3\xb8W$\
+a\xe18d\xf0\xa6\xadSt\x87\xecD\x97P4\xca\
+\xe3P\xec\x06>7\x01B\x18Q\x1a\xb1-\xef~\xaf\
+\xb6\xa12\xfa9\xd0\xefM\xf7@\x99\x96\xcb8\xa5g\
+\x15\xc71\x0b]&\xb4\x1f\xcc\xf3L\x01\xf8>\xd7\xe0\
+\xe7\xaa\x09\x0b\x0e\x7f\xa0\xa1E\xab\xf0\x0f\xb9\xa2\x1a\x12\
+\xa6~d@\xd9vs u{\xd1\xba\x8c\x89\x00\x04\
+\xd2\xc3\x13Y\xb9\xcd\xea9*.P\x82\xd5z\xe7\x0a\
+\x04\xe7\x06\x04\xbf\xa9\x00\x19' \xfdb\xb9\xdc\x89\x98\
+\xfe \xc3z\xadw\x93\x93\x82\xb5\xb1+\x11-\xe4\xe7\
+f\x8dF*\xa4\xe1\xd1\x0a\xe5L\xac\xb9\xd9;\xdei\
+s,N\xa9/\x94\xa7\x94\xee\xa2\x8d\xaa\x01y\x8eJ\
+\xe4\xact=\x94\x99\x0d\xe7\xbc&T\x12\xd1\xcc\x98\x9a\
+[\xf0>I\xac\x81\x90\xe58\xc5\xa85\xbd\xe3\xbe4\
+\x92\xd6Ud\x86\x1f\xaa\x14\x9ff\xf9\xb3s\x90?\xe7\
+\xda\x06l\xd7\xb0\xd3\xf3R\x9dM\xda\x98^h`\x87\
+\xd6\xed\x00f\xbd2\xe8zMn\x0e\x0c\x9e\x0a@q\
+\xf6\xc9\x0e\x0b\xe2\x8c\x88\xbek\xfeb\xe4id\xa6#\
+\xea\x10\x86RB\xad#\x80\x06s\xba\x85\x04\xf1\xde\x19\
+M,\xad\x97\x8b\xd1LwtQ\x1bi\x0b\x95\x7f\x87\
+&(\x0a\x88\x93\x12\x9f5\xc6\x09\xa6\xa6l\xd6\x1f\x93\
+]\xcdm\x96s\xdc\xd4$\x81\xa6n\xf4V\x9dZd\
+\x1a:\xe61P\x82\xc7A\x82\xfa\xb8\xc3\xd4\x9d>\xa4\
+QX\xc2\x1a8\x0b\x91a`\x8b\x03\xcc\xbb\x08\x15\x99\
+$\xc6\xe4\x99\xa6%a\x8e\x08\xe3\x8e\x03\xd5\xc2\x8e^\
+\x07@\x04\xbf\xa8t\xa4\xa1$\xdb\xa9\x05\xd8\xec\xe1>\
+\x85\x1dL\xa0:\x8ft\xd1\xfb;* \xc0\xc2~v\
+-\x1b\x0e\x12U]\xa2\x1a\x82R)-\xb4\xbd\x8c\xde\
+\xe3O\xebg\xf6\xdc\x19k\xd6\xb4\xdd\xf5%\xe8\x0eF\
+\xc2\x98O\xb5\xe2\x16``\x9a\x99\x02\x96\xd1\x886l\
+0K\xa0\xc9\xf4\xbd\x88$\x1f\x15[|QGbW\
+\xd4\xcbd\xf3,C,o\x11!\x98VTc.C\
+8\xaaF\xa7\xc5\x00\xeb\x90v\x15\xc9\x03\x17\xa9\xefX\
+X\xc1\xb5\xc5\xd8\x10h\x87xQ[Z\x9d\xce\x84\xda\
+\xc3\xc8\xd3\x10W\xa3\x9e\x17\xd8q\x93\x14\x92,\xe4J\
+\xe5J\xda\xf0t\x1e\x17a/\x88\xae\x06\x889>\xa6\
+\xd7D\xe4\xd1\xc7\xc5\x80\xe4\x84\xad\xe3'x\xa2Q\x15\
+\x85\x1acr\xb6\xbe\xbeQs*\xce3\x8c\xe0\xf5\x03\
+\x1dI\x86\xb4Ed(v\x0b\xe0\x0ey\x84\xda\x8dS\
+\xc7H\xd41gU\xa4\x90\x9e\x06\x94\x99nR\x99\xef\
+\x08\xb3\xca#\xee\xd7\x81\x19\xdd\x09pV\x1cTz\x08\
+\xe4T\xa5\xd04\x8aZc\x0b\x00\xc7\x071&\x92\xf5\
+\x87+\xf8\xcb.l\x0aK\xe3\x83G\xa5\xacsM+\
+.\xf4\xf8\xa0\x0b\x14\xebT\x16M\x11\x1a\xd2\xfe\x12E\
+E\x9d\xfe\xaa\x92\xc6\xf1\xa7\x8d3\x83\xb3:\xfb\xbe\xdc\
++\xc6r\xb2\xab \x10\x12\xf8\xd7\xb9\x07\x9e\xcc\xb4\xce\
+\xe8\xf1\xa2\xbdk(\xce\x13\xec\xa6c\xd8Phc\x01\
+\x03\xa0\xb9\x0c\xd8\xc8\x1ek\xd7_\xc2\xa1>\x0a\x90@\
+\x86Z\xc1\xa6'\xfa\xcd\x0b}\xe2k\xfd\xcc\xdd\x08#\
+S\xb7\x06\x12t\xba\x0590\xdd\x85\xe8\x98\x87\xe3\x87\
+\xc1\x08\xf8\xb5\xf79\xc8\xda\xc8\x93^]&\x93\x00\xb7\
+mw\xdd\xb1\x13\x22\x16\xea\xe4\x8c\x89\x8ab\x06\x1a\xc9\
+\x05\xd7\xf3TM[\xa8\x077vMZI\x1c:,\
+\x03F\xcc\xcf\x10\xb0\x98\xda\xb2\xd9}%c\xfe\xc34\
+<[\xe7\x00\x09\x0e\x9e\xb9\xcb\xa0\x15\xaf\x88u^\xd6\
+F\xf7\xa8sm\xc0\xa3^\xc7c\xde\xc2i\xc19\x17\
+\x1d\xd0\x83\x99\x0d\xe7'\xc5D\x11\xa17)DT]\
+\x15\xd9\xb6B9Eh\x1b\xd3r\xa6\xd0\x17\xa7M$\
+d@eA\xb4\xc8\x99v\xbev%\x19+\x8dh\xcf\
+\x14\xce\xa9B0\xed\xa2\xb0\x22yjG\xe0\x97@\x06\
+4\x10Y@\x8f\xa2\xcc\x08\xc5\xd3\x92\x1b\xc8\xa3\xd5\xc5\
+U\xac\xa4\xf4\x9f\xe6\x08\x89s\xbcNOV\x9d\xaf\xbb\
+p-\xc7a\x0d\xd8\x1e{a\xb16\x0c\x0b\x03\x92W\
+\x12\xe6e\x13\xf3\xf7\x22\xad>\x03_\x90\xe5\x97B\xb6\
+\xd3E\xaa\x00\xb4e\x90\x9a^\x15\x1e\x98\x22}\x009\
+c\x14\xb4\x0e[\x92\xac\xe7\x81l\xdd\x08\x035\x0cB\
+#\xc0\xde\xce\x11\xc2\x0c\x19\x11\x0cH\x10\xa1\x19x\xc3\
+\xe3\xd8:\xa8\x92\x0eS\xecwG\xa9\xd7\xb6r,\xd1\
+\x86\x0f\xa0\xc9Ctr\x9d\x99\xfd\x92(\xe1k\x1bz\
+\xefI\x8a\x99\xc0\x91\x8c\xdd\xb2s\xaa\xce\x9c\xb5\xc7L\
+1\xb1\xf0j\xe1\xce`8\xf8\x83kb\xe7y\x80\xb2\
+q\x8bC/xK7r\x9b\xf74\xcd\xb6\xe4\x02j\
+t/=\xfa\xd5d`04U\x05\xcb\xd9W\xe7\xe0\
+\xd3\x5c@^\x99\x86\xe8ueR\xe8\xca\x05\x12O\x10\
+f\xc3\x5c\xbbn\x09\x19 C}\xdf\x8c\xe8\x03[3\
+~ \x0b\x85\x03\x5cQ\x1fT\x1c\x01/J\x8c\xc4\x1e\
+M\xb7D\xd6\xcc\x97\xcaNR\xbc\xfe\x07\xa1\xa1\x8f\x86\
+\xb8B!\xc5\x80\xe9\xf8\x0e\xad\xb1t\xbe\x90\x86\xf9\x93\
+\x1b\x07f\xca^\x12\x9d\x18\x83d\xb8\xc1\xa0HeM\
+\xe4$\xe8%R\xd4d\x16]\xb5\xe4Ov\x12\xb9V\
+\xc0q>\xc1v\x96 >\x02\x12O\xbbh+\x98\xef\
+\x14m\xc5;\xd5M&6M\x08\xd8\x8cG\xc2(\x9d\
+'\xeck\xa8\xdaw\x14\x03\xd3z\x8f\xe12\x18\xc9\x10\
+:\xff\x0d\xb5]\xd0I\xac\x00>\x94\xb1'\xbe\xdb\xd3\
+E\xba\xc5 \xbd\x84\x15\xd2\xaa;\xfbZ\xe9\xdc\xd99\
+.\x90q\xe3\xd3\xbd\xddj]4.\xd7\xac\xf6E\x06\
+\x81'[\x90\x8f\x16\x02\xd3\xdd\xb5h1\xc3F\x0dY\
+\xc8*\xda\xc0g+ND\x82\x92m\xcf\xe0\x5c\xddF\
+Uo,\xa6\x93p\x07\xe7\xad\xc2\xfd\xe9\x9e\x84\x22\x9c\
+\xa1\x99\xa0\xe7\x0d\xf6\x0a\x08\x95y\xd3D\xab\x1e;\xc8\
+\xe2\xa6\xfa\x1d\xf6+\x1c*\x9d\x0fAA\xd0\x93X\x0c\
+\x10\x12@Hh\x06\x82J\xe7\x90w\xeai\xd5\x14\xab\
+\xb6\xc9\x94mD_\xf4\xa0\xb6\x99\xea\xd8,\xaa\xb6\x22\
+\x1a\x0f\xc2iv:\x97\xabv\x871\x8aF2\xa1c\
+\xa1\x1f\xa1-\xde\xd5@:\x85\xc6\x18\xa6[|\x01\xd6\
+C\x0bX\xebJ\x8d\xe83\x9b\xea\x92\xf9\xb6r\xea\x0f\
+\xf0\xd0\xb83h\xecEC\xba\x07\x81o\x14\x09&\xdf\
+\xd0\x06\x980\xd5\xa1\xe4<P\x0e1\x80\x92\xfeD4\
+Z\xecAso\xbb\x12k\x1bS\x7f\x88\x0d\xa4\x83i\
+\xe9\xd6=\xf1\xd2h\xdc\xa3h\x10hDI\x08\x0fF\
+7\xe2q\x9057\x1a\xa6\xb4\x84bSF\xa9\xa1\x09\
+IWh\xb7N\xbd\xe6\x97\xb4\x22\x90\x83\xdeZ\xde\xcf\
+.\x97\x0cM\xf5\x01$tc\x22Tg`\x8c\x18f\
+\x0b\x00J%\x95\x9d\x94I+\x8e\x19UJ)!\x99\
+\x83\x15\xb9\xa0:\x7f\xd2\xfe\x09\xe8\xcd\x9e\xbaq)\x95\
+.\xf5\xcb$\x95\xd3\x11\x1f\xe1\xd4\xb8\xa3y\x97\xc3w\
+\xe31\xb3\xa5@H\x9d\xc2\x96l\xe2P\xe4\x22&\xcd\
+ 4y~E\x14\xb7m|\xa4\xdf\x15Ml\xc4\x80\
+5\xb7\xaa'{\x1d@\xed\x91t).{\x85o\x8c\
+/\x10\x98\x90Z\xd6\x93\x88\x025@\xd4d\xd3g7\
+M\x0b\xaf\xcenQ\xe5UP]\x1a!N\xc7\x08\x80\
+\xde2h[,\xa3\x92\x17\x9b\xa2\xae\x9b\x02@\x8c\xdb\
+\xfc!:c\xd9\x1e\x1ah\xc8X\x1bN2\xef\x1cC\
+C\x08\x22\x98\x9b\xb5ia\x8c\xe0\x82\xc3\x5cX?\xc6\
+\x00\xf9\x8a\x80\xd9\x97\x12$\x12\xaa\xf55Q,l\xb9\
+,3E9\x06d\x8f\xbe\x06\x92\xa9\x02P\x0b( \
+T\xf0\xb5h0\x94\x0f\xa1x|\xc9\xc4\x1aC(\xa4\
+\x82\xf4]G\xa1\xad\xd7\xb4\x18y\x9f\x0b\xd7\x96\xe1\x01\
+^\xba\x14\xde\xa2\xc8I\xc2C\xa3\xa3nl\x90h\x8a\
+\xad\x8c\x95\x162\x14\xccI&}jZs\x1b\x22\x92\
+z\xd5z0=X x\xc6\x8e\x1e<7\xe9]\x90\
+C7}}d\x9f\xd5\x8d\xbc\xdd\xf0E\x00\xd3t\xfa\
+\xcfhSz\xcc\xd39\x15h\xe9\x8f\xaeZ\x12\xd4\x0d\
+\xcc\x00\x00 \x00IDAT\x9e\xe8\xb7Q\x91U\x10\
+e\xa2tD \x115\x02\xb3\x16\x8c~\x0a\xa2\x1d\x9b\
+.MC\x0e\xd6\x98\x13\x09\x9a\x0c\xe7\xd4,5\x0b\xb5\
+\x97\x96`\xecn\x03\x8f\x8a\xb0\xb8(\x92\x95\x03\x83c\
+v\xbf\xd0\xac2h)\xbc\xe3j&\x92\xc2\xed\x9c8\
+\x0ch\xcd^U\xeb3\xac\x0f\xa7\x9dK\xd1\x049\x5c\
+\x1b\xaa\xd4\xe9\x8bS\xea\x13\x90\xa4>\x96\x94dih\
+)_3V\x1a\x13\x22\x0elE\x5c\xe6\xdcq\xc5\x1b\
+'\xc3\x0f\xb7\x1agh\xe9\x1dx\xfe\x9e\xaf+\x13N\
+L\xc2z\x9c\xa2Q\x042d\x13\xce0\xd7W\xc9\x1c\
+1\x1a\xca\x0d\xd1\xa6p\x9a\xb96\xcbhA\xefd\xc3\
+`\x19i}#\x868t\xc7\xd59\xb4\xf0\x15\x22\xde\
+\x97\xd6 \xf5P\xd0\x08k\xa3\x16;\x13]R\xaa\x22\
+\x1fMr?a\x9d\x0cd-\x8f@2\xd6\xb3\xbb\x87\
+\x9f\xff\xbcB\xa6\x1er\xea\xd7M/g(\x1f\xd0c\
+\xe5N\xec\xa5\xef\x9f\x10\x99\x07Mc\xf4\xa3m+\x9c\
+T in\x8c\xf1\xd4\x08\xb9\x023\x9a\xa2\x81UR\
+;\x98\xf1\xe69o!hh\xf1\xa9q}^%\x1c\
+!_\xba\x0d.\xca\x09x\xa52\xea\x92\x12-p\xc9\
+\xfc\x10\xef\x22\x9b\x9c\xc8pI!S\xd1\xaa\x1a\xd4I\
+\xa4\xa1\xdb\xc5\x8a\x9d\x08~\xb4\xc8\x0a\x99\xd4I=l\
+\x8a\xeb\xbdU\xecE\xac\xf2#\x22\xbc \xda\xdf\xcf\x95\
+)\x13\x98\xc5\xf9\x12\xa4l6\xdf\xbd\x80\x1c\x0f\x95\xff\
+\x9f\x0e\xc1\x99n\xa4\xaf\xd0K \x03\xa4\x05`:\x8b\
+\xa9L_\x882k\xea\x1a\xee\x04\x91r7\xcb \xcc\
+\xbc\x84\xe0Md\x5c\xef22\xc5\xf0zX\xd2\xd9\xd0\
+\x80\x9e5\xebT\x15{-\xc7 \x81\xdd\xbee\xbc\x9f\
+\xc1\x80zPsi\x86\xbd\xcd\xd4,\xab\x1d?\x80\xe1\
+\x15\x8a\x9b\x1c\x99\x9e\x87(F[\xa5\xfb\x88b\xc2\x89\
+\xf2{\xec\x04\xfc\x84\xb0\xa6\x89\xb6\x9a\xe9\x95\x80\xc9\x88\
+\xd5}Z\xdbg\x0dz\x22\x03?{\xa0a\x17\x04\x9c\
+\xca-\xb2r\xaf\x12x\x92L\xddR3\x1fa\xfc\x9b\
+\xe9\xa4\xdd\x916h\xda(3\x8a1\xc2\xe2aH\xe8\
+I\xaec\x8b\x8a\xa9\x0c\xcc\x14\xb6`\x87\x18\x06;\xa7\
+\xfb\xa4 \xad\xe1\x9d\xaa\xa5\xab\x01\x8e\xc1A\xa2C\x07\
+\xd1\xf7\x96;\x93\x04\x9b\x12\xaaW:\xb8:\x22M\xae\
+\x1dW9\x9c\xde\xac\xf8z\x193\xa8\xcdD~\x8e\xb9\
+\xea\xbc\x86T2E\xd5\x98`\xe9A\xd4\x14+\xc0\xe2\
+\xf1\xf6\xdcr\x05]\x221X5u\x0c{\x12\x98\x02\
+\xa8\xd6\xa9W\xcd\xaet\xc1\x9f5h\xcf\xdc\xdc\xa1\xa2\
+\x04X\xee\x9c\xf39\xb3\x19\x02\x999\xa1+\xc8\x1a3\
+\xb9k\xc4TMS(\xf3\xc3\xb5\x05\x11\x10\x11)V\
+m\x05~\xfa&i7\x93\xfe\x01\x864\xce\xf2\x0a\xa1\
+ww\xd8\xbf\x8be\x82u4\xde5\x81\x11\xba \xa8\
+\xa8p\x8e\xbb9\x9e\x00\x89;D\xef7D\x17Wg\
+\x0f\xc2r`\xce\xb0\x1f\x1d\xb5\x92\xc6M\x843\xe8\x87\
+\x0a\xdfT'3\x8d\xaf\xa9\x82U&\xfe\xb5Z\x11T\
+\xad\x1dD\xe05\x8f\x98n*\x8cBOVJ^\x10\
+\x91\x82\x89\xbdk9\x96Ys\x96g\x06m\xc05\xe5\
+\xd0a\x9d=Ag\xcb\x97\xbc:?i,Rg(\
+b\x95\x1e\x92*K\xe82\xa3qcR\xa6I\x81\xb8\
+iC\xef\x94\xf2\xa4\xf2\x1edo~\xb4\x07c|\xf4\
+\xd8S\x8d.A\xc2\xac\xb4A\xa7h\xca\x0e\xb6\xe8\x02\
+G\xab\x03@O\x04\x8a\x05\xcf\xd9\x87\xd6\xb1\xf6\x93P\
+\x88\x86&f\xf31#/'\xbac\x8ds\xe9Q\xd3\
+-c\xef4\xd0\x15\xd6\x8a\xbf\xa2f\xcf\xf4I\x1cE\
+\x12\x97\xc8Z\x84\x83J\x1f\xa3\x05\x0eI\xfbhb\xf5\
+\xfb\xd8\x0aE\xa9\xff\x87\xcc>\x90\x07S\x15\xc7$@\
+\xaf\x9aK\xc1\xea$gHU\x80\xa5N)5%\x9d\
+\xdb\x92\x89\xa0\xa2\xd0!\xca\xf6\xe9\xa9\x80g8~\x91\
+3d\xf2\x9d\x80\xde\xc0\xa4M\x0f\xb6\xe4Z\xb1*\x14\
+\x90\xc2\x04\x96f`\x19\xe9\xe2\x5c*D\x8fDY\xd0\
+\xe8j\xb7\xeb\x0c\xae\x96\x16\xe0g\xa3ZDu\x02\xd0\
+\x9a\x1a\xd2H\xa8w\x89Nj\x0f\x18\xe9\x04@\x9b\x96\
+\x84\xb9A7\x14\x06\x82\xb1G[\x80L\xaa0~\xd8\
+\xe1`K&\xb9\xd9\xa8\xaeW\xa6\x84\xe1Pw\xe9\x16\
+\xea\xd9\xbe\xcbY<\x1e\xb6\x8a\xc6\x80#\xe9S\x1c]\
+\xed\xbf\xba0k\xda\x97\xd0\xb2\x80|!\x09(\xb4\x02\
+`FC\x8e\x84\xde\xe6\x22%\xc4\xea\x85E\xeb\x1d\x84\
+\xe6\x0c\xcb\x08\xa3\xc5Ym\x05Q\x87u\xa4\x9b$\x01\
+\x7fD\x0dU\xa9\x18\xac\x96%\x5c\xf7\xa6\xcc\xb7\xde\xbd\
+\xf5!\x01\xef\x98\x1e\xe3\x96\xc6\x94\xaa)\xf5\x01bZ\
+\xf20\x1bF\x0b\xdf\xa8\x9b(L\xb2\xde\x1b+\xe6\xec\
+\x86\x94\xa9B\x05\x08\x092+I\xabm\xc0\xc6Lr\
+1//&1\x10\xe3\xd2a`\x8f\x22\x86\x22i\xb0\
+<\xc3\x965\x81s\xdb\xff\x9b~+}3f\x86\xd9\
+\xea\x95\xe0C\xb5\xae\xc2\xd4\x9cGU\x92\x92\xe3c3\
+\x9fb\xe7\x879\xd3\x19\xa8\x1a\x8c\xde\xb4J\xd4\xa3\xa7\
+\x83\xce\x9f*b\xb9\xb4'\xb5Z\xa4\xa8z\x82\xc9\xcc\
+\xb1A\xf0\xc0\xd4V@{\xd9\xa5.\xc7^u\xd5\xf8\
+0k\x14(]3\x1a\xf0\x072\xf3t6N\x9b\x09\
+\xfb\xf4{\x8a\xf2\xac\x8ao\xe8|\x823^\xcd\xdaZ\
+I\xba\x99M\x89\x94\xda \xa0\x98\xa7Q\x02\x9a\xde\xcb\
+N5Nf\xe5,SH\xe6\xcc\xfe\x12\xb3\xe7\xb9%\
+\x1b\x05NB\x7f|\x84\x9e\xbc*\x84\xcc\xc0\xac\x91 \
+\x02\xebW\xc0 \xa7)\x09\xb9\xb0;z;%\xcd\xb4\
+\x9b4yk\xd4\xff\xeb=\xb70\xd3?\xad~rp\
+\xea\x06\x96\x0ahb\xf6\xe0L\x92\x0e\xa78u\xa5\x8e\
+\xfch\x9c\xc2Ab:\x95\x8fl\xc8\x06jZZ\xa5\
+2DQ]\xb8p5H$\x82\x873\xbe\xa6)\x1b\
+&)\xe86\x95zm\x1a\xa3Z\xc9\x1du\x17^\xaa\
+\x1b&'f\xd2#m\xaa\xd5z\xd4)\xa6\xfa\x89\x86\
+\xb1A\xebCw\xeeT\x0c\x02aq\xa4\x80\xc7\x9bG\
+\xedt\x15#1\x08\x04\xc7\xeb\x10\xa8\x18T.T\x15\
+\xc4\x11Z\xa4\xbd`S\x84\x87-\xec\x9b&\xa2\x09\x89\
+\x03lC\xb3\xab\xcdG\x86\x85\xe6,Km\x89\xd4\xaa\
+YH\xc4\x1c\xd0\x83\x16HfK\x98\x1au\xcc\xf4\xdb\
+\xbay\x87\xa8\x11\xd4\xeb\x15v\xa8\x03\xf2B\x8f/\x9a\
+'\x1fYo\x03\x92\x1c\x1b\x9e\xf1\x92n\xc2\x98\x93\x81\
+\x83\x17A\xee\x05\xb4uZ\xd8\x12\xc7\x0a\x89\x0e\x89.\
+3\x994\xb9\xd7\x92\x19\xd0{x\x80\x11\x8c\xdb\xbc\x84\
+\xcd\x7f^\xf4\x0e\xda\xae(5\xb90\xff\x84\x87\xbd\xe8\
+zV\x9d&R`\x0d\xe9=\x963\x0a\xd2\xf0\xca]\
+\xda\x1e\xe5\x22J\xd1\xc1\xfd\x88MT\xc6p\xa0\xc1L\
+\xf5\xb0S/\xcc\x8f\xeb\xddTw\xa0Yi\x14C\x8b\
+q\xbc\x18\xe8\xf2\x91%L44\xd3\xea@\xd4\xa6N\
+1\xaa\x87*F\xb1g8H\x8f\xc4\xb9\xec:4`\
+\xb4\x0fM0\xbd\xda\x99\xd0\xda\xd0\xa8\x85 \xe1\xdd\xe7\
+\x00E$Qf\x88&\xab\xf0)b}Z\x00\xa6l\
+\x0e\xba=\x17\xce;\xcbh?d\xcaW\xae\x86hs\
+\x93\xb0\xa1\x11\x96\x0b\xa3\xef?\x15_1BT\x08t\
+\x9f8!\xf5q\xa3\xb6s\x8f\x13J\x94\xc2\xa0>\x8e\
+$\xab\xd9&\xb8\xa2\xabIb*\x84i\xb51\xbfc\
+#\xac\xea\x84@\x90\xa4\xd7\xa6\x12\xc4\x90ZSt\xa9\
+\xd6\xb3 \xddf\xc6PA\x17\xaf\xb1m\x097\xf6=\
+\x02\xe6,\xcc\x0a\x0f\xd0\xfd\xfb4\xa9\x1a\x02n\xd0\xcf\
+\x98\xa6\x06fM5\xdaTe\x95\x10\xe8bb\xa8\xea\
+a\xe8=kHq\xd1\xca\xea\x81&}\xe9Z`\x0d\
+\x1f\x82\x8b4\x88\xde\x01\x06I\xc1\xb4\xb6\xc4T\xc2\x93\
+5\xed9\xf0B\x83\x0d\xa15\xcf\xf6\x9c\x05\x01\xc8\xc4\
+!V\x02B\xd1\xf6\xe0\xc4\xa8;\xe3\x88\x84\xd4\x12.\
+\xee^ojN\x91\xc5b\xb9#&\x8bF\xf4\xdb\xb6\
+\x14 \x9bt\x92\x11\x84\x18u\x1e\xed_\xa2\xc0\xa5.\
+` \xf4\x8b\xe6\xb4\x13\x15\x9bY\xe2\x0cT\xb2\x01I\
+V\xf2E\xa99\xf3\xdf\xa8\xbaa@(\x94\xf5:p\
+\xca\x97\xc1\x1aE(g\x80\x14\x05\xcat\xda\xed\x0c\x09\
+\xad(\xd8\xbch\xc5:;\xb3\xb5\x22\x14\xcc\xe4\xb7\xe6\
+\x1eh\x8e\xb8%s\x9c%$\xf6sV\xfd3\x12\xa5\
+\xfc_\xd6\xe0\x01\x89\x8e\xea\xb4]\x0c\xde\xc6\x8f\xd9\xa9\
+\x11\x90\x8c\x1c\xb2\x80\xa5\xa7Fu\xe8`\x07\x1fg\x7f\
+s\x09&\xb3\xfaT\xb6\xe4\x9c\xd0\xb8.-0\x93\xc6\
+d\xa2}\x1f\xe7\xc3\xfc\x1a\x01\x5c\xcb\xaa1\x8a\xee\x15\
+\x062\xb7\x18@b\xa5\xad\x1b\xb55\xc9S\x98\x12N\
+\xacu\x90\x1bm\x06^O\xce_\xc4\xfc\xda@\x96/\
+\x88\xa3\x14Z4\xc3\xa8X\xbb\xb6\x87\xb9\xacH\xe5\x0f\
+\xc8\xcc\x8fcco$vE\x9d\xc4$\xd8bV\x93\
+\x84\x08\x9cE\x92\xad'bf\x87@\xba+\xa4[\x8d\
+\x17\x02\x0a\x97p\xf6[JQ\xb0*\xdcf\xe1\x18m\
+v2\xfdl\xb4\xf80\xce_]\x1d\x1a\xeb\xd2\xa4\xa4\
+\xa6\x1b\xb52\x11\x1b\xe3Z\xd9^\x9bm\x10J\xe1+\
++\x86E\xeb\xb1\x08\xad\xd194B\xdb\xa4\xac\xb3[\
+\xca\xce\x1e\x9fM\xcee\xc0\xf3gb\xebn\x89\xbe\xf6\
+\x5c\xa3w\x9d\xf9}0\x9fz\xfe\xe8H\xfb\x9d\xb3\xa4\
+<\x7f\xbf\xf4?\xa3\xe7\xd52\x1d\xa3\x11?\xa1\xe4\xe7\
+\x1a\xc3\x8e\x84\x84\xa77\x85\x02Lax\xceL\xaf>\
+\x91\x19}%s\x06\xbe\xf3\x184\xfc\x0f\x94fj\xcd\
+\xf9\x9a\xeeLt\x18\x07]\x17\xfa\x8a\x88\xac\x0a0l\
+`c\x89\x0dL\x88\x82\xa5\xe8\xce\xc6@\xba\xb6\xd6c\
+\x16\xa8\xc5\xaaV\x15U\xb3\x89\x16\xf0\xa1\x08Weu\
+\xae\x9c\xdf\xc2\x96`\xb0$WrV\x17:k\xa2\xb4\
+{\x1c\xb3\xd2\x03uv\xac6mj\xf5=\xa5\xd5c\
+Q62\xd6\x12\xfb\x87\x8e\xcf\xc8u\xa2F\x0eiE\
+\xf26\xf3X\xc3\x9e\x18n\x5c\x96\x92\x8d\x96\x07:)\
+Nr-\xed\xdeP\x97\xaf5:\xc0Q+\xc3>\xc1\
+\xd04\x12F'\xd97\x95\x8e\x98\xd2\xab#\x92p\xb1\
+f\x8c\xaa\xa0\x8f\x8b\x86\xba\xc9\xd7\xc6o\xac\x84\x87p\
+\xe8\xa5{\xbe\xf2\xa6\xcd;\x8en\xbf\xf6\x92\xedG\xb6\
+ac1qLK\xdb\xc2\x87\xe9\x90(\xe2\xb8\xe0\xb0\
+Z\xcf\x1d\x91\x98\x88\xb0\x90\x91\x15\xd7\xaa\x1b\x1c\x1d\x0f\
+\x86*\xcd\x87Q\x07i\xfa\x19Rd\x0b\xe7O\x9c?\
+\xf1\xb9s\xc7>y\xfa\xd3\x7f\xf1\xec=\x9f=s\x0c\
+\xc3@xi\x1b%\xc2\x96\xf1O\x92\x90\x9a\xae\x98g\
+\x89\x22\x81\xe3iK\xbf\x9eg\xaaW\x8e?\x02\xd5\xec\
+\xd72\xef\x8eA@m^\xad\xa85\x89\x15\xdf\xfc\xc6\
+\x06OS\xc0\xf6\xcdC\xc9\xae\xae\xdb%\xe6d\x94\xc3\
+J\xb0\x8d/\x91\x12\xd0\xdbs0\xbfCQ\x8c\xe8J\
+<(\xb1\xe6l\x0e13\xad\x93\xca\xbaT\xef\xa2\x1a\
+\xce\xe4\xed\xbb^\xfc\xf7\x0e|\xcbs7_\x08\x12\xc4\
+  V\x02\x11)\xe8n\xa0\x94\x0e\x95\x8eW*\x8d\
+\xb3\xd6\x0a\xd4\x80\x85\x17\xfb\x1a\x98\xeev\xb0\x90\xfe0\
+ieC\xc8\xa1s\x83\x04\xa0\x14\x19\xaat\xf1bQ\
+\xee;\xf7\xb9\xb7>\xf9;\xef=~W\x09.\x81\x1d\
+V\xf2\x06\xf7\xcc\xc5\x97$&\xa0\xbd\xff\xa7)N\xf7\
+\xe2o\xf3\xdb\xae\xa6\xdb\xfd\xc2y\xe6\xaf\xa6\x0bu\xe9\
+!\xcaI\xdb\xcfuJJ\x8eb\xda[f`\x92l\
+I$(\xb1\xb9y\xa8\xed\x9e\xba\xfd\x8a!ZJ\xd6\
+\x05\x0d\xe6\xc2xD\xc1\xe2\xf34\x9c\x1aL\xfa\xa90\
+\x07\xae}\x17\xa9m;i+5\x09FPOV6\
+\xceU\xf3\x9a*\xc0\x10\x9d\x08\xc3\x98\xabZ\x19\xe5\xf0\
+p\xf9?\xbe\xecGn\xdbq\xe7H\xf8\x99f9\xaa\
+b/\xb4\x0do\xab\xd6\xd2\x0a,\xbaUA\x09\x984\
+\xbc#G\x8f5\x86\x9a\x01\x0e\x8aE6\x04\x13\x8f\x11\
+\xd9\x1cd\xf8\xec\xf9c?\xf7\xc57}\xe6\xf4\xfd\xfd\
+\xa4\xb0\xb6PV\x92\x90)\xdc\xa4\xf6[3\x1f\xa2\x1b\
+\x07\xa2\xe2n\x06o8\xcf\x22;\xed\xcc,B<.\
+L\x04\x0fo\xad\xdd5\x11\xc6\x80Q7\x84h\xbe\xa2\
+\x0f\xacj\x12\xec\x9a\xa3\xe0va\xfa\x0a\x16\xb3\x8c#\
+iMw\xdf\x8d\xa6\x01H\xea&i\xb5\x96k\xb1J\
+JO\x9aM\xb6\xd6\x0bO\x0c\x8dP\xb6$Gg\xbf\
+5\xfe\x7f\x11\xbel\xef+~\xe4\x8a\x9f\xbbl8*\
+\xc3\x08\xe2\x13]X\x80\x82\xa2\xb7\xf0\xbe\x97CKt\
+L\x8c\x85\xd6\xe1\xa4?7p\x1e\xc6\x9f)\xae5\x0d\
+\xad{\x03]:/l\x14\xd3\xc6{hq\xe0\xd5\x97\
+|\xed\x199\xfb\x89\xd3\x9fN\xb2B\xd8\x88x.&\
+LZ%\x9dBr\xf77g\xdc\xf8\xd2(\x9c\x04\xe2\
+\xcft\xcfD =\x8d-\xda\xdd\xd7\x22\x83\x8f\x9d`\
+\xd6\x81\x01\xc1\xbdA\xabC+>\x01\xac\xf9x\xae\x82\
+\x06Y\xe7!\x91\xb7\xe1\xd9\xb6\xd4\x04_S\x05\xbe\xe0\
+\x99\x85\xc4B\x02\x1522\xba\xf7S\xa5\x92F\x0d\x02\
+V\x90\xd7\xa3\x08T\xbe\xde\x98Rx\x0a\xbfa\xff\xeb\
+\xbf\xeb\xe0\x7f\xbf\x18\xe3\x1d\xe9\x0a\xbc\x98*ZT\x92\
+\xec\x9d\xddRQ\x22\xaa`%BF\x86&\xa4\x89\x1f\
+\xb1x\xecH\x0e\xed\x08b+\x12\xf7n\xcc\xa9\xf67\
+px\xd9\xae\x17\xefY\xee\xfa\xe0\x89\x8fp\xc0\x0cG\
+\x05\xa9dw\xecE\x16\xabt\x81\xf82\x22\xbd/E\
+\x84\x12im\xbbYbfF!\x18u\xf8\x1b\xc8\xae\
+\x80\x9c\x82\xd2\xfe\xd4\x0b \xcc\xea\xc0\xc8\x83\xa3\x0d\xe8\
+\xa0\xd5C\x89\x9cA\xad\xf2\xe2;\x92=\x03\xcefa\
+\xd6\xbd\xd4\xbb\x87u\x8f0%\x1b\xae&\x18r~\x8f\
+\xc7|\x80\xaf\xd9\xf7\x8d\xaf;\xf8\xdf\x81B\x94&\xa8\
+\x8b\xda\x00\x82@g\xd0\xc6\xc6J\xb0\x8b\xba-v\x0c\
+\x93\x06KchG\x81\xf2hk\x089-\xdf\xa1\xa9\
+M\xc2\xf1\xc3\xb4lv\x13\x98\xba}\xe7M\x9b\x1b\xdb\
+?\xf0\xcc\xdf\x003\xaf\x03\x01tO}\x82\xe7\xc8\xa1\
+\xc8\x0c\xe0\x98\xcf\x1f\x1f\xf0y\xdaA\x98K\xb1eY\
+\xb39\xd2\x89\xee\x80u\xc9@H5s\x16\x1b\xe3\x02\
+Xc\xcc\x96z\xd1`=j\xec\xa5\x17\xf2\xda\x84d\
+\x94\xac\xb8\x03\xa5^\xb6\xb0\x02\x00be\x0b\x9cK]\
+_\x15\xda\xa0xM\xa5\x0b\x02<g\xe3\xf6\x1f\xb8\xec\
+'\x01\x16\xac\xa6v\x14P\xa4(\xbaCK\x06\xb4\xd9\
+0\x153\x93\xf0\xdc\x95\xfa\xf3\x86)\xadz\x9c\x00\xe8\
+\xc58)W\xeb\xee|\x0e\x00\x86\xb2\x00@\x0e0\xce\
+\x19\xba\xe1\xa4\x85^w\xec\xb8\xed\xd8\xf9\xcf\x1d;\xfb\
+p\xc2\xa0\x8b\xe2\x17\xa1#\xdc\xd9rHp\x0a\x9a\x15\
+\x890TP\xe4\xf9\x9c\xdd\xf0\x80|\xbfN\x22\xde\xb4\
+\xeb\x0e\x82u\x05\xf7\xc4x\x02\xdb7\x0f\xc5d\xb7\xa7\
+,\x0c{\xe4\x97(\xf2Qq\x00}M2\xc4/\x9c\
+\xf5P\xd0\x9f>[^\x89\xf9\x9a!\x15\xa0\xb0M\xc7\
+i\xe2\xdbNG\x9d\xcaS\x1fCKY\xfe\xccUo\
+9\xb2\xbcB\x06\xb27\x8c\xd4|\xb7F\xf90\xa5\xab\
+\xd2\x15D\xa4k-\xab\x8aX\xfb\x22\xbd`.8\x10\
+\x94R\xa5\x9a\x80\xde\xd70\x1e^\xd3~\x7f\xef\xf9{\
+\x7f\xf5\x8b\xbf\xf9\x993\xf7\xed^\xee~\xf5\xc1\xaf\xff\
+o\x0e\xff\xc3\x81\xc3\xa0\xe7'\xc6CB\xfa\x17\xc1g\
+x\xea\xdb>\xf3\xc6gV\xa7\xb5\x86K^|5\xd0\
+\x8b2G\x89\x18\x1dS\xeb/\x99-\xc0)\xf0(\x22\
+{\x14&{\xe1\x1a\x5c\x8ev\xfe\xc8\x9c\x0d\x07L'\
+[\xb8\xb7z\x02\xa4\x9b:2R!f\x1c\x92\xb3\xec\
+\x09\x98M\x92\xdd\x89\x94\x95\xb3\xb1&\xde\x13\x176\x86\
+}\x05\xd6\xecJ\xcd\xc9d4\x9d\x8b6dx\xc5\xfe\
+\xd7\xbel\xf7\xd7NZ\xc00\xb3\xbf\xef\xfa\x15V~\
+\x86O\x7f\xf6\xec\xa7\x1e_=\xfc\xf8\x85Gvo\xec\
+\xdd6,k\x14B\xbd\x85CJ\xbb\x95\xa1\xde\x1dT\
+o7:\x07\x94P\xd4\xbb\x89\xb7\x08~\xe1\xc2\x83\xff\
+\xf4s\xff\xfc\x91\xd5\x13E\xe4,\xcf\x7f\xfc\xf4\xa7\x8f\
+\x97\xa7\xbf|\xd7\x8bP\xd04\xbb\xa1\x22\xb1F\x88\xdd\
+\x81\xed\xdb\xb0\xed\x9eg?\x02X\x8b\xc6\x18\xe5\xce\xcd\
+]#\xcabm\xb7E\x91\xfb\xd6\x84\x053M\xf8J\
+\x9f\x1c\xb6\xf3@\xbfb^\xc4\xd2\xde\x05\xf0\x98\xa9\xff\
+\x05N\xd8\x92\xc6\xbb\xdd\xb5\x22s2\x1e\xa6\xd7\x95\x12\
+\xb1\x98{\xb2\x8b{s\xae9OF\x1avc\xdf\x88\
+m\xa5\xc5b\xfcZ\x94\x180\x1as\x9a\xf8\x00\xadg\
+a\x1eQ<\x99\xd1\x88'-\xcb\xc67\x1c\xfc6J\
+Q\x12b\xedE\xd1\xaa\x91\xca\xa3[\x0f\xff\xe4\xb1\x1f\
+:\xcf\x0b\xe3w\xf7\x0d\xfb\xfe\xe5\xf5o\xde9\xec\xb4\
+\xb5\xfd\xd2\xce\xd0\xa9\x89\x9d\x1d\xb2#\xcc\xeal\x9fR\
+\x83(LOA\xfc\xbfO\xfd\xe7\x0b\x5c\xe9\xf7\xfa\x87\
+O\xbc\xe7\xbb\x0f\x7f\xfb^\xec\x9e\xd2\x07j\x0f\xb0i\
+\x95\x12R\xc8o:\xf8\xaa_\x7f\xfc\xdf\x9f,\xa7&\
+}\x84\x99L\x97\xb38\x9b\x02QC\x8f\x8b&?\xd1\
+\xc6\x9f\x9aY\x9a\x22\x9b\x8a\xa1\xc2I{\x82\xd6\xf7\xa0\
+\x03\xe7\x17!\xf0\xf9\x0a-,T\xaa\xe9%\x95\xe9:\
+\xa8\xee&S\x8e\xef\x1da>b\x86\x09I\x11p+\
+\xed\x22-\xd6\x11\xd6\xa6/\xc8R-\xf8\xaf\xa2\xa32\
+y\xae\xd1M\x90\xd1\x1b\xce\xa8\xb5AM\xcb\x8dm\x81\
+\xf1\x19\x17DD^\xb2\xff\xabvc\x7f\x15\x8c)\x14\
+\x0a\x0aeU[\xb6K\x05^(C\xf9\xdbg\xee>\
+'\x17\x9a\xb3\xce\xf1\xd5\xc9O\x9c\xfd(k\xa44\xfd\
+\xfa\xf4\xcd\xde\xd7\xcb\xf1\x22]\x0c\xd0\x9a\xed\xb0\x9b\xba\
+v\x9b\x94\xa1<v\xfe1G\x0eY\xc9\xd6c\x17\x9e\
+\x10\x14\x01\x05\x85\xd3\x91U\xc6\xeb\xd7O\xa7\x80KY\
+\xfc\x83\x83\xaf\x00\x876\xaat\x99e\x02\xe2\xd86I\
+\x04'w;z:[\x80\x164bw\xa00zb\
+Jv\x14\x1a\x09\x8e\xee\x06\xc8[\x0e\xa3\x8f\x82B)\
+\x89\x98\x8a\xc0;O\x0e]o\x19V\x15\xbb\xe9\xa2k\
+\xb1\xa8I^\x99\x8e\xcde\xee\x9a\x0dt\xd1\xe2\xc1:\
+}\xb1]\xb5]\x0f\xd1\xc8*+\x89\x9b\x89qB\xa6\
+>1V\xa1\xa3\x97I\x18T\xe8\xcd1b\xfbf\xd9\
+\x9b\xb2\xa5|\xd9\xceW\xa0\xb2\xfd1\x89&\x10\xaa\x03\
+\x9a\xaa\xa9\xf1\xc2\xa8\x18\xa5x\x1d[\xbc\x90\xc5i\x9d\
+\xbc\x04g+\xa28\xf6M\x83G\xea\xcaa]3\x85\
+\xbcn\xe7\xd5\xeebKY\x5c\xb6y\xb8\xf6\x7f\xb35\
+\xfe\xb39WcZx\x04_\xb9\xef\xbf\xa0\xac\xe6\x1b\
+!\x13\x7fK[\xa1\xa1t\xe4UU\xf8X\x85\xca\xe9\
++<\xacgA-HRK\x9dy\xd7Q\xad/\xea\
+\x0c&Rixh-\xb9\xb4\xe5=\x81$\x1d\xadc\
+0\xb7\xd1U\xa62z.g\xc4\xb8\x8d\xcbU\x9d\xbb\
+\xd1\x0f\x8b\xaa\x8d_;gt5\xa7\xa4\xcb\xc5&0\
+\xf4\xe2\xa7\xad\x7f\xde*\xe4\xd6\xff\xa1ZRL\xcc/\
+Th\xd3.\xba\x94\xed7\xed~\x1e)\x94R\xa4\x90\
+EHJ\x19k\xc0-%P\xe3Y\x94\xa9D\xf3\xf9\
+#Q\xd8\x19\x08M\xb3\x82\xac\x92;\xe4\xf8\x8bEi\
+{\x91\x942\x9e\x1b\xd3\xae[8~\xba\x14\x11\xfeW\
+\x07_\xbdw\xd85\x94i\xae\x0d\x94\xd7\x1e\xf9\xfb;\
+\xb9\xa3\xc0\x8c5\xd1.[\xc6;\x1f/r\xd3\x8e\xeb\
+\x0e.\x0e\xb4\x01a\xef\xad7\x1a}\x9dJNe\x98\
+\xa1\xdd\x16\xbc\xfd\x89\xa1*\x92\xca\xf7\xc1\xcc\x1cR\xd2\
+YA'/\x93Q\xdf\xa9\xb5\xf8\xfd\xc4\x13\xf5\x02\xc4\
+\xfaN0k\xabQokH\xf2n\x84r\x16\xe2)\
+i\xd7V\xaa\xd4\xe9\x9b\x93\xcd\xa43\x1c` \xc0\xa1\
+HPW\xa8|\x06\x06\x0fs\xea\xe2\xe8\x8c\xeap\x19\
+d\xc7\xa5z\xd6kw>g\x83\x1b\x8d\xd9\xc6.2\
+d4%\x1b\x16\xc4>B\xb5\x02\xcf\xa2\xda\xb0}\x8d\
+\x8c\xae\xd4\xe76\xdf\xd6\x0eE\xc7\xdf\x12\x119\xb0\xd8\
+\xf7\x7f\xde\xf43_}\xe8\xe5G\x96\x97\x5c\xb7\xfd\xaa\
+7\x1e\xfd\xae\xef\xbb\xec;V\xed\xb0\x85PX\xc0\xbe\
+\x03@\xf5\x8dAV\xe4\x9d{n\x13\x1d\x0e8C\x14\
+\xf3*\xe9'@\xa2U\x1e\x0e:\xeb\x86\xe2\x94\x1c\xa1\
+l\x97\x90\x1b\xea\xa8P\xca7G\x06j\x81\x92\xa7\x84\
+\xee\xa9\xed\xc8\x01\xd69sB\x04\xb2\x8c\x02\x91\x91\x82\
+\xc3\x9c~\xad\x80N\x13\x90\x1bf2}\xa6\x15\xb2N\
+/\xc2\xe6\xd9[S\xcd\xa7y1\xc2i\xaa\xd8}\xa9\
+37\x8dzT\xe77\xb0SR\x08\x9f\x8a\x0bV\xd7\
+o\xde\xb6\x9a>\xa0\xb4?\xeb\x0f\x8e\xd1\x7fQ5\x8c\
+\x15\x07\xdd\xc8\x09\x11\x19&\xc6\x11;\xb2\xdf\x05\xe8P\
+\x97\x8d\xd3\xfe`\xef\xe7\x9b\xc2\x05\x1c/\xc7?\xf1\xcc\
+'\xb6-\xb6\xdd\xb1\xeb\xb6Ml\x8e\xeb\xe0\xc8p\xe9\
+\xffp\xf9\x0f\x0dG\x81\xc2\x22\xab\xd5j\x8aJ\x86%\
+\x8f\x9d}\xe8\xbe\xd3\x9f\xdd\xbf\xb1\xf7\x85\xbb\x9f\xbf!\
+\x03\xcb\xd0 \xc0R\x9f\xfd\xb6\xed7\xbe[\xee\x0a\xef\
+4\xb6\xddX\xb0\xc1x\xf8X\x85,\x1bDZ]K\
+\x83B\xd0vLr\x86\xe6H\xff\xa1!Go\xd3\x8f\
+H\xaefx\xae4\xe4$\xc2\xf7\xf5\x9a~\x00d\xfd\
+\x0aHtXz\xcf\x8a\xfe7\xd6\x04Is\x96\xde3\
+\xe3\x1e\xea\xf4M\xc2\xa9\x85;P]\x03\xee\x94i\xe2\
+\xa0\x00\x0a\xad\xd6\xaf\x0ey\xe8\x89_\x22B\x0eWo\
+\x5c?n\xffSC\x01\xfa\xc7\x11|\xe4\xc2\x83\xef?\
+\xf1g+n\xd51_\x1d;\xfb9\xd5\xa9\xc0\x22x\
+\xcf\x89w}\xfc\xd4\xc7\x84\x18\x83\xa8\x9d\x8b\xcdo\xbc\
+\xe4\x1f\x1eX\xec\xd7l|\xc02\xcb'\xff\xa9\x89 \
+8\x08~\xef\xe9\xdf\x7f\xeb\x17\xdf\xbe\x1a\x8a\x88\xec\x92\
+\xdd?q\xed?\xb9}\xc7mC\xfd\x9d\xb2*\x8d|\
+Ja\x19\xca\xbf|\xe0\x17\xdf{\xe2\xaeA\x16\x14\x1e\
+\xddv\xc5\xcf\xdd\xf0c\x97\x0e\x87&\xf9H%\xb2y\
+\xc3\x8e\xab\x0d\xa1\x13\xd2\x8d\xaf\xc4:=\xccaw\xba\
+\xe5\x95uN\xd1\xbb\x96\x1b\xa9\xcd\x00\xb3\xeac\x07&\
+\x83\x0a\x94\xb3\x94FJ]\xfd\xd1\xa4\xa6t\x13\xb7w\
+hC\xace-\xaa\xab71\x9d\xc4\xd4<\xd9i\x97\
+\x1b\xc4\xfb\x87W\x94\x8e\x0a\xc2!\x83\xdc\x87\xaa\x9c\x80\
+\xa1\xf0\xce9Mk+i\x074\xb0,\xa7}(\xa6\
+lN\xc6S\xb2\xbfVy\xa3\xc2.\x5c]\xb9y]\
+\x95\xcc)\xe8`\x0e\x01Y.\x86\x7f}\xff\xff\xf6\xd8\
+\x85G\xc5\x83\xab\x86e\xfb\xc9g?I\xf9D\xdd.\
+\x06\x01\xcfc\xeb{\x0f\xbf\x01\xd0Z\xd02EY\xfd\
+\x91z\xea\xf8\x99\xb3\xf7\xfe\xc6\x17\xdf\x06\x0c\xe3\x02\x7f\
+V\x9e\xfd\xd9\x07\xfe\xaf\xb7\xdc\xf2\x0b\xbb\xb1\x83JX\
+\xa7\x05\x11\xefx\xf2\x8f\xdes\xe2\x03\x90a%\x04\xe4\
+\xc1\xf3_\xfc\xd9\x07\xdf\xf4\x0b\xd7\xfe\xb4H\xa1\x0c2\
+\xb0i\x07\xdd\xb0\xf3\x1aJ\x19\xb0TU.\xfd\xd6\xc4\
+k\xf0\xc3\xf4\xb5h\x0e$*\x1eL\x00\x01\xc1\xad\xf8\
+\xad\x9aQ\x1d\xcb\xa4\xf5\xfbl\xae\xd4\x00bw\x01\x1b\
+j\xa2\x02'\xf8Nb\xc0\x1a!\xb6[\xac\xc6\xf7\xcc\
+;'\x87\xac\xe9P\xa1'\xce\x13\xb3\xb9\x83\xcc\x17P\
+&\x12\x0e|\xfb&\xb5-R\xea^\x88&\xc74\xf5\
+\x08E2)b\xfd\xcbF\xab\xda X\xc5\x94\xb0b\
+9\xb4\xfaL\xfd\x8a\x0bY\x5c\xba\xedrQ\xe4M(\
+5\xf0\x82\xf2\xc4\xf9'<{\xd2d\x124\x14&\x0c\
+\xe3W\x1e?\xf7h\xe3\xcc\x11\xdd\xaa\x93\xad\x1e\xa0\x90\
+\xcd\x22r\xd7\xc9\x0fr@\x8d\xe0\x05\x22\xa7y\xe6\xa3\
+'\xff\x86\xe8\xd8\x5c\xc5&9\x0c\x8b\xbf:\xf9a\xb1\
+\xf6\x92\x1f\x7f\xe63O\xf1d\xa9\xb6\xe1\xe3\xe7\x16\x94\
+C\xcb\xbd\xfb\x87\xdd\x8a}\x8f\x96\xee\xba0\xdbR2\
+D+\x81\xf5\xfe\xae\xa0\x0f\xa2\x85L\xdb~c'\xbd\
+w\xeb\xe8\xf3[\x12\x1b\xe3i\xc7\xd2T4\xe5\x8a\x05\
+\xaf3b\xd6\x95X*\x19\xb3L`h0E\x83\xdc\
+\x14\xc5\xb1\xc2B\x9c\x90\x85\xde\xb9\xc0.d\x1a\xd2}\
+egG\x9d\xa1\x1b\xcf3\xedoS\x8dP\xc9Zz\
+\x9d\xce\xa0\xc2\xf6[\xb5\x1e\xcb\x8e\xbb5\xb4i\x92\x03\
+\x15\xa5m\xad\xf4\xd0\xd9 \x0f6yt\xabz\xd2\xa1\
+\xbd\xfd\x1b\x877\x17\x9b\xdah\x9c$\xda\xe7P*\x88\
+\xd3\x15\xe2\xa7/*{\x80\x09/\x22\xda\xe3\x95z\xbf\
+#^H-\xddG\xd2\x8bq\x93S*KuM9\
+/\xab\x06mTl\xb4\x88\x08\x87\xb2Z\x95&\xb2Z\
+\x7fd\xb8P.\xf4:C\xfd\xe6\x96\x94\xebw]\xdd\
+zL\xe8\x05\x94\xa7\xc7\xb6\xf2\xd2\x1d[\xd5I\x0a\xd9\
+\xb2l\x05\x08(\xe0\xa8\x09\x9e\xb7\x06I=\x0d\xa6a\
+/\xe6\x9a\xa2\x80\x82n\x8f\xab|[+\x1e\x05m\x8e\
+d0Hj\x8c\xc7\x0c\xaeh\xb7\x83\x0a\x0b\x0e&\x88\
+\x06\x1d\x0cl\x80\x08%\xbf\xc9L*;r1h\x0e\
+\x17:0\xca\x17\xe8\x1a\x95\xb2\xca\xcc\x22M\xcc\xbc\xf0\
+\xae\xea|\x84\xf7\x88\xa7\x16\xdaM\x10,*?\x05@\
+p\xc5\xf6\xabVcx\x0dbj\xc5\xedH\xc2\x00Y\
+LT\x1dQ\x92\xd8t\xce\x980X6T\x86<\xad\
+V\xa3\x9d8(\x8dUP\xc8Ax\xdb\xce[\xec\xd4\
+\xc46Y\xde\xb1\xf7\xf9#l\xdd'\xc3\x08\xfb\x94\xad\
+\x97\x1d\xb8\x83\xf6\xfc\xbeq\xd7U\x87\x97\x07z-m\
+\x9a\xaeR\xca\xea9\x9b\xd7\x88w\x94\xb0\x85\xf9\x0c\xf8\
+\x08\xe9*mn\xe0\xdd`\x99\xc1\x19J\xb2\x85M\xd8\
+^\xff\x0c\xc5T\x84\xa2G\x03\xa2\x9d:=\xc7\x12\xc1\
+\xcb\xd0\xdd\x89\xde\x85\x07\x05\xb3\x1a\xd6\x81\xb7\xc91\x00\
+f\xaerP523\xcbF5]\x134\x95\x06-\
+o@\x1a\x13w\xab~v\xd4PL\xb3\x93\xe8t\xf3\
+`(u4\x0d*\x1d\x0a\xec\x03yt\xdb\x0d\x13\xea\
+_\xef\x09j\xf7\x972\xdc\xb6\xeb\x8eqaTQ1\
+4cz]\xef\x1e\xfa\xfb(,|\xf1\xee\x17\xa3G\
+G-\x06\x9c6@T\xca\xc2x\xa7E\xf0\xb2\xbd/\
+\xfe\xfaC_=\x94\xc9\xc3p\x83\xc3?\xb9\xfa{\xf7\
+aw\x91\x22(\x13\x18U\xf7\x83\xc2\xe1\xb5\x97\xbc\xfa\
+\xce=\xb7L\x19\xbb\xf0\xe0b\xef\x8f_\xfd\x83\x85+\
+v\x91\xae:\x9c\x03\xaf\xdd<:\xb0c\xee\xb9\xa3\x8f\
+1\xb1\xb1\xfb\x16\x94J\x9dr\xe3q\xa2\xddi&\xed\
+\x93e\xb7\xc7j-\x0f\x06\xafc\xf5\x1c\xb6_\x02~\
+\xb75\xae~Zs\xdc\xfc\xeet0m\xdf\xbc\x04N\
+\x0by\xca\xe3\xd9\xb9\x14sr\x1a\xcc\x14{\x18a\x1c\
+\xff\x096\xef\xe8FP\x96G\x17x\x83)\xd7O\xbf\
+\xb0\xa9\xdb\xa8gq\x85\x1c\xdc9b)\xa90\xddy\
+\xf8\xee\xc3?\xf2\xf2\xfd_\xdbB\x89Z\xa8m!a\
+)\xd8\xfa\xf4\xa9\xbf\xd9\x92\xf3#+y!\xf8\xf0\xc9\
+{\xdew\xe2=*q\xc4k\x0e\x7f\xd3M\xbbn\x1d\
+O\xd4A\x16\x07\x16\xfb\xaf\xdav\xb4`\x15t\x97\x19\
+\xb5\xfe\x9a\xb0\xf2\xb0\xc0\xbd\xa7\xef\xfd\xf8\xb3\x9f\xd85\
+\xecx\xc9\xde\x17\x1fY\x1e.S\x8c] 2`1\
+\xdda\x9dGX\xf2\xaf\x9f\xf9\xc4}\xa7\xef\xbfd\xe3\
+\xc0W\xec}\xe9N\xd9\xce\xd0\xa61\xf2C?u\xe6\
+\xfe\x1f\xb8\xef\x7f\x19\xeaa\xe2\xbb\xa5\xb9N\x8e!\x17\
+5IY\xca2\xd3\x189\xbe\xd9\xec:\xbaaF\x03\
+<n\x9b\xa7\x87\xde\xd7\xf32\xe3\x8f\x99\x99\xb6\x84\x99\
+}\x0e\x0b\xab\xc7V\xd8\xd5i\xf2\x1a\x1a\x9f\x0bS\x8f\
+P4j\xd7s4hk\x00\x95\x8dN\xd0A'\xb3\
+i\xde\xbc\xda\xac\x01+\xaf\x5c\xa5\x5c\xb4Z\x0d\x95\x8b\
+\xa39\x05\xeb\x0a7k\xa0\x08\xaf\xd8u\xdd\xc4P3\
+\xa6J\xed\x0a\xc3\x82\x1b\xcf\xdd\xfd\xe2*nH\x08\x1f\
+:\xf3y\x97\xff_\xb9\xe3\xca\xdbw?_e\xf2,\
+,\x96=\x1f\xe4\x1e\xd1Z\x98'\xc6\x0d\x0b\x9f\xb3\xf9\
+\x9c\x9bv<g\xacV\x16\x19\x1b/\xcb\x199\xfd\xbb\
+\x8f\xff\xd1'N\xdf\xbb\x7f\xb1\xe7U\x87\xbe\xeaE\xbb\
+\xee(c,\xbc\xc2\x9d;n\xbfs\xe7s1=\x8b\
+~1\x1dA\x13\xcau;\xae\x188(1H\x03\xb7\
+)\x1b\xc5Y\x8a1\x03t\x0e\xf5\xc2\x0c5_9\xf0\
+4\xd9e\xba\x9d\xd4H\xf95C&;\xaf\x8c\xca\x94\
+\xea]\x07\xe7\xe6\xb9YbfNR\x97~\x96\xb4\xf6\
+\xaa>\xad\xd6fg0\xb2{\xd1D6=L{M\
+\xaa\xebXM\xbc\xfc\xde\xcb\xc9\xa9\xbb\xaf;JP\xe0\
+\x9b\x14lK\x01*\xa6J\x10\xae\xe0\xa65\x13\x89\x8c\
+Ik\x0b$\xd3`\x0f\x1c.\xdb8\xda\x12Um\x5c\
+\xc8\xd6\xf6\xa5\xbcz\xd9\x986\xce/\x81m\x0d+#\
+'\x0d\x9e\xb7y>\xa6\x04m\x9eN\xf9\x0f\x91\x0ak\
+\x92\xa7\xca\x99\x1f\xbd\xff\xa7\x1e;\xffD\x11\x0a\xe4\xaf\
+\x8e\x7f\xe4\x8dW\xbd\xfe\xd5\xfb^\x01qlz\xaa\x7f\
+\xaa]\x86\x22\x90\x9d\x8b\x1d\x97n;\xf8\xc8\x85\xa7\x90\
+I\x08\xb9&\x0b;\xf30\x99\xd3 F&F\xb4\xc4\
+j\xe5\x896\xd9u\x00\x9c>\xafIE\x83\xad\x9b\x5c\
+P\x00J\xa4QfjN\xb6I\xc4\xb4|\x17\x91a\
+\x9cK\x03\xc0\x00?5\x0fz\xc5_\x83\xccF\x8d\xb4\
+d\xa6\x16\xc41o1\x83\xf5O\xd6\x8eV\xa4h\xe4\
+I_\x14b8\xee\xea\xe8\x11%\x1fk\x8fjj*\
+\x9f\x88o\xc8\xd1\xaa\xef\x22\x90#\xdb\xae\xd8\x8e\xed\x13\
+\xb4\x02\xeb\x14=\xd6\x9b*\xe25\xc1\x91P\x8es5\
+\xb1\xabXB\x11rb\xf2p\xcc(V\x94U\xc3\xba\
+j\x16[\xf5T0\xb1}\xaa\xdcma\xfbK\xcb\x16\
+\x06\xfe\xc1\x93\xef|\xe4\xdc\xe3\xd3\x96_XP~\xf5\
+\xc1\xb7\x9f\xc1Y\x18\xd4\xa4c3T\xe8\x18\xa7T\xb8\
+\x94\xb2u\xfd\x8e\xab\xc490\x856\x0d&j@N\
+/\x8b6\xbf\xa3\xcc8-\xb4W\x11\x7fF{\xe3!\
+L\xaa\xbe;S\x97sg%lDd\x9d\x9c\x8e\x91\
+\xa2\x9a\xe6\xc2\xe0u\xfb\x0cY:\x94\xa0\x1d3\xc2\xb5\
+,v>\x1e\x9c\x16\xb4\xa7\xb71'\x1f\x09BG\x0c\
+\xe0iW\x91|5\xeeU\x9an\xd7\x01S\xa7\x93k\
+\xc8X\xac^\xf3c\xb8~t\xc7u\x85+\x85\xc9\xd4\
+lub\xbf\xe9\xca{Q\xc8\x13\x9c\xe4b\xad\xbc\x8e\
+\xc7\x08\x8d=,(v\x93\xa35\x13u\xfer\x15\x7f\
+\x9e\x96\xdd\xfd\xa7?\xef\x9a\xd4\xcf\xf3\xc2\xc3g\x1e\xb5\
+\xce\xf5\xf5\x9c\xa9\xf0\xbf\xd6]\xa6\xc8J\xcau\x9bG\
+\x11Te\xec\xd0f\x9eD\xbe\x88\x02\x99w\x99\x14\xce\
+\xa8\x14\xa6\x89\x1c\xfa+s\xbc/\xdasP$\x98\x91\
+\xd1\x94\xb1\x1c\xa9\x86kT*j!l\xadX\xa3+\
+w \x84:\xa9\xc3\xb8\xaa\xed\xa5O\xae\x85+\x987\
+aL\xf5\xeb\x5c\xe8\xd8\xcb\xa8h\x01v-RO\x1b\
+\x11\x98\x82\xb5%E\x03\xc2\xcb\xb7]]\xb4m1\x8b\
+\xa8\xd9\xa3\xe4MT\xc9i\x90\xcd\xc5&&\xd6\xd0\xf4\
+\x16\xf7,\xf7L \x95\xafU\x14]2A$U\x82\
+\x06\x87\xa6{\x89\xdc\xbf\xb1\xbf\x89Ps,\x03\x90\xbb\
+7v7\x86\x05\x9bVE\x9f'm\xf9t\xdf\xe5\xeb\
+\xb6])3.P\xf9\x7f\x08\x05\xfah\x8c27\xe3\
+\x99E<\x0e\xa6a\xef\xdfC\xce2\xce\x18:\x0e\xf7\
+qf\x8fn\xc3\x9b*8\x22V*~\xa0v\xe6%\
+bt\xcf\xe4`\x0a7\xe7I\xa7\xd6\x1e\x8e\xf3mG\
+s\xe3%\xb9\xc2^8\x90\x19p\x08*\x935o\xe6\
+\xa9y[>\xb1\xa3\x5c\xb9q\xb4k\xfb\x902\x8c\x95\
+\xe0\xa6\x011]\x1b\xaa\x82G\xcaK\xf6~\xc5\xe1\xe5\
+\x11\xb2\x14\x16\x96\xd5\x0d\x9b\xd7\xdf\xb2\xf3\xb6\xc6\xb3l\
+\xb85|\xf7Dj!\xdd\xdb/{+f\xad,\x12\
+\xfc\xfa\x83_\xd9k\xac\x02`x\xe9\xfe;\x8f,\x0f\
+qh\xc8\xe8T\x9d(\xfdj2\x05l\x9c\x82.\x11\
+^\xbd\xf3J\x96\x92\xa3\x9c\x09]\xdc\xd4\x0e\xc9\xc0?\
+dVV@\xd8\x8e\xa3\xdd\x80\x87\xe3\x14\xab\x9d\x81\x98\
+\xcc|\xab\xe5\x1c$\xef\xc8\xc1~\xd7\xadO\xb7\xb9y\
+H2A/0a,5f\x08\x19\x0c\xe0hgS\
+\xe07\xc7;3?\xc8\xac\xf42\xa7\x01?\x07~\xd1\
+\xbab\xc7\x03\xa75\xc5\xc7\xdek\xcaO_\xfb\xe6K\
+\xb7_\x89\xc9\x13\x9a\xd4ZnMf\x88J\xf2\x0dh\
+\xbdZ\xcf\x5c8A)\xa0\x1c\xd8\xd8\xaf\xf8\xda\xcde\
+\x97\x9dc\x9ct\xcd[+\x1aP\xe13\xd4\xbdl\x03\
+\xe5Cg>\xfa+\x0f\xbc\xf5\xb1\xf3\x8f/\xb0\xfc\xaa\
+C/\xff\x81+\xbes\x13\xdb\x89\xe2\xb8\xa5\x83\xe5\xcb\
+\xa2Ej\x13\x10\xc3W\xff\xf5\x1b\xb7\x1a\xadu\xbd\x5c\
+d\xfcJ\xcc\x9d\x91\xc1\xa9)\xcf\x92iq\x00t\xd2\
+\xd0I\xfc\x9di\x7f\x22\xfc@Nj\xb5%2u'\
+KZ&\x0e\x95w\x95\x22\x11\xd1\x88\xe0h\x2222\
+9\x0d1\x8a\xc7NQ\xb7k6N\x9f\xd2\xcf\x1e\xab\
+|\xa8\xa44\xe0u\xf53\x9f\x84\x09\x14\xa3\xea%\xa8\
+lP\x18\x09\x04\xb8\xd3\x9b\x22Xpq\xe9\xf6+\x00\
+EiAt\xdb\x22\xbc\x1a\x00\x01\xa2`\xdfb\x1f\xa6\
+\xa7)\xd0\xb6\x85\x08\xe6\x8b\x08E\x80D\xc0\xbf\x18n\
+\xd4\x04\x5c\x80\x83\xbcx\xf7\x1d/\xbd\xfd\x05'W'\
+v-v.\xcbr\x18\x97\x9d\x96\x88\x8b=\x82\xd5|\
+\xb4\xb6\xd4q1,\x8f\xee8r\xec\xdc\xa3\xa3l\x06\
+\x82\xfb\x22\xe7\xa6\xb5\x01\xfb}I3\xeeb\xd0}J\
+\x8e\x16)F\x11\xa6\xf1\x95\xa1{y\xdbH5\xdbg\
+G\xad\xb3\x9d\xd73lb\xd3}\xa9\xfaE\xa6\xea~\
+'\xa0\xd9cM:\xab\xa5\xffg\xe8\x8c\x0c\x01Yo\
+(\xa3\x22\xb7\xbb\x94\x05\x86\xd3C\x09}=*\xaa\xa3\
+M\x12\xb5\xe1\xb8\xef`\xea\xac\xdd<R\xa5\x00\x00 \
+\x00IDAT\xf5\xa6\x9aF\xd8\x1e5M\x99\xb6\x12\
+\xc9\xbct\xc7\x95\xcba[gw4\xb2\x03\x85`\x11\
+\x16\x95\xb3R\xf7\xa7i\xd5\x14\xc5\x82Q\x09\x9c\x92\x94\
+\x13\xd5\xa7\x12\xcb\xec\xddU`DQ\xed;\xc1t\xed\
+\xb2*{\xb0g(\x03\x85+\xf4\xa2\xb5m\x84\xea\xd1\
+\x94ac\x91\x80\x94\xb2u\xe3\x8e\xabta\x96\x11\xd8\
+\xf6\xc8\x9ef\xd30\xe1\x93H[_4Q*:@\
+\xe6\xc1\x0c:\xd0\x05b\xd8V\x8d\xfc\xc3\xfa\xd6U\xe8\
+\xd9~\x06\xb6\xc9+\xb6\x91Q\xff\xa6y\x8b$\x07\xc6\
+d\xa8\xfd\x9a#\x03\xaa*\x02\x85I\xe3\xcb\xbc@\x16\
+5\x02\x96\x14\x1ab\x80\x18\xdc\xc0bG\x5c\xc4!z\
+\xe9\xbf\xd3\xb0\x10\xbb\xf6\x1cA\x8c\x22\x82k7o,\
+eU?\xb3\x98X\xb0\x1f;-\xdcU\xee\xd2ha\
+v\xdf\x1eZ\x8b\xf1\x04\xecW\xcbf\xfaV!\xd39\
+J%\xe5\xdeXl\xdd@w\xe4\x0aN\xa9\xb9\xc6B\
+\x5cC\xa6e\xb5\xa9t\x82\x9cr\x00B\xae\xda\xbc\xbc\
+y\xd9\x14\xe6@\x0du\x03\xa4~+\x14\xdf\xce\xdf\xe0\
+\xaa4\xaf\x13\xdfH\xc9\xac\xbf\xc5\xb40\x19\xcbjt\
+\xd7t\xa3K\xdb;D\x08\x97\x08\xeal\xb7\x1f\x0e\xa5\
+Q\x22\xeb\xd7\x96J\xa7\xb9\x9fb\xba^i\x12\x1c*\
+9\x18\x9b\xbfi\xcf\xca(h\xe5\x15\x0e\xbb'B\xb0\
+\x0e\xb0a\xc1\x18\x22\xf5\x10\xc8\x16B`u\xfc\xa6*\
+S?\xe7\x12\xc1E\x86\xae\xbe1F\xbar\xe3\x9aI\
+\xa9\xa1\xc7\x81t\x1c\xaa\xea\xa2W\xd3\xfc\xa9%\xc8\xf4\
+=j\x01\xc3\x9a\xcc\xd5\x01\x87\xd3\x0fP\x98C\xed\xbf\
+\x00Z\xa7]+w\xb7\x80\x91\xfd\xddCo\xb1:\x18\
+\xa0\x0e!\x14\xd5\x8f0\xc5\x1c^\xbfye\x93c\x07\
+R\x1b\x1c\xc7$\x83\x95\xabQZ\xc0\x22\xd6\xbd53\
+\xa7\xa6$ \xa5\xd5\x8e\xa8V\x91\x0a\x86\xf7lk\xef\
+\x841\xd4B\xa3\xd8\x00;\x8a*\xd6\x81\x81\x18\x9e\x05\
+\x06f\xe9\xb5i\x12\x89\x07\x0b\xd7uq\xb1{A\xb0\
+O\xd3\x04\xa5\xc2|\x06\xa6:\x89\xc0$\x1c\x22\x1c\x0e\
+\xc4\x14\xc6\x00\x130\xc0C\x1c\xe3\x91+\x97m\xbf\x0a\
+\xa6\xeen\xb6X%&C\xf8\x15/\xf68iM\xbd\
+T\xf8\x01\xd9~_\xb1r5O\x8f\xad\xf8\x06sV\
+5\xd0\x13\x09~\xd4\xb6v=\x9c\xea\xbcQ\xd2,j\
+\xfcH\xe1\xd1\x1d\x87\x0b\x8b5\x95\xb5{6|\x17\xd8\
+x\xeb\xc5\xca\x9c\xfb\xeaJ\x8a\xeee\x85\x1e\x0b\x22N\
+\xa7\x9b\xae+\xd2\xaaR0K\x82}Vg!J\xb8\
+\xc4\xaa\x0f}\xdf\xbe\x97Z\x11\x9cJ|\x1b\xb0(\xa3\
+\xa1Yjaw\xc4\xca\xa0K\x94\x0d\x87\x82\xcdc\xcb\
+*2\xc2\xe4\xcc\xe8\xd1\xfe\xc8\x0e\x02\xac\xe1\xafn\xc9\
+D\xf3\x11\xb2\x9c\xa5N\x9ePi|\xfb\x99.\x1b7\
+\x08K\xb9|\xfbUR:;V\xbcwMe7\xd4\
+g`W\xa2\xa2\x16nR\xb2\xd4\xa3\x04O-\x89\x80\
+\xe8\x9c\xd1\x82^\xa7n\xf2\xbaM+NG\xce\x10!\
+\x07\x8e2\x8f\x03E\x86\xca\x1a\xd1FA\xd3\xceV\xdc\
+3\xf6\x0d\x09\xcaw\x0f\x02\xe1\x91\x1d\x07\x172\x10\xda\
+\xd1\xca\x08\x0cKe\x92\x184\x82\xb0\xaaXH]\x9a\
+\x93\xfa+\x94\x8b\xead\xcfX\xe7\x9bn\xd7\x9b\x86j\
+\x10e\xc3\xe9tp\x18P\x10\xe7E\x96\xafDk\xc8\
+\xd7\xb0\x85\xc6\x05\xea\x90\xa1\x0e1T\xeb\x0dH\xd5&\
+1\xcdR\x15\x8c\xf4\x9e\x10W\x15eki\xefo\xc0\
+\xb4(#\x22\xb8-\xb4\xc1\xd0\xe0\xc7\xfe)\xb4-p\
+TX\xa5\xe9\xe3S\xd8\xa5dE\x85\x16P,\x04\xfb\
+\x97\x87R\x19\x1a\x95\xe0\xd8\x00F\xb9\xbc\x88u \x17\
+\xe0\xd9\xd5\x89\x8f\x9e\xf8\xc83\xabSN\xbd\xae\xa7W\
+\x06Ai\x1b\xc1\x88fN,\xe8\xc9#@\x04\xc4%\
+\xdb\x0f\xbct\xef\x0b\xb6-\x96\xd0\x87\x8f\x89\xd3\xd8X\
+opO\x09\xdd\xac=\xbd\x9fM,7\x17\xdbN\x97\
+\xf3\xae\xc4\x19Dla\x5c\xe0&\x96]\x82\xcdC\xd0\
+\x93c*\x86t\xb0\xa8\xd5\x91\xa4\x1e\x02\xe8\xed\xac]\
+\x93\x84b\xd4u\x02L\x90\xf9\xa3y\xfb\xf4?\x1e\xaa\
+\xb2\xe3\x90-\xdbd\x9b\xfa\xa7\xa1@\x93\xf6\xd4\x93\x95\
+\x8b\xcai\xe1tb\xac\x04a\x07\xa9\xa8\xa8p\xb4T\
+T\xdd\xe3n\xb2\xa2\xa6\xf1\x07\x9b\x86\xe9{h\x11\xb9\
+\xd2\xd85\x1d\xbaP\x95\x12\x0cn\xd6\xb7\xedk<a\
+d\x13\xbb\xb7\x0d\x1b\xab\xb2\xd5c\x18h\x01\xa3jf\
+\xe3\xc1\x11v\xb6_u\xaf\x18\xc8{N~\xe0W\x1e\
+\xfc\xe5\xf3\xb2\xd5\x88\xbd\x22\x9a\xf0\xa8D\x168\xe3\xb2\
+\x88\xc4\x84d\xcf\xb0\xf3\x9f\xdd\xf0\x86\xdbw\xdej\xc9\
+\xc1\x14/F`\x9b\xc9\x15\xe05\xeaYL\x85\x02\x0c\
+;\xb0\xed\xb4\x9c\x9fc*P\x9725m5\x06\xbf\
+T\xb8\x1a\x9d\x86\x14\x03\x10\x9e7\xe3\xc0\xaaR\x13A\
+)\x8a\x8a\x8d\xc8^:\xb6~b\x1abd,(\x19\
+\x9a\xeb\xc4\x05\x92\xae\xe4M\xd0\xeb\xe7\xb4\xbc\x063Q\
+?\xfa\xb1\x02\x98\xd6,\xd1l\x9e\xa6\xf9\xc7\xac\xdb\x08\
+FD\x88\xd0\xd2\xbf\x8e}\xd7\xfb\xbb4q\x04\xbev\
+\x0c\x89elQ^\xeef\xd7\xe1bZ\x22]\xbb|\
+\x5c`]o\x0c\xed\x91\x08S\xb2U\xdd\xdb\xa0\x88|\
+\xfc\xd4\xc7\xde\xfc\xe0\x9b\xcf\xcb\x05\xfd\xe9\xda\x9f\x8e\x92\
+5;\xc5\xf2P\x07W\xa6X\xfe\xe4\xea\xf4\xcf\xdc\xf7\
+\xa6\xfb\xce\x1c\x8b\xf5\xdb\xc6\xd8\x00d\x22\xd2M\x11\x11\
+\xedS+8\xd0\xde\x7f\xf2v\xe7\x14\xf0\x19\x8c\xf4\xa6\
+HOz\x91\xaf)\xc8#p\xc6 \xd0\xa2\xcbm\x94\
+\x9bB\x9a[\xff0\x8c\xba&\xb8\xa9\xe5\xe5\xa0\xaed\
+\x94\xe9\x02\xf9\x87A\xd7y0\x0d\x19\xec\x8d\xa2P\xe2\
+H\x8aK\x80\xfa\x7fmH}\xa9D\xab\x1b\xc3\xeeQ\
+-F\xa9\xc2G=\xb8\x80jr\x86h\x15\xf3\xe8B\
+\xe9\x9a\xe3\x1acY\xa9\xa8\xf8\x9e\x19]h\x10\xd5D\
+6=\xe3\x85Q\xda\xb6\x81\x85b cM*/\x1a\
+\xca\xf1\xb6\x1e<\xcbS\xbf\xfc\xe0\x9b\x83\xdb\x86\xef\x08\
+\xb1[\x87\x9dX\x89LYm\xa3\x87\x5c\xe0\xea\xe7\x8f\
+\xfd\xd2\xf9\x09\xad\x22h<f\x14vZ\x17\x9b&h\
+Co|(\xc2\xb3\xe5BD\x1d\xab\xd1\x8c\x9b\xf1T\
+Mv\x8a\xfccx\xb9u2\xa9\xe1\x87m\x0f\x80\x02\
+\x1c\xd9\xa23\xf6\xe3\x11>\xdcW\xcd}N\xb1\x8d9\
+y\x0d\xc9>\x17\x87T\xac\xf9\x9a\x88Sb\xeb%<\
+\xd8\xdbw%\x9e\x1eqZc\x11x\x0dG-A\xa2\
+\xbbNU\xb7\xbfFW\xbat\xb8\x87\xa3\xa0k\x8eP\
+Y\x98n\xb45\x9ci\x88\xee\xeb\xed*U\x8d\xb6M\
+\xc8\xd9\xd5\xe9s\xe5\xf4D\xf5\xc1\x04\xa0v7\x13\xe5\
+\x0904ytz,h!\xf2\xef\x1e~\xeb\xc9\xd5\
+ieue\x05z-TjD\xc7u=X\xa1\x89\
+\xe2\x16\x1a\xf0\xf8\xf9\xa7\x7f\xfb\x8b\xbf\xa3\xcc\x84I\xd0\
+\x84'\x95\xad\x84.\x92\xde\xac=\x1aY\x9a\xa7\xb7\xce\
+\x9c.g\x83\xd9.\x14\xd5\xb3-\x09\xb8n\xa7\x84\x88\
+\xa8\xb0\x10\xe8\xb6\x04D\xc2o\x7f\xe7\x08f0\xceL\
+\x18^\x07\xa4\x0fL\x8bUf\x5c\xb4i${\x93\xdd\
+h\xba\xe1\xa1\x97\x12\x8c\xa2\xa3*\xf2\xb23\xf4uu\
+\xc1\xd6\x18[=F\x15\x8du\x1b\x7f\xa0\xeb*\xc9\x89\
+D,\xb4W\xeb\xc8\x84.\xaaTEitT)\xa1\
+\x16\xdbn]\x17\x04\xab\x9aC\x0d\xd2\x07\xb9\xff\xf4\xbd\
+\x1c\xe8\x09:\xa2\xe8\xea\xd5\x08fd?L\xd1]W\
+\xb0\xe0gN\x7f\xea/\x9e\xfa+W\xcaD\xffPz\
+\x96a\xabg\xea\x81\xd7\x92\xc2\xaa`\xd9FC\x84\xbf\
+\xff\xd8\xbb\x8f\x9d\xff\xfcPA\xf0\xac\x0cX\x0d;L\
+\xd8c\xc2\x9b{O\x1d\xe30\xd0jOiV\xb9\xca\
+r\xaa\x1d\xb6:\x0f\xa8\xe1p\x15r\xb7\xc2\xabX\xc1\
+Y\xad\x13\xa1!a[\x97mQ\xa2\xaf\xf5\xeb7:\
+\xf5\x1bQ\x8d\x8f%\xb97 \xb8\xcf\x0f\xa5\x5c\xd2/\
+\xc2N\x850aA\x84\x9c\xaa%\xad\xd7\xb3C8A\
+\x95\xfa\xb5\xb9`\x22,\xca\xb4! \x08O\x22\xe7\x82\
+J\x80\xc6L\x18\xe6\xad\x18\x82>\x96>\xa4\x00\x88|\
+\xf8\xd4_\xc2\x16\xec\xeb\xde_\x9d`&w\xb0\x82P\
+J\x00e%\xab\xb7|\xe1Wg\x0d\xe8\x0d\xa9(\x86\
+\x1d\xad\x07\xc9\x08\xf4TRDo\xdd\xaf\xd1\x8b\xfc\xeb\
+c\xffV\xd1\x0b\xc4\xe3B\x18+\xbe\x06\x9c\xaa\xcf5\
+\x0a\xa8\xf0\x9e\x13\x9f\xd2\xcb\xc7\x196$|8\xdd}\
+\xe8\x00\x0f\x0f8\x06^@\xf4\x11\xf3\xe5^{y\x18\
+\xde\x91\x99>Z\xb4\xdf)\xcc\x86\xac\x12N\xf6\xde\xf9\
+k\xa9\x1c\xc0KO\xd02H]!k\x8d\xe1WO\
+\xc6\xa9\xd9\x0c0\x9ac\x89\xc1\xa4\xedA5G\x9c$\
+b\xac4\xaa\xb8\x9ayjM\xa2\x9c\x1b\xa8\xf2L\xd1\
+!\x08)\x82\xbb\x8f\xbf\xf7\x14\x9e\xa1\xde/\xa5\xd4\xaa\
+\x14\x0c\xdeZ\x9dR!\xd5+`(\xefx\xf4?>\
+z\xfe\xf1@\xc4r~\x07\xf0\x8c\x8fd/\xc0\x5c\x07\
+\x04\x15\x0f\xed\xbe\xb3\x0f\xfc\xd1\x93\xef-F\xbf\xbb-\
+\xdd^-4\xfd\x00}vr5\xac\xfe\xe4\x89{f\
+u,\x93\xc7\xb0\xabl\x82\xe8T\x8d\xc0T0\x993\
+\xab\xbd\x8c\x8ec\xd1w=\x03\xc6\xda%\x8dhH,\
+\xd4K\xd6\x8c\x16\x89\x15\x0c^\x10\x83\x11\xben\xee\x0d\
+\xa2\x99li\x9f\x92%\xb08p\x80\xa0\x1b\x15\x86\x8e\
+\x023(\x88\xad>\xce\x85\xc03\x96@-=\xde\xde\
+\xb5kY&\x1d4hNk}\xe8\x9f\xe7\x85w<\
+\xf6\xb6\x81\x8d\x88\xde\x04\x17\xa0\x00\x93)\x80\xee\xbb)\
+\x05\x94\xcf\x9f\xfd\xdc;\x9fx\xa7\x8br\xe8D\xe7\xc5\
+j\xcd2\xb4m8\x12\x14\x93z\xa9R\x17Z\xfc\xd6\
+C\xbf{ru\xd2\x10\x8a\xa0\xd5\xc8\x04.\xa8\x992\
+\xfcB\xe1\xef}\xf1\xbd\xc7\xb7NyE\xfdt&E\
+\xcd\xfeiU\x978\xdc\x8c\xc9\x7f\xa6\xec\xe9FC}\
+=\xa5\xe3\xcd\xc0\xb43\x00\x95\x9f'L\xbaY4\x18\
+9@\x9b\x87j\xc1\x08\x84Na\x9d\x8c;\x8fsO\
+\xd6Od\xaf\x04\x99\x1f\x18\xe6\x9f\x07p\x1a\xca\x88k\
+F2\xc8L\xb1\xdd\x10\xce\xe19\xa4E\xa4\xbc\xef\xa9\
+?\xfd\xd8\x99\x0f\x01\x9ae\xda\xe7<\xfa\xe18\xa2\x07\
+\x84\x88\x0c\xa5\xc8\xf9_\xf9\xfc\xbf\xe9\x0e\x11~\xd6r\
+]c\x87\xe1k\xa9\x94\x0d\xd9\xec18l9]\xce\
+\xfd\xe2\x83o\x93\x05\x91\xb4\xea\xb2%\x00\x84\xd6\x0c&\
+\x80\x87\xb6\x1e\xff\x8d/\xbe\x93\x8d(\x12\x0dF\xc5\x18\
+\x91\xd0e\xab\xaaZ\xe3\xe8\x06\x88\xda!\x12\x1c,\xa2\
+\xe9K\xafzv\xafpxh\x18\xc1\x5cT\xc0\x9cl\
+\x11*o\xa2A+Xn\xd2b\xb1\xdca0\x9b\xa6\
+M1\xe3\x17\x0b\xb8 \x11\xce\xb14\x8b\xf81\x1b\x8d\
+#k)^\xa3S\x8d\xd9\x06b\x8dH\x88\xc2\xdd\xdb\
+\xa8N>=!\x1a\xd4u\xc4\x8f\x9d\xfc\xf0\x9d{_\
+\xb8{\xb1\xcfK\xc9CQz\xd1\xdbM\x16\x90\xb7<\
+\xf8\xab\x1f;\xf5)\x132\xc2\x91X$\x19\x18;\xed\
+\x88D\x05-\x1f4\x85\xb5}\xe1\xdc\xa3\xfb\x97\xbbo\
+\xdcy\x0d\xa4\xfb\xb4B{\xb3\xa2\xdd\xf9\xd8O\x83\xe3\
+[\xcf\xfc\xe8g\xdetr\xebL\x97\x08A\xec:\xf2\
+\xe59d\xde^\x8d\xff\x06\xb7t\xd7\xb8\xa7\xa7-2\
+\xee\xaf0\xed\x04\xb9QR\xdc\x17\x18\x8d\x0f\x1d\x9a\x06\
+\x89N\x08\x90\xc5\xc6\xc6.\x8bvB\xad\xc6n\xff\x80\
+\x80:uS\xf6\xfa\xf3\xcc6\xb2u\xef\x11\xde5U\
+\xe3\xb0\x00`\xad\xad\x15~\xe6\xcd\x0a\xa1\xb5^a\xbe\
+\x22\xc4\xd0{\xact\xb9@\xa2\x17\xfd\x16\xb6>x\xfc\
+/o\xd8}\xe3\xe1\x8dKk\x1f\x09P-a\x94?\
+$\x07\x14\x80\xbf\xf9\xd0[\xde{\xfc/5\xac\xd6\xe0\
+V\xe3\xa1\x86\xf9t\xd0\x16\xf9\x9d[<\xacl\xb0\x96\
+\x9f\x1b_\xe5GN~\xf2\xf2\x1d\x07\xaf\xdbu\x95\xb0\
+\x0cm\xa1\xa2\x1bF4\xb7\xfa\x81x\xb8<\xfe\xcf>\
+\xf3\xa6\x87\xcf\x1d\xa7d\xeb\x106q\x89n'p\xc2\
+\x80z\xbad'\xb9}X\xa4\xd9\xa3\xde\xb6g\xd2\xbe\
+\xce\xf9\xd5?\xd0kI\xa6\x9e&\xb6\x22\x96\xe24P\
+\x09\xfct\x02\xd0\xc6@\x08\xfb\x164w\x87\x89=\xa5\
+\x973G\x1e\xe0\x04\xca\xed\x5cX\xd4M`\x93\x982\
+O\x18!^O\x1aT\xbe\xb8\xe9\x11\xad\x89\xd5\xe3\x97\
+/pu\xf7\xf1\xf7\x9d\xe6\xc9\x9bv\xdf:`\x01W\
+\xf2\xaeR\x11O\x95\xa7\xdft\xec\x17>\xf8\xec\x87!\
+X\xb3\xd3\xa5\xac,\x06\xa3\xe9|3\xa3\xb2\xffFf\
+;*\x10\x91\xbb\x9f\xfe\xdb3\xe5\xf4\x1d\xbbo\x86\x0c\
+\xad\xb6gM\xdb(\xe0\xef?\xfe\x97?\xf3w\xbf\xfe\
+\xf4\xd6\xa9\xfc\x04\xe5z}\xb5n\xbe\xaa\x9c\x8cl\xa5\
+\x1e\x89D\xb3)\xffQ\xf2\x89\x89\x8b\x8d\xdd\x9c\x8b\xeb\
+\x97\xf0\x1fR\xbbV\xfd\xed\xcd\xcdK,\xff\x11\x9e\xcf\
+\xa6\x89J\xc8\xb0\xc8V]\x1d\x93\xa0N\xe1\xd1\xf1\xd4\
+d\x01!\x19\x03\xce|$37\xc8>g\xd8\xca\xc4\
+\x98\xb7h\xed\x97\xa4Gb\xb4\xbc\x8c\x9bw\x96;\x82\
+=\x8b\xdd\xaf\xbc\xe4\xef}\xd9\x81\xaf<\xb2q\xa4\xac\
+\xb6(\x1cD\x86\xc5\xe2\x89\xd5\xc3\xef~\xe2\xdd\x7f\xf6\
+\xd8\x9f\x9c\x93-\x05Z\x18\x9a\x897\x00w.\xe1\x99\
+b\x92\x16~RQ\xbb\xce\xc4<#X\xc1Y<\xb2\
+\xed\xe0\xeb\xae|\xd5\xd7\x1cz\xd16n\x94\xb2\x02\x84\
+\xe0\xc60<S\xce\xfc\xc5\x13\x1fy\xc7#\xefy\xf0\
+\xdc\x93J\xa7W=3\xd2\xfet]\xcd%U?\x07\
+\xdbYZS\xac`\x90+\x09\xe4\xdd\xfc\xaahXw\
+\xee\x1e`\xadb\x8c\xd1\xb5\xf8\x9e^\xb7yL\xf7c\
+\x1c\x0d(\xf3\x8d\xe5\xd3u6w\x1c\x1aS\xbd\x91t\
+\xd74\x03+\x05\x99\xb3\xad\xc6j\x16\xc1%bd\xeb\
+@\x90\xc0gr\x11\x1brq9\xd3\xc3\x8fV\xfa\xa5\
+uH\xf2\xe3F\x9a\x06\xd3\xca\xa6\x04$\x18[\xc6i\
+\x07\xdd\x0eT\x9b\xd0\x0b\xe5\xf2\xed\x97]\xb5y\xcd\xae\
+\xc5\xae\xf3<\xfb\xc0\xa9\xfb\x1f:\xff0\x86\xa1(\x96\
+\xa1f\x8f0=\xf9\xe8\xf3Z}\xc0\xe5\x93\xe6K\xd9\
+\xdd\xec\x1e\x02\xe1\x86l\xbbu\xcf\xd5Wl\xbbd\xdb\
+\xb0\xed\x99\xadS\x0f\x9c}\xf4sg\x1eb3{\xa6\
+\xdfJy\x91\xeb\xd3U\xf8\xe9\x18\x8d\x9c\xd9\xcf\xe2\xb5\
+\xeco\x1a\xe0\x82\xbd\xdd\x22I\xf0\xe6\x17\xa7[\x91\xf6\
+\xbb\x00\xc4v\xe115\xa2\xc7\xf6\xcdC\x8a\xb1\xa3\xf7\
+Y\xb5i\xd1\x87\x8c\xd9\xcbS\x0c\xd5\xec\xc3\xdc\x06\x8d\
+x\x11\xa49\x12\xe8\x15G\xadR\xaa\x89\xcetKB\
+o\x8b\xc2\xa0K\xbb\x84\xb7>!\x937?\xab\xfa\x0b\
+\xb3\xbb\xb4\xa7\x86\xd7\x80q\xf6\x80\xcc\xe2\x8dl\xeah\
+>\xfa\x1c\xd3\x85&\xdb3\x82\x07\xe1Y\xc0\x5c,\xe4\
+\xa2s\x1f\x89;\x9c\xdb{\xfb?\xa1\xdb\xae\x01\x09C\
+\xe1\xffb\xce\xc9\xb5\x93~f\xeb\x0e!,\xb21\x0e\
+\xb2\xcfn\x00\x07\xed\xd3nMB(\xd1\xaf\xc6\x02e\
+\xe2\x02p]\x15\x04e\xce\xab\x15~\x98\x90\x8c\x00\x18\
+D\x09\x5cm\x02f\x8f2j'\xb6\xc3\xc1\xb9\x08\xb8\
+&!\xce\xcc\x8a\xce\x12\x08,\xa3D\xf8\x0c\xc2,\xc2\
+d\x1a\xc8\xfa\xf3\x98\xb3\xf5\xd1\xb8\xe3\xfb\xcc\xd5\xb4\xc5\
+\x91VB2F\xd84\xed\xf8H\x8aq\x96\xcd\x9cl\
+_qe\xd0\x8c\xb6e\xf8!Q\x07\x825\x09\x0cL\
+G_DN\x14z1GQ\x0d\x5cZ\x0b\xd9;\x13\
+b\xc8\x90\xdaPPC\x17P\xeaLf\x02\x8b\x97\xd0\
+S\x1d~\xd0\x8d})\xe2h\x5c\x22[{\x97\x81F\
+\x19\xd4<\xdd\xb0\x9b.\x02\xd5Z\xa5\xab\xe9\xa9\xde\x10\
+\x03o4\x1c\xb2\xb0sF\x95b\x0d[\x92H\xc5\xa0\
+\xa0\xa8\xe4\x0ca\x07g\x94\x9eT\x85\xcf\x8b\xe6\x01\xb9\
+\x88\x95\xb2o\xefn\xad*~\xa4\xee\x17\xa7\x83k\x98\
+\xaa\x05:*\xa5FH\x0cY\x869\x13\xc2\x92R\xc2\
+R\x9a\xab\x1aiG,\x06\xfe\xae\x11\xbb\x11\x89/\xd7\
+) \x22\xdb\x94\xb4Co\xfd\xfbb\xb9\xdc\xa1\xdf\x0d\
+\x94z\x1a\xac\x9f\xabh\x14(\xd1\x9f\xd1pX\xf7\x91\
+\x84\x18$+\xee\x04@\xd0pS\xc7\xbar\x8ek\xcc\
+N\x0f3Jv\x01\x8ds#\xc0\xb7H:\xb9\xe6\xa2\
+l\xe5\xf2V\xb0\xe0\xb2pk\xa4P\xe5\xe8\x05L\x19\
+\xc0\xdc\x1cgA\xc0\x8c\xdb\x94\x85\xea0\x15\xc9/%\
+m@\xae<\xe91\x81\xecH\x0fH6\x1d\x9e\xae\xdd\
+X.\x96\xa1\xcc\xe4Bc\xb5B\x85\xcf\xe6\x82\xa0\x84\
+A\xcc\x900\xba\xf2\xcfE~I\xff\xd0\xb2\x13DD\
+w\xd6\xa0\xb3\x00\xcc\x86\x0d\x85\xb2\x81\xf6\xac%\xe8C\
+\xc5\x1e\xaa'\x82\x0c\xcc\xe5{\xa1\xdc\x1e)\x82C\x1b\
+\x97~\xd9\x9eo\x00\xc6\x86A\x19&5\x89v\x12\xf3\
+Sg>|\xdf\xb9O\xb4\xf20\xb4\xe0q\x18\xfa[\
+7\x9f\x7f\xcb\xe6\x9d\x0b\xd5^1\xfe\xb1\x18\x86\xdf{\
+\xfamgW\xe7\x8c`\xf7\x94K\xe1\xf0\xf2\x92o>\
+\xfc\x9dw\xee\xbes\xc7\xb0\xf3\xd9\xad\x13\x1fx\xe6\xae\
+\xdfy\xf2\xb7\x9f)\xa7F\xd2\x13\xa2\x96\xb2\x91\xcb\xa0\
+N+\x10\xe3t\xe3\x18\x8bD\xd6\xd8\xd1\xa8$\x06(\
+P\xddg\xbe]p\x1e\xa3\x85\xa0\xc0y\xfaxz\x96\
+e'\x9b4\x07j\xff\x00e\xe6\xb4\x86\x1f\x01\xb7\xd4\
+\xa1wY\xab\x1aH\xdd\xf4\xa6<T)\x17)\xb4B\
+\xe1W\x22&Q\xeb\xa4\xce\xf1[#\x0cJO^h\
+\x0a\x88\xe8\xaa\x1b0mm\x1d\xc70\xca%\xd3\x87\xea\
+\x9cb\xd6\x80\xc4\xe6n\xda<@\xb7\xf6^\xbf\xf3\xb6\
+\x7fz\xf9\xbfb\x19\x8f\x932\xb0w\xae\x8d\xcf\xf44\
+\x9f\xf8\xa9c\xdf\xb3\x92\xf3Q\xc7\xc2i\xed\x8b\xc87\
+\x1c\xf8\xd6o<\xf8\x8f\x84\x18&G^!d\x10\x0e\
+\xc3\xf2\x87\x8f\xbd\xfe\xc4\xd6q\xdbr-\x14\xb9j\xdb\
+\xd1\xff\xf1\xea\x7f\xb1\x1b;\xc8a4\xca\x1e(O\x0f\
+O\xfc\xf4\xe7\xfe\xf9\x93\x17\x9e\x8a\xa9'\xb2\x8c\xd7\xe9\
+\xee7d\xd0\xd8\xe7\xc0b/t\x9am\xbd\xd1\xc8Q\
+\xab#\x83nV\xaeRG\xea\xccMx\x1dL\xc5\xb9\
+S\xc5\x8a\xf2\x89u\xdf\x89\x99\xba\x05\x0e\xb3\xf2\xads\
+.\xb1@\xbc+?\x8bD\x07\x09?\xb3\xa8h\x1b\x14\
+I\xcd\xec\x06\xb1n\x80\x8a9n\xd8f\x8a\xc9\x1d\x08\
+m\xa2\x95K\xac`\x13\x85\xeb\x82\xbf\x1a\xe4\xd9\xc6_\
+\xc73\x1fH\x19:'\xbb\x0ch=)\x05B\xe1~\
+\x1c|\xd5\xa1o\x962(B\x19\x95\x8a\xabK\xd8\x06\
+!e\x902\x90\x83\x94a\xbc\x0e\x06@\x0aa\xb9j\
+B\x0e\x94\x1f>\xfa\x13\x9b\xd8\xb1\x12)\xc3\xaa\xa0\x10\
+R \xfby\xc9\x0f^\xfe\xc3UqDr\x90\xd51\
+#\xe92F;Z\x22Qa\xdfP\x0f{\xe3\x04\x1d\
+\xfb0\x1e)\xb4\xfe\x14l\xe5c\xd4vgz\xbe\xa0\
+{\x88\xfc\xbbF\x82\xcf<\x94\xbb\xab\x84\x0c\xca\xae\xe2\
+f\xf2\xb8\xce\xe9W*\x034\xefR\xa7\x99\xad\xb9\xd6\
+\xa8\xa530\xdf\x94K)\xb3\xd4b\x22\xc3%\x96\xbd\
+\x14\x0f)\xa5\xd9\x1a/\x1ayz\x83\xbeDJz&\
+|d\xa7%\xa1P\xb4\xd1Cm\xc5\xd2\xb9\xa9\xbc\xf2\
+\xe0\xb7\x1c\xda8R\xfb[\xbcW\xa4\xbfv\xa7\xf5u\
+]\xf2\xd2\xf9\x93\x0a\xea\x81\xdc\xb0\xf3\xe6K\x17\x97\xf7\
+\xc9\xd0s\x9ar\xcb\xe6mWm\xbf:\x1f+\x06\x9c\
+\xc7\x13\x12\x1d\xd5>tp3\x81\xe0\x10\xbf\xae\xc1\xc4\
+\xb9\xb1E_oU\x7f\x0d6\xfa\x9a\xc5\x82r\xc9&\
+-\xbe\x0f\xd5E\xe9z\xbbt\xed\xc1y\xa4\xab\xceV\
++-9?\xb5\x88\x1c@\x13g\x0f\xecKe\xc93\
+\xa8\x1dg\x99\x98\x96\xa1\x96l\x19j\xc2nVq\x1e\
+\xa1\x99-we\xaf9\xfc\x1e\xa0\xe3\x80)\x8b\xa0\x12\
+=\x22M\x8a\xb4,\x1b\xdfz\xf8\x8do~\xe4\xa7\xa5\
+\xd2\x85i|\xe3\xed\xe3\x0fD\xa9\x1d\x8b\xad\xa3\x12t\
+\xba\xfc\xe3\xbc\xbez\xf3\xea\x15\x8b\x0cl\xd2\xb2\xf5v\
+d%[\xd7l^\xf3\xe0\xb9/$\x82\xc9H\x82x\
+J7s\xb29\xa8s7\xecshP2\x0b\xa6\x18\
+\xef\xdaf\xe7**\xb6\xce\x80\x94z\xa0\x9c\x8b\x12\x86\
+\x0bi \x04t\x9b\xa8\x9d\x8b\xed\xdfs\xe5kV\xa5\
+\xf4\xaa\x13DD\xb6\xe4\xc2/=\xf8\x0e`h\x14\xd4\
+.\x82\xa7\xcb\x07V\x875\x99'\xf1`\xa4O\xadT\
+P\x15l\xd5\xad\x9d\x98X\xe8\xab\xa5\xdcK\xab\xd4\xab\
+r\xd6\x16\xcb\xa7\xa053\xd6\xab\xac%\x97D\xf48\
+\xb3kT\xf9\x17\x14\xe4@\xb2\x86k\xc6 sr\xd4\
+\x02\xf1\xbc\x9d/\xbdc\xd7K\xfe\xf6\xd9\x0f\x8b\x94\xa9\
+*\x07)\x14\xa4\x15 $\x91j\xa3\xff\xabm\x8b\xa7\
+W\xa7\x07\x94\x155\xebk\xe2\xc3\x09\xb1\xc5\x0b\x96\x01\
+\x05?b)\xdbq\xcek\x91\xc1q1h\xd6'e\
+Z\xe6\xb5\xa1\xd9\xaa.\x13\xa1p\xcc\xd4\x1f\x1c\x80\xa6\
+\xaf\xbcC6\xbf\xe9\xb2\xaf\xb9\xb0Z\xc1\xf8\xed\xf1\x9c\
+\x9c\xff\xe5\x07\xde\xd1\xbb\xcd\xe3\x1bp\x5c\x17\xf5\x90f\
+\xcfbp\xe4S\xf7\xccN\x0c\x08\xd7\xac\x00\xa2\x9e\xfd\
+L\xf1\x03\xca\xd00\xf3X\xa2\x06\xa3\xc4b\xa5\x00\xc2\
+3\xcb:UP\x81\xc80T\xbf\x194\x0eF2\x00\
+\xec\x10'-\x9e\xd3\x94\x09\xea\x02)\x1a\xa0*\xc2o\
+\xbb\xf4\x0d\x1b\xd8\xd6\x80O\xfaa1Z\x85mB\x8d\
+77\xb8\xb5P\x9f\xf5\x93\xa7>\xb6Zna\x18\x9b\
+\xca\x8b\xf2\xdf\x10\x0c\xe5\xd3\xcf~\xda\x02nHP\xce\
+P\xc3\xf5\xaeO\x90\xc4\x11\x1c\x16\xff1j]\x86\xa4\
+\x90\xb3\xed\x93\xdaj\xf3h\x82i\x9c[\x03\xa72g\
+\xb2O\xf1\x01\xc8\x81\xa2\x8aK\xc4Xt %n\x9a\
+Y\xd5\x8a\x9aU\xaa\xd9\xbf&\x19\xd7;!\x18H\xa3\
+*\xc8D\x84^\xcc\xdaa\xdc\x00\x07\xdbn*\xc6y\
+\x17\xd2EP`\xc4\xb7h\xe1\xfe\xee\xff\xd0y\xab\x1d\
+\x85gV\x19\x06\x0c\xadv\x12\xc0Aw\xed\x12\xd3\x17\
+\xa1\x13\x80\xf1\xc4-5\xe0o\x9b<\xf7./y\xf5\
+\xa1oe\xb5EAk\xe6\x80\xd6\x8f\x10\xa7\xe6@P\
+L\x18b\xde\xc2\xc9\xd5\xc9?y\xf2\x0f\xa5\x82\xbf\xda\
+\xf9\xe2\xddO\xff\xc9q\x9e\xa8\xb8\x15\x13\xc4^l\x9f\
+5BY\x19I\x8d\xdc\x1b|\x04\x867e=\xc4-\
+\xa13C\xd2r\x0cb;m\x00\x12\xd3\x94\x00h\xde\
+O\x0c\x85\x0dU93\xb7S}\x08\xe2r\x85IL\
+\x9d\x8e\x06\xc3p\xc2\x1d\x84\x8d\xa5;\x84w\xe0\x0a\xc6\
+0%\x8c&\x8c\xe5BJBU\xfd\xbar\x02\x8d_\
+\x81/\x1a\x22\x8c\x12u\x8cV\xe5x\x8c\xad\x02\xe1\x13\
+\x1c\xc63W+o\x8e\xbd\xde\x1c\x0d\x15UoOw\
+\xe5[\x0d\xaf8\xf0\x9aK7\xae\xe8jR\xcd\xe5\xcb\
+\x1eb\xd2\xad)[(J\xd5\xfcMm\xbf\xf3\xef\x1f\
+\xfb\xed\xf7>\xf3\xc7\x8b%\x87Q\x1ek\xd8Z,\xf8\
+\xfe3\xef\xfe\xad\xc7\xfe\xedd%\xa3;\xd2\xe0\xa4\x9c\
+\xb2z\xb3\x9b\x1c\x88\xc30\xb3)W\x0d]\xe4\x86S\
+}\x16\xa6\xd4\x0a\x1bm\xe7\xfek0\xed\x80\x94\xac\x97\
+}\xbc\xfe\x00\xd7\x85\xd7\x011$\x5c\x1e\xc8\x8c\xabi\
+\x9b\xfe@P\xff\x0d\xd5F\xfa#\xda\xcb\xed\xc20%\
+\x9a\xca\x06\xddi\xd0\xa6\xcfR\xbb\xf0N\x94P%B\
+\xde\xe0\x03+\xb7'1^\xa0Gm\x1dX\xa0u\x17\
+\x1d\x9bN\xe9\xe6\xc2\xe0T\xeaH\xa4\xa7\x1eh\xda\x9d\
+\xca_\x17\x5c~\xfb\xe5o\xfc\xbf\x1f\xf8\xc9\x09e/\
+\x1c\x90\xe9u\xb7\xd7\xac\xb2?\xf6\xf0m\x8a\x1f\xeb\x06\
+]~\xe3\xe1_{\xef\xd3\x7f\xf6\xb2\xdd_v`q\
+\xf0\x04\x9f\xfe\xe0\xc9\x0f\xdcw\xe6~\x98\xd0\x9b\x927\
+\xd0\xae\xeb\x89h\x95\xf5\x0eSJj\x13d\x1dS\xf4\
+!\xcf\x19\x8cn\xce\xfe\x8bs\xda\x9e\xeap\xac|\xf3\
+\xb9;\xa7\x06\xeb&\xc9\x144\xaf\x1f\xe3\x03J\xad)\
+\x9e\xb1\xeb*\x1b\x94P\x19X\xe6[,\xdaXh\xa4\
+x\xc0?\xaf\xf5\x0f\xd6M\xf8\xde\xfe\xba%\xe7K\xb7\
+\xe4\x98\x85\xec}\xb2\x052\x9d\x16{\x22[A0H\
+[\x8b\xd5\x08\xb5\xbb<\x8c+\x0c\xb5\x899\x1d\x17\x11\
+*\xed7\x9a\x5c\xac\xaa\x02\xbce\xfb\x9d/\xdc\xf5\xb2\
+\x8f\x9e\xbe\xa7\x96s\xa8\xb3\xa7*\x8c\x85\x8e\xe2\x89\xc8\
+X\x09`Q\xdd\x02\xcef\x99\xc7\xce\x1c;v\xf6\x01\
+\x94\xa9v\x82\xc0mM\xe9\xa0}\xb5ft\x03\xc6\xda\
+\x90.n\xa5\xb6\xecfuYS4U\xad\xe4\xdc\x8a\
+\x1b\xfa\xb0ifg\xf5\x19\x80\xaa\xdd\x10\xe1\xde\xcc\x83\
+\x95\x96\xa7Q)\xfbj\x993\xd1\x06\xb2p\x05\x13}\
+\x02\xd3\xc2\xbc\x0e\x09\xb0\xc8X{q\xbe\x91\xc0\x92h\
+\x98\x8e<\x8c\xbe\xdd\xe8\x14\xef\xbc\x96\xbac\xb7\x91\xa9\
+\xd0\x22\x83\xbel?\x99i4\x05sv\xb0\xcf\xaaF\
+\xeb\xd2\x8c\xb6sOJtt#^\xa6\xb0\xa6\x11%\
+\x88\x94\xb1#R\xc8o\xb9\xec\x0d\x1f\xbf\xff\xc3\x17\xb0\
+\x1aM\xafu\x80\xc1\x1c\x10\xae\xb6\xba\xa6v\x84\xaa\xb3\
+_-T\x0a\xa7&\x83:\xd9\x06\x0cm\x84\x0bWm\
+\xcex\x9e2\x06\xdf5\x87\xe6\xe7\xb4\xe5)\x93\xe3\xd0\
+\x0d\x8b\x88\x12\xb7^\x8d\xc2\x82\xa8\xa5\x0b\x01\x06\xda\xe3\
+\xd8^\xa1l\xe3\xc6s\xf7\x5c\x7f\xdb\xee\x1b/\xdb~\
+\xc9\xee\xc5\x0e\x0aNm\x9d~\xf4\xc2c\xf7\x9dz\xf0\
+c'\xef;\xc53J,\xb0Gd\x96]\xbc\x9a\x8e\
+\xc5\xc5J\xa3\xd2jr\xd0\xdf 0\xc0\x08\x85d{\
+\x81j\xaa\xa5U\xf3\x94^$\x18\x10\x9a92x\xc7\
+xa\xc3xl\xd1n\xaeK\x88x\xcd&t\xf5}\
+\xa34f\x93\x00\x18A`\xf6\x96\xa56C\xe99\xd5\
+\xba_\xa7\xb1\x1d\x18\xac\xc9}jf\x80\xee\xd2F\x0a\
+\xe0\x05\x9e\xdb\xc0\xe6$\xde\xc0\xae3\xb8o8\xf4\x0d\
+G^\xf7\x8eG\xdf\xea\xc3\x1e ~L\x0d@\x89\xf4\
+\xd3K\xf9\xc9\xe7\xfc\xec\xb2,\xbba\x1f(\x82\x81\xb8\
+\xef\xec\xdf\xfd\xda#\xbfR\xbd`\xf8}W~\xff\x8d\
+\xdbo.(\xca\x9a\xad\x08\xe5<\xce\xfd\xd4}?M\
+#\x17>\xe5z\xdb\xb1\xf13\xb7\xfc\xafCYPJ\
+\xcf-QD\xe4\x0f\x9ex\xe7\x9f?}\x8fc\x9b\x12\
+\x10\xf0\xf5W\xbc\xe6%{^\xe8\x94d\x802`\xf9\
+/>\xfb\xa6G\xce?\xc9\xd0D\xcf\x22\xb7\xec\xba\xee\
+\x9b\x8e\xbc\xf2\xa5\x07\xee\xdc\xc6\x0dJ\x19\xf7\xfb\xba\xab\
+r\x10Y\x0d\xe5\xafO|\xea\x0f\x1e\x7f\xcf=O\x7f\
+\x82\x83\xb3\xfa\x99\xee\xfd\xc6\xddG\x7f\xec\xfa\x7f\x5c\xca\
+t\xd4l]\xa0SY \xb8\xe4\xc6\xaf\xdd\xf1?S\
+\xf9\xd9\x10\xab\xef\xff\xdb\x7f\xe5\xa8!\xcd!\xc82\xef\
+\xec\xd1\xaa\xdb\x862\xde\x1du\xe7\xba}\xd3mr\xa5\
+\xd1\x5c\x0b\x8b\x96\xe6\x9e$\x84\xe2\x16vu\x9b\x91\x09\
+\xed@\x9d\xc92(\x1cI7\xebIh\x89l\xa7\xa0\
+\xe1N\x05m\x16U\xfb!\xf9\xc9\x93\x1f\xbad\xc7e\
+G7\xae\xaf\xb8i\xdfc\xbf\xee\xe07\xbd\xff\xf8\xbb\
+\x1e=\xf70t\xc3Z\x15\x8cb\xa7\xe1\xd0\x11\xe3\xdd\
+\x99\x0d\xe0\xf2\x8d\xa3\x9b\xdc\xa9\xadNA\xc8 \xc7/\
+<\xadZ\x9a\x87/\x9c}\xe8\xbf\xdc\xf7J\xe8\xe4\x8b\
+\x84\xc8\xb0\x94\xa3\x9bG\x1f<\xf7`\xa4\xb8=\x7f\xef\
+\xadWo\x5c;\xda\xe5\x0cU\xca\x9c\xe0@y\xf9\xde\
+\x17\xbf\xf7\xe9{\x22\x89\x88\xa5|\xcd\xc1\xaf88\x1c\
+\x98\xe4\xe2X-\xe9\x07y\xfc\xdc\x13\x0f\x9f\x7f\x5cd\
+\xe1$}\x0f/\xf6\x7f\xff5\xaf\xfb\xf2}/(+\
+\x0e\x85\x5c\xacD\xb7\x0f\xd4<qIy\xd1\xde[^\
+\xbc\xff\xd6\xbf;\xfd\xc0\x9b\x8e\xbd\xed\xefN?4\xdd\
+\xea\xd0\xa5\x8a7\xb0q\xcd\xe6ee*5R\x19\x9a\
+\xf5\x13x\x00\xae\xde<\xd2R\x1a\x90[\xc3\x05\xb2\x08\
+\x16\x9aeD\xb8t\xae\x85\x12A\x9e0V\x17]%\
+\x03\xb9\xcd\x84\x89\xb3T^\xac\x93\xd8\xc1t.\xb0\xb7\
+\xdc\x92YY>r\x5c\x90\x16\xfc\x83\xf5\x1e\x13\x5cY\
+i_\xf6\xe8\x8f\xda(\xa7z\xff\xe8\x8eZT\xb1\xa7\
+AX\x86\xad\xb7?\xf6K\xb2(\x1do\x922^q\
+X\xe1\xdb\x0f\xbfa\x8cZ4'\xa9\xb2\xc9&\x81\x93\
+\xfe\x9e\x82\x99\xe5\x94\xfasl5gU.T>\xf2\
+R:\xe3\x84\xbc\xfb\xc4]\xc3rz\xa0I\x5co\x10\
+\x0e\xb2*\xbcc\xf7\x9dZ\xcd\x98\x15\xd2~\xfe\x9e;\
+F\xf3j\xa0L\xb7\x09\x8aH\x01\x9f\xbb\xff\xd6\x8d2\
+\xe8\x06\x9cq\xb7\xbf|\xfbeG6.i\xf5\x90R\
+\xad\xe1\x01\xf9\xf3\xe3w\x83\x9d\xdc\x05\x0c\x22|\xf9\x9e\
+;~\xf1\xd6\xff\xfd\xe5\xbb_PV\x14a\x19&F\
+D\x97K\xad\xda\x99\x93\x0df\xe1sv\x5c\xf5\xa6\xdb\
+~\xec[/\xfd\x1a\xb2hJ~\xdbk\xcbd\x101\
+>g\x13\x95-\x93\x22`\xab\x09\xd4\x01olIZ\
+D\x86>\x1f@\xa4\xa59e8\xe5\x22\xa8D\xc0\x1c\
+\xc1\xa4\xce\x13(BP#\x1d9y\xa1\xc1\xe1\xc6-\
+\x86\x05rI\xa3\xa6\x13je\xd3U\x0d\x82\xb3U/\
+\x1d\xb4)\xad\x0b4\xc0\x1e\xca'\x84\xa2\x0b#\x80n\
+\xd1RN\x02\xc7\xce\xdcw\xf7\x89w\xd5\x92\xba2\xe2\
+%n\xddq\xc7\x0b\xf7~Y+\xda\x99V\x16L\x11\
+\x074\xf9H\xb4\x9a5`\x95$\xe1\xacqa\x14P\
+E\xe4\xf8\xea\xf8}\xa7\xef\x85-\xb9\x8f\xcc\x81\xdbw\
+\xdd\xaai\xe5cZPJy\xc1\x9e;a8\xef\xd3\
+j\x87\xc8Nn\xde\xbc\xe7F\x0f\xde\x01w\xee\xbdu\
+\xc5-\xf8\x12\x83,!\xef~\xf2n\x1a!\xef\xf2\x8a\
+\x83/\xff\x89\xeb\x7fpsX\x12\xdd>s\xa8\x93\xa3\
+n\x01\xb4\x05[\x0ae \xbf\xe7\xe8k\xdfx\xedk\
+\xa7H\xc9\x98\xf7j\xbf\xd3\xf1\x9fE\x1b\x05\x18\xf1r\
+\xb4\x83\x82b\x1a<\xd4\xa8\x1a\x89u\xd1\xad=ml\
+\xa0J\x08\xdem\x80\x16\xd94\x07\x01\x80PK\xb1@\
+\xed`js\xcdX\x11\x0a\x18oV\x82Y\x9dEy\
+U\xd8\xaapZ\xfd\xa5uFWy\xf5\x94\xa1N\x05\
++W\xe0\xebR\x8b\xd0\xb6yu\x09\xfe\xcec\xbfv\
+\x1a\xcf\x0c\xea\xc7\xa7}T\xe4\xdb.\xfd\xbe\xed\xb2\xad\
+\x1f\xf3\xa6\xc9,Q\xfaEP\x96\xaf\xcb\xb3\xc6]S\
+\xa5\xb3\xe8\xc8\xacr\xbf\x87\x0f\x9c\xb8\xabs\x16\xd1w\
+\xbb\x9b\xf7\xde\xb2\x94%,H}\xf9\xf6\xcb.\xdb8\
+\x5c\xba\x8f]\x19k\xab\xe3d-\xc2\x17\xedy\x1e\x95\
+6\xf9x\xf3\xcf\xdbu[\xa1\xb0g\xe2\xd3<\xbe\xef\
+\xcc\xb1\x87\xcf=.J\x17\xe8\xce]7\xff\xd0\xb5\xff\
+\xad\x90EJ\xc3yD\xa4\xa0\x10\x94\xf1O\xa1\xc8X\
+W)D\x19\xd7\x03Q\x08!\xca7\x1f\xf9\xba\xd7]\
+\xf6\x8a\xba\x97\x13@A\xd7\xe56\xf6{\xa8\xda\xebF\
+\xady\x1c(z\xfc\x8a\xca\xcdX\xc5?@'\xdc\xbb\
+<M\xf33\xc1:EDy!\xb9\x9dVCL\xc8\
+dI\xdb\x09\x90\xf0\xc8[\x85T'\xbc\x16\x9c\x8d\xdd\
+\x1flD/\xce\xab\x03\x04;xS\xf4\xa1\xa2\x11\x1a\
+\xe2V\xef\x02\xa6'q\x09D\xce\x94\xd3\xefx\xf47\
+\xb5\x1er\xf5\xf6\xe0\xde\xe1\xc0\x7f}\xe4\x1f\xa9\xba\x98\
+\x83\x82\xccf\xe6e\xf0[\xd8\xed\x02\xc1\xc0\xacj\x84\
+\xba\xbb\x8f\xdf\x83\x05a\xb6\x14\x11r\xb3l\xbfy\xf7\
+M\xaa\x0b_@y\xc1\xbe;V\x5c\xc1\x96p\xaa+\
+\xa4\x80r\xe7\xde\xdbY\xb6\xda*\x1c\x93\xd9\xe7\xee\xbb\
+yAS\x11\x1e\xef\xfd\xcf\x9f\xbag\xa8t\x14R\xf6\
+,v\xfd\xe8\x0do\x18\xaa\x85k\x0b\xdf0\x19\xcbO\
+\x09\xbe\xd5\xc3\xf7\x1bB\x91\xad\xef>\xfa\x9a\xdbv]\
+\xadL\x18\xb9\x92B)E\x0a\x15\xc0l1'\x16p\
+%et\x17/\xb4\x95\x01\xd5\xc6\xe5\x8c\xa8\xd98\x99\
+\xb0,n\xebyB\x15\xad\xd2v\x7f3\x05\xa1\xc50\
+j]\x00\xb6t\xd8\x13\xc55\xf5\xa5E\x0d\x18\x1bm\
+\xb2Y\x7f\xd4d\x97Uje\xa8\xc6m\xec\x1enM\
+FH\xad\x04\xd4\xc7G\xe7'N\xe5]T\x98u\xd0\
+\xca\xb3\xd3\x9a\x9c\x1c\x1f\xee:\xf1g_q\xe0\x15\xd7\
+m\xdc\xd4\x16kK*\xbez\xff\xdf\x7f\xff\xc9?\xfd\
+\xc2\xd9\x07\x15\x82D\xe3\x01\xd1\x92x\x92Fe\x94\xe2\
+,\xbe\xf46\x822\xa5(\xbd:\xc7\xa7.<\xf5\xd9\
+3\xf7\xdd\xb0y\xa3\xba\xa6\x08d\xc5\xf2\xbc\xdd\xb7\x7f\
+\xf2\xd9{\x81U\xdb\xcc^\xb0\xfb\x8e\xd2\xdfOAp\
+\xa1\xbcz\xc7\xd1C\x1b\xfb\x9f\xdaz\xb6\xf9]\x1d\xdd\
+\xbcb\xdfbwY\xad\xd0qZ\x91\x81\x83\x0c\xef{\
+\xf2\x83\xba\x00\xf7]G_\xbb{\xd8Ao\xf6J\x82\
+\xc0\xea\x99r\xfa}\x8f\x7f\xf0\xfe\xb3\x0f\x9d-\xe7/\
+\xdfv\xe8e\x07o\xbfe\xd7\xf5R\x8a\xa9\xc7L\xbe\
+P\xab\x1f\xbd\xe1u\xdf\xf7\xd7?\xbf\x02Ay\xec\xc2\
+\xf1\xb7<\xf4\xbb(\x22\x82\x9d\xc3\xf6\xef\xb8\xf2U\x17\
+\xa4\x18\x97i\x91\x22\xe5\xb7>\xffN\x1d\xdamak\
+@3a6\xbd\xdb\x1aV\x87\xc3\xd9\x9dv\x18U\xa8\
+\xea\xb4\xd4\x0d\xf4)\x0c\x84Q\xdf\x8c\xa3\x90\xc9\xa5/\
+86\xbbY$\xd1\x8b\xae\xbf$\x02Zp\xca\xb5}\
+&\xaa2)\x8d\x17\x08: \xd1\x9f\xaf\xa3c\xe8\x0d\
+9\xb5\x8dj\xa8\xde\x9d\x96%;\xbc\xfd\xe1\x7f\xf3\xe3\
+\xd7\xfc\x1f\xe37\xd1\xab\x1d\x04\xf1\xed\x97\x7f\xff\xcf\x7f\
+\xee\x7f\xb2\xd4@\x9a\x1a\x9a.\x8eu\x0fC\xb4\xc4<\
+0\x22\xb55o\xcf\x0e\x00\xf9\xc0\xf1\xbbn\xb8\xec\xfa\
+\x0e\x8bL\x9e\xa5\xb8}\xd7s\xff\x9d\xfc\x87F\xba\xdb\
+\xe0p\xcb\x9e\x9b\x9a\xdaQ\xab\xb7\xab\x93\x96e%/\
+\xdc\xf7\xfcw=\xf9\xfe\x16\x1a\xdf\xb9\xff\xd6U\xd9j\
+\xbe\xb1mG\xf9\xe4\xb3\xf7>q\xe1\xc4\xe4.I\xb9\
+d\xdb\x81W\x1e|y\xb7\x0c\xef*7\x84\xe0\x0f\x1f\
+\xff\xf3_\x7f\xf0\x87\xdd\x22q\x00\x00 \x00IDA\
+T\xf7\xcf\xe1\x028\x8c\xf5\xd4\xb7?\xf2\xa7/\xddw\
+\xeb\x8f^\xf7\x9d\xbb\x16;\xa1\xcf.)\x22rt\xdb\
+\x91\xaf;\xfc\xa2?~\xe2C\x14y\xea\xfc\xc9\xff\xe7\
+\x8b\xef\x1d/{h\xd8\xfd\x1dW\xbdJVz\xc1\x08\
+\xc1\x95\xac\xde\xfe\xf0\xbb\x81E\xef\x93$9@\xab\xed\
+\xc6\x828\x83\xd4z\xce;N\x1c\xcc5CPG\x0f\
+d\xca\xe0\xd7\x06\xc0\x94!Sp\x9d\x92|\xd3V\x0c\
+\xef\x12H\x09\xf8\x8fi$\xd4^yyD\x849\xf2\
+\x98\xa2`\x8c\xb2>l\xa1\x06\xfa,\x11-\xe3,\xe5\
+\x0b\xe7\xee\x7f\xdf\xf1\xff<\x0c\xa57\xa2\xd50\xeb\x86\
+m\xb7\xbdt\xcfWv1E\xd6\x10v\xca\xe8\xeb\x91\
+B'60m6\x1clG\xcf\xe4\x95$Q\xc3\x80\
+\x22w\x9d\xb8G\x96\x9c\x08\x97\xd5l\x1d\xe0u{\xae\
+\xdf\x89\x1dS_\x14\xe5\xd6}\xb7l\xe3\xb6>\x1f\xc6\
+U\x22EDZ\xc7\x9b\x0c\xe5\xf6=7)\xd4\xb9<\
+w\xd7M\xda\xad\xa2\xc9\x95\xbe\xeb\xe9\xbb\xaa\xb7\xaa\x00\
+\xf8\xfaK\xbe\xdcu\x05C\x8a@\x86\x81\xff\xe1\xd1w\
+\xfe\xd2\x03\xff\xf1\x5c\xd9\x92\x22\xc2R\x99\x0b\xf8\xe0\x89\
+O\xff\xf8\xbdo\xba\x80\xb32f\x02\xd6\x00\xe8\x1f\x5c\
+\xfa\x95\xc2\x826zS[\x0d\xa7\x94\x00\xd5\xa6\x09\xa4\
+H\xc1j\xfa\xee\x98!0\x1a#\xaaaS\x04N\xac\
+\xe7\xcf3t\x92\xc0\xb7O\xc4h,\x94`M\xa1\x0d\
+P\xfe\x00\xb6\x12\xcb\x16\xd0G\x0az\xf2\x18\xead\xa0\
+\x22\x0dr\xb6\x19 \xf8\xee\x06\x8a<L\xe7\xea\xd4\x84\
+5\xbd\x92\xe6\xfdf\xe9\x8d\xbf\xf7\xf8\xdbN\x95S6\
+\xcf\x1e\x1f\xa4|\xcb\xa5\xdf\xbd\x89\xcdi\xb6\x0f\xadh\
+\xa0i\xb4\xec\xd4P\x0b\x15\xa0\xf4\xe8\x1c\xea\x10\xa7U\
+)\x1d\xff\xf5\xd4\xea\xa9\xfb\x9e\xbdO\xd9\xfc\xd5\x0d\xb5\
+\xf0\xd6\xbd7\xb7(\xf6\xce=\xcf\x9b\x12\xc7\x9eu\x15\
+\xf3\x1e!\x22r\xc7\x9e\xe7vZI\xe1m{\x9f\xa3\
+\xde\x7f\x19\xef\xa2`\xf5WO}\xb4[\xf4\xb2\xbcd\
+\xef\xf35\x0e\xd3\xe83\xc7\xce<\xf8\xd6/\xbcS\xb0\
+0\x0e!\xf5r\xf7\x9fy\xe4\xb7\x1f\xfa\xe3zY\xb3\
+\x0b\xdc\xba\xfb\xaaC\x1b\xfb\xa8\x9a\x16\xa9+N\xa2(\
+\xa2\x17\xb7\xdc\x88\xf4Q\xdf\xed8C\xd2f\xce\x9c]\
+\xc7\xe8v\xea\x9e\x09\xfft\x80\x22`6\x13\xcb\xce\xcd\
+\x86\x88U)\xee\x82\xc7J\xbe\xb8\xca\x11C\xa4^\xb1\
+\xaf\xe9\xca\xf4\x06\x94d1<\x22\x86.\xf7\x8bA\xd3\
+Xa\xc0\xab\xd6o\x80n\xb4\xde~\xe2\xac\x9c\xf9O\
+O\xfc:Lj;M\xc1=\xc3\xde\xd7\x5c\xfaz\xea\
+vj\xf4\xb0X9\x15\xf6;Tnl4c\x0d\x11\
+\x85W\xaa\xe1\x18\xe7\xcdp\xcf\xc9\xf7O\x9d8\x9d\x82\
+\xc5By\xde\xce\xdbG&R\xe1\xea\xce=\xb7\xeb#\
+e\xbc\xc0\x03g?\x8f\xa1\xb4\xfb\x07e\xdfr\xef\xf5\
+;\xae\x1a/u\xfd\xae\xab\xf7-v5\xc7\xbbV\xc4\
+\xfd\xf0\xc9\x8f\x9d\xe1Y\xd6W\xb6}\xd8\xb8v\xd7Q\
+N\xa5I\x05\xd7@\xfe\xd3\xa3\x7f&C\x1b\xed1f\
+\x9b\xb0\x97q\xa7\xf9\xfdG\xdfwvXAH\x14\x0a\
+G\xff\x1b\x08\xb7\xca\xd6\xf3\xf6^W\xd7\xfaP\xd9\xec\
+SX5\x96_*E\x97\xb4{\xb1F\x9f\x91\xaa5\
+\xd7\x093(\x87J\x83^6\xb9\xf0N\xb4G\x94\xd9\
+6\x0d)\xd3\x0fV\x0c\x17\x03z\xdb\x89j1\x00\x06\
+C\xd8\xf2\x1di\xbdZ.\xd1\xc4V\xe9\xac*\x877\
+X\x7f\x8c\xa9T\xc2\xc9\x9f\xd0 \x17\xbe\x16\xac\x15\x1a\
+\x9d\x8a\x86\xf68\x11\x8f\xde\xb3\xebb\xc9\xddO\xff\xc5\
+g\xcf\x7f\x86l\x08w\xeb\xa8,_u\xe8UWn\
+\xbbz:I\xb4/\xa5\x0d\xd5\x9a\x04-\x0c\xb4\xd0J\
+\x92\xec\xde\xaeZIR\xd1\xd8?p\xfcCX\xd2\xd1\
+C\x07\xca\xad\xbbo+\xa5Pphy\xf0\xe8\xf6+\
+!ZI\xa4\xdc\x7f\xe6\x81?y\xf2\xcf\xd5q$\x00\
+We\xeb\x05\xfb\x9e;\x0e\xd1\x1d{n\x1e\x13\x00e\
+N$\x83\xc8\xbb\x9e\xbaK\xd7I\x0eo?\xb0!\xc3\
+\xb8\x91\x0f\xd2[\x11\x97\x83|\xe8\xf8\xa7\xb5\xae\xb3(\
+U\xc01\xab8[.|\xfa\xe4g\x0b\xd8\xcf\xef\x8a\
+\xb5_\xb5y\xb8\x97KU\x85\xa9J\xc6#t\xefz\
+\xa2j\xdd\xcf\x00\xab\xcc\xa7K\x8f\xda\x05eV\xd9\x85\
+3r\xb2\x8e\xe7\xeb\x15\x00\xb5\x9a@\x9f\x9f\x835U\
+\xd5\xa6}=;\x0df\xaf\x92`f\xfa9\xa1\xe2\xbe\
+\x1e\xe2\x8a\x16\x1f\x92`,6\xf3\xd4\xe3\xc0\x143\x9b\
+[\x0d\x19\x8a\xa4W\xdb\x16\xde\xfe\xe8/c\xa34Z\
+A\x13@\x18.\x0c\xaf\xbf\xf4{G\x8etu\xd1b\
+Wj\x00\xad\x9d\xb8\xf6\x9d\xc7\x84ah\x01L\xe87\
+hx\xd0On=\xf5\xe9g\xef\xad\x08\xf3\x18\xa7\x15\
+\x11\xb9f\xe7U{\x16\xbb\x06\x91\x17\xec}~)+\
+\xf6o\x11\x22\xf7\x1c\xff\xe0\xdd'>$\xcbndM\
+\xe1 |\xfe\xee\xdbDV\x10\xb9}\xcf\xcd\xad^?\
+-\x03\xf0\x8c\x9c\xfd\xf0\xd3\x9f\xd2b\xeb\x9b\xcb\x1dm\
+a\x95\x8e\x1e\xf0\xd9\xd5\xd9\x93[\xa7\xa6\x9c^\xfe\xbf\
+\xd2\xbe\xb5g\xb3\xeb<\xeb\xbe\xf6\xf3\xcex\xc6\xf6\xd8\
+I&\x0dN\xe2\xc4%\xa4N\xec$D\x8aB\xa5\x14\
+Z\xa9D \xaaJ\xa8\x12\x15 \x15$\xbe $\x0e\
+\x12|F|\x01$P\xfb\x81\x1f\x00D\x81\x88J\xa5\
+U\x8b\xaaJ\xb4\x05\x91\xa6i\xea\xf3\xa9I\xdb\xc48\
+vb'\xb1=\xf6\x8cglgf<3\xef\xbe\xf8\
+\xf0\xec\xbd\xd6u\x1f\xd6~\xde\x0a+\x8a\xc6\xe3\xf7}\
+\x0e{\xaf\xbd\xd6}_\xf7u\xe8\xf2\xf8\xbeRH\x03\
+^\xbe~i\x82u\x80\xdff\xb3\x99\xd3|\xe7\xa9\xb3\
+S\xbf\x8f\xcb\x14qI\x99u^\x02\xfb\xf7\xcdF\x19\
+\xa0\xc0\x1dL*\x87n\x04\x9f\x04\xba2\x0b.\xbc\x8d\
+\xcd\xc7HZ\x07\xf8\x96\x87\xb5\xefN\x08&\x8b\xec1\
+\xa9\xe6d\x04\x80\xc5\x84GV\x0d_I\x12\xa7\x85\x1d\
+!F\xdb\xb4\xcd\x19.\xed\x18>\x9b:\xa6\x0a: \
+\x18+\x0f\xc6\x8a\x94\x9c\xef_{\xe9\xab\x97\x7f\xa7\xa5\
+ii9\xf5cg\x1f\xf8\xcc\xb9\xbf\x8c\x89\xe8D]\
+\x8am\xa0.zGy\xea\x19\xa1N\xda\x18\xc3-\xd6\
+7\xda=v\xe5\x11\x9b\x97bf%I\xcdv<\x7f\
+\xf2\xae\x07\x89\xf9/\xde\xf9\x89i\x15\xa2\xee\x9f\xe8i\
+\xb2\x87\xae<\xf1\xf6\xf1\xb5o\xbe\xf5\xac\x06n\xd1\xec\
+\xe3\xe7>r\x06\xa7w\xc4'\xee\xfc1,\xbb~[\
+F|\xe8\xe2\xd37\xed\x98\x94B\x80\x8cP/h\xc6\
+\x1d\xd0\xd3\xce\x92\x1a\xa7u\x81;N{RC?B\
+\x975=K\xe4\x18R\xb6\xad[\x1bHR\xb2\x9ce\
+\x19\x05\x8b\xb4\xac\xd0\x81W\xf3\xb7:\x85Y4\x13$\
+0D`\xb5\x91\x85}\x8c5Y\x8fg\xf0,d\xa0\
+u\xb3C\x8f\x10\xcemN\xcch\xd5\x18\xde\xf6Y\xc3\
+\xe0le\x90\x93J\xa1\x0d\xc6\x1e=.\x16\x91\x0b\xbf\
+\xbc4\x98ls\x96O\xfa\x1b/\xff\xb7\xab\xf6\xf6:\
+\xf5\xea\xaf>\xdb|\xcf\xe9{\xc9\x89\xee\xc4\xdb\x1f&\
+3g\x9fZ\xdb`\xfeu?no\xb6\xfcy^s\
+\x91W8\xb5\x11c\x1e\xb9\xf2\xd8\xb4\x9b\xda\xe1\xb3R\
+\xfd\xe6O\xdf\xf9\x80\x1d\xdb\xa7\xce=x<\xb7\xaa`\
+\x06\xf9\xe2\x8d\xef\xbf\xfc\xce\x053<z\xe5\xa95\xde\
+k\x91%\xec8}\xea\xdc\xc7\xee\xbf\xe3G\xcf\xe0\x94\
+\xdf\x0a9\xc1~\xff\xf2cJ^\x22y\xed\xf8:\xba\
+(`%\xf9\xc0\xce\xeen{\xf7\xd1\x1d\xaa\xaaN\xc7\
+\xbb\x91\xf3=g\xcf\x0b\xcfk\xbf\x9b\xcd$o\x1c\xdf\
+P\x878]}\x14\x82\xda\xfe\xbapNk\x99\x84d\
+Q\xbb\x1e\x9b\x95)\x8c[7\xf4\xa22:>\x1a\x0b\
+\xd6r\x8c\xaadD\x8f\x18&\xc1\xb2\xf1\xa23:\x94\
+\xdda\x85\xfb\x0a\x99\xc0\x1c8\x1d'\xbc}.\xdd\x94\
+\xb1\xb0;\xee\xd6\x02\xe6\xe5\xb9hc[\xb6\x1e\x87\xd1\
+a\xbb\xcfd\xaf\xdb\x8d_\x7f\xe5KS\x91,\xd2u\
+w\xbds\x01m\x22}\xfc\x96\x0fTe\xeb\x17\x1d\xae\
+\x86\xa8hmP\xcc\xa5[o<w\xed\xd9\xe0\x06\x02\
+\xb3\x07\xeex\xe0\xbe\xb3\xf7\xde9\xdd\xdef^\xfb\xcd\
+\xe0\xd1\xcbOL\xb6\xa3\xf1\xe1KOM\xd3\xb4\x1et\
+\xcb'\xfc\xf4]\x1f\xff\xe4]\xf7\xcf{\x05J\xe7;\
+\xf1\xf2\xad7\x9fy\xf3[A\x0e\xf8\xda\xf5K7\xec\
+\xd6\x02M.<9\x9a\xd9||\xfc\x99w?\xb8\xa8\
+\x19*\xbb\x9c\xd9\xec,N}\xec\xdc\x87\xa0[\xcd\xaa\
+\xdaz\xf9\xc6\xa5\xceo\xd3\xc3\x9e\xbd\xd7bH\xc5\xab\
+\xa4\x96\x0a\x00\xae\xff\x0fU\xd6CxTA>\xcbD\
+\x8e\x08\x7ff\x15D\xb1\x8er\xfa\x7f\x9e\xe5\xf9\x99\x84\
+\xe5\x8bv`\xa2\xc9\x0cc\x89\xb1\xe2=\x22ZB4\
+5X\x11 _\xca\x04\xd1\xc1\xe4Jw\x83{5\x08\
+\x06\xda\x936\x02^\xba\xaf\x1f\xa6\x84\x8c\xd9\xc2\xcd\xfc\
+\xf2\x0b7\xbf\x053p\x96v\xb6q?9c\x86$\
+\xe9N\xa6\x92\xfe\xde$\xc2\xf6\xc9C=z\x11\xeb\xaa\
+\xd2\xec=6'\x96\xb5\x06x\xe8\xca\xc3+\x0d\x92-\
+n\xf2\x83\xa7?\xf0\xf9\xf3?5sn\x83y\x18w\
+f\x0f_~r\x7f\x8f_\xbf\xf5\xc6\x0b\xd7\xbe\xbb\xc7\
+\x82\xf6,\x7f\xb3\xf93\xe7>\xf1\xe0\xed\x1f\xe5\xc2A\
+Z:\x87\x19\xf3\x1f\xbc\xf181\xc1\xb3\xf7\xde\xe1\xad\
+\xe7\xaf\xbe8\xc5N\x8d\xc7\xd3\xfcs\xef\xff\xa9\x9d\xe8\
+]\xc2\x22\xdd\x99\xfd\xec\x07>w\x0a\x13\xa1g\xf1l\
+\xe0n\xb7\xfb\x937\xbf\xe3\x8b\x0dL\x86\x04\xba7\x22\
+eM\x83Q\xf7v\x0f\xaa-\xaf:\xa9mg$\x8f\
+\x0f`\x1f\xb8rn\x7f\x1d\xa6\xa0\x94\xa2\xd3\xc7OK\
+\xce\xe7\xf2\x8eHC\xfe\xae\xbd\x08[\x05\xc4%\xdcK\
+v\x1a\x9c%\xca\x96,\x00\x82\xca\x09D\x01\xdf1\xf5\
+\xd8!-\xa1\xc3\xb6fSw\xbb\x89\xfd\xbf\x0c\x07m\
+3\xf0\xcb\xdf\xff\x8f\xee\x0a\xad\xc6?\xd83\x02\xac\xbf\
+\x06\xd6\x12\xc2\x82t\xde\x84\xa0\xe0\xcd8h\xdd'B\
+\xb7\xa1\xf6\xbfG/?\xb6\xdb\xb1\x19\x99\xee\xff\xf2\x98\
+\xf3O\xbf\xe7\xa7\x17\x82\xddJ\xd1\xb9p\xeb\xe2\x0bW\
+_Z\x7fqz\xf8\xf2\x93\xeb\xc1\xb0\xbc\xfe=\xa7\xcf\
+\x7f\xf2\xdcG\xa7nKA\x98\xed\xb0\xfb\xbdKO\x88\
+\xfb\xda\xb2}N\x98\x1e\xb9\xfc\xcc\xbeb\xa7\xbaO\xd1\
+>|\xe6\x9e\xbf\xff\xa1\x9f\xe9F\xdb\xc2H\x80\xd9\x87\
+\xcf\xfe\xc8\xdf\xfb\xe0_\x8f\xd3\x03\x83\x19_\xba~\xe1\
+\xc5\xeb\xafOKP`WB\x92\xb3\xcc\xc1\x97\xd9\xd1\
+\xd9\xdd\xe9\xd3\xbb#\xab$\xed\x90\x0d\x92Un;\xc3\
+\xa5\x979\x85\xaf\xdf\xa3\xf2S\xf6~2\xdb\x88!\xc6\
+\xc5s%\xdcL\x16\x8b\x17\x86\xac\xf9ju\xe5\x16\x87\
+\xce\x09\x14\x85_/d\x8bg\xf0?\xb0\xf0\xdd\x92\xa7\
+\x8b\x82R\xcd,\x98swc-\xf2w\xf9\xd2\xf5\x97\
+\xber\xe5\xb7\xa5\x99\xe3j \x148\xe4{\x5c\x05c\
+\xbb\x820U\x98W\xea\xf2\xaaZp\x9e\xb5Kcr\
+\xf1\xc6\xe5\xe7\xae}{2\x10\xeb\xfc\x8e6c\xde\x19\
+\x16\x94\x9d\x0b\x87\xfe\xd1\xcb\x8fO\xd8\xb5W\x7f\xe8\xf2\
+\x93\xbb\xdd\xae\xd5\xea{|}\xc2\xa4DK\x80/\xbf\
+s\xe1\xff\xbe\xfd\xe2\xde\xe3\xce\xbb'\xf2w_{\xf8\
+\xd6nv\xf9\xda\xfb\xd1,\xa7\xbfu\xcf\xe7\xff\xd1G\
+~\xee4w\xe8\x91&4\x1e\x7f\xf6\xee\xfb\xff\xfd\x83\
+\xff\xf8\x14\x8f\x22\xfef\xb3\x19\x7f\xe7\xc2c\xfb\x99\xa9\
+'\x22\xc8 \xd59x\xf2\xb3\xef\xba\xdf\xf3\xd9\xd8\xf8\
+\x07\x10v\x15i\x01\xf5\x10\x06t\xef\x0ezvy\x92\
+\xa3\xc0\x05+\xc1\xeb\xb3\xa1\x0a}\x91':g\xc3\xa3\
+\x90\xfb\xa8>\xbeV\xc4\xe1\xe4\xec\xb1\xe6ul!\xc2\
+\xcdT(\xb9.\x11\x98\xd2\xb8Tn\xb60[Qy\
+\xca\x0b[\xc4\x9a\xbbD\xaf\xbc\x0b\x17\xb1\xe5\xd3\xfe\x8f\
+W\x7f\xe5\xc7\xcf}\xee\xf6\xe9Ng\xad\xb6VA\xe8\
+\xbbc\x8f|\xf3\xfa\xea\xa5\xdf\xed\xac\xa0>\xe0\x22\xdd\
+\x8e\xb2\xc0\xf3\xbd-\xc2\xf4\xe8\x1b\x8f~\xe4\xfd\xf7\xb5\
+Cn\xef\xb5$\x89\xc2\xfbZ\x13\x8f\x5cy\x92}\xde\
+f?\xb8\xfe\xdaKW\xbf\xf7\xc1\xdb\xeeQ5\xdf\xe4\
+I\xb3$\xbfv\xe9INS[{\xf2\x04\xe2\x8d\xe3\
+\xb7\xfe\xcfk\x0f}\xfe\xfcO\x88\xf2t\xe9\xa1\x8e\xc9\
+\xbf\xf1\xde\xcf\xfd\xe4\xbb?\xfd\xe5\xd7\x9e|\xe1\xea\x0f\
+\xde9\xbe\xf1\x81\xb3\xef\xfd\xf1w=\xf0\xf1\xbb\xee\xe3\
+1e\xb3\xe9\xfe o\xcd\xd7~\xf3\xd5\x87\xc4ma\
+\xb94\xef\x1c\xdf\x14\x93\x8e.\x81\x9c\xcd\xfe\xc5G\xff\
+\xce\x7f\xfa\xeeo~\xf3\xcd\xef\x9d=u\xdb'\xcf\xdd\
+7\xd9\xf4k\xaf|m\xdd\x96\xdb\xaf\xa4[\xbd\x1e\x97\
+*\x0c`\xa6\xa5\x89\x11?\xf5\xb9\xef\xdc\xd0\xce\x92\x06\
+\xb2\xecFx\x9e\xd8K\x22W\x0b\xf4\xc6\x97R\x9ev\
+\xcf\x0c`\xf6\xe6S\x17\xc3\x14\xef\x10\xb3=U\x8e+\
+\x9eA\xd6S\xecB\xc6T\x94\x04\xb3\xad\x00\xb2\xf1 \
+\xa8\x8fO4\x10\xb96_\xfd\xb5\x0b\xff\xe5\x1f\xbc\xff\
+\x9fri~\xfa\xc5Gp\xd2\xc7\xdc\x1as\x02\xea\x9a\
+3\x89^\x0e\x9e\x0e\xe8\x9baa\x98\x9a\x99\xf1\xe1+\
+\x8f\xff\xc2\xbd\x7fw>>\xee\x1a\xa5\x8e\x04\xce{\x9d\
+\xd9\x95\xf9\xca\xb7~\xf8\xfc^\xbd\xb5\xf6 \xd3CW\
+\x9e\xfc\xf9\xf7\xfdL\xe3\x08C<u\x96\x0b6\xf1+\
+\x17\x9f0\x96^\x93\x84\xd9\x17_\xfa\xad\x9fx\xf7\xa7\
+\xef8\xba}\xad\x85\xda\x98\x9b\xc6\xdd9\x9c\xfb\x9b\x7f\
+\xee'\xfb\xc62\xcd\x8b\x9d\xe4j\xe1\x8c\x15\x224\xda\
+\x17_\xfc\xedk\xf3\xcd\xd5m\xaf\xd3\xf8\xaf\x1e_\xbb\
+\xc6\x9bG\x98\x84l\xb9\xe0Ow\xee\xce\xfc\xf3\x8f\xfc\
+\xed\xd3\xd3\xee\x983y\xfc\xe5\xd7\x9fZ\xdd\x09\xc4\x9b\
+\xca\xf9\xec\xb6H\xf3L>\xa66\x8f\x95\xf3t\xe8\x0c\
+\xd10$\x07\x85&3\x98\xfd\x22\x9b\x04\xd5sq\x9f\
+\xcc '\xfc\xac\xc1,X\x0eQ\x5c\xb9\x1b@\xc4n\
+U\xc7h\x89\x8e\xa0\x8e\xb4RR\xb9\x0e\xdbI\x07|\
+\xf9\x12m\x1d\xb4\xe5\xfc\xa1\xaf]\xf9\xea\xb7\xaf\x7f\x8b\
+v\x5c\xd9\xe8P\x1d\xa0lj31\x93Yh\x17<\
+/\xed\xaf\xa0\xab\xd2\x155<\xb6!\xbf|\xed\xe6\xc5\
+\xe7\xaf\xbe\xe0\x863\xbai\xd0\xcc\xec\xb1\xcbO\x11;\
+\xa7\xb02>\xf4\xc6\xd3\xd3\xd2\x10\x8a\xea\xb0[\xb7\xf3\
+\xbbW\x7f\xf0\x9d\x1b\xafx\x89*\x84|\x8b\xb7\xe7\xeb\
+\xbf\xf4\xdc\x97\xe6(^p\xe0\xe7\xbea\x9b\xf6A\x09\
+\x8dge\xeb\xf4\x90<\x9e\xed+\x97\xbe\xfe[\xaf>\
+\xde>\xbb+\x04'\xfb\xa3\xcb\xcf\xb1QIZ\x1f\xb5\
+\xac\xe3\xf9&o\xcev\xeca\x10_\xcc\xa7\xfc2f\
+o\xecv\xdcs\x90B\xcf\xb0V\xe9\xb9\x0c(\xc6\xae\
+r\xb5\xa7\xd0_+y\x03VX\xd9\xad.\x1f\x9d\xe9\
+cL\xdf\x05!nOON4\xd5\x17}G\xec\x11\
+'\xaa\x18EZ~a8\xee1n'\xf5\x01\xfa\xa1\
+\xd2.\xcf\xf4\xcb/\xffg\xeef\x01\xb6<\xb1\xc2\x16\
+Tg)\x18\xd1\x1a$\x0aoD[M\xfaiL`\
+g\xb1\xf1^0M\x8f]y\xac\xc9\x9a;(\xb7\xcc\
+\x95g3>\xfa\xe6S\xed\xa1j\x9d\xd8w\xae\xfd\xe0\
+\xc2\xcd\x0b\x8dv!\x93\x0e3\x9bI\xfb\xea\xe5''\
+L\x15\xb7p\xad\xee\x88g\xde~\xf6?\xbc\xf0\xa5\x19\
+\xb3M\xf3\x0a[\xf5\xbc{]0\x00[\xad\xb1P\xda\
+@\x03\xbfq\xed\xf9_z\xeeW!\x94\x09\x1f9\x87\
+\xdf}\xedQ\xf1\xec\x5cP\x0ak\xa3PvG\xc65\
+\x08\xc0S\xd7\xfc\x1c\xb4\x1e|F\x04\x06AZ\xe9\xbc\
+\xab\x8b\xb6\x9b\xa1\x94\x0eP\xd2$\xf4\x07\xdd;Y1\
+\xfb\xd6p\x05MvP?e\x89{ab\x8bB\x83\
+\x0b\xfc\xe1\xad\xfd\x81\x7f\x0c\xda\x89\xa9\xcc\x85\x05\xde\xa6\
+\xcb\xeeQ&!\x9c*\xd4\xec\xa5\xeb\xdf\xff\xfdK\xff\
+\xcb\x8f\xe7\xe9s%\xc5?Ke0bA\xd5\xd8\x07\
+\x8d\xa9\xe6\xb3\x85\x10\xbe\xef\x9e\x87\xf1\x87\x97\x1f?\x9a\
+\xb4\xf7`\x9fO\x93W\xed\xea3W\x9e\x05Cn\x03\
+0M\x0f\xbd\xf1TWV\xae\xc5\xca~u\xee&~\
+\xf9\xf5'J\xeb\x1f9Z8\x1b\xfe\xe0\xe2\xd3\xff\xee\
+\xd9/\x5c\xbb\xf5N\xd3\x0e\xb5\xd1\x5c\x97\x88F\x1fr\
+\x98\xd9d\xd3\xef\xbd\xfe\xcc\xbf\xfc\xc6\x17oq\xa6'\
+\x04\xa8\xe1\xc4\xd7.~\xfd\x997\x9f\xeb\x0bb\xd9C\
+\xa8\xb7\x99l\xa5\x8f\x17\xe3Yi\x01MW\x0e\xd1\xa7\
+\x22\xc4\xb1[\x15\xc3\xe1\xefE\x90TF\x8e\xe4\xda\x5c\
+Q\x085T\xe0\xc8<\x94\x10}+\x119\xd2i\xf2\
+\xa6\xaf\xac\xc1w\x05\xe6\xe2\xbc5\xda\x93\xd6\x08}K\
+\xc5>\x8b9/\x1b\xe7C\x1cb\xc2\xc0z\xbf\x88\xe6\
+\xdfx\xf5\xbf_\x99/\xd9\xce\xebC\x97\xd5<+\xad\
+\x97:\xa26\xe1\xd4\xf4\x9f\xdcW\x19\xb3R\xa6<A\
+\xa5\xdbL\xbcr\xe3\xc2\x0bW_\x5c\xfc\xf3I\xa5\xe2\
+p:~\xfc\x8d\xa7\xe6\x1eg,\x8f\x01\xf9\x87\x97\x9f\
+\xde\xad\x19\xb6{\x05\xef\xf2\x0a8\xfe\xe6[/\x5c\xb8\
+yy\xb1l\xb0\xacR\xed8\x18\x0d\x8f\xbf\xf9\xa7\xff\
+\xec\x1b\xbf\xf8\xe4\x0f\xbf9\xed\xb0*\x03\xe8\xefT\xab\
+a\xe6\xfdx\xe1\xf5\xf9\xad\x7f\xfb\xec\x7f\xfd\xc5\xe7\x7f\
+\xf5\xe6<\xb76\xads\xa6\xbc:\xee\xdf<\xfb\xc5g\
+\xae>7\x19t\xbbr\xde\x07Z y\xba\xb9K\xb8\
+\xadF\xfe\x02\xe4\xa4\x9a\x87\x092\xaf<U\xb3\x07T\
+\xb0\xb1=\x0a\xe6;A]\xa6\xdd+\xca\xe4X\xf4\x94\
+(\xd7\xe0gs/s\x01\xab9z\xc3\xa7\x08Ko\
+\x0c\xee\xa6\xdd\xccy\x8f\x10`yl\x09\xec\xdd\xd34\
+\x10J\xed~\x9cC\xea;\xbc\xf1\xeb\xaf\xfe\xca?\xfc\
+\xd0?\xe14\xf5\x07f\x0fQNf\xc6\xa3\xddQ\x9f\
+\xa7O\xa6\x09!\xd34\x1d\xed\xad\x87\xb1n\xfc\x80a\
+u\x1d\x95\xd5\x00\x9fQ\x07\xc3\x04<\xf2\xe6\xe3\x7f\xe1\
+\x8e\x0f\xafqdb\xcf8\x9d~\xe2\xad?\xee\xcb\xca\
+o&\xcf\xbd\xfd\xbd7n\xbd\xf5\x9e\xa3\xbb\xc1y\xdd\
+3\xf6\xe5\xca\xee\xabW\x9e\x81\xce\xb3:\x08\xea\x92\x0d\
+\x16`\x04\xb8x\xf3\xed\x7f\xfd\xa7_\xf8\xd4\xdd\x7f\xfe\
+g\xdf\xf7W\xfe\xd2\xbb>~\x0a;\xce\x04:F\xb9\
+\x7f\x22\x8f\xa6\xdd\xb7\x7f\xf8\xfd\xffy\xe1\xb1\xff\xfd\xea\
+\xe370\x83SK\xe3A\x03\x16\x11W\xe3;\xc7\xc7\
+\xff\xea\x8f\xbf\xf0\xd7\xde\xf7\xd9_\xb8\xf7\xaf\xfe\xc8\xa9\
+w\xcd6\xef\x1f<\xc28\xf3h\x9a.\xdez\xf3O\
+\xde~q\xe6:\xd9\x04\x0b\x84\x5cP\xdc\x14\x02\x82H\
+\x0d\x82\xc6\xa6\x14\x09\xe6\xd9Y\xab\x16\xca\xec\xf1\x8e3\
+g\xce\xef\x05\xb9\x81O\x1a\xad9\x9b\xf1[\xc7D!\
+\xaeX\xc1\x18\x93\x85\xb5e\x99\xa5\xce\xeca/\xa7\xdb\
+\xbaZn\xb3\xd3\xac\x0e\x8bc;\xbee7\xadi\x1f\
+\xa9k\xb1w\xde\xcdC\xe0\x0cn#\xe7\x10\xea\xd8>\
+\xdcu{'&\xa1\x9b\x99\xf1\xac\x9d\xf56\x9e\xcb7\
+\x9c\xed\xf8\x86\xdd\xaa\xd8\xb8\x9d[\x0e\xc3\x84\xe94O\
+\x99\xcdq_\x82]\xb7\x1b\x8cW\xa6\xbf\xf3m<\x9a\
+|h\xdc\xf29q\x8b3\x89\x8a\x10\x1c?\xbf\xda\xbb\
+\x81\x9c\xcf\xe0\xd4\x03w\xff\xe8\xfd\xb7\xdf\xfb\xfe\xb3\xef\
+\xb9cwvg\xb8v|\xe3\xe2\x8d7_\xba\xfe\xca\
+\xd3\x97\x9f\x7f\xfd\xd6e\xf3\xc9\x16!5\x82\xac\x18\x92\
+\xfb\xc57\xf3c\xe7>\xf4\x89\xbb\xee;\x7f\xfa\xee#\
+\x9b~x|\xed\xe2\xcd+_\xbf\xf2\x9d\xef^\xbd\xd0\
+\xd5j\xa5<\x8b\xecj<$\xe7Y\x0a\x08>\xd0\xbc\
+p\x1c\xf6\x9a\xb4\xbe\x88\xe9}\xb7\x9d9_\xbfh\x05\
+\xb0\x0d^\xba\xa4\x85\xca3\x90\xad\xa5\x0f(\x8548\
+A\x18Q\xfe]\x9a\x87\x5c\x03})\x82\xfb\x16\xb4\x1a\
+\x0a.v\xad[\xdbs\xf7C\xecx\xd46I\xeb\x82\
+q\xeb\xce\xde`P\x1eP@\xb9_ \x1d\xf8\x0d\xba\
+\x10\xaa\xbc\xb6X8E\xf7\x99\x82\xde\xc7\xf1UE$\
+\x97\xdbJ\xfa\x00U\xa2\xedMz!\xc4\xb3x\xf2s\
+h\xfb4c1\x0e\xde\x8b\x96y\xf0\xeaH\xff%w\
+\xa2\x5cN[\xcb\x06'\xd4\xa1U\xce\xd8\xbbSGw\
+d%\xb2*\xb6:\x8dGuY\xb6\xb9\xfd\xa0\xb1\x8b\
+P\xa7DV\x87@2\xcdw\xa9\xb7\xce\x9e\xd7\xfb\xf5\
+\x86\xa9C\xf7\x07\x16\x13\xe8\x9c\x9b\xd5U/I\x8b\x1a\
+\xc1\x84\xd4\x9c\xc00\x90y*\xad\xba\xc1dI?\x8d\
+2&0\xbd*28\x96\xfc3\xd5?l\xb04\xe9\
+\xab\xb4\xc1\xeaB\xb8K\x94\xe1\xe6\xea\xbdmy\xe63\
+4\x80\xaa\xb5\x89\xa8~\xb2\xe5\xdc\xa3\x08\xb8\x81\xbb\xc1\
+E\xb0F\xfa{;\xa4\x91\x0cl\xd0\xc0\xb1\x90\xe2!\
+\xd2#r\xd3\x1b\xcft\x01\xab\x83\xaf\x7f\xfd\x93}\x99\
+\xb8\x17%\xb5uW\xc9\xa8fu\xf5\xe1\x04\x18\xac\x5c\
+\xcd\xf1F\xcbC\x8a\x05z\xa0\xef\xee\xd2r\x18\x7fO\
+\x8d\x7fu\xa9A\x5c\xe6T\xb0\xe6\x99\xde\xb4j%\xb2\
+0\x0d\x0b\xd9BH\xd0w\xe7\x9e\x8b\xb9\x12#\xec]\
+.M\x06%T\x00\xe0\x91\x91\xa5\xa8\xe3\x1a&\x14\xa4\
+>4\xc6C2%\xe5\xd0\xe5\x99BBm\x9cK\xf9\
+`g\xcf\x8fz\xf4:\x8a\x09t\xcb\x8d\x99R\x0e@\
+p\x1c\xea^\xecJr\x03\xab\xc7T<\x8e`\x07\x0e\
+\xc0h\xfaR=\xdc\x08\xdf\x0f\xbe\xa4\x95\xee\x09\xe0\xe8\
+\x90t4\xe5\x84\xd50\x8dA\xcc\x87\x8eZ\xc5\x8f\xeb\
+SU\xf9h\xb4aIT\x05r\xd1a\xe10\xa9G\
+\x1c:\xc2\xe2#\x86\x1d\x0f\x91e\x88A]\x9a\xc4E\
+L\xd3\xfd\xb2\xd2\x01\xe2~\xec\x83\x81\xd2LD\x09\xda\
+\x90\x83D\xe0A\xe4\x0a\x07\xc8>\x98D`>w\xeb\
+B\x9axi\xd2\xb3\xb05x\x0e\x833\x08\x80\xd9\xee\
+\xe8\xe8\xf6\x81D'\xfd\x15\xaa\x22 \xf5^\x1b\xaf\xb1\
+]\xc9\x85\xe3_\xe3%P\xaf&e+\x89\xd3\xf6\xaa\
+h\xdb/\xca\xc9\x95N\x11\xb5)\x8bH\x1c*&1\
+6\xbf+\x89\xc0\xf0\xc01J\xe3\x03\x0c\x16\xa0@j\
+\xd1\xd92\xdb\xa0\xd5\xd5\xb9h\x97\x03+\x12B\xa6\x19\
+~w\x1c\xd8\xc3\x06\x0b\xc6wkE\x9c\x98[\x8f\xf4\
+\xe5\xe3\xa0|\x8f\xf5d\x08<\xaa\x90En\xb6.G\
+K\x89\x90\x9asvsv\xf5O\x07-\xb4\xe8\x8d#\
+\x02\x84PG\xf9:\x82\xab\xc23\xb4,;\xc2k\xdd\
+\x97\x87l1W\xa0w).:y\x89\xech\xc9\x9b\
+\x22\xb7\xd6\xe8\x03U\x5c\xf8\x8b\x0c\x0cB\xc1Q\xc4\xb7\
+e\xfc\xd1J\xdc\xb8\x10F\x84wmW\x06\xe1\x12\x87\
+\xa3\xc8\xb1\xc1\xa0\xdb\xb2\x10\xf2h\xea\xb3WT\xe4\xed\
+\x93j\x01\x89\x88\xaf\xd4BE\x8a;\x7f\xd1\xb3\xb8\x88\
+o\x86\x1e#\xc6\x19-?<!\x03\xf7\xec\xbc\xc5\xa4\
+\xfa\x88\xc6\xa0-\x8c\xd1_<\xb5P\x8f\x9fqwt\
+t6x\x8c\xbaEO\xf7\x9b\xf4\xb7:?\xfb\xf0\xd6\
+v\xd8\xd8>\xeb'\x12t]7\xa4\x22g_\xcd!\
+\x19%\xe21\xf0\xb9)@D\x9d=\xdcX\x00|[\
+;\x9f|\xaa\xb8\xf32Tn\x18\xa0\x10\xf9\x04\xc8\x8b\
+(\xc5\x83\xb84 \x0e\xf7\xea\x04W\x9d\xf8\x1cV\xc2\
+J\xc2@\x0b8H'\xee\xe5\xf7J!\xc7\xdb\xa3\xa4\
+\xad\xf3\xd3\x7f\xb6\xb2\xaf\xb5\xe8\x22\x87\x0d<@\xf3\x01\
+\xe0\x83>\xfb\x86\xed\xab&\x97\x9e\xdb{L\xf7\xcc\x14\
+\x0d~\xc0U \xf8h<\xfc\x19;dv\xda\xf7\x9a\
+}ZZ\x9e\xfan*\xab\xc3\xf4\x0fp\xa7J\x7fN\
+\x91\x82.\x91\xf6\x17\xe9\x83\x03\xaeZ\x81u\xf0%w\
+F\xcc\x98j\xba\x04\x13!?s\x1d\x1fv\x12&\x17\
+\xcc\xe1W`d\xcf\xc0}q=V\x80\x80\xa4E\xee\
+\xa4%Wo\x88M\xbc{\xc5\xc8\xb0\x07s\x1fA\xbf\
+\x0fEo\x9f\x88\xcd\xf5\xb68\xda\xd4\x87#\xa77\xda\
+\xa0\xe3\xbedS\x93\xa9i\xae\x92\xaa\x00\xa6\xf2\x05\x0b\
+k\xd8\xd4!\x14\xc5\xc07\xbe\x15\xeb`O\x01\xe0\x10\
+\xab\x0e\x88\x97\x85rQM\x1d}+\x95\x99\xfb\x14H\
+\xb8\xa6\xfb\x0e\xc6P\x1a\xf7x(\xb0\xfeRp\xa7\x8d\
+O\xbf*\xc0%o\xf5\x82\xc4\xe1Rj5t\x93`\
+\xecm\x14\x0d\x8ar\x0dy\x8c\xb3\xb9\x85\xd5\xdeOD\
+Z\xae\x8c\xb59r\x8c\xb7\xe6}kI\x5c\xc5\x0dw\
+\xb6\x96OP_*\xd4 (\x1f\xbe\x9ag\x8e9\xc1\
+\x00\xe3I \x0c5\xe4\xbcf\x9aS\x8b\xed\x8e\x8e\xce\
+\xb6\x8b\xcd\xb8z\xfbp\xd5\xb7\x178\xd4&\xb2\xcb\x8c\
+YM\x00\xc2No\xc5&\x9a\xe7\xb5\x9e*\x01?\x97\
+\xa0?\xb5Q\x85\x11\x98\x97\xfe\x14\x07\xa2\x0d\x8eix\
+g\xf6\xb8wV\xd5\x0e\xe0\xff+\x12f\xa0)$V\
+\x8dG\x14\x0a\x80>\xd1\xd5\xact\xf3\xf4\xcf?\x894\
+\xb4d\x95J\xb4U71r^\xea\x19?\x07y\xf1\
+\xf5\xdb\xa3&\xc8\xc55\x03\x8bQ\x00\xb1\x0a`l5\
+\xa8\xbdR\x0ft\xda\x9f\xe2\xa9\x06\x03k*Qc5\
+\xd5&/\xc8w\x01\xf5\xb1Pw\x0e\xae:`\xb0\xd4\
+s>\x0a\x08\x89/h9\xb3H\xf7H\xce3\x87\x0b\
+\x177\x15\x955eJ\x10SB\x0b\x07\x95+\xb9\xf5\
+_{0Ye\x17X\xf8\x83wj:+|\x09\x1e\
+~\xacOcJ!E_\xd6\xa4\x8c\xf5\x1a\xad\xf6\xc8\
+Ru#\x05\xbc\x80\xc5J\xb7h\x22$^A\xd9\x96\
+n\xdbD6Y.\x1a\x81\xe0\x9c\x1bF\x8b\xaa\x8aW\
+\x8c{\x0f\x83b\xf0%\x0d\x83&\xad\x98\xf5\xbb\xd3\x91\
+\xf5!1bC\xa4S\x22(\xd9\xfav\x18\x8f\xa1>\
+\x1afv\xaeV\xc7\x81V\xcf\xf0\x84P_\x9a\x9f\x9d\
+\xf0\x04\xcc\x1e\x15\xb9G\xdebC\xb9\xab\x87\xd1\xc0\xf6\
+\x84D\x95\xd0\xa5\xd1\xbdr&\xbb\x1f\x04\xa9-C\x05\
+\xb9\xff\x13\xd4\xe2\xf0e\xe6`\xe6\x17gu(\xd8%\
+\x1c\x02-\xa9\x5c\xf3\xe7\x8c\xfc\xff\xc4je\xa2R\x84\
+\x15\x93\xc5\xb2\xb6\x19\x93\x96\xea\x81u\xf5\xf71\xff\x00\
+)s\xb2;\xc9\xb0\xc1\xb5\x8dn\xdf\xfb\xa5\xe6\xb9\xc7\
+\x15)\xc5\xd64qcZ\x9c\xbcQ\x0f-\xb8L\xcf\
+\x85\x8d\xa7}i\xb6\x11\xba\xfd0\x08\xb3\x8dSl<\
+\x83\x03\xc6\xdf\xb7\x5c\xaf\x03P#\xbd;C\x832\x9c\
+\xdaV5\x03H?\x08.>}j 9:\x0b\x8a\
+_g\xfdy\xf6\x92Hunr#\xee\xe0\x1b\xc6\xea\
+\xb6\xebSR8EpsAU\xf3\xf7\xe2icq\
+\xb3{\xae\x0f\xf2x\xde\xcd\xb3W\xc3\x13\xeb\xea\x8f\xc1\
+\x80\x9a\xc3\x85\xe1\xb75\x87\x81l\xdec\x94\x0cu\xf9\
+\xa6*\xa4`$'\x84\xeb#\xbe\x16bh\x1a\xed\xf4\
+\x86O!\xc9\x0d\xeb\xf2\x11@\xc1\xc2\xa9\xd5\x06\xf7\xb1\
+\xef\xb3d}\x7fmsO\x85\x07A\xe8\x9c2=\xf7\
+\x82\x83\x85\xc4\xfa\xb3\xa1\x07O\xc5\x02\x9f\x8b\xad\x85\xcd\
+:\xc7\xf7\x09\xf6Ea\xa8?C\x96^\xc0\x9a\x05o\
+\x9d\xb1\x12}\xe2\x9c\x81\xdd*\x1c\xb4B?\x10\xc4\xc2\
+\xcd\xb3(?d\xaeT!cL2\x03m<\x98$\
+2x\xdf-\xbb\xc7\xaaJ\x1e\xd0\x1d\x02U(i5\
+\xe8\xf5\xaa*\x00i\x1e\x92\xa6N\xb5=\xa5u\xff\x1c\
+\xd3\x92Cw\xdb\xde\x98TP\xee3\xec\x9d!\x97\xd5\
+\xc5n\xdf\xe8\xae\x18\x9c&\xd0\xf5\xf2\xce\xb5p\xe5c\
+\xb1}nj|\xce::rR\x03s\x00\x93\xdfa\
+)\x9a\xaf\xf6o\xa6\xf0\xaa{$\x88p\x10\xa9\xf7\xa4\
+\x92\x1e\xe9\xe4EB\xc2\xea1\xae>'x\xc5\xfd$\
+)H\x9b\x16\xa6'O\x120\xd0\xdc\x19\xcb\xed\x01\x82\
+\x17\x0a\xf0\xd8\xd1\xf7U\xe9\xd7\xe6n\x11N\x11\x85\xba\
+@+(G\x86>\x1a\x86H\xb9\xad@\x05\xc0/\x82\
+\xf7\xc2\x08I<\xf0\xd6W+K|\xff\xf9\x91\xc9L\
+\xe8'R \xb9\xac3\x158\xe5\xc9\xe2\xe2\xe5\x17!\
+S$\xb3\xf2\x0cX,\xda\xb5\xfc\xe3\xca\x9a\x84\xa3\x07\
+j\xce{\x90fSs?\xda\xd6\x01\xff\xdd\x88\x10]\
+\xd8\xacL\xe0\xafv_\x06\x0c#\xec6\xf0A\xd7\xa1\
+\xf8\xaaK\x00\x1c\xbf\x06V\x97)\xa5\x07\xb5\x1e\xaa=\
+,hQ\x9b\x10Y\xfa\xf29'S\x0d\x16C\x12X\
+ \xe3\x88@\xd7\x09{\x11K\x8f\xfe\xfa\xca\xbbj^\
+\x11~\xd8\x18\x9e\xf5\xa20@:\xe8Y\x9c\xde\x82%\
+\xb5io\x13[T\xae\x00\xdeV\x8c\x90\xb2$\xd5\x7f\
+JL\xe3\xa0B\xc8G\x95:X\xd3\xa3\xd6a\x12\xe2\
+~\x17\xfe\xddk\xa3}\x7fD\xc2\x1f\xb0\x8c\x07\xae\x1c\
+\xba\xcd^8RA\x89\x10\x11T\xe7P3\xe8\x05\xd5\
+\x80\xbf\x10\x83W\xbac7K\x13\x9e\x01\x19\xe6\x11\xf0\
+s\xf5&\xbe\xb7\xf5\xe4!\xcd9{\xb07\xc8\x94\xdc\
+Q\xef#\xe5\xb4sg\xce\x9c\xb7\x84\xb9\xc2#:\xd9\
+\xe4\x87\x1b\xf0\xce*\x1dl\xdb/6\x7fk4\xae\x1f\
+\xe4\xa3\xb92'K\x96\xc2\xfb\x11N\x99\xa3|\x9d<\
+\xbc\xe7\xa0\x89\xca\xa0\xf8\xf03\xab\xad\x92U\x88\xd6\x08\
+:K\xf3\xe5h\x17(wa\xeb\xd56.#\xe9\xc7\
+\x0a\xe1F0\xec\xd7\x1c\x7f_t\xedz\xa7\xf617\
+\xc7\xc31Eb\xa0P\x07\xdcI.\xbbJl\x22\x96\
+C\xcd\x96\x05QC[t\xc6nth7\x17\x14\x08\
+C\x9c\x8a\x058\x93\xc3\x0f\x12\x84\x84@\x94\xa8c\x05\
+$#\x175P\xe2\x8auz69Rv\xe9J\xc7\
+G\xb3^\xd0\xe0\xd9\xbe\xd3\xc0\xb5\xee%S\x01a\x94\
+\xbb\x81\x9e\x84\xcd\xd9\xd3\xce,\xe0\xb9\xb0\x82jS<\
+\x88\x88P\xb6\xe39H\xe1\x82\xed\xb1\xa9\xe7\x12p0\
+\x98@$7lw\xf8\xddp\x83\xbel\x0a;\xbdN\
+\xad\xb2\x84\x88n\xe5\xf4\xae\xa0\x9a\x13\xcd\x96F\x16n\
+\x9a\x03\x8e\xc0\xd6\x0e\xe7w\x1bZ\x1d\xceN\xab\xe3W\
+\x9c\xfe\xa0B<\x1b\xd9\x00\xc5\xd2\xebT\x8d\x84\x93 \
+\x17\x0c)\x0fR\x8a\x0dz\xae%\xf3\xfa\xa0{\x91n\
+jMsvzZskA\xee\xdc\xcfG'\x00l\
+\xc3T@\x9e\xdd5%\xb9\x0c\x22/\x96\x057\x11\x12\
+\xf3\x98G\xe8\xbe\xd8C\xd2\xdcgauz\xd1\xe25\
+\x94\xcf\x80\x01\xaa\x03%\xda\xb1\xd8\x06\xa1\xcf\x9f\xa4\xc3\
+ d\x84\x22\xccSe#\xceO~p\xfd\xa7F\x8d\
+\xaaeG\x03N\x13\x94\x8aT\xe6\x06\x5c\x8d\x81#\xb1\
+\xfc\xe2\xee\xe8\xe8\xf6\xb8Km\x0c.\xea\xb1\x9f\xac&\
+\xb3H\xdes4\x0d\x99\x92\xc2\x8fQ\xd2+\xa3\x1d\xcb\
+\xa8\xf4\x8c\xd2\xe9T\xf6\x01\xd0\xc9\x0f\xacH\x0a8\x11\
+\x99cP2\xc0*8?OMqh\x10T\xb9'\
+\xaf+|\x09\xc2q\x9f\x04aK\x1d\xf3fXM\xe2\
+J\xd2\xfdh\xa0[\x0e\x02G\xe5\x96c  \xdf\xf1\
+\xf8\x93\xc3qd\xf5\x8b\x999\x0b3O\x86\x89\x84\x0b\
+\xfap\xa5\xa0\xe3\x94\x9f\x9fd\xd3\x95A\xac\xad\x0c\xaf\
+\xe4\xdd\x85\xd18\xcboi\x00\x1c\x8c\xe3w#\xf83\
+\x87\xf4\x0a\xa3\xd439\xe6\xa33\xc9\x5c\x8a-\x88\x1a\
+\x01\x228\xf2Y\xf7\x1c\xd50\x88\xd8d5\xbb\x1d\x8f\
+\x07\xbc_\xa4\xab\xea\xc0\x82\xa8P?p\x9e\x89\x86\x10\
+\xf4\xc6r\x9eBu3\x0eL$P\xf6b\x0a\xe1\xb3\
+$\xd3\x96g\x91\xbb\xfbPB|%\x065+]\x08\
+\xd3\xab\xa1\xe0\x02Y\xcb\x11U\xe0\xcb}e\xf4c\x16\
+\xba\xdf\x86\x06\xb5\x98\xd14\x99/\xdd\x89\xb1\xdaaB\
+kN\x98\xf3zw_\x07\x1e\xcf\xa8\xc6>m\xd0\xde\
+\xc6\xd4\xc0 \xcc#(P\xc2wX}\x0c\xe3(\x00\
+Y3\xeb\x1e\x9f\xbdu\x8e\x83\xf4\x0a\xbd#\x863N\
+x\xb8\x1d\xe9n\xd1\xaf\xbb\xd0\xfc(\xb1\xb1A\xf8\xa8\
+\x06\xba\xa8\x94\xbf\xf0\xfe\x8b(xA\xfez\xba,\x9d\
+Xv\xb5\xb4\x0f\xf8W\x06d\xcaS\x1f\xfeH\xb3j\
+z:;-4\xa9\x0a\xc7\xa1\x9cv\xbbx\x98\xea@\
+\xa0FlY\x8c\xd1m\x1c\xfd\xa5\xe0\xd58\xa2\x12\x18\
+\x90\xf5LO\xe9\xa6\x84YOT\x19\xb5\x1f\xb7e\x9e\
+\x11d\xb7\xceX\x83p?\xd9,\xbd\xc8\x12\xact\x83\
+\xcc\x9e\xb5*p\x15\xe4g\x90\xf6\xe9~\xe9\x08\xc4\xc9\
+\xf0\xe2@\xd6\xaf\xa5\x22~L#\x0b\x0eN\x00\xca\xe9\
+d\xe1\xe7\x19\x13\xa7\x98\xb2\xe0\x90\x0e\x1e:\xc3@c\
+\x09\xa09W\xa3\xb8k\xd2]\x7f\x879\xb3\xde\xc5\xe5\
+[{>\x15#\xaf.\xa3\xbe\xe5\xf5q!\xcb\xde\xdb\
+Y>\x093\xb3\x95\xa3)\xb2\xbb\xce\xc2\x9ff\xac\xdd\
+\xf3\xca1_;\x00\xe3sL\x83\x9d\x84[?\x85m\
+2vh0\x0d\x01\xee\x88s\xd0\x9b\x08#G\xd1'\
+7f\xa2\x0f'Ef\xff0\xf6\x09\xfe\xcf\xdd$\x0f\
+\xddL\xd8y\x95\x89\xabV\xb9\xcb\x17\x80Ud\xb9\x90\
+)\x8b\x9ct\xfe\xd8\xbd\xcb\xee\xbe`\xa6\x1b\x12\xa9\x8e\
+\xf2\x8ab\x13\xaa\xafC\x18\xa9\xb7v\x96\xb3\xf8u\xfb\
+\xd4\xef4,W\xdf\xdaa\x0f\xb3\xc60\xae\xee\xcdl\
+\xeeH\xeb}\xe9\x7foQ\xfa\xd1~\xb2\x8d\x17\xdb\x06\
+0\x93z2\xd3\xbc`\xa8L\xa5\x83\x07\xec\xa1_\x22\
+\xa8\xe5\xdb\x00\xcf\x0a\x87D\xb4\x01r\xe2\xde\xea\xae\xba\
+\x16\xcd\xedyg\x0fZg\x9b\x03\x80d\x90\x15\xab!\
+\x17\xe1\xceY\x9az\xc2i#F\xd9\xbfQ\xb8)\xfa\
+\xf6\x1f\xf0\xa4mq\xb4\x22}B\x9dy5\xb2\x05!\
+\x5c\xd6\x19\xcb\xe7\xb4&{&|0\x87\x0d\xbc}\x0a\
+&zV \x97\xc6#\x05\xd3\x13\x8e\x86\x8c\xe2:l\
+qE3\xbd\x04\x07\x84\xde\x96/\xa9\x95C\xa8-\xa0\
+3O\x1b\xdc\xcdJ\x9a\x01\x94CI\x8c\xe7:\x1c\x9b\
+g\xb02\x8f\xf2\xed\x8d\xe5wo\xf9\x10\x19\xd7C\x95\
+\xa6\xbb\xf6\xc9\x93\x94\x0e\xb6\xce\xcb\x1dL\xab>\xb1\xba\
+\x0f\xb9#\x0c^\x1b\x14z\xba\xcc\xa5S\xf3\x5c\x9fB\
+l\x9a\xa0\xa2\xd8*\x873\x9c\xce\xaf\xa0\x02\x86Y\x98\
+f\xf0v\xe5M\x00\x00\x1cXIDATQvY\
+\x0eZ3\xcec\xd5t\xd3\xf2\xb4\xd22\x8b\xc3|\x84\
+K\xa5\xc1I8o`&\x9a8\x84 \x22\x80eW\
+M\xab>\x18\xad\xa0\xbce.\x1d\xe2\xf1\x1b\xff&\xd3\
+\x1a\xe9\x07\x0c\xa8`\xdf\xd4\x09\x8az\x85}v]\x9b\
+\xb1\xf8\x02\xcc,o\x899F\xd25\x18~VC\x99\
+nO\x08\xd1u\xecQ_\x1bfc\xf5\x9e\xc9C\x98\
+_\xd67\x95HY\xe8\xc0qh\xd3\x0a\xdeK\x9d\x8e\
+@oLU\xec\x80\xc5\xd2\xdc\xf8*8\x843\xba\x85\
+\x8b\x8a\xd9J\x0bv\x88\x92\xb1\x1c\xe6\xb2\x96sr\xbc\
+Y\xb3\xa1\xe2\xd8\x86\x01Kx\x1a\xcd\xc4\x873U;\
+j2_^\x0eX\xf2\xdc\xcf#\x0ef\x1e\xe4\x9ac\
+\x5c@|\xcd\xe0\xc2\xb1\x14\xf7\xb1\xce\x01\xc4\x0bLE\
+l-\x07\xbf\xb3Tc\x1a.Mp\x92\x18-\x15*\
+G\xe7l\xcd\x8d\xad\x8cn\x0a>=\xe8p=V&\
+\x83\xc8\x94\xc7z(\xcf\xf2\xe9\x0a\x8b\x06>\x1e=T\
+\xa7\xb4\x00\x01\x0f\x1f\x82F\xa2)\xb1m\x05\xd1\x86.\
+=\xc8\xee~\x94\xb4\xb0\xe8z\x13\x07\xab\x05\x09\x08\xb6\
+i\xdbJ\xb8\x19u:\x08\x5c\xb6b\xb3\xa1\xd96t\
+\xa2X\xbc\x07\x18\x10\xbe\xc2Q-\x9e\x89\xc9}\xa5\x8b\
+P+7\xfd-Y\x1f\x9bJ\x0e\x0en\xc7Jf\x1c\
+m\xceS\xf9}\x1d\x056k\xba\xf5\xa2F\x87,G\
+\x02F\xe1\xf4\x80\x80\xeb\xa5\x88\xefjS\x89NtL\
+Q\x1a4\xbfo\xb6\x14\x93\xc6lE\x9a\x89\xbaN\xd4\
+'\x8e[U\xb4\xa0\xb4\xe0.\xcb*\x1b\x89\x06\xa4\x99\
+\x0b3N\x1e\x1aD\xe6y\x1cY\xaf\x80\xc1\x19,\x5c\
+NMd\xa3X\xe9\xb0\xd6c(U\x11-n<\xea\
+k@\x9d\xcc\xc7\xca\xb6J\xdd\xd2u\x05\x98\x8bC\xd1\
+\xd3\xa3\x18\xe30tM#2\x04:\xe6Y\xf1,&\
+Z\xd5\xa7\x86f\xcaI\xcc\xa9\x11\x92N\xfd\x00Og\
+\x05\xfc\xd0\x91\x85\xa3&\xb6j+gu\xa7\xa9\x17\xa8\
+g\xba\x05\xae\xe8i\xa3y, \x1b\xb7\x032\xaa~\
+\x91\xf5\xaeO\x8c\x193\x89C\xa1\xc9\xc2[<\x9b\xa0\
+\xe0\x18\xcd\xaa*\x1fi\x07t\x88~W\x9d\xeb\xab\x07\
+s\xa0l\xce4@Z\xd6DDN\x95D7\x92i\
+\xf1\x85\xc1\xa7\xc5\xea\xd0\x19\xa5k\xf4f%\xaf;\x91\
+\xdf\xb8\xa5\x18\xd3\x05\xd4\x9f\xe0\xa7\xb6~\xbfW\xf1v\
+\x7fR\xdd\xd6\x09\xe8\x83\xe8\xfdiS\xc2@Q\x18U\
+\x1e\x9c\x92'D]\xf4\xc81=\x16\x0f\x88\x10\xb5\xe7\
+\xb1\xfb\xad\xa2\xb1{\xec\xfah\x03u\xa9\xb4\xf8\xedz\
+\xe6\x0d\xc2\x0b\xa5\xd9p\x98\xe0r\x83\xba`\xdd\xec4\
+\x0a\xf1X6\xdaqh\xd0\x9d\x8d,\xe5\x89&\xbf\x8c\
+}X8\x90\xbc\xc1\x0a\xdf\x9e\x86K y\xfd\x9b?\
+J\xdb\xbf!\x15:n$\xc6F\xb8\x97\x9f\x0c]\x1b\
+=\x0f\x96\xd5\xb2\xa9T\x8fap\xe4\xe7\x12\xcb\xd5\xd8\
+\xed\x8en\xcf{\x0dl\xf3\xf6\xc0*s\xb3\xea\x99\xc3\
+\x09\xa0\xb7\x92\xe9\xb1\xf5[\x1e\x99\xcby\xacnz\xba\
+\xdfr\x81l\x1eY\x1a\x94g\x97S\xef\xd0+x/\
+\x22h\xe34\xd1%\xe1+X\x1e\xa2\x1a$\x06\x9b\x8f\
+\xf0\xe5\xd0\xd1bg\x1d\x89\xc3\xf8f\x13\x91#pH\
+\xc9\xe8\x15\x22\x8c\xa4\xd2\x0ce\x85)\x9c\xe1C}:\
+\x8fM\x10@\x91\xe6\xc0\x0a\xf3\x97\xc1\xeb8\xd2v\xf2\
+\xfcG\xbd=\xd0\x92\xef\xe8\x9e\x0e\x1d\xabpTuy\
+8\xcci>B\x92Vj\xa0\xcc{j\xe5\xf3 \x85\
+7\xc0\x0b\xe2*\xcc\x8d\x96\x99m\x03\x11\xf9j,%\
+\x0eY\x8el\xe1]\xc8\x02\xd5\xc9\x82\xfd*,\xcb\xa1\
+\xdc\xc8)\xf8}#\xb9\xe7\x8f\xc1mP5y\xa9\xf8\
+\x8b\xdf\x0d.\x0b\xc1\x0a\xa3\xa5\xfc?}\xed=S\x1c\
+}\x88\x82|S\xe0\xb3\xac\xe1\x99\xb7\x9e\xd1\x81\x1a\xb0\
+\x18\xeda,\x92\x10\x1aD\x00\xf4$\xf2\xc81F$\
+)ps\xeb\xa4\x05\xa9uk\xcd\xb5\xaf\x0e\xee\xd08\
+\xb4?\x97\xce\x97\xf0FPV\xacQ\x1e\xde\xa0\xc6\xb3\
+\x1d\x04h\x90\x91\xefW}~Y\x81@efa\xd9\
+\x02s\xc9\xcdC\xe92\xdcb\xc81He)?N\
+\x1d\xae\x02\x9f\x86\x82\xf2\xfb\x9a\x0d\x94\x1a\xb5\xfc\xc4\xc6\
+\x83\xbd\xea}\x11H\xe2\x18\xbc>\x02f,\x9a\x9f\xd2\
+\xc0\x88\xf0:\x80xtX~\xf7|O\x990\xfcL\
+*\x0a\x9f\x90\x86\xac'Jg,,\xb4\x19\x13\x9cu\
+T\x5c7&\xf6;H\x9bh\x18\xac\x15\x96e\xba\x09\
+\x0e\x80\xff\xf0\xe0 Ju\xe5\xa1\x0d\x02\x0b\x08Wz\
+-\xc4\x1b\xa3\x10\xbej\x8f\x16\xe5\x14\x97,ol9\
+\xe5c\x06nD\xda)f5\xa2\xc7\xcdi\xa8_V\
+\xf9Y\xf7\xf9\x1fE]\x8bj\xc3W\x8bp$T\x0d\
+z/\x96\xa9\xffZ\x80x\xd8\x15\xf2)\x92C\x8e\xde\
+\x8b)\x9a4\xa9\x88\x9a\x058\x06D\x0ewQ\xa9\xb8\
+4\xa0\xc2\xa6\x07U\x22B\x87\xfb\x08S\xb7W\xf3\xaf\
+\xa6\xb4\xc3U\x1dm\xb6;:\xba#\x22\x1c\x07\x91\xe0\
+\x11\xf8\x8ch\xe8\xe4\xea\xae|\xf8\x97\x8fD4L\xdc\
+\xde\xdbz*\xb7nq\xcb;7\xc4\xb5\xab\xee\x8b&\
+%2\x8a1\xf0\xae\xc2\xb6\xff\xbc\x9e\xd4';\xe5F\
+B\x82\xed\xc8\xab\x83\xe7\x8cL\x18\xe0\xf7\xdau\xdb\x96\
+\xf5\xed6O\x14SX\x16\xb3\x17\x94k >\x0b\x18\
+~6\xd3\xa8\x0e\x08\xd4O\xd1nT\x9bP\xe1\x9a\xeb\
+\x0d\xed\x13\xb4\x17.\x0a\x92\x1b\xdf\xa4\x838\xcbCk\
+\xb7\x97\xf0\x00\xd6\xd4%m2\x82c$\xe4\xe76\x94\
+a,\x0f\x09\xc6)UI\xee\x89Z\xb4\xe7\x0cR\xfa\
+\xd5X\xc4\x07\xd0\xa4\x02\x1e\x01\xc3\x1e\x8c\x8a\xea\xc4\x18\
+n\xec\xf1\xd5>\xe2\xb7[GC`Q\xc5\x1e\xfcg\
+\xc3\xb5\x8f\xa2\xfd\xeeO;,\x93\x7f%l\xd9\xcd\xfc\
+\xac\xf2K\xab\xec\xcb\x98\x068\xcc\xb7\xb6&\x95@m\
+\x08\xfc@\xa9\xa4\xa7\xc6\xa8\xeez*\x1f;\x04\x86W\
+\xd1\x955Q\x85j\x08>\x19\x07\xd8\x08\xcc=\x1a\xd2\
+\x0a\xc0xnj\x03\x91V\xe3\x96\xe6\x06\xb2\x1a\x01\x9b\
+\xd0\xf5h.\xcb@\x01U\xb3\x08\xafY \x93\x04\x5c\
+?\x149\xc5\xb8a \xe9G\x9a\xd4\x14\xdf6\xc5\x1c\
+\x955O\xd9\x1d0\xad\xc0\xf2\xf8a^\xb0~\xef\x81\
+\xdb\xba\xea\xf31)\xdee\xd5\xc3\xc1\xc3\xc2\xea\xc9\x15\
+\xca\x18\xdcC\xb24\x8a^\xaeJq\xe1h\xbba\xd1\
+\xc7\xaf,&\xc8\xdd\x8a;\xf9\xd4@\x0b \xa2\x8b\xd0\
+\xf9=\x92\x90#pU\x90\xc6S\xf4=ER\x90`\
+\xd0\xe44\xdc%\xbe\x94\x9a\xc2{\xa1#\xc4\x06\xdd\x97\
+z\x11\x171\xf91T\xe9\x90\xbd\x08\xaf\xf8\xa7\xa6\x00\
+\x98\x16~\xf0\x03Q\xb3\xfa\xe1\xc9\xbb\xe48-\xdc\x0d\
+8\xb4\xa8\x8c\xa5#\x0c)F\x05io\xa2\xbff>\
+u\x06:\xcfA\x18\xe8\x22\xf5(\xfb\xf7\xa4@i}\
+\xcb@\xde\x01\xd1S\xab\xaa\x8a\x97}\x95\xb5\x86\x96\xf5\
+\xc9\x89\xba\x0101\xb3\xf2K\x851\xfdA\xee \x10\
+'\xc1\xac\x19&\xcc\xa9{\xe3q\x16\xa1\xab\xd4;\x82\
+e&\xcf\xa04a(\x5c\xb2V\x81:\xceq\xd2y\
+e\xad\xabH\xadmE,\x80E'q1\xd4\xde\xdc\
+\x9a\x9a\x19K\xb8D\xc5\xeb\xa7<\xc7L\x13\x0c2\xc2\
+XW\xa3c\xceO\xf1X\x95\xa5\x11i\x16\xbbl\x0e\
+\xc7\xd64(@\x9c\xbf\x02\xd3\x83\xca\xe1 \x89:r\
+\x96zA,)\xd8\x8e}\xa2\xa0\x85:\xdb>0\xcc\
+\xcd\xe0]\x04P\x92C\xdd\x87!iS\x03\xfd\x18\xf8\
+\xa7t\xb0\x0c\xd2\xd6\xb3\x15$\xb4\xa6\xe104\xe5\x8a\
+\x8f\xc3\x19q(\xe0\x04\xafBC\xa5=_U\x93@\
+52i\x88B\x0cV\xc9\x07W\x1f\xbd\x0e,k\x91\
+\xcc\xfec\xbaM%o\x5c\xf1(4#\x07\xb8\xef\x1e\
+\xc7 H]\xb8U\xe1\xbd\x16\x9e\xea\xc8SB<\x1a\
+c\x91\x85P\xd6\xea\xe1\x1eA\xa5\xf8\x89\xe0\x8fz7\
+4@*}\x862h\xc42<o\x00\xe3lW!\
+\xd3 s\xe7\x9c\xfb\xc9\x90\x10\xa5K\xdav\xbb:%\
+\xd2a#H\xcfY\xc4\x7f\x0b\xc4\x00\x18M'=\xb4\
+\x125\xd6Dqh\x95\xe7\x04b\x02\xd5\x8a\xc6v\xb9\
+4{\xfc&\xc7\xfc\xeea%_\xa8\x02B\xd9\x97\x89\
+u\x83\x91d\xf1f(G\xd7\xd9\xeb+\xe0\x84\xe3\xb1\
+F5\x1b@4\x15\xa5\xab\x0e\x87\xe2\x1b\xc3\x01\xebq\
+\x9f\x1c\x86*V\xc9\xb6\xd0|\x8d\x06\x92\xa0z\x9f`\
+\xa9,\x18\xc6\x19\xd6\xb6\xc1Dj/\x8a\x81V\xd3\x03\
+\xf8\xda\xacYq\xd2e\xf4\x0d{\xe1PR\xabN\xd4\
+\xcdE\xa1\x88\xb0/\xf1\xd5\xb4\x80\xce\x13\xddZBR\
+\xdf\xac\x00\xc9_\xe8\xcf\x7f7`X\x8dM\x81\xea\xfc\
+\xa3\xe4\xa8\xca\xff\xbbN\x05Aj\xe9\x0d\x96\x80\x0cT\
+#\xdb\xe7\xf7\xd2\x17\xa5x \xe9P\x838_\xbby\
+\xb4a\x0b\xca\xf1\x98~r\xc9\x5c\x97B!\x86\xae\x8a\
+/G\xb4%\x83\x0ao@\xed\x04}\x07\x81\xc9\x98\x9e\
+\x15\xbd\x08\x84\x9c\x8a\xb1\x05h\xb6\xe8\xeb\xe1\x05\xc0\x06\
+\xf3x\xa9w\xe9\x8a\x91L\xb26\x9f\xcf\x06\x8b\xd9c\
+\xfaT.\x93`F\x88\x1fZ\x87\x8d\xa2\xf9\xaa1\x0d\
+R\xbb\xba\x95\xe7\xe3OE\xf8\xca\xab\x9d\xf8\xfd\xd61\
+~\xad\x0ev\xc8\xbb`\x91,\x02\x84\xfa\x02\xadE\x99\
+\x8f\x86f\xd1\xa1s\x9d\x1e`\xf0\x9d\xa3+~\xf2\xe0\
+5=\x8b\xf2D9\xa2\x0a\xa5\xc7D\xc4\x22\xa2\x0f\xb3\
+\xd7\xd1\xd7D\xeaQ\x82/\x8a=>(\xcb\x99\x9f1\
+Z:UD\x87\x1d\xd9I\xa8\x0a\xca<_W\xfd\xe5\
+\xe8\xe0\xa7O\xb4\xad\x8eR\x8eG&t\xbe]\xee\x9f\
+\xdd\xee\xe8,\xac\xca\xdc\x18\xd0\x151z7\xabx\xd5\
+\x80\x9d\xa4\xecHp\x1b\xb2jtC\xbd\x8bh\x0d\xe0\
+\xd1g\xa2A\xe2\xe5;\xe2\x04\xd156\x88\xc3\xddH\
+\xb4j\xc1k\x883\xd9Cu\xc5\xa8\x9cq\xdf\x9a9\
+\xe1z3n,O\x94i'\x0e\xad\xe1\x81\xaa\x11\xe5\
+\x98\xefd\x03\x0d\x16^VV\xed\x9d9\xba5\xdb\x91\
+\xf8\xba\x11\xce\x11\xb4\x9b\x12\xc8+L\xe64\x83\xc9M\
+71EI\x89/\x8dpJ\xc2\x02\xe2pjp\xa7\
+\xd3\xc3\xc6L\xafbB\x14d~\xc4\xc0\x82\x0e\xf8\x0c\
+E\x15\x11\xb0|\xf3\x0c@\xd2X\x99\x19\xaa\xed>\x07\
+I\x1f\xc1\x0d\x95,>9\xcd\xb6\xc2S\x18=\xca\x1d\
+\x0b\xc9\xd2\xbe\x5c\x19\xef;\xb9\x89\x8a\x13\xe9%\xd3]\
+\x8b\xabi\x14\xb0\xf2u\xd2\x07\x15\xe5w \x9a\xc3\xdf\
+\x94\xc1\x0c%\x80\x9bK\xd4\xc4\xd8\x99G\xaf^\xf8\x83\
+\xf0\xee\x19P\x9e\xf6{+\xa6\xe82s\x83=\xbaU\
+\xa5\x10sp\xe1\x1aH\x07\xd0\x8d\x8e\xb2s\xee\xaa\x84\
+\x88\x8a\xc3\x81Q\x18\x95\xef\xb8\xfcn\xc6\xd3PY\xfe\
+\xf9!V\x8f\x17]\xd2\xc1\x1a\xc3m0\x9aeA\xa6\
+\xb2h\x8e\xd3JCH\xe2'\x99\x1f[\xa97\x9do\
+7:\xab/\xdefZ\xa2d\x93\xe9[\x97.\xec\xa8\
+\xd6V\x1b\x0f\xb6\x88\x10\xb6\x08\x84U\xd4HF\x8c\x89\
+=\xec\xa1\x0a'Qk\xb8I\xcc\x09\x83\x84\x9b\x02\xac\
+m\x8e\xd6\x109$\xd8\xc8\xef\xa6\x15\x10=\xa2]Q\
+\xb5\x0e\x83\xef{h\xde&+\x04\xc3\xf0\xb8C\x9c\xc7\
+rILi>\x14({\xfe\x1e[_\x8fy\xb2>\
+f)\xe6\xa9\xadx\xf2\x0de\xb4dQ\x5c\xbb\xff\xfc\
+\xde3\xb1;\x10\xef\xbd\xea8\xaaoL\x8co,\xd3\
+\xca\x5c\x92\xf7\xfe\xb5|\x0cE\xf1\x9a\x91|\x04\x1aG\
+\x86i\x88\xcaQ\xf7\xac\x92(\x08L\xdeM/\x94\xdb\
+\xc9\xa7k\xc9\x09b\x0f\x1f\x8f\xc3\xa2x@\xc2\xffW\
+\x80\xce>\xa9\xfb\xa4\xb9\x08\x0dy\xcdl\xd2\x15?O\
+\x98 1\x80\xf8H\xa1Qp\xfd\xde\x08]\x0ac\x16\
+\xc8[\x07<\xbb\xf9\x02\xe5\x04tnz\xbcz\xf0\xa6\
+\x1cd){\x99\xb6Yc\x0f*\xf0\xbe_\x8ekT\
+lV\xbbX\xf64\xf8Q\x10F\xba\x18\x17o\xce\x81\
+\xd8\x11)\xb8=\x5c\x131\xbf\x8a\xde\x0f.p \xc5\
+\x16\xb6'\xdc\xc3\xbb\x9d4cp/\xcb\xa2\xf8\xef\xaa\
+\xc72\xbc\xb3T\xce\xb0nm\x96\x08\xf5\xd1\x99\x1b\x88\
+\x09!\xbc\xd1\xf2\xf7\xf5\x92L\x0c b\x1b\x10\xbaO\
+\xe2\x00\x1fnSH\xf2(\xa7\x02S5L\x8c\xf9{\
+\x1c\x19\xcee\xf7\xbfu_\xd4\xa0\x95\xfe\xd4\xd6Y!\
+\x10(\xa698\x80\xb1\x91\x0cQX\xe0z\x1aP\xec\
+\x1d\xd8\xbdf*\x98\xc5\x01\xbc\x14\x09*\x18\xa9zl\
+\x18\x133\xa8\xe0\xec\xd9A\xcf6\x10\x9f\x13u\xc2\xf0\
+\xfe9\x8a\x11\xb9\xf2\x95\xe6\xb3r:\x16*n\xd1\x95\
+\xb7\x08,\x08\x16r\xa2_\xe5y\x1fLu\x83\xd7v\
+\xf3\x22*\x02\xfb\xa2SX\xa6v\x81>\xd1^\xe1=\
+fb\x1bG}\xb5\x93IrLP\xd4E56\x0d\
+\x83,0vA\x8c\xca\xb6P=\x98\xe0\x92\xb9\x05\xf3\
+\x83\x8bbs\xa6eWd\x0d\x80\xc7&*\xba\x02\xf5\
+\xf4\x1b#*(C\x1d\xdf\x0b\x9d\xb4\xbf-T\x92z\
+i\x0e\xe71\x04\xb2\xde\x1eQ\xcd\xfcQ\xf2\xbd8\x80\
+\xbc\xcc\xb6\xf0\xa6\x15\xa3A\xa0E\xb6\xd2\x85\xb6\x0d\x17\
+\xd6\xe7\xb87\x0a\x8f\xaa^\x8f\xaa\xd1\x92+D\x18\xf7\
+\xaa\x868;vm\xcf\x1aa\x01{\xecJ\x9d\x02\x98\
+b\x1cE\xd1\xdd\xfap7\x066\x06\x89\xa4\xb7\xff\x8b\
+\xdb\xce\xbcW\xcd0pR\xe0+.\x97\x91\x81\x07B\
+\xd6\xe4\x9f!\x16I\x8f0\xc4\xdcJ\xe4\x01,\xf3M\
+\x9e\x97a\x06\xe4\x05Xc\x82\xb4T\xafo~:\x86\
+6\x89[\xf8\xe9x\xc4\x9b/`P\x9b\xc1\x94\xfc\xd0\
+b&|\xf4\x19N4\xdb&\xfb\x80m\x03\xcd\xf6\x9b\
+:\x9d\x06y\xa3\x87\xca\x15\x15\xad\x9c\xba\x0cK\xc74\
+\x07\xc0\xc8Y4\xfeY\xfd;\xd3\x1e\x9b\x0c<\xf5\xbb\
+\xef\x8e\xf6s\x00S@B\xe1\x8a\x11\x92\xcf\x96b\xb8\
+\x85f\x03V:\xd0\x8f\x86\x00\x19\xda/\x06\xe9TV\
+\x0f\x92G\x9aS\x95\xb7\x9a@]A\x13\xc9\xa7nG\
+J\xc9\xe9\x08\xfa\xde\xf8^\xc3\xc2v\x13P\x87\xed\xa9\
+Zd\x01\x7f\x16\xcbp\x83Y\xe4\xb6?\x8c><\xf2\
+\x97M6\xac\x08.\x04\x07\xb4;\x8cg\xdaxE\xa3\
+<\x91;d\x15\x12\xeeQ\x90\x9d\xaa\x90\xb8\xa1lV\
+\x022:\xa8\x8aL|\x81cw\x86\x1b\x98\xe9\xd8\x9e\
+',\x88\x01Gt\x9aa+\xd4rGS\xf3\x01\x07\
+\xe4B\xcb\xf4x\xfc0\xaa\xd5\x91\xc7IU\x03\x9ff\
+\x99e?\xc4\x01\x00\x93\xd7\x10\xed\xd0|\xcbCb\xcd\
+}8Y\x9c\x96\x16gLL\xb1\xc0.\x93N#\xd9\
+K\xb5\xaf\x05g\xa9\x9b\xba\x1e\xa9\xfbas\x86=\xb1\
+\xc1\xdb\xaa\xf4\x00\x087z\xe0\xb8\xaa\xa5\xb4\x97\xb4\x1e\
+\x9e\x22\x86'Cu\x1a\xeb\x04e\xc2(\x97&\xf4)\
+\xa8,\xdc\xe3\xbe\x11\xc2\xa6R\xc1\xb7\xe1\xf4\x14?\x02\
+\x10\xa5\x1b^\x0f\x07\x8d\x82\xadF\x8b\xc5\x04-U\xb4\
+\x10\x17\xee|\xeeZr\x95\x11\xb6M\xb1\xffq\xecB\
+\xb3\xe5^\xe8\x1baX\xdcJ\x18\x1f\xffL\xd1\x13\x8f\
+\x0eX\xee\xe2\x0a\x07\xc9\x18W\x1a\x02}kh\xac\x1a\
+\xde\x14\x14NZqS\x81\x94\xe7\xed`\x0d4\x8a\x17\
+\xaa+\x13\xef!F\x07p\x853\xaa\xcfs\xd4\xa0O\
+\xcc\x0be\xed\x93\x99\x85\x17\xf4\x09\x08\xe6\x81ZG\xb5\
+%\xea\xd4\xfa\xc1\x17+\x12x\x19\xe5\xb6\x8c\xaa;\x8e\
+;\x89\xe0t\xe6f\xb0\x9a\xee\x86\xc4\xd8\x0f\xa9D9\
+\xeb\x9c\xbe\x99\xb6\x90t\x96\xebk\x14\xce\xbb\x18lV\
+\xa3\xe4J\xc7g*\xe0b\xd6\xb3\xf4\xe8P\xe82\x86\
+\xb4\x97\xa5\xf3\xc0\x04\x07N\xc2'\x8cY[\xae\xc0\x9c\
+ow\x95\xf0,\xd3e\x95-z\xc1Y\xd8\xce\x99\xb6\
+\xbfQ\xec_\x81f\xcb\x0d\x99\x10`\x12\x94G\x09\x1b\
+\xc4\xd8\x9e\xd6\xe8\xb0\xec\xca\x86\x0c\x91$0\xcc=\x89\
+L\x15'\xb1}\xa5\xa3<\x00~L\x02\xd7\xa6&\xf9\
+\xbb\x1f\xc1\x9b\x99\xa7\x17ZR\x91\xe9\x18j\xe0V\xcd\
+\x9c\x7f\x0a+\xdd a\x1b)z\x184\xd0\x88\xa7y\
+\x8aQsl|/\xf1\xeb\xb1X\x80\xbf\xde\x22\xcfS\
+m4\xa2E\x9f\xfe\x0d\x0f\x12\xc5\xb9\x82\xec\x18\x9a\x19\
+\xc2\xb9f\xc2\xf3x\xe5\x9c\x89\xbe\x10\xfdjP\x0a\xa4\
+`+\x8c\x116\xe4\x9c;\xcdl\xd1\x03\xa0S\x14\xeb\
+\x1b\x03\xb3Q~j\x1a\x9e2\xdf\x8e\xca\xff\xdeE\x09\
+N\xb1\xabW\x12t\xf5\xa6\xb0L\x10\xf3\xd5\x83P\xab\
+\xa1\xab&\xbbTeW\x08\x1b8\xdf\xa1V\xbcZ.\
+K0\xf2nvZ\x1a\xd4>\x171t\xb9\xbc\x0f\xa1\
+z\xd8\x18\xf68?@\xf7\xa1P\xdc\x91^\x00\xc3\xeb\
+\x0b\xab(gV=\xfdh\xac\x05Od)\x12\xd0\xa8\
+\x16\xc4\x80\xb1\xf2'\x1e\x1dC5\xf1\xc2\x06\x9a\x84\xf5\
+ewGG\xb7c\xfb`C\x85\xbe\x87\x05S\x18\x09\
+\xba\x06\xb4\xbbJm@b\x18\xcb\xcc\x0e\x1bv\x97\xc8\
+\xe6J{\x87E\xf2.\x06\xcb\x14\x15f\xccA\x93w\
+\xc0G\xff\xff\xf7\x1fV(Z\xe8\xb9h\x01\x1e\x19\xa0\
+@\x9b\xb7\xd5\xd1$\xf5x\xcc\xde\xa0\x02\xc93=\x8a\
+\xb5\xe7\xe3!\xfb\xda\xd5i+\xa1\xb3P\x92\x16\x0bK\
+\x81Q\xaf\xc5CkF~`r\x1d\x18\x0b\xb5\x9b\x10\
+\xf2\x052\x87kT\xa3\xc9@\xa5\xe9\xb2,\xa5\xb3\xca\
+\xe7\xd9W\x1d(\xbc\xb8\x92\xff\x1c|tsW\x22\xda\
+\xfa\x15\xa5\x89F\x81\x81#Z\xbf\xa7$\xdd\xd2\x8c \
+\xef\xa5Q\xa6\x84\x0d\xdf\xd4\xe1\x1d\xc2\xa8]\x0dn\x94\
+M[\x14.\xb2+'j\xc4(\xae%\xd4\x96\x93\xd9\
+\xfaM\x9c\x11\x91\xc8P\xe1\xa8\xa8\x1d\xe2\x92\xc0\x15\xfd\
+\xb0ap'\xe9j\x81\xe88J\xf83\x04\x83\xc3\x07\
+\xe5\xd5\x86K\x8a7e\x0e\xd1\xbc\xc0>\xd8~\x96\xd6\
+t\xb9\xcdD\x0cR*\x9e\x93\xe0\x18\x13e\xfb.\xda\
+!\xb2\xc8\xd4\xd0F\x13\xfd\xa4\x7f@KL\x0d\xe8\xd3\
+!\x8fus\xc5Q\x04\xb5\xf5\x22ib]\xfc6-\
+\x1a0_\xae@\x01\x8b\x0b\xc8\x1dW\xa3D\xeax\xc3\
+\xa1\x96\xcdT\xf3\x12XJ\xb1F\x0a\xebM\xba1_\
+K\xfa\xc6\xa07\x8c\x18\xcc\xd2HK\x9e\xb7V\x05\x89\
+\xf7\xc1\x15\x14\xda\x03\xc7\x00'\xebO\xe8>\xa0\xcc\xae\
+X\x82u2\xd6\x98\xc2\x99\xde\xdc.\xb8\xc6\xb2\xb6\xbb\
+\xe2\xb8\xfd\x1a\x94\x19d\xc6\xfb\xa5\x08\xea&\xae\xca\xb4\
+@\x0d\xeb\xa8.\xa1I\x8d\x16\xe6w\xa1\x00\x8b\xbb/\
+\x10S\xbd\x0d\x00Y\xd5\x87\xf0\xebx\x5c93\xf5\xb8\
+\x84\xcf\xbf\x0b>\xa2\x10j}\xbb\xb9<p\x02\x00\x83\
+\x16s\xa5R\xd1\xf4d\xcbc&\xf3H\x1e\xea*\x91\
+N\xf2\xc84X\x0cu\x17\x94\xdb\x81\x03cf\xef\xf2\
+\xec\xd9\xe2Ql'\x8fS\x1fG\xb6\x98\xb02\xc7\xd9\
+\x17 \xf1\xfb\xe6\xc2\xbe8\xe5\x02\xa1\xb4\xfd\xda\x140\
+W\x8ao\xa8D\xb1\xd0\xc5\x93!\x1d\xcfTx\xaa\x97\
+\x15\x94\xe5\xac\xbc\x92n\x09A\x0d\xbe\xd0Q}\x010\
+C\x9e\x8dNn\xf4\xa3\x9d6pX\x96+\xd2\xae\x9b\
+f\x03\x8e\xf60\x12\xeeT\x16W\xf4\xaa\x0f\xb0j\xb9\
+*\x84$\xa0\xb1\xaa\xee\x88\xd0\x9e\xbaz\xb6\x9b\xe3\xbc\
+\xf6\xcd%7%\x8b\x13\xd76\x90\xca9\xa3>\xd3\xd6\
+Y\x81+\xcb0\x01\xd1M\xeb\xd2\xbb+\xcf\x0b\xd9&\
+G\x842J\x92Q9\x08\xb6U\xc7\xd2N\xcc\x18-\
+}\x0e\xdc$(\xda\xa0,\xe2=s\xe6|H=e\
+b\x22\xe5iN\x8cR\xc5\x16\xcf\xc5\x06\xc4T\xdbL\
+\x0d\xb5(\x1f\xa9\xd9\xbcJ\xdf\xa2\xe7\xbd\xc1l\xe6\xea\
+\xb7d\x96\x22\xad\x02\xbf\x8b\x8c`dm\xe6`\xb5\xb7\
+]\xad\xf5*$\xd1#\xdc\x10\xc96\x89\x08s\x06v\
+\xf4\x88\xe9-\xc7$\x9f\xe8D\xeb\xb7\xc5\x8a\xd3>\xea\
+'\x19\xf8=\xfd\xea\xc7\xfc\xd9\x0d\xdaGM\xbeo\xc7\
+\x0f\xb6\x1c\x22\xb1\xc5;\x1b1N\x98,\xa8\xfa\xebO\
+TT\xd8\x13\x9a\xdb] \x8b\xb1V\xdf\xdc\x93g\x84\
+N\xcat\xa4\xa6|\xe5\xa26c\xf1\x5c\xe8S\xbdw\
+\xf9Y\x8d\x0e\x11\x84\xbf\xa1xqm\x1c\xd9\xcb\x08\xfa\
+\x02\x0a\xb9\xd1\x84\x97UZ\xd8\x97\x91\xca\x16\x8a\x98\xaf\
+\x89\x05kN\x22\x5cE\x0e\xabe\xcdi|C\x17\x96\
+\x13V>\xa2\xe1\x11\xb3-\x1d\xd2D\x96\xd2\x0a\xb10\
+\xb7VuX\xbf;\x84\xae~\xb1y\xa0p\xb7\x18\x95\
+8~\x8c\xaf!\x99\xa09\xdb\x03\x8c\x86Y\x09\xc1\xe6\
+h+\xcc&\x11\xab:\x8fR\xf4\xad\xff\xec\x8e\x8e\xee\
+@\x99\xf4\x88\x98\xcfW\x10Ek\xaf\xde\x15\x82\xc4\xa0\
+jDY\x12c\xb0\x0f!NPsG?\xd0\x9ac\
+\x15\xc3(\xa2\xc9\xb1\xf4\xe6\xc4\xe0e\x92\xec;\xe4>\
+a\xf5\xc3L\x8d\xcdY\x12\x9ck\x17l\x0c\x10\x1ft\
+\xa4FXw\xa9\xdf\xc5\x18\xe2b\xb2\x96\xaf\xa2;\x80\
+ z\xc2\x10\x04\x8b \xcf\xc2\xf0\xe6\x22Y\x03J\xf3\
+\xc6*r\xe8@\xc0\x5c<\x97\xe1A$\xa4Ipj\
+\xb7\xc9R\xb2\x1bS\xc3\x1a\x95\x09*(\x87\x19+\x8f\
+\xb2a\xb2\xdd\xa6\x1bX\x8e\xa4ft\x12\x93\xc8\x1a\xb1\
+\xdb\xae$ \x85[\x10\xc7\x1c\x85\x83%\xad[d\x03\
+o\xb3\x92B\x17\xa4%!]\x98V\xa0\x9f\xdb\x1f\x84\
+\xce8/\x9e_\xb00}\xcc\xaf\x10M\x084Z\xc5\
+\xaf\x84\xcc\x0d\x96\x9ed\xdb\x14.V\xe7\xe8[\x13\x9c\
+6\x94C\xff/\xd4\x99\xb1\xbd\xb8+\x1fyi&{\
+\x1f\xbef\x84m\xc0\x14\x01R-\xab`\x1c\x1c\xc1T\
+\xfc\x01n\xa4H\xc8\x81\x8d\x83JM\x8c$\x0c:\x09\
+N\xe7\xe4\xa1A[F\xa0\xaa/\x8cr\xa4\x9a\xb7C\
+\xe4\xc9|3\xe6b\x1e\x90[D\x97:\x02\x8a\xb2\xb8\
+n\xe6\xe7\xe5\xe1\x864\xccB5x\xaa\xc6\xec\xb5g\
+Q\x89\x16\x97?\x93/<\xad\x08\x97i\x00\x0b\xabw\
+,[\x0b\xe6\xc7}\x8c\xea\x0d\x06/\xbbSGgk\
+\xb6\x82%!\x12%\xd5\x8c\x83\xfc\xb2\xd0\xe0\xa0(\xa2\
+\x91|0\xc1\x0a\xab*\xdb\xe6\x92p\x1fD@Y\xa4\
+\x0d\xd7\x9b\x14T\x8aZrZ9\x15\xc4\x9aj32\
+\x03\xf1Z\x1d&8\xb1\xa4\x96x\x9d\x9a\x0dR\x13p\
+2_\xa0b\xf8XM\xbe\xadjzX#\xfai\xe8\
+\xc9q\x8e{^\x9c\x14\xbeRF\x06\xba\xb8\x05\x85\x7f\
+\x14K\xdb\x85\xea\xf8q\xf0b;\xeb\xa62p \xce\
+/\xe0\xb41\xae\xaf\xf5\x9f\x89V\xdb1j@o\x9e\
+\x03\xd0b\x01M\xf3\x83F\xbf\xa6\xc5\x1f\x0e\xce)\x98\
+\xee\x8b\x02\xa0E\x9e\xa5\xacE\xf7<\xb0\xca\xda\x8b`\
+\xd0\xd89K\x129\xa9\x1bX\xc8K\xcd\x868\x86\xe4\
+\x8c\x81d\xba&\x17\x8b\xae?&\xb6\x887\xe3\xcd\x18\
+\xa1\x94E\xb1\xa9\x87\x16.\xb8\xdb\xa8]Rv1c\
+\x1d\xf9\x0c\x17\xdc\x94\x8d!\xd1om\x03\xcb\xe9\x9b{\
+\xbf\xd8C\x16\xbb\x9fHV}%\x15\x17]'\xc1\xf0\
+\xe3\x18\xa0jJ\xe1!|\xa0h\x89\x10\x04\xd8\x1e\xc9\
+W#h\x01\x05Vw\x95j8\x85\xf4+\x10{\x9d\
+u\xe8\xa2S8\xc0=e\x08$0\xc1KF\x1b\xb7\
+\x9b\x82$\xa3\xc6\xd8\xd9\x16\x1e(\x18\x1a\xed\xb6\x1a\x06\
+\x09\xdf\xc8Q~\x9a\x1a\x09w1\xd0\xa14d\xf8\x01\
+\xbe\xcdEU\x00\xc0\x07h;\x97r\xa4H\x07\x7f\xbf\
+\x804\x8ed\xcdqp\xf9\x00\x16\x07T\xae\x88\x5c\xe9\
+\xc1}u\xe5\xf6\xc17J\x8d\xdb\xaa\xd0\x11%q\x9e\
+ X\xd4\xf3n\xb5\x98M\x1e!\x1b\xf0O8\x10\xbe\
+1z5\x86\x0b\xc1\x81\xc724\x02J&|L\xd3\
+\x22x\xbf\x86\x8e\xd2zc4:t\xcb\xad\x8e\x5c\xc3\
+\xa8e\x0d\x10\x88\x0e\x9e=?\xf6\xeb\xa6/\x1d\x02\x15\
+9\xcfA\x9c\xc2\x83.\xe7c\xedt\x88h\xec\xbd\xfe\
+(\x8b\x02n\xbb=Wp2\x1f\xc9\xc1]\x8e2\xa0\
+\x0f\x194\xcd\xb9\xde\x9b\x86\xb08\xb2\xf2\xe09\xac\x08\
+\xa6;\xc2a\xb4j2\x01\x96}\xdd\xdf\xd9HC\x93\
+\x81\x18\xab&6`\x10Se\x83\x92\xccD\xd1g\x84\
+\xa1\xb5\xaa7;`\x94!\xa0f'1\xe1G\xaa\x8e\
+\xbd\x05\x08<\xa6\xa0{\x9b\xce\x94Sp\x88\x0a\x14\xa2\
+yQ\x0f\x10\x16_\xe8\xf5A%\x86\x9cT\x8f\xa1H\
+&\x0b{\xc0\x9b\xbfb\x00t\x89W\xba\x0eZwf\
+\x89k\x80\xb2\x8d@e0K&\x9a\xab+\x90\x8ey\
+y\xae9\xa0`\xe4\xd5\x9b}d\xdc\xfd\x0a(\x12\x1c\
+\xb9\x0e\xc5\x0eX*z\x82\xe5!\xfc\xa1\xd3\xefEn\
+\xc1\xe1\x83\x1f\xa5s$\x13}I/:\x02\x8e \x17\
+o\x92R\x10:\xcff\xd5;\xa0\x98\xd6\xe76<v\
+|\xecM&V|\x15\xb4\xd0\x93\x80\x86\xaam\x83\xcf\
+1G\xc5^\xee[\xbb~\x8b\x98\x0d\xe0\xe2\xe2!a\
+\x22\xcb(\x5c*\xdbb\xb1D\xa3\xc3x\x80\xf5\xdcQ\
+\x0f\xec\x06\x87\x1eH\xbe\xd3je\x1e\xb2N]\xf5\x8a\
+\x22*\xd1@\x04&n\xe8\xb4!\x03\xae\x0a\x90OF\
+\xa9,\x8a\x18\xb7li\x1a\x1a\x15s6\x02\x13\x02\x09\
+`bL\xb3H~\xb2\x1c\x8e\xcb\x11\xf1\xe1\xbcJ\x9b\
+\xfb:Y\x80\xc6\xcd\x22\xd9:\x8bu\xc5E\x16_ \
+d\x80\x10\xa9S\xaf=|#\x09\xa1\x0e\x17\xaa$6\
+\xd1\x94\xc6\xd4=\xa0f@T@B\xf4\x19\x8a\xb4\xb2\
+n\x1d\xce\x03\xbc\x86q\x22\xabG\x81\xbc\xcd\xa1w<\
+\xd8\x1aN\xf1\xc0(\xbf\x8c\x90\x0e\x0eo\xb5\xdd\xfc&\
+\x5cX_5\x9c4\x8d\x12#C\x0c\x0e\xae\x18\xc3\x9e\
+]\x98\x1b\xf9>\x88\x01N\x0a\xecZ\xa2\xf2\xfb\x18~\
+uX\xe9\x89\x92\xe6\x9d\xdd\x16\xa5*\xa4p\x10\xbd\x82\
+mb#'\x9e\xab\x02\xc5]\x81\xb4\xbe\xc3\x954\x86\
+y\xa1\xd4A\xb4\xca*\x97f\xc3\xe9\xea\xf0\xed\xe0G\
+|\xee\xae\xa0\xf0S5\xd8\x88\x15<\xba\xd8\xacH\xc9\
+\xa3\x19\xb0\xd5\x10>\xb6Wt\xe0*\x8fC\xef\x0be\
+\xff\x08\x5c\xda\x1er[2\x9d\xd3\x82\x141\xab8\xe4\
+\x91g\xb66\x8a\x835|f?4\x19|\xe6I\xb6\
+\x81\xb9q\xfd(\x07\xb8|h\xc6\x85\xc6\xc4\xd8X0\
+\x8d=:\xc5\xb86+\x1b\xbb\x80jG\xe0\xb0\x9e\xce\
+\xe6\x86\x8e\xb0\x88\xb5\xa2{i\xb1+\xaeW\x93\x96\x8a\
+A\xe5\x83o\xeb\x13\x80L!zK\xf9H&\x9f_\
+sP(\xc5\xc7]\xe3i\xbbi9\x0b\xd0\xb4\xfdM\
+a(\x9f|\x8d\xd7~\xc1{>0\x9d\xd7\xbd\x9dm\
+\x0d\x1fX\x5c\xd5npY\x0dxb\xe40\xe5k\xa6\
+y6\x95\x1d\xccX\x1f\xa1\xf9\x01\xa6\xf5\xc0F4\x90\
+\x994}\xf7\xc4\xc2\xc0S\xecxh\x81\xa7\xde|X\
+p\xdb\x99\xf38\x1c\xa7\x90&\x1b\x07\x0c?8\x98\xa1\
+\x96\xfbQa\xc3V\x7f\x98\xcd4\xa8\xe0\x19\xc7*A\
+\x04\x95\xa1\xef\xc8;\x96\xe3s\x00\x1b\xf9\x18K\xb9:\
+\xdbF\xc6\xd6v\x12\xc7\x88\xcd\x821\x0f\xe2\xe4\x9e\xc6\
+\x0cG\xd9V|\x0a\x0a6\xa8\x8cP\xac\x88\x22\xb6\xaa\
+\x10\xaa\x13\x87\x8b\xb5\xd4\x08\xb0D~\xb2\x83l\x93'\
++YGW\xb8\x19c\xb9\xc0\x5c&\xcc\xba\x9d5(\
+|\x126\xa81\x8d\xc4\xe0\xfaV&4\x82r\x15[\
+6\x99\x0f4\xde\x08\x1e\x8c:\x19f\x00S\xa6ZU\
+=\xc1\xaa\xd0\xc0\xb8\xfc\xdbZ\xb7\x94\xcd\x06(\x9b(\
+\xb7\xf4X\xb5@\xde\x0c\x8c\xca}\xa1\x05\xd4+\x06\xe8\
+V\xddk\xdd)#<\xf3(E\x85\x0e1t\x91\x06\
+2\x91\xb1\xe4\xc1\x9b\x9d\xad\x98\x8a\x11\x06\x0b\xdd\x8e}\
+\x22\x00\xd9\x090\x89j\xaa8\xb3M\x1a\xccR\x0e\xd6\
+~\xfd\xcc\x99\xf3v\xc8\xa70\xfd'\xef\xf0\x03\x8b\xf1\
+?t\x9d\x0e\xffL\xbdA\xbf%\x1c\x9fH\xb4\x0d\xb6\
+\xa9\xd3*\xc04\xa8\x8d\xe4\xf8\xe7G\xff\xba\xc1W8\
+\xe1\xaf\x9c\xa0\x879i?\x1a+\xa0ClP\xc4\xe9\
+\x0a\xa1P\x86\x1b\xf0n]\x10\xdbr?-\x0a\xc5\x92\
+\x7f\xbf\x89.\xf0`\xf32\xb8S\x84W\xb5\xb1\xbe#\
+\x8c\xfa06EXq\x1c\x8d&@]g\x1e\xfb\xb6\
+}l\x04\x05\xba\x14\x91[m\x7f\x19\x02_\xa9%f\
+S{\x95\x16x\x10\xfb\x8c\xa2\xa9\x16-\x9f\x08\xb6\xa4\
+z\xafh\x94\xfe\xf6\x85\xaf\x1f\xf4\x01\xa8\xfa\xe4\x92\xc5\
+\x1e\xec\xbe\x8a\xebf\x91#\xc1A\xbf\xc4\xea\xbf\xd0\x87\
+\xde\x85\x0df\x98b\xa8\x07u\xe7l\xc0A\xf5\xce\xe8\
+\xbd`e1}w\xed\x92\x8a\xb9a>*{sP\
+\x86q#\xd2.RIF\xb7\x06\xc2\xb01\xc5I\x15\
+P\xc9\x9e\x0d\x1a\x82L*\xf8\x81\x96yJ\x1c\xf9\xe1\
+\xe4Y\xbc\xb7\xa9\x8a&\xb8H\xb1\x87\xe1\xd3`\xd3\x9b\
+6\x9d0]\xcf\xca@>@\xe1!\xd4:E\x94&\
+d.2\x00c\xc0\xa4\x90\xed\xc3\x83:\x18\xf0#\xc6\
+A'\xb0!\x81\xb5\xbf\xf2\xc6!\x80\xaao\x0e`v\
+\xcf`\xa8h\xe2\xa8\xcct\xb3YU0\xad<\xe8\xc5\
+R\x1b|\x10\xd9C\xd7\x03\x5c\x11\xb9\xda~#\x1cv\
+\xd7\x99\x02EH\x91\x0c\x17=\x86\xca\xe0\x96L\xe0W\
+2~P4)\x0b>8\xcanX?\xcf\xc8\x9bv\
+\x94\xb4!\x84=\xa1\xa51p\x0b {\x9b\x85\x1a\x95\
+\xe3n=.\xedj?N\xeb\x15)\xb3-\xd26\x95\
+'\xb0j\x7f\xe3\xc6\xc9b\xa6\x8d\xad\x12(~\xe9\xb6\
+\x8d\x91\x83\xd4H\xdb|\x11\xf5,I\xa3>\xbd\xd1,\
+\xe3\xf1\x10\x9a\x09o\x8f\xd0\xb6S\xcd\xbe\xd1\xc0\xa4\xf5\
+u\xc9aCh\x96\x1dQ\x1d\xf7-f;r\x85A\
+\xb9\x09\x94\x86\xd3 \x133\x1aMB\x06\x831-8\
+8\xb1\xd5K\xcd\xf7L\x06_i\xb8\x9d\x92ii\x06\
+\xb8\x0f>\xea\xd8[\x0d0N\xf6s\x07R\x1f/\xe2\
+\xd3_\x8f\xf9\x02Y\xd2wj\xc8sa\xed\xf7X\x8d\
+\x0f\xdd\x168\xe5\x96y\xdc\x7fP\x0f\xfe\x85$\xb3P\
+\xda\xd1\xe8\xb9EWV\x9a\x00P`\x90\xf2\xfc,]\
+\x19%j\xdaX<i\xd0\x02\xc1\xa9\x8a\x85\x05\x89\x94\
+~]u$\xc8\x909$\x0b\x19\x22\xab\xf3\x1c\xf5\xff\
+\x07\xe8@\x09\xd0k3\x8bV\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x1a\x04\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00H\x00\x00\x00H\x08\x02\x00\x00\x00\xda\x8f$\x10\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x19\xb6IDATh\xde\xbd\
+[w|\x95\xe5\xf5?\xe7y\xd7\xdd#\xfb&!\x8b\
+\x08\x06\xd9B@@d\x08\x02\x05\x11\x10\x5c\x94*\xa3\
+P\x95\xd2\x96\xe2@\xdcV\x14E\xa8R\xa8\x8aU\xb0\
+(\x8e\x16Q\xa9\xa2le\x05d\x86M\x06d\xef\xdc\
+\xe4\xeew\x9c\xdf\x1f\xf7&\xb9d@B\xe9\xef~\xc2\
+\xe7r\xef}\xd6y\xce\xfe\x9e\xf3\x22\x80\x01\xda|!\
+\x00\xb5\xf6\xb1\xe5\xf7\xff\xd3\x175lA\xed\x9f\xc3\xae\
+\xb5b[\x1f\xf1\x7fL\x09]\xb9)u\x88\xaak\x12\
+\xd6\x16\x01mmC7\x88\xaa\x1b\xb0 \xeb\xc8`\xbc\
+\x16\xbbn\x08\x1b\xb1\xe1\x8fZ\xfb\xfe\xc6\x10\x86W\xee\
+\xd4\xec\xcb\x1bD\x0cB\x82\x94\xd0\x86^\xe1\x95\xdbu\
+\x80\x81\x1c\x80\xd0\x91\xeb\xc7\xd6\xc8\xben\x92\xd0\xc4\x9b\
+\xe7\xc4>.1\xdd\x05\xdf\xb966\xbaNi\xe4\xdb\
+%z\x047^\xf6\x10\xe3\xc5\xc4\xc7b\x9f@\x80\xf7\
+\xcaW\xb5&{\xe1\xf6\xb0\xc3\x9a\xdc*\xc7B\x020\
++\xe6\xc1^\xc6neJ\x85K\xf3\x00\xe2\x7f+t\
+M\xc2\x8b\x80\x98(%/\x88{\xce*\xd8\xbf\xa8Y\
+74\xa2Sq\xa0\xc6\xa3\x04\xda\x98C\xd7\xc1@v\
+\x95\x1b\x95I\x9dj\xbf{m\xca\xf2%\xf1\xf3\x93\xa5\
+x\x00\x0c\x9e\xa9=\xdc\x08\xdd\x0e\x86\xfd\x85M\x8f\xe4\
+\xa3\x1e\x8b}\xda\xc0\x99*\xe5\xf2s\xbe\xa3\xcf\xa6N\
+\xf1\xa9\xfe\xb6/\x0e[3-\x1d&\xaciN\xae\xff\
+\x92\x06\x90\xe3\xcf\x1fj\xce|/e\xe9\xfc\xd8\xe9\x06\
+Nj\xbc\xf2V&6\xd2@\xe1j\x8f\x80\x88a\xe3\
+\x05&\xcc\x8e]h\xe2\xac\x00\xb0\xadn\xcbCqC\
+\xcc\xbcN&\xf5\xba\x5c\x02\xb6\x9f0j|/\x0a\x94\
+(\x84nM^Z\xfa7\x99\xe4\xc9\xf6\xbb>H\xf9\
+\xcbM\xba\xa40\xb6\x84\x93\x04\x88\x10+F\x84\x99\x15\
+\x14\x18?\xc62\xe4\xcd\xc4\xa72\x8d=\x1bm\xcd\xdd\
+\xf6\x07\xe3\xc5\x14\x02\xf0\x92'\xcb\xbd\xe7\xbe\x98AD\
+$1\xa1#J\x8b\xd7'\x8a!\xda\xca\x95\x0a\x02v\
+\xb3\xfe\xe6(.\xe6\x89\xc2\xd7\x5c\x9a7A\x88Y\x9d\
+\xfc\xec@S\xcf\x10\x07B,\x0aM\x8b\x13\x22\xa7\xda\
+G\x06\xf9\x83\x88\xb7\x19{\xaeOy}Q\xdc\x9c=\
+\xae\xac,\xf7\x09$D\xc4d)}\x90y\x8c\x06@\
+\x00\x87\x5c{SuQ\xa9\xba(\xd24\x89\x89\xed>\
+t\xcb\xb8\xa4\xbd\x84\x85\x96\xf6j>\x99T\x0d`j\
+\xe4\x14\xaf\x16XR\xf4\x96B\xaa\x1e\xa5W\x13\x16\xf4\
+7v\xc7+\xa5\x11\x01{\xe8\xd3\x07\x9anA\x00D\
+|4f\xda\xb2\xc4?%\x08Q\xbb\xea\xf7\x7f\xe3\xdc\
+\xd1\xa8\x1d\x0e1\xa90\x90\xab\x11\x11@\x96{\xcf`\
+kW\x00 \x22cH\xc8;\x14\x97tX\xc7(\xf8\
+N@\x01PU\x00\x04~v\xf4\xac\x93\xdes\xab*\
+>!\x00\x01\x85\x97\xe3\xe7\xa7J\x09A\xda\x82J\x04\
+\x08\x83M=\x2283\x22>\x1d\xf7\xc8\xf4\x88\xb1\x1c\
+\x92\x17<\xefTl0s\x86q\xd6AO\xc4M\x7f\
+-a~?}\xec\xfb\xe5\xaf\xec\xa8\xdb\x5c\xa5T\x5c\
+\xf2\xe7\xf42&\x07w\xe3\xdak\xf7\xf0\xba\x09k\xb2\
+\xad\x08\x88((\x042`\xaatS\xa61sS\xed\
+\xb6}\xee\xe3\x04\xa0G\xdd\x8b\xf1\xf3%&\x22b\x8a\
+\x14\x0f\x00\x12\x13\xee0\xf7\x91A\x9e\x195a\x82u\
+\x08\x03\xe2\x90v\xd4\xed\x9f\x195\xfe\xdb\xf4\xb7^\x88\
+\x9f5\xd9>\xbcH.\xffG\xd5W\xc3,\x93\x87[\
+\xee9\xe99\x0c\x00=\x8c\x9d4\x02M\xebP(\xf3\
+_[E=\xd3\x030\x15P%P\x01\xee\xb1\xdf\x8b\
+\x00\xcb\xcb>\xf2h\x01B\xec$\xc4\xcf\x8a\x9a\x02\x00\
+\xb7\x9b\xfb\xa4\xeb\x12\xc7Z\x07\x9a\x98\xde\xc2Ls\xa2\
+&2 Db\x00w\xdbn\x7f\xc0>J\x8f\x22\x00\
+\xbc^\xba\xfe\x9d\xf2\xcf\xfa\x1a\x86\x0e4\x8dV\x09\xce\
+z\x8f\xdbyS4o\xcf\xf3Tj\x1a\x84YE\xba\
+!\xd2\xd8VH\x85\x80\x10%D\x8f\xb0\x8e\x0e\xaa\xaa\
+\x06`f\x96\x1c\xff\xc5<\x7f>\x22\xf61\xdc\x82\x08\
+7\xeb\xd2v\xd4\xefO\x95\xe2\xef0\xf5\x19k\x1d`\
+\xe1\x8c\x22\x0a\xd8p9\x08\xc0!\x0b~\xcc\xf2\x9c\xbe\
+\xe8/H\xd7%^\x0e\xe4|[\xfbe\x85Rt\xc6\
+w\xcc\xca\x1b\xd6\x95\xefJ\xd7;n\xd6wZ^\xf8\
+u@S:n\x12\xb1\x9d\x84\x85\x85\x7f\x88v.b\
+\x98u\x14\x00j\x00\xbf\xb8\x0e\x1a8\x93\xc4\xf4G\xdc\
+\x87\xce\x07\xf2\xef\xb6\x8e\xd01\x91G4rz\x03\x13\
+&\xda\x86\x02\xc0\xa6\xda\xdd\xbb\xea\x8f\xd6\xaa\xeeD1\
+\x8eG\xae\xc9\x5c\x22$\x88\xd1w\x98\xfb\xdc\xa2O\xdd\
+Zw\xd0\xa7\xf9\xe2\x04Q\x03\xad8P\x1d\xd0\x94\x17\
+\x93\xeeW4\xed\xed\x92-\x0d\x9c\xb81\x99\x1e\x07 \
+\xb6~%\x88&\xce4\xcc2:\xb8\xddg\xd5\xff\xdc\
+P\xf5\x91S\xab\xadQ\xab\x15M\xb5\xf1\xe6\x1e\xfa\x9b\
+8\x80t)!V\xb4\xd7*\xaeG.\xbd\xb2\xad\xfe\
+\xf0q\xef\xc5\x1d\xf5\x87\xbf\xab\xdb\x97\xa1Ou\x08\x11\
+\x8d\xbcC\x00\x00ZT\xf87#\xa7\xfb0\xf5\xe9I\
+\xf6!\x0fD\x8e@\x84\x12\xa5rV\xcc\xe8\x13\xee\xcb\
+\x00\x5c\xae\xbfD!\xedF\xd1\xd6R\x14\x1b\xaf\x19\x15\
+\x90\xc7\xda&\x01\x80\x06\x18\xd0d\x09\xb5\xa1\xa6\x01\x85\
+r\xb1Ks\xd7\xab\xae\xbbm\xc39$\x1e\xd1\xc4\xf4\
+O\x15\xbf\xe3T\xdd\xb3\xa3&?\x12y\xcfps&\
+\x00\xfc\xbd\xf2\xcb~\xc6n1\xbc\xbdq\xc1r\xa5\xe6\
+\xcb\xda\x1d\x7fOYd\xe0\xc4`|\xd5\xcf\xd8\xe5\x80\
+\xfbL@S{\x1b\xd2;\xeb\x126T\xee\xecH\xda\
+u\x8dq\xec**\xea\xd5|\xe5r\xb9\x02 \x13\xf4\
+6\x0e9\xe7\xcf\xeb\xacK[\x9d\xf4\xfa$\xdb\xe8\xf3\
+\xfe|\x8f\xe6a@\x08T\xafy\xea4\xcf\xda\x94\x97\
+'\xdbFg\xe8;\xf73\xde\xf2\x87\xd8\xe9k\x92\x96\
+|Z\xbd\x95\x00\xa8A\xc2.\xcbeO\xc4=\xc4\x03\
+\xdbP\xf9\xe3\xe3\x97V..\x5c{\xd4\x93\xf3h\xf4\
+\xa4O\xabv[\x98ys\xf5\xfe\xeb\xb2\xec\xd8!\xe3\
+\xd1dy\xa3\x05G\xa2\x94\xae\x12h\xc0\x199\xf3'\
+U\x1f\xddi\xb9\xfdvS?\x91\xf1VN\x17\xcb\xdb\
+\x00\xc0G\xf2PS\xff(\xde\xb6\xcf}\xf4\xed\xf2\x0d\
+\x1b\xaa\xb7\xecu\x1d\x8b\x11\x22&X\xef\x10\x18\xc7#\
+\x17\x5c\xd1\xc4\x19\x92\xa5\xd8\xdf_^\xa9\xden\x9a\xf7\
+\xd4\x9c\xc4\x01\xa9o\x1c\xfc\xd0\xe65\x9e\xf5]\xee*\
+%\xbdV\xb2\xb1\xc9xP\xfbC\x90\xabQlh\xf3\
+\x0e\x10\x13\xa4\xa4?\xc7/S\x09\xaa\x94\x8a\x1c\xdf\xc9\
+\x83\xae\x1fu\x0c\x97',\xb6p\x92B.3\xd3\x01\
+\x80\x06\xa0\x02\xae\xab\xfe\xf6?\xd2\xfe%O,\xec\xdb\
+\xbbgNn\xde\xb2\x95\xef\xc4\xe5Y\x9e\x89\x9b)\x00\
+\x22\x12\x00 \xd2\x175;*F\xd1\xea\x15o\x06\x97\
+\xaf\xadu\xde9\xfe\x1e\x7f\x9e\xdb\xa9\xb9*\x02N\xa2\
+\x16\xd8\x11\xb5\x07\xbd\xa2\xeb!\x0c\x10\x1e\x88z\xb4\xb7\
+qh\x99\x5c\xbc\xb2da\x7fC\xafZ\xd5\xe9\x10\xa3\
+^\x8d\x9f\xcf\x83\x8a@\x04@\xc0\xb2}\xb9/\xa9\xff\
+\xd8\xfd\xc3\x96\xb8\xd8\x98\xe0\x8e\x81\x80\xff\xa1Y\xbf\x8d\
+>\xa4\x9b\x1b5\x89A\x88\xb0\xb9\xa5o|s\xf0_\
+\x11\x11\x11\xa1\xd3\x10\xec=p\xe0\xce\x09S\x80\xa0\x05\
+U\xc1!\xed\x0c\xa0\xa8#\xd1=\x00\x10\x01\xc1\xa6\xea\
+\x7f\x14\xf8\xf3\xec|\xfc \xf38\xa7V\xfff\xa7\xe7\
+gGM\xf3j\xde\xf0Dpc\xf5\xd6\xd7_y>\
+.6\x06\x1b&\x8a\x82\xf8\xe1\xeaU?\x19OT(\
+5\x8d\x8bE\xf6\x8c\x89\x88\xb0\x07\x97\x0d\xee3x\xe0\
+\x80n\x19]\xdb\xb6\x0e\xedI\xff\xa8\x054\x02\x00\xc8\
+\xae\x99{\xfbT\xdf\x07\xe5/\x9f\xf2\x1c\x18e}\x90\
+\xc0\xf0r\xf1[Q\xbc\xcd\xc8\xa4\xf0[=/\x15L\
+\x1876$\x16\x0dwo4\x19\xe7?>\xf7\xfb\xba\
+\xfd\xc1\x9d\xdd\x9a7\xa1S\x82\xa6i\xf3\xfe\xb8\xf0O\
+\x8b\x9f\x09\x12G\x04\x03\xfb\xdf\x9a\xa6s\x5cM\xa1\xae\
+A\x1b6\xc4\xfb\xe1bI\xec\x1a\xec&\x02\x00\xaf\xea\
+\xf9\xacr\xe5\xfa\x8aW;\xeb\xba\x1d\xf6\x9c\xfc\xa8\xea\
+_\xe1Cj\xd5\xfa\xb4\x8cT\x9e\xe3\x08\xe0\xf8\xc9\xec\
+\xf1S\x1f\xf8q\xe7.\x02\x02\x82\x09c\xee:\xe1\xbd\
+\x18\x1c&1Q\x96\xe5\xa3\xc7O\xac\xfb\xe7\xc65\xef\
+\x7ft\xe4\xd8\xf1\xe0\xc6V\x8be\xb8\xa976$u\
+\x1c\xe3\x0c\xbc\xd9,D\x98x\x1b\xc7\xf8\xb0\xb8\xb5C\
+\x02\x89\xfc\xb5`\xed&\x02s}\xa7s}\xa7\x1cb\
+\xf4\xc3\x11\x130t\x8f\x08\x04\x01\x0a\x98-\xe6\xe0\xcc\
+\x97\x96.\xdb\xbec\xcf\xb9\xf3\x17\xce\x1d\xcdB\xc0\xd8\
+\xd8X\x8f\xe4\x0f\xda\x01\x11\xb8\x9a\xb3\xe5&\xa31\xb8\
+\xa0\xc7\xe3\x09\xeeSQV>\xd2\xdc\xfd\x83\xca\xef8\
+\xe4\xac|Lg]\xda8K\xa6C\x88\xbc\xe4/Y\
+_\xfd]\x8dR\xeaQ\xdc\x80p\x15;\xd1\x1a\x22B\
+|;\x1dE0C\xb1\xf3\x96\xb7\x12\x17\xda8\x13B\
+0D D\xb4qfg\xad3\xb8jeU\x15\x00\
+\x14\x17\x97\x06\x02\xb2$\x8a\x08\xc4!\x86T\x19)\xb5\
+$\xaa\xb4\xacl\xd1\x82\xc7\xce_\xcc\x19\xd0\xbf\x1f\x00\
+x}\xbe\xd3?\x9f\xaa\xf1\x16#\xa2]p\x08(N\
+\xb5\x0d\xbe\xcd\xd8]\x03\xadF\xa9&P,\x9c\xd5\xa3\
+\xba[/\x19\x5cU\x83\xf8\xf6;\xc0d\xc9\xf1Z\xc2\
+\x1f\x0cL\xcc\x0b\x14\xa6I\x8e\x06\xe1 \x1d\x0a5g\
+*\xdc\x1e\x8f\xc1`\x18;\xfa\xce\xac\xc3G3\xfb\xdf\
+*I\x22\x10\x14\x16\x97D\x06\xcc\x0c\x09\x81\x00a\xbc\
+\xf5\xb6W\x97\xbc\xf1\xf9\xe6\x8f-f3 \xe4]\xca\
+\x7fa\xe9\xb2\xe3\xa5\x17$s\x17\x89\xe9\x11@%\xf9\
+\xad\xf2\x8d6\xce\xe0Q\xbd2)\x0d\xe1w\xfb\xab\x16\
+W3\xf7\xe1QUH\xb8\xf5L\xba\xd7~\xd7\x8c\xc8\
+\xbbu\xc8\xd5k\xf5Q\xbc\x05\x81TRw\xbb\x8e\x9c\
+\xf7\x17HL<\xee\xb90\xf1\xa9\xc9\xbf\x9f7W\xd3\
+\xb4m\xbbv\xf5\xed\xd532\x22\x02\x08\xde|{\x95\
+\xe1c\xe7\x9d\x96\xbe\x87\x5c\xe7W\x97o\xaaQ\xeb\xeb\
+TOj\xf7\xb4\xee\xdd2Ndg\x9f8y\xfa\x9e\
+\xa8\x81\x8f'\x8e\xf5\xaa\xfeI'\xdf20\x0b\x0b\xa5\
+\xac\x80@\x08\x04\x00^\xcd\xe3T\xea\x1a*\x13\x1d\xc8\
+h\xb0\x8d2R(\x0eN\xd5%\xddk\x1f?\xc8\xd4\
+\xc7\xca\xf4<\x12\x87\xc4\x011\xa4:\xcd\xb5\xa0`\xb9\
+I\xe4F\xc7\xf64p\xe2)W\xe1w5'\xd7\xaf\
+{w\xe4\xd0\xa1\xd4\xe0[\xb3O\x9f\x9e\x7f\xdf\x1f\xde\
+OX\xc0\x01\x9e\xf0\xe4\xf42\xa5\x1ds]z\xb3\xf0\
+3\xbbh2q\xba\xe3\xae\xbc\x15]\x1f\xbe\xd5\x9a\xca\
+\x10dM\x1d\x9c\xf5\x9cK\x06\x0e9\x16D\xea\x10\x18\
+\x80L\x81\x1a\xc5\xa9\x91\xd6p\xe0V]v\xebn\x1a\
+\x01\x8cm\xa2Y\x88<r\xe3l#GZ\x06w\x91\
+\x92\x8cLDPy\x04\x86\xf4T\xd1_\xc7\xc5\xf5\x98\
+\x9et\x1b'\x10\x22\x02P\xb1\xd7\xb9\xe0\xd4\xfa\xb8;\
+\xba\x8e\x1du\xa7\xd1h8|\xe4\xd8\xb7\xeb\xbf^\x99\
+8;E\x17\x85\x08\x08t\xd6S|\xc6{yBt\
+?\x1d\xc7\xaf\xbc\xbcev\xa7a\x11\xa2\xa1\xd1\x92\xff\
+\xe2\xcc\x9fs\xf2\xfd\x9a\x80\x9fG\x1e\x81\x11\xa8\x0a\xc9\
+\xa3c\xba\xe7\xba\xcbN8/_+\x16\xa1V9c\
+\xbc\xb2\xb2\x86\xcd\x1cHpo\x0e\xd9$\xdb\xa8\x99Q\
+\x93-\x9c\xa1T)\xfb\xd9\xb7wA\xca\x18I\xd2\xb6\
+\xd5d\x7fZ\xbc\xcf\xc4\xeb\xe6%\x8d\xc80$\xfcP\
+q\xea\xe7\xeas~MI\xd3\xc5\x054eLt\xcf\
+T}t#\x82\x8a\x08\x0c\x01\x11T\xd0\x04\xc6\x1am\
+xP\xe4=\xaa\xfcCEvv}\xc1\xe7\xc5\x07\x1f\
+N\x1azwL\xdf4C\xd4\x83\xbf\xac\xdeV\x91\xdd\
+\x0e\xc2\x9a3\xad\x19\xc7\xa0U\xc2\xba\xe8\xd2\x9e\x8c\x9b\
+\x97*& \x12\x07\xe4\x22g\xbcI\xb2\x1a\xb4\x1d\xce\
+csN\xbd\xab\x11\x01\xc0\xc4\xb8\xfe\x7f\xeb\xf6\x1b\x0e\
+\x18ip\xa0.oK\xc5\xe1\xfb\xe2\x06\xf60%\x02\
+ 5Bu\xac1P\x0b\x9ddke\xf6]\xd1\xdd\
+\xf1\xcamG\x1fX\xf6\xfd\x80'\x10@#\xe8\xbb\xe7\
+\x99\x22Ou3\xbf\xda6xJ\xcd\xacb\xdb\x08\x11\
+\xc2H\xcb\xed\x7f\x8c\xfd\xad\x84\x1c\x01\x01!\x01\xd98\
+\x0b\x92\xaci\xb4\xb3\xfa\xd4\xf6\xcc%S\x8e\xac\xa8\x0e\
+\xb86\x97\x1e\xaa\x088_\xearowc\xc2 [\
+\xca {J#\xfb\x1b1\xc8p\xc0\xe6\x9b\xb2c\x11\
+\x82)^\xb253gY\xb5y\x19\xa6x\x04\x00\x82\
+\x1f+N\x16y\xab\xaf/y\x09f\xd0\xd4\xa2\x0c\x15\
+\x0a\xd2FX\x87,\x8c}\x94\x0b\xfa!@/y\x05\
+\x14\x18#\x9e\x91\xc8S\x7f{J\x8a\xce\xbe\xbd\xfat\
+\xa1\xafJ\xaf\x97\xd6~\xfa\xf7\xc5;>\xd8r>\xcb\
+.\x1aS\xf4\xd1\xac\x09\xf3\xc6p\xaa\x82\xef]\x8dq\
+I\x86\x88\x1a\xd9-k\xaa\x89\xd7\x05\xbf\xf4k\xeac\
+\xd9\x1f=\x93~O\xa4`\xcasW\xcc<\xf6\x9e[\
+\xf1\x05\xe7\x88\x8c\xd7@k\x8d\x86\xd6Kg\xc1|,\
+\xbcj\xded\x12\xd3t\xc9K\x1c\x8b|\x9a\x7f\x8fk\
+\xff'5\xff\xdeP\xbd)\xd3\xd4\xc7\xca\x99\x10\x89c\
+\xc41\xcd,\x88\x8c\xc1\x05o\xc9!g.\x11\xbd\xf1\
+\x97\x97\x06ef.^\xf3fq2-;\xfce\x91\
+\xafFb\x82Cg\xe7\x905\x18\xf1\xb03  \x80\
+\xc8\x04#/\x09\x8cC\x80\xaa\x80{\xf6\xf1\xb5\x0c\x98\
+\x9d7|^\x9c\xb5\xe8\xcc'\xd5\x01Wp\xe4\xb2\xa4\
+G\x97&\xcd\x1bc\x1bp\xc1_P\x22\xb7\x87\x87W\
+\x98\xfb+\x91]\xc4\xe7\x12\x9e>\xe69\xf6C\xdd\x0e\
+\x9f\x16\xd0s\xba\x15\x89\xcfw\x96:!\x10\x87$q\
+\xaaQR\x8d:E\x12\xb4=\xce\xd3\x0f\x9dX\x05\x04\
+\x1f\xaf\xfd\xdb\x9a\x0f>\xda\x7f\xe0\xd0\x99_\xf6\x07d\
+\xf9\xde\xe9\x0f\x17\x14\x15s2e\xda\xd2\x07\xda\xd3\xfb\
+X\x93\xbb\x99\x12\xa3Ds(\xba\x0f\xdd!\x11\xe1i\
+W\xd1\xe6\xb2_6\x96\x1f\xb8\x7f\xc6\xb4o\xbf\xdb\x9a\
+\x93\x9b\x1f\xaeJ\x88\xb0\xb3\xdb*+\xa7'\x02\x97\xea\
+\x9bzqIY\xa0\x06Z&o-t\x0c\xc3*\xf3\
+M\xe4q\xc8\xbdQ\xba\xd2\xa3z\x83\xc1\xd4\xac\xc8\x07\
+\x92\xc5$\x95\x88\x01\x02\x80\xac\xb1\x80J\x82\xc2xF\
+\xb7Y\xbb\x98x\x9dK\xf6\xfdz\xcec\xc1\xb9;\x7f\
+\xfa9)1\xf1bN\xde}\xf7\xde\xf3\xe2\xe2\xa7\xd6\
+\x7f\xba\xf1\x95e+\x18c:\x9d(\xc8\x98\xa0\x8b\xb4\
+\xf1\x06\x91\x09\x01Mv*\x9ej\xde[\xe9rr\x8c\
+eg\xed\x8d\x8b\x89\xf9\xd7\xe6oZ\x1a\x88\x83\xae\xd3\
+\xa3,\xfd\x10\xc8\xc4\xe9\xa6D\x0c[]\xba\xa9\xed\xaa\
+2\x85\xe7c\xad(\x9f\xa2)\x1e5\x98tQ\xa2\xe4\
+\x18m\x19\xa9\x01h\x80\x0a\x80B(\x13\x0b\xa8,\xa0\
+0Ye\x02\xf0c\x22{5e\x0f\x04/.}\xe3\
+\xc1\x99s5\x8dv\xff\xbc/>\xceq\xf8\xc8q \
+\x90$\xa1\xf4\xe2\xd9S\xd9Y\xd5z\xff\x08\xfd$\x16\
+\x884\xf4\x8e\xfbf\xdfWG\xb2~b\xc8|>\x7f\
+QI\xc9\xee\xbd\xfb\x0a\x0b\x8b[\xc6\xdf\xdb\x9c\x874\
+B\x02$\xc0n\xba\xb4\xf6D\x1e|K^\xb5|\x8d\
+\xb5\x8c\xd6\x80\x01\x81\x06\xdaY\xef\xd9\x12\xb9d\x84e\
+\x08\x22\xc7+L\xe45A\xc3iq\x03\xbf,\xcb\x02\
+\x0c\xad[VV\x1e\xcc\x99\x8bK\xca\xa6\xfcz\xc6\xd6\
+m\xbb\x00\xc0\xeb\xf5\x7f\xb1\xe9\xab\x9aZg\xaa;\xa5\
+Wl\x8f\x0d\x95\x1b]']6\xabm\xed\xba\x8f\xfd\
+\xfe\x00\x00\xbe\xb2ly^\xfe%\xa2V\xc2\xbf\xa3\xee\
+\xf3\x1a!\x00!\x10kt\x17\xad\x98\xfe&\x8e\xf1\xd7\
+*\xf8\x02\x00\xf43\xf6\xf7\x92\xfc\x1f\xe7w[j\xbf\
+\x0f\x90\xfcL\xfc\xd3*\x08~\x8d8\x85\x092\xc7s\
+4\xd0\xd2\xb5\x8b1\xce\x88\xe2\xeb\xa9\xf7\xa6\xebc\xab\
+\x95\xfa\x9d\xceso\x17m\x93\x98\xe8;\x5c\xca!S\
+\x81\x80h\xce\xfc?\x11\xd1\xe2\xd8\x85\x85\xfe\xc2\xbc\xc0\
+%\xa8\x80\x87\x7f\xf7\xd8\xce\xdd?\x07q\x81\x1f\xb6\xed\
+j\xcb\x82;U\x97JH\x80\x0c\xa0\xd0_\xde\xc0\x08\
+\x0c1\xb4\xb5\xa8\x9f]\xabQ\x05,\x9c\xa5Ru\xfe\
+\xb1`\xd1\xc7U\x1bk\xd5\xba\xdf\xc6,\x8c\x11\xd2<\
+\x84\x1e\x0d\xbd\x1as+\xcc\xaf0E\xc5y\x89\xa3\x8c\
+\x9c\xd4\xc3\x98``|')bF\xecm;z-\
+\x8a\x10\x0cwFt\xfb\xb1\xe7\x9f\xd3\xf51\x80\xa0i\
+\x1a\x12\xf4\xd0u;\xea=\x16<\xca\xd7\xdfn\xad\xaf\
+w_\xd3\xc4\xc5\x09\xd1*\xa1J\xa8\x10\xedsg#\
+\x02\x87h\xe5\x8d\x02\xe3\x1a\xbcd\xf3Z\xeeU\xfb<\
+\x08\x01\xc0\xaf\xf9_(|\xbe4P\x0e\x04\x83\xccw\
+9\xa4\x0c71\xa7&{\x08]*s+\x5c\x89\xcf\
+\xe7\x97\xd9\xddQ\x99\x97\xfcUCO,{\xe0\xec\xfb\
+\xa7=%\x00`\xe5t\x1fw\x9d\xf5A\xc9\x1eD\xf8\
+\xb2\xdb\xa3Q\x82\x19\x00\xec\x9cUbb~\xe0R\x13\
+\xaar\xad\x98\x1d\x11n7\xdd\xaa\x12T\xca\xf5s.\
+\xfd\xc5\xc0\xa4\x0fR\x9f\xcc\xea\xbef\xdf-+\x0e\xf7\
+X\xf5\xd7\xd4yV\xde\xd8\x821\x14t\xd0\xd8\xba\x9a\
+!\x00\xa0B\xaaF\x1a 2d\x93#\xe7\xee\xa9\xdb\
+\xf2i\xe5\xea\x7fW\x7f\xba\xb9v\xd3Q\xefq3\xb3\
+\x97\x05\xea8T\xa3D\xa3]\xd4o,\xdd\x97\xef\xab\
+\xdcTudBdo\x1bo\xd03!Y\x17\xf5n\
+\xc9\xee\x87b\x06\x989\xfd\x8f5\xa7x\xc6M\xb1O\
+\xf8\xc9\xb5\xbf@.\xbe\x9a\x0d\xa0&8\x801|\xd2\
+1\xcf\xc4\x19_(yg\x849\xf3\xd1\x98)\x0e1\
+\x92C\x06\x00\x0c1Ur\xd8y\xf3\xce\xba\xe3\xcdt\
+\x8a5\xcb\xa8\xaf(\x84R\xd3?\x22\x92Pz\xaf\xec\
+\xc5]\xce\xafk\x95\x1a\x00\xd4\x88r}\xf9\xab\xca\xd7\
+\xc6\x0b\xdd\xd6\x96\xee\xa8\xf5k\xf7D\x0f\xeciN\x02\
+\x80:\xc5\xf7f\xc1\xd6\xe0\x1a\xa3\xec\xdd*\xe5\xfaj\
+\xc5;-\xba\xbf\x9d7\xd4\xab\xee*\xa5\x02\x90^}\
+n\xb1(\x09\xad\xe34t\xc5\xb7\xb7\x1a\xba;\xf8X\
+\xb7\xea=\xe3\xcb\x99h\x1b\xa9\x12S\x88)\x1a\x935\
+T5T5\xec\xa3\xef\xda\xf1^*j\x8a;=\xaa\
+\xc7\xad\xd6Q\xc8\xbf\x02\x00\x8c\x8f\xf8\xf5\xb3\x9d\xd6\xba\
+I\xdf\xd7x\xd7\xab\x97?\xf3\xc9\xfc\xd2\xf4\xe9\x22r\
+\x00\xf0cMv\x10\xdfF\xa0i\xd1\xfd\x0f\xd6\xe7\xea\
+8~\xb4\xbd;\x00\xfc\xa5t\xc5\xe0G2\x1f\x9f5\
+;\xde\x11\xd7J\xb8\xde\x04'\x86~\xeag\xe8\x81\x00\
+2)^\xcd_\xab\xba\x0f\xb9\xcf./\xfddn\xfe\
+k3r^~\xb2\xe0\xbd\xd2@}\x99\x5c\xdf\xd2D\
+\xb4\xafI\x8c\xae\xc8L#\xf8\xe8\x0cC\xdf^\xa6A\
+\xa7<\x87\x8a\x02y\x01d\x91B\xcaiO\xd5\xe7\xa5\
+\xfbS\x84N\x8bS\xa7\x02@\x9d\xe2u*>\x04$\
+\x80\x11\xb6\x8c\xcb\xbe*\x00\xca\xb4\xa4\x02@!\x94\xce\
+\xb8\x7f\x1a\x01UVV\x0d\xb5\xdd|M\xe4\xd0\xce\xdb\
+\x00\xc0\xc6Y\x87\x9a2\xef\xcf]\xb8\xb6\xf2_]u\
+i\xcf8\xe6\xbe\x97\xf2\xe2\x0b\x8e\xc7\xac\x9c-Np\
+p-t\x8c\xef\x10\xd2o\xe0L\xbf\x8a\x98\xd1\xc74\
+\x8cG\x0e\x001\x94\x91\x80\x0a4\xc0<\xf2\xb5\xc25\
+I\x92cr\xc4\xb0\xcb\xde\xeau\xa5?\x9a8)\xb8\
+V\x82d\xe3\x10\x09 ]\x1f\x03\x00~_`\xc8\xd8\
+\x09\xe3\xef\x1a\xa5z\xe5\xb7\xfb<\xd4\xff\x97\x17\xaeh\
+\xf2ha\xbbK\x03\x15AG\x14\xcbG\x0d3\x0fX\
+\x14;+\x88\x1d\xa8D\x1a\x00\x1031K\xac\x10]\
+\x1c(\x0b\x07\xfd;\xd4\xd6\x07n\xc5\xf5E\xc5\xeag\
+\xf3\x1fx\xb7\xe4\xd9\xf3\xde\xc3\x0d\x91-\x12`o\xd3\
+P\x87\x90\xb20\xef\xedc\xce\x8a\x89\xb6\x11\xb1\xa2%\
+\xa8@A\x08\xb5\xbb1\x11\x01\xa2\x04S\xc8/\xd5\xd5\
+\x7f\xfe\xe5\xe67;\xdfo\xe1\xa4\xe6\xd2\x18^\x03\x07\
+\x00\x80=\xae\x83\x1a\x81Fp\xc6\x973\xc4\xd8O#\
+T\x09\x14B\x85\x98L(\x13*\xc4\x5c\x8dHV\x83\
+\x0c\xf3\xad\xb5\x05\xb6\xe9\xa9\x01!I\xea2\xd8\xf2\xab\
+\xae\x86>F\xceL\xa4AC\xc7\x07 \xcc\x88\xfd\xe3\
+\x8a\xa2'\x7f\x9f\xf7\xfa\xd4\x8817\xe9\xe3\xc2O\xd8\
+\xcf\x9cL\x00\x0cPb|W}\x5c\x86!~\xae\xe3\
+\x8e\x0c\x83\xe3\xed\xa2\xedj\xeb\xa8}\x13\x899\xfe\x82\
+\xff\xd4\xed\x1cg\x19\xdeYJ\xfe\xda\xb9\xfd\xb8\xf7\xec\
+I\xef\xd9\x1a\xd5ic\xd6\x041\xfa\xf1\xe8\x99y\x81\
+\xc2:\xd5\xdd,\x1a\xe6\xdb_\x9b\x11\x998>bN\
+\x1f\xd30\x0e\x91!h\xa4\x05!\x97\xc6\xc5\xecB\xec\
+\xef\x1c\xcf\xad)y\xf9\xfd\xf2/f9no\x08\x0a\
+\x10\x80\x04dD\xe0\xd5\xe4\x0cC\xfc\xf7\xdd\x17\x10 \
+\x11\xac-\xf9yM\xf1\xde\x18\xd1Q\x16(nv\xdf\
+\xe1\xaf\x08\xdeV\xa6TW*u\xc3L\x83\xfe\x5c\xf4\
+J\xba\xd4y~\xf4o\x13\xc5x\x86\x08\x00\x1aQ\xb9\
+R\xdb\x921|\xbbD\x10Ab\xba\x19\xb1\xcf2`\
+G]\xdbo5\x8f\x00`W`\x08\x0d\xcc\x89\x97\xd2\
+\x16&\xbe\xfeV\xe1S\x91\x82\xf9\xca\x0e\x07B\x80|\
+_\xa5\x953\x5c\xf0T\x1es_\xfe\xb0lo\xbdj\
+X\x90\xb0\xd4\xc8Y\x0f\xd5\xef:\xea\xfa)\xd7{N\
+%5t\xb2\xb0\xa9\xd3#\xef\x1bi\xba\x03\x81vx\
+\xf7\x8d\xb1\x0c\x9ff\x9b\xa4\x01\xa8D\x0a\x85\x0ch\xa1\
+\xbf\xb4\x05c\x88o\xa7v\xa5\xe9\xbbo\xa9^[!\
+\x17\xce\x8a{\x11\x815o\xfe\x0c#\xd2\xc6\xc7X\xf9\
+\x88z\xc5\xdb\xcc5\x11\xd0\xf6\x9a\xb3\xbb\x9dg\x87\x9e\
+X\x9a\xa6\xcb\x18f\x9b\xda\xdd0\xe0\x94\xe7P\x81/\
+\xd7\xab\xb9\x19p\xd8\xd8]\x16f\xc3\xfa\x1bo\x1db\
+\xbaC\x06\x02PS\xa5\xd4\xcd\xce\xef\xee\xb2\x8c\x8e\x16\
+b\x00P!%@2\x02\xdbZ\xb7\xbd%\x9f\xf9v\
+a\xab\x04g\xdc\x87\x11ab\xe4\xbcD\xf1\xa6\xa6\xe0\
+\x0c[\xaf\x07\xc7K)\xdf\xd7d/N\xfa\x95\xc8\xb8\
+\xc6P\xe2\x9c\xa7\xfc\xab\xaac\xd3c\x1e\xbfI\xdf\xc3\
+\xcaG\x12\x11\x00u\xd1\xf7\xfc\xc9\xf9\xdd9\xcf\x09j\
+\x8e@!\x00$J\x89s\xa3\x1fS\x08\x18@\xae?\
+\xbf^\xf3L\xb3O}\xad\xec-#3\xe8P\x97$\
+&M\xb0MXS\xbe\xbaL\xael\xa9@\xedk\x9d\
+E\x00\xc0d\xdd\xcd\xc3\xad\xf7\x16\xc9\xe7#\x858\x06\
+\xc8\x82`F#\xea\x146>R\x88\xfe\xbe\xfa\x9b\x93\
+\x9e\xa2Ls\x9a\x85\xd3)D\xdfWg\xcf\xbb\xb8n\
+\x5c\xc4o2\xcd\xc3%f\x08\x82\xfe\x08\xc8\x90\xebi\
+\x1ax\xdas\xa8^u6\xdb:R\x88\x5c\xe4x\xd6\
+\xc4YCE\x19.bS\xedWEr\xe1D\xdb\xc4\
+\xe1\xa6a=\x0c=\xbd\xe4\xfd{\xc5\xbb\xe7|\x17\xda\
+\xc2\x15\x0d\xed\x82~\x18\x8e\xb2\xdd\x7f\xcc\xbd\xfbw\x8e\
+WM\x9c%h6\x82(\x8dJJ\xadR\x1e-\xc4\
+\x87k\xef\x09\xf7\x81\xcf*\xd6xTW\x04o\xf2h\
+~\x03\xb3M\x8e\x9e\xd9\xdd\xd0\xbfQ\x09\x8a\xfc\xb9\xff\
+(}#^LN\xd3gD\xf0\xd1\x1f\x96.\xd73\
+\x83G\xf3\x04e%QLz4nQ\x0c\x1f\x8d\x04\
+\x1c\x10\x22!\x01\x01\xed\xac\xdf\xb1\xae\xf2\x83\x86*\x1c\
+\xb6\x00\xe4\xa8=E\x89\xe6\xd2\xf8s\xdd\xe6\xfe\xe6\x91\
+f\xde\x82\x0d$\x05\xd79\xe79\xaa\x80\x1c-$\x10\
+h,To\x86\x9e\xa6\x81\x19\xc6>\xf9\xde\xb3>\xcd\
+\x1d)\xc4%H\xa9\xc1\xc1y\xbe\xb3\x22J\x09RJ\
+\xa2\x94\xa6\x90|\xd2}8\xdbs8\xd8\x946\xcc6\
+\xbe\x87\xa1_\xa5\x5cl\xe6\xac7\xe92x@\x95(\
+\x94\xe1\x87ps(\x95K\x89\xdaU\xc8\xe5\xdb\x0f\xd6\
+\xf94\xef`\xeb\x18\x0e\xc3zR\x10\x10\xe0\xbc\xf7d\
+\x9a\xee\xe6=\xce\xcd\x83\xacc\x10\xc4F4L\x00\xb1\
+\x8b\xa1Wc\x993xO\x06fZ^\xf4\xe4\xef\x1c\
+KRu\x19\x0e1\xc9\xa9\xd4N\x8e|$QJ;\
+\xe39B\xa4%\x88)\x9d\xc4\x94 \x1f\xb4\x06\xe5l\
+\xc4\xdcNyOlu\xfe\xe7Z\xd5\x89\xd0\x86\xac\xfd\
+\x15\xeb$)=F\x8cg\x08,(\x87\x00\x0c\x10\x11\
+/\xfb/\xec\xab\xdb\xea\xd7\xfc\x02J\x8d(\x1b\x02\x9c\
+r\x1f\x04j<\x03\x16\x07\xf2\xaa\x95r\x0ey \xf8\
+\xb4|Mi\xe0\xb2\xc4t\x00P\xe8\xcfK\x95\xba\x8e\
+\xb3?0\xd6~_8\xae\xa4\x85\xfa\x11@!P\x08\
+\x0b\x02\x85\xef\x97\xbfs\xd5\xe4\xed\x8a\xd0\xb9\x03!U\
+WC/\xd6\x98\xa0\x06e\x11\x01\x09K\x02\x97\xfd\xe4\
+\xbb\xd3>9\xcc<\x22\x00\xe89si\xe0Rc\x88\
+\x1b#\xc4\xaf)~\xa9\xc0\x9f\xd3Y\xdf\xad\x87\xb1\xff\
+\xfb\xa5\xaf\xd7\xc8\x95\x00P\x1c\xb8\x04\xa1\xe0\x8b\xa8!\
+\xf5\x0c\x11F\xa0\x11\xa8\x00\x97\x02\xf9\x7f-}\xc5\xa3\
+z\x82?\xb7\x87\x0d\x1d ,IJo\xc0Q\x1a\xbb\
+\xb4\xc1\xa9V\xf95\xdf\xcc\xd8?s\xc87\xeb8\xec\
+\xac\xbf%R\x88m,\xff\x8b\xa8\xb3\xf1\x91\x1b\xcaW\
+\xf56\x0e\xeca\xec_\x19(\xbb\xec\xcf%\x80B\x7f\
+\xfe\xc6\xf2\xd5N\xa5\xa6\x81\xbd\x14\xea\xb7#\xd2\x00\x5c\
+\x9a\xfb\x07\xe7W+K\x9f\xafW\xea:\xd4\x0eq\x15\
+s\xdf\xbc@\xe1\xd2j\x13\xa4T+\x1f\x11\xae|E\
+\xfe\x9c\xac\xfa\x9d\x93\xa3g7{\xd8&x\x05\x5cx\
+d\x83\xa0\x81Z\xe0\xcf\x99\x163\xcf\xceGm\xaf\xfd\
+J\x03\x0d\x88\x08\xa8(\x90\xb7\xaf\xee\x07@L\x96\xd2\
+\x11X\x80d\x06\x5c\x80d\x0d4\x1e$\x02\x0aP\xa0\
+D.l\xa3\x22\x81\x1d\xeaWl\x85\xb0*\xb9b_\
+\xdd\x0f\x17\xbc'\x09\xc0\xceGI\x9c\x84\x00\xb9\xbe3\
+\x17\xbc\xd9\xa3\xedS \x94\xcd7\x08\xea\x95\x8e;\xf8\
+\x9fx1\xb9\xafy\x88\x91\x99\x11\xf1\x84\xfb`\x9d\xda\
+\x14\xe3\xa9\xa4\x9e\xf7f\x1f\xf5\xec\xb5\xf3QV>r\
+}\xc5\x8a\x80\xe6\xdfU\xf7\xed\xc7\x95\x7f\xcdr\xed)\
+\x09\x14\xb4a\x03\xdb|\x0c\x05\xaf\xf5`\x5cs\x08\xa4\
+\xc1\xaba\x82\x94\x92\xa2\xebR\xa7\xd6\xe4xO?\x97\
+\xbc\xda\xc8[B\xd1\x03\xb6^\xf2\xa1\x06\x10\xda\xa3\xd6\
+_\xf4\x9e\xfa\xba\xea\x9fe\x81\xe2\x16\xe2\x84\x00\x90\xac\
+K\x8f\xe4\xa3\x8f\xb8\xf676\xf0\x5cGG\xd5\xd5\x09\
+k\xed2\xb0\x95\xd4\x06\x11b\x04\x87CJ\x8e\x16\xe2\
+\xac|\xa4\x893KL/\xa0\x88\x80\x0a\x05\xbc\x9a\xc7\
+\xa5:k\xe4\xaaJ\xb9\xb4$p\xb9B.m\xa0\x9a\
+\xae\xc6\x06jg\x17\x15v4\xf2hwo\x1dv\xb4\
+u\x92\xda\xc0q\xa1\x83\x8b\xc0\xf59\xe8V\x84\xa4\xed\
+\xdf\xe9\xc6\x1e\xeb\xbf\x9fx\xcd\x07\xe3Z>\x93pC\
+\x9eW\xfc\x1f\x92\xd4\x1e\x8e\xd1\x8d\xbbi\xe8\xb0\xac\xfe\
+w;\xf2\x1d\x1c\x8f\xff\xbf\xfc\xc1\xeb\xbe\xd6\xff\x03p\
+\xa8pDYD\xf8\xae\x00\x00\x00\x00IEND\xae\
+B`\x82\
+\x00\x00\x01r\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x02\x00\x00\x00\x90\x91h6\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x01$IDAT(\xcf\x95\
+R\xbbN\xc3@\x10\x9c\xdd;\xc5\x0f\x88\x11\x82\x18\x81\
+\xa2\x90\x22\x05\x0d\x0d\x0d\x15\x7f\xc07 \xd1\xd2\xf3\x05\
+\xf9\x0aZ>\x07\x04\x12\x08(\x9c&\xbc\xa4H\x08E\
+\x0e\xba\xd8\xf8\x91\xa30\xc4\xc6\x0eQ\x98\xe2t{\xb7\
+;\xb3\xabY2\xcc5T\xa1\x01\x00\x04\xe8\x9f3\x0b\
+\x01\xce\xbfg\x82\xca\x0f\x8c\xf9\xa8p\xc9\x22\xcdT<\
+'\xa6\xb2\x8e\xac\xd2\xd5\x85c\xb1E@4\x09\x87\xa9\
+?KA\xe7\x1c[\xb5\xed#\xf7\xa4i\xac:\x82\xfd\
+xp68\xbf\x0b\xbc\xca\xd0\x05t\xac\x9d\x84\x83\x84\
+U\xccA,\xc2\xddzg\xde\x0c\x00b\x84\xa6\x14\xdd\
+~W\xeb\xc9i\xfb8\x80*%\xd0\xd4\x87\x03\xe7\xf0\
+9\xea5k\xad\x8f\xf4\xfdF]g}\x0abA\xa2\
+mnz\xe3\xa7\xf2\xd0\x0d\xc3u\x8duF\xda\xe2\x8d\
+\xfd\x95=[\x8a\x18*\xd5\x11Q\xc4\xc4\xde\xe3w\x81\
+\x90\xd2\xcen\xb6\x5cz\x18_\x11\xf40y\x0b\xb5z\
+\xf9\xec_\x8en\x1b\xc6\xf2\x85\x7f\x0f\xd2=\xf5Zn\
+iA\xc8_v\xd2\x9f\x06WV\x83f\xacM\xd9f\
+\x02(+\xa0\x7f,\x9f\x5c(\xaf\x10~\x01\x9dJY\
+\xd0S#*\xdb\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x02X\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x02\x00\x00\x00o\x15\xaa\xaf\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x02\x0aIDAT8\xcb\xa5\
+T\xcfk\x13A\x14~ov\xb6\x9d\xcd\xa6\xdd\xfc\xc0\
+\x18\x13\xab\xa9m\xca*\xa2'\x0d\xa8 ^<x\x91\
+\x5cTP\xff\x02\x11\xfc/<\x09\xfe\x01\xde\xa4\x07\x0f\
+\x1e\x14oBO\x82\x1e\xd4-T\x11\xacR\xf4\x90\x22\
+\x96\xc6\xd8m6\xbbqg<H\x9a\xdd\xccl6\xc5\
+w\xdb\xf7f\xbe\xef{o\xdf|8\xcd\x8a\x00\x00\x02\
+\x00A\x1d\x02\x00\xe2\xd5\xbdL\xe4\x16\x19\x16\xc6G\xf4\
+\x0c\x82|\x8b$\x15\xd2\x03e\xa0\xc9!\x84D9\xc8\
+P\xb9\xdbq\xe4(i\x19dH\xbahL\x1b\xd9\xb0\
+\xb5\xd4S\x13\x8c\x89*:G\x00\x00\x0dh\xb3p{\
+\x8eU)r\x1d8E\xd1\xeeo=\xfa\xb9\xec\xf1\x9e\
+r\x0fH\xacs\x1c\x92\x9c\x99\xb9x\xd6\xba\xf0\xd1{\
+\x7f<k/\x99\x8b\x1d\xde>\x99\xad7\x0b\x97\xd5\xa2\
+\xf0\x9f\x22\xd5 \x8e\xb0y\x1f\xba.\xff\xcd\xd1\x17\x18\
+p\x0c\xfb\xd8[\xcc\x1cN\xea\x92\x0eE\xc6\xb1\xca\xd3\
+\x95\xb2Q\xbaZj:\xee;\x0d\xf81\xb3Z3\x0e\
+\xe9\xf4\x8fb\x150\x0a$)\xfa\xd4u\xaaF\xf1\xe1\
+\xf7\x07\x9b~\x0b\x00\x8az\xee~\xfd\xee[w-\xf1\
+\xdf\x8e\xbc\xb5+\xf9[\xab\xbb\xaf,\xcd\xf2x\xf7\xb4\
+y\xea\xd9\xf6SY/E\xad4\x95o\xf9[\xd1a\
+k\x94f\xf6\xe0\x11\xe0\xc6\xc1;\xf3F=\x14\xbe\x8e\
+Z\x99\x95\x08\x22\x17\xe1\xf9\x5c\x83\x00\x14\xa6\xacK\x85\
+\xc6B\xa6bQ\xf3^\xed\xfa\x9b\xce\x87.\xf7\xa5a\
+\x0f\xfa\x0d\xd1\xff\xec\xad6\xacs/\xb7\x9f\xdb\x19{\
+\xa3\xb7~\xb3|\xcd\xce\x1e\xdd\xf0\xd6\xbfx\xdf\x18\xd1\
++l&\x84\xa0\x15\xfc\xe8\xf4\xddq\x0b\xe9\xc3\xeeJ\
+\xfb\x05@?\x84 \x10\xae\xb3\xe3\xd8f\xed\xf1\xe6\x13\
+C\xd3^\xffrN\xcc\xceU\x8c\xfc\xda\xce\xd7\x03l\
+6\xa7gc3b\xac(T\x9b\xb1_/ Bz\
+\x15b\x04EL\x80*\xe4\xb7&\x12>\x85\x04\x1d'\
+ j\x97I2#\x91\xc8DR\xecBe=i~\
+\xb4_\x9f\x8cg\xa8\x9a6U\x14\x8c:\x0f\x81\xff\x89\
+\x08\xc7_\xcfG\xb3dygk\xd1\x00\x00\x00\x00I\
+END\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00u\x0ed\
+\x00n\
+\x00i\x00w\x00o\x00t\
+\x00\x0d\
+\x01\x18\x06G\
+\x00a\
+\x00v\x00a\x00t\x00a\x00r\x00-\x005\x006\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x01X\x06G\
+\x00a\
+\x00v\x00a\x00t\x00a\x00r\x00-\x009\x006\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x01\xca\x06G\
+\x00a\
+\x00v\x00a\x00t\x00a\x00r\x00-\x002\x008\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x0d\xd0Gg\
+\x00a\
+\x00v\x00a\x00t\x00a\x00r\x00-\x001\x009\x002\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x01\xf8\x06G\
+\x00a\
+\x00v\x00a\x00t\x00a\x00r\x00-\x003\x006\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x01\x22\x06G\
+\x00a\
+\x00v\x00a\x00t\x00a\x00r\x00-\x008\x000\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x00\xa4\x1bg\
+\x00i\
+\x00c\x00o\x00n\x00-\x004\x008\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x01\xe2\x06G\
+\x00a\
+\x00v\x00a\x00t\x00a\x00r\x00-\x004\x000\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x09\xaf\x95G\
+\x00i\
+\x00c\x00o\x00n\x00-\x001\x002\x008\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x00H\x1bg\
+\x00i\
+\x00c\x00o\x00n\x00-\x006\x004\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x00\xba\x1bg\
+\x00i\
+\x00c\x00o\x00n\x00-\x003\x002\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x08}\x95G\
+\x00i\
+\x00c\x00o\x00n\x00-\x002\x005\x006\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x014\x06G\
+\x00a\
+\x00v\x00a\x00t\x00a\x00r\x00-\x007\x002\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x00\x96\x1bg\
+\x00i\
+\x00c\x00o\x00n\x00-\x001\x006\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x00\x88\x1bg\
+\x00i\
+\x00c\x00o\x00n\x00-\x002\x004\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0f\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01,\x00\x00\x00\x00\x00\x01\x00\x01\x1b\xe5\
+\x00\x00\x01\xa1Q \xa1\xe2\
+\x00\x00\x01\xbe\x00\x00\x00\x00\x00\x01\x00\x01\xe3\x06\
+\x00\x00\x01\xa1Q \xa1\xd2\
+\x00\x00\x01\xa2\x00\x00\x00\x00\x00\x01\x00\x01\xe1\x90\
+\x00\x00\x01\xa1Q \xa1\xcf\
+\x00\x00\x00\xd2\x00\x00\x00\x00\x00\x01\x00\x00\xe6\x8b\
+\x00\x00\x01\xa1Q \xa1\xd6\
+\x00\x00\x01H\x00\x00\x00\x00\x00\x01\x00\x01&\xf7\
+\x00\x00\x01\xa1Q \xa1\xd5\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1Q \xa4\x7f\
+\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\xc7\xb7\
+\x00\x00\x01\xa1Q \xa4\x8e\
+\x00\x00\x01\x82\x00\x00\x00\x00\x00\x01\x00\x01\xc7\x88\
+\x00\x00\x01\xa1Q \xa4\x82\
+\x00\x00\x000\x00\x00\x00\x00\x00\x01\x00\x00\x11z\
+\x00\x00\x01\xa1Q \xa4\x9e\
+\x00\x00\x00P\x00\x00\x00\x00\x00\x01\x00\x00:\x9c\
+\x00\x00\x01\xa1Q \xa4u\
+\x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x00\xed\x0e\
+\x00\x00\x01\xa1Q \xa4z\
+\x00\x00\x00\x92\x00\x00\x00\x00\x00\x01\x00\x00\xbf \
+\x00\x00\x01\xa1Q \xa4w\
+\x00\x00\x01d\x00\x00\x00\x00\x00\x01\x00\x01*\xae\
+\x00\x00\x01\xa1Q \xa4F\
+\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\xf7x\
+\x00\x00\x01\xa1Q \xa2&\
+\x00\x00\x00p\x00\x00\x00\x00\x00\x01\x00\x00@c\
+\x00\x00\x01\xa1Q \xa5&\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
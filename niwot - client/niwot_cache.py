@@ -0,0 +1,106 @@
+# niwot_cache.py
+from __future__ import annotations
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PySide6 import QtCore
+
+import niwot_metrics
+import niwot_tasks
+
+DEFAULT_TTL_S = 60.0        # fenêtre de fraîcheur : pas de requête tant que la valeur est plus jeune
+DEFAULT_MIN_INTERVAL_S = 5  # au plus une requête par clé sur cet intervalle, même forcée
+
+
+class _Entry:
+    __slots__ = ("fetch", "ttl", "min_interval", "value", "at", "last_request", "inflight", "retry", "pending")
+
+    def __init__(self, fetch: Callable[[Any], Any], ttl: float, min_interval: float):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.min_interval = min_interval
+        self.value: Any = None
+        self.at = 0.0            # time.time() de la valeur (0 = jamais reçue)
+        self.last_request = 0.0  # time.monotonic() du dernier envoi
+        self.inflight = False
+        self.retry: Optional[QtCore.QTimer] = None
+        self.pending: Tuple[Any, bool] = (None, False)  # (client, force) de la demande reportée
+
+
+class SwrCache(QtCore.QObject):
+    """
+    Cache « stale-while-revalidate » par clé (une clé = un endpoint) :
+      - la valeur connue s'affiche tout de suite (peek), même périmée
+      - request() ne part sur le réseau que si la valeur a dépassé son TTL (ou force=True),
+        jamais deux fois en vol, et au plus une fois par min_interval : une demande trop
+        rapprochée est reportée à la fin de l'intervalle
+      - sig_value n'indique changed=True que si le contenu a réellement changé
+
+    Signals:
+      - sig_value(key: str, value: object, changed: bool)   revalidation réussie
+      - sig_failed(key: str, error: str)
+    """
+    sig_value = QtCore.Signal(str, object, bool)
+    sig_failed = QtCore.Signal(str, str)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._entries: Dict[str, _Entry] = {}
+
+    def register(self, key: str, fetch: Callable[[Any], Any], ttl_s: float = DEFAULT_TTL_S,
+                 min_interval_s: float = DEFAULT_MIN_INTERVAL_S):
+        """fetch(client) -> valeur, exécuté dans un thread worker. Sans effet si déjà enregistrée."""
+        if key not in self._entries:
+            self._entries[key] = _Entry(fetch, ttl_s, min_interval_s)
+
+    def peek(self, key: str) -> Any:
+        e = self._entries.get(key)
+        return e.value if e else None
+
+    def age(self, key: str) -> Optional[float]:
+        e = self._entries.get(key)
+        return (time.time() - e.at) if e and e.at else None
+
+    def is_fresh(self, key: str) -> bool:
+        e = self._entries.get(key)
+        return bool(e and e.at and time.time() - e.at < e.ttl)
+
+    def seed(self, key: str, value: Any, at: float):
+        """Valeur venue d'ailleurs (instantané disque) ; ignorée si le cache a plus récent."""
+        e = self._entries.get(key)
+        if e is not None and at > e.at:
+            e.value, e.at = value, at
+
+    def request(self, key: str, client, force: bool = False) -> bool:
+        """Revalide si nécessaire ; True si une requête part (maintenant ou à la fin de l'intervalle)."""
+        e = self._entries[key]
+        if e.inflight or (not force and self.is_fresh(key)):
+            niwot_metrics.inc("cache.lookups", cache="swr", result="hit")
+            return False
+        niwot_metrics.inc("cache.lookups", cache="swr", result="miss")
+        wait = e.min_interval - (time.monotonic() - e.last_request)
+        if wait > 0:
+            if e.retry is None:
+                e.retry = QtCore.QTimer(self)
+                e.retry.setSingleShot(True)
+                e.retry.timeout.connect(lambda: self.request(key, *e.pending))
+            e.pending = (client, force)
+            if not e.retry.isActive():
+                e.retry.start(int(wait * 1000) + 1)
+            return True
+        e.inflight = True
+        e.last_request = time.monotonic()
+        niwot_tasks.submit(e.fetch, client, on_done=lambda value, err: self._on_done(key, value, err))
+        return True
+
+    def _on_done(self, key: str, value: Any, err: Optional[Exception]):
+        e = self._entries[key]
+        e.inflight = False
+        if err is not None:
+            self.sig_failed.emit(key, str(err))
+            return
+        changed = value != e.value
+        if changed:
+            e.value = value
+        e.at = time.time()
+        self.sig_value.emit(key, e.value, changed)
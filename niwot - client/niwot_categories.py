@@ -0,0 +1,250 @@
+# niwot_categories.py
+from __future__ import annotations
+import time, unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from PySide6 import QtCore
+
+import niwot_storage
+
+CATEGORIES_FILE = "categories.json"
+CACHE_KEY = "categories"
+CATEGORIES_TTL_S = 600.0  # le catalogue bouge peu : revalidé au plus toutes les 10 min
+
+
+def normalize_categories(data: Any) -> List[Dict[str, Any]]:
+    """Réponse brute (liste ou {categories|data|items…: [...]}) -> [{id, name, approvedCount}]."""
+    arr = None
+    if isinstance(data, list):
+        arr = data
+    elif isinstance(data, dict):
+        for k in ("categories", "data", "items", "result", "rows", "records"):
+            if isinstance(data.get(k), list):
+                arr = data[k]
+                break
+    norm: List[Dict[str, Any]] = []
+    for c in arr or []:
+        if not isinstance(c, dict):
+            continue
+        cid = c.get("id") or c.get("_id") or c.get("ID") or c.get("uuid")
+        name = c.get("name") or c.get("label") or c.get("title")
+        approved = c.get("questionCount") or c.get("approvedCount") or c.get("count") or c.get("questionsApproved")
+        if cid is None or name is None:
+            continue
+        try:
+            cid = int(cid)
+        except Exception:
+            cid = str(cid)
+        norm.append({"id": cid, "name": str(name),
+                     "approvedCount": approved if isinstance(approved, (int, float)) else None})
+    return norm
+
+
+def search_text(c: Dict[str, Any]) -> str:
+    """Nom sans accents ni casse : « cinema » trouve « Cinéma »."""
+    s = unicodedata.normalize("NFD", c["name"].casefold())
+    return "".join(ch for ch in s if not unicodedata.combining(ch))
+
+
+def fetch_categories(c) -> List[Dict[str, Any]]:
+    """
+    Thread worker : catalogue normalisé, ou exception. Ne touche à aucun état partagé :
+    le résultat est remis à CategoryService.accept() dans le thread UI.
+    """
+    res = c.get_categories()
+    if not res.get("ok"):
+        raise RuntimeError(res.get("error") or "catégories indisponibles")
+    return res["categories"]
+
+
+class CategoryService(QtCore.QObject):
+    """
+    Catalogue des catégories partagé par toutes les pages (salle, paramètres, suggestion) :
+      - une seule source, normalisée une fois ([{id, name, approvedCount}])
+      - persisté sur disque (categories.json) : connu dès le démarrage suivant
+      - revalidé en arrière-plan via client.cache une fois le TTL dépassé ; entrer
+        dans une salle ne coûte donc aucun aller-retour
+      - sig_changed prévient les abonnés quand le contenu change réellement
+
+    Signals:
+      - sig_changed(categories: list)
+    """
+    sig_changed = QtCore.Signal(list)
+
+    def __init__(self, client, ttl_s: float = CATEGORIES_TTL_S):
+        super().__init__(client)
+        self._client = client
+        self._disk_loaded = False
+        client.cache.register(CACHE_KEY, fetch_categories, ttl_s=ttl_s)
+        client.cache.sig_value.connect(self._on_value)
+
+    # --- lecture ---
+    def items(self) -> List[Dict[str, Any]]:
+        """Thread UI : catalogue connu (mémoire, sinon disque), éventuellement périmé ; [] si jamais chargé."""
+        self._load_disk()
+        return self._client.cache.peek(CACHE_KEY) or []
+
+    def get(self, cid: Any) -> Optional[Dict[str, Any]]:
+        for c in self.items():
+            if c["id"] == cid:
+                return c
+        return None
+
+    # --- revalidation ---
+    def refresh(self, force: bool = False) -> bool:
+        """Revalide en tâche de fond si le TTL est dépassé (ou force) ; True si une requête part."""
+        self._load_disk()
+        return self._client.cache.request(CACHE_KEY, self._client, force)
+
+    def accept(self, cats: List[Dict[str, Any]]):
+        """Thread UI : adopte un catalogue obtenu par fetch_categories (cache, disque, sig_changed)."""
+        self._client.cache.seed(CACHE_KEY, cats, time.time())
+        self._store(cats)
+        self.sig_changed.emit(cats)
+
+    # --- interne ---
+    def _load_disk(self):
+        if self._disk_loaded:
+            return
+        self._disk_loaded = True
+        snap = niwot_storage.read_json(CATEGORIES_FILE)
+        if not isinstance(snap, dict) or snap.get("v") != 1 or snap.get("api") != self._client.api_base:
+            return
+        cats, at = snap.get("categories"), snap.get("at")
+        if isinstance(cats, list) and isinstance(at, (int, float)):
+            self._client.cache.seed(CACHE_KEY, cats, float(at))
+
+    def _store(self, cats: List[Dict[str, Any]]):
+        niwot_storage.write_json_async(CATEGORIES_FILE, {"v": 1, "api": self._client.api_base,
+                                                         "at": time.time(), "categories": cats})
+
+    def _on_value(self, key: str, value: Any, changed: bool):
+        if key != CACHE_KEY:
+            return
+        self._store(value)  # même inchangé : la date sur disque repousse la prochaine revalidation
+        if changed:
+            self.sig_changed.emit(value)
+
+
+class CategoryModel(QtCore.QAbstractListModel):
+    """
+    Catégories cochables : la sélection est un ensemble d'ids, pas un état par ligne.
+    Tout cocher / décocher = une opération sur l'ensemble + un seul dataChanged ;
+    la vue ne repeint que les lignes visibles.
+
+    Signals:
+      - sig_selection_changed(count: int)
+    """
+    sig_selection_changed = QtCore.Signal(int)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._cats: List[Dict[str, Any]] = []
+        self._labels: List[str] = []
+        self._text: List[str] = []
+        self._selected: Set[Any] = set()
+
+    # --- contenu ---
+    def set_categories(self, cats: List[Dict[str, Any]]):
+        """Remplace le catalogue ; la sélection des catégories toujours présentes est conservée."""
+        self.beginResetModel()
+        self._cats = list(cats)
+        self._labels = [c["name"] + (f" ({c['approvedCount']})" if isinstance(c.get("approvedCount"), (int, float)) else "")
+                        for c in self._cats]
+        self._text = [search_text(c) for c in self._cats]
+        self.endResetModel()
+        before = len(self._selected)
+        self._selected &= {c["id"] for c in self._cats}
+        if len(self._selected) != before:
+            self.sig_selection_changed.emit(len(self._selected))
+
+    def text(self, row: int) -> str:
+        return self._text[row]
+
+    def category_id(self, row: int) -> Any:
+        return self._cats[row]["id"]
+
+    # --- sélection ---
+    def selected(self) -> List[Any]:
+        """Ids cochés, dans l'ordre du catalogue."""
+        return [c["id"] for c in self._cats if c["id"] in self._selected]
+
+    def set_selected(self, ids: Iterable[Any]):
+        self._replace_selection(set(ids) & {c["id"] for c in self._cats})
+
+    def select_all(self, on: bool = True):
+        self._replace_selection({c["id"] for c in self._cats} if on else set())
+
+    def select(self, ids: Iterable[Any], on: bool = True):
+        sel = set(self._selected)
+        if on:
+            sel |= set(ids)
+        else:
+            sel -= set(ids)
+        self._replace_selection(sel)
+
+    def _replace_selection(self, sel: Set[Any]):
+        if sel == self._selected:
+            return
+        self._selected = sel
+        if self._cats:
+            self.dataChanged.emit(self.index(0), self.index(len(self._cats) - 1),
+                                  [QtCore.Qt.ItemDataRole.CheckStateRole])
+        self.sig_selection_changed.emit(len(sel))
+
+    # --- Qt ---
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cats)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._labels[index.row()]
+        if role == QtCore.Qt.ItemDataRole.CheckStateRole:
+            return (QtCore.Qt.CheckState.Checked if self._cats[index.row()]["id"] in self._selected
+                    else QtCore.Qt.CheckState.Unchecked)
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.CheckStateRole:
+            return False
+        cid = self._cats[index.row()]["id"]
+        if QtCore.Qt.CheckState(value) == QtCore.Qt.CheckState.Checked:
+            self._selected.add(cid)
+        else:
+            self._selected.discard(cid)
+        self.dataChanged.emit(index, index, [QtCore.Qt.ItemDataRole.CheckStateRole])
+        self.sig_selection_changed.emit(len(self._selected))
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        return QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable | QtCore.Qt.ItemFlag.ItemIsUserCheckable
+
+
+class CategoryFilterProxy(QtCore.QSortFilterProxyModel):
+    """Filtre texte (sans accents) au-dessus de CategoryModel, ordre du catalogue conservé."""
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._query = ""
+
+    def set_query(self, query: str):
+        query = search_text({"name": query.strip()})
+        if query == self._query:
+            return
+        self._query = query
+        self.invalidateFilter()
+
+    @property
+    def query(self) -> str:
+        return self._query
+
+    def visible_ids(self) -> List[Any]:
+        m = self.sourceModel()
+        return [m.category_id(self.mapToSource(self.index(r, 0)).row()) for r in range(self.rowCount())]
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:
+        return not self._query or self._query in self.sourceModel().text(source_row)
@@ -1,10 +1,22 @@
 # niwot_client.py
 from __future__ import annotations
-import requests
-import socketio
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Tuple, TYPE_CHECKING
 from PySide6 import QtCore
-import queue
+import json, queue, threading, time
+
+if TYPE_CHECKING:
+    import requests
+    import socketio
+    from niwot_outbox import Outbox
+
+from niwot_media import MediaVariants, DEFAULT_VARIANT_QUERY
+from niwot_cache import SwrCache, DEFAULT_TTL_S
+from niwot_categories import CategoryService, normalize_categories
+import niwot_metrics
+import niwot_storage
+import niwot_trace
+
+SESSION_FILE = "session.json"
 
 
 class NiwotClient(QtCore.QObject):
@@ -16,30 +28,80 @@ class NiwotClient(QtCore.QObject):
     """
     sig_socket_message = QtCore.Signal(str, object)
 
-    def __init__(self, api_base: str, ws_base: str):
+    def __init__(self, api_base: str, ws_base: str, media_variant_query: Optional[str] = DEFAULT_VARIANT_QUERY,
+                 leaderboard_ttl: float = DEFAULT_TTL_S):
         super().__init__()
         self.api_base = (api_base or "").rstrip("/")
         self.ws_base = (ws_base or "").rstrip("/")
-        self.sess = requests.Session()
         self.bearer_token: Optional[str] = None
 
+        # requests / socketio sont importés à la première utilisation (ou par warm_up()
+        # en tâche de fond) : l'écran de connexion s'affiche sans attendre la pile réseau.
+        self._sess: Optional["requests.Session"] = None
+        self._sio: Optional["socketio.Client"] = None
+        self._saved_cookies: List[Dict[str, Any]] = []  # session restaurée, posée à la création de sess
+        self._net_lock = threading.Lock()
+
+        # Avatars/médias à la taille d'affichage (cache partagé par toutes les pages)
+        self.media = MediaVariants(self, media_variant_query)
+        # Données partagées revalidées en arrière-plan (classements…), fraîches pendant leur TTL
+        self.cache = SwrCache(self)
+        self.leaderboard_ttl = leaderboard_ttl
+        # Catalogue des catégories (disque + revalidation), partagé par salle / paramètres / suggestion
+        self._categories_source: Optional[Tuple[str, Optional[Dict[str, str]]]] = None
+        self.categories = CategoryService(self)
+        self._outbox: Optional["Outbox"] = None  # créée à la première utilisation (sqlite)
+
         # --- Queue thread-safe pour transférer les events socket -> UI ---
-        self._evt_queue: "queue.SimpleQueue[Tuple[str, object]]" = queue.SimpleQueue()
+        self._evt_queue: "queue.SimpleQueue[Tuple[str, object, float]]" = queue.SimpleQueue()  # (event, payload, reçu à)
         self._pump = QtCore.QTimer(self)
         self._pump.setInterval(10)  # 100 Hz
         self._pump.timeout.connect(self._drain_queue)
         self._pump.start()
+        self.dispatching: Optional[str] = None  # évènement en cours de traitement (niwot_watchdog)
+
+    @property
+    def outbox(self) -> "Outbox":
+        """File d'envoi durable des propositions (niwot_outbox)."""
+        if self._outbox is None:
+            from niwot_outbox import Outbox
+            self._outbox = Outbox(self, self)
+        return self._outbox
 
-        # --- Socket.IO ---
-        self.sio = socketio.Client(
+    # ---------------- Pile réseau (chargement différé) ----------------
+    @property
+    def sess(self) -> "requests.Session":
+        if self._sess is None:
+            with self._net_lock:
+                if self._sess is None:
+                    import requests
+                    sess = requests.Session()
+                    self._load_cookies(sess, self._saved_cookies)
+                    self._saved_cookies = []
+                    if self.bearer_token:
+                        sess.headers["Authorization"] = f"Bearer {self.bearer_token}"
+                    self._sess = niwot_metrics.instrument_session(sess, self.api_base)
+        return self._sess
+
+    @property
+    def sio(self) -> "socketio.Client":
+        if self._sio is None:
+            with self._net_lock:
+                if self._sio is None:
+                    self._sio = self._make_sio()
+        return self._sio
+
+    def _make_sio(self) -> "socketio.Client":
+        import socketio
+        sio = socketio.Client(
             logger=False,
             engineio_logger=False,
             reconnection=True,
         )
 
         # handlers SIO (ATTENTION: thread réseau)
-        self.sio.on("connect", lambda: self._queue("connect", {"id": getattr(self.sio, "sid", None)}))
-        self.sio.on("disconnect", lambda: self._queue("disconnect", {}))
+        sio.on("connect", lambda: self._queue("connect", {"id": getattr(sio, "sid", None)}))
+        sio.on("disconnect", lambda: self._queue("disconnect", {}))
 
         for ev in [
             "room:update", "room:started", "room:running",
@@ -48,9 +110,25 @@ class NiwotClient(QtCore.QObject):
             "room:players", "room:sync", "room:kicked", "room:banned",
             "quiz:question", "quiz:proposals", "quiz:result",
             "quiz:ended", "quiz:gotoRoom", "quiz:started",
-            "game:started"
+            "game:started",
+            "rooms:public", "rooms:public:update", "rooms:public:remove",
         ]:
-            self.sio.on(ev, self._mk(ev))
+            sio.on(ev, self._mk(ev))
+        return sio
+
+    def warm_up(self):
+        """
+        Précharge requests / socketio / requests_toolbelt dans un thread daemon
+        (à appeler une fois la fenêtre affichée). Sans effet si déjà chargés.
+        """
+        def _load():
+            try:
+                self.sess
+                self.sio
+                import requests_toolbelt  # noqa: F401  (envoi multipart des propositions)
+            except Exception:
+                pass
+        threading.Thread(target=_load, name="niwot-warmup", daemon=True).start()
 
     # ---------------- HTTP helpers ----------------
     def _set_auth_header_if_needed(self):
@@ -61,6 +139,7 @@ class NiwotClient(QtCore.QObject):
         endpoints = ["/auth/me", "/me", "/users/me"]
         self._set_auth_header_if_needed()
         last_err = ""
+        status = None  # dernier code HTTP reçu (None = serveur injoignable)
         for path in endpoints:
             url = f"{self.api_base}{path}"
             try:
@@ -70,9 +149,11 @@ class NiwotClient(QtCore.QObject):
                     user = (data.get("user") if isinstance(data, dict) and "user" in data else data)
                     return {"ok": True, "user": user}
                 last_err = f"{r.status_code} {r.text[:200]}"
+                if status not in (401, 403):
+                    status = r.status_code
             except Exception as e:
                 last_err = str(e)
-        return {"ok": False, "error": f"Impossible de récupérer /me: {last_err}"}
+        return {"ok": False, "status": status, "error": f"Impossible de récupérer /me: {last_err}"}
 
     def login(self, email: str, password: str) -> Dict[str, Any]:
         login_paths = ["/auth/login", "/login"]
@@ -128,6 +209,7 @@ class NiwotClient(QtCore.QObject):
 
     def logout(self) -> Dict[str, Any]:
         try:
+            self.forget_session()
             r = self.sess.post(f"{self.api_base}/auth/logout", timeout=10)
             self.bearer_token = None
             self.sess.headers.pop("Authorization", None)
@@ -136,6 +218,7 @@ class NiwotClient(QtCore.QObject):
             return {"ok": False, "error": str(e)}
 
     def get_categories(self) -> Dict[str, Any]:
+        """Bloquant : préférer self.categories (cache partagé). La route qui a répondu est retenue."""
         self._set_auth_header_if_needed()
         candidates = [
             ("/categories/stats", None),
@@ -147,6 +230,9 @@ class NiwotClient(QtCore.QObject):
             ("/api/categories", None),
             ("/api/v1/categories", None),
         ]
+        if self._categories_source in candidates:
+            candidates.remove(self._categories_source)
+            candidates.insert(0, self._categories_source)
         last_err = ""
         for path, params in candidates:
             url = f"{self.api_base}{path}"
@@ -154,28 +240,68 @@ class NiwotClient(QtCore.QObject):
                 r = self.sess.get(url, params=params, timeout=10)
                 if not r.ok:
                     last_err = f"{r.status_code} {r.text[:160]}"; continue
-                data = r.json()
-                arr = None
-                if isinstance(data, list): arr = data
-                elif isinstance(data, dict):
-                    for k in ("categories","data","items","result","rows","records"):
-                        if isinstance(data.get(k), list): arr = data[k]; break
-                if not isinstance(arr, list) or not arr: continue
-                norm: List[Dict[str, Any]] = []
-                for c in arr:
-                    if not isinstance(c, dict): continue
-                    cid = c.get("id") or c.get("_id") or c.get("ID") or c.get("uuid")
-                    name = c.get("name") or c.get("label") or c.get("title")
-                    approved = c.get("questionCount") or c.get("approvedCount") or c.get("count") or c.get("questionsApproved")
-                    if cid is None or name is None: continue
-                    try: cid = int(cid)
-                    except Exception: cid = str(cid)
-                    norm.append({"id": cid, "name": str(name), "approvedCount": approved if isinstance(approved,(int,float)) else None})
-                if norm: return {"ok": True, "categories": norm}
+                norm = normalize_categories(r.json())
+                if norm:
+                    self._categories_source = (path, params)
+                    return {"ok": True, "categories": norm}
             except Exception as e:
                 last_err = str(e)
         return {"ok": False, "error": f"Échec de chargement des catégories: {last_err or 'aucune source valide'}"}
 
+    # ---------------- Session persistante ----------------
+    def save_session(self, user: Optional[Dict[str, Any]]):
+        """Mémorise cookies + jeton + identité (écriture protégée, hors thread UI)."""
+        cookies = []
+        for c in self.sess.cookies:
+            cookies.append({
+                "name": c.name, "value": c.value, "domain": c.domain, "path": c.path,
+                "secure": bool(c.secure), "expires": c.expires,
+                "rest": {k: v for k, v in getattr(c, "_rest", {}).items() if isinstance(v, (str, type(None)))},
+            })
+        state = {
+            "v": 1, "api": self.api_base, "savedAt": int(time.time()),
+            "token": self.bearer_token, "cookies": cookies, "user": user,
+        }
+        niwot_storage.write_json_async(SESSION_FILE, state, secret=True)
+
+    def restore_session(self) -> Optional[Dict[str, Any]]:
+        """
+        Recharge la session mémorisée pour cette API (sans importer requests) et
+        retourne l'identité en cache, ou None. La validité reste à vérifier via me().
+        """
+        state = niwot_storage.read_json(SESSION_FILE, secret=True)
+        if not isinstance(state, dict) or state.get("v") != 1 or state.get("api") != self.api_base:
+            return None
+        now = time.time()
+        cookies = [c for c in state.get("cookies") or []
+                   if isinstance(c, dict) and (not c.get("expires") or c["expires"] > now)]
+        token = state.get("token")
+        user = state.get("user")
+        if not (cookies or token) or not isinstance(user, dict):
+            return None
+        self.bearer_token = str(token) if token else None
+        if self._sess is None:
+            self._saved_cookies = cookies
+        else:
+            self._load_cookies(self._sess, cookies)
+            self._set_auth_header_if_needed()
+        return user
+
+    def forget_session(self):
+        niwot_storage.remove_async(SESSION_FILE)
+
+    @staticmethod
+    def _load_cookies(sess: "requests.Session", cookies: List[Dict[str, Any]]):
+        from requests.cookies import create_cookie
+        for c in cookies:
+            try:
+                sess.cookies.set_cookie(create_cookie(
+                    c["name"], c["value"], domain=c.get("domain") or "", path=c.get("path") or "/",
+                    secure=bool(c.get("secure")), expires=c.get("expires"), rest=c.get("rest") or {},
+                ))
+            except Exception:
+                pass
+
     # ---------------- Socket.IO ----------------
     def connect_socket(self):
         if not self.ws_base or self.sio.connected:
@@ -190,24 +316,50 @@ class NiwotClient(QtCore.QObject):
 
     def disconnect_socket(self):
         try:
-            if self.sio and self.sio.connected:
-                self.sio.disconnect()
+            if self._sio is not None and self._sio.connected:
+                self._sio.disconnect()
         except Exception:
             pass
 
     def socket_emit(self, event: str, data: Optional[dict] = None, ack=None):
-        if not self.sio or not self.sio.connected:
+        if self._sio is None or not self._sio.connected:
+            niwot_metrics.inc("socket.emit_dropped", event=event)
             return
-        if ack: self.sio.emit(event, data or {}, callback=ack)
-        else:   self.sio.emit(event, data or {})
+        niwot_metrics.inc("socket.emits", event=event)
+        if ack: self.sio.emit(event, data or {}, callback=self._timed_ack(event, ack))
+        else:
+            niwot_trace.instant(f"emit {event}", "socket")
+            self.sio.emit(event, data or {})
+
+    def pending_events(self) -> int:
+        """Évènements socket reçus, pas encore remis au thread UI (lisible depuis tout thread)."""
+        return self._evt_queue.qsize()
 
     # ---------------- Internes ----------------
+    @staticmethod
+    def _timed_ack(event: str, ack):
+        """Aller-retour émission -> accusé (thread socket) : socket.rtt.ms, jauge socket.rtt_ms, span async."""
+        t0 = time.perf_counter()
+        aid = niwot_trace.async_begin(f"emit {event}", "socket.ack")
+
+        def _ack(*args):
+            ms = (time.perf_counter() - t0) * 1000.0
+            niwot_trace.async_end(f"emit {event}", "socket.ack", aid)
+            niwot_metrics.observe("socket.rtt.ms", ms, event=event)
+            niwot_metrics.set_gauge("socket.rtt_ms", ms)
+            return ack(*args)
+        return _ack
+
+
     def _queue(self, ev: str, payload: object):
-        # appelé depuis le thread socket
-        try:
-            self._evt_queue.put((ev, payload))
-        except Exception:
-            pass
+        # appelé depuis le thread socket (la taille est mesurée ici, pas dans le thread UI)
+        niwot_trace.instant(f"recv {ev}", "socket")
+        self._evt_queue.put((ev, payload, time.perf_counter()))
+        if niwot_metrics.ENABLED:
+            try:  # mesure seulement : un échec ne doit pas perdre l'évènement, déjà en file
+                niwot_metrics.inc("socket.bytes", len(json.dumps(payload, default=str)), event=ev)
+            except Exception:
+                niwot_metrics.inc("errors.swallowed", where="socket.bytes")
 
     def _mk(self, ev: str):
         def _fwd(data=None):
@@ -217,12 +369,23 @@ class NiwotClient(QtCore.QObject):
     @QtCore.Slot()
     def _drain_queue(self):
         # appelé dans le thread UI (par QTimer self._pump)
+        niwot_metrics.set_gauge("socket.queue_depth", self._evt_queue.qsize())
         try:
             while True:
-                ev, payload = self._evt_queue.get_nowait()
+                ev, payload, at = self._evt_queue.get_nowait()
+                t0 = time.perf_counter()
+                niwot_metrics.observe("socket.wait.ms", (t0 - at) * 1000.0, event=ev)  # attente dans la file
+                self.dispatching = ev
                 try:
                     self.sig_socket_message.emit(ev, payload)
                 except Exception:
-                    pass
+                    niwot_metrics.inc("errors.swallowed", where="socket.handler", event=ev)
+                finally:
+                    self.dispatching = None
+                t1 = time.perf_counter()
+                niwot_metrics.observe("socket.handler.ms", (t1 - t0) * 1000.0, event=ev)
+                if niwot_trace.recording:
+                    niwot_trace.complete(ev, "socket.dispatch", t0, t1, {"wait_ms": round((t0 - at) * 1000.0, 2)})
+                niwot_metrics.inc("socket.events", event=ev)
         except queue.Empty:
             return
@@ -0,0 +1,135 @@
+# niwot_clock.py
+from __future__ import annotations
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from PySide6 import QtCore, QtWidgets
+
+
+def now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class FrameClock(QtCore.QObject):
+    """
+    Horloge partagée par tous les widgets : un seul QTimer (précis, one-shot) réarmé sur
+    la prochaine échéance visible parmi les abonnés, au lieu d'un timer périodique par widget.
+
+    Un abonné fournit :
+      - next_change(now_ms) -> instant (ms epoch) du prochain changement visible, ou None
+      - on_change()         -> appelé dans le thread UI quand cet instant est atteint
+    Après un changement d'état (nouvelle question, nouvel endsAt…) appeler wake().
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._fire)
+        self._subs: Dict[object, Tuple[Callable[[int], Optional[int]], Callable[[], None]]] = {}
+        self._due: Dict[object, int] = {}
+
+    def subscribe(self, key: object, next_change: Callable[[int], Optional[int]], on_change: Callable[[], None]):
+        self._subs[key] = (next_change, on_change)
+        self.wake()
+
+    def unsubscribe(self, key: object):
+        self._subs.pop(key, None)
+        self._due.pop(key, None)
+        self.wake()
+
+    def wake(self):
+        """Recalcule les échéances (à appeler après un changement d'état d'un abonné)."""
+        now = now_ms()
+        self._due.clear()
+        for key, (next_change, _) in self._subs.items():
+            try:
+                t = next_change(now)
+            except Exception:
+                t = None
+            if t is not None:
+                self._due[key] = int(t)
+        if not self._due:
+            self._timer.stop()
+            return
+        self._timer.start(max(0, min(self._due.values()) - now))
+
+    @QtCore.Slot()
+    def _fire(self):
+        now = now_ms()
+        for key, due in list(self._due.items()):
+            sub = self._subs.get(key)
+            if sub is None or due > now:
+                continue  # réveil anticipé de ~1 ms : on se réarme simplement
+            try:
+                sub[1]()
+            except Exception:
+                pass
+        self.wake()
+
+
+_clock: Optional[FrameClock] = None
+
+
+def shared_clock() -> FrameClock:
+    """Instance unique (créée dans le thread UI au premier appel)."""
+    global _clock
+    if _clock is None:
+        _clock = FrameClock()
+    return _clock
+
+
+class CountdownBar(QtWidgets.QProgressBar):
+    """
+    Barre de temps restant animée en continu par le pilote d'animation Qt (aligné sur le
+    rafraîchissement écran), sans timer applicatif. Arrêtée quand le widget est masqué.
+    """
+    RESOLUTION = 1000
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
+        super().__init__(parent)
+        self.setRange(0, self.RESOLUTION)
+        self.setValue(0)
+        self.setTextVisible(False)
+        self.setFixedHeight(4)
+        self._anim = QtCore.QVariantAnimation(self)
+        self._anim.setEasingCurve(QtCore.QEasingCurve.Type.Linear)
+        self._anim.valueChanged.connect(lambda v: self.setValue(int(v)))
+        self._ends_at_ms: Optional[int] = None
+        self._total_ms = 0
+        self._drift_ms = 0
+
+    def start(self, ends_at_ms: Optional[int], total_ms: int, drift_ms: int = 0):
+        self._ends_at_ms = ends_at_ms
+        self._total_ms = max(1, int(total_ms or 1))
+        self._drift_ms = int(drift_ms or 0)
+        self._restart()
+
+    def stop(self):
+        self._anim.stop()
+        self._ends_at_ms = None
+        self.setValue(0)
+
+    def _restart(self):
+        self._anim.stop()
+        if self._ends_at_ms is None:
+            self.setValue(0)
+            return
+        left = max(0, self._ends_at_ms - (now_ms() + self._drift_ms))
+        start = int(self.RESOLUTION * min(1.0, left / self._total_ms))
+        self.setValue(start)
+        if left <= 0 or not self.isVisible():
+            return
+        self._anim.setStartValue(start)
+        self._anim.setEndValue(0)
+        self._anim.setDuration(left)
+        self._anim.start()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._restart()
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        self._anim.stop()
@@ -0,0 +1,377 @@
+# niwot_import.py
+from __future__ import annotations
+import copy, csv, hashlib, io, json, os, re, time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from PySide6 import QtCore, QtGui
+
+import niwot_storage
+import niwot_tasks
+from niwot_categories import search_text
+from niwot_outbox import TransientError, deliver_suggestion
+
+IMPORT_PARALLEL = 3        # propositions en vol au plus
+IMPORT_RETRIES = 5         # tentatives par ligne sur échec passager, avant « échec »
+IMPORT_RETRY_S = 2.0       # 2 s, 4 s… entre deux tentatives d'une même ligne
+JOURNAL_FILE = "import_journal.json"  # lignes déjà envoyées, par fichier : reprise sans doublon
+
+# Colonnes reconnues (en-têtes sans accents ni casse) -> champ
+_ALIASES = {
+    "text": ("question", "text", "texte", "intitule"),
+    "type": ("type",),
+    "citation": ("citation", "citationtext", "quote"),
+    "image": ("image", "fichier", "file"),
+    "answer": ("answer", "reponse"),
+    "alternatives": ("alternatives", "variantes"),
+    "explanation": ("explanation", "explication"),
+    "categories": ("categories", "categorie", "categoryids"),
+}
+_SPLIT = re.compile(r"\s*[|;\n]\s*")
+
+# statuts de ligne
+INVALID, READY, SENDING, SENT, DONE_BEFORE, FAILED = "invalid", "ready", "sending", "sent", "done", "failed"
+_STATUS_LABELS = {INVALID: "Invalide", READY: "Prête", SENDING: "Envoi…", SENT: "Envoyée",
+                  DONE_BEFORE: "Déjà envoyée", FAILED: "Échec"}
+_STATUS_COLORS = {INVALID: "#ff8b8b", FAILED: "#ff8b8b", SENT: "#69f0ae", DONE_BEFORE: "#69f0ae"}
+
+
+class ImportRow:
+    __slots__ = ("line", "raw", "fields", "image", "errors", "key", "status", "error", "attempts")
+
+    def __init__(self, line: int, raw: Dict[str, Any]):
+        self.line = line          # n° de ligne dans le fichier (pour les messages)
+        self.raw = raw
+        self.fields: Dict[str, Any] = {}
+        self.image: Optional[str] = None
+        self.errors: List[str] = []
+        self.key = ""             # Idempotency-Key : même ligne = même clé, d'un essai à l'autre
+        self.status = READY
+        self.error = ""
+        self.attempts = 0
+
+
+# ---------- Lecture ----------
+def read_rows(path: str) -> List[Dict[str, Any]]:
+    """CSV (séparateur , ou ; détecté, UTF-8 ou Windows-1252) ou JSON (liste ou {questions: [...]})."""
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        text = data.decode("cp1252")
+    if path.lower().endswith(".json"):
+        d = json.loads(text)
+        arr = d.get("questions") if isinstance(d, dict) else d
+        if not isinstance(arr, list):
+            raise ValueError("JSON attendu : une liste de questions ou {\"questions\": [...]}")
+        return [x if isinstance(x, dict) else {} for x in arr]
+    try:
+        dialect = csv.Sniffer().sniff(text[:4096], delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    return [dict(r) for r in csv.DictReader(io.StringIO(text), dialect=dialect)]
+
+
+def _fold(s: str) -> str:
+    return search_text({"name": s})
+
+
+def _get(raw: Dict[str, Any], field: str) -> Any:
+    for k, v in raw.items():
+        if re.sub(r"[\s_-]", "", _fold(str(k or ""))) in _ALIASES[field]:
+            return v
+    return None
+
+
+def _text(v: Any) -> str:
+    return str(v).strip() if v is not None else ""
+
+
+def _items(v: Any) -> List[str]:
+    if isinstance(v, list):
+        return [_text(x) for x in v if _text(x)]
+    return [x for x in _SPLIT.split(_text(v)) if x]
+
+
+def build_rows(raw_rows: List[Dict[str, Any]], categories: List[Dict[str, Any]],
+               image_dir: Optional[str], first_line: int = 1) -> List[ImportRow]:
+    """
+    Validation locale de toutes les lignes (mêmes règles que le formulaire) avant tout envoi.
+    first_line : numéro affiché de la première ligne (2 pour un CSV, après l'en-tête).
+    """
+    by_id = {str(c["id"]): c["id"] for c in categories}
+    by_name = {_fold(c["name"]): c["id"] for c in categories}
+    rows: List[ImportRow] = []
+    seen: Dict[str, int] = {}
+    for n, raw in enumerate(raw_rows, start=first_line):
+        row = ImportRow(n, raw)
+        text, quote = _text(_get(raw, "text")), _text(_get(raw, "citation"))
+        image, answer = _text(_get(raw, "image")), _text(_get(raw, "answer"))
+        qtype = _text(_get(raw, "type")).upper() or ("IMAGE" if image else "CITATION")
+        if not text:
+            row.errors.append("question manquante")
+        if qtype not in ("CITATION", "IMAGE"):
+            row.errors.append(f"type inconnu « {qtype} » (CITATION ou IMAGE)")
+        if qtype == "CITATION" and not quote:
+            row.errors.append("citation manquante")
+        if qtype == "IMAGE":
+            if not image:
+                row.errors.append("image manquante")
+            else:
+                path = image if os.path.isabs(image) else os.path.join(image_dir or "", image)
+                if not image_dir and not os.path.isabs(image):
+                    row.errors.append("dossier d'images non choisi")
+                elif not os.path.isfile(path):
+                    row.errors.append(f"image introuvable : {image}")
+                else:
+                    row.image = path
+        if not answer:
+            row.errors.append("réponse manquante")
+        cat_ids = []
+        if not categories:
+            row.errors.append("catalogue des catégories indisponible")
+        for name in _items(_get(raw, "categories")):
+            cid = by_id.get(name, by_name.get(_fold(name)))
+            if cid is None:
+                row.errors.append(f"catégorie inconnue : {name}")
+            elif cid not in cat_ids:
+                cat_ids.append(cid)
+        if categories and not cat_ids and not any(e.startswith("catégorie") for e in row.errors):
+            row.errors.append("au moins une catégorie")
+
+        alts = _items(_get(raw, "alternatives"))
+        row.fields = {"text": text, "type": qtype, "answer": answer,
+                      "alternatives": json.dumps(alts) if alts else "",
+                      "explanation": _text(_get(raw, "explanation")),
+                      "categoryIds": json.dumps(cat_ids)}
+        if qtype == "CITATION":
+            row.fields["citationText"] = quote
+        # clé stable : contenu de la ligne (+ nom d'image), indépendante de sa position
+        row.key = "import-" + hashlib.sha256(json.dumps([row.fields, image], sort_keys=True)
+                                             .encode("utf-8")).hexdigest()[:32]
+        if row.key in seen:  # même clé : le serveur n'en garderait qu'une
+            row.errors.append(f"doublon de la ligne {seen[row.key]}")
+        seen.setdefault(row.key, n)
+        row.status = INVALID if row.errors else READY
+        rows.append(row)
+    return rows
+
+
+# ---------- Modèle ----------
+class ImportModel(QtCore.QAbstractTableModel):
+    """Lignes importées et leur statut ; une seule ligne repeinte par changement de statut."""
+    HEADERS = ("Ligne", "Question", "Type", "Réponse", "Statut")
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.rows: List[ImportRow] = []
+
+    def set_rows(self, rows: List[ImportRow]):
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def row_changed(self, i: int):
+        self.dataChanged.emit(self.index(i, 0), self.index(i, len(self.HEADERS) - 1))
+
+    def count(self, *statuses: str) -> int:
+        return sum(1 for r in self.rows if r.status in statuses)
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role == QtCore.Qt.ItemDataRole.DisplayRole and orientation == QtCore.Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        r, col = self.rows[index.row()], index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return str(r.line)
+            if col == 1:
+                return r.fields.get("text", "")
+            if col == 2:
+                return r.fields.get("type", "")
+            if col == 3:
+                return r.fields.get("answer", "")
+            label = _STATUS_LABELS[r.status]
+            if r.status == INVALID:
+                return f"{label} : {r.errors[0]}" + (f" (+{len(r.errors) - 1})" if len(r.errors) > 1 else "")
+            if r.status == FAILED:
+                return f"{label} : {r.error}"
+            if r.status == SENDING and r.attempts > 1:
+                return f"{label} (essai {r.attempts})"
+            return label
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole and col == 4 and (r.errors or r.error):
+            return "\n".join(r.errors) or r.error
+        if role == QtCore.Qt.ItemDataRole.ForegroundRole and col == 4 and r.status in _STATUS_COLORS:
+            return QtGui.QBrush(QtGui.QColor(_STATUS_COLORS[r.status]))
+        return None
+
+
+# ---------- Envoi ----------
+def load_import(path: str, categories: List[Dict[str, Any]],
+                image_dir: Optional[str]) -> Tuple[List[ImportRow], str, Dict[str, Any]]:
+    """
+    Thread worker : lecture, validation et reprise. Renvoie (lignes, clé du fichier, journal) ;
+    les lignes déjà envoyées lors d'un import précédent du même fichier sont marquées.
+    """
+    with open(path, "rb") as f:
+        file_key = hashlib.sha256(f.read()).hexdigest()
+    first = 1 if path.lower().endswith(".json") else 2  # CSV : ligne 1 = en-tête
+    rows = build_rows(read_rows(path), categories, image_dir, first)
+    j = niwot_storage.read_json(JOURNAL_FILE)
+    journal = j if isinstance(j, dict) else {}
+    done = set((journal.get(file_key) or {}).get("sent") or [])
+    for r in rows:
+        if r.key in done and r.status == READY:
+            r.status = DONE_BEFORE
+    return rows, file_key, journal
+
+
+_pool: Optional[QtCore.QThreadPool] = None
+
+
+def _send_pool() -> QtCore.QThreadPool:
+    """Pool partagé par les imports : fermer le dialogue n'attend pas les envois en vol."""
+    global _pool
+    if _pool is None:
+        _pool = QtCore.QThreadPool()
+        _pool.setMaxThreadCount(IMPORT_PARALLEL)
+    return _pool
+
+
+class ImportRunner(QtCore.QObject):
+    """
+    Envoie les lignes prêtes via /suggest, IMPORT_PARALLEL à la fois. Échec passager :
+    la ligne est retentée (IMPORT_RETRIES fois, attente croissante) puis marquée « échec ».
+    Chaque ligne envoyée est notée dans import_journal.json : rouvrir le même fichier
+    (après un arrêt, une panne réseau…) marque ces lignes « déjà envoyée » et ne renvoie
+    que le reste ; l'Idempotency-Key couvre les lignes en vol au moment de l'arrêt.
+
+    Signals:
+      - sig_progress()    statut d'une ligne ou statistiques changés
+      - sig_finished()
+    """
+    sig_progress = QtCore.Signal()
+    sig_finished = QtCore.Signal()
+
+    def __init__(self, client, model: ImportModel, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._client = client
+        self._model = model
+        self._file_key = ""
+        self._journal: Dict[str, Any] = {}
+        self._queue: List[int] = []
+        self._inflight: Dict[int, niwot_tasks.Task] = {}
+        self._retrying: Set[int] = set()  # lignes en attente d'un nouvel essai
+        self._running = False    # session d'envoi en cours (jusqu'à sig_finished)
+        self._stopped = False    # stop() demandé : on attend les lignes en vol
+        self.started_at = 0.0
+        self.sent_now = 0        # lignes envoyées depuis start()
+
+    def attach(self, file_key: str, journal: Dict[str, Any]):
+        """Fichier chargé par load_import() ; ses envois sont notés dans le journal."""
+        self._file_key = file_key
+        self._journal = journal
+        self.started_at, self.sent_now = 0.0, 0
+
+    def _remember(self, key: str):
+        entry = self._journal.setdefault(self._file_key, {"sent": []})
+        entry["sent"].append(key)
+        entry["at"] = time.time()
+        niwot_storage.write_json_async(JOURNAL_FILE, copy.deepcopy(self._journal))  # sérialisé hors thread UI
+
+    # --- envoi ---
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self):
+        """Envoie les lignes prêtes et celles en échec (reprise)."""
+        rows = self._model.rows
+        self._queue = [i for i, r in enumerate(rows) if r.status in (READY, FAILED)]
+        for i in self._queue:
+            rows[i].attempts = 0
+        self._running, self._stopped = True, False
+        self.started_at = time.monotonic()
+        self.sent_now = 0
+        self._pump()
+
+    def stop(self):
+        """Plus de nouvel envoi ; les lignes en vol se terminent."""
+        self._stopped = True
+        self._queue.clear()
+        self._pump()
+
+    def cancel(self):
+        """Fermeture : plus aucun rappel. Une ligne en vol déjà reçue par le serveur sera
+        reconnue (409) au prochain envoi grâce à sa clé."""
+        self._stopped = True
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+        self._queue.clear()
+        self._retrying.clear()
+        self._running = False
+
+    def throughput(self) -> float:
+        """Lignes envoyées par minute depuis start()."""
+        dt = time.monotonic() - self.started_at
+        return self.sent_now * 60.0 / dt if self.started_at and dt > 0 else 0.0
+
+    def _pump(self):
+        rows = self._model.rows
+        while not self._stopped and self._queue and len(self._inflight) < IMPORT_PARALLEL:
+            i = self._queue.pop(0)
+            r = rows[i]
+            r.status, r.error = SENDING, ""
+            r.attempts += 1
+            self._model.row_changed(i)
+            self._inflight[i] = niwot_tasks.submit(deliver_suggestion, self._client, r.key, dict(r.fields), r.image,
+                                                   on_done=lambda _res, err, i=i: self._on_done(i, err),
+                                                   pool=_send_pool())
+        self.sig_progress.emit()
+        if self._running and not self._inflight and (self._stopped or not (self._queue or self._retrying)):
+            self._finish()
+
+    def _on_done(self, i: int, err: Optional[Exception]):
+        self._inflight.pop(i, None)
+        r = self._model.rows[i]
+        if err is None:
+            r.status = SENT
+            self.sent_now += 1
+            self._remember(r.key)
+        elif isinstance(err, TransientError) and not self._stopped and r.attempts < IMPORT_RETRIES:
+            r.status, r.error = READY, str(err)
+            self._retrying.add(i)
+            QtCore.QTimer.singleShot(int(IMPORT_RETRY_S * 1000 * r.attempts), lambda: self._requeue(i))
+        else:
+            r.status, r.error = FAILED, str(err)
+        self._model.row_changed(i)
+        self._pump()
+
+    def _requeue(self, i: int):
+        if i not in self._retrying:
+            return
+        self._retrying.discard(i)
+        self._queue.append(i)
+        self._pump()
+
+    def _finish(self):
+        for i in self._retrying:  # nouvel essai programmé mais import arrêté
+            r = self._model.rows[i]
+            r.status = FAILED
+            self._model.row_changed(i)
+        self._retrying.clear()
+        self._queue.clear()
+        self._running = False
+        self.sig_progress.emit()
+        self.sig_finished.emit()
@@ -0,0 +1,191 @@
+# niwot_leaderboard.py
+from __future__ import annotations
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from PySide6 import QtCore, QtGui
+
+import niwot_tasks
+
+PAGE_SIZE = 100
+MAX_PAGES = 12          # pages gardées en mémoire (LRU) : ~1200 lignes quel que soit le classement
+PAGE_TIMEOUT_S = 10
+RETRY_AFTER_S = 5.0     # page en échec : pas de nouvelle requête avant ce délai (survol, repeint…)
+
+# Classements paginés : GET <path>?offset=&limit= -> {<key>: [...], total: N}
+#                       GET <path>/rank?userId=   -> {rank: N} (1 = premier)
+BOARDS: Dict[str, Dict[str, str]] = {
+    "players": {"path": "/leaderboard", "key": "leaders", "score": "wins", "label": "Victoires"},
+    "proposers": {"path": "/leaderboard/proposers", "key": "proposers", "score": "approvedCount",
+                  "label": "Questions approuvées"},
+}
+
+
+def fetch_page(c, board: str, offset: int, limit: int) -> Tuple[List[Dict[str, Any]], Optional[int], float]:
+    """(lignes, total annoncé ou None, durée de la requête en ms) — thread worker."""
+    spec = BOARDS[board]
+    t0 = time.perf_counter()
+    r = c.sess.get(f"{c.api_base}{spec['path']}", params={"offset": offset, "limit": limit},
+                   timeout=PAGE_TIMEOUT_S)
+    r.raise_for_status()
+    d = r.json() if "application/json" in (r.headers.get("content-type") or "") else {}
+    ms = (time.perf_counter() - t0) * 1000.0
+    arr = d if isinstance(d, list) else (d.get(spec["key"]) or d.get("top") or [])
+    rows = []
+    for i, u in enumerate(arr[:limit]):
+        try:
+            rows.append({"rank": int(u.get("rank") or offset + i + 1),
+                         "username": str(u.get("username") or ""),
+                         "score": int(u.get(spec["score"]) or 0)})
+        except Exception:
+            continue
+    total = d.get("total") if isinstance(d, dict) else None
+    return rows, (int(total) if isinstance(total, (int, float)) else None), ms
+
+
+def fetch_rank(c, board: str, user_id: Any) -> Optional[int]:
+    r = c.sess.get(f"{c.api_base}{BOARDS[board]['path']}/rank", params={"userId": user_id},
+                   timeout=PAGE_TIMEOUT_S)
+    if not r.ok:
+        return None
+    d = r.json() if "application/json" in (r.headers.get("content-type") or "") else {}
+    rank = d.get("rank")
+    return int(rank) if isinstance(rank, (int, float)) and rank > 0 else None
+
+
+class LeaderboardModel(QtCore.QAbstractTableModel):
+    """
+    Classement complet, virtuel : rowCount = total annoncé par le serveur, les pages
+    de PAGE_SIZE lignes sont demandées quand la vue les affiche (data()), la suivante
+    dans le sens du défilement est préchargée, et seules MAX_PAGES restent en mémoire.
+    Sans « total » côté serveur, la liste s'allonge d'une page tant que les pages sont pleines.
+
+    Signals:
+      - sig_page_loaded(page: int, ms: float)   durée de la requête de la page
+      - sig_failed(str)
+    """
+    sig_page_loaded = QtCore.Signal(int, float)
+    sig_failed = QtCore.Signal(str)
+
+    def __init__(self, client, board: str = "players", parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._client = client
+        self.board = board
+        self.me: Optional[str] = None  # pseudo mis en gras
+        self._pages: "OrderedDict[int, List[Dict[str, Any]]]" = OrderedDict()
+        self._inflight: Dict[int, niwot_tasks.Task] = {}
+        self._failed_until: Dict[int, float] = {}  # page -> time.monotonic() de la prochaine tentative
+        self._total = 0
+        self._last_page = -1  # la 1re page affichée précharge la 2e
+
+    # --- classement ---
+    def set_board(self, board: str):
+        for task in self._inflight.values():
+            task.cancel()
+        self.beginResetModel()
+        self.board = board
+        self._pages.clear()
+        self._inflight.clear()
+        self._failed_until.clear()
+        self._total = 0
+        self._last_page = -1  # la 1re page affichée précharge la 2e
+        self.endResetModel()
+        self._want(0)
+
+    def start(self):
+        self._want(0)
+
+    def ensure_rows(self, count: int):
+        """Allonge la liste à au moins count lignes (ex. saut à un rang au-delà des pages connues)."""
+        if count > self._total:
+            self._set_total(count)
+
+    @property
+    def pages_held(self) -> int:
+        return len(self._pages)
+
+    # --- lecture ---
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._total
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else 3
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role == QtCore.Qt.ItemDataRole.DisplayRole and orientation == QtCore.Qt.Orientation.Horizontal:
+            return ("#", "Pseudo", BOARDS[self.board]["label"])[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        p, i = divmod(index.row(), PAGE_SIZE)
+        page = self._pages.get(p)
+        if page is None:
+            self._want(p)
+            if role == QtCore.Qt.ItemDataRole.DisplayRole:
+                return str(index.row() + 1) if index.column() == 0 else "…"
+            return None
+        self._pages.move_to_end(p)  # LRU : les pages affichées ne sont pas évincées
+        if p != self._last_page:
+            # préchargement d'une page dans le sens du défilement
+            self._want(p + 1 if p > self._last_page else p - 1)
+            self._last_page = p
+        if i >= len(page):
+            return None
+        u = page[i]
+        col = index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return str(u["rank"]) if col == 0 else (u["username"] if col == 1 else str(u["score"]))
+        if role == QtCore.Qt.ItemDataRole.FontRole and self.me and u["username"] == self.me:
+            f = QtGui.QFont()
+            f.setBold(True)
+            return f
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole and col != 1:
+            return int(QtCore.Qt.AlignmentFlag.AlignCenter)
+        return None
+
+    # --- pages ---
+    def _want(self, p: int):
+        if p < 0 or p in self._pages or p in self._inflight:
+            return
+        if self._failed_until.get(p, 0.0) > time.monotonic():
+            return
+        if p > 0 and p * PAGE_SIZE >= self._total:
+            return
+        board = self.board
+        self._inflight[p] = niwot_tasks.submit(
+            fetch_page, self._client, board, p * PAGE_SIZE, PAGE_SIZE,
+            on_done=lambda res, err: self._on_page(board, p, res, err))
+
+    def _on_page(self, board: str, p: int, result: Any, err: Optional[Exception]):
+        if board != self.board:
+            return
+        self._inflight.pop(p, None)
+        if err is not None:
+            self._failed_until[p] = time.monotonic() + RETRY_AFTER_S
+            self.sig_failed.emit(str(err))
+            return
+        self._failed_until.pop(p, None)
+        rows, total, ms = result
+        self._pages[p] = rows
+        while len(self._pages) > MAX_PAGES:
+            self._pages.popitem(last=False)
+        if total is None:  # pas de total : une page de plus tant que les pages sont pleines
+            total = max(self._total, p * PAGE_SIZE + len(rows) + (PAGE_SIZE if len(rows) == PAGE_SIZE else 0))
+        self._set_total(total)
+        first, last = p * PAGE_SIZE, min(p * PAGE_SIZE + len(rows), self._total) - 1
+        if last >= first:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, 2))
+        self.sig_page_loaded.emit(p, ms)
+
+    def _set_total(self, total: int):
+        if total > self._total:
+            self.beginInsertRows(QtCore.QModelIndex(), self._total, total - 1)
+            self._total = total
+            self.endInsertRows()
+        elif total < self._total:
+            self.beginRemoveRows(QtCore.QModelIndex(), total, self._total - 1)
+            self._total = total
+            self.endRemoveRows()
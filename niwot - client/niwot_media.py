@@ -0,0 +1,261 @@
+# niwot_media.py
+from __future__ import annotations
+import base64, math
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from PySide6 import QtCore, QtGui
+
+import niwot_metrics
+import niwot_tasks
+import niwot_trace
+
+
+def decode_scaled(data: bytes, height: int) -> QtGui.QImage:
+    """
+    Décode une image directement à la hauteur voulue (QImageReader.setScaledSize),
+    sans passer par l'image pleine résolution. Utilisable hors thread UI (QImage only).
+    """
+    buf = QtCore.QBuffer()
+    buf.setData(QtCore.QByteArray(data))
+    buf.open(QtCore.QIODevice.OpenModeFlag.ReadOnly)
+    reader = QtGui.QImageReader(buf)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if height > 0 and size.isValid() and size.height() > 0 and size.height() != height:
+        w = max(1, round(size.width() * height / size.height()))
+        reader.setScaledSize(QtCore.QSize(w, height))
+    with niwot_trace.span("decode_scaled", "image", h=height, bytes=len(data)):
+        img = reader.read()
+    if img.isNull():
+        return QtGui.QImage()
+    # certains formats ignorent setScaledSize : on termine ici, toujours hors thread UI
+    if height > 0 and img.height() != height:
+        img = img.scaledToHeight(height, QtCore.Qt.TransformationMode.SmoothTransformation)
+    return img
+
+
+# Indices de taille ajoutés aux URLs de médias ({w} = côté en pixels physiques)
+DEFAULT_VARIANT_QUERY = "w={w}&fmt=webp"
+
+
+class MediaError(RuntimeError):
+    """Échec HTTP lors du chargement d'un média (message = code de statut)."""
+
+
+def image_size(data: bytes) -> QtCore.QSize:
+    """Dimensions d'une image encodée, sans la décoder."""
+    buf = QtCore.QBuffer()
+    buf.setData(QtCore.QByteArray(data))
+    buf.open(QtCore.QIODevice.OpenModeFlag.ReadOnly)
+    return QtGui.QImageReader(buf).size()
+
+
+def decode_cover(data: bytes, side: int) -> QtGui.QImage:
+    """
+    Décode une image pour remplir un carré side x side (équivalent KeepAspectRatioByExpanding) :
+    le plus petit côté vaut side. Les images plus petites sont décodées telles quelles.
+    """
+    buf = QtCore.QBuffer()
+    buf.setData(QtCore.QByteArray(data))
+    buf.open(QtCore.QIODevice.OpenModeFlag.ReadOnly)
+    reader = QtGui.QImageReader(buf)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if side > 0 and size.isValid() and min(size.width(), size.height()) > side:
+        k = side / min(size.width(), size.height())
+        reader.setScaledSize(QtCore.QSize(max(1, round(size.width() * k)), max(1, round(size.height() * k))))
+    with niwot_trace.span("decode_cover", "image", side=side, bytes=len(data)):
+        img = reader.read()
+    return img if not img.isNull() else QtGui.QImage()
+
+
+def variant_side(size: int, dpr: float = 1.0) -> int:
+    """Taille logique d'affichage -> pixels physiques demandés au serveur."""
+    return max(1, int(math.ceil(size * (dpr or 1.0))))
+
+
+def variant_url(url: str, side: int, template: Optional[str] = DEFAULT_VARIANT_QUERY) -> str:
+    """Ajoute les indices de taille/format à une URL http(s) (jamais aux data: URL)."""
+    if not template or not url or url.startswith("data:"):
+        return url
+    query = template.lstrip("?&").format(w=side, h=side)
+    return url + ("&" if "?" in url else "?") + query
+
+
+class MediaVariants:
+    """
+    Avatars et petits médias à la taille d'affichage, partagé par tous les widgets (client.media).
+
+    - Demande une variante (variant_url) puis décode au plus juste (decode_cover).
+    - Si le serveur refuse la variante (4xx/5xx, ou 200 sans image lisible) alors que
+      l'original répond, ou renvoie visiblement l'original (image > 2x la taille demandée),
+      l'hôte est marqué et on télécharge directement l'original, une seule fois pour toutes
+      les tailles.
+    - Cache des variantes par (source, côté en pixels), indépendant par taille.
+    """
+
+    def __init__(self, client: Any, query_template: Optional[str] = DEFAULT_VARIANT_QUERY,
+                 capacity: int = 256, timeout: float = 6.0):
+        self._client = client
+        self.query_template = query_template
+        self._capacity = max(1, int(capacity))
+        self._timeout = timeout
+        self._variants: "OrderedDict[Tuple[str, int], QtGui.QImage]" = OrderedDict()
+        self._originals: "OrderedDict[str, bytes]" = OrderedDict()
+        self._ignoring_hosts: Set[str] = set()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "variant": 0, "original": 0}
+
+    def image(self, source: str, side: int) -> QtGui.QImage:
+        """
+        Image pour un carré side x side (pixels physiques). data: URL ou URL absolue.
+        Lève MediaError / exceptions réseau en cas d'échec.
+        """
+        key = (source, int(side))
+        img = self._variants.get(key)
+        if img is not None:
+            self._variants.move_to_end(key)
+            self.stats["hits"] += 1
+            niwot_metrics.inc("cache.lookups", cache="media", result="hit")
+            return img
+        self.stats["misses"] += 1
+        niwot_metrics.inc("cache.lookups", cache="media", result="miss")
+        if source.startswith("data:"):
+            data = base64.b64decode(source.split(",", 1)[1])
+        else:
+            data = self._fetch(source, int(side))
+        img = decode_cover(data, int(side))
+        if not img.isNull():
+            self._variants[key] = img
+            niwot_metrics.add_gauge("cache.bytes", img.sizeInBytes(), cache="media")
+            while len(self._variants) > self._capacity:
+                niwot_metrics.add_gauge("cache.bytes", -self._variants.popitem(last=False)[1].sizeInBytes(), cache="media")
+        return img
+
+    def _fetch(self, url: str, side: int) -> bytes:
+        import requests
+        sess = getattr(self._client, "sess", None)
+        if sess is None:
+            raise MediaError("pas de session HTTP")
+        host = urlsplit(url).netloc
+        variant_failed = False
+        if self.query_template and host not in self._ignoring_hosts and url not in self._originals:
+            try:
+                r = sess.get(variant_url(url, side, self.query_template), timeout=self._timeout)
+                data = r.content if r.ok else b""
+            except requests.RequestException:  # délai (redimensionnement CDN), connexion coupée, SSL…
+                data = b""
+            size = image_size(data) if data else QtCore.QSize()
+            if size.isValid():
+                if min(size.width(), size.height()) > 2 * side:
+                    # indices ignorés : c'est l'original, on le garde pour les autres tailles
+                    self._ignoring_hosts.add(host)
+                    self._keep_original(url, data)
+                    self.stats["original"] += 1
+                else:
+                    self.stats["variant"] += 1
+                return data
+            # refusée, en échec réseau, ou 200 dont le corps n'est pas une image lisible : repli sur l'original
+            variant_failed = True
+        data = self._originals.get(url)
+        if data is not None:
+            self._originals.move_to_end(url)
+            return data
+        r = sess.get(url, timeout=self._timeout)
+        if not r.ok:
+            raise MediaError(str(r.status_code))
+        if variant_failed:
+            self._ignoring_hosts.add(host)
+        self.stats["original"] += 1
+        self._keep_original(url, r.content)
+        return r.content
+
+    def _keep_original(self, url: str, data: bytes):
+        self._originals[url] = data
+        self._originals.move_to_end(url)
+        while len(self._originals) > 32:
+            self._originals.popitem(last=False)
+
+
+class ImageLoader(QtCore.QObject):
+    """
+    Chargement + décodage d'images hors thread UI, avec cache LRU des images déjà mises à l'échelle.
+
+    source = data: URL ou URL absolue. Les requêtes HTTP passent par client.sess (cookies).
+
+    Signals:
+      - sig_ready(source: str, height: int, image: QImage)  (image nulle si échec)
+    """
+    sig_ready = QtCore.Signal(str, int, object)
+
+    def __init__(self, client: Any, capacity: int = 32, timeout: float = 8.0, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._client = client
+        self._capacity = max(1, int(capacity))
+        self._timeout = timeout
+        self._cache: "OrderedDict[Tuple[str, int], QtGui.QImage]" = OrderedDict()
+        self._pending: Set[Tuple[str, int]] = set()
+
+    # ---------- cache ----------
+    def cached(self, source: str, height: int) -> Optional[QtGui.QImage]:
+        key = (source, int(height))
+        img = self._cache.get(key)
+        if img is not None:
+            self._cache.move_to_end(key)
+        return img
+
+    def _store(self, key: Tuple[str, int], img: QtGui.QImage):
+        old = self._cache.get(key)
+        self._cache[key] = img
+        self._cache.move_to_end(key)
+        niwot_metrics.add_gauge("cache.bytes", img.sizeInBytes() - (old.sizeInBytes() if old is not None else 0),
+                                cache="images")
+        while len(self._cache) > self._capacity:
+            niwot_metrics.add_gauge("cache.bytes", -self._cache.popitem(last=False)[1].sizeInBytes(), cache="images")
+
+    # ---------- chargement ----------
+    def request(self, source: Optional[str], height: int) -> bool:
+        """
+        Lance le chargement si l'image n'est ni en cache ni déjà en cours.
+        Retourne True si l'image est déjà disponible (cached()).
+        """
+        if not source:
+            return False
+        key = (source, int(height))
+        if key in self._cache:
+            niwot_metrics.inc("cache.lookups", cache="images", result="hit")
+            return True
+        niwot_metrics.inc("cache.lookups", cache="images", result="miss")
+        if key in self._pending:
+            return False
+        self._pending.add(key)
+        niwot_tasks.submit(self._fetch_decode, source, int(height),
+                           on_done=lambda img, err, k=key: self._on_done(k, img, err))
+        return False
+
+    def prefetch(self, source: Optional[str], height: int):
+        """Alias explicite : charge en tâche de fond pour une question à venir."""
+        self.request(source, height)
+
+    def _fetch_decode(self, source: str, height: int) -> QtGui.QImage:
+        # thread worker : pas de QPixmap ici
+        if source.startswith("data:"):
+            data = base64.b64decode(source.split(",", 1)[1])
+        else:
+            sess = getattr(self._client, "sess", None)
+            if sess is None:
+                return QtGui.QImage()
+            r = sess.get(source, timeout=self._timeout)
+            if not r.ok:
+                return QtGui.QImage()
+            data = r.content
+        return decode_scaled(data, height)
+
+    def _on_done(self, key: Tuple[str, int], img: Any, err: Optional[Exception]):
+        self._pending.discard(key)
+        if err is not None or not isinstance(img, QtGui.QImage):
+            img = QtGui.QImage()
+        if not img.isNull():
+            self._store(key, img)
+        self.sig_ready.emit(key[0], key[1], img)
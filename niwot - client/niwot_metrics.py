@@ -0,0 +1,278 @@
+# niwot_metrics.py
+from __future__ import annotations
+import bisect, functools, os, threading, time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import niwot_trace
+
+# Registre de mesures en mémoire, appelable depuis n'importe quel thread :
+#   inc()        compteurs (requêtes, erreurs, octets…)
+#   set_gauge()  jauges (file socket, requêtes en vol, mémoire des images…)
+#   observe()    histogrammes à seaux fixes (durées en ms) : count / sum / max / p50 / p95 / p99
+# Une mesure coûte une clé de dict et quelques additions sous verrou (~1 µs) : laissé
+# actif en production. NIWOT_METRICS=0 le coupe ; NIWOT_METRICS_FILE=<chemin> écrit
+# snapshot() en JSON à la sortie (voir dump()). Les durées de timed() et des requêtes HTTP
+# deviennent aussi des spans niwot_trace quand une trace est en cours d'enregistrement.
+ENABLED = os.environ.get("NIWOT_METRICS", "1") != "0"
+
+# bornes hautes des seaux, en ms (la dernière case reçoit tout le reste)
+BUCKETS_MS = (0.25, 0.5, 1, 2, 4, 8, 16, 33, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_Key = Tuple[str, Tuple[Tuple[str, Any], ...]]
+_lock = threading.Lock()
+_counters: Dict[_Key, float] = {}
+_gauges: Dict[_Key, float] = {}
+_hists: Dict[_Key, "Histogram"] = {}
+
+
+class Histogram:
+    __slots__ = ("count", "sum", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def observe(self, v: float):
+        self.count += 1
+        self.sum += v
+        if v > self.max:
+            self.max = v
+        self.buckets[bisect.bisect_left(BUCKETS_MS, v)] += 1
+
+    def quantile(self, q: float) -> float:
+        """Borne haute du seau qui contient le quantile q (max pour la dernière case)."""
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(BUCKETS_MS[i], self.max) if i < len(BUCKETS_MS) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {"count": self.count, "sum": round(self.sum, 3), "max": round(self.max, 3),
+                "avg": round(self.sum / self.count, 4) if self.count else 0.0,
+                "p50": round(self.quantile(0.5), 3), "p95": round(self.quantile(0.95), 3),
+                "p99": round(self.quantile(0.99), 3)}
+
+
+def _key(name: str, labels: Dict[str, Any]) -> _Key:
+    return (name, tuple(sorted(labels.items()))) if labels else (name, ())
+
+
+# ---------- Écriture ----------
+def inc(name: str, n: float = 1, **labels: Any):
+    if not ENABLED:
+        return
+    k = _key(name, labels)
+    with _lock:
+        _counters[k] = _counters.get(k, 0) + n
+
+
+def set_gauge(name: str, value: float, **labels: Any):
+    if not ENABLED:
+        return
+    k = _key(name, labels)
+    with _lock:
+        _gauges[k] = value
+
+
+def add_gauge(name: str, delta: float, **labels: Any):
+    """Jauge relative (requêtes en vol : +1 au départ, -1 au retour)."""
+    if not ENABLED:
+        return
+    k = _key(name, labels)
+    with _lock:
+        _gauges[k] = _gauges.get(k, 0) + delta
+
+
+def observe(name: str, value: float, **labels: Any):
+    if not ENABLED:
+        return
+    k = _key(name, labels)
+    with _lock:
+        h = _hists.get(k)
+        if h is None:
+            h = _hists[k] = Histogram()
+        h.observe(value)
+
+
+class timer:
+    """with timer("render.ms", fn="...") : observe la durée du bloc en ms."""
+    __slots__ = ("name", "labels", "t0")
+
+    def __init__(self, name: str, **labels: Any):
+        self.name = name
+        self.labels = labels
+        self.t0 = 0.0
+
+    def __enter__(self) -> "timer":
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        observe(self.name, (time.perf_counter() - self.t0) * 1000.0, **self.labels)
+
+
+def timed(name: str, **labels: Any) -> Callable[[Callable], Callable]:
+    """Décorateur : durée de chaque appel en ms (fn=<qualname> ajouté aux étiquettes)."""
+    def deco(fn: Callable) -> Callable:
+        if not ENABLED:
+            return fn
+        k = _key(name, dict(labels, fn=fn.__qualname__))
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                t1 = time.perf_counter()
+                if niwot_trace.recording:
+                    niwot_trace.complete(fn.__qualname__, name, t0, t1)
+                ms = (t1 - t0) * 1000.0
+                with _lock:
+                    h = _hists.get(k)
+                    if h is None:
+                        h = _hists[k] = Histogram()
+                    h.observe(ms)
+        return wrapper
+    return deco
+
+
+# ---------- Lecture ----------
+def counter(name: str, **labels: Any) -> float:
+    return _counters.get(_key(name, labels), 0)
+
+
+def gauge(name: str, **labels: Any) -> float:
+    return _gauges.get(_key(name, labels), 0)
+
+
+def total(name: str) -> float:
+    """Somme d'un compteur sur toutes ses étiquettes."""
+    with _lock:
+        return sum(v for (n, _), v in _counters.items() if n == name)
+
+
+def select(name: str) -> Dict[Tuple[Tuple[str, Any], ...], float]:
+    """Toutes les séries d'un compteur : {étiquettes triées: valeur}."""
+    with _lock:
+        return {labels: v for (n, labels), v in _counters.items() if n == name}
+
+
+def histogram(name: str, **labels: Any) -> Optional[Dict[str, float]]:
+    with _lock:
+        h = _hists.get(_key(name, labels))
+        return h.summary() if h else None
+
+
+def label_text(name: str, labels: Tuple[Tuple[str, Any], ...]) -> str:
+    return name + ("{" + ",".join(f"{k}={v}" for k, v in labels) + "}" if labels else "")
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """Copie cohérente du registre : {counters, gauges, histograms}, clés « nom{étiquette=valeur} »."""
+    with _lock:
+        return {"counters": {label_text(*k): v for k, v in _counters.items()},
+                "gauges": {label_text(*k): v for k, v in _gauges.items()},
+                "histograms": {label_text(*k): h.summary() for k, h in _hists.items()}}
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _hists.clear()
+
+
+def dump(path: Optional[str] = None) -> Optional[str]:
+    """Écrit snapshot() en JSON (NIWOT_METRICS_FILE par défaut) ; renvoie le chemin écrit."""
+    path = path or os.environ.get("NIWOT_METRICS_FILE")
+    if not path or not ENABLED:
+        return None
+    import json
+    data = dict(snapshot(), at=time.time())
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+    return path
+
+
+# ---------- HTTP ----------
+# Gabarits de routes : segment qui suit une collection = identifiant (code de salle, pseudo,
+# id d'upload…), sauf sous-routes fixes ; sous un dossier de fichiers, tout le reste est le fichier.
+_ID_AFTER = {"rooms": {"public"}, "users": {"me"}, "uploads": set(), "chunks": set(),
+             "questions": set(), "suggestions": set(), "categories": {"stats", "list"}}
+_FILES = {"media", "static", "images", "avatars"}
+
+
+def route_of(url: str, base: str = "") -> str:
+    """« https://api/rooms/QWERTZ/join?x=1 » -> « /rooms/:id/join » : une étiquette par route, pas par URL."""
+    if base and url.startswith(base):
+        path = url[len(base):]
+    elif "://" in url:
+        return "ext"  # médias et autres hôtes : regroupés
+    else:
+        path = url
+    path = path.split("?", 1)[0].split("#", 1)[0]
+    out: List[str] = []
+    prev = ""
+    for seg in path.split("/"):
+        if prev in _FILES and seg:
+            out.append(":file")
+            break
+        fixed = _ID_AFTER.get(prev)
+        out.append(":id" if seg and (seg.isdigit() or (fixed is not None and seg not in fixed)) else seg)
+        prev = seg
+    return "/".join(out) or "/"
+
+
+def instrument_session(sess, base: str = ""):
+    """
+    Mesure chaque requête de la session requests (une seule fois) :
+      http.requests{method,route,status}   http.ms{method,route}   http.bytes_in / bytes_out{route}
+      http.errors{method,route,kind}       http.inflight (jauge)
+    """
+    if not ENABLED or getattr(sess, "_niwot_metrics", False):
+        return sess
+    request = sess.request
+
+    @functools.wraps(request)
+    def measured(method, url, *args, **kwargs):
+        route = route_of(str(url), base)
+        method = str(method).upper()
+        add_gauge("http.inflight", 1)
+        t0 = time.perf_counter()
+        try:
+            r = request(method, url, *args, **kwargs)
+        except Exception as e:
+            inc("http.errors", method=method, route=route, kind=type(e).__name__)
+            raise
+        finally:
+            t1 = time.perf_counter()
+            add_gauge("http.inflight", -1)
+            observe("http.ms", (t1 - t0) * 1000.0, method=method, route=route)
+            if niwot_trace.recording:
+                niwot_trace.complete(f"{method} {route}", "http", t0, t1, {"url": str(url)})
+        inc("http.requests", method=method, route=route, status=r.status_code)
+        try:
+            size = r.headers.get("Content-Length")
+            if size is None and not kwargs.get("stream"):
+                size = len(r.content)  # déjà lu : pas de coût réseau
+            inc("http.bytes_in", int(size or 0), route=route)
+            body = r.request.body
+            if body is not None:
+                inc("http.bytes_out", len(body) if hasattr(body, "__len__") else getattr(body, "len", 0), route=route)
+        except Exception:
+            pass
+        return r
+
+    sess.request = measured
+    sess._niwot_metrics = True
+    return sess
+
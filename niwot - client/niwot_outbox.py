@@ -0,0 +1,330 @@
+# niwot_outbox.py
+from __future__ import annotations
+import json, os, random, shutil, threading, time, uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from PySide6 import QtCore
+
+import niwot_metrics
+import niwot_storage
+import niwot_tasks
+from niwot_upload import ChunkedUpload, UploadError, UploadUnsupported, chunked_available
+
+if TYPE_CHECKING:
+    import sqlite3
+
+OUTBOX_DB = "outbox.sqlite3"
+STAGING_DIR = "outbox"       # copies des images jointes, supprimées après envoi
+BACKOFF_BASE_S = 5.0         # 5 s, 10 s, 20 s… (± 20 %) jusqu'à BACKOFF_MAX_S
+BACKOFF_MAX_S = 600.0
+SEND_TIMEOUT_S = 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    key        TEXT PRIMARY KEY,      -- Idempotency-Key : un renvoi ne crée pas de doublon
+    user_id    TEXT NOT NULL,
+    fields     TEXT NOT NULL,         -- champs multipart (JSON)
+    image      TEXT,                  -- copie dans STAGING_DIR
+    created    REAL NOT NULL,
+    attempts   INTEGER NOT NULL DEFAULT 0,
+    next_at    REAL NOT NULL DEFAULT 0,
+    status     TEXT NOT NULL DEFAULT 'pending',   -- pending | rejected (gardée pour correction)
+    last_error TEXT
+)
+"""
+
+
+class TransientError(Exception):
+    """Échec passager (réseau, 5xx, 401/408/429) : nouvel essai plus tard."""
+
+
+def deliver_suggestion(client, key: str, fields: Dict[str, Any], image: Optional[str],
+                       progress: Optional[Callable[[int, int], None]] = None) -> None:
+    """
+    Thread worker : image (découpée si possible) puis POST /suggest avec Idempotency-Key.
+    TransientError si un nouvel essai a des chances d'aboutir, RuntimeError si refusée.
+    """
+    import requests
+    if image and not os.path.exists(image):
+        raise RuntimeError("Image introuvable.")
+    upload: Optional[ChunkedUpload] = None
+    try:
+        if image and chunked_available(client, image):
+            upload = ChunkedUpload(client, image, progress=progress)
+            try:
+                fields["uploadId"] = upload.run()
+            except UploadUnsupported:
+                upload = None
+        if image and upload is None:
+            with open(image, "rb") as f:
+                fields["image"] = ("image", f.read(), "application/octet-stream")
+        client._set_auth_header_if_needed()
+        from requests_toolbelt import MultipartEncoder
+        m = MultipartEncoder(fields=fields)
+        r = client.sess.post(f"{client.api_base}/suggest", data=m, timeout=SEND_TIMEOUT_S,
+                             headers={"Content-Type": m.content_type, "Idempotency-Key": key})
+    except (UploadError, OSError, requests.RequestException) as e:  # réseau coupé, délai…
+        raise TransientError(str(e))
+    if r.ok or r.status_code == 409:  # 409 : déjà reçue sous cette clé
+        if upload is not None:
+            upload.forget()
+        return
+    try:
+        err = r.json().get("error")
+    except Exception:
+        err = r.text[:200]
+    if r.status_code >= 500 or r.status_code in (401, 408, 429):  # 401 : session à rétablir
+        raise TransientError(f"{r.status_code} {err or ''}".strip())
+    raise RuntimeError(err or f"Refusée ({r.status_code})")
+
+
+class Outbox(QtCore.QObject):
+    """
+    File d'envoi durable des propositions (/suggest) :
+      - enqueue() écrit la proposition dans outbox.sqlite3 et copie l'image dans
+        STAGING_DIR avant de rendre la main : quitter l'application ne perd rien
+      - un envoi à la fois, en tâche de fond ; échec passager -> nouvel essai avec
+        attente exponentielle, l'image reprend là où elle s'est arrêtée (niwot_upload)
+      - chaque envoi porte un Idempotency-Key stable : un acquittement perdu puis
+        renvoyé ne crée pas de doublon côté serveur
+      - refus définitif (4xx) : signalé (sig_rejected) et gardé avec son image et last_error,
+        sans nouvel essai, jusqu'à ce que l'utilisateur le reprenne (take) ou l'abandonne (discard)
+      - la base (synchronous=FULL : fsync à chaque écriture) n'est touchée que sur
+        niwot_storage.io_pool() ; le thread UI ne garde que self.pending
+
+    Signals:
+      - sig_pending(count: int)              propositions en attente pour l'utilisateur courant
+      - sig_progress(key: str, done: int, total: int)   envoi de l'image (depuis un worker)
+      - sig_sent(key: str)
+      - sig_rejected(key: str, error: str, text: str)   text = la question refusée
+    """
+    sig_pending = QtCore.Signal(int)
+    sig_progress = QtCore.Signal(str, int, int)
+    sig_sent = QtCore.Signal(str)
+    sig_rejected = QtCore.Signal(str, str, str)
+
+    def __init__(self, client, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._client = client
+        self._db: Optional["sqlite3.Connection"] = None
+        self._lock = threading.Lock()
+        self._user_id: Optional[str] = None
+        self._task: Optional[niwot_tasks.Task] = None  # étape en cours : lecture, envoi ou écriture
+        self.pending = 0  # dernier nombre connu de propositions en attente (thread UI)
+        self.rejected: Dict[str, str] = {}  # propositions refusées de l'utilisateur courant : clé -> question (thread UI)
+        self._rescan = False  # kick() pendant une lecture : elle a pu précéder la nouvelle ligne
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._send_next)
+
+    # --- stockage (appelable depuis n'importe quel thread) ---
+    def _conn(self) -> "sqlite3.Connection":
+        with self._lock:
+            if self._db is None:
+                import sqlite3
+                self._db = sqlite3.connect(os.path.join(niwot_storage.data_dir(), OUTBOX_DB),
+                                           check_same_thread=False, isolation_level=None)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=FULL")  # ligne écrite = ligne sur disque
+                self._db.execute(_SCHEMA)
+            return self._db
+
+    def _exec(self, sql: str, args: tuple = ()) -> list:
+        db = self._conn()
+        with self._lock:
+            return db.execute(sql, args).fetchall()
+
+    def enqueue(self, fields: Dict[str, Any], image: Optional[str] = None) -> str:
+        """
+        Bloquant (copie de l'image) : à lancer sur niwot_storage.io_pool(), après start().
+        Renvoie la clé ; la proposition est sur disque au retour.
+        """
+        user_id = self._user_id
+        if user_id is None:
+            raise RuntimeError("Non connecté.")
+        key = uuid.uuid4().hex
+        staged = None
+        if image:
+            folder = os.path.join(niwot_storage.data_dir(), STAGING_DIR)
+            os.makedirs(folder, exist_ok=True)
+            staged = os.path.join(folder, key + os.path.splitext(image)[1].lower())
+            if os.path.dirname(os.path.abspath(image)) == os.path.abspath(folder):
+                os.replace(image, staged)  # image d'une proposition refusée reprise (take) : déjà copiée
+            else:
+                shutil.copyfile(image, staged + ".tmp")
+                os.replace(staged + ".tmp", staged)
+        self._exec("INSERT INTO outbox (key, user_id, fields, image, created) VALUES (?, ?, ?, ?, ?)",
+                   (key, user_id, json.dumps(fields), staged, time.time()))
+        return key
+
+    def pending_count(self, user_id: Optional[str] = None) -> int:
+        """Bloquant (lecture de la base) : hors thread UI. Côté UI, voir self.pending."""
+        user_id = user_id or self._user_id
+        if user_id is None:
+            return 0
+        return self._exec("SELECT COUNT(*) FROM outbox WHERE user_id = ? AND status = 'pending'",
+                          (user_id,))[0][0]
+
+    def take(self, key: str) -> Optional[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Bloquant : sur niwot_storage.io_pool(). Proposition refusée retirée de la file et rendue
+        pour correction : (champs, image). L'image reste dans STAGING_DIR jusqu'au prochain
+        enqueue() qui la reprend ; None si la proposition n'existe plus.
+        """
+        rows = self._exec("SELECT fields, image FROM outbox WHERE key = ? AND status = 'rejected'", (key,))
+        if not rows:
+            return None
+        self._exec("DELETE FROM outbox WHERE key = ?", (key,))
+        return json.loads(rows[0][0]), rows[0][1]
+
+    def discard(self, key: str) -> None:
+        """Bloquant : sur niwot_storage.io_pool(). Proposition refusée abandonnée, image comprise."""
+        self._remove(key)
+
+    # --- envoi (thread UI ; la base n'est lue / écrite que sur niwot_storage.io_pool()) ---
+    def start(self, user_id: Any):
+        """Après connexion : envoie ce qui attend pour cet utilisateur (y compris d'une session précédente)."""
+        self._user_id = str(user_id)
+        self.rejected = {}  # relus par _prepare pour cet utilisateur
+        if self._task is not None:
+            self._task.cancel()
+        self._task = self._io(self._prepare, self._user_id, then=self._on_prepared)
+
+    def stop(self):
+        """Déconnexion : plus d'envoi ; les propositions restent sur disque."""
+        self._user_id = None
+        self._timer.stop()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.pending = 0
+        self.rejected = {}
+        self.sig_pending.emit(0)
+
+    def kick(self, key: Optional[str] = None):
+        """Essaie tout de suite : la proposition key (nouvelle ou relancée), sans toucher à l'attente des autres."""
+        if self._user_id is None:
+            return
+        if key is not None:
+            # même thread d'E/S, dans l'ordre : écrit avant la lecture de _send_next
+            self._io(self._exec, "UPDATE outbox SET next_at = 0 WHERE key = ?", (key,), then=None)
+        self._rescan = True
+        if self._task is None:
+            self._timer.start(0)
+
+    def forget_rejected(self, key: str):
+        """Thread UI : après take() / discard(), la proposition ne compte plus parmi les refusées."""
+        self.rejected.pop(key, None)
+
+    def _io(self, fn: Callable, *args, then: Optional[Callable[[Any], None]]) -> niwot_tasks.Task:
+        def done(result: Any, err: Optional[Exception]):
+            if then is None:
+                return
+            if err is not None:  # disque plein, base verrouillée… : nouvel essai plus tard
+                niwot_metrics.inc("errors.swallowed", where="outbox.io")
+                self._task = None
+                self._timer.start(int(BACKOFF_BASE_S * 1000))
+                return
+            then(result)
+        return niwot_tasks.submit(fn, *args, on_done=done, pool=niwot_storage.io_pool())
+
+    def _prepare(self, user_id: str) -> Tuple[int, List[Tuple[str, str, str]]]:
+        self._cleanup_staging()
+        rejected = [(key, err or "", json.loads(fields).get("text", "")) for key, err, fields in self._exec(
+            "SELECT key, last_error, fields FROM outbox WHERE user_id = ? AND status = 'rejected' ORDER BY created",
+            (user_id,))]
+        return self.pending_count(user_id), rejected
+
+    def _on_prepared(self, result: Tuple[int, List[Tuple[str, str, str]]]):
+        self._task = None
+        count, rejected = result
+        for key, err, text in rejected:  # refus d'une session précédente, toujours à corriger
+            self._set_rejected(key, err, text)
+        self._set_pending(count)
+        self._send_next()
+
+    def _set_rejected(self, key: str, error: str, text: str):
+        self.rejected[key] = text
+        self.sig_rejected.emit(key, error, text)
+
+    def _set_pending(self, count: int):
+        self.pending = count
+        self.sig_pending.emit(count)
+
+    def _send_next(self):
+        if self._user_id is None or self._task is not None:
+            return
+        self._rescan = False
+        self._task = self._io(self._exec, "SELECT key, fields, image, attempts, next_at FROM outbox "
+                              "WHERE user_id = ? AND status = 'pending' ORDER BY next_at, created LIMIT 1",
+                              (self._user_id,), then=self._on_next)
+
+    def _on_next(self, rows: list):
+        self._task = None
+        if self._rescan:
+            self._timer.start(0)  # lecture peut-être antérieure à la proposition ajoutée : on relit
+            return
+        if not rows or self._user_id is None:
+            return
+        key, fields, image, attempts, next_at = rows[0]
+        now = time.time()
+        if next_at > now:
+            self._timer.start(int((next_at - now) * 1000) + 1)
+            return
+        fields = json.loads(fields)
+        text = str(fields.get("text", ""))
+        self._task = niwot_tasks.submit(self._deliver, self._client, key, fields, image,
+                                        on_done=lambda _r, err: self._on_done(key, text, attempts, err))
+
+    def _deliver(self, client, key: str, fields: Dict[str, Any], image: Optional[str]) -> None:
+        deliver_suggestion(client, key, fields, image, progress=lambda d, t: self.sig_progress.emit(key, d, t))
+
+    def _on_done(self, key: str, text: str, attempts: int, err: Optional[Exception]):
+        self._task = self._io(self._record, self._user_id, key, attempts, err,
+                              then=lambda count: self._on_recorded(key, text, err, count))
+
+    def _record(self, user_id: str, key: str, attempts: int, err: Optional[Exception]) -> int:
+        """Thread d'E/S : issue d'un envoi écrite, renvoie le nombre de propositions en attente."""
+        if err is None:
+            self._remove(key)
+        elif not isinstance(err, TransientError):
+            # refusée : plus de nouvel essai, mais rien n'est perdu avant que l'utilisateur la reprenne
+            self._exec("UPDATE outbox SET status = 'rejected', last_error = ? WHERE key = ?", (str(err), key))
+        else:
+            delay = min(BACKOFF_MAX_S, BACKOFF_BASE_S * (2 ** attempts)) * random.uniform(0.8, 1.2)
+            self._exec("UPDATE outbox SET attempts = ?, next_at = ?, last_error = ? WHERE key = ?",
+                       (attempts + 1, time.time() + delay, str(err), key))
+        return self.pending_count(user_id)
+
+    def _on_recorded(self, key: str, text: str, err: Optional[Exception], count: int):
+        self._task = None
+        if err is None:
+            self.sig_sent.emit(key)
+        elif not isinstance(err, TransientError):
+            self._set_rejected(key, str(err), text)
+        self._set_pending(count)
+        self._timer.start(0)
+
+    def _remove(self, key: str):
+        rows = self._exec("SELECT image FROM outbox WHERE key = ?", (key,))
+        self._exec("DELETE FROM outbox WHERE key = ?", (key,))
+        if rows and rows[0][0]:
+            try:
+                os.remove(rows[0][0])
+            except OSError:
+                pass
+
+    def _cleanup_staging(self):
+        """Copies orphelines (arrêt entre la copie et l'écriture de la ligne)."""
+        folder = os.path.join(niwot_storage.data_dir(), STAGING_DIR)
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            return
+        known = {os.path.basename(r[0]) for r in self._exec("SELECT image FROM outbox WHERE image IS NOT NULL")}
+        for name in names:
+            if name not in known:
+                try:
+                    os.remove(os.path.join(folder, name))
+                except OSError:
+                    pass
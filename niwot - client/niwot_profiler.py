@@ -0,0 +1,235 @@
+# niwot_profiler.py
+from __future__ import annotations
+import collections, dis, os, sys, threading, time
+from typing import Any, Dict, List, Optional, Tuple
+
+import niwot_storage
+
+# Profileur par échantillonnage, démarré / arrêté en cours de partie (Ctrl+Shift+P ou
+# python main.py --profile) : un thread relève toutes les SAMPLE_MS les piles Python de
+# tous les threads (sys._current_frames), sans instrumenter le code. À l'arrêt :
+#   profiles/profile-<date>.folded  piles repliées « thread;module.fn;… N » (flamegraph.pl, speedscope)
+#   profiles/profile-<date>.txt     répartition Niwot / Qt / réseau / attente et les TOP_N fonctions
+SAMPLE_MS = int(os.environ.get("NIWOT_PROFILE_MS", "5"))
+TOP_N = 25
+PROFILE_DIR = "profiles"   # dans niwot_storage.data_dir()
+_STACK_DEPTH = 64
+_NATIVE = "[natif]"        # feuille ajoutée quand la trame la plus interne est dans un appel C
+
+# modules de la pile réseau (premier composant du nom de module)
+_NET = {"requests", "urllib3", "socketio", "engineio", "websocket", "simple_websocket", "wsproto",
+        "ssl", "socket", "selectors", "http", "certifi", "charset_normalizer", "idna"}
+# attente bloquante (threads au repos) : ni du travail Niwot ni du réseau actif
+_IDLE = {"wait", "sleep", "select", "poll", "_recv", "recv", "recv_into", "readinto", "accept",
+         "acquire", "join", "_wait_for_tstate_lock"}
+_CALLS = {i for i, name in enumerate(dis.opname) if name.startswith(("CALL", "PRECALL"))}
+_LOOP_NAMES = {"exec", "exec_"}  # QApplication.exec(), QDialog.exec() (PySide : aussi exec_)
+_loop_sites: Dict[Tuple[Any, int], bool] = {}  # (code, f_lasti) -> appel de exec()
+
+
+def _module(frame) -> str:
+    mod = frame.f_globals.get("__name__") or "?"
+    return "main" if mod == "__main__" else mod  # python main.py
+
+
+def is_niwot(mod: str) -> bool:
+    return mod.startswith(("niwot_", "ui_")) or mod == "main"
+
+
+def _in_native_call(frame) -> bool:
+    """La trame attend le retour d'une fonction C (Qt, socket, verrou…), pas d'une fonction Python."""
+    try:
+        return frame.f_code.co_code[frame.f_lasti] in _CALLS
+    except (IndexError, AttributeError):
+        return False
+
+
+def in_loop(frame) -> bool:
+    """
+    La trame est arrêtée sur un appel .exec() (app.exec, dialog.exec : boucle Qt). Lu dans le
+    bytecode et non dans les sources, absentes de l'exécutable PyInstaller ; partagé avec
+    niwot_watchdog.
+    """
+    if not _in_native_call(frame):
+        return False
+    key = (frame.f_code, frame.f_lasti)
+    hit = _loop_sites.get(key)
+    if hit is None:
+        hit = _loop_sites[key] = _calls_exec(*key)
+    return hit
+
+
+def _calls_exec(code, lasti: int) -> bool:
+    """L'appel à l'offset lasti porte sur un attribut exec : dernier nom chargé avant lui (exec() sans argument)."""
+    name = None
+    for ins in dis.get_instructions(code):
+        if ins.offset >= lasti:
+            break
+        if ins.opname in ("LOAD_METHOD", "LOAD_ATTR"):
+            name = ins.argval
+    return name in _LOOP_NAMES
+
+
+class Profiler:
+    """
+    Échantillonneur de piles. start() / stop() depuis le thread UI ; write() (bloquant, quelques
+    ms) écrit les deux fichiers à partir de la copie figée par stop(). Chaque relevé tient le GIL ~30 µs : à SAMPLE_MS = 5, moins de
+    1 % d'un cœur. Le temps passé dans Qt n'a pas de trame Python : il est compté à la trame
+    Niwot qui l'a appelé (feuille « [natif] ») et, sous la boucle exec(), comme « Qt (boucle) ».
+    """
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._lock = threading.Lock()   # un relevé à la fois ; stop() copie sous ce verrou
+        self._thread: Optional[threading.Thread] = None
+        self._samples: "collections.Counter[Tuple[str, ...]]" = collections.Counter()
+        self._buckets: "collections.Counter[str]" = collections.Counter()
+        self._ticks = 0
+        self._t0 = 0.0
+        self._started = 0.0
+        # résultats : copie figée par stop(), seule lue par write() / summary()
+        self.samples: "collections.Counter[Tuple[str, ...]]" = collections.Counter()
+        self.buckets: "collections.Counter[str]" = collections.Counter()
+        self.ticks = 0
+        self.started_at = 0.0
+        self.elapsed = 0.0
+        self._names: Dict[int, str] = {}
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        # nouvel évènement et nouveaux compteurs : un ancien thread non rejoint n'y touche pas
+        self._stop = threading.Event()
+        self._samples = collections.Counter()
+        self._buckets = collections.Counter()
+        self._ticks = 0
+        self._started = time.time()
+        self._t0 = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, args=(self._stop,), name="niwot-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête l'échantillonnage et fige les résultats, même si le thread tarde à se terminer."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(1.0)
+        self._thread = None
+        with self._lock:  # le thread ne relève plus rien une fois _stop posé et le verrou pris
+            self.samples = collections.Counter(self._samples)
+            self.buckets = collections.Counter(self._buckets)
+            self.ticks = self._ticks
+        self.started_at = self._started
+        self.elapsed = time.perf_counter() - self._t0
+
+    # ---------- Thread d'échantillonnage ----------
+    def _run(self, stop: threading.Event):
+        own = threading.get_ident()
+        main = threading.main_thread().ident
+        period = SAMPLE_MS / 1000.0
+        while not stop.wait(period):
+            with self._lock:
+                if stop.is_set():
+                    break
+                self._ticks += 1
+                for tid, frame in sys._current_frames().items():
+                    if tid != own:
+                        self._sample(tid == main, tid, frame)
+
+    def _thread_name(self, tid: int, is_main: bool) -> str:
+        name = self._names.get(tid)
+        if name is None:
+            t = threading._active.get(tid)  # lecture seule, sans verrou : nom indicatif
+            name = "UI" if is_main else (t.name if t is not None and not t.name.startswith("Dummy") else "worker")
+            self._names[tid] = name
+        return name
+
+    def _sample(self, is_main: bool, tid: int, frame):
+        inner = frame
+        labels: List[str] = []
+        mods: List[str] = []  # du plus interne au plus externe
+        while frame is not None and len(labels) < _STACK_DEPTH:
+            code = frame.f_code
+            mod = _module(frame)
+            labels.append(f"{mod}.{getattr(code, 'co_qualname', code.co_name)}")
+            mods.append(mod)
+            frame = frame.f_back
+        labels.reverse()
+        native = _in_native_call(inner)
+        if native:
+            labels.append(_NATIVE)
+        self._samples[(self._thread_name(tid, is_main), *labels)] += 1
+        self._buckets[_bucket(is_main, inner, mods, native)] += 1
+
+    # ---------- Résultats ----------
+    def folded(self) -> str:
+        return "".join(f"{';'.join(stack)} {n}\n" for stack, n in self.samples.most_common())
+
+    def summary(self) -> str:
+        total = sum(self.buckets.values())
+        ui = sum(n for stack, n in self.samples.items() if stack[0] == "UI") or 1
+        lines = [f"Niwot Desktop — profil du {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started_at))}",
+                 f"{self.elapsed:.1f} s, {self.ticks} relevés toutes les {SAMPLE_MS} ms, {total} piles", "",
+                 "Répartition (trame la plus interne, tous threads) :"]
+        lines += [f"  {n / max(1, total) * 100:5.1f} %  {n:6d}  {name}" for name, n in self.buckets.most_common()]
+
+        inclusive: "collections.Counter[str]" = collections.Counter()
+        own: "collections.Counter[str]" = collections.Counter()
+        for stack, n in self.samples.items():
+            if stack[0] != "UI":
+                continue
+            frames = [s for s in stack[1:] if s != _NATIVE]
+            for mod in {f.split(".", 1)[0] for f in frames}:
+                if is_niwot(mod):
+                    inclusive[mod] += n
+            if frames:
+                own[frames[-1]] += n
+        lines += ["", "Thread UI, par module Niwot (inclusif : le module est sur la pile) :"]
+        lines += [f"  {n / ui * 100:5.1f} %  {mod}" for mod, n in inclusive.most_common()]
+
+        fn_incl: "collections.Counter[str]" = collections.Counter()
+        for stack, n in self.samples.items():
+            if stack[0] == "UI":
+                for f in set(stack[1:]) - {_NATIVE}:
+                    fn_incl[f] += n
+        lines += ["", f"Thread UI, {TOP_N} fonctions les plus vues en tête de pile (propre) :"]
+        lines += [f"  {n / ui * 100:5.1f} %  {fn}" for fn, n in own.most_common(TOP_N)]
+        lines += ["", f"Thread UI, {TOP_N} fonctions les plus vues sur la pile (inclusif) :"]
+        lines += [f"  {n / ui * 100:5.1f} %  {fn}" for fn, n in fn_incl.most_common(TOP_N)]
+        return "\n".join(lines) + "\n"
+
+    def write(self, folder: Optional[str] = None) -> Tuple[str, str]:
+        """Écrit profile-<date>.folded et .txt ; renvoie leurs chemins."""
+        folder = folder or os.path.join(niwot_storage.data_dir(), PROFILE_DIR)
+        os.makedirs(folder, exist_ok=True)
+        stem = os.path.join(folder, "profile-" + time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started_at)))
+        with open(stem + ".folded", "w", encoding="utf-8") as f:
+            f.write(self.folded())
+        with open(stem + ".txt", "w", encoding="utf-8") as f:
+            f.write(self.summary())
+        return stem + ".folded", stem + ".txt"
+
+
+def _bucket(is_main: bool, inner, mods: List[str], native: bool) -> str:
+    """
+    Attribue un relevé selon la trame la plus interne : boucle Qt, Qt / C appelé par un module
+    Niwot, module Niwot, réseau, attente ; le code de bibliothèque (json, PySide…) est
+    compté au module Niwot le plus proche sur la pile.
+    """
+    if native and in_loop(inner):
+        return "Qt (boucle d'évènements)" if is_main else "Qt (boucle, autre thread)"
+    # sur le thread UI, une attente bloquante n'est pas du repos : comptée à son appelant
+    idle = native and not is_main and inner.f_code.co_name in _IDLE
+    if any(m.split(".", 1)[0] in _NET for m in mods):
+        return "réseau (attente)" if idle else "réseau"
+    if idle:
+        return "attente (verrous, files, sommeil)"
+    mod = mods[0] if mods else ""
+    if is_niwot(mod):
+        return f"Qt / natif (appelé par {mod})" if native and is_main else mod
+    caller = next((m for m in mods if is_niwot(m)), None)
+    return f"{caller} (bibliothèques)" if caller else "autre"
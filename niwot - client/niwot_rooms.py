@@ -0,0 +1,477 @@
+# niwot_rooms.py
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+
+from PySide6 import QtCore
+
+import niwot_tasks
+
+# Protocole socket de la liste publique :
+#   client -> serveur : "lobby:subscribe" / "lobby:unsubscribe"
+#   serveur -> client : "rooms:public"        {"rooms": [...]}  liste complète
+#                       "rooms:public:update" {room} ou {"room": {room}}
+#                       "rooms:public:remove" {"code": "ABC123"}
+EV_FULL = "rooms:public"
+EV_UPDATE = "rooms:public:update"
+EV_REMOVE = "rooms:public:remove"
+
+POLL_MS = 10_000         # sans push socket : polling conditionnel (ETag)
+POLL_LIVE_MS = 60_000    # push actif : filet de sécurité seulement
+RESORT_DELAY_MS = 50     # salle dont la clé de tri change : re-tri différé et groupé
+_RESET_RUNS_ABOVE = 200  # au-delà de N plages de lignes supprimées d'un coup : reset du modèle
+
+# Recherche : filtrage local à chaque frappe jusqu'à SEARCH_LOCAL_MAX salles (~15 ms),
+# au-delà : filtrage + requête serveur après SEARCH_DEBOUNCE_MS sans frappe
+SEARCH_LOCAL_MAX = 2000
+SEARCH_DEBOUNCE_MS = 250
+SEARCH_LIMIT = 50
+SEARCH_TIMEOUT_S = 5
+POLL_TIMEOUT_S = 10      # sans réponse : la requête échoue, le polling suivant repart
+
+
+def normalize_room(x: Any) -> Optional[Dict[str, Any]]:
+    """Salle publique telle qu'affichée, ou None (invalide / sans joueur)."""
+    try:
+        code = str(x.get("code") or "").upper()
+        name = (None if x.get("name") is None else str(x.get("name")))
+        status = str(x.get("status") or "lobby")
+        if status not in ("running", "ended"): status = "lobby"
+        players = int(x.get("players") or 0)
+        maxp = int(x.get("maxPlayers") or 10)
+    except Exception:
+        return None
+    if players <= 0 or not code:
+        return None
+    return {"code": code, "name": name, "status": status, "players": players, "maxPlayers": maxp}
+
+
+def fetch_public_rooms(c, etag: Optional[str] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+    """
+    GET /rooms/public conditionnel (thread worker).
+    (None, etag) si le serveur répond 304 : la liste connue est toujours à jour.
+    """
+    headers = {"If-None-Match": etag} if etag else {}
+    r = c.sess.get(f"{c.api_base}/rooms/public", headers=headers, timeout=POLL_TIMEOUT_S)
+    if r.status_code == 304:
+        return None, etag
+    r.raise_for_status()
+    data = r.json() if "application/json" in (r.headers.get("content-type") or "") else {}
+    rooms = [n for n in (normalize_room(x) for x in (data.get("rooms") or [])) if n]
+    return rooms, r.headers.get("ETag")
+
+
+def search_public_rooms(c, query: str) -> List[Dict[str, Any]]:
+    """GET /rooms/public?q=… (thread worker) : salles du serveur qui ne sont peut-être pas dans la liste."""
+    r = c.sess.get(f"{c.api_base}/rooms/public", params={"q": query, "limit": SEARCH_LIMIT},
+                   timeout=SEARCH_TIMEOUT_S)
+    r.raise_for_status()
+    data = r.json() if "application/json" in (r.headers.get("content-type") or "") else {}
+    return [n for n in (normalize_room(x) for x in (data.get("rooms") or [])) if n]
+
+
+def search_text(r: Dict[str, Any]) -> str:
+    return f"{r['name'] or ''} {r['code']}".casefold()
+
+
+class PublicRoomsModel(QtCore.QAbstractTableModel):
+    """
+    Salles publiques indexées par code, mises à jour ligne par ligne
+    (upsert / remove / reset différentiel) : la vue ne repeint que ce qui change.
+
+    Le tri est tenu ici (liste Python triée, insertion par dichotomie) plutôt que par
+    QSortFilterProxyModel, dont le tri appelle data() en Python à chaque comparaison.
+    """
+    COLUMNS = ("Salle", "Code", "Joueurs", "Statut")
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        self._index: Dict[str, int] = {}
+        self._text: Dict[str, Tuple[Dict[str, Any], str]] = {}  # code -> (salle, texte indexé)
+        self._sort_col = 2
+        self._desc = True
+        # déplacer une ligne fait recalculer tout le proxy : les re-tris sont regroupés
+        self._resort_timer = QtCore.QTimer(self)
+        self._resort_timer.setSingleShot(True)
+        self._resort_timer.setInterval(RESORT_DELAY_MS)
+        self._resort_timer.timeout.connect(self._resort)
+
+    # --- lecture ---
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role == QtCore.Qt.ItemDataRole.DisplayRole and orientation == QtCore.Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        r = self._rows[index.row()]
+        col = index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            if col == 0: return r["name"] or f"Salle {r['code']}"
+            if col == 1: return r["code"]
+            if col == 2: return f"{r['players']}/{r['maxPlayers']}"
+            return "En cours" if r["status"] == "running" else "Salle d'attente"
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return r["code"]
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole and col in (1, 2):
+            return int(QtCore.Qt.AlignmentFlag.AlignCenter)
+        return None
+
+    def room(self, row: int) -> Dict[str, Any]:
+        return self._rows[row]
+
+    def text(self, row: int) -> str:
+        """Nom + code en minuscules, recalculé seulement quand la salle change."""
+        r = self._rows[row]
+        hit = self._text.get(r["code"])
+        if hit is None or hit[0] is not r:
+            hit = self._text[r["code"]] = (r, search_text(r))
+        return hit[1]
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Copie superficielle (les dicts sont remplacés, jamais modifiés en place)."""
+        return list(self._rows)
+
+    # --- tri ---
+    def _key(self, r: Dict[str, Any]) -> Tuple:
+        col = self._sort_col
+        if col == 0: return ((r["name"] or "").casefold(), r["code"])
+        if col == 2: return (r["players"], r["code"])
+        if col == 3: return (r["status"], r["code"])
+        return (r["code"],)
+
+    def sort(self, column: int, order=QtCore.Qt.SortOrder.AscendingOrder):
+        self._sort_col = column
+        self._desc = order == QtCore.Qt.SortOrder.DescendingOrder
+        self._resort()
+
+    def _resort(self):
+        """Tri complet ; les index persistants (sélection, courant) suivent leur salle."""
+        self._resort_timer.stop()
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        codes = [self._rows[ix.row()]["code"] for ix in old]
+        self._rows.sort(key=self._key, reverse=self._desc)
+        self._index = {r["code"]: i for i, r in enumerate(self._rows)}
+        self.changePersistentIndexList(old, [self.index(self._index[c], ix.column()) for c, ix in zip(codes, old)])
+        self.layoutChanged.emit()
+
+    def _position(self, room: Dict[str, Any]) -> int:
+        """Rang d'insertion de room dans l'ordre courant (dichotomie)."""
+        k = self._key(room)
+        lo, hi = 0, len(self._rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            km = self._key(self._rows[mid])
+            if (km > k) if self._desc else (km < k):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _in_place(self, row: int) -> bool:
+        k = self._key(self._rows[row])
+        before = (lambda a, b: a > b) if self._desc else (lambda a, b: a < b)
+        if row > 0 and before(k, self._key(self._rows[row - 1])):
+            return False
+        if row + 1 < len(self._rows) and before(self._key(self._rows[row + 1]), k):
+            return False
+        return True
+
+    # --- écriture ---
+    def upsert(self, room: Dict[str, Any]) -> bool:
+        row = self._index.get(room["code"])
+        if row is None:
+            pos = self._position(room)
+            self.beginInsertRows(QtCore.QModelIndex(), pos, pos)
+            self._rows.insert(pos, room)
+            self._reindex(pos)
+            self.endInsertRows()
+            return True
+        if self._rows[row] == room:
+            return False
+        self._rows[row] = room
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+        if not self._in_place(row):
+            self._resort_timer.start()  # une rafale de pushes -> un seul tri
+        return True
+
+    def remove(self, code: str) -> bool:
+        row = self._index.get(code)
+        if row is None:
+            return False
+        self._remove_run(row, row)
+        self._reindex(row)
+        return True
+
+    def reset(self, rooms: List[Dict[str, Any]]) -> bool:
+        """
+        Aligne le modèle sur une liste complète ; retourne True si quelque chose a changé.
+        Suppressions par plages, mises à jour sur place, ajouts en fin, puis un seul tri.
+        """
+        fresh = {r["code"]: r for r in rooms}
+        gone = sorted(row for code, row in self._index.items() if code not in fresh)
+        runs = _runs(gone)
+        if len(runs) > _RESET_RUNS_ABOVE:  # suppressions très dispersées : un seul reset
+            self.beginResetModel()
+            self._rows = sorted(fresh.values(), key=self._key, reverse=self._desc)
+            self._index = {r["code"]: i for i, r in enumerate(self._rows)}
+            self._text.clear()
+            self.endResetModel()
+            return True
+        for first, last in reversed(runs):  # de la fin vers le début : indices stables
+            self._remove_run(first, last)
+        if runs:
+            self._reindex(runs[0][0])
+        changed = bool(runs)
+        reorder = False
+        added = []
+        for code, r in fresh.items():
+            row = self._index.get(code)
+            if row is None:
+                added.append(r)
+            elif self._rows[row] != r:
+                reorder = reorder or self._key(r) != self._key(self._rows[row])
+                self._rows[row] = r
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+                changed = True
+        if added:
+            first = len(self._rows)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(added) - 1)
+            self._rows.extend(added)
+            self._reindex(first)
+            self.endInsertRows()
+            changed = reorder = True
+        if reorder:
+            self._resort()
+        return changed
+
+    def _remove_run(self, first: int, last: int):
+        self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+        for r in self._rows[first:last + 1]:
+            del self._index[r["code"]]
+            self._text.pop(r["code"], None)
+        del self._rows[first:last + 1]
+        self.endRemoveRows()
+
+    def _reindex(self, start: int):
+        for i in range(start, len(self._rows)):
+            self._index[self._rows[i]["code"]] = i
+
+
+def _runs(rows: List[int]) -> List[Tuple[int, int]]:
+    """[2, 3, 4, 9] -> [(2, 4), (9, 9)] (lignes triées)"""
+    out: List[Tuple[int, int]] = []
+    for r in rows:
+        if out and out[-1][1] == r - 1:
+            out[-1] = (out[-1][0], r)
+        else:
+            out.append((r, r))
+    return out
+
+
+class RoomFilterProxy(QtCore.QSortFilterProxyModel):
+    """
+    Filtre par statut ("" = tous) et par texte (nom / code) au-dessus de PublicRoomsModel ;
+    le tri demandé par la vue est délégué au modèle source (ordre conservé ici).
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._status = ""
+        self._query = ""
+        self.setDynamicSortFilter(True)
+
+    def sort(self, column: int, order=QtCore.Qt.SortOrder.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+    def set_status(self, status: str):
+        if status == self._status:
+            return
+        self._status = status
+        self.invalidateFilter()
+
+    def set_query(self, query: str):
+        query = query.strip().casefold()
+        if query == self._query:
+            return
+        self._query = query
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:
+        m = self.sourceModel()
+        if self._status and m.room(source_row)["status"] != self._status:
+            return False
+        return not self._query or self._query in m.text(source_row)
+
+
+class RoomSearch(QtCore.QObject):
+    """
+    Recherche de salle au fil de la frappe :
+      - liste courte (<= SEARCH_LOCAL_MAX) : filtre local immédiat sur l'index nom / code
+      - liste longue : filtre local + requête serveur, après SEARCH_DEBOUNCE_MS sans frappe ;
+        chaque frappe annule la requête en vol (son résultat est ignoré), les salles
+        trouvées sont ajoutées au modèle au retour et le filtre les affiche d'elles-mêmes.
+
+    Signals:
+      - sig_busy(bool)      requête serveur en cours
+    """
+    sig_busy = QtCore.Signal(bool)
+
+    def __init__(self, model: PublicRoomsModel, proxy: RoomFilterProxy, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.model = model
+        self.proxy = proxy
+        self._client = None
+        self._text = ""
+        self._inflight: Optional[niwot_tasks.Task] = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._timer.timeout.connect(self._run)
+
+    def set_client(self, client):
+        self._client = client
+
+    @QtCore.Slot(str)
+    def set_text(self, text: str):
+        self._text = text
+        self._cancel()
+        if self.model.rowCount() <= SEARCH_LOCAL_MAX or not text.strip():
+            self._timer.stop()
+            self.proxy.set_query(text)
+            return
+        self._timer.start()  # (re)démarre : on attend la fin de la frappe
+
+    def _run(self):
+        q = self._text.strip()
+        self.proxy.set_query(q)
+        if len(q) < 2 or self._client is None:
+            return
+        self._inflight = niwot_tasks.submit(search_public_rooms, self._client, q, on_done=self._on_results)
+        self.sig_busy.emit(True)
+
+    def _cancel(self):
+        if self._inflight is not None:
+            self._inflight.cancel()
+            self._inflight = None
+            self.sig_busy.emit(False)
+
+    def _on_results(self, rooms: Any, err: Optional[Exception]):
+        self._inflight = None
+        self.sig_busy.emit(False)
+        if err is not None:
+            return  # le filtre local reste affiché
+        for r in rooms:
+            self.model.upsert(r)
+
+
+class PublicRoomsFeed(QtCore.QObject):
+    """
+    Alimente un PublicRoomsModel : abonnement socket (push) + polling HTTP conditionnel
+    en secours, ralenti tant que le push fonctionne. start() / stop() suivent la visibilité du lobby.
+
+    Signals:
+      - sig_synced()        liste complète confirmée (200, 304 ou push complet)
+      - sig_changed()       le modèle a changé
+      - sig_failed(str)     échec du polling
+    """
+    sig_synced = QtCore.Signal()
+    sig_changed = QtCore.Signal()
+    sig_failed = QtCore.Signal(str)
+
+    def __init__(self, model: PublicRoomsModel, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.model = model
+        self.etag: Optional[str] = None
+        self._client = None
+        self._live = False
+        self._running = False  # entre start() et stop() : push et reconnexions ignorés sinon
+        self._inflight: Optional[niwot_tasks.Task] = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(POLL_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def start(self, client):
+        if client is not self._client:
+            if self._client is not None:
+                self._client.sig_socket_message.disconnect(self._on_message)
+            self._client = client
+            client.sig_socket_message.connect(self._on_message)
+        self._running = True
+        self._client.socket_emit("lobby:subscribe")  # sans effet si le socket n'est pas connecté
+        self.refresh()
+        self._timer.start()
+
+    def stop(self):
+        self._running = False
+        self._set_live(False)  # désabonné : au retour, polling normal jusqu'au premier push
+        self._timer.stop()
+        if self._client is not None:
+            self._client.socket_emit("lobby:unsubscribe")
+
+    @property
+    def busy(self) -> bool:
+        return self._inflight is not None
+
+    @QtCore.Slot()
+    def refresh(self):
+        c = self._client
+        if c is None or self._inflight is not None:
+            return
+        self._inflight = niwot_tasks.submit(fetch_public_rooms, c, self.etag, on_done=self._on_polled)
+
+    def _on_polled(self, result: Any, err: Optional[Exception]):
+        self._inflight = None
+        if err is not None:
+            self.sig_failed.emit(str(err))
+            return
+        rooms, self.etag = result
+        if rooms is not None and self.model.reset(rooms):
+            self.sig_changed.emit()
+        self.sig_synced.emit()
+
+    @QtCore.Slot(str, object)
+    def _on_message(self, ev: str, payload: Any):
+        if not self._running:
+            return  # lobby masqué : ni réabonnement à la reconnexion, ni modèle modifié
+        if ev == "connect":
+            self._client.socket_emit("lobby:subscribe")
+            return
+        if ev == "disconnect":
+            self._set_live(False)
+            return
+        if not ev.startswith(EV_FULL) or not isinstance(payload, dict):
+            return
+        self._set_live(True)
+        self.etag = None  # le modèle ne correspond plus forcément à la dernière réponse HTTP
+        changed = False
+        if ev == EV_FULL:
+            rooms = [n for n in (normalize_room(x) for x in (payload.get("rooms") or [])) if n]
+            changed = self.model.reset(rooms)
+        elif ev == EV_UPDATE:
+            raw = payload.get("room") if isinstance(payload.get("room"), dict) else payload
+            room = normalize_room(raw)
+            if room:
+                changed = self.model.upsert(room)
+            else:  # plus de joueur : n'est plus listée
+                changed = self.model.remove(str(raw.get("code") or "").upper())
+        elif ev == EV_REMOVE:
+            changed = self.model.remove(str(payload.get("code") or "").upper())
+        if changed:
+            self.sig_changed.emit()
+        if ev == EV_FULL:
+            self.sig_synced.emit()
+
+    def _set_live(self, live: bool):
+        if live == self._live:
+            return
+        self._live = live
+        self._timer.setInterval(POLL_LIVE_MS if live else POLL_MS)
@@ -0,0 +1,143 @@
+# niwot_storage.py
+from __future__ import annotations
+import json, os, sys
+from typing import Any, Optional
+
+from PySide6 import QtCore
+
+import niwot_tasks
+
+
+def data_dir() -> str:
+    """
+    Dossier de données de l'utilisateur (créé au besoin, 0700 hors Windows) :
+      Windows %APPDATA%\\Niwot, macOS ~/Library/Application Support/Niwot,
+      Linux $XDG_DATA_HOME/niwot (~/.local/share/niwot). NIWOT_DATA_DIR prend le dessus.
+    """
+    path = os.environ.get("NIWOT_DATA_DIR")
+    if not path:
+        if sys.platform == "win32":
+            path = os.path.join(os.environ.get("APPDATA") or os.path.expanduser("~"), "Niwot")
+        elif sys.platform == "darwin":
+            path = os.path.expanduser("~/Library/Application Support/Niwot")
+        else:
+            base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+            path = os.path.join(base, "niwot")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+# ---------------- Protection (DPAPI sous Windows) ----------------
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    class _Blob(ctypes.Structure):
+        _fields_ = [("cbData", wintypes.DWORD), ("pbData", ctypes.POINTER(ctypes.c_char))]
+
+    def _dpapi(data: bytes, protect: bool) -> bytes:
+        crypt32, kernel32 = ctypes.windll.crypt32, ctypes.windll.kernel32
+        buf = ctypes.create_string_buffer(data, len(data))
+        src = _Blob(len(data), ctypes.cast(buf, ctypes.POINTER(ctypes.c_char)))
+        out = _Blob()
+        fn = crypt32.CryptProtectData if protect else crypt32.CryptUnprotectData
+        # CRYPTPROTECT_UI_FORBIDDEN = 0x1 ; clé liée au compte Windows courant
+        if not fn(ctypes.byref(src), None, None, None, None, 0x1, ctypes.byref(out)):
+            raise OSError("DPAPI")
+        try:
+            return ctypes.string_at(out.pbData, out.cbData)
+        finally:
+            kernel32.LocalFree(out.pbData)
+
+    def _protect(data: bytes) -> bytes:
+        return _dpapi(data, True)
+
+    def _unprotect(data: bytes) -> bytes:
+        return _dpapi(data, False)
+else:
+    # ailleurs : fichier 0600 dans un dossier 0700 (pas de trousseau système imposé)
+    def _protect(data: bytes) -> bytes:
+        return data
+
+    def _unprotect(data: bytes) -> bytes:
+        return data
+
+
+# ---------------- Lecture / écriture ----------------
+def write_bytes(name: str, data: bytes) -> str:
+    """
+    Écriture atomique (fichier temporaire 0600 dans le même dossier, fsync, os.replace) :
+    un crash en cours d'écriture laisse l'ancienne version intacte.
+    """
+    import tempfile
+    folder = data_dir()
+    path = os.path.join(folder, name)
+    fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=folder)  # créé en 0600
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def read_bytes(name: str) -> Optional[bytes]:
+    try:
+        with open(os.path.join(data_dir(), name), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def write_json(name: str, obj: Any, secret: bool = False) -> str:
+    """JSON compact ; secret=True -> chiffré pour l'utilisateur courant (DPAPI) sous Windows."""
+    data = json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return write_bytes(name, _protect(data) if secret else data)
+
+
+def read_json(name: str, secret: bool = False) -> Optional[Any]:
+    """Contenu du fichier, ou None s'il est absent / illisible / corrompu."""
+    data = read_bytes(name)
+    if data is None:
+        return None
+    try:
+        return json.loads((_unprotect(data) if secret else data).decode("utf-8"))
+    except Exception:
+        return None
+
+
+def remove(name: str) -> None:
+    try:
+        os.unlink(os.path.join(data_dir(), name))
+    except OSError:
+        pass
+
+
+# ---------------- Écritures hors thread UI ----------------
+_pool: Optional[QtCore.QThreadPool] = None
+
+
+def io_pool() -> QtCore.QThreadPool:
+    """Un seul thread : les écritures / suppressions s'appliquent dans l'ordre d'appel."""
+    global _pool
+    if _pool is None:
+        _pool = QtCore.QThreadPool()
+        _pool.setMaxThreadCount(1)
+        _pool.setExpiryTimeout(-1)
+    return _pool
+
+
+def write_json_async(name: str, obj: Any, secret: bool = False) -> niwot_tasks.Task:
+    """write_json dans le thread d'E/S ; obj doit déjà être une copie (plus touchée par l'UI)."""
+    return niwot_tasks.submit(write_json, name, obj, secret, pool=io_pool())
+
+
+def remove_async(name: str) -> niwot_tasks.Task:
+    return niwot_tasks.submit(remove, name, pool=io_pool())
@@ -0,0 +1,83 @@
+# niwot_tasks.py
+from __future__ import annotations
+from typing import Any, Callable, Optional
+
+from PySide6 import QtCore
+
+import niwot_metrics
+import niwot_trace
+
+
+class Task:
+    """
+    Poignée d'une tâche lancée en arrière-plan.
+    cancel() n'interrompt pas le thread, mais le callback ne sera jamais appelé.
+    """
+    __slots__ = ("cancelled", "done")
+
+    def __init__(self):
+        self.cancelled = False
+        self.done = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _Relay(QtCore.QObject):
+    """Vit dans le thread UI : les émissions depuis un worker arrivent en file (queued)."""
+    sig_done = QtCore.Signal(object, object, object, object)  # task, callback, result, error
+
+    def __init__(self):
+        super().__init__()
+        self.sig_done.connect(self._dispatch)
+
+    @QtCore.Slot(object, object, object, object)
+    def _dispatch(self, task: Task, cb: Optional[Callable], result: Any, error: Any):
+        task.done = True
+        if task.cancelled or cb is None:
+            return
+        try:
+            cb(result, error)
+        except Exception:
+            niwot_metrics.inc("errors.swallowed", where="tasks.callback")
+
+
+class _Job(QtCore.QRunnable):
+    def __init__(self, relay: _Relay, task: Task, fn: Callable, args: tuple, cb: Optional[Callable]):
+        super().__init__()
+        self._relay = relay
+        self._task = task
+        self._fn = fn
+        self._args = args
+        self._cb = cb
+
+    def run(self):
+        if self._task.cancelled:
+            return
+        result, error = None, None
+        try:
+            if niwot_trace.recording:
+                with niwot_trace.span(getattr(self._fn, "__qualname__", "tâche"), "task"):
+                    result = self._fn(*self._args)
+            else:
+                result = self._fn(*self._args)
+        except Exception as e:
+            error = e
+        self._relay.sig_done.emit(self._task, self._cb, result, error)
+
+
+_relay: Optional[_Relay] = None
+
+
+def submit(fn: Callable, *args, on_done: Optional[Callable[[Any, Optional[Exception]], None]] = None,
+           pool: Optional[QtCore.QThreadPool] = None) -> Task:
+    """
+    Exécute fn(*args) dans un QThreadPool et rappelle on_done(result, error)
+    dans le thread UI. À appeler depuis le thread UI.
+    """
+    global _relay
+    if _relay is None:
+        _relay = _Relay()
+    task = Task()
+    (pool or QtCore.QThreadPool.globalInstance()).start(_Job(_relay, task, fn, args, on_done))
+    return task
@@ -0,0 +1,151 @@
+# niwot_trace.py
+from __future__ import annotations
+import json, os, threading, time
+from typing import Any, Dict, List, Optional
+
+# Enregistrement de spans au format « Trace Event » (chrome://tracing, ui.perfetto.dev) :
+# requêtes HTTP, émission -> accusé socket, traitement des évènements, rendus, décodage
+# d'images, tâches de fond — chacun sur la piste de son thread. Inactif par défaut : chaque
+# point de mesure ne coûte alors qu'un test de `recording`. Démarré par NIWOT_TRACE=1 au
+# lancement ou Ctrl+Shift+T (MainWindow) ; export() écrit traces/trace-<date>.json.
+MAX_EVENTS = 500_000       # au-delà, les évènements sont comptés mais plus gardés
+TRACE_DIR = "traces"       # dans niwot_storage.data_dir()
+
+recording = False
+_events: List[Dict[str, Any]] = []
+_dropped = 0
+_threads: Dict[int, str] = {}
+_started_at = 0.0
+_lock = threading.Lock()
+_async_id = 0
+_PID = os.getpid()
+
+
+def _now_us() -> float:
+    return time.perf_counter_ns() // 1000
+
+
+def _add(ev: Dict[str, Any]):
+    global _dropped
+    tid = threading.get_ident()
+    ev["pid"], ev["tid"] = _PID, tid
+    if tid not in _threads:
+        t = threading.current_thread()
+        # threads du QThreadPool : inconnus de threading (« Dummy-N »)
+        _threads[tid] = ("UI" if t is threading.main_thread()
+                         else f"worker-{len(_threads)}" if t.name.startswith("Dummy") else t.name)
+    if len(_events) < MAX_EVENTS:
+        _events.append(ev)  # list.append : atomique sous le GIL
+    else:
+        _dropped += 1
+
+
+# ---------- Enregistrement ----------
+def start():
+    global recording, _dropped, _started_at
+    with _lock:
+        _events.clear()
+        _threads.clear()
+        _dropped = 0
+        _started_at = time.time()
+        recording = True
+
+
+def stop() -> int:
+    """Arrête l'enregistrement (les évènements restent jusqu'au prochain start()) ; renvoie leur nombre."""
+    global recording
+    recording = False
+    return len(_events)
+
+
+def complete(name: str, cat: str, t0: float, t1: float, args: Optional[Dict[str, Any]] = None):
+    """Span déjà mesuré (t0 / t1 en secondes perf_counter), sur le thread appelant."""
+    if recording:
+        ev = {"name": name, "cat": cat, "ph": "X", "ts": round(t0 * 1e6, 1), "dur": round(max(0.0, (t1 - t0) * 1e6), 1)}
+        if args:
+            ev["args"] = args
+        _add(ev)
+
+
+def instant(name: str, cat: str, args: Optional[Dict[str, Any]] = None):
+    if recording:
+        ev = {"name": name, "cat": cat, "ph": "i", "s": "t", "ts": _now_us()}
+        if args:
+            ev["args"] = args
+        _add(ev)
+
+
+def async_begin(name: str, cat: str, args: Optional[Dict[str, Any]] = None) -> int:
+    """Intervalle qui se termine ailleurs (autre thread, rappel) : id à passer à async_end (0 si inactif)."""
+    global _async_id
+    if not recording:
+        return 0
+    with _lock:
+        _async_id += 1
+        aid = _async_id
+    ev = {"name": name, "cat": cat, "ph": "b", "id": aid, "ts": _now_us()}
+    if args:
+        ev["args"] = args
+    _add(ev)
+    return aid
+
+
+def async_end(name: str, cat: str, aid: int):
+    if recording and aid:
+        _add({"name": name, "cat": cat, "ph": "e", "id": aid, "ts": _now_us()})
+
+
+class span:
+    """with span("decode", "image", h=360) : span complet sur le thread courant."""
+    __slots__ = ("name", "cat", "args", "t0")
+
+    def __init__(self, name: str, cat: str, **args: Any):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.t0 = 0.0
+
+    def __enter__(self) -> "span":
+        if recording:
+            self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if recording and self.t0:
+            complete(self.name, self.cat, self.t0, time.perf_counter(), self.args or None)
+
+
+# ---------- Export ----------
+def export(path: Optional[str] = None) -> str:
+    """
+    Écrit la trace (JSON « Trace Event », ts en µs) et renvoie son chemin. Bloquant
+    (quelques centaines de ms pour 100 000 évènements) : à lancer hors thread UI.
+    """
+    if path is None:
+        import niwot_storage
+        folder = os.path.join(niwot_storage.data_dir(), TRACE_DIR)
+        os.makedirs(folder, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(_started_at or time.time()))
+        path = os.path.join(folder, f"trace-{stamp}.json")
+    with _lock:
+        events = list(_events)
+        threads = dict(_threads)
+    meta = [{"name": "process_name", "ph": "M", "pid": _PID, "tid": 0, "args": {"name": "Niwot Desktop"}}]
+    meta += [{"name": "thread_name", "ph": "M", "pid": _PID, "tid": tid, "args": {"name": name}}
+             for tid, name in threads.items()]
+    meta += [{"name": "thread_sort_index", "ph": "M", "pid": _PID, "tid": tid,
+              "args": {"sort_index": 0 if name == "UI" else 1}} for tid, name in threads.items()]
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms",
+                   "otherData": {"dropped": _dropped, "started": _started_at}}, f, ensure_ascii=False)
+    os.replace(tmp, path)
+    return path
+
+
+def toggle() -> Optional[int]:
+    """Démarre, ou arrête ; renvoie None au démarrage, le nombre d'évènements à l'arrêt."""
+    if recording:
+        return stop()
+    start()
+    return None
@@ -0,0 +1,240 @@
+# niwot_upload.py
+from __future__ import annotations
+import hashlib, mimetypes, os, threading, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Optional, Set
+
+import niwot_storage
+
+# Envoi découpé et reprenable (images de questions) :
+#   POST /uploads {filename, size, sha256, chunkSize, contentType} -> {uploadId[, chunkSize][, received]}
+#   GET  /uploads/<id>                       -> {received: [index...]} ou {offset: octets acquittés}
+#   PUT  /uploads/<id>/chunks/<index>        corps = octets du morceau,
+#        X-Chunk-Offset, X-Chunk-Sha256 (hex) ; le serveur refuse (409/422) un morceau altéré
+#   POST /uploads/<id>/complete              -> le serveur vérifie le sha256 du fichier
+# puis POST /suggest avec uploadId=<id> à la place du fichier.
+CHUNK_SIZE = 256 * 1024
+PARALLEL = 3               # morceaux en vol au plus
+STALL_TIMEOUT_S = 30.0     # plus aucun morceau acquitté depuis ce délai : abandon (reprise au prochain run())
+RETRY_BASE_S = 0.25
+RETRY_MAX_S = 4.0
+CHUNK_TIMEOUT_S = 30
+CHUNKED_MIN_BYTES = 512 * 1024  # en dessous, un seul envoi multipart suffit
+UPLOADS_FILE = "uploads.json"   # sessions en cours, pour reprendre après un échec ou un redémarrage
+
+_state_lock = threading.Lock()
+_unsupported: Set[str] = set()  # api_base sans /uploads : envoi multipart classique
+
+
+class UploadError(RuntimeError):
+    pass
+
+
+class UploadUnsupported(UploadError):
+    pass
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def chunked_available(c, path: str) -> bool:
+    try:
+        return c.api_base not in _unsupported and os.path.getsize(path) >= CHUNKED_MIN_BYTES
+    except OSError:
+        return False
+
+
+def _load_state() -> Dict[str, Any]:
+    d = niwot_storage.read_json(UPLOADS_FILE)
+    return d if isinstance(d, dict) else {}
+
+
+def _save_entry(key: str, entry: Optional[Dict[str, Any]]):
+    with _state_lock:
+        d = _load_state()
+        if entry is None:
+            d.pop(key, None)
+        else:
+            d[key] = entry
+        niwot_storage.write_json(UPLOADS_FILE, d)
+
+
+class ChunkedUpload:
+    """
+    Envoi d'un fichier en morceaux de taille fixe, PARALLEL en vol, chacun avec son sha256.
+    Un morceau qui échoue (connexion coupée, checksum refusé) est renvoyé seul ; l'envoi
+    n'abandonne que si plus rien n'est acquitté pendant STALL_TIMEOUT_S. La session est
+    alors gardée dans uploads.json et run() suivant ne renvoie que les morceaux non
+    acquittés par le serveur. Bloquant : à lancer dans un thread worker.
+
+    progress(envoyés: int, total: int) est appelé depuis les threads d'envoi.
+    """
+
+    def __init__(self, client, path: str, chunk_size: int = CHUNK_SIZE, parallel: int = PARALLEL,
+                 progress: Optional[Callable[[int, int], None]] = None):
+        self._c = client
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.chunk_size = chunk_size
+        self.parallel = max(1, parallel)
+        self.upload_id: Optional[str] = None
+        self.sha256 = ""
+        self.resumed_bytes = 0  # déjà acquittés au démarrage de run()
+        self.sent_bytes = 0     # octets effectivement envoyés (renvois compris)
+        self._progress = progress
+        self._done = 0
+        self._last_ack = 0.0
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def _key(self) -> str:
+        return f"{self._c.api_base}|{self.sha256}|{self.size}"
+
+    @property
+    def chunks(self) -> int:
+        return max(1, -(-self.size // self.chunk_size))
+
+    # --- déroulé ---
+    def run(self) -> str:
+        """Envoie (ou reprend) puis finalise ; renvoie l'uploadId à citer dans /suggest."""
+        self._cancel.clear()
+        self._last_ack = time.monotonic()
+        self._c._set_auth_header_if_needed()
+        self.sha256 = file_sha256(self.path)
+        received = self._resume() if self.upload_id is None else self._status()
+        if received is None:
+            received = self._create()
+        todo = [i for i in range(self.chunks) if i not in received]
+        self._done = self.resumed_bytes = sum(self._length(i) for i in received if i < self.chunks)
+        self._report()
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.parallel, thread_name_prefix="upload") as pool:
+            futures = [pool.submit(self._send_chunk, i) for i in todo]
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                except Exception as e:
+                    errors.append(e)
+                    self._cancel.set()  # inutile de continuer : on reprendra depuis le serveur
+        if errors:
+            raise UploadError(f"Envoi interrompu ({self._done}/{self.size} octets acquittés) : {errors[0]}")
+
+        r = self._c.sess.post(f"{self._c.api_base}/uploads/{self.upload_id}/complete", timeout=CHUNK_TIMEOUT_S)
+        if not r.ok:
+            if r.status_code in (404, 410):
+                _save_entry(self._key, None)  # session perdue côté serveur : repartir de zéro
+            raise UploadError(f"Finalisation refusée ({r.status_code}) : {r.text[:160]}")
+        return self.upload_id
+
+    def forget(self):
+        """À appeler une fois /suggest accepté : la session n'a plus à être reprise."""
+        if self.sha256:
+            _save_entry(self._key, None)
+
+    # --- session ---
+    def _resume(self) -> Optional[Set[int]]:
+        entry = _load_state().get(self._key)
+        if not isinstance(entry, dict) or not entry.get("uploadId"):
+            return None
+        self.upload_id = str(entry["uploadId"])
+        self.chunk_size = int(entry.get("chunkSize") or self.chunk_size)
+        received = self._status()
+        if received is None:
+            _save_entry(self._key, None)
+            self.upload_id = None
+        return received
+
+    def _status(self) -> Optional[Set[int]]:
+        try:
+            r = self._c.sess.get(f"{self._c.api_base}/uploads/{self.upload_id}", timeout=CHUNK_TIMEOUT_S)
+        except Exception:
+            return set()  # serveur injoignable : on tentera quand même les morceaux
+        if not r.ok:
+            return None
+        return self._received(r.json())
+
+    def _create(self) -> Set[int]:
+        body = {"filename": os.path.basename(self.path), "size": self.size, "sha256": self.sha256,
+                "chunkSize": self.chunk_size,
+                "contentType": mimetypes.guess_type(self.path)[0] or "application/octet-stream"}
+        r = self._c.sess.post(f"{self._c.api_base}/uploads", json=body, timeout=CHUNK_TIMEOUT_S)
+        if r.status_code in (404, 405, 501):
+            _unsupported.add(self._c.api_base)
+            raise UploadUnsupported("Envoi découpé non pris en charge par le serveur")
+        if not r.ok:
+            raise UploadError(f"Ouverture de l'envoi refusée ({r.status_code}) : {r.text[:160]}")
+        d = r.json()
+        self.upload_id = str(d.get("uploadId") or d.get("id") or "")
+        if not self.upload_id:
+            raise UploadError("Réponse /uploads sans uploadId")
+        self.chunk_size = int(d.get("chunkSize") or self.chunk_size)
+        _save_entry(self._key, {"uploadId": self.upload_id, "chunkSize": self.chunk_size,
+                                "path": self.path, "at": time.time()})
+        return self._received(d)
+
+    def _received(self, d: Any) -> Set[int]:
+        if not isinstance(d, dict):
+            return set()
+        if isinstance(d.get("received"), list):
+            return {int(i) for i in d["received"] if isinstance(i, (int, float))}
+        offset = d.get("offset")
+        if isinstance(offset, (int, float)):
+            return set(range(int(offset) // self.chunk_size))
+        return set()
+
+    # --- morceaux ---
+    def _length(self, i: int) -> int:
+        return min(self.chunk_size, self.size - i * self.chunk_size)
+
+    def _send_chunk(self, i: int):
+        offset = i * self.chunk_size
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            data = f.read(self.chunk_size)
+        headers = {"Content-Type": "application/octet-stream", "X-Chunk-Offset": str(offset),
+                   "X-Chunk-Sha256": hashlib.sha256(data).hexdigest()}
+        url = f"{self._c.api_base}/uploads/{self.upload_id}/chunks/{i}"
+        attempt = 0
+        while True:
+            if self._cancel.is_set():
+                raise UploadError("annulé")
+            if attempt:
+                self._cancel.wait(min(RETRY_MAX_S, RETRY_BASE_S * (2 ** (attempt - 1))))
+            attempt += 1
+            try:
+                with self._lock:
+                    self.sent_bytes += len(data)
+                r = self._c.sess.put(url, data=data, headers=headers, timeout=CHUNK_TIMEOUT_S)
+                if r.ok:
+                    with self._lock:
+                        self._done += len(data)
+                        self._last_ack = time.monotonic()
+                    self._report()
+                    return
+                if r.status_code in (404, 410):
+                    raise UploadError(f"session d'envoi expirée ({r.status_code})")
+                last = f"{r.status_code} {r.text[:120]}"  # 409/422 checksum, 5xx : on renvoie
+            except UploadError:
+                raise
+            except Exception as e:  # connexion coupée, délai dépassé…
+                last = str(e)
+            # liaison instable mais vivante : on insiste ; plus rien n'est acquitté : abandon
+            if time.monotonic() - self._last_ack > STALL_TIMEOUT_S:
+                raise UploadError(f"morceau {i} : {last}")
+
+    def _report(self):
+        if self._progress:
+            try:
+                self._progress(self._done, self.size)
+            except Exception:
+                pass
@@ -0,0 +1,216 @@
+# niwot_watchdog.py
+from __future__ import annotations
+import collections, logging, os, sys, threading, time
+from typing import Any, Dict, List, Optional, Tuple
+
+from PySide6 import QtCore
+
+import niwot_metrics
+import niwot_storage
+from niwot_profiler import in_loop
+
+HEARTBEAT_MS = 50          # battement posé par le thread UI
+STALL_MS = int(os.environ.get("NIWOT_WATCHDOG_MS", "250"))  # sans battement au-delà : blocage
+SAMPLE_MS = 100            # pendant un blocage, une pile du thread UI toutes les SAMPLE_MS
+MAX_SAMPLES = 50
+LONG_STALL_S = 5.0         # écrit sans attendre la fin (l'utilisateur risque de tuer l'application)
+LOG_FILE = "watchdog.log"  # dans niwot_storage.data_dir(), 512 Kio x 3
+WORST_KEPT = 5
+_STACK_DEPTH = 30
+_LOOP = "@boucle"
+
+log = logging.getLogger("niwot")
+
+
+def enabled() -> bool:
+    return os.environ.get("NIWOT_WATCHDOG", "1") != "0"
+
+
+def _frames(frame) -> List[Tuple[str, int, str]]:
+    """
+    Pile (fichier, ligne, fonction), du plus externe au plus interne. Une trame arrêtée sur un
+    appel à exec() (app.exec, dialog.exec : boucle Qt, voir niwot_profiler.in_loop) a pour
+    fonction « fonction@boucle ».
+    """
+    out = []
+    while frame is not None and len(out) < _STACK_DEPTH * 2:
+        code = frame.f_code
+        name = code.co_name
+        if in_loop(frame):
+            name += _LOOP
+        out.append((os.path.basename(code.co_filename), frame.f_lineno, name))
+        frame = frame.f_back
+    out.reverse()
+    return out
+
+
+def _slot(stack: List[Tuple[str, int, str]]) -> str:
+    """Fonction appelée par la boucle Qt la plus interne (trame qui suit son exec())."""
+    loops = [i for i, (_, _, fn) in enumerate(stack) if fn.endswith(_LOOP)]
+    i = loops[-1] + 1 if loops else 0
+    if i >= len(stack):
+        return "(code Qt, hors Python)"  # bloqué sous exec() sans trame Python : layout, peinture…
+    f, line, fn = stack[i]
+    return f"{fn} ({f}:{line})"
+
+
+def _format(stack: List[Tuple[str, int, str]]) -> str:
+    return "\n".join(f"    {f}:{line} {fn}" for f, line, fn in stack[-_STACK_DEPTH:])
+
+
+class Stall:
+    __slots__ = ("started", "ms", "slot", "event", "stack", "seen", "samples", "stacks", "queue_depth", "logged")
+
+    def __init__(self, started: float):
+        self.started = started      # time.time() du dernier battement
+        self.ms = 0.0
+        self.slot = ""
+        self.event: Optional[str] = None  # évènement socket en cours de traitement
+        self.stack: List[Tuple[str, int, str]] = []  # pile la plus souvent observée
+        self.seen = 0
+        # piles relevées, comptées par (fichier, fonction) : une boucle ne change que les numéros de ligne
+        self.samples: "collections.Counter[Tuple[Tuple[str, str], ...]]" = collections.Counter()
+        self.stacks: Dict[Tuple[Tuple[str, str], ...], List[Tuple[str, int, str]]] = {}
+        self.queue_depth = 0
+        self.logged = False
+
+    def summary(self) -> str:
+        when = time.strftime("%H:%M:%S", time.localtime(self.started))
+        event = f", évènement {self.event}" if self.event else ""
+        return (f"{when} {self.ms:.0f} ms dans {self.slot}{event} "
+                f"(file socket {self.queue_depth}, pile vue {self.seen}/{sum(self.samples.values())})")
+
+
+class Watchdog(QtCore.QObject):
+    """
+    Surveille le thread UI depuis un thread daemon : le thread UI pose un battement toutes les
+    HEARTBEAT_MS ; sans battement depuis STALL_MS, le watchdog relève la pile Python du
+    thread UI (sys._current_frames) toutes les SAMPLE_MS jusqu'au retour, puis écrit dans
+    watchdog.log la durée, la fonction appelée par la boucle Qt, la pile la plus vue et la
+    file socket en attente. À l'arrêt : les WORST_KEPT pires blocages de la session.
+    NIWOT_WATCHDOG=0 le désactive, NIWOT_WATCHDOG_MS règle le seuil.
+    """
+
+    def __init__(self, client: Any = None, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._client = client       # file socket en attente et évènement en cours (NiwotClient)
+        self._beat = time.monotonic()
+        self._beat_wall = time.time()
+        self._gap_ms = 0.0          # dernier écart entre deux battements au-delà du seuil
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(HEARTBEAT_MS)
+        self._timer.timeout.connect(self._on_beat)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._main_id = threading.main_thread().ident
+        self._file: Optional[logging.Logger] = None
+        self.stalls = 0
+        self.worst: List[Stall] = []
+        self._lock = threading.Lock()
+
+    # ---------- Cycle de vie ----------
+    def start(self):
+        if self._thread is not None:
+            return
+        self._on_beat()
+        self._timer.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="niwot-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête la surveillance et écrit le résumé de la session."""
+        if self._thread is None:
+            return
+        self._timer.stop()
+        self._stop.set()
+        self._thread.join(1.0)
+        self._thread = None
+        with self._lock:
+            worst = list(self.worst)
+        if worst:
+            self._logger().warning("session : %d blocage(s), les pires :\n%s", self.stalls,
+                                   "\n".join(f"  {s.summary()}" for s in worst))
+
+    def _on_beat(self):
+        now = time.monotonic()
+        gap = (now - self._beat) * 1000.0
+        if gap >= STALL_MS:
+            self._gap_ms = gap  # durée exacte, vue depuis le thread UI
+        self._beat = now
+        self._beat_wall = time.time()
+
+    # ---------- Thread watchdog ----------
+    def _run(self):
+        stall: Optional[Stall] = None
+        last_tick = time.monotonic()
+        period = SAMPLE_MS / 1000.0
+        while not self._stop.wait(period):
+            now = time.monotonic()
+            if now - last_tick > 2 * STALL_MS / 1000.0:
+                # le watchdog lui-même n'a pas tourné (mise en veille…) : pas un blocage de l'UI
+                last_tick, stall = now, None
+                continue
+            last_tick = now
+            lag = (now - self._beat) * 1000.0
+            if lag < STALL_MS:
+                if stall is not None:
+                    self._close(stall)
+                    stall = None
+                continue
+            if stall is None:
+                stall = Stall(self._beat_wall)
+            stall.ms = lag
+            stall.queue_depth = max(stall.queue_depth, self._depth())
+            stall.event = stall.event or getattr(self._client, "dispatching", None)
+            if sum(stall.samples.values()) < MAX_SAMPLES:
+                stack = _frames(sys._current_frames().get(self._main_id))
+                key = tuple((f, fn) for f, _, fn in stack)
+                stall.samples[key] += 1
+                stall.stacks.setdefault(key, stack)
+            if not stall.logged and lag >= LONG_STALL_S * 1000:
+                stall.logged = True
+                self._write(stall, ongoing=True)
+
+    def _depth(self) -> int:
+        try:
+            return self._client.pending_events() if self._client is not None else 0
+        except Exception:
+            return 0
+
+    def _close(self, stall: Stall):
+        stall.ms = max(stall.ms, self._gap_ms)  # du dernier battement avant au premier après
+        self.stalls += 1
+        niwot_metrics.inc("ui.stalls")
+        niwot_metrics.observe("ui.stall.ms", stall.ms)
+        self._write(stall, ongoing=False)
+        with self._lock:
+            self.worst.append(stall)
+            self.worst.sort(key=lambda s: s.ms, reverse=True)
+            del self.worst[WORST_KEPT:]
+
+    def _write(self, stall: Stall, ongoing: bool):
+        if stall.samples:
+            key, stall.seen = stall.samples.most_common(1)[0]
+            stall.stack = stall.stacks[key]
+        stall.slot = _slot(stall.stack)
+        head = "blocage en cours" if ongoing else "blocage"
+        self._logger().warning("%s : %s\n%s", head, stall.summary(), _format(stall.stack) or "    (pas de pile)")
+        if not ongoing:
+            log.warning("thread UI bloqué %.0f ms dans %s", stall.ms, stall.slot)
+
+    def _logger(self) -> logging.Logger:
+        if self._file is None:
+            from logging.handlers import RotatingFileHandler
+            logger = logging.getLogger("niwot.watchdog")
+            logger.propagate = False  # piles complètes dans le fichier seulement
+            logger.setLevel(logging.INFO)
+            try:
+                h = RotatingFileHandler(os.path.join(niwot_storage.data_dir(), LOG_FILE),
+                                        maxBytes=512 * 1024, backupCount=3, encoding="utf-8")
+                h.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                logger.addHandler(h)
+            except OSError:
+                logger.addHandler(logging.NullHandler())
+            self._file = logger
+        return self._file
@@ -0,0 +1,75 @@
+# tools/bench_assets.py
+"""
+Mesure avant/après du pipeline de ressources (niwot_assets) :
+  - icône fenêtre : QIcon(niwot-favicon.png 1024 px) vs registre multi-tailles
+  - avatar par défaut par ligne de liste : QPixmap(niwotfren.png).scaled(...) vs fallback_avatar()
+
+    python tools/bench_assets.py [--rows 100]
+"""
+from __future__ import annotations
+import argparse, os, sys, time
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+
+def _ms(t0: float) -> float:
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def _bytes(pm: QtGui.QPixmap) -> int:
+    return pm.width() * pm.height() * max(1, pm.depth()) // 8
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100)
+    args = ap.parse_args()
+    app = QtWidgets.QApplication(sys.argv[:1])  # noqa: F841
+
+    # --- Icône (avant) : décodage du PNG 1024 px pour obtenir l'icône 32 px
+    t0 = time.perf_counter()
+    old_icon = QtGui.QIcon(os.path.join(HERE, "niwot-favicon.png"))
+    old_icon.pixmap(32, 32)
+    icon_before = _ms(t0)
+
+    import niwot_assets
+    t0 = time.perf_counter()
+    niwot_assets.app_icon().pixmap(32, 32)
+    icon_after = _ms(t0)
+
+    # --- Avatar par défaut, une fois par ligne (avant)
+    path = os.path.join(HERE, "niwotfren.png")
+    t0 = time.perf_counter()
+    decoded_before = 0
+    for _ in range(args.rows):
+        pm = QtGui.QPixmap(path)
+        decoded_before += _bytes(pm)
+        pm.scaled(40, 40, QtCore.Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                  QtCore.Qt.TransformationMode.SmoothTransformation)
+    rows_before = _ms(t0)
+
+    # --- (après) registre partagé : un seul décodage, déjà en 40 px
+    t0 = time.perf_counter()
+    keys = set()
+    decoded_after = 0
+    for _ in range(args.rows):
+        pm = niwot_assets.fallback_avatar(40)
+        if pm.cacheKey() not in keys:
+            keys.add(pm.cacheKey())
+            decoded_after += _bytes(pm)
+    rows_after = _ms(t0)
+
+    print(f"ressources compilées (niwot_assets_rc) : {'oui' if niwot_assets._HAS_RC else 'non'}")
+    print(f"{'':32}{'avant':>12}{'après':>12}")
+    print(f"{'icône fenêtre (ms)':32}{icon_before:12.2f}{icon_after:12.2f}")
+    print(f"{f'avatars x{args.rows} (ms)':32}{rows_before:12.2f}{rows_after:12.2f}")
+    print(f"{'décodé par ligne (Ko)':32}{decoded_before / args.rows / 1024:12.1f}{decoded_after / args.rows / 1024:12.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
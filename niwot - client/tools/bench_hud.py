@@ -0,0 +1,69 @@
+# tools/bench_hud.py
+"""
+Coût par tick du bandeau du quiz : QLabel RichText (ancienne version) vs QuizHud peint.
+
+Chaque tick change le compte à rebours puis laisse Qt traiter layout + peinture
+(processEvents), comme dans l'application.
+
+    python tools/bench_hud.py [--ticks 300]
+"""
+from __future__ import annotations
+import argparse, os, sys, time
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtCore, QtWidgets  # noqa: E402
+
+
+def _bench(app, ticks: int, tick) -> float:
+    for i in range(10):  # chauffe
+        tick(i)
+        app.processEvents()
+    t0 = time.perf_counter()
+    for i in range(ticks):
+        tick(i)
+        app.processEvents()
+    return (time.perf_counter() - t0) * 1000.0 / ticks
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--ticks", type=int, default=300)
+    args = ap.parse_args()
+    app = QtWidgets.QApplication(sys.argv[:1])
+    QtCore.qInstallMessageHandler(lambda *a: None)  # bruit du plugin offscreen
+    from ui_hud import QuizHud
+
+    # --- avant : deux QLabel RichText reconstruits à chaque tick
+    old = QtWidgets.QWidget()
+    h = QtWidgets.QHBoxLayout(old)
+    left, right = QtWidgets.QLabel(), QtWidgets.QLabel()
+    h.addWidget(left, 1); h.addWidget(right, 0)
+    old.resize(900, 40); old.show()
+
+    def tick_old(i: int):
+        left.setText("Salle <span style='font-family:monospace'>ABC123</span> <span style='color:#8ea0ff;'>•</span> "
+                     "Objectif : <span style='font-family:monospace'>100 pts</span>")
+        left.setTextFormat(QtCore.Qt.RichText)
+        right.setText(f"Hôte : <b>Alice</b> &nbsp; Temps restant : <span style='font-family:monospace'>{15 - i % 15}s</span>")
+        right.setTextFormat(QtCore.Qt.RichText)
+
+    idle = _bench(app, args.ticks, lambda i: None)  # coût fixe de processEvents
+    before = _bench(app, args.ticks, tick_old) - idle
+    old.hide()
+
+    # --- après : HUD peint, seule la zone du compte à rebours est invalidée
+    hud = QuizHud()
+    hud.resize(900, 40); hud.show()
+    hud.set_room("ABC123", 100); hud.set_host("Alice"); hud.set_score(42)
+
+    after = _bench(app, args.ticks, lambda i: hud.set_seconds(15 - i % 15)) - idle
+
+    print(f"par tick : avant {before:.3f} ms  |  après {after:.3f} ms  ({after / before * 100:.0f} %)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
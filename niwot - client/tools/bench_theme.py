@@ -0,0 +1,125 @@
+# tools/bench_theme.py
+"""
+Coût du recalcul de style sur une liste de joueurs (comme QuizWidget._render_players) :
+  - avant : setStyleSheet inline par ligne (points + badge hôte) et sur le label de statut
+  - après : rôles / états en propriétés dynamiques ciblés par le QSS global (ui_theme)
+
+Mesures (QPA offscreen, médiane sur --repeat) :
+  - reconstruction de la liste + polish de toutes les lignes (processEvents)
+  - états successifs du label de statut (remise à zéro, faux, faux, trouvé), --toggles fois
+
+    python tools/bench_theme.py [--players 100] [--repeat 5] [--toggles 200]
+
+Relevé (offscreen, 100 joueurs, 3 x --repeat 7) : liste 83.6-84.9 ms inline contre
+82.4-83.8 ms en propriétés, 200 états 11.7-12.0 contre 11.5-11.6 ms : à égalité, le
+gain du thème global est la maintenance (un seul QSS), pas le temps de polish.
+"""
+from __future__ import annotations
+import argparse, os, statistics, sys, time
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtWidgets  # noqa: E402
+
+from ui_theme import apply_theme, role, set_state  # noqa: E402
+
+_BADGE = "font-size:11px; padding:2px 6px; border:1px solid rgba(255,255,255,0.1); border-radius:8px;"
+
+
+def _row(i: int, inline: bool) -> QtWidgets.QWidget:
+    w = QtWidgets.QWidget()
+    h = QtWidgets.QHBoxLayout(w)
+    h.setContentsMargins(8, 6, 8, 6)
+    avatar = QtWidgets.QLabel()
+    avatar.setFixedSize(40, 40)
+    name = QtWidgets.QLabel(f"joueur{i} ")
+    pts = QtWidgets.QLabel(f"({i * 3} pts)")
+    line = QtWidgets.QHBoxLayout()
+    line.addWidget(name)
+    line.addWidget(pts)
+    if inline:
+        pts.setStyleSheet("color:#bfc7ff;")
+    else:
+        role(pts, "points")
+    if i == 0:
+        badge = QtWidgets.QLabel("Hôte")
+        if inline:
+            badge.setStyleSheet(_BADGE)
+        else:
+            role(badge, "badge")
+        line.addWidget(badge)
+    v = QtWidgets.QVBoxLayout()
+    v.addLayout(line)
+    v.addWidget(QtWidgets.QLabel("Aucune proposition"))
+    h.addWidget(avatar)
+    h.addLayout(v, 1)
+    return w
+
+
+def _render(lst: QtWidgets.QListWidget, players: int, inline: bool, app: QtWidgets.QApplication) -> float:
+    t0 = time.perf_counter()
+    lst.clear()
+    for i in range(players):
+        w = _row(i, inline)
+        it = QtWidgets.QListWidgetItem()
+        it.setSizeHint(w.sizeHint())
+        lst.addItem(it)
+        lst.setItemWidget(it, w)
+    app.processEvents()
+    return (time.perf_counter() - t0) * 1000.0
+
+
+# séquence d'une question : remise à zéro, deux mauvaises réponses, la bonne
+_QUESTION = ("", "error", "error", "ok")
+
+
+def _toggle(lbl: QtWidgets.QLabel, n: int, inline: bool, app: QtWidgets.QApplication) -> float:
+    t0 = time.perf_counter()
+    for k in range(n):
+        state = _QUESTION[k % len(_QUESTION)]
+        if inline:
+            lbl.setStyleSheet({"": "", "error": "color:#ff8b8b;", "ok": "color:#69f0ae;"}[state])
+        else:
+            set_state(lbl, "status", state)
+        lbl.setText({"": "", "error": "Faux !", "ok": "Trouvé !"}[state])
+        app.processEvents()
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--players", type=int, default=100)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--toggles", type=int, default=200)
+    args = ap.parse_args()
+    app = QtWidgets.QApplication(sys.argv[:1])
+    apply_theme(app)
+
+    page = QtWidgets.QWidget()
+    v = QtWidgets.QVBoxLayout(page)
+    lbl = QtWidgets.QLabel("")
+    lst = QtWidgets.QListWidget()
+    v.addWidget(lbl)
+    v.addWidget(lst)
+    page.resize(480, 900)
+    page.show()
+    app.processEvents()
+
+    res = {}
+    for inline in (True, False):
+        _render(lst, args.players, inline, app)  # chauffe
+        res[inline] = (
+            statistics.median(_render(lst, args.players, inline, app) for _ in range(args.repeat)),
+            statistics.median(_toggle(lbl, args.toggles, inline, app) for _ in range(args.repeat)),
+        )
+
+    print(f"{args.players} joueurs, médiane sur {args.repeat}")
+    print(f"  liste + polish      inline {res[True][0]:8.1f} ms   propriétés {res[False][0]:8.1f} ms")
+    print(f"  {args.toggles} états statut    inline {res[True][1]:8.1f} ms   propriétés {res[False][1]:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
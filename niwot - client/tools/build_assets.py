@@ -0,0 +1,85 @@
+# tools/build_assets.py
+"""
+Pipeline des ressources embarquées.
+
+Génère depuis les PNG sources (1024 px) des versions pré-réduites :
+  - assets/icon-<N>.png    (icône fenêtre, N = ICON_SIZES)
+  - assets/avatar-<N>.png  (avatar par défaut, N = AVATAR_SIZES)
+puis assets/niwot_assets.qrc et le module compilé niwot_assets_rc.py (pyside6-rcc),
+et assets/splash.png (écran de lancement natif du build PyInstaller, hors .qrc).
+
+    python tools/build_assets.py
+
+À relancer après modification de niwot-favicon.png / niwotfren.png ou des tailles.
+"""
+from __future__ import annotations
+import os, shutil, subprocess, sys
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtCore, QtGui  # noqa: E402
+from niwot_assets import ICON_SIZES, AVATAR_SIZES, ICON_SOURCE, AVATAR_SOURCE  # noqa: E402
+
+ASSETS = os.path.join(HERE, "assets")
+
+
+def _scaled(src: QtGui.QImage, side: int) -> QtGui.QImage:
+    return src.scaled(side, side, QtCore.Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                      QtCore.Qt.TransformationMode.SmoothTransformation)
+
+
+SPLASH_SIZE = (360, 220)
+
+
+def _splash(icon: QtGui.QImage) -> QtGui.QImage:
+    """Image du splash PyInstaller ; le texte d'état est dessiné par le bootloader en bas à gauche."""
+    w, h = SPLASH_SIZE
+    img = QtGui.QImage(w, h, QtGui.QImage.Format.Format_RGB32)
+    img.fill(QtGui.QColor("#0b0b12"))
+    p = QtGui.QPainter(img)
+    p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+    p.setPen(QtGui.QColor(255, 255, 255, 20))
+    p.drawRect(0, 0, w - 1, h - 1)
+    p.drawImage(QtCore.QPoint((w - 128) // 2, 36), _scaled(icon, 128))
+    p.end()
+    return img
+
+
+def main() -> int:
+    app = QtGui.QGuiApplication(sys.argv[:1])  # noqa: F841
+    os.makedirs(ASSETS, exist_ok=True)
+    files = []
+    for prefix, source, sizes in (("icon", ICON_SOURCE, ICON_SIZES), ("avatar", AVATAR_SOURCE, AVATAR_SIZES)):
+        img = QtGui.QImage(os.path.join(HERE, source))
+        if img.isNull():
+            print(f"Source illisible : {source}")
+            return 1
+        for side in sizes:
+            name = f"{prefix}-{side}.png"
+            _scaled(img, side).save(os.path.join(ASSETS, name), "PNG", 9)
+            files.append(name)
+
+    _splash(QtGui.QImage(os.path.join(HERE, ICON_SOURCE))).save(os.path.join(ASSETS, "splash.png"), "PNG", 9)
+
+    qrc = os.path.join(ASSETS, "niwot_assets.qrc")
+    with open(qrc, "w", encoding="utf-8") as f:
+        f.write('<!DOCTYPE RCC><RCC version="1.0">\n<qresource prefix="/niwot">\n')
+        for name in files:
+            f.write(f"    <file>{name}</file>\n")
+        f.write("</qresource>\n</RCC>\n")
+
+    rcc = shutil.which("pyside6-rcc")
+    if not rcc:
+        print("pyside6-rcc introuvable (pip install PySide6)")
+        return 1
+    out = os.path.join(HERE, "niwot_assets_rc.py")
+    subprocess.check_call([rcc, qrc, "-o", out])
+    total = sum(os.path.getsize(os.path.join(ASSETS, n)) for n in files)
+    print(f"{len(files)} images ({total / 1024:.1f} Ko) -> {os.path.relpath(out, HERE)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
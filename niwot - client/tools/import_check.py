@@ -0,0 +1,134 @@
+# tools/import_check.py
+"""
+Vérifie l'import en masse (niwot_import) contre le serveur de substitution de
+upload_check.py : validation locale, envoi en parallèle borné, reprise après panne.
+
+    python tools/import_check.py [--rows 60] [--drop 0.2]
+
+Scénarios : fichier CSV avec lignes invalides (refusées avant tout envoi), serveur qui
+tombe au milieu de l'import (lignes en échec), réouverture du même fichier (les lignes
+déjà envoyées ne repartent pas) et reprise : chaque ligne valide reçue une seule fois.
+"""
+from __future__ import annotations
+import argparse, csv, json, os, sys, tempfile, time
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.join(HERE, "tools"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("NIWOT_DATA_DIR", tempfile.mkdtemp(prefix="niwot-import-"))
+
+CATEGORIES = [{"id": 1, "name": "Cinéma"}, {"id": 2, "name": "Musique"}, {"id": 3, "name": "Séries"}]
+
+
+def write_file(folder: str, rows: int) -> str:
+    """rows lignes valides (un quart avec image) + 3 invalides."""
+    os.makedirs(os.path.join(folder, "img"), exist_ok=True)
+    path = os.path.join(folder, "questions.csv")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f, delimiter=";")
+        w.writerow(["Question", "Type", "Citation", "Image", "Réponse", "Alternatives", "Explication", "Catégories"])
+        for i in range(rows):
+            if i % 4 == 0:
+                name = f"q{i}.png"
+                with open(os.path.join(folder, "img", name), "wb") as img:
+                    img.write(os.urandom(2048))
+                w.writerow([f"Quel film ? #{i}", "IMAGE", "", name, f"Film {i}", "", "", "cinema"])
+            else:
+                w.writerow([f"Qui a dit ça ? #{i}", "", f"Citation {i}", "", f"Auteur {i}",
+                            "Alt A|Alt B", "Parce que.", "Musique|séries"])
+        w.writerow(["", "CITATION", "x", "", "y", "", "", "Cinéma"])             # question manquante
+        w.writerow(["Image absente", "IMAGE", "", "absente.png", "z", "", "", "1"])
+        w.writerow(["Catégorie inconnue", "", "c", "", "r", "", "", "Sport"])
+    return path
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=60)
+    ap.add_argument("--drop", type=float, default=0.2, help="probabilité de couper un POST /suggest enregistré")
+    args = ap.parse_args()
+
+    from PySide6 import QtWidgets
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    import niwot_import
+    from niwot_import import DONE_BEFORE, FAILED, INVALID, READY, SENT, ImportModel, ImportRunner, load_import
+    from upload_check import _Client, make_server
+
+    niwot_import.IMPORT_RETRY_S = 0.05  # pas d'attente réelle entre deux essais ici
+    ok = True
+
+    def check(label: str, cond: bool, detail: str = ""):
+        nonlocal ok
+        ok &= cond
+        print(f"  [{'ok' if cond else 'ÉCHEC'}] {label}" + (f" — {detail}" if detail else ""))
+
+    def pump(cond, timeout: float = 30.0) -> bool:
+        end = time.monotonic() + timeout
+        while time.monotonic() < end and not cond():
+            app.processEvents()
+            time.sleep(0.002)
+        return cond()
+
+    folder = tempfile.mkdtemp(prefix="niwot-import-src-")
+    path = write_file(folder, args.rows)
+    srv = make_server(args.drop)
+    c = _Client(f"http://127.0.0.1:{srv.server_address[1]}")
+
+    # 1. validation locale
+    t0 = time.perf_counter()
+    rows, file_key, journal = load_import(path, CATEGORIES, os.path.join(folder, "img"))
+    ms = (time.perf_counter() - t0) * 1000
+    model = ImportModel()
+    model.set_rows(rows)
+    invalid = [r for r in rows if r.status == INVALID]
+    check("validation locale", len(rows) == args.rows + 3 and len(invalid) == 3 and not srv.state["suggestions"],
+          f"{len(rows)} lignes, {len(invalid)} invalides ({'; '.join(r.errors[0] for r in invalid)}) en {ms:.0f} ms")
+    cats = json.loads(rows[1].fields["categoryIds"])
+    check("catégories par nom (sans accents ni casse)", cats == [2, 3], str(cats))
+
+    # 2. panne au milieu de l'import
+    runner = ImportRunner(c, model)
+    runner.attach(file_key, journal)
+    inflight_max = [0]
+    runner.sig_progress.connect(lambda: inflight_max.__setitem__(0, max(inflight_max[0], len(runner._inflight))))
+    finished = []
+    runner.sig_finished.connect(lambda: finished.append(1))
+    runner.start()
+    pump(lambda: model.count(SENT) >= args.rows // 3)
+    srv.state["down"] = True
+    pump(lambda: finished)
+    sent_first, failed = model.count(SENT), model.count(FAILED)
+    check("panne : lignes en échec, parallélisme borné",
+          failed > 0 and sent_first < args.rows and inflight_max[0] <= niwot_import.IMPORT_PARALLEL,
+          f"{sent_first} envoyées, {failed} en échec, {inflight_max[0]} en vol au plus")
+
+    # 3. réouverture du même fichier + reprise
+    srv.state["down"] = False
+    time.sleep(0.2)  # journal écrit en tâche de fond
+    pump(lambda: False, 0.2)
+    rows, file_key, journal = load_import(path, CATEGORIES, os.path.join(folder, "img"))
+    model.set_rows(rows)
+    runner.attach(file_key, journal)
+    done_before = model.count(DONE_BEFORE)
+    check("réouverture : lignes déjà envoyées reconnues", done_before == sent_first,
+          f"{done_before} déjà envoyées, {model.count(READY)} à envoyer")
+    rounds = 0
+    while rounds < 5 and model.count(READY, FAILED):  # « Reprendre » tant qu'il reste des échecs
+        rounds += 1
+        finished.clear()
+        runner.start()
+        pump(lambda: finished)
+    received = len(srv.state["suggestions"])
+    check("reprise : chaque ligne valide reçue une seule fois",
+          model.count(SENT, DONE_BEFORE) == args.rows and received == args.rows,
+          f"{received} reçues, {srv.state['replays']} renvoi(s) dédoublonné(s), "
+          f"{rounds} reprise(s), {runner.throughput():.0f} lignes/min")
+    srv.shutdown()
+
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
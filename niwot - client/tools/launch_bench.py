@@ -0,0 +1,163 @@
+# tools/launch_bench.py
+"""
+Temps lancement -> écran de connexion des builds PyInstaller (profils de NiwotDesktop.spec),
+à froid et à chaud, plus la référence « python main.py ». Fonctionne sous Linux.
+
+  - chaque lancement se fait avec NIWOT_STARTUP_PROBE=1 : l'app écrit l'instant de sa
+    première frame sur stderr puis quitte ; mesure = cet instant - instant du spawn
+  - à froid : les fichiers du build sont évincés du cache disque avant chaque lancement
+    (posix_fadvise DONTNEED, sans droits root ; --drop-caches : /proc/sys/vm/drop_caches,
+    root requis). Le build onefile ré-extrait de toute façon Python + Qt à chaque lancement.
+  - sans écran ($DISPLAY / $WAYLAND_DISPLAY absents) : QPA offscreen et splash désactivé
+
+    python tools/launch_bench.py --build                # construit onefile + fast puis mesure
+    python tools/launch_bench.py [--profiles fast] [--runs 5] [--dist dist/launch-bench]
+"""
+from __future__ import annotations
+import argparse, os, statistics, subprocess, sys, tempfile, time
+from typing import Dict, List, Optional
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SPEC = os.path.join(HERE, "NiwotDesktop.spec")
+MARKER = "niwot-startup "
+PROFILES = ("onefile", "fast")
+_DATA_DIR = tempfile.mkdtemp(prefix="niwot-bench-")
+EXE = "NiwotDesktop.exe" if os.name == "nt" else "NiwotDesktop"
+
+
+def _headless() -> bool:
+    return os.name != "nt" and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["NIWOT_STARTUP_PROBE"] = "1"
+    env["NIWOT_API_BASE"] = ""
+    env["NIWOT_WS_BASE"] = ""
+    env["NIWOT_DATA_DIR"] = _DATA_DIR  # vide : pas de session mémorisée -> écran de connexion
+    if _headless():
+        env["QT_QPA_PLATFORM"] = "offscreen"
+        env["PYINSTALLER_SUPPRESS_SPLASH_SCREEN"] = "1"
+    return env
+
+
+def _exe_path(dist: str, profile: str) -> str:
+    if profile == "fast":
+        return os.path.join(dist, profile, "NiwotDesktop", EXE)
+    return os.path.join(dist, profile, EXE)
+
+
+def _build(dist: str, work: str, profile: str) -> None:
+    env = dict(os.environ, NIWOT_BUILD_PROFILE=profile)
+    cmd = [sys.executable, "-m", "PyInstaller", "--noconfirm",
+           "--distpath", os.path.join(dist, profile), "--workpath", os.path.join(work, profile), SPEC]
+    print(f"build {profile} …", flush=True)
+    t0 = time.perf_counter()
+    subprocess.run(cmd, cwd=HERE, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    print(f"  {time.perf_counter() - t0:.0f} s")
+
+
+def _files(root: str) -> List[str]:
+    if os.path.isfile(root):
+        return [root]
+    out = []
+    for d, _, names in os.walk(root):
+        out.extend(os.path.join(d, n) for n in names)
+    return out
+
+
+def _evict(paths: List[str], drop_caches: bool) -> None:
+    """Sort les fichiers du cache de pages (lancement à froid)."""
+    if drop_caches:
+        os.sync()
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+        return
+    for p in paths:
+        try:
+            fd = os.open(p, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _launch(cmd: List[str]) -> float:
+    t_spawn = time.time()
+    p = subprocess.run(cmd, cwd=HERE, env=_env(), capture_output=True, text=True, timeout=180)
+    for line in p.stderr.splitlines():
+        if line.startswith(MARKER):
+            fields = dict(kv.split("=", 1) for kv in line[len(MARKER):].split())
+            return (float(fields["epoch"]) - t_spawn) * 1000.0
+    raise RuntimeError(f"{cmd[0]} : pas de première frame (code {p.returncode})\n{p.stderr[-1500:]}")
+
+
+def _size_mb(root: str) -> float:
+    # les liens symboliques (libQt6*.so.6 -> …) ne sont comptés qu'une fois
+    return sum(os.path.getsize(p) for p in _files(root) if not os.path.islink(p)) / (1024 * 1024)
+
+
+def _measure(cmd: List[str], runs: int, evict: Optional[List[str]], drop_caches: bool) -> Dict[str, float]:
+    _launch(cmd)  # remplit le cache disque
+    warm = [_launch(cmd) for _ in range(runs)]
+    res = {"warm": statistics.median(warm)}
+    if evict is not None:
+        cold = []
+        for _ in range(runs):
+            _evict(evict, drop_caches)
+            cold.append(_launch(cmd))
+        res["cold"] = statistics.median(cold)
+    return res
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--profiles", default=",".join(PROFILES))
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--dist", default=os.path.join(HERE, "dist", "launch-bench"))
+    ap.add_argument("--work", default=os.path.join(HERE, "build", "launch-bench"))
+    ap.add_argument("--build", action="store_true", help="(re)construire les profils avant de mesurer")
+    ap.add_argument("--drop-caches", action="store_true", help="vider tout le cache disque (root)")
+    ap.add_argument("--no-python", action="store_true", help="sans la référence python main.py")
+    args = ap.parse_args()
+
+    profiles = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    unknown = [p for p in profiles if p not in PROFILES]
+    if unknown:
+        print(f"profil(s) inconnu(s) : {', '.join(unknown)} ({' | '.join(PROFILES)})")
+        return 2
+    can_evict = hasattr(os, "posix_fadvise") or args.drop_caches
+    if not can_evict:
+        print("(mesure à froid indisponible sur cette plateforme : posix_fadvise absent)")
+
+    rows = []
+    if not args.no_python:
+        rows.append(("python main.py", "-", _measure([sys.executable, os.path.join(HERE, "main.py")],
+                                                     args.runs, None, False)))
+    for profile in profiles:
+        if args.build:
+            _build(args.dist, args.work, profile)
+        exe = _exe_path(args.dist, profile)
+        if not os.path.exists(exe):
+            print(f"{profile} : {os.path.relpath(exe, HERE)} absent (lancer avec --build)")
+            return 1
+        root = os.path.dirname(exe) if profile == "fast" else exe
+        evict = _files(root) if can_evict else None
+        rows.append((profile, f"{_size_mb(root):.0f} Mo", _measure([exe], args.runs, evict, args.drop_caches)))
+
+    print(f"\nlancement -> écran de connexion, médiane sur {args.runs}"
+          + ("  (offscreen, splash désactivé)" if _headless() else ""))
+    print(f"  {'profil':<16} {'taille':>8} {'froid':>10} {'chaud':>10}")
+    for name, size, res in rows:
+        cold = f"{res['cold']:.0f} ms" if "cold" in res else "-"
+        print(f"  {name:<16} {size:>8} {cold:>10} {res['warm']:>7.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+# tools/leaderboard_bench.py
+"""
+Temps de réponse par page du classement complet (ui_leaderboard.LeaderboardDialog)
+contre un serveur local de substitution (QPA offscreen) :
+  - serveur : N utilisateurs (100 000 par défaut), /leaderboard[/proposers]?offset=&limit=
+    avec total, /leaderboard[/proposers]/rank?userId= ; latence artificielle optionnelle
+  - scénario : ouverture, défilement page par page, sauts aléatoires, « Mon rang »
+  - mesures : durée de requête par page (côté client), délai défilement -> page affichée,
+    part des pages déjà préchargées au moment du défilement, pages gardées en mémoire
+
+    python tools/leaderboard_bench.py [--users 100000] [--scroll 30] [--jumps 20] [--latency-ms 0]
+    python tools/leaderboard_bench.py --serve --port 8766      # serveur seul
+"""
+from __future__ import annotations
+import argparse, json, os, random, statistics, sys, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List
+from urllib.parse import urlsplit, parse_qs
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def make_server(users: int, latency_ms: float = 0.0, port: int = 0):
+    rnd = random.Random(42)
+    base = [{"id": i, "username": f"joueur{i:06d}", "wins": rnd.randint(0, 5000),
+             "approvedCount": rnd.randint(0, 300)} for i in range(1, users + 1)]
+    boards = {}
+    for path, key, score in (("/leaderboard", "leaders", "wins"),
+                             ("/leaderboard/proposers", "proposers", "approvedCount")):
+        ordered = sorted(base, key=lambda u: (-u[score], u["id"]))
+        boards[path] = (key, score, ordered, {u["id"]: r for r, u in enumerate(ordered, start=1)})
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *a):
+            pass
+
+        def _json(self, status: int, obj) -> None:
+            body = json.dumps(obj).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if latency_ms:
+                time.sleep(latency_ms / 1000.0)
+            parts = urlsplit(self.path)
+            q = parse_qs(parts.query)
+            path, rank = parts.path, parts.path.endswith("/rank")
+            if rank:
+                path = path[:-len("/rank")]
+            if path not in boards:
+                return self._json(404, {"error": "not found"})
+            key, score, ordered, ranks = boards[path]
+            if rank:
+                r = ranks.get(int((q.get("userId") or ["0"])[0] or 0))
+                return self._json(200 if r else 404, {"rank": r})
+            offset = max(0, int((q.get("offset") or ["0"])[0]))
+            limit = max(1, min(500, int((q.get("limit") or ["10"])[0])))
+            page = [{"rank": offset + i + 1, "username": u["username"], score: u[score]}
+                    for i, u in enumerate(ordered[offset:offset + limit])]
+            self._json(200, {key: page, "total": len(ordered)})
+
+    srv = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+def _wait(app, cond: Callable[[], bool], timeout: float = 10.0) -> bool:
+    end = time.perf_counter() + timeout
+    while time.perf_counter() < end:
+        app.processEvents()
+        if cond():
+            return True
+        time.sleep(0.001)
+    return False
+
+
+def _stats(label: str, xs: List[float]) -> None:
+    if not xs:
+        print(f"  {label:<34} -")
+        return
+    xs = sorted(xs)
+    p95 = xs[min(len(xs) - 1, int(round(0.95 * (len(xs) - 1))))]
+    print(f"  {label:<34} médiane {statistics.median(xs):7.1f} ms   p95 {p95:7.1f} ms   max {xs[-1]:7.1f} ms   (n={len(xs)})")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--users", type=int, default=100_000)
+    ap.add_argument("--scroll", type=int, default=30, help="pages parcourues en défilant")
+    ap.add_argument("--jumps", type=int, default=20, help="sauts aléatoires dans le classement")
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="latence ajoutée par le serveur")
+    ap.add_argument("--serve", action="store_true", help="lancer seulement le serveur")
+    ap.add_argument("--port", type=int, default=0)
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    srv = make_server(args.users, args.latency_ms, args.port)
+    api = f"http://127.0.0.1:{srv.server_address[1]}"
+    print(f"serveur {api} : {args.users} utilisateurs ({(time.perf_counter() - t0):.1f} s)")
+    if args.serve:
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            return 0
+
+    from PySide6 import QtWidgets
+    from niwot_client import NiwotClient
+    from niwot_leaderboard import MAX_PAGES, PAGE_SIZE
+    from ui_leaderboard import LeaderboardDialog
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    client = NiwotClient(api, "")
+    me_id = args.users * 2 // 3
+    dlg = LeaderboardDialog(client, {"id": me_id, "username": f"joueur{me_id:06d}"})
+    model, table = dlg.model, dlg.table
+    request_ms: List[float] = []
+    model.sig_page_loaded.connect(lambda _p, ms: request_ms.append(ms))
+
+    def loaded(row: int) -> Callable[[], bool]:
+        return lambda: (row // PAGE_SIZE) in model._pages
+
+    t = time.perf_counter()
+    dlg.show()
+    _wait(app, lambda: model.rowCount() > 0 and loaded(0)())
+    open_ms = (time.perf_counter() - t) * 1000.0
+
+    scroll_ms, prefetched, held = [], 0, 0
+    for _ in range(args.scroll):
+        _wait(app, lambda: not model._inflight, 2.0)  # le préchargement a eu le temps de finir
+        target = table.rowAt(0) + PAGE_SIZE
+        prefetched += loaded(target)()
+        t = time.perf_counter()
+        table.scrollTo(model.index(target, 0), QtWidgets.QAbstractItemView.PositionAtTop)
+        _wait(app, loaded(target))
+        scroll_ms.append((time.perf_counter() - t) * 1000.0)
+        held = max(held, model.pages_held)
+
+    rnd = random.Random(7)
+    jump_ms = []
+    for _ in range(args.jumps):
+        row = rnd.randrange(model.rowCount())
+        t = time.perf_counter()
+        table.scrollTo(model.index(row, 0), QtWidgets.QAbstractItemView.PositionAtCenter)
+        _wait(app, loaded(row))
+        jump_ms.append((time.perf_counter() - t) * 1000.0)
+        held = max(held, model.pages_held)
+
+    t = time.perf_counter()
+    dlg.btn_me.click()
+    _wait(app, lambda: dlg._rank_task is None and table.currentIndex().isValid()
+          and loaded(table.currentIndex().row())())
+    me_ms = (time.perf_counter() - t) * 1000.0
+    me_row = table.currentIndex().row()
+
+    print(f"\n{model.rowCount()} lignes, pages de {PAGE_SIZE}, au plus {MAX_PAGES} en mémoire"
+          + (f", latence serveur +{args.latency_ms:.0f} ms" if args.latency_ms else ""))
+    print(f"  ouverture -> 1re page affichée         {open_ms:7.1f} ms")
+    _stats("requête par page (client)", request_ms)
+    _stats("défilement -> page affichée", scroll_ms)
+    _stats("saut aléatoire -> page affichée", jump_ms)
+    print(f"  « Mon rang » -> ligne {me_row + 1} affichée     {me_ms:7.1f} ms")
+    print(f"  pages déjà préchargées au défilement   {prefetched}/{args.scroll}")
+    print(f"  pages en mémoire (max observé)         {held}")
+    srv.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
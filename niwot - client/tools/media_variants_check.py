@@ -0,0 +1,118 @@
+# tools/media_variants_check.py
+"""
+Vérifie la négociation de variantes de médias (niwot_media.MediaVariants) contre un
+serveur de médias local de substitution.
+
+    python tools/media_variants_check.py              # les 3 modes
+    python tools/media_variants_check.py --serve honor --port 8765   # serveur seul
+
+Modes du serveur :
+  - honor  : respecte ?w=&fmt= (redimensionne + encode)
+  - ignore : ignore les paramètres et renvoie toujours l'original
+  - reject : répond 404 dès qu'il y a une query string
+"""
+from __future__ import annotations
+import argparse, os, sys, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtCore, QtGui  # noqa: E402
+
+
+def _encode(img: QtGui.QImage, fmt: str) -> bytes:
+    ba = QtCore.QByteArray()
+    buf = QtCore.QBuffer(ba)
+    buf.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+    if not img.save(buf, fmt.upper()):
+        img.save(buf, "PNG")
+    return bytes(ba)
+
+
+def _original() -> bytes:
+    img = QtGui.QImage(1024, 768, QtGui.QImage.Format.Format_RGB32)
+    img.fill(QtGui.QColor("#7a3cff"))
+    return _encode(img, "PNG")
+
+
+def make_server(mode: str, port: int = 0):
+    original = _original()
+    log = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *a):
+            pass
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            q = parse_qs(parts.query)
+            body, status = original, 200
+            if parts.query and mode == "reject":
+                body, status = b"not found", 404
+            elif parts.query and mode == "honor":
+                w = int((q.get("w") or ["0"])[0] or 0)
+                fmt = (q.get("fmt") or ["png"])[0]
+                img = QtGui.QImage.fromData(original)
+                if w > 0:
+                    img = img.scaled(w, w, QtCore.Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                                     QtCore.Qt.TransformationMode.SmoothTransformation)
+                body = _encode(img, fmt)
+            log.append((self.path, status, len(body)))
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    srv = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv, log
+
+
+def check(mode: str) -> bool:
+    import requests
+    from niwot_media import MediaVariants
+
+    srv, log = make_server(mode)
+    url = f"http://127.0.0.1:{srv.server_address[1]}/media/avatar.png"
+
+    class _Client:
+        sess = requests.Session()
+
+    media = MediaVariants(_Client())
+    a = media.image(url, 80)
+    b = media.image(url, 80)   # cache
+    c = media.image(url, 40)   # autre taille
+    srv.shutdown()
+
+    expected_requests = {"honor": 2, "ignore": 1, "reject": 2}[mode]
+    ok = (not a.isNull() and a is b and min(a.width(), a.height()) == 80
+          and min(c.width(), c.height()) == 40 and len(log) == expected_requests)
+    print(f"[{mode:6}] {'OK ' if ok else 'FAIL'} requêtes={len(log)} (attendu {expected_requests}) "
+          f"octets={sum(n for _, _, n in log)} stats={media.stats}")
+    for path, status, n in log:
+        print(f"         {status} {path} ({n} o)")
+    return ok
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--serve", choices=["honor", "ignore", "reject"])
+    ap.add_argument("--port", type=int, default=8765)
+    args = ap.parse_args()
+    app = QtGui.QGuiApplication.instance() or QtGui.QGuiApplication(sys.argv[:1])  # noqa: F841
+    if args.serve:
+        srv, log = make_server(args.serve, args.port)
+        print(f"Serveur de médias ({args.serve}) sur http://127.0.0.1:{args.port}/ — Ctrl+C pour arrêter")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            srv.shutdown()
+        return 0
+    results = [check(m) for m in ("honor", "ignore", "reject")]
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
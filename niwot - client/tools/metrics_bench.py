@@ -0,0 +1,66 @@
+# tools/metrics_bench.py
+"""
+Coût des mesures niwot_metrics (à garder négligeable : elles restent actives en production).
+
+    python tools/metrics_bench.py [--n 200000]
+
+Mesure le coût par appel de inc / observe / timed depuis le thread courant, puis sous
+contention (4 threads), et affiche un extrait de snapshot().
+"""
+from __future__ import annotations
+import argparse, os, sys, threading, time
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+
+import niwot_metrics  # noqa: E402
+
+
+def per_call_us(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) * 1e6 / n
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=200000)
+    args = ap.parse_args()
+    n = args.n
+
+    @niwot_metrics.timed("bench.ms")
+    def render():
+        pass
+
+    def bare():
+        pass
+
+    base = per_call_us(bare, n)
+    rows = [
+        ("inc (sans étiquette)", per_call_us(lambda: niwot_metrics.inc("bench.count"), n)),
+        ("inc (2 étiquettes)", per_call_us(lambda: niwot_metrics.inc("bench.count", event="quiz:question", x=1), n)),
+        ("observe (1 étiquette)", per_call_us(lambda: niwot_metrics.observe("bench.wait", 3.2, event="room:sync"), n)),
+        ("timed (décorateur)", per_call_us(render, n) - base),
+    ]
+
+    def worker():
+        for _ in range(n // 4):
+            niwot_metrics.inc("bench.threads", event="room:update")
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    rows.append(("inc, 4 threads", (time.perf_counter() - t0) * 1e6 / (n // 4 * 4)))
+
+    for label, us in rows:
+        print(f"  {label:<24} {us:6.2f} µs/appel")
+    print(f"  total bench.threads = {niwot_metrics.total('bench.threads'):.0f}")
+    print(f"  bench.ms : {niwot_metrics.histogram('bench.ms', fn=render.__qualname__)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
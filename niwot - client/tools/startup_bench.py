@@ -0,0 +1,120 @@
+# tools/startup_bench.py
+"""
+Profil de démarrage reproductible de main.py (QPA offscreen, sans réseau) :
+  - N lancements avec NIWOT_STARTUP_PROBE=1 -> temps jusqu'à la première frame
+    (dans le process, et depuis le lancement de l'interpréteur) ; médiane retenue
+  - 1 lancement avec -X importtime -> coût des imports avant la première frame,
+    imports les plus lourds, modules réseau chargés trop tôt
+  - comparaison au budget (tools/startup_budget.json) : code de sortie 1 si dépassé
+
+    python tools/startup_bench.py [--runs 5] [--budget tools/startup_budget.json] [--top 12]
+"""
+from __future__ import annotations
+import argparse, json, os, re, statistics, subprocess, sys, tempfile, time
+from typing import Dict, List, Optional, Tuple
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(HERE, "main.py")
+MARKER = "niwot-startup "
+_DATA_DIR = tempfile.mkdtemp(prefix="niwot-bench-")
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    env["NIWOT_STARTUP_PROBE"] = "1"
+    # pas de serveur : rien ne doit de toute façon partir avant la première frame
+    env["NIWOT_API_BASE"] = ""
+    env["NIWOT_WS_BASE"] = ""
+    env["NIWOT_DATA_DIR"] = _DATA_DIR  # vide : pas de session mémorisée -> écran de connexion
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return env
+
+
+def _launch(importtime: bool = False) -> Tuple[Dict[str, str], float, List[str]]:
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + [MAIN]
+    t_spawn = time.time()
+    p = subprocess.run(cmd, cwd=HERE, env=_env(), capture_output=True, text=True, timeout=120)
+    lines = p.stderr.splitlines()
+    for i, line in enumerate(lines):
+        if line.startswith(MARKER):
+            fields = dict(kv.split("=", 1) for kv in line[len(MARKER):].split())
+            wall = (float(fields["epoch"]) - t_spawn) * 1000.0
+            return fields, wall, lines[:i]
+    raise RuntimeError(f"pas de marqueur de première frame (code {p.returncode}) :\n{p.stderr[-2000:]}")
+
+
+def _imports(lines: List[str]) -> Tuple[float, List[Tuple[float, str]], List[str]]:
+    """(somme des temps 'self' en ms, [(cumulé ms, module racine)], tous les modules)"""
+    total_us = 0
+    tops: List[Tuple[float, str]] = []
+    mods: List[str] = []
+    for line in lines:
+        m = _IMPORT_LINE.match(line)
+        if not m:
+            continue
+        self_us, cum_us, indent, name = int(m.group(1)), int(m.group(2)), m.group(3), m.group(4)
+        total_us += self_us
+        mods.append(name)
+        if len(indent) <= 1:  # import de premier niveau
+            tops.append((cum_us / 1000.0, name))
+    tops.sort(reverse=True)
+    return total_us / 1000.0, tops, mods
+
+
+def _load_budget(path: Optional[str]) -> Dict:
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--budget", default=os.path.join(HERE, "tools", "startup_budget.json"))
+    ap.add_argument("--top", type=int, default=12)
+    args = ap.parse_args()
+
+    _launch()  # lancement à blanc : caches disque / .pyc
+    frame, wall = [], []
+    for _ in range(max(1, args.runs)):
+        fields, w, _ = _launch()
+        frame.append(float(fields["first_frame_ms"]))
+        wall.append(w)
+
+    _, _, lines = _launch(importtime=True)
+    import_ms, tops, mods = _imports(lines)
+
+    budget = _load_budget(args.budget)
+    forbidden = budget.get("forbidden_before_first_frame", [])
+    early = sorted({m for m in mods if m.split(".")[0] in forbidden})
+
+    result = {
+        "first_frame_ms": round(statistics.median(frame), 1),
+        "launch_to_first_frame_ms": round(statistics.median(wall), 1),
+        "import_ms_before_first_frame": round(import_ms, 1),
+    }
+    print(f"runs={len(frame)} (médianes)")
+    for k, v in result.items():
+        limit = budget.get(k)
+        print(f"  {k:<30} {v:>8.1f} ms" + (f"   budget {limit} ms" if limit is not None else ""))
+    print("imports de premier niveau les plus lourds (cumulé, avant première frame) :")
+    for cum, name in tops[:args.top]:
+        print(f"  {cum:8.1f} ms  {name}")
+    print("modules réseau avant première frame : " + (", ".join(early) if early else "aucun"))
+
+    failures = [f"{k} = {v} ms > {budget[k]} ms" for k, v in result.items()
+                if budget.get(k) is not None and v > budget[k]]
+    if early:
+        failures.append("chargés avant la première frame : " + ", ".join(early))
+    if failures:
+        print("BUDGET DÉPASSÉ :\n  " + "\n  ".join(failures))
+        return 1
+    print("budget respecté" if budget else "(pas de budget)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
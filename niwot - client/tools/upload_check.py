@@ -0,0 +1,290 @@
+# tools/upload_check.py
+"""
+Vérifie l'envoi découpé et reprenable (niwot_upload.ChunkedUpload) et la file d'envoi
+des propositions (niwot_outbox.Outbox) contre un serveur local de substitution qui coupe
+des connexions.
+
+    python tools/upload_check.py [--size-kb 3072] [--drop 0.25]
+    python tools/upload_check.py --serve --drop 0.3 --port 8767     # serveur seul
+
+Le serveur implémente /uploads, /uploads/<id>, /uploads/<id>/chunks/<i>,
+/uploads/<id>/complete et /suggest (multipart, uploadId, Idempotency-Key). Avec --drop p,
+chaque PUT de morceau a une probabilité p d'être coupé : la moitié avant lecture du corps,
+la moitié après enregistrement mais avant la réponse (acquittement perdu) ; de même pour
+les POST /suggest portant une clé.
+
+Scénarios : envoi sans coupure, envoi avec coupures, reprise après abandon (seuls les
+morceaux non acquittés repartent), suggestion complète (deliver_suggestion), serveur sans
+/uploads (repli multipart), file d'envoi durable (niwot_outbox) : serveur hors ligne puis
+de retour, POST /suggest coupés après enregistrement et dédoublonnés par Idempotency-Key.
+"""
+from __future__ import annotations
+import argparse, hashlib, json, os, random, socket, sys, tempfile, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("NIWOT_DATA_DIR", tempfile.mkdtemp(prefix="niwot-upload-"))
+
+
+def make_server(drop: float = 0.0, port: int = 0, chunked: bool = True):
+    rnd = random.Random(1)
+    state: Dict[str, Any] = {"uploads": {}, "suggestions": [], "keys": set(), "replays": 0, "puts": 0, "dropped": 0,
+                             "down": False}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *a):
+            pass
+
+        def _json(self, status: int, obj) -> None:
+            body = json.dumps(obj).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _body(self) -> bytes:
+            return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        def _cut(self) -> None:
+            self.close_connection = True
+            try:
+                self.connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+        def do_POST(self):
+            parts = self.path.strip("/").split("/")
+            if parts == ["suggest"]:
+                body = self._body()
+                if state["down"]:
+                    return self._cut()
+                key = self.headers.get("Idempotency-Key")
+                with lock:
+                    replay = key is not None and key in state["keys"]
+                    state["replays"] += replay
+                    state["keys"].add(key)
+                    if not replay:
+                        state["suggestions"].append(body)
+                if key is not None and rnd.random() < drop:
+                    return self._cut()  # enregistrée, acquittement perdu : le renvoi doit être dédoublonné
+                return self._json(200 if replay else 201, {"ok": True})
+            if not chunked or parts[0] != "uploads":
+                self._body()
+                return self._json(404, {"error": "not found"})
+            if len(parts) == 1:
+                d = json.loads(self._body() or b"{}")
+                uid = hashlib.sha1(os.urandom(8)).hexdigest()[:12]
+                with lock:
+                    state["uploads"][uid] = {"size": d["size"], "sha256": d["sha256"], "chunkSize": d["chunkSize"],
+                                             "chunks": {}, "complete": False}
+                return self._json(201, {"uploadId": uid, "chunkSize": d["chunkSize"], "received": []})
+            up = state["uploads"].get(parts[1])
+            if up is None:
+                return self._json(404, {"error": "unknown upload"})
+            data = b"".join(up["chunks"][i] for i in sorted(up["chunks"]))
+            if len(data) != up["size"] or hashlib.sha256(data).hexdigest() != up["sha256"]:
+                return self._json(422, {"error": "incomplete or corrupt"})
+            up["complete"] = True
+            return self._json(200, {"uploadId": parts[1]})
+
+        def do_GET(self):
+            parts = self.path.strip("/").split("/")
+            up = state["uploads"].get(parts[1]) if len(parts) == 2 and parts[0] == "uploads" else None
+            if up is None:
+                return self._json(404, {"error": "not found"})
+            self._json(200, {"received": sorted(up["chunks"]), "complete": up["complete"]})
+
+        def do_PUT(self):
+            parts = self.path.strip("/").split("/")
+            up = state["uploads"].get(parts[1]) if len(parts) == 4 else None
+            with lock:
+                state["puts"] += 1
+                r = rnd.random()
+                cut = state["down"] or r < drop
+                if cut:
+                    state["dropped"] += 1
+            if state["down"] or (cut and r < drop / 2):
+                return self._cut()  # coupé avant lecture du corps
+            body = self._body()
+            if up is None:
+                return self._json(404, {"error": "unknown upload"})
+            if hashlib.sha256(body).hexdigest() != self.headers.get("X-Chunk-Sha256"):
+                return self._json(422, {"error": "checksum"})
+            with lock:
+                up["chunks"][int(parts[3])] = body
+            if cut:
+                return self._cut()  # enregistré, mais l'acquittement se perd
+            self.send_response(204)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    srv = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    srv.state = state
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+class _Client:
+    """Sous-ensemble de NiwotClient utilisé par ChunkedUpload (sans Qt)."""
+
+    def __init__(self, api: str):
+        import requests
+        self.api_base = api
+        self.sess = requests.Session()
+
+    def _set_auth_header_if_needed(self):
+        pass
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--size-kb", type=int, default=3072)
+    ap.add_argument("--drop", type=float, default=0.25, help="probabilité de couper un PUT de morceau")
+    ap.add_argument("--serve", action="store_true", help="lancer seulement le serveur")
+    ap.add_argument("--port", type=int, default=0)
+    args = ap.parse_args()
+
+    if args.serve:
+        srv = make_server(args.drop, args.port)
+        print(f"serveur http://127.0.0.1:{srv.server_address[1]} (coupures {args.drop:.0%})")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            return 0
+
+    import niwot_upload
+    from niwot_upload import ChunkedUpload, UploadError, UploadUnsupported
+
+    niwot_upload.RETRY_BASE_S = 0.01  # pas d'attente réelle entre deux tentatives ici
+    niwot_upload.RETRY_MAX_S = 0.1
+    niwot_upload.STALL_TIMEOUT_S = 1.0
+    path = os.path.join(os.environ["NIWOT_DATA_DIR"], "image.bin")
+    with open(path, "wb") as f:
+        f.write(os.urandom(args.size_kb * 1024))
+    sha = niwot_upload.file_sha256(path)
+    size = os.path.getsize(path)
+    ok = True
+
+    def check(label: str, cond: bool, detail: str = ""):
+        nonlocal ok
+        ok &= cond
+        print(f"  [{'ok' if cond else 'ÉCHEC'}] {label}" + (f" — {detail}" if detail else ""))
+
+    def assembled(srv, uid: str) -> str:
+        up = srv.state["uploads"][uid]
+        return hashlib.sha256(b"".join(up["chunks"][i] for i in sorted(up["chunks"]))).hexdigest()
+
+    print(f"fichier {size // 1024} Kio, morceaux de {niwot_upload.CHUNK_SIZE // 1024} Kio, {niwot_upload.PARALLEL} en vol")
+
+    # 1. sans coupure
+    srv = make_server(0.0)
+    up = ChunkedUpload(_Client(f"http://127.0.0.1:{srv.server_address[1]}"), path)
+    uid = up.run()
+    check("sans coupure", assembled(srv, uid) == sha and up.sent_bytes == size,
+          f"{up.sent_bytes // 1024} Kio envoyés")
+    up.forget()
+    srv.shutdown()
+
+    # 2. coupures aléatoires : renvoi des seuls morceaux touchés
+    srv = make_server(args.drop)
+    up = ChunkedUpload(_Client(f"http://127.0.0.1:{srv.server_address[1]}"), path)
+    uid = up.run()
+    check(f"coupures {args.drop:.0%}", assembled(srv, uid) == sha,
+          f"{srv.state['dropped']}/{srv.state['puts']} PUT coupés, {up.sent_bytes // 1024} Kio envoyés")
+    up.forget()
+    srv.shutdown()
+
+    # 3. abandon puis reprise : seuls les morceaux non acquittés repartent
+    srv = make_server(0.0)
+    api = f"http://127.0.0.1:{srv.server_address[1]}"
+    up = ChunkedUpload(_Client(api), path, parallel=1)
+
+    def fail_midway(done: int, total: int):
+        if done >= total // 2 and not srv.state["down"]:
+            srv.state["down"] = True  # le serveur coupe tout à partir de la moitié
+
+    up._progress = fail_midway
+    try:
+        up.run()
+        check("abandon à mi-parcours", False, "aucune erreur levée")
+    except UploadError as e:
+        check("abandon à mi-parcours", True, str(e)[:70])
+    srv.state["down"] = False
+    up2 = ChunkedUpload(_Client(api), path)
+    uid = up2.run()
+    check("reprise", assembled(srv, uid) == sha and up2.resumed_bytes > 0 and up2.sent_bytes == size - up2.resumed_bytes,
+          f"{up2.resumed_bytes // 1024} Kio déjà acquittés, {up2.sent_bytes // 1024} Kio renvoyés")
+
+    # 4. suggestion complète (deliver_suggestion) : le POST /suggest cite l'uploadId
+    from PySide6 import QtCore
+    from niwot_outbox import Outbox, deliver_suggestion
+    app = QtCore.QCoreApplication(sys.argv[:1])
+    fields = {"text": "Q", "type": "IMAGE", "answer": "R", "explanation": "E", "categoryIds": "[1]"}
+    deliver_suggestion(_Client(api), "k-direct", fields, path)
+    body = srv.state["suggestions"][-1]
+    check("POST /suggest avec uploadId", fields.get("uploadId") == uid and uid.encode() in body
+          and len(body) < 4096, f"{len(body)} octets de multipart")
+    check("session oubliée après /suggest", not niwot_upload._load_state())
+    srv.shutdown()
+
+    # 5. serveur sans /uploads : repli multipart
+    srv = make_server(0.0, chunked=False)
+    c = _Client(f"http://127.0.0.1:{srv.server_address[1]}")
+    try:
+        ChunkedUpload(c, path).run()
+        check("serveur sans /uploads", False)
+    except UploadUnsupported:
+        check("serveur sans /uploads -> UploadUnsupported", not niwot_upload.chunked_available(c, path))
+    fields = {"text": "Q", "type": "IMAGE", "answer": "R", "explanation": "E", "categoryIds": "[1]"}
+    deliver_suggestion(c, "k-multipart", fields, path)
+    check("repli multipart", len(srv.state["suggestions"][-1]) > size, "fichier joint au POST /suggest")
+    srv.shutdown()
+
+    # 6. file durable : serveur hors ligne -> en attente ; retour -> envoyées une seule fois
+    import niwot_outbox
+    niwot_outbox.BACKOFF_BASE_S = 0.05
+    srv = make_server(args.drop)
+    srv.state["down"] = True
+    c = _Client(f"http://127.0.0.1:{srv.server_address[1]}")
+    outbox = Outbox(c)
+    pending = []
+    outbox.sig_pending.connect(pending.append)
+
+    def pump(cond, timeout: float = 30.0) -> bool:
+        end = time.monotonic() + timeout
+        while time.monotonic() < end and not cond():
+            app.processEvents()
+            time.sleep(0.005)
+        return cond()
+
+    outbox.start("u1")
+    pump(lambda: pending, 5.0)  # start() nettoie les copies sur le thread d'E/S : enqueue() après
+    keys = [outbox.enqueue({"text": f"Q{i}", "type": "IMAGE", "answer": "R", "explanation": "E",
+                            "categoryIds": "[1]"}, path) for i in range(3)]
+    outbox.kick()
+
+    pump(lambda: outbox._exec("SELECT MAX(attempts) FROM outbox")[0][0] >= 2, 10.0)
+    check("hors ligne : gardées en file", outbox.pending_count() == 3 and not srv.state["suggestions"],
+          f"{outbox._exec('SELECT MAX(attempts) FROM outbox')[0][0]} essais, en attente {pending[-1]}")
+    srv.state["down"] = False
+    pump(lambda: outbox.pending_count() == 0 and pending[-1] == 0)
+    sent_keys = srv.state["keys"] & set(keys)
+    check("retour du serveur : envoyées une seule fois", outbox.pending_count() == 0 and len(sent_keys) == 3
+          and len(srv.state["suggestions"]) == 3 and pending[-1] == 0,
+          f"{len(srv.state['suggestions'])} reçues, {srv.state['replays']} renvoi(s) dédoublonné(s)")
+    check("copies d'images supprimées", not os.listdir(os.path.join(os.environ["NIWOT_DATA_DIR"], niwot_outbox.STAGING_DIR)))
+    srv.shutdown()
+
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,10 @@
 # ui_admin.py
 from __future__ import annotations
 from PySide6 import QtWidgets
-from typing import Optional, Dict, Any
-from niwot_client import NiwotClient
+from typing import Optional, Dict, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from niwot_client import NiwotClient
 
 class AdminWidget(QtWidgets.QWidget):
     def __init__(self):
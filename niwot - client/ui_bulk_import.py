@@ -0,0 +1,218 @@
+# ui_bulk_import.py
+from __future__ import annotations
+import os, time
+from typing import Any, Dict, List, Optional
+
+from PySide6 import QtWidgets
+
+import niwot_tasks
+from niwot_categories import fetch_categories
+from niwot_import import (DONE_BEFORE, FAILED, INVALID, READY, SENDING, SENT,
+                          ImportModel, ImportRunner, load_import)
+from ui_theme import role, set_state
+
+
+def _load(path: str, client, categories: List[Dict[str, Any]], image_dir: str):
+    """
+    Thread worker : catalogue (requête si encore inconnu) puis lecture et validation du fichier.
+    Renvoie (catalogue requêté ou None, résultat de load_import).
+    """
+    fetched = None
+    if not categories:
+        try:
+            fetched = categories = fetch_categories(client)
+        except Exception:
+            categories = []
+    return fetched, load_import(path, categories, image_dir)
+
+
+class BulkImportDialog(QtWidgets.QDialog):
+    """
+    Import en masse de propositions : fichier CSV/JSON (+ dossier d'images), validation
+    locale de toutes les lignes, puis envoi en parallèle borné avec statut par ligne.
+    """
+
+    def __init__(self, client, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Import en masse")
+        self.resize(760, 560)
+        self._client = client
+        self._path: Optional[str] = None
+        self._image_dir: Optional[str] = None
+        self._load_task: Optional[niwot_tasks.Task] = None
+
+        lay = QtWidgets.QVBoxLayout(self)
+        lay.setContentsMargins(16, 16, 16, 16)
+        lay.setSpacing(10)
+
+        form = QtWidgets.QFormLayout()
+        file_row = QtWidgets.QHBoxLayout()
+        self.inp_file = QtWidgets.QLineEdit()
+        self.inp_file.setReadOnly(True)
+        self.inp_file.setPlaceholderText("CSV (séparateur , ou ;) ou JSON")
+        btn_file = QtWidgets.QPushButton("Choisir…")
+        btn_file.clicked.connect(self._pick_file)
+        file_row.addWidget(self.inp_file, 1)
+        file_row.addWidget(btn_file)
+        form.addRow("Fichier", file_row)
+        dir_row = QtWidgets.QHBoxLayout()
+        self.inp_dir = QtWidgets.QLineEdit()
+        self.inp_dir.setReadOnly(True)
+        self.inp_dir.setPlaceholderText("Par défaut : le dossier du fichier")
+        btn_dir = QtWidgets.QPushButton("Choisir…")
+        btn_dir.clicked.connect(self._pick_dir)
+        dir_row.addWidget(self.inp_dir, 1)
+        dir_row.addWidget(btn_dir)
+        form.addRow("Images", dir_row)
+        lay.addLayout(form)
+
+        hint = role(QtWidgets.QLabel(
+            "Colonnes : question, type (CITATION/IMAGE), citation, image, réponse, "
+            "alternatives, explication, catégories (noms ou ids séparés par | ou ;)."), "hint")
+        hint.setWordWrap(True)
+        lay.addWidget(hint)
+
+        self.model = ImportModel(self)
+        self.runner = ImportRunner(client, self.model, self)
+        self.runner.sig_progress.connect(self._update_stats)
+        self.runner.sig_finished.connect(self._on_finished)
+
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.setShowGrid(False)
+        self.table.setWordWrap(False)
+        vh = self.table.verticalHeader()
+        vh.setVisible(False)
+        vh.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        vh.setDefaultSectionSize(26)
+        hh = self.table.horizontalHeader()
+        hh.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
+        for col, width in ((0, 56), (2, 80), (3, 140), (4, 220)):
+            hh.resizeSection(col, width)
+        lay.addWidget(self.table, 1)
+
+        self.lbl_stats = role(QtWidgets.QLabel(""), "caption")
+        lay.addWidget(self.lbl_stats)
+        self.lbl_msg = QtWidgets.QLabel("")
+        self.lbl_msg.setWordWrap(True)
+        lay.addWidget(self.lbl_msg)
+
+        btns = QtWidgets.QHBoxLayout()
+        btns.addStretch()
+        self.btn_send = QtWidgets.QPushButton("Envoyer")
+        self.btn_send.clicked.connect(self._start)
+        self.btn_stop = QtWidgets.QPushButton("Arrêter")
+        self.btn_stop.clicked.connect(self.runner.stop)
+        btn_close = QtWidgets.QPushButton("Fermer")
+        btn_close.clicked.connect(self.reject)
+        for b in (self.btn_send, self.btn_stop, btn_close):
+            btns.addWidget(b)
+        lay.addLayout(btns)
+        self._update_buttons()
+
+    # ---------- Fichier ----------
+    def _pick_file(self):
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Fichier de questions", "",
+                                                        "Questions (*.csv *.json);;Tous les fichiers (*.*)")
+        if path:
+            self.load(path)
+
+    def _pick_dir(self):
+        folder = QtWidgets.QFileDialog.getExistingDirectory(self, "Dossier des images",
+                                                            self._image_dir or "")
+        if folder:
+            self._image_dir = folder
+            self.inp_dir.setText(folder)
+            if self._path:
+                self.load(self._path)
+
+    def load(self, path: str, image_dir: Optional[str] = None):
+        """Lit et valide le fichier en tâche de fond ; rien n'est envoyé avant « Envoyer »."""
+        if self.runner.running:
+            return
+        if image_dir:
+            self._image_dir = image_dir
+            self.inp_dir.setText(image_dir)
+        self._path = path
+        self.inp_file.setText(path)
+        if self._load_task is not None:
+            self._load_task.cancel()
+        self._set_msg("info", "Lecture du fichier…")
+        self._load_task = niwot_tasks.submit(_load, path, self._client, self._client.categories.items(),
+                                             self._image_dir or os.path.dirname(path),
+                                             on_done=self._on_loaded)
+
+    def _on_loaded(self, res: Any, err: Optional[Exception]):
+        self._load_task = None
+        if err is not None:
+            self.model.set_rows([])
+            self._set_msg("error", f"Fichier illisible : {err}")
+        else:
+            fetched, (rows, file_key, journal) = res
+            if fetched:
+                self._client.categories.accept(fetched)
+            self.model.set_rows(rows)
+            self.runner.attach(file_key, journal)
+            invalid = self.model.count(INVALID)
+            if not rows:
+                self._set_msg("error", "Aucune ligne dans le fichier.")
+            elif invalid:
+                self._set_msg("error", f"{invalid} ligne(s) invalide(s) : corrigez le fichier ou "
+                                       "envoyez seulement les lignes valides.")
+            else:
+                self._set_msg("ok", "Toutes les lignes sont valides.")
+        self._update_stats()
+
+    # ---------- Envoi ----------
+    def _start(self):
+        if not self.model.count(READY, FAILED):
+            return
+        self._set_msg("info", "")
+        self.runner.start()
+        self._update_buttons()
+
+    def _on_finished(self):
+        failed = self.model.count(FAILED)
+        if failed:
+            self._set_msg("error", f"{failed} ligne(s) en échec : « Reprendre » les renvoie.")
+        elif not self.model.count(READY):
+            self._set_msg("ok", "Import terminé.")
+        self._update_buttons()
+
+    def _update_stats(self):
+        m, r = self.model, self.runner
+        total, sent = len(m.rows), m.count(SENT, DONE_BEFORE)
+        parts = [f"{total} ligne(s)", f"{sent} envoyée(s)", f"{m.count(READY, SENDING)} à envoyer",
+                 f"{m.count(INVALID)} invalide(s)", f"{m.count(FAILED)} en échec"]
+        rate = r.throughput()
+        if r.running and rate > 0:
+            left = m.count(READY, SENDING)
+            parts.append(f"{rate:.0f}/min · reste ≈ {left * 60 / rate:.0f} s")
+        elif r.sent_now and r.started_at:
+            parts.append(f"{r.sent_now} en {time.monotonic() - r.started_at:.1f} s")
+        self.lbl_stats.setText(" · ".join(parts) if total else "")
+        self._update_buttons()
+
+    def _update_buttons(self):
+        running = self.runner.running
+        self.btn_send.setText("Reprendre" if self.model.count(FAILED) else "Envoyer")
+        self.btn_send.setEnabled(not running and self._load_task is None and bool(self.model.count(READY, FAILED)))
+        self.btn_stop.setEnabled(running)
+
+    def _set_msg(self, state: str, text: str):
+        set_state(self.lbl_msg, "status", state)
+        self.lbl_msg.setText(text)
+
+    def reject(self):
+        if self.runner.running:
+            ok = QtWidgets.QMessageBox.question(
+                self, "Import en cours", "Arrêter l'import ? Les lignes déjà envoyées ne le seront "
+                "pas deux fois si vous rouvrez le même fichier.")
+            if ok != QtWidgets.QMessageBox.Yes:
+                return
+        self.runner.cancel()
+        if self._load_task is not None:
+            self._load_task.cancel()
+        super().reject()
@@ -0,0 +1,78 @@
+# ui_category_picker.py
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List
+
+from PySide6 import QtCore, QtWidgets
+
+from niwot_categories import CategoryFilterProxy, CategoryModel
+from ui_theme import role
+
+
+class CategoryPicker(QtWidgets.QWidget):
+    """
+    Choix de catégories : recherche, liste virtualisée (seules les lignes visibles
+    sont peintes, Espace coche), « Tout » / « Aucune » sur les catégories affichées par le filtre.
+
+    Signals:
+      - sig_selection_changed(count: int)
+    """
+    sig_selection_changed = QtCore.Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.model = CategoryModel(self)
+        self.proxy = CategoryFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+
+        lay = QtWidgets.QVBoxLayout(self)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.setSpacing(6)
+
+        top = QtWidgets.QHBoxLayout()
+        self.inp_search = QtWidgets.QLineEdit()
+        self.inp_search.setPlaceholderText("Rechercher une catégorie…")
+        self.inp_search.setClearButtonEnabled(True)
+        self.inp_search.textChanged.connect(self.proxy.set_query)
+        top.addWidget(self.inp_search, 1)
+        self.btn_all = QtWidgets.QPushButton("Tout")
+        self.btn_none = QtWidgets.QPushButton("Aucune")
+        self.btn_all.clicked.connect(lambda: self._select_visible(True))
+        self.btn_none.clicked.connect(lambda: self._select_visible(False))
+        top.addWidget(self.btn_all)
+        top.addWidget(self.btn_none)
+        lay.addLayout(top)
+
+        self.view = QtWidgets.QListView()
+        self.view.setModel(self.proxy)
+        self.view.setUniformItemSizes(True)  # hauteur fixe : pas de mesure ligne par ligne
+        self.view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.view.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        lay.addWidget(self.view, 1)
+
+        self.lbl_count = role(QtWidgets.QLabel(""), "caption")
+        lay.addWidget(self.lbl_count)
+        self.model.sig_selection_changed.connect(self._on_selection_changed)
+        self._on_selection_changed(0)
+
+    # --- API ---
+    def set_categories(self, cats: List[Dict[str, Any]]):
+        self.model.set_categories(cats)
+        self._on_selection_changed(len(self.model.selected()))
+
+    def set_selected(self, ids: Iterable[Any]):
+        self.model.set_selected(ids)
+
+    def selected(self) -> List[Any]:
+        return self.model.selected()
+
+    # --- interne ---
+    def _select_visible(self, on: bool):
+        if self.proxy.query:
+            self.model.select(self.proxy.visible_ids(), on)
+        else:
+            self.model.select_all(on)
+
+    def _on_selection_changed(self, count: int):
+        total = self.model.rowCount()
+        self.lbl_count.setText(f"{count} / {total} sélectionnée(s)" if total else "")
+        self.sig_selection_changed.emit(count)
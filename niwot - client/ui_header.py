@@ -1,15 +1,12 @@
 # ui_header.py
 from __future__ import annotations
-import os, sys, base64
+import base64
 from typing import Optional, Dict, Any
 
 from PySide6 import QtWidgets, QtCore, QtGui
-
-
-def resource_path(name: str) -> str:
-    """Chemin d'une ressource packagée (PyInstaller) ou en dev."""
-    base = getattr(sys, "_MEIPASS", os.path.dirname(__file__))
-    return os.path.join(base, name)
+from niwot_media import variant_side
+from niwot_assets import fallback_avatar, fit
+from ui_theme import role
 
 
 class HeaderWidget(QtWidgets.QWidget):
@@ -56,10 +53,15 @@ class HeaderWidget(QtWidgets.QWidget):
 
         self.lbl_user = QtWidgets.QLabel("Connecté en tant que -")
 
+        # propositions en file d'envoi (niwot_outbox), masqué à 0
+        self.lbl_outbox = role(QtWidgets.QLabel(""), "caption")
+        self.lbl_outbox.setVisible(False)
+
         self.btn_profile = QtWidgets.QPushButton("Mon profil")
         self.btn_profile.clicked.connect(self.sig_go_profile.emit)
 
         right_w = QtWidgets.QWidget(); right_w.setLayout(right)
+        right.addWidget(self.lbl_outbox)
         right.addWidget(self.lbl_avatar)
         right.addWidget(self.lbl_user)
         right.addWidget(self.btn_profile)
@@ -79,8 +81,13 @@ class HeaderWidget(QtWidgets.QWidget):
         except Exception:
             self._api_base = ""
 
-    def set_user(self, user: Dict[str, Any] | None):
-        """Appelé après login / /me."""
+    def set_pending(self, count: int):
+        self.lbl_outbox.setVisible(count > 0)
+        self.lbl_outbox.setText(f"{count} proposition(s) en attente d'envoi")
+        self.lbl_outbox.setToolTip("Envoi automatique dès que le serveur répond")
+
+    def set_user(self, user: Dict[str, Any] | None, load_avatar: bool = True):
+        """Appelé après login / /me. load_avatar=False : avatar par défaut, sans requête réseau."""
         self._user = user or None
         username = (user or {}).get("username") or (user or {}).get("email") or "-"
         self.lbl_user.setText(f"Connecté en tant que {username}")
@@ -99,7 +106,7 @@ class HeaderWidget(QtWidgets.QWidget):
             if not avatar_val:
                 avatar_val = user.get("profileImage") or user.get("avatarUrl") or user.get("avatar") or user.get("imageUrl") or user.get("picture")
 
-        if avatar_val:
+        if avatar_val and load_avatar:
             pm = self._load_avatar_from_value(avatar_val)
             if pm is not None:
                 self._set_avatar_pixmap(pm)
@@ -109,14 +116,11 @@ class HeaderWidget(QtWidgets.QWidget):
 
     # ---------- helpers ----------
     def _set_avatar_pixmap(self, pm: QtGui.QPixmap):
-        scaled = pm.scaled(28, 28, QtCore.Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                           QtCore.Qt.TransformationMode.SmoothTransformation)
-        self.lbl_avatar.setPixmap(scaled)
+        self.lbl_avatar.setPixmap(fit(pm, 28, self.devicePixelRatioF()))
 
     def _fallback_avatar_pixmap(self) -> QtGui.QPixmap:
-        """Charge niwotfren.png comme avatar par défaut (embarqué via --add-data)."""
-        path = resource_path("niwotfren.png")
-        pm = QtGui.QPixmap(path)
+        """Avatar par défaut niwotfren (registre partagé niwot_assets, déjà en 28 px)."""
+        pm = fallback_avatar(28, self.devicePixelRatioF())
         if not pm.isNull():
             return pm
         # dernier recours : petite pastille unie
@@ -152,15 +156,14 @@ class HeaderWidget(QtWidgets.QWidget):
             except Exception:
                 return None
 
-        # 2) HTTP/relatif via session (cookies)
+        # 2) HTTP/relatif via session (cookies), variante à la taille affichée
         url = self._resolve_media_url(raw)
-        if url and self._client:
+        media = getattr(self._client, "media", None)
+        if url and media:
             try:
-                r = self._client.sess.get(url, timeout=6)  # type: ignore
-                if r.ok:
-                    img = QtGui.QImage.fromData(r.content)
-                    if not img.isNull():
-                        return QtGui.QPixmap.fromImage(img)
+                img = media.image(url, variant_side(28, self.devicePixelRatioF()))
+                if not img.isNull():
+                    return QtGui.QPixmap.fromImage(img)
             except Exception:
                 return None
 
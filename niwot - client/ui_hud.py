@@ -0,0 +1,312 @@
+# ui_hud.py
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+
+from PySide6 import QtWidgets, QtCore, QtGui
+
+
+COLOR_TEXT = QtGui.QColor("#bfc7ff")
+COLOR_ACCENT = QtGui.QColor("#8ea0ff")
+COLOR_STRONG = QtGui.QColor("#e8ebff")
+COLOR_OK = QtGui.QColor("#69f0ae")
+COLOR_MUTED = QtGui.QColor("#9aa0c6")
+
+# (texte, police: "text" | "mono" | "bold", couleur)
+Run = Tuple[str, str, QtGui.QColor]
+
+
+class _Fonts:
+    def __init__(self, base: QtGui.QFont):
+        self.text = QtGui.QFont(base)
+        self.mono = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont)
+        if base.pointSizeF() > 0:
+            self.mono.setPointSizeF(base.pointSizeF())
+        self.bold = QtGui.QFont(base)
+        self.bold.setBold(True)
+
+    def get(self, kind: str) -> QtGui.QFont:
+        return getattr(self, kind, self.text)
+
+
+class _StaticTextCache:
+    """QStaticText préparés (glyphes mis en forme une fois), réutilisés d'un rendu à l'autre."""
+    def __init__(self, limit: int = 128):
+        self._limit = limit
+        self._items: Dict[Tuple[str, str], QtGui.QStaticText] = {}
+
+    def get(self, text: str, kind: str, font: QtGui.QFont) -> QtGui.QStaticText:
+        key = (text, kind)
+        st = self._items.get(key)
+        if st is None:
+            if len(self._items) >= self._limit:
+                self._items.clear()
+            st = QtGui.QStaticText(text)
+            st.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+            st.setPerformanceHint(QtGui.QStaticText.PerformanceHint.AggressiveCaching)
+            st.prepare(QtGui.QTransform(), font)
+            self._items[key] = st
+        return st
+
+
+class QuizHud(QtWidgets.QWidget):
+    """
+    Bandeau du quiz peint à la main (remplace les QLabel RichText) :
+      - à gauche : Salle CODE • Objectif : N pts
+      - à droite : Score : N pts   Hôte : nom   Temps restant : Ns
+    Le texte est mis en cache (QStaticText) ; un changement de seconde ou de score ne
+    repeint que la zone concernée.
+    """
+    GAP = 16
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
+        super().__init__(parent)
+        self._fonts = _Fonts(self.font())
+        self._cache = _StaticTextCache()
+        self._code = ""
+        self._target: Optional[int] = None
+        self._host = "—"
+        self._score: Optional[int] = None
+        self._seconds: Optional[int] = None
+        self._placed: List[Tuple[str, QtGui.QStaticText, QtGui.QColor, QtCore.QPointF, QtCore.QRectF]] = []
+        self._zones: Dict[str, QtCore.QRectF] = {}
+        self._seconds_idx = -1
+        self._dirty_layout = True
+        fm = QtGui.QFontMetrics(self._fonts.bold)
+        self._line_h = fm.height()
+        # emplacement fixe pour le compte à rebours : pas de re-layout quand le nombre de chiffres change
+        self._seconds_w = QtGui.QFontMetricsF(self._fonts.mono).horizontalAdvance("000s")
+        self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        self.setMinimumHeight(self._line_h + 4)
+
+    def sizeHint(self) -> QtCore.QSize:
+        return self.minimumSizeHint()
+
+    def minimumSizeHint(self) -> QtCore.QSize:
+        # largeur du contenu : gauche + droite + un espace, compte à rebours à largeur fixe
+        w = 0.0
+        for zone, (text, kind, _) in self._left_runs() + [("", ("", "gap", COLOR_TEXT))] + self._right_runs():
+            if kind == "gap":
+                w += self.GAP
+                continue
+            tw = self._cache.get(text, kind, self._fonts.get(kind)).size().width()
+            w += max(tw, self._seconds_w) if zone == "seconds" else tw
+        return QtCore.QSize(int(w) + 1, self._line_h + 4)
+
+    # ---------- API ----------
+    def set_room(self, code: str, target: Optional[int]):
+        if code == self._code and target == self._target:
+            return
+        self._code, self._target = code, target
+        self._invalidate()
+
+    def set_host(self, name: str):
+        if name == self._host:
+            return
+        self._host = name
+        self._invalidate()
+
+    def set_score(self, points: Optional[int]):
+        if points == self._score:
+            return
+        had = self._score is not None
+        old = self._zones.get("score")
+        self._score = points
+        if had != (points is not None) or self._dirty_layout:
+            self._invalidate()
+            return
+        self._relayout()
+        self._update_zone(old, self._zones.get("score"))
+
+    def set_seconds(self, seconds: Optional[int]):
+        if seconds == self._seconds:
+            return
+        had = self._seconds is not None
+        self._seconds = seconds
+        if had != (seconds is not None) or self._dirty_layout or self._seconds_idx < 0:
+            self._invalidate()
+            return
+        # emplacement de largeur fixe : on remplace seulement le texte du compte à rebours
+        kind, _, color, pos, rect = self._placed[self._seconds_idx]
+        self._placed[self._seconds_idx] = (kind, self._cache.get(f"{seconds}s", kind, self._fonts.get(kind)), color, pos, rect)
+        self._update_zone(rect)
+
+    # ---------- layout ----------
+    def _invalidate(self):
+        self._dirty_layout = True
+        self.updateGeometry()
+        self.update()
+
+    def _update_zone(self, *zones: Optional[QtCore.QRectF]):
+        for z in zones:
+            if z is not None:
+                self.update(z.toAlignedRect().adjusted(-1, -1, 1, 1))
+
+    def _left_runs(self) -> List[Tuple[str, Run]]:
+        runs: List[Tuple[str, Run]] = [("", ("Salle ", "text", COLOR_TEXT)), ("", (self._code, "mono", COLOR_TEXT))]
+        if self._target is not None:
+            runs += [("", (" • ", "text", COLOR_ACCENT)), ("", ("Objectif : ", "text", COLOR_TEXT)),
+                     ("", (f"{self._target} pts", "mono", COLOR_TEXT))]
+        return runs
+
+    def _right_runs(self) -> List[Tuple[str, Run]]:
+        runs: List[Tuple[str, Run]] = []
+        if self._score is not None:
+            runs += [("score", ("Score : ", "text", COLOR_TEXT)), ("score", (f"{self._score} pts", "mono", COLOR_TEXT)),
+                     ("", ("", "gap", COLOR_TEXT))]
+        runs += [("", ("Hôte : ", "text", COLOR_TEXT)), ("", (self._host, "bold", COLOR_TEXT)), ("", ("", "gap", COLOR_TEXT))]
+        if self._seconds is None:
+            runs.append(("", ("En attente du quiz…", "text", COLOR_TEXT)))
+        else:
+            runs += [("", ("Temps restant : ", "text", COLOR_TEXT)), ("seconds", (f"{self._seconds}s", "mono", COLOR_TEXT))]
+        return runs
+
+    def _relayout(self):
+        self._placed = []
+        self._zones = {}
+        self._seconds_idx = -1
+        h = float(self.height())
+
+        def place(zone: str, run: Run, x: float) -> float:
+            text, kind, color = run
+            st = self._cache.get(text, kind, self._fonts.get(kind))
+            size = st.size()
+            w = size.width()
+            if zone == "seconds":
+                w = max(w, self._seconds_w)
+            y = (h - size.height()) / 2.0
+            rect = QtCore.QRectF(x, y, w, size.height())
+            self._placed.append((kind, st, color, QtCore.QPointF(x, y), rect))
+            if zone == "seconds":
+                self._seconds_idx = len(self._placed) - 1
+            if zone:
+                self._zones[zone] = self._zones[zone].united(rect) if zone in self._zones else rect
+            return w
+
+        x = 0.0
+        for zone, run in self._left_runs():
+            x += place(zone, run, x)
+
+        # côté droit : placé depuis le bord droit pour que seul le score bouge quand il change de largeur
+        right = self._right_runs()
+        widths = []
+        for zone, (text, kind, _) in right:
+            if kind == "gap":
+                widths.append(float(self.GAP))
+                continue
+            w = self._cache.get(text, kind, self._fonts.get(kind)).size().width()
+            widths.append(max(w, self._seconds_w) if zone == "seconds" else w)
+        x = float(self.width()) - sum(widths)
+        for (zone, run), w in zip(right, widths):
+            if run[1] != "gap":
+                place(zone, run, x)
+            x += w
+        self._dirty_layout = False
+
+    # ---------- Qt ----------
+    def resizeEvent(self, e: QtGui.QResizeEvent):
+        super().resizeEvent(e)
+        self._dirty_layout = True
+
+    def paintEvent(self, e: QtGui.QPaintEvent):
+        if self._dirty_layout:
+            self._relayout()
+        clip = QtCore.QRectF(e.rect())
+        p = QtGui.QPainter(self)
+        for kind, st, color, pos, rect in self._placed:
+            if not rect.intersects(clip):
+                continue
+            p.setFont(self._fonts.get(kind))
+            p.setPen(color)
+            p.drawStaticText(pos, st)
+        p.end()
+
+
+class ResultPanel(QtWidgets.QWidget):
+    """
+    Correction affichée après une question, peinte à partir de QStaticText
+    (remplace le QLabel RichText) : bonne réponse, premier trouvé, explication, mention de suite.
+    """
+    SPACING = 6
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
+        super().__init__(parent)
+        self._fonts = _Fonts(self.font())
+        self._small = QtGui.QFont(self.font())
+        self._small.setPixelSize(12)
+        self._lines: List[Tuple[List[Run], bool]] = []  # (runs, retour à la ligne autorisé)
+        self._prepared: List[Tuple[QtGui.QStaticText, QtGui.QFont, QtGui.QColor]] = []
+        self._prepared_w = -1
+
+    def set_result(self, correct, first, explanation):
+        lines: List[Tuple[List[Run], bool]] = []
+        if correct is not None:
+            lines.append(([("Bonne réponse : ", "bold", COLOR_OK), (str(correct), "mono", COLOR_OK)], True))
+        if first:
+            lines.append(([("Premier trouvé : ", "text", COLOR_STRONG), (str(first), "bold", COLOR_STRONG)], True))
+        if explanation:
+            lines.append(([(str(explanation), "text", COLOR_STRONG)], True))
+        if not lines:
+            lines.append(([("Correction affichée.", "text", COLOR_STRONG)], True))
+        lines.append(([("Nouvelle question dans quelques secondes…", "small", COLOR_MUTED)], True))
+        self._lines = lines
+        self._prepared_w = -1
+        self.updateGeometry()
+        self.update()
+
+    def clear(self):
+        self._lines = []
+        self._prepared = []
+        self._prepared_w = -1
+        self.update()
+
+    def _font(self, kind: str) -> QtGui.QFont:
+        return self._small if kind == "small" else self._fonts.get(kind)
+
+    def _prepare(self):
+        w = max(50, self.width() - 8)
+        if w == self._prepared_w:
+            return
+        self._prepared = []
+        for runs, _ in self._lines:
+            # une ligne = un QStaticText ; les morceaux de style différent sont combinés en RichText minimal
+            if len(runs) == 1:
+                text, kind, color = runs[0]
+                st = QtGui.QStaticText(text)
+                st.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+                font = self._font(kind)
+            else:
+                html = "".join(
+                    f"<span style='{'font-weight:600;' if kind == 'bold' else ''}"
+                    f"{'font-family:monospace;' if kind == 'mono' else ''}'>{_esc(text)}</span>"
+                    for text, kind, _ in runs
+                )
+                st = QtGui.QStaticText(html)
+                st.setTextFormat(QtCore.Qt.TextFormat.RichText)
+                color = runs[0][2]
+                font = self._fonts.text
+            st.setTextWidth(w)
+            st.setTextOption(QtGui.QTextOption(QtCore.Qt.AlignmentFlag.AlignHCenter))
+            st.prepare(QtGui.QTransform(), font)
+            self._prepared.append((st, font, color))
+        self._prepared_w = w
+
+    def sizeHint(self) -> QtCore.QSize:
+        self._prepare()
+        h = sum(st.size().height() + self.SPACING for st, _, _ in self._prepared)
+        return QtCore.QSize(320, int(h))
+
+    def paintEvent(self, e: QtGui.QPaintEvent):
+        self._prepare()
+        total = sum(st.size().height() + self.SPACING for st, _, _ in self._prepared) - self.SPACING
+        y = max(0.0, (self.height() - total) / 2.0)
+        p = QtGui.QPainter(self)
+        for st, font, color in self._prepared:
+            p.setFont(font)
+            p.setPen(color)
+            p.drawStaticText(QtCore.QPointF(4, y), st)
+            y += st.size().height() + self.SPACING
+        p.end()
+
+
+def _esc(text: str) -> str:
+    return (text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;"))
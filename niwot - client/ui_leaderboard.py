@@ -0,0 +1,134 @@
+# ui_leaderboard.py
+from __future__ import annotations
+from typing import Any, Dict, Optional
+
+from PySide6 import QtWidgets
+
+import niwot_tasks
+from niwot_leaderboard import BOARDS, LeaderboardModel, fetch_rank
+from ui_theme import role
+
+
+class LeaderboardDialog(QtWidgets.QDialog):
+    """Classements complets (joueurs / contributeurs), chargés page par page au défilement."""
+
+    def __init__(self, client, user: Optional[Dict[str, Any]] = None, board: str = "players", parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Classements")
+        self.resize(520, 640)
+        self._client = client
+        self._user = user or {}
+
+        lay = QtWidgets.QVBoxLayout(self)
+        lay.setContentsMargins(16, 16, 16, 16)
+        lay.setSpacing(10)
+
+        top = QtWidgets.QHBoxLayout()
+        self.tabs = QtWidgets.QTabBar()
+        for key in BOARDS:
+            self.tabs.addTab("Joueurs" if key == "players" else "Contributeurs")
+        self.tabs.setCurrentIndex(list(BOARDS).index(board))
+        self.tabs.currentChanged.connect(self._on_tab)
+        top.addWidget(self.tabs)
+        top.addStretch()
+        self.btn_me = QtWidgets.QPushButton("Mon rang")
+        self.btn_me.setEnabled(self._user.get("id") is not None)
+        self.btn_me.clicked.connect(self._goto_me)
+        top.addWidget(self.btn_me)
+        lay.addLayout(top)
+
+        self.model = LeaderboardModel(client, board, self)
+        self.model.me = self._user.get("username")
+        self.model.sig_page_loaded.connect(self._on_page_loaded)
+        self.model.sig_failed.connect(lambda msg: self.lbl_status.setText(f"Erreur : {msg}"))
+
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.setShowGrid(False)
+        self.table.setWordWrap(False)
+        # lignes de hauteur fixe : la vue ne demande que les lignes visibles (data() -> pages)
+        vh = self.table.verticalHeader()
+        vh.setVisible(False)
+        vh.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        vh.setDefaultSectionSize(28)
+        hh = self.table.horizontalHeader()
+        hh.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
+        for col, width in ((0, 80), (2, 150)):
+            hh.setSectionResizeMode(col, QtWidgets.QHeaderView.Fixed)
+            hh.resizeSection(col, width)
+        lay.addWidget(self.table, 1)
+
+        self.lbl_status = role(QtWidgets.QLabel(""), "caption")
+        lay.addWidget(self.lbl_status)
+
+        btns = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Close)
+        btns.rejected.connect(self.reject)
+        lay.addWidget(btns)
+
+        # rang demandé dès l'ouverture : « Mon rang » n'attend ensuite que la page
+        self._rank_task: Optional[niwot_tasks.Task] = None
+        self._ranks: Dict[str, Optional[int]] = {}
+        self._jump_pending = False
+        self.model.start()
+        self._fetch_rank()
+
+    # ---------- Slots ----------
+    def _on_tab(self, i: int):
+        if self._rank_task is not None:
+            self._rank_task.cancel()
+            self._rank_task = None
+        self._jump_pending = False
+        self.btn_me.setEnabled(self._user.get("id") is not None)
+        self.model.set_board(list(BOARDS)[i])
+        self.table.scrollToTop()
+        self._fetch_rank()
+
+    def _on_page_loaded(self, page: int, ms: float):
+        self.lbl_status.setText(f"{self.model.rowCount()} au classement · page {page + 1} : {ms:.0f} ms"
+                                f" · {self.model.pages_held} page(s) en mémoire")
+
+    def _fetch_rank(self):
+        uid = self._user.get("id")
+        board = self.model.board
+        if uid is None or board in self._ranks or self._rank_task is not None:
+            return
+        self._rank_task = niwot_tasks.submit(fetch_rank, self._client, board, uid,
+                                             on_done=lambda rank, err: self._on_rank(board, rank, err))
+
+    def _goto_me(self):
+        if self.model.board in self._ranks:
+            self._scroll_to_rank(self._ranks[self.model.board])
+            return
+        self._jump_pending = True  # réponse en vol : on sautera à son arrivée
+        self.btn_me.setEnabled(False)
+        self._fetch_rank()
+
+    def _on_rank(self, board: str, rank: Any, err: Optional[Exception]):
+        self._rank_task = None
+        if err is not None:
+            self.btn_me.setEnabled(True)
+            if self._jump_pending:
+                self._jump_pending = False
+                self.lbl_status.setText(f"Erreur : {err}")
+            return
+        self._ranks[board] = rank or None
+        if self._jump_pending and board == self.model.board:
+            self._jump_pending = False
+            self.btn_me.setEnabled(True)
+            self._scroll_to_rank(self._ranks[board])
+
+    def _scroll_to_rank(self, rank: Optional[int]):
+        if not rank:
+            self.lbl_status.setText("Vous n'apparaissez pas dans ce classement.")
+            return
+        self.model.ensure_rows(rank)
+        if rank > self.model.rowCount():
+            self.lbl_status.setText(f"Rang {rank} introuvable dans ce classement.")
+            return
+        row = rank - 1
+        ix = self.model.index(row, 1)
+        self.table.scrollTo(ix, QtWidgets.QAbstractItemView.PositionAtCenter)  # charge la page à l'affichage
+        self.table.selectRow(row)
@@ -1,11 +1,57 @@
 # ui_lobby.py
 from __future__ import annotations
 from PySide6 import QtWidgets, QtCore
-import re
-from typing import Any, Dict, Optional
+import re, time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import niwot_storage
+from niwot_rooms import PublicRoomsFeed, PublicRoomsModel, RoomFilterProxy, RoomSearch
+from ui_theme import role, set_state
 
 ALNUM6 = re.compile(r"^[A-Z0-9]{6}$")
 
+# Dernières données affichées (salles publiques + classements), rechargées au démarrage
+SNAPSHOT_FILE = "lobby_snapshot.json"
+SNAPSHOT_DELAY_MS = 1500  # regroupe les écritures (3 réponses arrivent presque ensemble)
+FETCH_TIMEOUT_S = 10      # une requête bloquée laisserait l'entrée SWR « en vol » pour toujours
+
+
+# ------------- Chargement (threads worker : pas de widgets ici) -------------
+def _json(r) -> Any:
+    return r.json() if "application/json" in (r.headers.get("content-type") or "") else {}
+
+
+def fetch_top_players(c) -> List[Dict[str, Any]]:
+    d = _json(c.sess.get(f"{c.api_base}/leaderboard", timeout=FETCH_TIMEOUT_S))
+    arr = d.get("leaders") or d.get("top") or (d if isinstance(d, list) else [])
+    norm = []
+    for u in arr[:10]:
+        try:
+            norm.append({"username": str(u.get("username") or ""), "wins": int(u.get("wins") or 0)})
+        except Exception:
+            continue
+    return norm
+
+
+def fetch_top_proposers(c) -> List[Dict[str, Any]]:
+    d = _json(c.sess.get(f"{c.api_base}/leaderboard/proposers", timeout=FETCH_TIMEOUT_S))
+    arr = d.get("proposers") or (d if isinstance(d, list) else [])
+    norm = []
+    for u in arr[:10]:
+        try:
+            norm.append({"username": str(u.get("username") or ""), "approvedCount": int(u.get("approvedCount") or 0)})
+        except Exception:
+            continue
+    return norm
+
+
+# section du lobby -> clé du cache SWR du client (un endpoint chacune)
+LEADERBOARDS = {
+    "players": ("leaderboard", fetch_top_players),
+    "proposers": ("leaderboard/proposers", fetch_top_proposers),
+}
+
+
 class LobbyWidget(QtWidgets.QWidget):
     """
     Lobby avec :
@@ -29,6 +75,10 @@ class LobbyWidget(QtWidgets.QWidget):
 
         self.title = QtWidgets.QLabel("<h2>Lobby</h2>")
         root.addWidget(self.title)
+        # visible tant que des sections viennent de l'instantané disque
+        self.lbl_stale = role(QtWidgets.QLabel(""), "muted")
+        self.lbl_stale.setVisible(False)
+        root.addWidget(self.lbl_stale)
 
         # === Ligne créer / rejoindre ===
         two_col = QtWidgets.QHBoxLayout()
@@ -68,12 +118,56 @@ class LobbyWidget(QtWidgets.QWidget):
         root.addWidget(self.grp_public, 2)
         pub_v = QtWidgets.QVBoxLayout(self.grp_public)
         hb_pub = QtWidgets.QHBoxLayout()
-        hb_pub.addStretch()
+        self.cmb_status = QtWidgets.QComboBox()
+        for label, status in (("Toutes", ""), ("Salle d'attente", "lobby"), ("En cours", "running")):
+            self.cmb_status.addItem(label, status)
+        self.cmb_status.currentIndexChanged.connect(
+            lambda _i: self.rooms_proxy.set_status(self.cmb_status.currentData()))
+        hb_pub.addWidget(self.cmb_status)
+        self.inp_search = QtWidgets.QLineEdit()
+        self.inp_search.setPlaceholderText("Rechercher (nom ou code)…")
+        self.inp_search.setClearButtonEnabled(True)
+        hb_pub.addWidget(self.inp_search, 1)
+        self.lbl_searching = role(QtWidgets.QLabel("Recherche…"), "muted")
+        self.lbl_searching.setVisible(False)
+        hb_pub.addWidget(self.lbl_searching)
         self.btn_refresh_pub = QtWidgets.QPushButton("Rafraîchir"); self.btn_refresh_pub.clicked.connect(self._refresh_public)
         hb_pub.addWidget(self.btn_refresh_pub)
         pub_v.addLayout(hb_pub)
-        self.lst_public = QtWidgets.QListWidget(); self.lst_public.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        pub_v.addWidget(self.lst_public, 1)
+
+        # modèle par code (mis à jour ligne à ligne par push socket / polling) -> tri + filtre -> vue
+        self.rooms = PublicRoomsModel(self)
+        self.rooms_proxy = RoomFilterProxy(self)
+        self.rooms_proxy.setSourceModel(self.rooms)
+        self.feed = PublicRoomsFeed(self.rooms, self)
+        self.feed.sig_synced.connect(self._on_public_synced)
+        self.feed.sig_changed.connect(self._snapshot_later)
+        self.feed.sig_failed.connect(self._on_public_failed)
+        self.search = RoomSearch(self.rooms, self.rooms_proxy, self)
+        self.search.sig_busy.connect(self.lbl_searching.setVisible)
+        self.inp_search.textChanged.connect(self.search.set_text)
+
+        self.tbl_public = QtWidgets.QTableView()
+        self.tbl_public.setModel(self.rooms_proxy)
+        self.tbl_public.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tbl_public.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.tbl_public.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tbl_public.setSortingEnabled(True)
+        self.tbl_public.sortByColumn(2, QtCore.Qt.SortOrder.DescendingOrder)  # plus de joueurs d'abord
+        self.tbl_public.setShowGrid(False)
+        self.tbl_public.setWordWrap(False)
+        # hauteur de ligne fixe, pas de ResizeToContents : rien à mesurer sur des milliers de lignes
+        vh = self.tbl_public.verticalHeader()
+        vh.setVisible(False)
+        vh.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        vh.setDefaultSectionSize(30)
+        hh = self.tbl_public.horizontalHeader()
+        hh.setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        for col, width in ((1, 90), (2, 80), (3, 130)):
+            hh.setSectionResizeMode(col, QtWidgets.QHeaderView.Fixed)
+            hh.resizeSection(col, width)
+        self.tbl_public.doubleClicked.connect(lambda _ix: self._join_selected_public())
+        pub_v.addWidget(self.tbl_public, 1)
         self.btn_join_public = QtWidgets.QPushButton("Rejoindre la salle sélectionnée")
         self.btn_join_public.clicked.connect(self._join_selected_public)
         pub_v.addWidget(self.btn_join_public)
@@ -88,6 +182,9 @@ class LobbyWidget(QtWidgets.QWidget):
         tp_v = QtWidgets.QVBoxLayout(self.grp_top_players)
         self.lst_top_players = QtWidgets.QListWidget()
         tp_v.addWidget(self.lst_top_players)
+        self.btn_all_players = QtWidgets.QPushButton("Voir tout le classement")
+        self.btn_all_players.clicked.connect(lambda: self._open_leaderboard("players"))
+        tp_v.addWidget(self.btn_all_players)
 
         # Top contributeurs + bouton Proposer question
         self.grp_top_props = QtWidgets.QGroupBox("Top 10 contributeurs (Questions approuvées)")
@@ -101,16 +198,35 @@ class LobbyWidget(QtWidgets.QWidget):
 
         self.lst_top_props = QtWidgets.QListWidget()
         tpr_v.addWidget(self.lst_top_props)
+        self.btn_all_props = QtWidgets.QPushButton("Voir tout le classement")
+        self.btn_all_props.clicked.connect(lambda: self._open_leaderboard("proposers"))
+        tpr_v.addWidget(self.btn_all_props)
 
         # Erreurs
-        self.lbl_err = QtWidgets.QLabel(""); self.lbl_err.setStyleSheet("color:#ff8b8b;")
+        self.lbl_err = role(QtWidgets.QLabel(""), "error")
         root.addWidget(self.lbl_err)
         root.addStretch()
 
         # états
         self._busy_create = False
         self._busy_join = False
-        self._refreshing = False
+        self._public_failed = False
+
+        # données affichées par section, date de ces données, sections encore issues de l'instantané
+        self._views: Dict[str, QtWidgets.QAbstractItemView] = {
+            "public": self.tbl_public, "players": self.lst_top_players, "proposers": self.lst_top_props,
+        }
+        self._renderers: Dict[str, Callable[[List[Dict[str, Any]]], None]] = {
+            "public": self.rooms.reset, "players": self._render_top_players, "proposers": self._render_top_props,
+        }
+        self._data: Dict[str, Optional[List[Dict[str, Any]]]] = {k: None for k in self._views}
+        self._data_at: Dict[str, int] = {}
+        self._stale: Set[str] = set()
+        self._offline = False
+        self._snapshot_timer = QtCore.QTimer(self)
+        self._snapshot_timer.setSingleShot(True)
+        self._snapshot_timer.setInterval(SNAPSHOT_DELAY_MS)
+        self._snapshot_timer.timeout.connect(self._write_snapshot)
 
     # ------------- API helpers -------------
     def set_user(self, user: Dict[str, Any]):
@@ -119,9 +235,62 @@ class LobbyWidget(QtWidgets.QWidget):
         self.title.setText(f"<h2>Lobby — {name}</h2>")
 
     def refresh_rooms(self, client):
-        self._client = client
+        """
+        Revalide les classements s'ils ont dépassé leur TTL et (ré)active le flux des salles
+        publiques (push socket + polling) ; l'affichage actuel reste en place.
+        """
+        self._bind(client)
+        self._offline = False
         self._load_leaderboards()
-        self._load_public()
+        self.search.set_client(client)
+        self.feed.start(client)
+
+    def hideEvent(self, e):
+        # autre page : plus de polling ni d'abonnement (fenêtre réduite : on garde le flux)
+        if not e.spontaneous():
+            self.feed.stop()
+        super().hideEvent(e)
+
+    def _bind(self, client):
+        if client is self._client:
+            return
+        self._client = client
+        for key, (cache_key, fetch) in LEADERBOARDS.items():
+            client.cache.register(cache_key, fetch, ttl_s=client.leaderboard_ttl)
+        client.cache.sig_value.connect(self._on_cached)
+        client.cache.sig_failed.connect(self._on_cache_failed)
+
+    def restore_snapshot(self, client) -> bool:
+        """
+        Affiche immédiatement les dernières données enregistrées pour cette API,
+        marquées comme périmées jusqu'à l'arrivée des données fraîches (ou tant
+        qu'elles sont hors de la fenêtre de fraîcheur, pour les classements).
+        """
+        self._bind(client)
+        snap = niwot_storage.read_json(SNAPSHOT_FILE)
+        if not isinstance(snap, dict) or snap.get("v") != 1 or snap.get("api") != client.api_base:
+            return False
+        sections = snap.get("sections") or {}
+        for key, render in self._renderers.items():
+            sec = sections.get(key)
+            if not isinstance(sec, dict) or not isinstance(sec.get("rows"), list):
+                continue
+            try:
+                render(sec["rows"])
+            except Exception:
+                continue
+            self._data[key] = sec["rows"]
+            self._data_at[key] = int(sec.get("at") or 0)
+            if key == "public":
+                self.feed.etag = sec.get("etag")  # un 304 confirmera directement l'instantané
+            else:
+                cache_key = LEADERBOARDS[key][0]
+                client.cache.seed(cache_key, sec["rows"], self._data_at[key])
+                if client.cache.is_fresh(cache_key):
+                    continue
+            self._stale.add(key)
+        self._update_stale()
+        return bool(self._stale)
 
     # ------------- Actions UI -------------
     def _uppercase_code(self, text: str):
@@ -176,91 +345,119 @@ class LobbyWidget(QtWidgets.QWidget):
 
     @QtCore.Slot()
     def _refresh_public(self):
-        self._load_public(force=True)
+        self.feed.refresh()
 
     @QtCore.Slot()
     def _join_selected_public(self):
-        item = self.lst_public.currentItem()
-        if not item: return
-        code = item.data(QtCore.Qt.ItemDataRole.UserRole)
+        ix = self.tbl_public.currentIndex()
+        if not ix.isValid(): return
+        code = ix.data(QtCore.Qt.ItemDataRole.UserRole)
         if code: self._join_public(code)
 
+    def _open_leaderboard(self, board: str):
+        if not self._client: return
+        from ui_leaderboard import LeaderboardDialog  # ouvert rarement : importé à la demande
+        LeaderboardDialog(self._client, self._user, board, self).exec()
+
     # ------------- Chargement données -------------
-    def _load_public(self, force: bool=False):
-        c = self._client
-        if not c: return
-        if self._refreshing: return
-        self._refreshing = True; self.btn_refresh_pub.setEnabled(False)
-        try:
-            r = c.sess.get(f"{c.api_base}/rooms/public")
-            data = r.json() if "application/json" in (r.headers.get("content-type") or "") else {}
-            rooms = data.get("rooms") or []
-            shown = []
-            for x in rooms:
-                try:
-                    code = str(x.get("code") or "")
-                    name = (None if x.get("name") is None else str(x.get("name")))
-                    status = str(x.get("status") or "lobby")
-                    if status not in ("running", "ended"): status = "lobby"
-                    players = int(x.get("players") or 0)
-                    maxp = int(x.get("maxPlayers") or 10)
-                    if players > 0 and code:
-                        shown.append({"code":code, "name":name, "status":status, "players":players, "maxPlayers":maxp})
-                except Exception:
-                    continue
-            self.lst_public.clear()
-            for rinfo in shown:
-                label = f"{rinfo['name'] or ('Salle ' + rinfo['code'])}  [{rinfo['code']}]  —  {rinfo['players']}/{rinfo['maxPlayers']} · " + \
-                        ("En cours" if rinfo["status"] == "running" else "Salle d'attente")
-                it = QtWidgets.QListWidgetItem(label)
-                it.setData(QtCore.Qt.ItemDataRole.UserRole, rinfo["code"])
-                self.lst_public.addItem(it)
-        except Exception as e:
-            self.lst_public.clear()
-            self._error(f"Impossible de charger les salles publiques : {e}")
-        finally:
-            self._refreshing = False; self.btn_refresh_pub.setEnabled(True)
+    @QtCore.Slot()
+    def _on_public_synced(self):
+        self._data_at["public"] = int(time.time())
+        self._stale.discard("public")
+        self._offline = False
+        self._public_failed = False
+        self._update_stale()
+        self._snapshot_later()
+
+    @QtCore.Slot(str)
+    def _on_public_failed(self, err: str):
+        if "public" in self._stale or self.rooms.rowCount():
+            self._set_offline()  # on garde la liste affichée ; le polling réessaiera
+        elif not self._public_failed:  # une seule alerte jusqu'au prochain succès
+            self._public_failed = True
+            self._error(f"Impossible de charger les salles publiques : {err}")
 
     def _load_leaderboards(self):
         c = self._client
         if not c: return
-        # Top joueurs
-        try:
-            r = c.sess.get(f"{c.api_base}/leaderboard")
-            d = r.json() if "application/json" in (r.headers.get("content-type") or "") else {}
-            arr = d.get("leaders") or d.get("top") or (d if isinstance(d, list) else [])
-            norm = []
-            for u in arr[:10]:
-                try:
-                    norm.append({"username": str(u.get("username") or ""), "wins": int(u.get("wins") or 0)})
-                except Exception:
-                    continue
-            self.lst_top_players.clear()
-            if not norm: self.lst_top_players.addItem("Pas encore de classement.")
-            else:
-                for i, u in enumerate(norm, start=1):
-                    self.lst_top_players.addItem(f"{i}. {u['username']} — {u['wins']} wins")
-        except Exception:
-            self.lst_top_players.clear(); self.lst_top_players.addItem("Pas encore de classement.")
+        for key, (cache_key, _fetch) in LEADERBOARDS.items():
+            cached = c.cache.peek(cache_key)
+            if cached is not None and cached != self._data.get(key):
+                self._apply(key, cached, time.time() - (c.cache.age(cache_key) or 0))
+            c.cache.request(cache_key, c)  # rien si encore frais, reporté si trop rapproché
 
-        # Top contributeurs
-        try:
-            r = c.sess.get(f"{c.api_base}/leaderboard/proposers")
-            d = r.json() if "application/json" in (r.headers.get("content-type") or "") else {}
-            arr = d.get("proposers") or (d if isinstance(d, list) else [])
-            norm = []
-            for u in arr[:10]:
-                try:
-                    norm.append({"username": str(u.get("username") or ""), "approvedCount": int(u.get("approvedCount") or 0)})
-                except Exception:
-                    continue
-            self.lst_top_props.clear()
-            if not norm: self.lst_top_props.addItem("Aucun contributeur pour le moment.")
-            else:
-                for i, u in enumerate(norm, start=1):
-                    self.lst_top_props.addItem(f"{i}. {u['username']} — {u['approvedCount']} approuvées")
-        except Exception:
-            self.lst_top_props.clear(); self.lst_top_props.addItem("Aucun contributeur pour le moment.")
+    @QtCore.Slot(str, object, bool)
+    def _on_cached(self, cache_key: str, rows: Any, changed: bool):
+        for key, (k, _fetch) in LEADERBOARDS.items():
+            if k == cache_key:
+                self._apply(key, rows, time.time())
+
+    @QtCore.Slot(str, str)
+    def _on_cache_failed(self, cache_key: str, err: str):
+        for key, (k, _fetch) in LEADERBOARDS.items():
+            if k != cache_key:
+                continue
+            if key in self._stale:
+                self._set_offline()
+            elif self._data.get(key) is None:
+                self._renderers[key]([])
+
+    def _apply(self, key: str, rows: List[Dict[str, Any]], at: float):
+        """Données revalidées : re-rendu seulement si elles diffèrent de l'affichage, puis instantané."""
+        if rows != self._data.get(key):
+            self._renderers[key](rows)
+            self._data[key] = rows
+        self._data_at[key] = int(at)
+        self._stale.discard(key)
+        self._update_stale()
+        self._snapshot_later()
+
+    # ------------- Rendu -------------
+    def _render_top_players(self, rows: List[Dict[str, Any]]):
+        self.lst_top_players.clear()
+        if not rows: self.lst_top_players.addItem("Pas encore de classement.")
+        else:
+            for i, u in enumerate(rows, start=1):
+                self.lst_top_players.addItem(f"{i}. {u['username']} — {u['wins']} wins")
+
+    def _render_top_props(self, rows: List[Dict[str, Any]]):
+        self.lst_top_props.clear()
+        if not rows: self.lst_top_props.addItem("Aucun contributeur pour le moment.")
+        else:
+            for i, u in enumerate(rows, start=1):
+                self.lst_top_props.addItem(f"{i}. {u['username']} — {u['approvedCount']} approuvées")
+
+    # ------------- Instantané -------------
+    def _set_offline(self):
+        self._offline = True
+        self._update_stale()
+
+    @QtCore.Slot()
+    def _snapshot_later(self):
+        self._snapshot_timer.start()  # (re)démarre : écriture groupée
+
+    def _update_stale(self):
+        for key, view in self._views.items():
+            set_state(view, "stale", key in self._stale)
+        if not self._stale:
+            self.lbl_stale.setVisible(False)
+            return
+        at = min(self._data_at.get(k, 0) for k in self._stale)
+        fmt = "%H:%M" if time.strftime("%x", time.localtime(at)) == time.strftime("%x") else "%d/%m %H:%M"
+        state = "hors ligne" if self._offline else "actualisation…"
+        self.lbl_stale.setText(f"Données du {time.strftime(fmt, time.localtime(at))} — {state}")
+        self.lbl_stale.setVisible(True)
+
+    def _write_snapshot(self):
+        c = self._client
+        if not c:
+            return
+        sections = {k: {"at": self._data_at.get(k, 0), "rows": rows}
+                    for k, rows in self._data.items() if rows is not None and k != "public"}
+        if self._data_at.get("public", 0) > 0:  # jamais synchronisée : pas de liste vide datée du 01/01/1970
+            sections["public"] = {"at": self._data_at["public"], "rows": self.rooms.rows(), "etag": self.feed.etag}
+        # les listes / dicts de salles ne sont jamais modifiés en place (remplacés) : copie superficielle suffit
+        niwot_storage.write_json_async(SNAPSHOT_FILE, {"v": 1, "api": c.api_base, "sections": sections})
 
     # ------------- Helpers -------------
     def _join_public(self, code: str):
@@ -1,10 +1,14 @@
 # ui_login.py
 from __future__ import annotations
 import os, sys
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 
 from PySide6 import QtWidgets, QtCore, QtGui
-from niwot_client import NiwotClient
+import niwot_tasks
+from ui_theme import role, set_state
+
+if TYPE_CHECKING:  # client réseau importé seulement pour les annotations
+    from niwot_client import NiwotClient
 
 
 def resource_path(name: str) -> str:
@@ -70,6 +74,7 @@ class LoginWidget(QtWidgets.QWidget):
         tabs.setSpacing(6)
         self.btn_tab_login = QtWidgets.QPushButton("Connexion")
         self.btn_tab_reg   = QtWidgets.QPushButton("Créer un compte")
+        self.btn_tab_login.setObjectName("AuthTab"); self.btn_tab_reg.setObjectName("AuthTab")
         self.btn_tab_login.clicked.connect(lambda: self._set_tab("login"))
         self.btn_tab_reg.clicked.connect(lambda: self._set_tab("register"))
         tabs.addWidget(self.btn_tab_login, 1)
@@ -106,7 +111,7 @@ class LoginWidget(QtWidgets.QWidget):
         prow.addWidget(lbl_p); prow.addWidget(self.inp_login_pwd)
         f1.addLayout(prow)
 
-        self.lbl_login_error = QtWidgets.QLabel(""); self.lbl_login_error.setStyleSheet("color:#ff8b8b;")
+        self.lbl_login_error = role(QtWidgets.QLabel(""), "error")
         f1.addWidget(self.lbl_login_error)
 
         self.btn_do_login = QtWidgets.QPushButton("Se connecter"); self.btn_do_login.setMinimumHeight(34)
@@ -126,7 +131,7 @@ class LoginWidget(QtWidgets.QWidget):
         lbl_a = QtWidgets.QLabel("Photo de profil")
         self.btn_pick_avatar = QtWidgets.QPushButton("Choisir un fichier…"); self.btn_pick_avatar.setMinimumHeight(32)
         self.btn_pick_avatar.clicked.connect(self._pick_avatar)
-        self.lbl_avatar_file = QtWidgets.QLabel(""); self.lbl_avatar_file.setStyleSheet("color:#aab2e6; font-size:12px;")
+        self.lbl_avatar_file = role(QtWidgets.QLabel(""), "caption")
         arow.addWidget(lbl_a); arow.addWidget(self.btn_pick_avatar); arow.addWidget(self.lbl_avatar_file)
         f2.addLayout(arow)
 
@@ -140,7 +145,7 @@ class LoginWidget(QtWidgets.QWidget):
         col1 = QtWidgets.QVBoxLayout(); col1.setSpacing(4)
         lbl_rp = QtWidgets.QLabel("Mot de passe")
         self.inp_reg_pwd = QtWidgets.QLineEdit(); self.inp_reg_pwd.setEchoMode(QtWidgets.QLineEdit.Password); self.inp_reg_pwd.setMinimumHeight(34)
-        hint = QtWidgets.QLabel("8+ caractères, 1 majuscule, 1 minuscule"); hint.setStyleSheet("color: rgba(255,255,255,0.6); font-size:11px; margin-top:2px;")
+        hint = role(QtWidgets.QLabel("8+ caractères, 1 majuscule, 1 minuscule"), "hint")
         col1.addWidget(lbl_rp); col1.addWidget(self.inp_reg_pwd); col1.addWidget(hint)
 
         col2 = QtWidgets.QVBoxLayout(); col2.setSpacing(4)
@@ -158,7 +163,7 @@ class LoginWidget(QtWidgets.QWidget):
         grid_w.setSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
         f2.addWidget(grid_w)
 
-        self.lbl_reg_error = QtWidgets.QLabel(""); self.lbl_reg_error.setStyleSheet("color:#ff8b8b;")
+        self.lbl_reg_error = role(QtWidgets.QLabel(""), "error")
         f2.addWidget(self.lbl_reg_error)
 
         self.btn_do_register = QtWidgets.QPushButton("Créer mon compte"); self.btn_do_register.setMinimumHeight(34)
@@ -182,10 +187,22 @@ class LoginWidget(QtWidgets.QWidget):
         QtCore.QTimer.singleShot(0, self._update_forms_height)
 
     # ------------------ API ------------------
-    def set_client(self, client: NiwotClient):
+    def set_client(self, client: NiwotClient, check_session: bool = True):
         self._client = client
+        if check_session:
+            self.check_session()
+
+    @QtCore.Slot()
+    def check_session(self):
+        """Vérifie une session existante (/me) au prochain tour de boucle."""
         QtCore.QTimer.singleShot(0, self._check_me)
 
+    def show_form(self, message: str = ""):
+        """Affiche directement le formulaire (aucune session à vérifier), message éventuel."""
+        self._set_tab("login")
+        self.lbl_login_error.setText(message)
+        self._set_loaded(True)
+
     # ------------------ Tabs ------------------
     def _set_tab(self, tab: str):
         if tab not in ("login", "register"): return
@@ -195,19 +212,8 @@ class LoginWidget(QtWidgets.QWidget):
         self._update_forms_height()
 
     def _apply_tab_styles(self):
-        active = (
-            "QPushButton{color:#fff;border:1px solid #6b4fd6;border-radius:10px;"
-            "padding:6px 10px;background-color:qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #7a3cff, stop:1 #5b2fd6);}"
-            "QPushButton:hover{border-color:#7a3cff;}"
-        )
-        inactive = (
-            "QPushButton{color:rgba(255,255,255,0.85);border:1px solid rgba(255,255,255,0.12);"
-            "border-radius:10px;padding:6px 10px;background-color:rgba(255,255,255,0.05);}"
-        )
-        if self._tab == "login":
-            self.btn_tab_login.setStyleSheet(active); self.btn_tab_reg.setStyleSheet(inactive)
-        else:
-            self.btn_tab_login.setStyleSheet(inactive); self.btn_tab_reg.setStyleSheet(active)
+        set_state(self.btn_tab_login, "active", self._tab == "login")
+        set_state(self.btn_tab_reg, "active", self._tab == "register")
 
     # ------------------ Taille contrôlée ------------------
     def _update_forms_height(self):
@@ -236,12 +242,12 @@ class LoginWidget(QtWidgets.QWidget):
     def _check_me(self):
         if not self._client:
             self._set_loaded(True); return
-        try:
-            r = self._client.me()
-            if r.get("ok") and r.get("user"):
-                self.sig_logged_in.emit(r["user"]); return
-        except Exception:
-            pass
+        # /me hors thread UI : la fenêtre reste réactive pendant l'aller-retour
+        niwot_tasks.submit(self._client.me, on_done=self._on_me)
+
+    def _on_me(self, r: Any, err: Optional[Exception]):
+        if err is None and isinstance(r, dict) and r.get("ok") and r.get("user"):
+            self.sig_logged_in.emit(r["user"]); return
         self._set_loaded(True)
 
     def _pick_avatar(self):
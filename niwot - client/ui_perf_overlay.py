@@ -0,0 +1,157 @@
+# ui_perf_overlay.py
+from __future__ import annotations
+import time
+from typing import Dict, List, Optional, Tuple
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+import niwot_metrics
+
+PROBE_MS = 16        # sonde de la boucle d'évènements (~60 Hz) : écart au délai prévu = temps de frame
+STALL_MS = 100       # au-delà : blocage du thread UI
+REFRESH_MS = 500     # texte recalculé et repeint 2 fois par seconde au plus
+_CACHES = (("swr", "swr"), ("media", "médias"), ("images", "images"))
+
+
+class PerfOverlay(QtWidgets.QWidget):
+    """
+    Panneau translucide (coin haut droit) : temps de frame et blocages de la boucle
+    d'évènements, file et débit socket, requêtes HTTP en vol, caches, horloge et RTT.
+    Transparent à la souris ; sonde et rafraîchissement arrêtés quand il est masqué.
+    Les lectures passent par niwot_metrics (jauges / compteurs), jamais par le réseau.
+    """
+
+    def __init__(self, parent: QtWidgets.QWidget):
+        super().__init__(parent)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_NoSystemBackground)
+        self.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self._font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont)
+        self._font.setPointSizeF(max(8.0, self._font.pointSizeF() * 0.9))
+        self._lines: List[Tuple[str, Optional[QtGui.QColor]]] = []
+
+        self._probe = QtCore.QTimer(self)
+        self._probe.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._probe.setInterval(PROBE_MS)
+        self._probe.timeout.connect(self._on_probe)
+        self._refresh = QtCore.QTimer(self)
+        self._refresh.setInterval(REFRESH_MS)
+        self._refresh.timeout.connect(self._update_text)
+
+        # fenêtre courante (remise à zéro à chaque rafraîchissement)
+        self._last_tick = 0.0
+        self._frames: List[float] = []
+        self._queue_max = 0.0
+        self.stalls = 0             # depuis l'ouverture du panneau
+        self.worst_stall_ms = 0.0
+        self._prev: Dict[str, float] = {}
+        self._prev_at = 0.0
+        self.hide()
+        parent.installEventFilter(self)
+
+    # ---------- API ----------
+    @property
+    def active(self) -> bool:
+        return self._refresh.isActive()
+
+    def toggle(self):
+        self.set_active(not self.active)
+
+    def set_active(self, on: bool):
+        if on:
+            self._last_tick = time.perf_counter()
+            self._frames.clear()
+            self._prev, self._prev_at = self._totals(), time.perf_counter()
+            self._probe.start()
+            self._refresh.start()
+            self._update_text()
+            self.show()
+            self.raise_()
+        else:
+            self._probe.stop()
+            self._refresh.stop()
+            self.hide()
+
+    # ---------- Mesure ----------
+    def _on_probe(self):
+        now = time.perf_counter()
+        dt = (now - self._last_tick) * 1000.0
+        self._last_tick = now
+        self._frames.append(dt)
+        if dt >= STALL_MS:
+            self.stalls += 1
+            self.worst_stall_ms = max(self.worst_stall_ms, dt)
+        depth = niwot_metrics.gauge("socket.queue_depth")
+        if depth > self._queue_max:
+            self._queue_max = depth
+
+    @staticmethod
+    def _totals() -> Dict[str, float]:
+        return {"events": niwot_metrics.total("socket.events"), "http": niwot_metrics.total("http.requests")}
+
+    def _update_text(self):
+        now = time.perf_counter()
+        totals = self._totals()
+        span = max(1e-3, now - self._prev_at)
+        ev_rate = (totals["events"] - self._prev.get("events", 0)) / span
+        http_rate = (totals["http"] - self._prev.get("http", 0)) / span
+        self._prev, self._prev_at = totals, now
+
+        frames, self._frames = self._frames, []
+        avg = sum(frames) / len(frames) if frames else 0.0
+        worst = max(frames) if frames else 0.0
+        queue_max, self._queue_max = self._queue_max, 0.0
+
+        hits: Dict[str, List[float]] = {}
+        for labels, v in niwot_metrics.select("cache.lookups").items():
+            d = dict(labels)
+            hit_miss = hits.setdefault(d.get("cache"), [0.0, 0.0])
+            hit_miss[0 if d.get("result") == "hit" else 1] += v
+        ratios = " · ".join(f"{label} {h / (h + m) * 100:.0f} %" for key, label in _CACHES
+                            for h, m in [hits.get(key, (0.0, 0.0))] if h + m)
+        pix_mb = sum(niwot_metrics.gauge("cache.bytes", cache=key) for key, _ in _CACHES) / 1e6
+
+        rtt = niwot_metrics.gauge("socket.rtt_ms")
+        offset = niwot_metrics.gauge("clock.offset_ms")
+        warn = QtGui.QColor("#ff8b8b")
+        self._lines = [
+            (f"frame  {avg:5.1f} ms moy · {worst:5.0f} ms max · {self.stalls} blocage(s)"
+             + (f" (pire {self.worst_stall_ms:.0f} ms)" if self.stalls else ""),
+             warn if worst >= STALL_MS else None),
+            (f"socket file {queue_max:.0f} · {ev_rate:5.1f} évt/s", warn if queue_max >= 50 else None),
+            (f"http   {niwot_metrics.gauge('http.inflight'):.0f} en vol · {http_rate:4.1f} req/s", None),
+            (f"cache  {ratios or '—'} · {pix_mb:.1f} Mo images", None),
+            (f"heure  décalage {offset:+.0f} ms · rtt {f'{rtt:.0f} ms' if rtt else '—'}", None),
+        ]
+        fm = QtGui.QFontMetrics(self._font)
+        w = max(fm.horizontalAdvance(t) for t, _ in self._lines) + 20
+        h = fm.height() * len(self._lines) + 14
+        if self.size() != QtCore.QSize(w, h):
+            self.resize(w, h)
+            self._place()
+        self.update()
+
+    # ---------- Affichage ----------
+    def _place(self):
+        p = self.parentWidget()
+        if p is not None:
+            self.move(p.width() - self.width() - 12, 12)
+
+    def eventFilter(self, obj, e):
+        if e.type() == QtCore.QEvent.Type.Resize and self.active:
+            self._place()
+        return False
+
+    def paintEvent(self, e):
+        p = QtGui.QPainter(self)
+        p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        p.setPen(QtCore.Qt.PenStyle.NoPen)
+        p.setBrush(QtGui.QColor(10, 12, 24, 190))
+        p.drawRoundedRect(self.rect(), 8, 8)
+        p.setFont(self._font)
+        fm = p.fontMetrics()
+        y = 7 + fm.ascent()
+        for text, color in self._lines:
+            p.setPen(color or QtGui.QColor(225, 230, 255, 235))
+            p.drawText(10, y, text)
+            y += fm.height()
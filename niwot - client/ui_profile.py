@@ -1,19 +1,15 @@
 # ui_profile.py
 from __future__ import annotations
-import os, sys, base64, mimetypes
-from typing import Optional, Dict, Any
+import os, base64
+from typing import Optional, Dict, Any, TYPE_CHECKING
 
 from PySide6 import QtWidgets, QtCore, QtGui
-from niwot_client import NiwotClient
+from niwot_media import MediaError, variant_side
+from niwot_assets import fallback_avatar, fit
+from ui_theme import role, set_state
 
-
-def resource_path(name: str) -> str:
-    """Chemin d'une ressource packagée (PyInstaller) ou en dev."""
-    base = getattr(sys, "_MEIPASS", os.path.dirname(__file__))
-    return os.path.join(base, name)
-
-
-DEFAULT_AVATAR_FILE = resource_path("niwotfren.png")
+if TYPE_CHECKING:
+    from niwot_client import NiwotClient
 
 
 class ProfileWidget(QtWidgets.QWidget):
@@ -56,7 +52,7 @@ class ProfileWidget(QtWidgets.QWidget):
 
         self.lbl_avatar = QtWidgets.QLabel()
         self.lbl_avatar.setFixedSize(96, 96)
-        self.lbl_avatar.setStyleSheet("border:1px solid #39406e; border-radius: 8px;")
+        self.lbl_avatar.setObjectName("ProfileAvatar")
         self._set_avatar_pixmap(self._load_default_avatar())
         av_top.addWidget(self.lbl_avatar)
 
@@ -65,8 +61,7 @@ class ProfileWidget(QtWidgets.QWidget):
 
         self.btn_pick = QtWidgets.QPushButton("Choisir une image…")
         self.btn_pick.clicked.connect(self._pick_avatar)
-        self.lbl_file = QtWidgets.QLabel("")  # nom du fichier choisi
-        self.lbl_file.setStyleSheet("color:#aab2e6; font-size:12px;")
+        self.lbl_file = role(QtWidgets.QLabel(""), "caption")  # nom du fichier choisi
         av_right.addWidget(self.btn_pick, alignment=QtCore.Qt.AlignmentFlag.AlignLeft)
         av_right.addWidget(self.lbl_file, alignment=QtCore.Qt.AlignmentFlag.AlignLeft)
 
@@ -170,12 +165,7 @@ class ProfileWidget(QtWidgets.QWidget):
         if not text:
             self.lbl_status.setText("")
             return
-        if ok is True:
-            self.lbl_status.setStyleSheet("color:#69f0ae;")
-        elif ok is False:
-            self.lbl_status.setStyleSheet("color:#ff8b8b;")
-        else:
-            self.lbl_status.setStyleSheet("color:#e8ebff;")
+        set_state(self.lbl_status, "status", "ok" if ok is True else "error" if ok is False else "info")
         self.lbl_status.setText(text)
 
     def _pick_avatar(self):
@@ -191,16 +181,13 @@ class ProfileWidget(QtWidgets.QWidget):
                 self._set_avatar_pixmap(pm)
 
     def _set_avatar_pixmap(self, pm: QtGui.QPixmap):
-        scaled = pm.scaled(96, 96, QtCore.Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                           QtCore.Qt.TransformationMode.SmoothTransformation)
-        self.lbl_avatar.setPixmap(scaled)
+        self.lbl_avatar.setPixmap(fit(pm, 96, self.devicePixelRatioF()))
 
     # ---------- avatar loaders ----------
     def _load_default_avatar(self) -> QtGui.QPixmap:
-        if os.path.isfile(DEFAULT_AVATAR_FILE):
-            pm = QtGui.QPixmap(DEFAULT_AVATAR_FILE)
-            if not pm.isNull():
-                return pm
+        pm = fallback_avatar(96, self.devicePixelRatioF())
+        if not pm.isNull():
+            return pm
         # fallback : pastille
         pm = QtGui.QPixmap(96, 96)
         pm.fill(QtCore.Qt.GlobalColor.transparent)
@@ -234,17 +221,16 @@ class ProfileWidget(QtWidgets.QWidget):
                     return QtGui.QPixmap.fromImage(img)
             except Exception:
                 pass
-        # 2) HTTP/relatif via session (cookies)
+        # 2) HTTP/relatif via session (cookies), variante à la taille affichée
         url = self._resolve_media_url(raw)
-        if url and self._client:
+        media = getattr(self._client, "media", None)
+        if url and media:
             try:
-                r = self._client.sess.get(url, timeout=6)  # type: ignore
-                if r.ok:
-                    img = QtGui.QImage.fromData(r.content)
-                    if not img.isNull():
-                        return QtGui.QPixmap.fromImage(img)
-                else:
-                    self._set_status(f"Avatar HTTP échec: {r.status_code}", ok=False)
+                img = media.image(url, variant_side(96, self.devicePixelRatioF()))
+                if not img.isNull():
+                    return QtGui.QPixmap.fromImage(img)
+            except MediaError as e:
+                self._set_status(f"Avatar HTTP échec: {e}", ok=False)
             except Exception as e:
                 self._set_status(f"Avatar HTTP erreur: {e}", ok=False)
         # 3) Fallback fichier local
@@ -338,6 +324,7 @@ class ProfileWidget(QtWidgets.QWidget):
 
     # ---------- utils ----------
     def _make_data_url(self, file_path: str) -> Optional[str]:
+        import mimetypes
         try:
             mime, _ = mimetypes.guess_type(file_path)
             if not mime:
@@ -1,16 +1,22 @@
 # ui_quiz.py
 from __future__ import annotations
-import os, sys, time, base64
-from typing import Any, Dict, List, Optional
+import time, base64, logging
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from PySide6 import QtWidgets, QtCore, QtGui
-from niwot_client import NiwotClient
+from niwot_media import ImageLoader, variant_side
+from niwot_assets import fallback_avatar, fit
+from niwot_clock import shared_clock, now_ms, CountdownBar
+from ui_hud import QuizHud, ResultPanel
+from ui_theme import role, set_state
+import niwot_metrics
 
+if TYPE_CHECKING:
+    from niwot_client import NiwotClient
 
-def resource_path(name: str) -> str:
-    """Chemin d'une ressource packagée (compatible PyInstaller)."""
-    base = getattr(sys, "_MEIPASS", os.path.dirname(__file__))
-    return os.path.join(base, name)
+log = logging.getLogger(__name__)
+
+IMAGE_HINT_HEIGHT = 360  # hauteur d'affichage de l'indice image
 
 
 def _abs_media_url(path_or_url: Optional[str], api_base: str) -> Optional[str]:
@@ -57,6 +63,11 @@ class QuizWidget(QtWidgets.QWidget):
         self._ends_at_ms: Optional[int] = None
         self._answered_correct: bool = False
 
+        # Indice image : chargement/décodage hors thread UI + mesure du temps d'affichage
+        self._images: Optional[ImageLoader] = None
+        self._pending_image: Optional[str] = None
+        self._question_at: float = 0.0
+
         # --- UI ---
         self.setObjectName("quiz-root")
         root = QtWidgets.QVBoxLayout(self)
@@ -65,31 +76,25 @@ class QuizWidget(QtWidgets.QWidget):
 
         # TOP BAR (Quitter + Infos)
         top_card = QtWidgets.QGroupBox()
-        top_card.setStyleSheet("QGroupBox{ border:1px solid rgba(255,255,255,0.1); border-radius:12px; }")
+        top_card.setProperty("card", "outline")
         top_h = QtWidgets.QHBoxLayout(top_card)
         top_h.setContentsMargins(12, 12, 12, 12)
         top_h.setSpacing(8)
 
-        left_h = QtWidgets.QHBoxLayout()
         self.btn_quit = QtWidgets.QPushButton("Quitter le quiz")
         self.btn_quit.clicked.connect(self._on_quit)
-        self.lbl_room_small = QtWidgets.QLabel("")   # "Salle CODE • Objectif : XX pts"
-        self.lbl_room_small.setStyleSheet("color:#bfc7ff;")
-        left_h.addWidget(self.btn_quit)
-        left_h.addSpacing(8)
-        left_h.addWidget(self.lbl_room_small)
-        left_h.addStretch(1)
-
-        right_h = QtWidgets.QHBoxLayout()
-        self.lbl_host_and_time = QtWidgets.QLabel("En attente du quiz…")
-        self.lbl_host_and_time.setStyleSheet("color:#bfc7ff;")
-        right_h.addWidget(self.lbl_host_and_time)
-
-        top_h.addLayout(left_h, 1)
-        top_h.addLayout(right_h, 0)
+        # Bandeau peint : "Salle CODE • Objectif : XX pts" … "Score • Hôte • Temps restant"
+        self.hud = QuizHud()
+        top_h.addWidget(self.btn_quit, 0)
+        top_h.addSpacing(8)
+        top_h.addWidget(self.hud, 1)
 
         root.addWidget(top_card, 0)
 
+        # Barre de temps restant (animation continue, cf. niwot_clock.CountdownBar)
+        self.bar_time = CountdownBar()
+        root.addWidget(self.bar_time, 0)
+
         # GRID deux colonnes
         grid = QtWidgets.QHBoxLayout()
         grid.setSpacing(12)
@@ -98,7 +103,7 @@ class QuizWidget(QtWidgets.QWidget):
         # --- Colonne Question ---
         q_col = QtWidgets.QVBoxLayout()
         q_card = QtWidgets.QGroupBox()
-        q_card.setStyleSheet("QGroupBox{ border:1px solid rgba(255,255,255,0.1); border-radius:12px; }")
+        q_card.setProperty("card", "outline")
         q_v = QtWidgets.QVBoxLayout(q_card)
         q_v.setContentsMargins(16, 16, 16, 16)
         q_v.setSpacing(12)
@@ -106,7 +111,7 @@ class QuizWidget(QtWidgets.QWidget):
         self.lbl_question_text = QtWidgets.QLabel("En attente de la première question…")
         self.lbl_question_text.setAlignment(QtCore.Qt.AlignCenter)
         self.lbl_question_text.setWordWrap(True)
-        self.lbl_question_text.setStyleSheet("font-size:18px; font-weight:600;")
+        role(self.lbl_question_text, "question")
         q_v.addWidget(self.lbl_question_text)
 
         # Zone indice (citation / image / résultat)
@@ -121,7 +126,7 @@ class QuizWidget(QtWidgets.QWidget):
         self.lbl_citation = QtWidgets.QLabel("")
         self.lbl_citation.setAlignment(QtCore.Qt.AlignCenter)
         self.lbl_citation.setWordWrap(True)
-        self.lbl_citation.setStyleSheet("font-style: italic;")
+        role(self.lbl_citation, "citation")
         cit_l.addWidget(self.lbl_citation)
         self.stack_hint.addWidget(self.page_cit)
         # 2: image
@@ -136,10 +141,8 @@ class QuizWidget(QtWidgets.QWidget):
         self.page_res = QtWidgets.QWidget()
         res_l = QtWidgets.QVBoxLayout(self.page_res)
         res_l.setContentsMargins(0, 0, 0, 0)
-        self.lbl_result = QtWidgets.QLabel("")
-        self.lbl_result.setAlignment(QtCore.Qt.AlignCenter)
-        self.lbl_result.setWordWrap(True)
-        res_l.addWidget(self.lbl_result)
+        self.result_panel = ResultPanel()
+        res_l.addWidget(self.result_panel)
         self.stack_hint.addWidget(self.page_res)
 
         q_v.addWidget(self.stack_hint, 1)
@@ -168,7 +171,7 @@ class QuizWidget(QtWidgets.QWidget):
         # --- Colonne Joueurs ---
         p_col = QtWidgets.QVBoxLayout()
         p_card = QtWidgets.QGroupBox("Joueurs")
-        p_card.setStyleSheet("QGroupBox{ border:1px solid rgba(255,255,255,0.1); border-radius:12px; }")
+        p_card.setProperty("card", "outline")
         p_v = QtWidgets.QVBoxLayout(p_card)
         p_v.setContentsMargins(16, 16, 16, 16)
         p_v.setSpacing(8)
@@ -180,9 +183,8 @@ class QuizWidget(QtWidgets.QWidget):
         grid.addLayout(p_col, 1)
 
         # --- Timers UI (strictement dans le thread UI) ---
-        self._timer_now = QtCore.QTimer(self)
-        self._timer_now.timeout.connect(self._tick)
-        self._timer_now.start(200)
+        # Compte à rebours : réveil par l'horloge partagée uniquement au changement de seconde,
+        # et seulement quand la page est visible (cf. showEvent / hideEvent)
 
         # resync initial en cas de latence
         self._timer_resync = QtCore.QTimer(self)
@@ -190,9 +192,21 @@ class QuizWidget(QtWidgets.QWidget):
         self._timer_resync.timeout.connect(lambda: self._emit("quiz:sync", {"code": self.room_code}))
         self._resync_started_once = False
 
+    # ========== Visibilité ==========
+    def showEvent(self, e: QtGui.QShowEvent):
+        super().showEvent(e)
+        shared_clock().subscribe(self, self._next_time_change, self._update_time_left)
+        self._update_time_left()
+
+    def hideEvent(self, e: QtGui.QHideEvent):
+        super().hideEvent(e)
+        shared_clock().unsubscribe(self)
+
     # ========== Wiring externe ==========
     def set_client(self, client: NiwotClient):
         self._client = client
+        self._images = ImageLoader(client, parent=self)
+        self._images.sig_ready.connect(self._on_image_ready)
 
     def set_room(self, code: str):
         self.room_code = (code or "").upper().strip()
@@ -245,10 +259,10 @@ class QuizWidget(QtWidgets.QWidget):
         def _ack(ack: Any):
             if isinstance(ack, dict) and ack.get("correct"):
                 self._answered_correct = True
-                self.lbl_status.setStyleSheet("color:#69f0ae;")
+                set_state(self.lbl_status, "status", "ok")
                 self.lbl_status.setText("Trouvé !")
             else:
-                self.lbl_status.setStyleSheet("color:#ff8b8b;")
+                set_state(self.lbl_status, "status", "error")
                 self.lbl_status.setText("Faux !")
         self._emit("quiz:answer", {"code": self.room_code, "answer": val}, ack=_ack)
 
@@ -313,7 +327,7 @@ class QuizWidget(QtWidgets.QWidget):
         except Exception as e:
             # Ne JAMAIS crasher l'UI si une donnée est manquante
             # Affiche silencieusement dans la barre de statut
-            self.lbl_status.setStyleSheet("color:#ff8b8b;")
+            set_state(self.lbl_status, "status", "error")
             self.lbl_status.setText(f"Erreur: {type(e).__name__}")
             # et tenter une resync prudente
             self._safe_resync()
@@ -348,12 +362,14 @@ class QuizWidget(QtWidgets.QWidget):
             self._resync_started_once = True
             self._timer_resync.start(800)
 
+    @niwot_metrics.timed("ui.render.ms")
     def _apply_question(self, p: Dict[str, Any]):
         # Web payload: { serverNow, params, question, startsAt, endsAt }
         try:
             client_now = int(time.time() * 1000)
             server_now = int(p.get("serverNow"))
             self._server_drift_ms = server_now - client_now
+            niwot_metrics.set_gauge("clock.offset_ms", self._server_drift_ms)
         except Exception:
             self._server_drift_ms = 0
 
@@ -362,7 +378,7 @@ class QuizWidget(QtWidgets.QWidget):
         self._answered_correct = False
         self.inp_answer.clear()
         self.lbl_status.setText("")
-        self.lbl_status.setStyleSheet("")
+        set_state(self.lbl_status, "status", None)
 
         q = p.get("question") if isinstance(p.get("question"), dict) else {}
         self._question = q if isinstance(q, dict) else {}
@@ -372,6 +388,7 @@ class QuizWidget(QtWidgets.QWidget):
             self._ends_at_ms = int(p.get("endsAt"))
         except Exception:
             self._ends_at_ms = None
+        self._start_countdown(p)
 
         # Affichage question
         text = str(self._question.get("text") or "Question")
@@ -382,14 +399,20 @@ class QuizWidget(QtWidgets.QWidget):
         self.lbl_question_text.setText(text)
 
         self.stack_hint.setCurrentIndex(0)
+        self._pending_image = None
+        self._question_at = time.perf_counter()
         if q_type == "CITATION" and isinstance(citation, str) and citation.strip():
             self.lbl_citation.setText(f"“{citation.strip()}”")
             self.stack_hint.setCurrentIndex(1)
         elif q_type == "IMAGE" and img_path:
-            pm = self._image_pixmap(img_path)
-            if not pm.isNull():
-                self.lbl_image.setPixmap(pm.scaledToHeight(360, QtCore.Qt.SmoothTransformation))
+            src = self._image_source(img_path)
+            if src and self._images:
+                # Affichage immédiat si préchargée, sinon décodage en tâche de fond (_on_image_ready)
+                self._pending_image = src
+                self.lbl_image.clear()
                 self.stack_hint.setCurrentIndex(2)
+                if self._images.request(src, IMAGE_HINT_HEIGHT):
+                    self._show_question_image(self._images.cached(src, IMAGE_HINT_HEIGHT))
             else:
                 # Pas d'image dispo -> rester vide
                 self.stack_hint.setCurrentIndex(0)
@@ -401,7 +424,57 @@ class QuizWidget(QtWidgets.QWidget):
         self._update_topbar()
         # Render joueurs (reset des propositions)
         self._render_players()
+        # Précharge les médias des prochaines questions si le serveur les annonce
+        self._prefetch_upcoming(p)
 
+    def _prefetch_upcoming(self, p: Dict[str, Any]):
+        """
+        Indices acceptés : nextImagePath (payload ou question), next/nextQuestion { imagePath },
+        manifest/upcoming [ { imagePath } | "chemin" ].
+        """
+        if not self._images:
+            return
+        hints: List[Any] = []
+        for src in (p, self._question or {}):
+            hints.append(src.get("nextImagePath"))
+            for k in ("next", "nextQuestion"):
+                if isinstance(src.get(k), dict):
+                    hints.append(src[k].get("imagePath"))
+        for k in ("manifest", "upcoming"):
+            arr = p.get(k)
+            if isinstance(arr, dict):
+                arr = arr.get("questions")
+            if isinstance(arr, list):
+                for it in arr:
+                    hints.append(it.get("imagePath") if isinstance(it, dict) else it)
+        for h in hints:
+            src = self._image_source(h) if h else None
+            if src and src != self._pending_image:
+                self._images.prefetch(src, IMAGE_HINT_HEIGHT)
+
+    @QtCore.Slot(str, int, object)
+    def _on_image_ready(self, source: str, height: int, img: Any):
+        if source != self._pending_image or height != IMAGE_HINT_HEIGHT:
+            return  # préchargement, ou question déjà passée
+        if isinstance(img, QtGui.QImage) and not img.isNull():
+            self._show_question_image(img)
+        else:
+            self._pending_image = None
+            if self.stack_hint.currentIndex() == 2:
+                self.stack_hint.setCurrentIndex(0)
+
+    def _show_question_image(self, img: Optional[QtGui.QImage]):
+        if img is None or img.isNull():
+            return
+        self._pending_image = None
+        self.lbl_image.setPixmap(QtGui.QPixmap.fromImage(img))
+        # Temps question reçue -> image visible
+        ms = (time.perf_counter() - self._question_at) * 1000.0
+        qid = (self._question or {}).get("id")
+        niwot_metrics.observe("quiz.image_visible.ms", ms)
+        log.info("quiz image visible: question=%s %.1f ms", qid, ms)
+
+    @niwot_metrics.timed("ui.render.ms")
     def _render_players(self):
         self.list_players.clear()
         # Map userId -> guess
@@ -413,6 +486,7 @@ class QuizWidget(QtWidgets.QWidget):
                     last_guess[item["userId"]] = g
 
         players = (self._room or {}).get("players") or []
+        dpr = self.devicePixelRatioF()
         for p in players:
             if not isinstance(p, dict):
                 continue
@@ -431,12 +505,11 @@ class QuizWidget(QtWidgets.QWidget):
             lbl_avatar.setFixedSize(40, 40)
             pm = self._avatar_pixmap(avatar)
             if pm.isNull():
-                pm = QtGui.QPixmap(resource_path("niwotfren.png"))
-            lbl_avatar.setPixmap(pm.scaled(40, 40, QtCore.Qt.KeepAspectRatioByExpanding, QtCore.Qt.SmoothTransformation))
+                pm = fallback_avatar(40, dpr)
+            lbl_avatar.setPixmap(fit(pm, 40, dpr))
 
             name = QtWidgets.QLabel(f"{username} ")
-            pts_lbl = QtWidgets.QLabel(f"({pts} pts)")
-            pts_lbl.setStyleSheet("color:#bfc7ff;")
+            pts_lbl = role(QtWidgets.QLabel(f"({pts} pts)"), "points")
 
             h.addWidget(lbl_avatar)
             v = QtWidgets.QVBoxLayout()
@@ -448,8 +521,7 @@ class QuizWidget(QtWidgets.QWidget):
             top_line.addStretch(1)
             # Badge hôte
             if self._room and uid == self._room.get("hostUserId"):
-                badge = QtWidgets.QLabel("Hôte")
-                badge.setStyleSheet("font-size:11px; padding:2px 6px; border:1px solid rgba(255,255,255,0.1); border-radius:8px;")
+                badge = role(QtWidgets.QLabel("Hôte"), "badge")
                 top_line.addWidget(badge)
             v.addLayout(top_line)
 
@@ -468,22 +540,7 @@ class QuizWidget(QtWidgets.QWidget):
 
     def _render_result(self):
         r = self._result or {}
-        correct = r.get("correct")
-        first = r.get("first")
-        explanation = r.get("explanation")
-        parts = []
-        if correct is not None:
-            parts.append(f"<div style='color:#69f0ae; font-weight:600;'>Bonne réponse : <span style='font-family:monospace'>{correct}</span></div>")
-        if first:
-            parts.append(f"<div style='color:#e8ebff;'>Premier trouvé : <b>{first}</b></div>")
-        if explanation:
-            parts.append(f"<div style='color:#e8ebff; margin-top:6px;'>{explanation}</div>")
-        if not parts:
-            parts.append("<div>Correction affichée.</div>")
-        parts.append("<div style='color:#9aa0c6; font-size:12px; margin-top:6px;'>Nouvelle question dans quelques secondes…</div>")
-
-        self.lbl_result.setText("".join(parts))
-        self.lbl_result.setTextFormat(QtCore.Qt.RichText)
+        self.result_panel.set_result(r.get("correct"), r.get("first"), r.get("explanation"))
         self.stack_hint.setCurrentIndex(3)
 
     def _show_end_dialog(self):
@@ -506,9 +563,32 @@ class QuizWidget(QtWidgets.QWidget):
             return
         self._is_host = (self._room.get("hostUserId") == self._me.get("id"))
 
-    def _tick(self):
-        # MAJ du bandeau (timer restant)
-        self._update_topbar()
+    def _start_countdown(self, p: Dict[str, Any]):
+        """Réarme l'horloge partagée et la barre de temps pour la question courante."""
+        total = None
+        try:
+            total = int(p.get("endsAt")) - int(p.get("startsAt"))
+        except Exception:
+            try:
+                total = int(((self._room or {}).get("params") or {}).get("answerTimeSec")) * 1000
+            except Exception:
+                total = None
+        if self._ends_at_ms is None:
+            self.bar_time.stop()
+        else:
+            left = self._ends_at_ms - (now_ms() + self._server_drift_ms)
+            self.bar_time.start(self._ends_at_ms, total if total and total > 0 else left, self._server_drift_ms)
+        shared_clock().wake()
+
+    def _next_time_change(self, now: int) -> Optional[int]:
+        """Instant où l'affichage « Temps restant : Ns » change (passage de seconde)."""
+        if self._ends_at_ms is None:
+            return None
+        left_ms = int(self._ends_at_ms) - (now + int(self._server_drift_ms))
+        if left_ms <= 0:
+            return None
+        shown = (left_ms + 999) // 1000
+        return now + left_ms - (shown - 1) * 1000
 
     def _update_topbar(self):
         # gauche: Salle CODE • Objectif : targetPoints
@@ -517,30 +597,31 @@ class QuizWidget(QtWidgets.QWidget):
             target = self._room.get("params", {}).get("targetPoints")
         except Exception:
             pass
-        left_txt = f"Salle <span style='font-family:monospace'>{self.room_code}</span>"
-        if target is not None:
-            left_txt += f" <span style='color:#8ea0ff;'>•</span> Objectif : <span style='font-family:monospace'>{target} pts</span>"
-        self.lbl_room_small.setText(left_txt)
-        self.lbl_room_small.setTextFormat(QtCore.Qt.RichText)
+        self.hud.set_room(self.room_code, target)
 
-        # droite: Hôte + temps restant
+        # hôte + score : recalculés seulement ici (changement d'état), pas à chaque seconde
         host_name = "—"
+        score = None
+        my_id = (self._me or {}).get("id")
         try:
             for p in (self._room or {}).get("players") or []:
                 if p.get("userId") == (self._room or {}).get("hostUserId"):
                     host_name = p.get("username") or "—"
-                    break
+                if my_id is not None and p.get("userId") == my_id:
+                    score = int(p.get("points") or 0)
         except Exception:
             pass
+        self.hud.set_host(host_name)
+        self.hud.set_score(score)
+        self._update_time_left()
 
-        time_left_txt = "En attente du quiz…"
+    def _update_time_left(self):
+        # temps restant : le HUD ne repeint que la zone du compte à rebours, et seulement s'il change
+        seconds = None
         if self._ends_at_ms is not None:
-            client_now = int(time.time() * 1000)
-            left_ms = max(0, int(self._ends_at_ms) - (client_now + int(self._server_drift_ms)))
-            time_left_txt = f"Temps restant : <span style='font-family:monospace'>{(left_ms + 999)//1000}s</span>"
-
-        self.lbl_host_and_time.setText(f"Hôte : <b>{host_name}</b> &nbsp; {time_left_txt}")
-        self.lbl_host_and_time.setTextFormat(QtCore.Qt.RichText)
+            left_ms = max(0, int(self._ends_at_ms) - (now_ms() + int(self._server_drift_ms)))
+            seconds = (left_ms + 999) // 1000
+        self.hud.set_seconds(seconds)
 
     def _safe_resync(self):
         if not self.room_code:
@@ -557,14 +638,17 @@ class QuizWidget(QtWidgets.QWidget):
         self._server_drift_ms = 0
         self._ends_at_ms = None
         self._answered_correct = False
+        self._pending_image = None
+        self.bar_time.stop()
+        shared_clock().wake()
         self.lbl_question_text.setText("En attente de la première question…")
         self.stack_hint.setCurrentIndex(0)
         self.lbl_citation.clear()
         self.lbl_image.clear()
-        self.lbl_result.clear()
+        self.result_panel.clear()
         self.inp_answer.clear()
         self.lbl_status.setText("")
-        self.lbl_status.setStyleSheet("")
+        set_state(self.lbl_status, "status", None)
         self.list_players.clear()
 
     # ===== Utils images / avatars =====
@@ -591,47 +675,27 @@ class QuizWidget(QtWidgets.QWidget):
             url = _abs_media_url(v, getattr(self._client, "api_base", "") or "")
             if not url:
                 return QtGui.QPixmap()
-            # requête HTTP via session du client (cookies conservés)
-            sess = getattr(self._client, "sess", None)
-            if not sess:
+            # variante à la taille affichée, via la session du client (cookies conservés)
+            media = getattr(self._client, "media", None)
+            if not media:
                 return QtGui.QPixmap()
-            r = sess.get(url, timeout=6)
-            if not r.ok:
-                return QtGui.QPixmap()
-            img = QtGui.QImage.fromData(r.content)
+            img = media.image(url, variant_side(40, self.devicePixelRatioF()))
             return QtGui.QPixmap.fromImage(img) if not img.isNull() else QtGui.QPixmap()
         except Exception:
             return QtGui.QPixmap()
 
-    def _image_pixmap(self, path_or_url: Any) -> QtGui.QPixmap:
-        # même logique que _avatar_pixmap, mais pour l'indice image
-        try:
-            if not path_or_url:
-                return QtGui.QPixmap()
-            if isinstance(path_or_url, dict):
-                for k in ("url", "href", "src", "path"):
-                    if isinstance(path_or_url.get(k), str) and path_or_url[k]:
-                        path_or_url = path_or_url[k]
-                        break
-            if not isinstance(path_or_url, str):
-                return QtGui.QPixmap()
-            v = path_or_url.strip()
-            if not v:
-                return QtGui.QPixmap()
-            if v.startswith("data:"):
-                b64 = v.split(",", 1)[1]
-                img = QtGui.QImage.fromData(base64.b64decode(b64))
-                return QtGui.QPixmap.fromImage(img) if not img.isNull() else QtGui.QPixmap()
-            url = _abs_media_url(v, getattr(self._client, "api_base", "") or "")
-            if not url:
-                return QtGui.QPixmap()
-            sess = getattr(self._client, "sess", None)
-            if not sess:
-                return QtGui.QPixmap()
-            r = sess.get(url, timeout=8)
-            if not r.ok:
-                return QtGui.QPixmap()
-            img = QtGui.QImage.fromData(r.content)
-            return QtGui.QPixmap.fromImage(img) if not img.isNull() else QtGui.QPixmap()
-        except Exception:
-            return QtGui.QPixmap()
+    def _image_source(self, path_or_url: Any) -> Optional[str]:
+        # même normalisation que _avatar_pixmap : data: URL telle quelle, sinon URL absolue
+        if isinstance(path_or_url, dict):
+            for k in ("url", "href", "src", "path"):
+                if isinstance(path_or_url.get(k), str) and path_or_url[k]:
+                    path_or_url = path_or_url[k]
+                    break
+        if not isinstance(path_or_url, str):
+            return None
+        v = path_or_url.strip()
+        if not v:
+            return None
+        if v.startswith("data:"):
+            return v
+        return _abs_media_url(v, getattr(self._client, "api_base", "") or "")
@@ -1,15 +1,19 @@
 # ui_room.py
 from __future__ import annotations
-import os, sys, base64, time
-from typing import Optional, Dict, Any, List, Callable
+import base64, time
+from typing import Optional, Dict, Any, List, Callable, TYPE_CHECKING
 
 from PySide6 import QtWidgets, QtCore, QtGui
-from niwot_client import NiwotClient
+from niwot_media import variant_side
+from niwot_assets import fallback_avatar, fit
+from ui_theme import role
+from ui_category_picker import CategoryPicker
+import niwot_metrics
+import niwot_tasks
+from niwot_categories import fetch_categories
 
-
-def resource_path(name: str) -> str:
-    base = getattr(sys, "_MEIPASS", os.path.dirname(__file__))
-    return os.path.join(base, name)
+if TYPE_CHECKING:
+    from niwot_client import NiwotClient
 
 
 # -------------------- Dialog Paramètres --------------------
@@ -90,33 +94,13 @@ class RoomSettingsDialog(QtWidgets.QDialog):
         group_cat = QtWidgets.QGroupBox("Catégories (optionnel)")
         vcat = QtWidgets.QVBoxLayout(group_cat)
         vcat.setContentsMargins(12, 12, 12, 12)
-        self._cat_checks: List[QtWidgets.QCheckBox] = []
+        self.cat_picker = CategoryPicker()
+        self.cat_picker.set_categories(cats)
+        self.cat_picker.set_selected(selected)
 
         if cats:
-            scroll = QtWidgets.QScrollArea(); scroll.setWidgetResizable(True)
-            cont = QtWidgets.QWidget()
-            fl = QtWidgets.QFormLayout(cont)
-            fl.setLabelAlignment(QtCore.Qt.AlignLeft)
-            fl.setFormAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
-
-            for c in cats:
-                label_name = str(c.get('name','Catégorie'))
-                ac = c.get('approvedCount')
-                suffix = f" ({ac})" if isinstance(ac, (int,float)) else ""
-                cb = QtWidgets.QCheckBox(f"{label_name}{suffix}")
-                try:
-                    cid = int(c.get("id"))
-                except Exception:
-                    cid = c.get("id")
-                cb.setChecked(cid in selected)
-                cb._cat_id = cid  # type: ignore
-                self._cat_checks.append(cb)
-                fl.addRow(cb)
-
-            scroll.setWidget(cont)
-            vcat.addWidget(scroll)
-            hint = QtWidgets.QLabel("Si aucune catégorie n’est cochée, toutes les catégories seront utilisées.")
-            hint.setStyleSheet("color: rgba(255,255,255,0.6); font-size:11px;")
+            vcat.addWidget(self.cat_picker)
+            hint = role(QtWidgets.QLabel("Si aucune catégorie n’est cochée, toutes les catégories seront utilisées."), "hint")
             vcat.addWidget(hint)
         else:
             vcat.addWidget(QtWidgets.QLabel("Impossible de charger les catégories."))
@@ -167,10 +151,7 @@ class RoomSettingsDialog(QtWidgets.QDialog):
             self._ban_list.addItem(QtWidgets.QListWidgetItem(u))
 
     def values(self) -> Dict[str, Any]:
-        cat_ids: List[int] = []
-        for cb in self._cat_checks:
-            if cb.isChecked():
-                cat_ids.append(getattr(cb, "_cat_id"))  # peut être int ou str
+        cat_ids = self.cat_picker.selected()  # ids int ou str, ordre du catalogue
         return {
             "private": (self.cmb_visibility.currentIndex() == 1),
             "maxPlayers": int(self.spin_max.value()),
@@ -227,9 +208,8 @@ class RoomWidget(QtWidgets.QWidget):
         root.addWidget(header)
         h = QtWidgets.QHBoxLayout(header); h.setContentsMargins(16, 16, 16, 16)
 
-        self.lbl_title = QtWidgets.QLabel("Salle")
-        self.lbl_title.setStyleSheet("font-size:16px; font-weight:600;")
-        self.lbl_code  = QtWidgets.QLabel(""); self.lbl_code.setStyleSheet("color:#aab2e6;")
+        self.lbl_title = role(QtWidgets.QLabel("Salle"), "title")
+        self.lbl_code  = role(QtWidgets.QLabel(""), "muted")
 
         title_col = QtWidgets.QVBoxLayout()
         title_col.addWidget(self.lbl_title); title_col.addWidget(self.lbl_code)
@@ -250,7 +230,7 @@ class RoomWidget(QtWidgets.QWidget):
         card_players = QtWidgets.QGroupBox("Joueurs")
         root.addWidget(card_players)
         vp = QtWidgets.QVBoxLayout(card_players); vp.setContentsMargins(16,16,16,16)
-        self.lbl_count = QtWidgets.QLabel(""); self.lbl_count.setStyleSheet("color:#aab2e6;")
+        self.lbl_count = role(QtWidgets.QLabel(""), "muted")
         vp.addWidget(self.lbl_count)
         self.list_widget = QtWidgets.QListWidget(); self.list_widget.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
         vp.addWidget(self.list_widget)
@@ -263,6 +243,7 @@ class RoomWidget(QtWidgets.QWidget):
     # ---------- Wiring ----------
     def set_client(self, client: NiwotClient):
         self._client = client
+        client.categories.sig_changed.connect(self._on_categories)
 
     def set_room(self, code: str):
         self.room_code = code.upper().strip()
@@ -286,13 +267,9 @@ class RoomWidget(QtWidgets.QWidget):
         # premier état HTTP
         self._refresh_room_http()
 
-        # Charger les catégories
-        try:
-            cats = self._client.get_categories()
-            if cats.get("ok") and isinstance(cats.get("categories"), list):
-                self._categories = cats["categories"]
-        except Exception:
-            pass
+        # Catégories : catalogue partagé (mémoire/disque), revalidé en fond seulement s'il est périmé
+        self._categories = self._client.categories.items()
+        self._client.categories.refresh()
 
         # Socket join
         self._ensure_socket()
@@ -330,6 +307,7 @@ class RoomWidget(QtWidgets.QWidget):
         self.btn_start.setVisible(self._is_host is True)
         self.btn_params.setVisible(self._is_host is True)
 
+    @niwot_metrics.timed("ui.render.ms")
     def _render_players(self):
         count = len(self._players)
         self.lbl_count.setText(f"{count} joueurs" if not self._max_players else f"{count} / {self._max_players} joueurs")
@@ -343,9 +321,9 @@ class RoomWidget(QtWidgets.QWidget):
         w = QtWidgets.QWidget()
         h = QtWidgets.QHBoxLayout(w); h.setContentsMargins(6,4,6,4); h.setSpacing(8)
         avatar = QtWidgets.QLabel(); avatar.setFixedSize(36,36)
-        avatar.setPixmap(self._avatar_pixmap(p.get("avatar")).scaled(36,36, QtCore.Qt.KeepAspectRatioByExpanding, QtCore.Qt.SmoothTransformation))
+        avatar.setPixmap(fit(self._avatar_pixmap(p.get("avatar")), 36, self.devicePixelRatioF()))
         name = QtWidgets.QLabel(str(p.get("username") or ""))
-        pts = QtWidgets.QLabel(f"{int(p.get('points') or 0)} pts"); pts.setStyleSheet("color:#aab2e6;")
+        pts = role(QtWidgets.QLabel(f"{int(p.get('points') or 0)} pts"), "muted")
         if p.get("userId") == self._host_user_id:
             name.setText(name.text() + "  <span style='font-size:11px; color:#aab2e6'>(Hôte)</span>")
         hl = QtWidgets.QHBoxLayout(); hl.addWidget(name, 1); hl.addWidget(pts, 0, QtCore.Qt.AlignRight)
@@ -380,21 +358,30 @@ class RoomWidget(QtWidgets.QWidget):
         # 🔒 filet de sécurité : ceci s'exécute DANS le thread UI, donc OK
         QtCore.QTimer.singleShot(2000, lambda: self._emit("quiz:sync", {"code": self.room_code}))
 
+    def _on_categories(self, cats: List[Dict[str, Any]]):
+        self._categories = cats
+
     @QtCore.Slot(int)
     def _do_delayed_quiz_sync(self, delay_ms: int):
         """Slot exécuté dans le thread UI -> peut utiliser QTimer sans crash."""
         QtCore.QTimer.singleShot(delay_ms, lambda: self._emit("quiz:sync", {"code": self.room_code}))
 
     def _on_params_clicked(self):
-        # Assure d’avoir les catégories
-        if not self._categories:
-            try:
-                cats = self._client.get_categories()
-                if cats.get("ok") and isinstance(cats.get("categories"), list):
-                    self._categories = cats["categories"]
-            except Exception:
-                pass
+        # Assure d’avoir les catégories : requête en tâche de fond seulement si rien n'est connu
+        if not self._categories and self._client:
+            self.btn_params.setEnabled(False)
+            niwot_tasks.submit(fetch_categories, self._client, on_done=self._on_params_categories)
+            return
+        self._open_params()
 
+    def _on_params_categories(self, cats: Any, err: Optional[Exception]):
+        self.btn_params.setEnabled(True)
+        if err is None and cats:
+            self._client.categories.accept(cats)  # -> sig_changed -> _on_categories
+        if self.room_code and self._is_host:  # salle quittée ou hôte changé pendant la requête
+            self._open_params()
+
+    def _open_params(self):
         dlg = RoomSettingsDialog(
             self,
             is_private=self._is_private,
@@ -453,6 +440,7 @@ class RoomWidget(QtWidgets.QWidget):
     # ---------- Socket messages ----------
     def on_message(self, event: str, payload: Any):
         if not isinstance(event, str): return
+        if event.startswith("rooms:"): return  # liste publique du lobby
 
         # 1) Évènements de démarrage => redirection quiz
         if event in {"quiz:question", "quiz:started", "room:started", "room:running", "game:started"}:
@@ -477,6 +465,7 @@ class RoomWidget(QtWidgets.QWidget):
         self._apply_room_payload(payload)
 
     # ---------- Appliquer payload room ----------
+    @niwot_metrics.timed("ui.render.ms")
     def _apply_room_payload(self, payload: Any) -> bool:
         changed = False
         if not isinstance(payload, dict): return False
@@ -572,7 +561,7 @@ class RoomWidget(QtWidgets.QWidget):
 
     # ---------- media ----------
     def _avatar_pixmap(self, raw: Any) -> QtGui.QPixmap:
-        fallback = QtGui.QPixmap(resource_path("niwotfren.png"))
+        fallback = fallback_avatar(36, self.devicePixelRatioF())
         if isinstance(raw, dict):
             for k in ("url","href","src","path"):
                 if isinstance(raw.get(k), str) and raw.get(k):
@@ -591,12 +580,11 @@ class RoomWidget(QtWidgets.QWidget):
             base = str(getattr(self._client, "api_base", "")).rstrip("/")
             if base:
                 url = (base + url) if url.startswith("/") else (base + "/" + url)
-        if self._client:
+        media = getattr(self._client, "media", None)
+        if media:
             try:
-                r = self._client.sess.get(url, timeout=6)  # type: ignore
-                if r.ok:
-                    img = QtGui.QImage.fromData(r.content)
-                    if not img.isNull(): return QtGui.QPixmap.fromImage(img)
+                img = media.image(url, variant_side(36, self.devicePixelRatioF()))
+                if not img.isNull(): return QtGui.QPixmap.fromImage(img)
             except Exception:
                 return fallback
         return fallback
@@ -1,17 +1,24 @@
 # ui_suggest.py
 from __future__ import annotations
 from PySide6 import QtWidgets, QtCore
-from typing import Optional, Dict, Any, List
-from niwot_client import NiwotClient
-from requests_toolbelt import MultipartEncoder
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+import json
+from ui_theme import set_state, role
+from ui_category_picker import CategoryPicker
+import niwot_storage
+import niwot_tasks
+
+if TYPE_CHECKING:
+    from niwot_client import NiwotClient
 
 class SuggestWidget(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
         self._client: Optional[NiwotClient] = None
+        self._last_key: Optional[str] = None  # dernière proposition mise en file
         self._categories: List[Dict[str,Any]] = []
-        self._selected: set[int] = set()
         self._image_path: Optional[str] = None
+        self._reject_errors: Dict[str, str] = {}  # clé refusée -> message du serveur
 
         root = QtWidgets.QVBoxLayout(self)
         root.setSpacing(12)
@@ -53,12 +60,28 @@ class SuggestWidget(QtWidgets.QWidget):
         # Catégories
         self.grp_cat = QtWidgets.QGroupBox("Catégories * (au moins une)")
         root.addWidget(self.grp_cat)
-        self.cat_layout = QtWidgets.QGridLayout(self.grp_cat)
+        vcat = QtWidgets.QVBoxLayout(self.grp_cat)
+        self.cat_picker = CategoryPicker()
+        self.cat_picker.view.setMinimumHeight(160)
+        vcat.addWidget(self.cat_picker)
 
         # Messages + actions
         self.lbl_msg = QtWidgets.QLabel("")
         root.addWidget(self.lbl_msg)
+        self.lbl_pending = role(QtWidgets.QLabel(""), "caption")
+        self.lbl_pending.setVisible(False)
+        root.addWidget(self.lbl_pending)
+        self.box_rejected = QtWidgets.QWidget(); rhr = QtWidgets.QHBoxLayout(self.box_rejected); rhr.setContentsMargins(0,0,0,0)
+        self.lbl_rejected = role(QtWidgets.QLabel(""), "caption")
+        self.btn_fix = QtWidgets.QPushButton("Corriger"); self.btn_fix.clicked.connect(self._fix_rejected)
+        self.btn_drop = QtWidgets.QPushButton("Abandonner"); self.btn_drop.clicked.connect(self._drop_rejected)
+        rhr.addWidget(self.lbl_rejected, 1); rhr.addWidget(self.btn_fix); rhr.addWidget(self.btn_drop)
+        self.box_rejected.setVisible(False)
+        root.addWidget(self.box_rejected)
         btns = QtWidgets.QHBoxLayout()
+        self.btn_import = QtWidgets.QPushButton("Import en masse…")
+        self.btn_import.clicked.connect(self._open_import)
+        btns.addWidget(self.btn_import)
         btns.addStretch()
         self.btn_send = QtWidgets.QPushButton("Envoyer")
         self.btn_send.clicked.connect(self._submit)
@@ -72,7 +95,17 @@ class SuggestWidget(QtWidgets.QWidget):
 
     def set_client(self, client: NiwotClient):
         self._client = client
-        self._load_categories()
+        # catalogue partagé : affiché tout de suite (mémoire/disque), revalidé en fond
+        client.categories.sig_changed.connect(self._render_categories)
+        self._render_categories(client.categories.items())
+        client.categories.refresh()
+        # propositions envoyées par la file durable (niwot_outbox), en tâche de fond
+        outbox = client.outbox
+        outbox.sig_pending.connect(self._on_pending)
+        outbox.sig_progress.connect(self._on_upload_progress)
+        outbox.sig_sent.connect(self._on_sent)
+        outbox.sig_rejected.connect(self._on_rejected)
+        self._on_pending(outbox.pending)
 
     def _toggle_type(self):
         is_cit = self.rb_citation.isChecked()
@@ -85,41 +118,20 @@ class SuggestWidget(QtWidgets.QWidget):
             self._image_path = path
             self.inp_img.setText(path)
 
-    def _load_categories(self):
-        self._categories.clear()
-        self._selected.clear()
-        for i in reversed(range(self.cat_layout.count())):
-            item = self.cat_layout.itemAt(i); w = item.widget()
-            if w: w.setParent(None)
-
+    def _open_import(self):
         if not self._client: return
-        try:
-            r = self._client.sess.get(f"{self._client.api_base}/categories")
-            data = r.json() if "application/json" in (r.headers.get("content-type") or "") else {}
-            cats = data.get("categories") or data or []
-            # Affiche en 3 colonnes
-            row = col = 0
-            for c in cats:
-                cb = QtWidgets.QCheckBox(c.get("name",""))
-                cid = int(c.get("id"))
-                cb.stateChanged.connect(lambda st, i=cid: self._toggle_cat(i, st))
-                self.cat_layout.addWidget(cb, row, col)
-                col += 1
-                if col >= 3:
-                    col = 0; row += 1
-                self._categories.append(c)
-        except Exception:
-            pass
-
-    def _toggle_cat(self, cid: int, state: int):
-        if state:
-            self._selected.add(cid)
-        else:
-            self._selected.discard(cid)
+        from ui_bulk_import import BulkImportDialog  # ouvert rarement : importé à la demande
+        dlg = BulkImportDialog(self._client, self)
+        dlg.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)  # modèle, envoi et pool libérés à la fermeture
+        dlg.exec()
+
+    def _render_categories(self, cats: List[Dict[str, Any]]):
+        self._categories = list(cats)
+        self.cat_picker.set_categories(self._categories)  # la sélection encore valide est conservée
 
     @QtCore.Slot()
     def _submit(self):
-        self.lbl_msg.setStyleSheet("color:#ff8b8b;")
+        set_state(self.lbl_msg, "status", "error")
         self.lbl_msg.setText("")
         if not self._client: 
             self.lbl_msg.setText("Client non disponible.")
@@ -131,7 +143,7 @@ class SuggestWidget(QtWidgets.QWidget):
         answer = self.inp_answer.text().strip()
         alts = [x.strip() for x in (self.txt_alts.toPlainText().replace(",", "\n")).split("\n") if x.strip()]
         expl = self.txt_expl.toPlainText().strip()
-        cats = list(self._selected)
+        cats = self.cat_picker.selected()
 
         # Vérifs
         if not text:
@@ -145,50 +157,119 @@ class SuggestWidget(QtWidgets.QWidget):
         if not cats:
             self.lbl_msg.setText("Choisissez au moins une catégorie."); return
 
-        try:
-            fields = {
-                "text": text,
-                "type": qtype,
-                "answer": answer,
-                "alternatives": QtCore.QByteArray(json.dumps(alts).encode("utf-8")) if alts else "",
-                "explanation": expl,
-                "categoryIds": QtCore.QByteArray(json.dumps(cats).encode("utf-8")),
-            }
-        except NameError:
-            import json
-            fields = {
-                "text": text, "type": qtype, "answer": answer,
-                "alternatives": json.dumps(alts) if alts else "",
-                "explanation": expl,
-                "categoryIds": json.dumps(cats),
-            }
+        fields = {
+            "text": text,
+            "type": qtype,
+            "answer": answer,
+            "alternatives": json.dumps(alts) if alts else "",
+            "explanation": expl,
+            "categoryIds": json.dumps(cats),
+        }
 
         if qtype == "CITATION":
             fields["citationText"] = quote
-        else:
-            # image binaire
-            try:
-                with open(self._image_path, "rb") as f:
-                    img_bytes = f.read()
-                fields["image"] = ("image", img_bytes, "application/octet-stream")
-            except Exception:
-                self.lbl_msg.setText("Impossible de lire le fichier image.")
-                return
-
-        # Envoie multipart
-        try:
-            m = MultipartEncoder(fields=fields)
-            r = self._client.sess.post(f"{self._client.api_base}/suggest", data=m, headers={"Content-Type": m.content_type})
-            if not r.ok:
-                try:
-                    err = r.json().get("error")
-                except Exception:
-                    err = r.text
-                raise RuntimeError(err or "Erreur lors de l'envoi.")
-            self.lbl_msg.setStyleSheet("color:#69f0ae;")
+
+        # Mise en file durable (copie de l'image comprise) puis envoi en tâche de fond :
+        # une coupure réseau ou un arrêt de l'application ne perd pas la proposition
+        self.btn_send.setEnabled(False)
+        image = self._image_path if qtype == "IMAGE" else None
+        niwot_tasks.submit(self._client.outbox.enqueue, fields, image,
+                           on_done=self._on_queued, pool=niwot_storage.io_pool())
+
+    def _on_queued(self, key: Any, err: Optional[Exception]):
+        self.btn_send.setEnabled(True)
+        if err is not None:
+            set_state(self.lbl_msg, "status", "error")
+            self.lbl_msg.setText(f"Impossible d'enregistrer la proposition : {err}")
+            return
+        self._last_key = key
+        set_state(self.lbl_msg, "status", "info")
+        self.lbl_msg.setText("Proposition enregistrée, envoi en cours…")
+        # reset
+        self.inp_text.clear(); self.txt_quote.clear(); self.inp_img.clear()
+        self._image_path = None; self.inp_answer.clear(); self.txt_alts.clear(); self.txt_expl.clear()
+        self._client.outbox.kick(key)
+
+    def _on_upload_progress(self, key: str, done: int, total: int):
+        if key == self._last_key and total:
+            self.lbl_msg.setText(f"Envoi de l'image… {done * 100 // total} %")
+
+    def _on_sent(self, key: str):
+        if key == self._last_key:
+            set_state(self.lbl_msg, "status", "ok")
             self.lbl_msg.setText("Proposition envoyée ! Elle sera visible après validation.")
-            # reset
-            self.inp_text.clear(); self.txt_quote.clear(); self.inp_img.clear()
-            self._image_path = None; self.inp_answer.clear(); self.txt_alts.clear(); self.txt_expl.clear()
-        except Exception as e:
-            self.lbl_msg.setText(str(e))
+
+    def _on_rejected(self, key: str, error: str, text: str):
+        self._reject_errors[key] = error
+        self._render_rejected()
+        if key == self._last_key:
+            set_state(self.lbl_msg, "status", "error")
+            self.lbl_msg.setText(f"Proposition refusée par le serveur : {error} — « Corriger » la remet dans le formulaire.")
+
+    def _on_pending(self, count: int):
+        self.lbl_pending.setVisible(count > 0)
+        self.lbl_pending.setText(f"{count} proposition(s) en attente d'envoi — nouvel essai automatique")
+        self._render_rejected()  # stop() (déconnexion) vide aussi les refus
+
+    # --- propositions refusées : gardées par la file jusqu'à correction ou abandon ---
+    def _render_rejected(self):
+        rejected = self._client.outbox.rejected if self._client else {}
+        self.box_rejected.setVisible(bool(rejected))
+        if not rejected:
+            return
+        key = next(reversed(rejected))  # la plus récente, reprise par « Corriger » / « Abandonner »
+        more = f" (+{len(rejected) - 1} autre(s))" if len(rejected) > 1 else ""
+        self.lbl_rejected.setText(f"Refusée : « {rejected[key]} »{more}")
+        self.lbl_rejected.setToolTip(self._reject_errors.get(key, ""))
+
+    def _fix_rejected(self):
+        if not self._client or not self._client.outbox.rejected:
+            return
+        if self.inp_text.text().strip() and QtWidgets.QMessageBox.question(
+                self, "Corriger", "Remplacer le formulaire en cours par la proposition refusée ?") \
+                != QtWidgets.QMessageBox.StandardButton.Yes:
+            return
+        key = next(reversed(self._client.outbox.rejected))
+        self.box_rejected.setEnabled(False)
+        niwot_tasks.submit(self._client.outbox.take, key, on_done=lambda res, err: self._on_taken(key, res, err),
+                           pool=niwot_storage.io_pool())
+
+    def _on_taken(self, key: str, res: Any, err: Optional[Exception]):
+        self.box_rejected.setEnabled(True)
+        if err is not None:
+            set_state(self.lbl_msg, "status", "error")
+            self.lbl_msg.setText(f"Impossible de relire la proposition : {err}")
+            return
+        error = self._reject_errors.pop(key, "")
+        self._client.outbox.forget_rejected(key)
+        self._render_rejected()
+        if res is None:
+            return
+        fields, image = res
+        self.inp_text.setText(fields.get("text", ""))
+        (self.rb_image if fields.get("type") == "IMAGE" else self.rb_citation).setChecked(True)
+        self.txt_quote.setPlainText(fields.get("citationText", ""))
+        self._image_path = image  # copie gardée par la file, reprise par le prochain envoi
+        self.inp_img.setText(image or "")
+        self.inp_answer.setText(fields.get("answer", ""))
+        self.txt_alts.setPlainText("\n".join(json.loads(fields["alternatives"])) if fields.get("alternatives") else "")
+        self.txt_expl.setPlainText(fields.get("explanation", ""))
+        self.cat_picker.set_selected(json.loads(fields.get("categoryIds") or "[]"))
+        set_state(self.lbl_msg, "status", "error")
+        self.lbl_msg.setText(f"Proposition refusée : {error} — corrigez-la puis « Envoyer »." if error
+                             else "Proposition refusée remise dans le formulaire : corrigez-la puis « Envoyer ».")
+
+    def _drop_rejected(self):
+        if not self._client or not self._client.outbox.rejected:
+            return
+        key = next(reversed(self._client.outbox.rejected))
+        self.box_rejected.setEnabled(False)
+        niwot_tasks.submit(self._client.outbox.discard, key, on_done=lambda _r, err: self._on_dropped(key, err),
+                           pool=niwot_storage.io_pool())
+
+    def _on_dropped(self, key: str, err: Optional[Exception]):
+        self.box_rejected.setEnabled(True)
+        if err is None:
+            self._reject_errors.pop(key, None)
+            self._client.outbox.forget_rejected(key)
+        self._render_rejected()
@@ -1,7 +1,17 @@
 # ui_theme.py
 from __future__ import annotations
+from functools import lru_cache
+from typing import Any
+
 from PySide6 import QtWidgets
 
+# Tout le style passe par ce QSS global, appliqué une seule fois à l'application.
+# Les widgets ne font pas de setStyleSheet : ils portent un objectName ou des
+# propriétés dynamiques (role, status, active…) que les sélecteurs ci-dessous ciblent.
+#   - role(w, "hint")                 : propriété fixe, posée avant le premier affichage
+#   - set_state(w, "status", "error") : changement d'état -> re-polish de ce seul widget
+
+@lru_cache(maxsize=1)
 def qss() -> str:
     return """
 /* ===== Base ===== */
@@ -68,6 +78,8 @@ QListWidget, QTreeWidget, QTableWidget, QTableView {
     border-radius: 12px;
 }
 QListWidget::item { padding: 6px; }
+/* données de l'instantané disque, en attente d'actualisation */
+QListWidget[stale="true"], QTableView[stale="true"] { color: rgba(232,235,255,0.55); }
 QListWidget::item:selected {
     background: rgba(122,60,255,0.30);
 }
@@ -88,7 +100,74 @@ QScrollBar::handle:horizontal {
     background: rgba(255,255,255,0.12); min-width: 24px; border-radius: 5px;
 }
 QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0; }
+
+/* ===== Cartes à bordure (quiz) ===== */
+QGroupBox[card="outline"] {
+    border: 1px solid rgba(255,255,255,0.1);
+    border-radius: 12px;
+}
+
+/* ===== Onglets Connexion / Créer un compte ===== */
+QPushButton#AuthTab {
+    color: rgba(255,255,255,0.85);
+    border: 1px solid rgba(255,255,255,0.12);
+    border-radius: 10px;
+    padding: 6px 10px;
+    background-color: rgba(255,255,255,0.05);
+}
+QPushButton#AuthTab[active="true"] {
+    color: #ffffff;
+    border: 1px solid #6b4fd6;
+    background-color: qlineargradient(x1:0,y1:0,x2:0,y2:1,
+                                      stop:0 #7a3cff, stop:1 #5b2fd6);
+}
+QPushButton#AuthTab[active="true"]:hover { border-color: #7a3cff; }
+
+/* ===== Avatar (profil) ===== */
+QLabel#ProfileAvatar { border: 1px solid #39406e; border-radius: 8px; }
+
+/* ===== Rôles de texte ===== */
+QLabel[role="muted"]    { color: #aab2e6; }
+QLabel[role="caption"]  { color: #aab2e6; font-size: 12px; }
+QLabel[role="hint"]     { color: rgba(255,255,255,0.6); font-size: 11px; }
+QLabel[role="error"]    { color: #ff8b8b; }
+QLabel[role="title"]    { font-size: 16px; font-weight: 600; }
+QLabel[role="question"] { font-size: 18px; font-weight: 600; }
+QLabel[role="citation"] { font-style: italic; }
+QLabel[role="points"]   { color: #bfc7ff; }
+QLabel[role="badge"] {
+    font-size: 11px;
+    padding: 2px 6px;
+    border: 1px solid rgba(255,255,255,0.1);
+    border-radius: 8px;
+}
+
+/* ===== États de message (set_state(w, "status", ...)) ===== */
+QLabel[status="ok"]    { color: #69f0ae; }
+QLabel[status="error"] { color: #ff8b8b; }
+QLabel[status="info"]  { color: #e8ebff; }
 """
 
 def apply_theme(app: QtWidgets.QApplication) -> None:
     app.setStyleSheet(qss())
+
+
+def role(widget: QtWidgets.QWidget, name: str) -> QtWidgets.QWidget:
+    """Rôle visuel fixe (propriété 'role'), à poser avant le premier affichage du widget."""
+    widget.setProperty("role", name)
+    return widget
+
+
+def set_state(widget: QtWidgets.QWidget, prop: str, value: Any) -> None:
+    """
+    Change une propriété dynamique ciblée par le QSS et re-polish uniquement ce widget
+    (rien si la valeur est inchangée). value "" / None = état neutre.
+    """
+    value = "" if value is None else value
+    if widget.property(prop) == value:
+        return
+    widget.setProperty(prop, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    QtWidgets.QWidget.update(widget)  # les vues masquent update() par update(index)